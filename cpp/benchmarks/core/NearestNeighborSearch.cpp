@@ -0,0 +1,202 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/core/nns/NearestNeighborSearch.h"
+
+#include <benchmark/benchmark.h>
+
+#include <deque>
+#include <random>
+
+#include "open3d/core/Tensor.h"
+#include "open3d/core/nns/DynamicNanoFlannIndex.h"
+#include "open3d/utility/Timer.h"
+
+namespace open3d {
+namespace core {
+
+static Tensor RandomPoints(int64_t num_points,
+                           std::mt19937 &rng,
+                           int64_t dimension = 3) {
+    std::uniform_real_distribution<float> dist(0.f, 100.f);
+    std::vector<float> points(num_points * dimension);
+    for (float &v : points) {
+        v = dist(rng);
+    }
+    return Tensor(points, {num_points, dimension}, Dtype::Float32);
+}
+
+// Streaming map: every iteration inserts one scan and removes the oldest one,
+// so that the map keeps a constant size. Sustaining 30 Hz requires an
+// iteration time below 33 ms.
+static void DynamicNanoFlannIndexStreaming(benchmark::State &state) {
+    const int64_t map_size = state.range(0);
+    const int64_t scan_size = state.range(1);
+    std::mt19937 rng(0);
+
+    nns::DynamicNanoFlannIndex index(3, Dtype::Float32);
+    std::deque<Tensor> scans;
+    for (int64_t i = 0; i < map_size; i += scan_size) {
+        scans.push_back(index.AddPoints(RandomPoints(scan_size, rng)));
+    }
+    const Tensor query = RandomPoints(scan_size, rng);
+
+    for (auto _ : state) {
+        state.PauseTiming();
+        Tensor scan = RandomPoints(scan_size, rng);
+        state.ResumeTiming();
+
+        scans.push_back(index.AddPoints(scan));
+        index.RemovePoints(scans.front());
+        scans.pop_front();
+        // Register the next scan against the map.
+        index.SearchKnn(query, 1);
+    }
+    state.counters["scans_per_second"] =
+            benchmark::Counter(state.iterations(), benchmark::Counter::kIsRate);
+}
+
+BENCHMARK(DynamicNanoFlannIndexStreaming)
+        ->Args({1 << 20, 1 << 14})
+        ->Args({1 << 24, 1 << 16})
+        ->Args({50000000, 100000})
+        ->Unit(benchmark::kMillisecond);
+
+// Batched knn and radius search with the given backend. Knn arguments are
+// {num_points, knn, dimension}, radius arguments are {num_points, radius}.
+// Index build time is reported as a counter, the iteration time is the query
+// time.
+static void KnnSearch(benchmark::State &state,
+                      nns::NNSBackend backend,
+                      nns::FaissIndexType faiss_index_type) {
+    const int64_t num_points = state.range(0);
+    const int knn = static_cast<int>(state.range(1));
+    const int64_t dimension = state.range(2);
+    std::mt19937 rng(0);
+    const Tensor dataset = RandomPoints(num_points, rng, dimension);
+    const Tensor query = RandomPoints(num_points / 10, rng, dimension);
+
+    nns::NearestNeighborSearch nns(dataset, backend, faiss_index_type);
+    utility::Timer timer;
+    timer.Start();
+    nns.KnnIndex();
+    timer.Stop();
+    for (auto _ : state) {
+        nns.KnnSearch(query, knn);
+    }
+    state.counters["build_ms"] = timer.GetDuration();
+}
+
+static void RadiusSearch(benchmark::State &state,
+                         nns::NNSBackend backend,
+                         nns::FaissIndexType faiss_index_type) {
+    const int64_t num_points = state.range(0);
+    // Radius giving about 8 neighbors per query, in 1/1000 units.
+    const double radius = state.range(1) / 1000.0;
+    std::mt19937 rng(0);
+    const Tensor dataset = RandomPoints(num_points, rng);
+    const Tensor query = RandomPoints(num_points / 10, rng);
+
+    nns::NearestNeighborSearch nns(dataset, backend, faiss_index_type);
+    utility::Timer timer;
+    timer.Start();
+    nns.FixedRadiusIndex();
+    timer.Stop();
+    for (auto _ : state) {
+        nns.FixedRadiusSearch(query, radius);
+    }
+    state.counters["build_ms"] = timer.GetDuration();
+}
+
+BENCHMARK_CAPTURE(KnnSearch,
+                  NanoFlann,
+                  nns::NNSBackend::NanoFlann,
+                  nns::FaissIndexType::Flat)
+        ->Args({1 << 12, 8, 3})
+        ->Args({1 << 16, 8, 3})
+        ->Args({1 << 20, 8, 3})
+        ->Args({1 << 16, 8, 33})
+        ->Unit(benchmark::kMillisecond);
+BENCHMARK_CAPTURE(RadiusSearch,
+                  NanoFlann,
+                  nns::NNSBackend::NanoFlann,
+                  nns::FaissIndexType::Flat)
+        ->Args({1 << 16, 3100})
+        ->Args({1 << 20, 1240})
+        ->Unit(benchmark::kMillisecond);
+
+BENCHMARK_CAPTURE(KnnSearch,
+                  BruteForce,
+                  nns::NNSBackend::BruteForce,
+                  nns::FaissIndexType::Flat)
+        ->Args({1 << 12, 8, 3})
+        ->Args({1 << 16, 8, 3})
+        ->Args({1 << 16, 8, 33})
+        ->Unit(benchmark::kMillisecond);
+BENCHMARK_CAPTURE(RadiusSearch,
+                  BruteForce,
+                  nns::NNSBackend::BruteForce,
+                  nns::FaissIndexType::Flat)
+        ->Args({1 << 16, 3100})
+        ->Unit(benchmark::kMillisecond);
+
+#ifdef WITH_FAISS
+BENCHMARK_CAPTURE(KnnSearch,
+                  FaissFlat,
+                  nns::NNSBackend::Faiss,
+                  nns::FaissIndexType::Flat)
+        ->Args({1 << 12, 8, 3})
+        ->Args({1 << 16, 8, 3})
+        ->Args({1 << 20, 8, 3})
+        ->Args({1 << 16, 8, 33})
+        ->Unit(benchmark::kMillisecond);
+BENCHMARK_CAPTURE(KnnSearch,
+                  FaissIVFFlat,
+                  nns::NNSBackend::Faiss,
+                  nns::FaissIndexType::IVFFlat)
+        ->Args({1 << 12, 8, 3})
+        ->Args({1 << 16, 8, 3})
+        ->Args({1 << 20, 8, 3})
+        ->Args({1 << 16, 8, 33})
+        ->Unit(benchmark::kMillisecond);
+BENCHMARK_CAPTURE(RadiusSearch,
+                  FaissFlat,
+                  nns::NNSBackend::Faiss,
+                  nns::FaissIndexType::Flat)
+        ->Args({1 << 16, 3100})
+        ->Args({1 << 20, 1240})
+        ->Unit(benchmark::kMillisecond);
+BENCHMARK_CAPTURE(RadiusSearch,
+                  FaissIVFFlat,
+                  nns::NNSBackend::Faiss,
+                  nns::FaissIndexType::IVFFlat)
+        ->Args({1 << 16, 3100})
+        ->Args({1 << 20, 1240})
+        ->Unit(benchmark::kMillisecond);
+#endif
+
+}  // namespace core
+}  // namespace open3d
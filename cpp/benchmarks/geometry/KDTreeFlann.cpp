@@ -30,6 +30,8 @@
 
 #include "open3d/geometry/PointCloud.h"
 #include "open3d/geometry/TriangleMesh.h"
+#include "open3d/io/PointCloudIO.h"
+#include "open3d/pipelines/registration/Feature.h"
 
 namespace open3d {
 namespace benchmarks {
@@ -96,5 +98,75 @@ BENCHMARK(BM_TestKDTreeLine0)
         ->MinTime(0.1)
         ->Ranges({{1 << 0, 1 << 14}, {1 << 16, 1 << 22}});
 
+// Feature matching in 33-D FPFH space, as in
+// RegistrationRANSACBasedOnFeatureMatching. Reports the recall of the first
+// neighbor against an exact KDTree, for a range of approximate index
+// parameters.
+class FeatureMatchingFixture : public benchmark::Fixture {
+public:
+    void SetUp(const benchmark::State& state) {
+        auto pcd = io::CreatePointCloudFromFile(TEST_DATA_DIR "/fragment.pcd");
+        target_ = ComputeFeature(*pcd, 0.01);
+        source_ = ComputeFeature(*pcd, 0.015);
+
+        geometry::KDTreeFlann exact_kdtree(*target_);
+        std::vector<int> indices;
+        std::vector<double> distance2;
+        exact_indices_.resize(source_->Num());
+        for (size_t i = 0; i < source_->Num(); ++i) {
+            exact_kdtree.SearchKNN(Eigen::VectorXd(source_->data_.col(i)), 1,
+                                   indices, distance2);
+            exact_indices_[i] = indices[0];
+        }
+    }
+
+    void TearDown(const benchmark::State& state) {
+        // empty
+    }
+
+    static std::shared_ptr<pipelines::registration::Feature> ComputeFeature(
+            const geometry::PointCloud& pcd, double voxel_size) {
+        auto down = pcd.VoxelDownSample(voxel_size);
+        down->EstimateNormals(
+                geometry::KDTreeSearchParamHybrid(voxel_size * 2, 30));
+        return pipelines::registration::ComputeFPFHFeature(
+                *down, geometry::KDTreeSearchParamHybrid(voxel_size * 5, 100));
+    }
+
+    std::shared_ptr<pipelines::registration::Feature> source_;
+    std::shared_ptr<pipelines::registration::Feature> target_;
+    std::vector<int> exact_indices_;
+};
+
+BENCHMARK_DEFINE_F(FeatureMatchingFixture, SearchKNN)
+(benchmark::State& state) {
+    geometry::KDTreeFlann kdtree(
+            *target_,
+            geometry::KDTreeIndexParam(static_cast<int>(state.range(0)),
+                                       static_cast<int>(state.range(1))));
+    std::vector<int> indices;
+    std::vector<double> distance2;
+    size_t num_correct = 0;
+    for (auto _ : state) {
+        num_correct = 0;
+        for (size_t i = 0; i < source_->Num(); ++i) {
+            kdtree.SearchKNN(Eigen::VectorXd(source_->data_.col(i)), 1, indices,
+                             distance2);
+            num_correct += (indices[0] == exact_indices_[i]);
+        }
+    }
+    state.counters["recall"] = double(num_correct) / double(source_->Num());
+}
+
+// Args: {num_trees, checks}. {0, -1} is the exact single KDTree.
+BENCHMARK_REGISTER_F(FeatureMatchingFixture, SearchKNN)
+        ->Args({0, -1})
+        ->Args({4, 16})
+        ->Args({4, 64})
+        ->Args({4, 256})
+        ->Args({8, 256})
+        ->Args({8, 1024})
+        ->Unit(benchmark::kMillisecond);
+
 }  // namespace benchmarks
 }  // namespace open3d
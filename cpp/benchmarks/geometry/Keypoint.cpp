@@ -0,0 +1,88 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/geometry/Keypoint.h"
+
+#include <benchmark/benchmark.h>
+
+#include "open3d/geometry/PointCloud.h"
+#include "open3d/io/PointCloudIO.h"
+
+namespace open3d {
+namespace benchmarks {
+
+class ISSKeypointsFixture : public benchmark::Fixture {
+public:
+    void SetUp(const benchmark::State& state) {
+        pcd_ = io::CreatePointCloudFromFile(TEST_DATA_DIR "/fragment.pcd");
+    }
+
+    void TearDown(const benchmark::State& state) { pcd_.reset(); }
+
+    std::shared_ptr<geometry::PointCloud> pcd_;
+};
+
+// Radii from the model resolution, the non maxima suppression reuses the
+// salient neighborhoods.
+BENCHMARK_DEFINE_F(ISSKeypointsFixture, ComputeISSKeypointIndices)
+(benchmark::State& state) {
+    for (auto _ : state) {
+        auto kp_indices = geometry::keypoint::ComputeISSKeypointIndices(*pcd_);
+        benchmark::DoNotOptimize(kp_indices);
+    }
+    state.SetItemsProcessed(state.iterations() * int64_t(pcd_->points_.size()));
+}
+
+// Fixed radii, with non_max_radius > salient_radius the non maxima
+// suppression queries the KDTree again.
+BENCHMARK_DEFINE_F(ISSKeypointsFixture, ComputeISSKeypointIndicesNoCache)
+(benchmark::State& state) {
+    for (auto _ : state) {
+        auto kp_indices = geometry::keypoint::ComputeISSKeypointIndices(
+                *pcd_, 0.03, 0.04);
+        benchmark::DoNotOptimize(kp_indices);
+    }
+    state.SetItemsProcessed(state.iterations() * int64_t(pcd_->points_.size()));
+}
+
+BENCHMARK_DEFINE_F(ISSKeypointsFixture, ComputeISSKeypoints)
+(benchmark::State& state) {
+    for (auto _ : state) {
+        auto keypoints = geometry::keypoint::ComputeISSKeypoints(*pcd_);
+        benchmark::DoNotOptimize(keypoints);
+    }
+    state.SetItemsProcessed(state.iterations() * int64_t(pcd_->points_.size()));
+}
+
+BENCHMARK_REGISTER_F(ISSKeypointsFixture, ComputeISSKeypointIndices)
+        ->Unit(benchmark::kMillisecond);
+BENCHMARK_REGISTER_F(ISSKeypointsFixture, ComputeISSKeypointIndicesNoCache)
+        ->Unit(benchmark::kMillisecond);
+BENCHMARK_REGISTER_F(ISSKeypointsFixture, ComputeISSKeypoints)
+        ->Unit(benchmark::kMillisecond);
+
+}  // namespace benchmarks
+}  // namespace open3d
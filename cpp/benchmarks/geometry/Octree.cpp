@@ -0,0 +1,120 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/geometry/Octree.h"
+
+#include <benchmark/benchmark.h>
+
+#include <random>
+
+#include "open3d/geometry/PointCloud.h"
+
+namespace open3d {
+namespace benchmarks {
+
+// Uniformly distributed colored points, state.range(0) of them.
+class OctreeFixture : public benchmark::Fixture {
+public:
+    void SetUp(const benchmark::State& state) {
+        std::mt19937 rng(0);
+        std::uniform_real_distribution<double> uniform(0.0, 1.0);
+        pcd_ = std::make_shared<geometry::PointCloud>();
+        pcd_->points_.resize(state.range(0));
+        pcd_->colors_.resize(state.range(0));
+        for (int64_t i = 0; i < state.range(0); ++i) {
+            pcd_->points_[i] =
+                    Eigen::Vector3d(uniform(rng), uniform(rng), uniform(rng));
+            pcd_->colors_[i] =
+                    Eigen::Vector3d(uniform(rng), uniform(rng), uniform(rng));
+        }
+    }
+
+    void TearDown(const benchmark::State& state) { pcd_.reset(); }
+
+    std::shared_ptr<geometry::PointCloud> pcd_;
+};
+
+BENCHMARK_DEFINE_F(OctreeFixture, ConvertFromPointCloud)
+(benchmark::State& state) {
+    for (auto _ : state) {
+        geometry::Octree octree(size_t(state.range(1)));
+        octree.ConvertFromPointCloud(*pcd_, 0.01);
+    }
+    state.SetItemsProcessed(state.iterations() * state.range(0));
+}
+
+BENCHMARK_DEFINE_F(OctreeFixture, LinearConvertFromPointCloud)
+(benchmark::State& state) {
+    for (auto _ : state) {
+        geometry::LinearOctree octree(size_t(state.range(1)));
+        octree.ConvertFromPointCloud(*pcd_, 0.01);
+    }
+    state.SetItemsProcessed(state.iterations() * state.range(0));
+}
+
+BENCHMARK_DEFINE_F(OctreeFixture, LocateLeafNode)
+(benchmark::State& state) {
+    geometry::Octree octree(size_t(state.range(1)));
+    octree.ConvertFromPointCloud(*pcd_, 0.01);
+    for (auto _ : state) {
+        for (const Eigen::Vector3d& point : pcd_->points_) {
+            benchmark::DoNotOptimize(octree.LocateLeafNode(point));
+        }
+    }
+    state.SetItemsProcessed(state.iterations() * state.range(0));
+}
+
+BENCHMARK_DEFINE_F(OctreeFixture, LinearLocateLeafNodes)
+(benchmark::State& state) {
+    geometry::LinearOctree octree(size_t(state.range(1)));
+    octree.ConvertFromPointCloud(*pcd_, 0.01);
+    for (auto _ : state) {
+        benchmark::DoNotOptimize(octree.LocateLeafNodes(pcd_->points_));
+    }
+    state.SetItemsProcessed(state.iterations() * state.range(0));
+}
+
+// Args: {num_points, max_depth}. Octree::LocateLeafNode traverses the whole
+// tree for every point, so it is only run on small inputs.
+BENCHMARK_REGISTER_F(OctreeFixture, ConvertFromPointCloud)
+        ->Args({100000, 8})
+        ->Args({1000000, 10})
+        ->Unit(benchmark::kMillisecond);
+BENCHMARK_REGISTER_F(OctreeFixture, LinearConvertFromPointCloud)
+        ->Args({100000, 8})
+        ->Args({1000000, 10})
+        ->Args({10000000, 12})
+        ->Unit(benchmark::kMillisecond);
+BENCHMARK_REGISTER_F(OctreeFixture, LocateLeafNode)
+        ->Args({1000, 6})
+        ->Unit(benchmark::kMillisecond);
+BENCHMARK_REGISTER_F(OctreeFixture, LinearLocateLeafNodes)
+        ->Args({1000, 6})
+        ->Args({1000000, 10})
+        ->Unit(benchmark::kMillisecond);
+
+}  // namespace benchmarks
+}  // namespace open3d
@@ -0,0 +1,317 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/geometry/PointCloud.h"
+
+#include <benchmark/benchmark.h>
+
+#include <algorithm>
+#include <numeric>
+#include <random>
+
+#include "open3d/camera/PinholeCameraIntrinsic.h"
+#include "open3d/geometry/BoundingVolume.h"
+#include "open3d/geometry/Image.h"
+#include "open3d/geometry/KDTreeFlann.h"
+#include "open3d/geometry/RGBDImage.h"
+#include "open3d/geometry/RGBDToPointCloudConverter.h"
+#include "open3d/io/ImageIO.h"
+#include "open3d/io/PointCloudIO.h"
+
+namespace open3d {
+namespace benchmarks {
+
+// Point cloud in random order, as it may arrive from a sensor or a merge of
+// scans. With state.range(0) == 1, it is sorted by Morton code first.
+class MortonOrderFixture : public benchmark::Fixture {
+public:
+    void SetUp(const benchmark::State& state) {
+        auto pcd = io::CreatePointCloudFromFile(TEST_DATA_DIR "/fragment.pcd");
+        std::vector<size_t> order(pcd->points_.size());
+        std::iota(order.begin(), order.end(), 0);
+        std::shuffle(order.begin(), order.end(), std::mt19937(0));
+        pcd_ = std::make_shared<geometry::PointCloud>();
+        for (size_t i : order) {
+            pcd_->points_.push_back(pcd->points_[i]);
+        }
+        if (state.range(0) == 1) {
+            pcd_->SortByMortonCode();
+        }
+    }
+
+    void TearDown(const benchmark::State& state) { pcd_.reset(); }
+
+    std::shared_ptr<geometry::PointCloud> pcd_;
+};
+
+BENCHMARK_DEFINE_F(MortonOrderFixture, EstimateNormals)
+(benchmark::State& state) {
+    for (auto _ : state) {
+        pcd_->EstimateNormals(geometry::KDTreeSearchParamKNN(30));
+    }
+}
+
+BENCHMARK_DEFINE_F(MortonOrderFixture, KDTreeFlannSearchKNN)
+(benchmark::State& state) {
+    geometry::KDTreeFlann kdtree(*pcd_);
+    std::vector<int> indices;
+    std::vector<double> distance2;
+    for (auto _ : state) {
+        for (const Eigen::Vector3d& point : pcd_->points_) {
+            kdtree.SearchKNN(point, 30, indices, distance2);
+        }
+    }
+}
+
+BENCHMARK_DEFINE_F(MortonOrderFixture, SortByMortonCode)
+(benchmark::State& state) {
+    for (auto _ : state) {
+        pcd_->SortByMortonCode();
+    }
+}
+
+// Argument: 0 for random order, 1 for Morton order.
+BENCHMARK_REGISTER_F(MortonOrderFixture, EstimateNormals)
+        ->Arg(0)
+        ->Arg(1)
+        ->Unit(benchmark::kMillisecond);
+BENCHMARK_REGISTER_F(MortonOrderFixture, KDTreeFlannSearchKNN)
+        ->Arg(0)
+        ->Arg(1)
+        ->Unit(benchmark::kMillisecond);
+BENCHMARK_REGISTER_F(MortonOrderFixture, SortByMortonCode)
+        ->Arg(0)
+        ->Unit(benchmark::kMillisecond);
+
+// Fragment repeated state.range(0) times with shifted copies, downsampled
+// with a voxel size of state.range(1) millimeters.
+class VoxelDownSampleFixture : public benchmark::Fixture {
+public:
+    void SetUp(const benchmark::State& state) {
+        auto pcd = io::CreatePointCloudFromFile(TEST_DATA_DIR "/fragment.pcd");
+        pcd_ = std::make_shared<geometry::PointCloud>();
+        for (int64_t i = 0; i < state.range(0); ++i) {
+            geometry::PointCloud copy = *pcd;
+            copy.Translate(Eigen::Vector3d(0.001 * i, 0.0, 0.0));
+            *pcd_ += copy;
+        }
+    }
+
+    void TearDown(const benchmark::State& state) { pcd_.reset(); }
+
+    std::shared_ptr<geometry::PointCloud> pcd_;
+};
+
+BENCHMARK_DEFINE_F(VoxelDownSampleFixture, VoxelDownSample)
+(benchmark::State& state) {
+    const double voxel_size = 0.001 * state.range(1);
+    for (auto _ : state) {
+        auto down = pcd_->VoxelDownSample(voxel_size);
+        benchmark::DoNotOptimize(down);
+    }
+    state.SetItemsProcessed(state.iterations() * int64_t(pcd_->points_.size()));
+}
+
+// Args: {num_copies, voxel_size_mm}.
+BENCHMARK_REGISTER_F(VoxelDownSampleFixture, VoxelDownSample)
+        ->Args({1, 5})
+        ->Args({1, 20})
+        ->Args({16, 5})
+        ->Args({16, 20})
+        ->Unit(benchmark::kMillisecond);
+
+// Fragment repeated state.range(0) times with shifted copies, with normals
+// and colors, of which about half the points are selected.
+class SelectFixture : public benchmark::Fixture {
+public:
+    void SetUp(const benchmark::State& state) {
+        auto pcd = io::CreatePointCloudFromFile(TEST_DATA_DIR "/fragment.pcd");
+        pcd->normals_.assign(pcd->points_.size(), Eigen::Vector3d(0, 0, 1));
+        pcd->colors_.assign(pcd->points_.size(), Eigen::Vector3d(1, 0, 0));
+        pcd_ = std::make_shared<geometry::PointCloud>();
+        for (int64_t i = 0; i < state.range(0); ++i) {
+            geometry::PointCloud copy = *pcd;
+            copy.Translate(Eigen::Vector3d(0.001 * i, 0.0, 0.0));
+            *pcd_ += copy;
+        }
+        const Eigen::Vector3d center = pcd_->GetCenter();
+        mask_.resize(pcd_->points_.size());
+        for (size_t i = 0; i < pcd_->points_.size(); ++i) {
+            mask_[i] = pcd_->points_[i](0) < center(0);
+        }
+        bbox_ = pcd_->GetAxisAlignedBoundingBox();
+        bbox_.max_bound_(0) = center(0);
+    }
+
+    void TearDown(const benchmark::State& state) { pcd_.reset(); }
+
+    std::shared_ptr<geometry::PointCloud> pcd_;
+    std::vector<bool> mask_;
+    geometry::AxisAlignedBoundingBox bbox_;
+};
+
+BENCHMARK_DEFINE_F(SelectFixture, SelectByMask)
+(benchmark::State& state) {
+    for (auto _ : state) {
+        auto selected = pcd_->SelectByMask(mask_);
+        benchmark::DoNotOptimize(selected);
+    }
+    state.SetItemsProcessed(state.iterations() * int64_t(pcd_->points_.size()));
+}
+
+BENCHMARK_DEFINE_F(SelectFixture, Crop)
+(benchmark::State& state) {
+    for (auto _ : state) {
+        auto cropped = pcd_->Crop(bbox_);
+        benchmark::DoNotOptimize(cropped);
+    }
+    state.SetItemsProcessed(state.iterations() * int64_t(pcd_->points_.size()));
+}
+
+// Argument: number of copies of the fragment.
+BENCHMARK_REGISTER_F(SelectFixture, SelectByMask)
+        ->Arg(1)
+        ->Arg(16)
+        ->Unit(benchmark::kMillisecond);
+BENCHMARK_REGISTER_F(SelectFixture, Crop)
+        ->Arg(1)
+        ->Arg(16)
+        ->Unit(benchmark::kMillisecond);
+
+// Visibility of the fragment from state.range(0) camera locations on a
+// sphere around it, with a cube map of state.range(1) pixels per side.
+static void ComputePointVisibilityZBuffer(benchmark::State& state) {
+    auto pcd = io::CreatePointCloudFromFile(TEST_DATA_DIR "/fragment.pcd");
+    const Eigen::Vector3d center = pcd->GetCenter();
+    std::vector<Eigen::Vector3d> camera_locations;
+    std::mt19937 rng(0);
+    std::normal_distribution<double> normal;
+    for (int64_t i = 0; i < state.range(0); ++i) {
+        Eigen::Vector3d direction(normal(rng), normal(rng), normal(rng));
+        camera_locations.push_back(center + 5 * direction.normalized());
+    }
+    for (auto _ : state) {
+        auto visibility = pcd->ComputePointVisibility(
+                camera_locations, 0,
+                geometry::PointCloud::VisibilityMethod::ZBuffer,
+                int(state.range(1)));
+        benchmark::DoNotOptimize(visibility);
+    }
+    state.SetItemsProcessed(state.iterations() * state.range(0) *
+                            int64_t(pcd->points_.size()));
+}
+
+// Args: {num_camera_locations, resolution}.
+BENCHMARK(ComputePointVisibilityZBuffer)
+        ->Args({16, 256})
+        ->Args({64, 256})
+        ->Unit(benchmark::kMillisecond);
+
+// Fragment with estimated normals, downsampled with a voxel size of
+// state.range(0) millimeters if it is positive.
+class OrientNormalsFixture : public benchmark::Fixture {
+public:
+    void SetUp(const benchmark::State& state) {
+        pcd_ = io::CreatePointCloudFromFile(TEST_DATA_DIR "/fragment.pcd");
+        if (state.range(0) > 0) {
+            pcd_ = pcd_->VoxelDownSample(0.001 * state.range(0));
+        }
+        pcd_->EstimateNormals(geometry::KDTreeSearchParamKNN(30));
+        normals_ = pcd_->normals_;
+    }
+
+    void TearDown(const benchmark::State& state) { pcd_.reset(); }
+
+    std::shared_ptr<geometry::PointCloud> pcd_;
+    std::vector<Eigen::Vector3d> normals_;
+};
+
+BENCHMARK_DEFINE_F(OrientNormalsFixture, OrientNormalsConsistentTangentPlane)
+(benchmark::State& state) {
+    for (auto _ : state) {
+        state.PauseTiming();
+        pcd_->normals_ = normals_;
+        state.ResumeTiming();
+        pcd_->OrientNormalsConsistentTangentPlane(10);
+    }
+    state.SetItemsProcessed(state.iterations() * int64_t(pcd_->points_.size()));
+}
+
+// Argument: voxel size in millimeters, 0 for the full fragment.
+BENCHMARK_REGISTER_F(OrientNormalsFixture, OrientNormalsConsistentTangentPlane)
+        ->Arg(0)
+        ->Arg(10)
+        ->Unit(benchmark::kMillisecond);
+
+// 640 x 480 frame of the RGBD test data, converted with
+// PointCloud::CreateFromRGBDImage if state.range(0) == 0 and by reusing an
+// RGBDToPointCloudConverter and its output if state.range(0) == 1. With
+// state.range(1) == 0 only the 16 bit depth image is converted.
+static void RGBDToPointCloud(benchmark::State& state) {
+    const camera::PinholeCameraIntrinsic intrinsic(
+            camera::PinholeCameraIntrinsicParameters::PrimeSenseDefault);
+    auto depth = io::CreateImageFromFile(TEST_DATA_DIR "/RGBD/depth/00000.png");
+    auto color = io::CreateImageFromFile(TEST_DATA_DIR "/RGBD/color/00000.jpg");
+    const bool reuse = state.range(0) == 1;
+    const bool with_color = state.range(1) == 1;
+    const geometry::RGBDToPointCloudConverter converter(intrinsic);
+    geometry::PointCloud output;
+    for (auto _ : state) {
+        if (with_color) {
+            // The float depth conversion is part of every frame of
+            // CreateFromRGBDImage, as the depth is read as 16 bit.
+            auto rgbd = geometry::RGBDImage::CreateFromColorAndDepth(
+                    *color, *depth, 1000.0, 3.0, false);
+            if (reuse) {
+                converter.ConvertRGBDImage(*rgbd, output);
+            } else {
+                auto pcd = geometry::PointCloud::CreateFromRGBDImage(*rgbd,
+                                                                     intrinsic);
+                benchmark::DoNotOptimize(pcd);
+            }
+        } else if (reuse) {
+            converter.ConvertDepthImage(*depth, output);
+        } else {
+            auto pcd = geometry::PointCloud::CreateFromDepthImage(*depth,
+                                                                  intrinsic);
+            benchmark::DoNotOptimize(pcd);
+        }
+        benchmark::DoNotOptimize(output.points_.data());
+    }
+    state.SetItemsProcessed(state.iterations() *
+                            int64_t(depth->width_ * depth->height_));
+}
+
+// Args: {reuse_converter, with_color}.
+BENCHMARK(RGBDToPointCloud)
+        ->Args({0, 0})
+        ->Args({1, 0})
+        ->Args({0, 1})
+        ->Args({1, 1})
+        ->Unit(benchmark::kMillisecond);
+
+}  // namespace benchmarks
+}  // namespace open3d
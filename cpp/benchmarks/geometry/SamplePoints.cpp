@@ -26,39 +26,72 @@
 
 #include <benchmark/benchmark.h>
 
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
 #include "open3d/geometry/TriangleMesh.h"
 #include "open3d/io/TriangleMeshIO.h"
 
 namespace open3d {
 namespace benchmarks {
 
+// Samples state.range(0) points with state.range(1) threads, or with the
+// default number of threads if state.range(1) == 0.
 class SamplePointsFixture : public benchmark::Fixture {
 public:
     void SetUp(const benchmark::State& state) {
         trimesh = open3d::io::CreateMeshFromFile(TEST_DATA_DIR "/knot.ply");
+#ifdef _OPENMP
+        max_threads = omp_get_max_threads();
+        if (state.range(1) > 0) {
+            omp_set_num_threads(int(state.range(1)));
+        }
+#endif
     }
 
     void TearDown(const benchmark::State& state) {
-        // empty
+#ifdef _OPENMP
+        omp_set_num_threads(max_threads);
+#endif
     }
     std::shared_ptr<open3d::geometry::TriangleMesh> trimesh;
+    int max_threads = 1;
 };
 
 BENCHMARK_DEFINE_F(SamplePointsFixture, Poisson)(benchmark::State& state) {
     for (auto _ : state) {
         trimesh->SamplePointsPoissonDisk(state.range(0));
     }
+    state.SetItemsProcessed(state.iterations() * state.range(0));
 }
 
-BENCHMARK_REGISTER_F(SamplePointsFixture, Poisson)->Args({123})->Args({1000});
+// Args: {number_of_points, threads}.
+BENCHMARK_REGISTER_F(SamplePointsFixture, Poisson)
+        ->Args({123, 0})
+        ->Args({1000, 0})
+        ->Args({20000, 1})
+        ->Args({20000, 2})
+        ->Args({20000, 4})
+        ->Args({20000, 8})
+        ->Unit(benchmark::kMillisecond);
 
 BENCHMARK_DEFINE_F(SamplePointsFixture, Uniform)(benchmark::State& state) {
     for (auto _ : state) {
         trimesh->SamplePointsUniformly(state.range(0));
     }
+    state.SetItemsProcessed(state.iterations() * state.range(0));
 }
 
-BENCHMARK_REGISTER_F(SamplePointsFixture, Uniform)->Args({123})->Args({1000});
+// Args: {number_of_points, threads}.
+BENCHMARK_REGISTER_F(SamplePointsFixture, Uniform)
+        ->Args({123, 0})
+        ->Args({1000, 0})
+        ->Args({1000000, 1})
+        ->Args({1000000, 2})
+        ->Args({1000000, 4})
+        ->Args({1000000, 8})
+        ->Unit(benchmark::kMillisecond);
 
 }  // namespace benchmarks
 }  // namespace open3d
@@ -0,0 +1,90 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include <benchmark/benchmark.h>
+
+#include <cmath>
+#include <random>
+
+#include "open3d/geometry/PointCloud.h"
+#include "open3d/geometry/TriangleMesh.h"
+
+namespace open3d {
+namespace benchmarks {
+
+// Scan of a height field with about num_points points on a jittered grid,
+// with the normals of the height field. Returns the grid spacing in spacing.
+static std::shared_ptr<geometry::PointCloud> CreateHeightFieldScan(
+        int64_t num_points, double& spacing) {
+    const int resolution = int(std::sqrt(double(num_points)));
+    spacing = 1.0 / resolution;
+    std::mt19937 rng(0);
+    std::uniform_real_distribution<double> jitter(-0.25 * spacing,
+                                                  0.25 * spacing);
+    auto scan = std::make_shared<geometry::PointCloud>();
+    scan->points_.reserve(int64_t(resolution) * resolution);
+    scan->normals_.reserve(int64_t(resolution) * resolution);
+    for (int i = 0; i < resolution; ++i) {
+        for (int j = 0; j < resolution; ++j) {
+            const double x = (i + 0.5) * spacing + jitter(rng);
+            const double y = (j + 0.5) * spacing + jitter(rng);
+            const double z = 0.05 * std::sin(6 * x) * std::cos(6 * y);
+            scan->points_.emplace_back(x, y, z);
+            scan->normals_.push_back(
+                    Eigen::Vector3d(-0.3 * std::cos(6 * x) * std::cos(6 * y),
+                                    0.3 * std::sin(6 * x) * std::sin(6 * y),
+                                    1.0)
+                            .normalized());
+        }
+    }
+    return scan;
+}
+
+// Ball pivoting of a scan of state.range(0) points, in parallel blocks if
+// state.range(1) == 1.
+static void BallPivoting(benchmark::State& state) {
+    double spacing;
+    auto scan = CreateHeightFieldScan(state.range(0), spacing);
+    const std::vector<double> radii = {1.5 * spacing, 3 * spacing};
+    for (auto _ : state) {
+        auto mesh = geometry::TriangleMesh::CreateFromPointCloudBallPivoting(
+                *scan, radii, state.range(1) == 1);
+        benchmark::DoNotOptimize(mesh);
+    }
+    state.SetItemsProcessed(state.iterations() * int64_t(scan->points_.size()));
+}
+
+// Args: {number_of_points, parallel}.
+BENCHMARK(BallPivoting)
+        ->Args({1000000, 0})
+        ->Args({1000000, 1})
+        ->Args({10000000, 0})
+        ->Args({10000000, 1})
+        ->Iterations(1)
+        ->Unit(benchmark::kSecond);
+
+}  // namespace benchmarks
+}  // namespace open3d
@@ -0,0 +1,254 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/geometry/TriangleMesh.h"
+
+#include <benchmark/benchmark.h>
+
+#include <limits>
+#include <random>
+
+#include "open3d/geometry/AsRigidAsPossibleDeformer.h"
+
+namespace open3d {
+namespace benchmarks {
+
+// Triangle soup of a sphere of resolution state.range(0), every triangle with
+// its own three vertices, as read from an STL file. With state.range(1) == 1
+// the vertices are moved by up to 1e-6, so that only MergeCloseVertices can
+// weld them.
+class TriangleSoupFixture : public benchmark::Fixture {
+public:
+    void SetUp(const benchmark::State& state) {
+        auto sphere =
+                geometry::TriangleMesh::CreateSphere(1.0, int(state.range(0)));
+        std::mt19937 rng(0);
+        std::uniform_real_distribution<double> noise(-1e-6, 1e-6);
+        soup_ = std::make_shared<geometry::TriangleMesh>();
+        for (const Eigen::Vector3i& triangle : sphere->triangles_) {
+            const int vidx = int(soup_->vertices_.size());
+            for (int k = 0; k < 3; ++k) {
+                Eigen::Vector3d vertex = sphere->vertices_[triangle(k)];
+                if (state.range(1) == 1) {
+                    vertex +=
+                            Eigen::Vector3d(noise(rng), noise(rng), noise(rng));
+                }
+                soup_->vertices_.push_back(vertex);
+            }
+            soup_->triangles_.emplace_back(vidx, vidx + 1, vidx + 2);
+        }
+    }
+
+    void TearDown(const benchmark::State& state) { soup_.reset(); }
+
+    std::shared_ptr<geometry::TriangleMesh> soup_;
+};
+
+BENCHMARK_DEFINE_F(TriangleSoupFixture, RemoveDuplicatedVertices)
+(benchmark::State& state) {
+    for (auto _ : state) {
+        state.PauseTiming();
+        geometry::TriangleMesh mesh = *soup_;
+        state.ResumeTiming();
+        mesh.RemoveDuplicatedVertices();
+    }
+    state.SetItemsProcessed(state.iterations() *
+                            int64_t(soup_->vertices_.size()));
+}
+
+BENCHMARK_DEFINE_F(TriangleSoupFixture, RemoveDuplicatedTriangles)
+(benchmark::State& state) {
+    // Every triangle twice, once with rotated vertices.
+    geometry::TriangleMesh welded = *soup_;
+    welded.RemoveDuplicatedVertices();
+    const size_t num_triangles = welded.triangles_.size();
+    for (size_t tidx = 0; tidx < num_triangles; ++tidx) {
+        const Eigen::Vector3i triangle = welded.triangles_[tidx];
+        welded.triangles_.emplace_back(triangle(1), triangle(2), triangle(0));
+    }
+    for (auto _ : state) {
+        state.PauseTiming();
+        geometry::TriangleMesh mesh = welded;
+        state.ResumeTiming();
+        mesh.RemoveDuplicatedTriangles();
+    }
+    state.SetItemsProcessed(state.iterations() *
+                            int64_t(welded.triangles_.size()));
+}
+
+BENCHMARK_DEFINE_F(TriangleSoupFixture, MergeCloseVertices)
+(benchmark::State& state) {
+    for (auto _ : state) {
+        state.PauseTiming();
+        geometry::TriangleMesh mesh = *soup_;
+        state.ResumeTiming();
+        mesh.MergeCloseVertices(1e-5);
+    }
+    state.SetItemsProcessed(state.iterations() *
+                            int64_t(soup_->vertices_.size()));
+}
+
+// Args: {sphere_resolution, noise}.
+BENCHMARK_REGISTER_F(TriangleSoupFixture, RemoveDuplicatedVertices)
+        ->Args({100, 0})
+        ->Args({500, 0})
+        ->Unit(benchmark::kMillisecond);
+BENCHMARK_REGISTER_F(TriangleSoupFixture, RemoveDuplicatedTriangles)
+        ->Args({100, 0})
+        ->Args({500, 0})
+        ->Unit(benchmark::kMillisecond);
+BENCHMARK_REGISTER_F(TriangleSoupFixture, MergeCloseVertices)
+        ->Args({100, 1})
+        ->Args({500, 1})
+        ->Unit(benchmark::kMillisecond);
+
+// Sphere of resolution state.range(0), decimated to 1% of its triangles, in
+// parallel if state.range(1) == 1.
+static void SimplifyQuadricDecimation(benchmark::State& state) {
+    auto sphere =
+            geometry::TriangleMesh::CreateSphere(1.0, int(state.range(0)));
+    const int target = int(sphere->triangles_.size() / 100);
+    for (auto _ : state) {
+        auto mesh = sphere->SimplifyQuadricDecimation(
+                target, std::numeric_limits<double>::infinity(), 1.0,
+                state.range(1) == 1);
+        benchmark::DoNotOptimize(mesh);
+    }
+    state.SetItemsProcessed(state.iterations() *
+                            int64_t(sphere->triangles_.size()));
+}
+
+// Args: {sphere_resolution, parallel}.
+BENCHMARK(SimplifyQuadricDecimation)
+        ->Args({100, 0})
+        ->Args({100, 1})
+        ->Args({300, 0})
+        ->Args({300, 1})
+        ->Unit(benchmark::kMillisecond);
+
+// Noisy sphere of resolution state.range(0), smoothed with one iteration of
+// each filter.
+class FilterFixture : public benchmark::Fixture {
+public:
+    void SetUp(const benchmark::State& state) {
+        mesh_ = geometry::TriangleMesh::CreateSphere(1.0, int(state.range(0)));
+        std::mt19937 rng(0);
+        std::uniform_real_distribution<double> noise(-1e-3, 1e-3);
+        for (Eigen::Vector3d& vertex : mesh_->vertices_) {
+            vertex += Eigen::Vector3d(noise(rng), noise(rng), noise(rng));
+        }
+        mesh_->ComputeVertexNormals();
+    }
+
+    void TearDown(const benchmark::State& state) { mesh_.reset(); }
+
+    std::shared_ptr<geometry::TriangleMesh> mesh_;
+};
+
+BENCHMARK_DEFINE_F(FilterFixture, ComputeAdjacencyCSR)
+(benchmark::State& state) {
+    for (auto _ : state) {
+        auto csr = mesh_->ComputeAdjacencyCSR();
+        benchmark::DoNotOptimize(csr);
+    }
+    state.SetItemsProcessed(state.iterations() *
+                            int64_t(mesh_->vertices_.size()));
+}
+
+BENCHMARK_DEFINE_F(FilterFixture, FilterSmoothSimple)
+(benchmark::State& state) {
+    for (auto _ : state) {
+        auto mesh = mesh_->FilterSmoothSimple(1);
+        benchmark::DoNotOptimize(mesh);
+    }
+    state.SetItemsProcessed(state.iterations() *
+                            int64_t(mesh_->vertices_.size()));
+}
+
+BENCHMARK_DEFINE_F(FilterFixture, FilterSmoothTaubin)
+(benchmark::State& state) {
+    for (auto _ : state) {
+        auto mesh = mesh_->FilterSmoothTaubin(1);
+        benchmark::DoNotOptimize(mesh);
+    }
+    state.SetItemsProcessed(state.iterations() *
+                            int64_t(mesh_->vertices_.size()));
+}
+
+// Args: {sphere_resolution}.
+BENCHMARK_REGISTER_F(FilterFixture, ComputeAdjacencyCSR)
+        ->Arg(100)
+        ->Arg(500)
+        ->Unit(benchmark::kMillisecond);
+BENCHMARK_REGISTER_F(FilterFixture, FilterSmoothSimple)
+        ->Arg(100)
+        ->Arg(500)
+        ->Unit(benchmark::kMillisecond);
+BENCHMARK_REGISTER_F(FilterFixture, FilterSmoothTaubin)
+        ->Arg(100)
+        ->Arg(500)
+        ->Unit(benchmark::kMillisecond);
+
+// Sphere of resolution state.range(0) with its poles pulled apart, through
+// DeformAsRigidAsPossible if state.range(1) == 0 and by reusing an
+// AsRigidAsPossibleDeformer if state.range(1) == 1.
+static void DeformAsRigidAsPossible(benchmark::State& state) {
+    auto sphere =
+            geometry::TriangleMesh::CreateSphere(1.0, int(state.range(0)));
+    std::vector<int> constraint_ids;
+    std::vector<Eigen::Vector3d> constraint_pos;
+    for (int i = 0; i < int(sphere->vertices_.size()); ++i) {
+        const Eigen::Vector3d& v = sphere->vertices_[i];
+        if (std::abs(v(2)) > 0.9) {
+            constraint_ids.push_back(i);
+            constraint_pos.push_back(v + Eigen::Vector3d(0, 0, 0.2 * v(2)));
+        }
+    }
+    geometry::AsRigidAsPossibleDeformer deformer(*sphere, constraint_ids);
+    for (auto _ : state) {
+        std::shared_ptr<geometry::TriangleMesh> mesh;
+        if (state.range(1) == 1) {
+            mesh = deformer.Deform(constraint_pos, 5);
+        } else {
+            mesh = sphere->DeformAsRigidAsPossible(constraint_ids,
+                                                   constraint_pos, 5);
+        }
+        benchmark::DoNotOptimize(mesh);
+    }
+    state.SetItemsProcessed(state.iterations() *
+                            int64_t(sphere->vertices_.size()));
+}
+
+// Args: {sphere_resolution, reuse_deformer}.
+BENCHMARK(DeformAsRigidAsPossible)
+        ->Args({50, 0})
+        ->Args({50, 1})
+        ->Args({150, 0})
+        ->Args({150, 1})
+        ->Unit(benchmark::kMillisecond);
+
+}  // namespace benchmarks
+}  // namespace open3d
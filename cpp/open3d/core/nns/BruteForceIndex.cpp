@@ -0,0 +1,386 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/core/nns/BruteForceIndex.h"
+
+#include <tbb/parallel_for.h>
+
+#include <algorithm>
+#include <numeric>
+
+#include "open3d/core/CoreUtil.h"
+#include "open3d/core/linalg/BlasWrapper.h"
+#include "open3d/utility/Console.h"
+
+namespace open3d {
+namespace core {
+namespace nns {
+
+constexpr int64_t BruteForceIndex::kQueryTileSize;
+constexpr int64_t BruteForceIndex::kDatasetTileSize;
+
+namespace {
+
+/// Squared distances between num_queries query points and num_points dataset
+/// points, written row-major to tile. Norms are the squared norms of the
+/// points.
+template <typename scalar_t>
+void ComputeDistanceTile(const scalar_t *queries,
+                         const scalar_t *query_norms,
+                         int64_t num_queries,
+                         const scalar_t *points,
+                         const scalar_t *point_norms,
+                         int64_t num_points,
+                         int64_t dimension,
+                         scalar_t *tile) {
+    // tile = -2 * queries * points^T.
+    gemm_cpu<scalar_t>(CblasRowMajor, CblasNoTrans, CblasTrans, num_queries,
+                       num_points, dimension, -2, queries, dimension, points,
+                       dimension, 0, tile, num_points);
+    for (int64_t i = 0; i < num_queries; ++i) {
+        scalar_t *row = tile + i * num_points;
+        for (int64_t j = 0; j < num_points; ++j) {
+            row[j] = std::max<scalar_t>(
+                    row[j] + query_norms[i] + point_norms[j], 0);
+        }
+    }
+}
+
+/// Squared norms of the rows of a {n, d} row-major matrix.
+template <typename scalar_t>
+void ComputeNorms(const scalar_t *points,
+                  int64_t num_points,
+                  int64_t dimension,
+                  scalar_t *norms) {
+    for (int64_t i = 0; i < num_points; ++i) {
+        const scalar_t *p = points + i * dimension;
+        norms[i] = std::inner_product(p, p + dimension, p, scalar_t(0));
+    }
+}
+
+/// Calls func(query_begin, num_queries, tile, dataset_begin, num_points) for
+/// every tile of the distance matrix, in parallel over query tiles. Within a
+/// query tile, dataset tiles are visited in order.
+template <typename scalar_t, typename func_t>
+void ForEachDistanceTile(const Tensor &query_points,
+                         const Tensor &dataset_points,
+                         const Tensor &dataset_norms,
+                         func_t func) {
+    const int64_t num_queries = query_points.GetShape()[0];
+    const int64_t num_points = dataset_points.GetShape()[0];
+    const int64_t dimension = dataset_points.GetShape()[1];
+    const int64_t query_tile_size = BruteForceIndex::kQueryTileSize;
+    const int64_t dataset_tile_size = BruteForceIndex::kDatasetTileSize;
+    const int64_t num_query_tiles =
+            (num_queries + query_tile_size - 1) / query_tile_size;
+
+    const scalar_t *queries_ptr =
+            static_cast<const scalar_t *>(query_points.GetDataPtr());
+    const scalar_t *points_ptr =
+            static_cast<const scalar_t *>(dataset_points.GetDataPtr());
+    const scalar_t *norms_ptr =
+            static_cast<const scalar_t *>(dataset_norms.GetDataPtr());
+
+    tbb::parallel_for(
+            tbb::blocked_range<int64_t>(0, num_query_tiles),
+            [&](const tbb::blocked_range<int64_t> &r) {
+                std::vector<scalar_t> tile(query_tile_size * dataset_tile_size);
+                std::vector<scalar_t> query_norms(query_tile_size);
+                for (int64_t t = r.begin(); t != r.end(); ++t) {
+                    const int64_t query_begin = t * query_tile_size;
+                    const int64_t tile_queries = std::min(
+                            query_tile_size, num_queries - query_begin);
+                    const scalar_t *tile_queries_ptr =
+                            queries_ptr + query_begin * dimension;
+                    ComputeNorms(tile_queries_ptr, tile_queries, dimension,
+                                 query_norms.data());
+                    for (int64_t point_begin = 0; point_begin < num_points;
+                         point_begin += dataset_tile_size) {
+                        const int64_t tile_points = std::min(
+                                dataset_tile_size, num_points - point_begin);
+                        ComputeDistanceTile(
+                                tile_queries_ptr, query_norms.data(),
+                                tile_queries,
+                                points_ptr + point_begin * dimension,
+                                norms_ptr + point_begin, tile_points, dimension,
+                                tile.data());
+                        func(query_begin, tile_queries, tile.data(),
+                             point_begin, tile_points);
+                    }
+                }
+            });
+}
+
+}  // namespace
+
+BruteForceIndex::BruteForceIndex(){};
+
+BruteForceIndex::BruteForceIndex(const Tensor &dataset_points) {
+    SetTensorData(dataset_points);
+};
+
+BruteForceIndex::~BruteForceIndex(){};
+
+int BruteForceIndex::GetDimension() const {
+    SizeVector shape = dataset_points_.GetShape();
+    return static_cast<int>(shape[1]);
+}
+
+size_t BruteForceIndex::GetDatasetSize() const {
+    SizeVector shape = dataset_points_.GetShape();
+    return static_cast<size_t>(shape[0]);
+}
+
+Dtype BruteForceIndex::GetDtype() const { return dataset_points_.GetDtype(); }
+
+bool BruteForceIndex::SetTensorData(const Tensor &dataset_points) {
+    if (dataset_points.NumDims() != 2) {
+        utility::LogError(
+                "[BruteForceIndex::SetTensorData] dataset_points must be "
+                "2D matrix, with shape {n_dataset_points, d}.");
+        return false;
+    }
+    if (dataset_points.GetDevice().GetType() != Device::DeviceType::CPU) {
+        utility::LogError(
+                "[BruteForceIndex::SetTensorData] dataset_points must be on "
+                "CPU.");
+        return false;
+    }
+    if (dataset_points.GetShape()[0] == 0) {
+        utility::LogError(
+                "[BruteForceIndex::SetTensorData] dataset_points is empty.");
+        return false;
+    }
+    Dtype dtype = dataset_points.GetDtype();
+    DISPATCH_FLOAT32_FLOAT64_DTYPE(dtype, [&]() {
+        center_ = dataset_points.Mean({0});
+        dataset_points_ = (dataset_points - center_).Contiguous();
+        const int64_t num_points = dataset_points_.GetShape()[0];
+        dataset_norms_ = Tensor::Empty({num_points}, dtype);
+        ComputeNorms(
+                static_cast<const scalar_t *>(dataset_points_.GetDataPtr()),
+                num_points, GetDimension(),
+                static_cast<scalar_t *>(dataset_norms_.GetDataPtr()));
+    });
+    return true;
+};
+
+Tensor BruteForceIndex::PrepareQuery(const Tensor &query_points,
+                                     const std::string &caller) const {
+    if (dataset_points_.NumElements() == 0) {
+        utility::LogError("[BruteForceIndex::{}] Index is not set.", caller);
+    }
+    if (query_points.GetDtype() != GetDtype()) {
+        utility::LogError("[BruteForceIndex::{}] Data type mismatch {} != {}.",
+                          caller, query_points.GetDtype().ToString(),
+                          GetDtype().ToString());
+    }
+    if (query_points.NumDims() != 2) {
+        utility::LogError(
+                "[BruteForceIndex::{}] query_points must be 2D matrix, with "
+                "shape {{n_query_points, d}}.",
+                caller);
+    }
+    if (query_points.GetShape()[1] != GetDimension()) {
+        utility::LogError(
+                "[BruteForceIndex::{}] query_points has different dimension "
+                "with dataset_points.",
+                caller);
+    }
+    return (query_points - center_).Contiguous();
+}
+
+std::pair<Tensor, Tensor> BruteForceIndex::SearchKnn(const Tensor &query_points,
+                                                     int knn) {
+    Tensor query = PrepareQuery(query_points, "SearchKnn");
+    if (knn <= 0) {
+        utility::LogError(
+                "[BruteForceIndex::SearchKnn] knn should be larger than 0.");
+    }
+
+    const int64_t num_query_points = query.GetShape()[0];
+    const int64_t k = std::min(static_cast<int64_t>(knn),
+                               static_cast<int64_t>(GetDatasetSize()));
+    Dtype dtype = GetDtype();
+    Tensor indices = Tensor::Empty({num_query_points, k}, Dtype::Int64);
+    Tensor distances = Tensor::Empty({num_query_points, k}, dtype);
+
+    DISPATCH_FLOAT32_FLOAT64_DTYPE(dtype, [&]() {
+        using entry_t = std::pair<scalar_t, int64_t>;
+        int64_t *indices_ptr = static_cast<int64_t *>(indices.GetDataPtr());
+        scalar_t *distances_ptr =
+                static_cast<scalar_t *>(distances.GetDataPtr());
+        const int64_t num_points = static_cast<int64_t>(GetDatasetSize());
+
+        // Running max-heaps of the k nearest neighbors of every query. Ties
+        // are broken by the smaller index.
+        std::vector<entry_t> heaps(num_query_points * k);
+        ForEachDistanceTile<scalar_t>(
+                query, dataset_points_, dataset_norms_,
+                [&](int64_t query_begin, int64_t num_queries,
+                    const scalar_t *tile, int64_t point_begin,
+                    int64_t num_tile_points) {
+                    for (int64_t i = 0; i < num_queries; ++i) {
+                        const scalar_t *row = tile + i * num_tile_points;
+                        entry_t *heap = heaps.data() + (query_begin + i) * k;
+                        for (int64_t j = 0; j < num_tile_points; ++j) {
+                            const int64_t index = point_begin + j;
+                            if (index < k) {
+                                // The heap is filled by the first k points.
+                                heap[index] = entry_t(row[j], index);
+                                std::push_heap(heap, heap + index + 1);
+                            } else if (entry_t(row[j], index) < heap[0]) {
+                                std::pop_heap(heap, heap + k);
+                                heap[k - 1] = entry_t(row[j], index);
+                                std::push_heap(heap, heap + k);
+                            }
+                        }
+                    }
+                    if (point_begin + num_tile_points < num_points) {
+                        return;
+                    }
+                    // Last dataset tile: write the sorted neighbors.
+                    for (int64_t i = 0; i < num_queries; ++i) {
+                        entry_t *heap = heaps.data() + (query_begin + i) * k;
+                        std::sort_heap(heap, heap + k);
+                        const int64_t offset = (query_begin + i) * k;
+                        for (int64_t j = 0; j < k; ++j) {
+                            distances_ptr[offset + j] = heap[j].first;
+                            indices_ptr[offset + j] = heap[j].second;
+                        }
+                    }
+                });
+    });
+    return std::make_pair(indices, distances);
+};
+
+std::tuple<Tensor, Tensor, Tensor> BruteForceIndex::SearchRadius(
+        const Tensor &query_points, const Tensor &radii) {
+    Tensor query = PrepareQuery(query_points, "SearchRadius");
+    if (query_points.GetDtype() != radii.GetDtype()) {
+        utility::LogError(
+                "[BruteForceIndex::SearchRadius] query tensor and radii "
+                "have different data type.");
+    }
+    if (radii.NumDims() != 1 ||
+        query_points.GetShape()[0] != radii.GetShape()[0]) {
+        utility::LogError(
+                "[BruteForceIndex::SearchRadius] radii tensor must be 1 "
+                "dimensional matrix, with shape {n, }.");
+    }
+    if (radii.Le(0).Any()) {
+        utility::LogError(
+                "[BruteForceIndex::SearchRadius] radius should be larger than "
+                "0.");
+    }
+
+    const int64_t num_query_points = query.GetShape()[0];
+    Dtype dtype = GetDtype();
+    Tensor indices;
+    Tensor distances;
+    Tensor num_neighbors = Tensor::Empty({num_query_points}, Dtype::Int64);
+
+    DISPATCH_FLOAT32_FLOAT64_DTYPE(dtype, [&]() {
+        using entry_t = std::pair<scalar_t, int64_t>;
+        const Tensor radii_contiguous = radii.Contiguous();
+        const scalar_t *radii_ptr =
+                static_cast<const scalar_t *>(radii_contiguous.GetDataPtr());
+        std::vector<std::vector<entry_t>> neighbors(num_query_points);
+
+        ForEachDistanceTile<scalar_t>(
+                query, dataset_points_, dataset_norms_,
+                [&](int64_t query_begin, int64_t num_queries,
+                    const scalar_t *tile, int64_t point_begin,
+                    int64_t num_tile_points) {
+                    for (int64_t i = 0; i < num_queries; ++i) {
+                        const scalar_t *row = tile + i * num_tile_points;
+                        const scalar_t radius = radii_ptr[query_begin + i];
+                        const scalar_t radius_sq = radius * radius;
+                        std::vector<entry_t> &query_neighbors =
+                                neighbors[query_begin + i];
+                        for (int64_t j = 0; j < num_tile_points; ++j) {
+                            if (row[j] < radius_sq) {
+                                query_neighbors.emplace_back(row[j],
+                                                             point_begin + j);
+                            }
+                        }
+                    }
+                });
+
+        // Sort by distance and flatten.
+        std::vector<int64_t> offsets(num_query_points + 1, 0);
+        tbb::parallel_for(tbb::blocked_range<int64_t>(0, num_query_points),
+                          [&](const tbb::blocked_range<int64_t> &r) {
+                              for (int64_t i = r.begin(); i != r.end(); ++i) {
+                                  std::sort(neighbors[i].begin(),
+                                            neighbors[i].end());
+                                  offsets[i + 1] = neighbors[i].size();
+                              }
+                          });
+        std::partial_sum(offsets.begin(), offsets.end(), offsets.begin());
+        const int64_t total_num = offsets.back();
+
+        indices = Tensor::Empty({total_num}, Dtype::Int64);
+        distances = Tensor::Empty({total_num}, dtype);
+        int64_t *indices_ptr = static_cast<int64_t *>(indices.GetDataPtr());
+        scalar_t *distances_ptr =
+                static_cast<scalar_t *>(distances.GetDataPtr());
+        int64_t *num_neighbors_ptr =
+                static_cast<int64_t *>(num_neighbors.GetDataPtr());
+        tbb::parallel_for(tbb::blocked_range<int64_t>(0, num_query_points),
+                          [&](const tbb::blocked_range<int64_t> &r) {
+                              for (int64_t i = r.begin(); i != r.end(); ++i) {
+                                  int64_t offset = offsets[i];
+                                  for (const entry_t &e : neighbors[i]) {
+                                      distances_ptr[offset] = e.first;
+                                      indices_ptr[offset] = e.second;
+                                      ++offset;
+                                  }
+                                  num_neighbors_ptr[i] =
+                                          offsets[i + 1] - offsets[i];
+                              }
+                          });
+    });
+    return std::make_tuple(indices, distances, num_neighbors);
+};
+
+std::tuple<Tensor, Tensor, Tensor> BruteForceIndex::SearchRadius(
+        const Tensor &query_points, double radius) {
+    int64_t num_query_points = query_points.GetShape()[0];
+    Dtype dtype = GetDtype();
+    std::tuple<Tensor, Tensor, Tensor> result;
+    DISPATCH_FLOAT32_FLOAT64_DTYPE(dtype, [&]() {
+        Tensor radii(std::vector<scalar_t>(num_query_points,
+                                           static_cast<scalar_t>(radius)),
+                     {num_query_points}, dtype);
+        result = SearchRadius(query_points, radii);
+    });
+    return result;
+};
+
+}  // namespace nns
+}  // namespace core
+}  // namespace open3d
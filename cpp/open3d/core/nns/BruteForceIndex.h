@@ -0,0 +1,142 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#pragma once
+
+#include <vector>
+
+#include "open3d/core/Tensor.h"
+
+namespace open3d {
+namespace core {
+namespace nns {
+
+/// \class BruteForceIndex
+///
+/// \brief Exact nearest neighbor search by blocked brute force.
+///
+/// Squared distances are computed with BLAS in tiles of kQueryTileSize query
+/// points by kDatasetTileSize dataset points, using
+/// |q - p|^2 = |q|^2 + |p|^2 - 2 q.p, and reduced into running per-query top-k
+/// heaps (or radius lists) tile by tile, so that the full distance matrix is
+/// never materialized. Query tiles are processed in parallel. Points are
+/// centered on the dataset mean to limit cancellation in the expansion.
+///
+/// This is faster than tree traversal for small datasets, large query batches
+/// and high dimensional points, where KDTrees degenerate to brute force.
+class BruteForceIndex {
+public:
+    /// \brief Default Constructor.
+    BruteForceIndex();
+
+    /// \brief Parameterized Constructor.
+    ///
+    /// \param dataset_points Provides a set of data points as Tensor for index
+    /// construction.
+    BruteForceIndex(const Tensor &dataset_points);
+    ~BruteForceIndex();
+    BruteForceIndex(const BruteForceIndex &) = delete;
+    BruteForceIndex &operator=(const BruteForceIndex &) = delete;
+
+public:
+    /// Set the data for the index from a Tensor.
+    ///
+    /// \param dataset_points Dataset points. Must be 2D, with shape {n, d},
+    /// dtype Float32 or Float64.
+    /// \return Returns true if the construction success, otherwise false.
+    bool SetTensorData(const Tensor &dataset_points);
+
+    /// Perform K nearest neighbor search.
+    ///
+    /// \param query_points Query points. Must be 2D, with shape {n, d}, same
+    /// dtype with dataset_points.
+    /// \param knn Number of nearest neighbor to search.
+    /// \return Pair of Tensors: (indices, distances):
+    /// - indices: Tensor of shape {n, min(knn, n_dataset_points)}, with dtype
+    /// Int64.
+    /// - distainces: Tensor of shape {n, min(knn, n_dataset_points)}, same
+    /// dtype with dataset_points.
+    std::pair<Tensor, Tensor> SearchKnn(const Tensor &query_points, int knn);
+
+    /// Perform radius search with multiple radii.
+    ///
+    /// \param query_points Query points. Must be 2D, with shape {n, d}, same
+    /// dtype with dataset_points.
+    /// \param radii list of radius. Must be 1D, with shape {n, }.
+    /// \return Tuple of Tensors: (indices, distances, num_neighbors):
+    /// - indicecs: Tensor of shape {total_num_neighbors,}, dtype Int64.
+    /// - distances: Tensor of shape {total_num_neighbors,}, same dtype with
+    /// dataset_points.
+    /// - num_neighbors: Tensor of shape {n,}, dtype Int64.
+    std::tuple<Tensor, Tensor, Tensor> SearchRadius(const Tensor &query_points,
+                                                    const Tensor &radii);
+
+    /// Perform radius search.
+    ///
+    /// \param query_points Query points. Must be 2D, with shape {n, d}, same
+    /// dtype with dataset_points.
+    /// \param radius Radius.
+    /// \return Tuple of Tensors, (indices, distances, num_neighbors):
+    /// - indicecs: Tensor of shape {total_num_neighbors,}, dtype Int64.
+    /// - distances: Tensor of shape {total_num_neighbors,}, same dtype with
+    /// dataset_points.
+    /// - num_neighbors: Tensor of shape {n}, dtype Int64.
+    std::tuple<Tensor, Tensor, Tensor> SearchRadius(const Tensor &query_points,
+                                                    double radius);
+
+    /// Get dimension of the dataset points.
+    int GetDimension() const;
+
+    /// Get size of the dataset points.
+    size_t GetDatasetSize() const;
+
+    /// Get dtype of the dataset points.
+    Dtype GetDtype() const;
+
+public:
+    /// Number of query points per tile.
+    static constexpr int64_t kQueryTileSize = 64;
+    /// Number of dataset points per tile. A tile of distances takes 256 KB in
+    /// Float32 and stays in L2 cache.
+    static constexpr int64_t kDatasetTileSize = 1024;
+
+private:
+    /// Check query points and center them on the dataset mean.
+    Tensor PrepareQuery(const Tensor &query_points,
+                        const std::string &caller) const;
+
+protected:
+    /// Dataset points centered on center_, with shape {n, d}.
+    Tensor dataset_points_;
+    /// Mean of the dataset points, with shape {d,}.
+    Tensor center_;
+    /// Squared norms of the centered dataset points, with shape {n,}.
+    Tensor dataset_norms_;
+};
+
+}  // namespace nns
+}  // namespace core
+}  // namespace open3d
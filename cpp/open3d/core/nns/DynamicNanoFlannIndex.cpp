@@ -0,0 +1,400 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/core/nns/DynamicNanoFlannIndex.h"
+
+#include <tbb/parallel_for.h>
+
+#include <algorithm>
+#include <cstring>
+#include <numeric>
+#include <set>
+
+#include "open3d/core/CoreUtil.h"
+#include "open3d/utility/Console.h"
+
+namespace open3d {
+namespace core {
+namespace nns {
+
+DynamicNanoFlannIndex::DynamicNanoFlannIndex(int dimension,
+                                             Dtype dtype,
+                                             int64_t leaf_size)
+    : dimension_(dimension), dtype_(dtype), leaf_size_(leaf_size) {
+    if (dimension <= 0) {
+        utility::LogError(
+                "[DynamicNanoFlannIndex] dimension should be larger than 0.");
+    }
+    if (dtype != Dtype::Float32 && dtype != Dtype::Float64) {
+        utility::LogError(
+                "[DynamicNanoFlannIndex] dtype must be Float32 or Float64.");
+    }
+    if (leaf_size <= 0) {
+        utility::LogError(
+                "[DynamicNanoFlannIndex] leaf_size should be larger than 0.");
+    }
+};
+
+DynamicNanoFlannIndex::~DynamicNanoFlannIndex(){};
+
+int64_t DynamicNanoFlannIndex::GetDatasetSize() const {
+    int64_t num_points = 0;
+    for (const Tree &tree : trees_) {
+        num_points += tree.NumPoints();
+    }
+    return num_points;
+}
+
+int64_t DynamicNanoFlannIndex::GetNumTrees() const {
+    return std::count_if(trees_.begin(), trees_.end(),
+                         [](const Tree &tree) { return tree.NumPoints() > 0; });
+}
+
+void DynamicNanoFlannIndex::AssertPoints(const Tensor &points,
+                                         const std::string &caller) const {
+    if (points.GetDevice().GetType() != Device::DeviceType::CPU) {
+        utility::LogError(
+                "[DynamicNanoFlannIndex::{}] Only CPU tensors are "
+                "supported.",
+                caller);
+    }
+    if (points.GetDtype() != dtype_) {
+        utility::LogError(
+                "[DynamicNanoFlannIndex::{}] Data type mismatch {} != {}.",
+                caller, points.GetDtype().ToString(), dtype_.ToString());
+    }
+    if (points.NumDims() != 2 || points.GetShape()[1] != dimension_) {
+        utility::LogError(
+                "[DynamicNanoFlannIndex::{}] points must be 2D matrix, with "
+                "shape {{n, {}}}.",
+                caller, dimension_);
+    }
+}
+
+void DynamicNanoFlannIndex::CollectLivePoints(
+        size_t level,
+        std::vector<const void *> &rows,
+        std::vector<int64_t> &indices) const {
+    const Tree &tree = trees_[level];
+    const int64_t row_bytes = dimension_ * dtype_.ByteSize();
+    const uint8_t *data_ptr =
+            static_cast<const uint8_t *>(tree.points_.GetDataPtr());
+    for (size_t i = 0; i < tree.indices_.size(); ++i) {
+        if (!tree.removed_[i]) {
+            rows.push_back(data_ptr + i * row_bytes);
+            indices.push_back(tree.indices_[i]);
+        }
+    }
+}
+
+void DynamicNanoFlannIndex::BuildTree(size_t level,
+                                      const std::vector<const void *> &rows,
+                                      std::vector<int64_t> &&indices) {
+    const int64_t num_rows = static_cast<int64_t>(rows.size());
+    const int64_t row_bytes = dimension_ * dtype_.ByteSize();
+    std::vector<int64_t> order(num_rows);
+    std::iota(order.begin(), order.end(), 0);
+    std::sort(order.begin(), order.end(),
+              [&](int64_t a, int64_t b) { return indices[a] < indices[b]; });
+
+    // The rows may point into the current tree, so copy them out first.
+    Tensor points = Tensor::Empty({num_rows, dimension_}, dtype_);
+    std::vector<int64_t> sorted_indices(num_rows);
+    uint8_t *data_ptr = static_cast<uint8_t *>(points.GetDataPtr());
+    tbb::parallel_for(tbb::blocked_range<int64_t>(0, num_rows),
+                      [&](const tbb::blocked_range<int64_t> &r) {
+                          for (int64_t i = r.begin(); i != r.end(); ++i) {
+                              std::memcpy(data_ptr + i * row_bytes,
+                                          rows[order[i]], row_bytes);
+                              sorted_indices[i] = indices[order[i]];
+                          }
+                      });
+
+    Tree &tree = trees_[level];
+    tree.index_.reset();
+    tree.points_ = points;
+    tree.indices_ = std::move(sorted_indices);
+    tree.removed_.assign(num_rows, 0);
+    tree.num_removed_ = 0;
+    if (num_rows > 0) {
+        tree.index_.reset(new NanoFlannIndex(tree.points_));
+    }
+}
+
+Tensor DynamicNanoFlannIndex::AddPoints(const Tensor &points) {
+    AssertPoints(points, "AddPoints");
+    Tensor contiguous_points = points.Contiguous();
+    const int64_t num_points = contiguous_points.GetShape()[0];
+    const int64_t row_bytes = dimension_ * dtype_.ByteSize();
+    const int64_t first_index = next_index_;
+    next_index_ += num_points;
+
+    std::vector<const void *> rows(num_points);
+    std::vector<int64_t> indices(num_points);
+    const uint8_t *data_ptr =
+            static_cast<const uint8_t *>(contiguous_points.GetDataPtr());
+    for (int64_t i = 0; i < num_points; ++i) {
+        rows[i] = data_ptr + i * row_bytes;
+        indices[i] = first_index + i;
+    }
+    Tensor result(indices, {num_points}, Dtype::Int64);
+    if (num_points == 0) {
+        return result;
+    }
+
+    // Binary counter: carry the new points upwards, absorbing every non-empty
+    // level, until they fit into an empty one.
+    std::vector<size_t> merged_levels;
+    for (size_t level = 0;; ++level) {
+        if (level == trees_.size()) {
+            trees_.emplace_back();
+        }
+        const int64_t capacity = leaf_size_ << std::min<size_t>(level, 48);
+        if (trees_[level].NumPoints() == 0 &&
+            static_cast<int64_t>(rows.size()) <= capacity) {
+            BuildTree(level, rows, std::move(indices));
+            break;
+        }
+        CollectLivePoints(level, rows, indices);
+        merged_levels.push_back(level);
+    }
+    for (size_t level : merged_levels) {
+        trees_[level] = Tree();
+    }
+    return result;
+}
+
+void DynamicNanoFlannIndex::RemovePoints(const Tensor &indices) {
+    if (indices.GetDtype() != Dtype::Int64 || indices.NumDims() != 1) {
+        utility::LogError(
+                "[DynamicNanoFlannIndex::RemovePoints] indices must be 1D, "
+                "with dtype Int64.");
+    }
+    std::set<size_t> touched_levels;
+    for (int64_t index : indices.ToFlatVector<int64_t>()) {
+        if (index < 0 || index >= next_index_) {
+            utility::LogError(
+                    "[DynamicNanoFlannIndex::RemovePoints] Index {} out of "
+                    "range [0, {}).",
+                    index, next_index_);
+        }
+        // Indices that are in no tree have been removed before.
+        for (size_t level = 0; level < trees_.size(); ++level) {
+            Tree &tree = trees_[level];
+            auto it = std::lower_bound(tree.indices_.begin(),
+                                       tree.indices_.end(), index);
+            if (it == tree.indices_.end() || *it != index) {
+                continue;
+            }
+            const size_t row = it - tree.indices_.begin();
+            if (!tree.removed_[row]) {
+                tree.removed_[row] = 1;
+                tree.num_removed_++;
+                touched_levels.insert(level);
+            }
+            break;
+        }
+    }
+
+    // Compact trees in which removed points dominate. The live points always
+    // fit back into the same level.
+    for (size_t level : touched_levels) {
+        Tree &tree = trees_[level];
+        if (tree.NumPoints() == 0) {
+            trees_[level] = Tree();
+        } else if (2 * tree.num_removed_ >
+                   static_cast<int64_t>(tree.indices_.size())) {
+            std::vector<const void *> rows;
+            std::vector<int64_t> live_indices;
+            CollectLivePoints(level, rows, live_indices);
+            BuildTree(level, rows, std::move(live_indices));
+        }
+    }
+}
+
+std::pair<Tensor, Tensor> DynamicNanoFlannIndex::SearchKnn(
+        const Tensor &query_points, int knn) {
+    AssertPoints(query_points, "SearchKnn");
+    if (knn <= 0) {
+        utility::LogError(
+                "[DynamicNanoFlannIndex::SearchKnn] knn should be larger than "
+                "0.");
+    }
+    const int64_t num_query_points = query_points.GetShape()[0];
+    const int64_t num_results =
+            std::min(static_cast<int64_t>(knn), GetDatasetSize());
+
+    Tensor indices;
+    Tensor distances;
+    DISPATCH_FLOAT32_FLOAT64_DTYPE(dtype_, [&]() {
+        // Search every tree for enough candidates to compensate for the
+        // removed points it still contains.
+        std::vector<size_t> levels;
+        std::vector<int64_t> tree_knns;
+        std::vector<std::vector<int64_t>> tree_indices;
+        std::vector<std::vector<scalar_t>> tree_distances;
+        for (size_t level = 0; level < trees_.size(); ++level) {
+            Tree &tree = trees_[level];
+            if (tree.NumPoints() == 0) {
+                continue;
+            }
+            const int64_t tree_knn =
+                    std::min(static_cast<int64_t>(tree.indices_.size()),
+                             static_cast<int64_t>(knn) + tree.num_removed_);
+            Tensor level_indices;
+            Tensor level_distances;
+            std::tie(level_indices, level_distances) = tree.index_->SearchKnn(
+                    query_points, static_cast<int>(tree_knn));
+            levels.push_back(level);
+            tree_knns.push_back(tree_knn);
+            tree_indices.push_back(level_indices.ToFlatVector<int64_t>());
+            tree_distances.push_back(level_distances.ToFlatVector<scalar_t>());
+        }
+
+        // Merge the per-tree results.
+        std::vector<int64_t> result_indices(num_query_points * num_results);
+        std::vector<scalar_t> result_distances(num_query_points * num_results);
+        tbb::parallel_for(
+                tbb::blocked_range<int64_t>(0, num_query_points),
+                [&](const tbb::blocked_range<int64_t> &r) {
+                    std::vector<std::pair<scalar_t, int64_t>> candidates;
+                    for (int64_t i = r.begin(); i != r.end(); ++i) {
+                        candidates.clear();
+                        for (size_t t = 0; t < levels.size(); ++t) {
+                            const Tree &tree = trees_[levels[t]];
+                            for (int64_t j = i * tree_knns[t];
+                                 j < (i + 1) * tree_knns[t]; ++j) {
+                                const int64_t row = tree_indices[t][j];
+                                if (!tree.removed_[row]) {
+                                    candidates.emplace_back(
+                                            tree_distances[t][j],
+                                            tree.indices_[row]);
+                                }
+                            }
+                        }
+                        std::partial_sort(candidates.begin(),
+                                          candidates.begin() + num_results,
+                                          candidates.end());
+                        for (int64_t j = 0; j < num_results; ++j) {
+                            result_distances[i * num_results + j] =
+                                    candidates[j].first;
+                            result_indices[i * num_results + j] =
+                                    candidates[j].second;
+                        }
+                    }
+                });
+        indices = Tensor(result_indices, {num_query_points, num_results},
+                         Dtype::Int64);
+        distances = Tensor(result_distances, {num_query_points, num_results},
+                           dtype_);
+    });
+    return std::make_pair(indices, distances);
+}
+
+std::tuple<Tensor, Tensor, Tensor> DynamicNanoFlannIndex::SearchRadius(
+        const Tensor &query_points, double radius) {
+    AssertPoints(query_points, "SearchRadius");
+    if (radius <= 0) {
+        utility::LogError(
+                "[DynamicNanoFlannIndex::SearchRadius] radius should be "
+                "larger than 0.");
+    }
+    const int64_t num_query_points = query_points.GetShape()[0];
+
+    Tensor indices;
+    Tensor distances;
+    Tensor num_neighbors;
+    DISPATCH_FLOAT32_FLOAT64_DTYPE(dtype_, [&]() {
+        std::vector<size_t> levels;
+        std::vector<std::vector<int64_t>> tree_indices;
+        std::vector<std::vector<scalar_t>> tree_distances;
+        std::vector<std::vector<int64_t>> tree_offsets;
+        for (size_t level = 0; level < trees_.size(); ++level) {
+            Tree &tree = trees_[level];
+            if (tree.NumPoints() == 0) {
+                continue;
+            }
+            Tensor level_indices;
+            Tensor level_distances;
+            Tensor level_num_neighbors;
+            std::tie(level_indices, level_distances, level_num_neighbors) =
+                    tree.index_->SearchRadius(query_points, radius);
+            std::vector<int64_t> offsets(num_query_points + 1, 0);
+            std::vector<int64_t> counts =
+                    level_num_neighbors.ToFlatVector<int64_t>();
+            std::partial_sum(counts.begin(), counts.end(), offsets.begin() + 1);
+            levels.push_back(level);
+            tree_indices.push_back(level_indices.ToFlatVector<int64_t>());
+            tree_distances.push_back(level_distances.ToFlatVector<scalar_t>());
+            tree_offsets.push_back(offsets);
+        }
+
+        // Merge the per-tree results, sorted by distance.
+        std::vector<std::vector<std::pair<scalar_t, int64_t>>> batch_results(
+                num_query_points);
+        tbb::parallel_for(
+                tbb::blocked_range<int64_t>(0, num_query_points),
+                [&](const tbb::blocked_range<int64_t> &r) {
+                    for (int64_t i = r.begin(); i != r.end(); ++i) {
+                        auto &candidates = batch_results[i];
+                        for (size_t t = 0; t < levels.size(); ++t) {
+                            const Tree &tree = trees_[levels[t]];
+                            for (int64_t j = tree_offsets[t][i];
+                                 j < tree_offsets[t][i + 1]; ++j) {
+                                const int64_t row = tree_indices[t][j];
+                                if (!tree.removed_[row]) {
+                                    candidates.emplace_back(
+                                            tree_distances[t][j],
+                                            tree.indices_[row]);
+                                }
+                            }
+                        }
+                        std::sort(candidates.begin(), candidates.end());
+                    }
+                });
+
+        // Flatten.
+        std::vector<int64_t> batch_nums(num_query_points);
+        std::vector<int64_t> batch_indices;
+        std::vector<scalar_t> batch_distances;
+        for (int64_t i = 0; i < num_query_points; ++i) {
+            batch_nums[i] = static_cast<int64_t>(batch_results[i].size());
+            for (const auto &result : batch_results[i]) {
+                batch_distances.push_back(result.first);
+                batch_indices.push_back(result.second);
+            }
+        }
+        const int64_t total_nums = static_cast<int64_t>(batch_indices.size());
+        indices = Tensor(batch_indices, {total_nums}, Dtype::Int64);
+        distances = Tensor(batch_distances, {total_nums}, dtype_);
+        num_neighbors = Tensor(batch_nums, {num_query_points}, Dtype::Int64);
+    });
+    return std::make_tuple(indices, distances, num_neighbors);
+}
+
+}  // namespace nns
+}  // namespace core
+}  // namespace open3d
@@ -0,0 +1,160 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#pragma once
+
+#include <memory>
+#include <vector>
+
+#include "open3d/core/Tensor.h"
+#include "open3d/core/nns/NanoFlannIndex.h"
+
+namespace open3d {
+namespace core {
+namespace nns {
+
+/// \class DynamicNanoFlannIndex
+///
+/// \brief Forest of NanoFlann KDTrees supporting incremental insertion and
+/// removal of points.
+///
+/// Points are kept in a logarithmic forest: tree i holds at most
+/// leaf_size * 2^i points. Inserting a batch merges it with the smaller trees
+/// in the same way as a binary counter, so that every point is rebuilt
+/// O(log(n)) times in total. Removed points are marked lazily and a tree is
+/// compacted once more than half of its points have been removed. The rows of
+/// every tree are sorted by index, so that the memory of the forest only
+/// depends on the points it holds, not on how many were ever inserted.
+///
+/// Every inserted point gets a unique, stable Int64 index that is returned
+/// by AddPoints() and used by the search functions and RemovePoints().
+class DynamicNanoFlannIndex {
+public:
+    /// \brief Parameterized Constructor.
+    ///
+    /// \param dimension Dimension of the points.
+    /// \param dtype Dtype of the points. Must be Float32 or Float64.
+    /// \param leaf_size Capacity of the smallest tree in the forest.
+    DynamicNanoFlannIndex(int dimension, Dtype dtype, int64_t leaf_size = 1024);
+    ~DynamicNanoFlannIndex();
+    DynamicNanoFlannIndex(const DynamicNanoFlannIndex &) = delete;
+    DynamicNanoFlannIndex &operator=(const DynamicNanoFlannIndex &) = delete;
+
+public:
+    /// Insert points into the index.
+    ///
+    /// \param points Points to insert. Must be 2D, with shape {n, d}.
+    /// \return Tensor of shape {n,}, dtype Int64, holding the indices assigned
+    /// to the inserted points.
+    Tensor AddPoints(const Tensor &points);
+
+    /// Remove points from the index. Indices that have already been removed
+    /// are ignored.
+    ///
+    /// \param indices Indices returned by AddPoints(). Must be 1D, with dtype
+    /// Int64.
+    void RemovePoints(const Tensor &indices);
+
+    /// Perform K nearest neighbor search on the points currently in the index.
+    ///
+    /// \param query_points Query points. Must be 2D, with shape {n, d}, same
+    /// dtype with the index.
+    /// \param knn Number of nearest neighbor to search.
+    /// \return Pair of Tensors: (indices, distances):
+    /// - indices: Tensor of shape {n, min(knn, num_points)}, with dtype Int64.
+    /// - distainces: Tensor of shape {n, min(knn, num_points)}, same dtype with
+    /// the index.
+    std::pair<Tensor, Tensor> SearchKnn(const Tensor &query_points, int knn);
+
+    /// Perform radius search on the points currently in the index.
+    ///
+    /// \param query_points Query points. Must be 2D, with shape {n, d}, same
+    /// dtype with the index.
+    /// \param radius Radius.
+    /// \return Tuple of Tensors, (indices, distances, num_neighbors):
+    /// - indicecs: Tensor of shape {total_num_neighbors,}, dtype Int64.
+    /// - distances: Tensor of shape {total_num_neighbors,}, same dtype with
+    /// the index.
+    /// - num_neighbors: Tensor of shape {n}, dtype Int64.
+    std::tuple<Tensor, Tensor, Tensor> SearchRadius(const Tensor &query_points,
+                                                    double radius);
+
+    /// Get dimension of the points.
+    int GetDimension() const { return dimension_; }
+
+    /// Get dtype of the points.
+    Dtype GetDtype() const { return dtype_; }
+
+    /// Get number of points currently in the index.
+    int64_t GetDatasetSize() const;
+
+    /// Get number of non-empty trees in the forest.
+    int64_t GetNumTrees() const;
+
+protected:
+    /// One level of the forest.
+    struct Tree {
+        /// Points of the tree, with shape {n, d}.
+        Tensor points_;
+        /// Index of every row of points_, in increasing order.
+        std::vector<int64_t> indices_;
+        /// Whether every row of points_ has been removed.
+        std::vector<uint8_t> removed_;
+        /// Number of rows of points_ that have been removed.
+        int64_t num_removed_ = 0;
+        std::unique_ptr<NanoFlannIndex> index_;
+
+        int64_t NumPoints() const {
+            return static_cast<int64_t>(indices_.size()) - num_removed_;
+        }
+    };
+
+    /// Collect the points of level \p level that have not been removed.
+    void CollectLivePoints(size_t level,
+                           std::vector<const void *> &rows,
+                           std::vector<int64_t> &indices) const;
+
+    /// (Re)build level \p level from \p rows, with the given indices. The
+    /// rows are sorted by index.
+    void BuildTree(size_t level,
+                   const std::vector<const void *> &rows,
+                   std::vector<int64_t> &&indices);
+
+    /// Check the shape, dtype and device of query or insertion points.
+    void AssertPoints(const Tensor &points, const std::string &caller) const;
+
+protected:
+    int dimension_;
+    Dtype dtype_;
+    int64_t leaf_size_;
+    std::vector<Tree> trees_;
+    /// Index assigned to the next inserted point.
+    int64_t next_index_ = 0;
+};
+
+}  // namespace nns
+}  // namespace core
+}  // namespace open3d
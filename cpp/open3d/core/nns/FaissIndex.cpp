@@ -27,8 +27,17 @@
 #include "open3d/core/nns/FaissIndex.h"
 
 #include <faiss/IndexFlat.h>
+#include <faiss/IndexIVFFlat.h>
+#include <tbb/parallel_for.h>
 
+#include <algorithm>
+#include <cmath>
+#include <map>
+#include <numeric>
+
+#include "open3d/core/CoreUtil.h"
 #include "open3d/utility/Console.h"
+#include "open3d/utility/Timer.h"
 
 #ifdef BUILD_CUDA_MODULE
 #include <faiss/gpu/GpuIndexFlat.h>
@@ -41,6 +50,306 @@ namespace open3d {
 namespace core {
 namespace nns {
 
+FaissIndex::FaissIndex(FaissIndexType index_type, int64_t nlist, int64_t nprobe)
+    : index_type_(index_type), nlist_(nlist), nprobe_(nprobe) {
+    if (nlist < 0) {
+        utility::LogError("[FaissIndex] nlist should not be negative.");
+    }
+    if (nprobe <= 0) {
+        utility::LogError("[FaissIndex] nprobe should be larger than 0.");
+    }
+};
+
+FaissIndex::FaissIndex(const Tensor &dataset_points, FaissIndexType index_type)
+    : FaissIndex(index_type) {
+    SetTensorData(dataset_points);
+};
+
+FaissIndex::~FaissIndex(){};
+
+int FaissIndex::GetDimension() const {
+    SizeVector shape = dataset_points_.GetShape();
+    return static_cast<int>(shape[1]);
+}
+
+size_t FaissIndex::GetDatasetSize() const {
+    SizeVector shape = dataset_points_.GetShape();
+    return static_cast<size_t>(shape[0]);
+}
+
+Dtype FaissIndex::GetDtype() const { return dataset_points_.GetDtype(); }
+
+bool FaissIndex::SetTensorData(const Tensor &dataset_points) {
+    if (dataset_points.NumDims() != 2) {
+        utility::LogError(
+                "[FaissIndex::SetTensorData] dataset_points must be "
+                "2D matrix, with shape {n_dataset_points, d}.");
+        return false;
+    }
+    if (dataset_points.GetDevice().GetType() != Device::DeviceType::CPU) {
+        utility::LogError(
+                "[FaissIndex::SetTensorData] dataset_points must be on CPU.");
+        return false;
+    }
+    Dtype dtype = dataset_points.GetDtype();
+    if (dtype != Dtype::Float32 && dtype != Dtype::Float64) {
+        utility::LogError(
+                "[FaissIndex::SetTensorData] Unsupported dtype {}, must be "
+                "Float32 or Float64.",
+                dtype.ToString());
+        return false;
+    }
+    dataset_points_ = dataset_points.Contiguous();
+    const int64_t dataset_size = static_cast<int64_t>(GetDatasetSize());
+    const int dimension = GetDimension();
+    if (dataset_size == 0) {
+        utility::LogError(
+                "[FaissIndex::SetTensorData] dataset_points is empty.");
+        return false;
+    }
+
+    utility::Timer timer;
+    timer.Start();
+    // FAISS indices only hold float.
+    Tensor data = dataset_points_.To(Dtype::Float32).Contiguous();
+    const float *data_ptr = static_cast<const float *>(data.GetDataPtr());
+
+    index_.reset();
+    quantizer_.reset();
+    if (index_type_ == FaissIndexType::Flat) {
+        index_.reset(new faiss::IndexFlatL2(dimension));
+    } else {
+        int64_t nlist = nlist_ > 0
+                                ? nlist_
+                                : static_cast<int64_t>(
+                                          4 * std::sqrt(double(dataset_size)));
+        nlist = std::max<int64_t>(1, std::min(nlist, dataset_size));
+        quantizer_.reset(new faiss::IndexFlatL2(dimension));
+        auto ivf_index = new faiss::IndexIVFFlat(quantizer_.get(), dimension,
+                                                 nlist, faiss::METRIC_L2);
+        ivf_index->nprobe = std::min(nprobe_, nlist);
+        index_.reset(ivf_index);
+        index_->train(dataset_size, data_ptr);
+    }
+    index_->add(dataset_size, data_ptr);
+    timer.Stop();
+    build_time_ = timer.GetDuration();
+    utility::LogDebug("[FaissIndex] Built index of {} points in {:.2f} ms.",
+                      dataset_size, build_time_);
+    return true;
+};
+
+void FaissIndex::SetNumProbes(int64_t nprobe) {
+    if (nprobe <= 0) {
+        utility::LogError(
+                "[FaissIndex::SetNumProbes] nprobe should be larger than 0.");
+    }
+    nprobe_ = nprobe;
+    if (auto ivf_index = dynamic_cast<faiss::IndexIVF *>(index_.get())) {
+        ivf_index->nprobe = std::min<size_t>(nprobe, ivf_index->nlist);
+    }
+}
+
+Tensor FaissIndex::PrepareQuery(const Tensor &query_points,
+                                const std::string &caller) const {
+    if (!index_) {
+        utility::LogError("[FaissIndex::{}] Index is not set.", caller);
+    }
+    if (query_points.GetDtype() != GetDtype()) {
+        utility::LogError("[FaissIndex::{}] Data type mismatch {} != {}.",
+                          caller, query_points.GetDtype().ToString(),
+                          GetDtype().ToString());
+    }
+    if (query_points.GetDevice().GetType() != Device::DeviceType::CPU) {
+        utility::LogError("[FaissIndex::{}] query_points must be on CPU.",
+                          caller);
+    }
+    if (query_points.NumDims() != 2) {
+        utility::LogError(
+                "[FaissIndex::{}] query_points must be 2D matrix, with shape "
+                "{{n_query_points, d}}.",
+                caller);
+    }
+    if (query_points.GetShape()[1] != GetDimension()) {
+        utility::LogError(
+                "[FaissIndex::{}] query_points has different dimension with "
+                "dataset_points.",
+                caller);
+    }
+    return query_points.To(Dtype::Float32).Contiguous();
+}
+
+std::pair<Tensor, Tensor> FaissIndex::SearchKnn(const Tensor &query_points,
+                                                int knn) {
+    Tensor query = PrepareQuery(query_points, "SearchKnn");
+    if (knn <= 0) {
+        utility::LogError(
+                "[FaissIndex::SearchKnn] knn should be larger than 0.");
+    }
+
+    const int64_t num_query_points = query.GetShape()[0];
+    const int64_t k = std::min(static_cast<int64_t>(knn),
+                               static_cast<int64_t>(GetDatasetSize()));
+    Tensor indices = Tensor::Empty({num_query_points, k}, Dtype::Int64);
+    Tensor distances = Tensor::Empty({num_query_points, k}, Dtype::Float32);
+
+    utility::Timer timer;
+    timer.Start();
+    // FAISS parallelizes over the query points internally.
+    index_->search(num_query_points,
+                   static_cast<const float *>(query.GetDataPtr()), k,
+                   static_cast<float *>(distances.GetDataPtr()),
+                   static_cast<faiss::Index::idx_t *>(indices.GetDataPtr()));
+    timer.Stop();
+    last_search_time_ = timer.GetDuration();
+    utility::LogDebug("[FaissIndex] Searched {} knn queries in {:.2f} ms.",
+                      num_query_points, last_search_time_);
+
+    return std::make_pair(indices, distances.To(GetDtype()));
+};
+
+std::tuple<Tensor, Tensor, Tensor> FaissIndex::SearchRadius(
+        const Tensor &query_points, const Tensor &radii) {
+    Tensor query = PrepareQuery(query_points, "SearchRadius");
+    if (query_points.GetDtype() != radii.GetDtype()) {
+        utility::LogError(
+                "[FaissIndex::SearchRadius] query tensor and radii "
+                "have different data type.");
+    }
+    if (radii.NumDims() != 1 ||
+        query_points.GetShape()[0] != radii.GetShape()[0]) {
+        utility::LogError(
+                "[FaissIndex::SearchRadius] radii tensor must be 1 "
+                "dimensional matrix, with shape {n, }.");
+    }
+    if (radii.Le(0).Any()) {
+        utility::LogError(
+                "[FaissIndex::SearchRadius] radius should be larger than 0.");
+    }
+
+    const int64_t num_query_points = query.GetShape()[0];
+    std::vector<float> radii_sq(num_query_points);
+    DISPATCH_FLOAT32_FLOAT64_DTYPE(radii.GetDtype(), [&]() {
+        std::vector<scalar_t> radii_vec = radii.ToFlatVector<scalar_t>();
+        for (int64_t i = 0; i < num_query_points; ++i) {
+            radii_sq[i] = static_cast<float>(radii_vec[i] * radii_vec[i]);
+        }
+    });
+
+    // Group the queries by the binary exponent of their squared radius, and
+    // run one range search per group with the largest radius of the group.
+    // A query is then searched with at most twice its squared radius, however
+    // much the radii differ across the batch.
+    std::map<int, std::vector<int64_t>> groups;
+    for (int64_t i = 0; i < num_query_points; ++i) {
+        groups[std::ilogb(radii_sq[i])].push_back(i);
+    }
+
+    utility::Timer timer;
+    timer.Start();
+    const int64_t dimension = GetDimension();
+    const float *query_ptr = static_cast<const float *>(query.GetDataPtr());
+    std::vector<int64_t> nums(num_query_points + 1, 0);
+    std::vector<std::vector<std::pair<float, int64_t>>> neighbors(
+            num_query_points);
+    std::vector<float> group_query;
+    for (const auto &group : groups) {
+        const std::vector<int64_t> &ids = group.second;
+        const int64_t num_group_points = static_cast<int64_t>(ids.size());
+        float group_radius_sq = 0;
+        for (int64_t id : ids) {
+            group_radius_sq = std::max(group_radius_sq, radii_sq[id]);
+        }
+        // The ids are ascending, so a single group is the query itself.
+        const float *group_query_ptr = query_ptr;
+        if (num_group_points != num_query_points) {
+            group_query.resize(num_group_points * dimension);
+            for (int64_t k = 0; k < num_group_points; ++k) {
+                std::copy(query_ptr + ids[k] * dimension,
+                          query_ptr + (ids[k] + 1) * dimension,
+                          group_query.data() + k * dimension);
+            }
+            group_query_ptr = group_query.data();
+        }
+
+        // For L2 metric, FAISS compares squared distances with the given
+        // radius.
+        faiss::RangeSearchResult result(num_group_points);
+        index_->range_search(num_group_points, group_query_ptr, group_radius_sq,
+                             &result);
+
+        // Filter by the radius of every query and sort by distance.
+        tbb::parallel_for(
+                tbb::blocked_range<int64_t>(0, num_group_points),
+                [&](const tbb::blocked_range<int64_t> &r) {
+                    for (int64_t k = r.begin(); k != r.end(); ++k) {
+                        const int64_t i = ids[k];
+                        std::vector<std::pair<float, int64_t>> &neighbor =
+                                neighbors[i];
+                        for (size_t j = result.lims[k]; j < result.lims[k + 1];
+                             ++j) {
+                            if (result.distances[j] < radii_sq[i]) {
+                                neighbor.emplace_back(result.distances[j],
+                                                      result.labels[j]);
+                            }
+                        }
+                        std::sort(neighbor.begin(), neighbor.end());
+                        nums[i + 1] = static_cast<int64_t>(neighbor.size());
+                    }
+                });
+    }
+    std::partial_sum(nums.begin(), nums.end(), nums.begin());
+    const int64_t total_num = nums.back();
+
+    Tensor indices = Tensor::Empty({total_num}, Dtype::Int64);
+    Tensor num_neighbors = Tensor::Empty({num_query_points}, Dtype::Int64);
+    Tensor distances;
+    DISPATCH_FLOAT32_FLOAT64_DTYPE(GetDtype(), [&]() {
+        distances = Tensor::Empty({total_num}, GetDtype());
+        int64_t *indices_ptr = static_cast<int64_t *>(indices.GetDataPtr());
+        scalar_t *distances_ptr =
+                static_cast<scalar_t *>(distances.GetDataPtr());
+        int64_t *num_neighbors_ptr =
+                static_cast<int64_t *>(num_neighbors.GetDataPtr());
+        tbb::parallel_for(
+                tbb::blocked_range<int64_t>(0, num_query_points),
+                [&](const tbb::blocked_range<int64_t> &r) {
+                    for (int64_t i = r.begin(); i != r.end(); ++i) {
+                        int64_t offset = nums[i];
+                        for (const auto &neighbor : neighbors[i]) {
+                            indices_ptr[offset] = neighbor.second;
+                            distances_ptr[offset] =
+                                    static_cast<scalar_t>(neighbor.first);
+                            ++offset;
+                        }
+                        num_neighbors_ptr[i] = nums[i + 1] - nums[i];
+                    }
+                });
+    });
+    timer.Stop();
+    last_search_time_ = timer.GetDuration();
+    utility::LogDebug(
+            "[FaissIndex] Searched {} radius queries in {:.2f} ms, found {} "
+            "neighbors.",
+            num_query_points, last_search_time_, total_num);
+
+    return std::make_tuple(indices, distances, num_neighbors);
+};
+
+std::tuple<Tensor, Tensor, Tensor> FaissIndex::SearchRadius(
+        const Tensor &query_points, double radius) {
+    int64_t num_query_points = query_points.GetShape()[0];
+    Dtype dtype = GetDtype();
+    std::tuple<Tensor, Tensor, Tensor> result;
+    DISPATCH_FLOAT32_FLOAT64_DTYPE(dtype, [&]() {
+        Tensor radii(std::vector<scalar_t>(num_query_points,
+                                           static_cast<scalar_t>(radius)),
+                     {num_query_points}, dtype);
+        result = SearchRadius(query_points, radii);
+    });
+    return result;
+};
+
 void TestFaissIntegration() {
     int num_dataset = 10;
     int num_query = 2;
@@ -26,8 +26,11 @@
 
 #pragma once
 
+#include <memory>
 #include <vector>
 
+#include "open3d/core/Tensor.h"
+
 // Forward declarations.
 namespace faiss {
 struct Index;
@@ -40,6 +43,142 @@ namespace open3d {
 namespace core {
 namespace nns {
 
+/// Index types supported by FaissIndex.
+enum class FaissIndexType {
+    /// Exact search by brute force. Needs no training.
+    Flat = 0,
+    /// Approximate search with an inverted file of flat lists. The dataset is
+    /// clustered into nlist cells and nprobe cells are visited per query.
+    IVFFlat = 1,
+};
+
+/// \class FaissIndex
+///
+/// \brief FAISS index for nearest neighbor search on CPU.
+///
+/// FAISS only works in Float32. Float64 points are converted to Float32 for
+/// building and searching the index, and the returned distances are converted
+/// back to the dtype of the dataset points. As in NanoFlannIndex, returned
+/// distances are squared L2 distances.
+class FaissIndex {
+public:
+    /// \brief Default Constructor.
+    ///
+    /// \param index_type Type of the FAISS index.
+    /// \param nlist Number of IVF cells. 0 picks 4 * sqrt(n_dataset_points).
+    /// Only used by FaissIndexType::IVFFlat.
+    /// \param nprobe Number of IVF cells visited per query. Only used by
+    /// FaissIndexType::IVFFlat.
+    FaissIndex(FaissIndexType index_type = FaissIndexType::Flat,
+               int64_t nlist = 0,
+               int64_t nprobe = 8);
+
+    /// \brief Parameterized Constructor.
+    ///
+    /// \param dataset_points Provides a set of data points as Tensor for index
+    /// construction.
+    /// \param index_type Type of the FAISS index.
+    FaissIndex(const Tensor &dataset_points,
+               FaissIndexType index_type = FaissIndexType::Flat);
+    ~FaissIndex();
+    FaissIndex(const FaissIndex &) = delete;
+    FaissIndex &operator=(const FaissIndex &) = delete;
+
+public:
+    /// Set the data for the index. IVF indices are trained on the dataset.
+    ///
+    /// \param dataset_points Dataset points. Must be 2D, with shape {n, d},
+    /// dtype Float32 or Float64.
+    /// \return Returns true if the construction success, otherwise false.
+    bool SetTensorData(const Tensor &dataset_points);
+
+    /// Perform K nearest neighbor search, batched over all query points.
+    ///
+    /// \param query_points Query points. Must be 2D, with shape {n, d}, same
+    /// dtype with dataset_points.
+    /// \param knn Number of nearest neighbor to search.
+    /// \return Pair of Tensors: (indices, distances):
+    /// - indices: Tensor of shape {n, min(knn, n_dataset_points)}, with dtype
+    /// Int64. IVF indices may return -1 if the visited cells hold less than
+    /// knn points.
+    /// - distainces: Tensor of shape {n, min(knn, n_dataset_points)}, same
+    /// dtype with dataset_points.
+    std::pair<Tensor, Tensor> SearchKnn(const Tensor &query_points, int knn);
+
+    /// Perform radius search with multi-radii, batched over all query points.
+    ///
+    /// Query points are grouped by radius, with the squared radii of a group
+    /// within a factor of two. One range search is run per group with the
+    /// largest radius of the group, and its results are filtered per query
+    /// point. Neighbors are sorted by distance.
+    ///
+    /// \param query_points Query points. Must be 2D, with shape {n, d}, same
+    /// dtype with dataset_points.
+    /// \param radii Radii of query points. Each query point has one radius.
+    /// Must be 1D, with shape {n,}.
+    /// \return Tuple of Tensors, (indices, distances, num_neighbors):
+    /// - indicecs: Tensor of shape {total_num_neighbors,}, dtype Int64.
+    /// - distances: Tensor of shape {total_num_neighbors,}, same dtype with
+    /// dataset_points.
+    /// - num_neighbors: Tensor of shape {n}, dtype Int64.
+    std::tuple<Tensor, Tensor, Tensor> SearchRadius(const Tensor &query_points,
+                                                    const Tensor &radii);
+
+    /// Perform radius search.
+    ///
+    /// \param query_points Query points. Must be 2D, with shape {n, d}, same
+    /// dtype with dataset_points.
+    /// \param radius Radius.
+    /// \return Tuple of Tensors, (indices, distances, num_neighbors):
+    /// - indicecs: Tensor of shape {total_num_neighbors,}, dtype Int64.
+    /// - distances: Tensor of shape {total_num_neighbors,}, same dtype with
+    /// dataset_points.
+    /// - num_neighbors: Tensor of shape {n}, dtype Int64.
+    std::tuple<Tensor, Tensor, Tensor> SearchRadius(const Tensor &query_points,
+                                                    double radius);
+
+    /// Set the number of IVF cells visited per query. Larger values give
+    /// higher recall at the cost of speed.
+    void SetNumProbes(int64_t nprobe);
+
+    /// Get dimension of the dataset points.
+    int GetDimension() const;
+
+    /// Get size of the dataset points.
+    size_t GetDatasetSize() const;
+
+    /// Get dtype of the dataset points.
+    Dtype GetDtype() const;
+
+    /// Get the type of the index.
+    FaissIndexType GetIndexType() const { return index_type_; }
+
+    /// Get the time spent in the last SetTensorData(), including training, in
+    /// milliseconds.
+    double GetBuildTime() const { return build_time_; }
+
+    /// Get the time spent in the last search, in milliseconds.
+    double GetLastSearchTime() const { return last_search_time_; }
+
+private:
+    /// Check query points and convert them to contiguous Float32.
+    Tensor PrepareQuery(const Tensor &query_points,
+                        const std::string &caller) const;
+
+protected:
+    FaissIndexType index_type_;
+    int64_t nlist_;
+    int64_t nprobe_;
+    Tensor dataset_points_;
+    /// Coarse quantizer of IVF indices. Must outlive index_.
+    std::unique_ptr<faiss::Index> quantizer_;
+    std::unique_ptr<faiss::Index> index_;
+    double build_time_ = 0.0;
+    double last_search_time_ = 0.0;
+};
+
+/// Minimal FAISS integration test, searching a few points on CPU (and GPU if
+/// built with CUDA).
 void TestFaissIntegration();
 
 }  // namespace nns
@@ -80,7 +80,8 @@ bool NanoFlannIndex::SetTensorData(const Tensor &dataset_points) {
 };
 
 std::pair<Tensor, Tensor> NanoFlannIndex::SearchKnn(const Tensor &query_points,
-                                                    int knn) {
+                                                    int knn,
+                                                    double eps) {
     // Check dtype.
     if (query_points.GetDtype() != GetDtype()) {
         utility::LogError(
@@ -102,6 +103,10 @@ std::pair<Tensor, Tensor> NanoFlannIndex::SearchKnn(const Tensor &query_points,
         utility::LogError(
                 "[NanoFlannIndex::SearchKnn] knn should be larger than 0.");
     }
+    if (eps < 0) {
+        utility::LogError(
+                "[NanoFlannIndex::SearchKnn] eps should not be negative.");
+    }
 
     int64_t num_query_points = query_points.GetShape()[0];
     Dtype dtype = GetDtype();
@@ -117,6 +122,8 @@ std::pair<Tensor, Tensor> NanoFlannIndex::SearchKnn(const Tensor &query_points,
         auto holder = static_cast<NanoFlannIndexHolder<L2, scalar_t> *>(
                 holder_.get());
 
+        const nanoflann::SearchParams params(32, static_cast<float>(eps));
+
         // Parallel search.
         tbb::parallel_for(
                 tbb::blocked_range<size_t>(0, num_query_points),
@@ -128,11 +135,14 @@ std::pair<Tensor, Tensor> NanoFlannIndex::SearchKnn(const Tensor &query_points,
                                 batch_distances[i].GetDataPtr());
 
                         // search
-                        holder->index_->knnSearch(
+                        nanoflann::KNNResultSet<scalar_t, int64_t> result_set(
+                                static_cast<size_t>(knn));
+                        result_set.init(single_indices, single_distances);
+                        holder->index_->findNeighbors(
+                                result_set,
                                 static_cast<scalar_t *>(
                                         query_points[i].GetDataPtr()),
-                                static_cast<size_t>(knn), single_indices,
-                                single_distances);
+                                params);
                     }
                 });
         // Check if the number of neighbors are same.
@@ -147,10 +147,15 @@ public:
     /// \param query_points Query points. Must be 2D, with shape {n, d}, same
     /// dtype with dataset_points.
     /// \param knn Number of nearest neighbor to search.
+    /// \param eps Approximation factor. Trees branches are pruned once they
+    /// cannot improve the neighbors by more than a factor of (1 + eps), which
+    /// trades recall for speed. 0 gives an exact search.
     /// \return Pair of Tensors: (indices, distances):
     /// - indices: Tensor of shape {n, knn}, with dtype Int64.
     /// - distainces: Tensor of shape {n, knn}, same dtype with dataset_points.
-    std::pair<Tensor, Tensor> SearchKnn(const Tensor &query_points, int knn);
+    std::pair<Tensor, Tensor> SearchKnn(const Tensor &query_points,
+                                        int knn,
+                                        double eps = 0.0);
 
     /// Perform radius search with multiple radii.
     ///
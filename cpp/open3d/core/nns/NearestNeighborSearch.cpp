@@ -35,7 +35,49 @@ namespace nns {
 
 NearestNeighborSearch::~NearestNeighborSearch(){};
 
+NNSBackend NearestNeighborSearch::SelectBackend(int64_t num_points,
+                                                int64_t dimension) {
+    // Below these sizes, one tile of brute force distances is cheaper than
+    // building a tree, and trees prune little in high dimensions.
+    const int64_t max_points_low_dimension = 4096;
+    const int64_t max_points_high_dimension = 1 << 20;
+    const int64_t high_dimension = 16;
+    if (num_points <= max_points_low_dimension ||
+        (dimension >= high_dimension &&
+         num_points <= max_points_high_dimension)) {
+        return NNSBackend::BruteForce;
+    }
+    return NNSBackend::NanoFlann;
+}
+
 bool NearestNeighborSearch::SetIndex() {
+    if (backend_ == NNSBackend::Auto) {
+        if (dataset_points_.NumDims() != 2) {
+            utility::LogError(
+                    "[NearestNeighborSearch::SetIndex] dataset_points must be "
+                    "2D matrix, with shape {n_dataset_points, d}.");
+        }
+        backend_ = SelectBackend(dataset_points_.GetShape()[0],
+                                 dataset_points_.GetShape()[1]);
+        utility::LogDebug("[NearestNeighborSearch] Selected {} backend.",
+                          backend_ == NNSBackend::BruteForce ? "BruteForce"
+                                                             : "NanoFlann");
+    }
+    if (backend_ == NNSBackend::BruteForce) {
+        brute_force_index_.reset(new BruteForceIndex());
+        return brute_force_index_->SetTensorData(dataset_points_);
+    }
+    if (backend_ == NNSBackend::Faiss) {
+#ifdef WITH_FAISS
+        faiss_index_.reset(new FaissIndex(faiss_index_type_, 0, faiss_nprobe_));
+        return faiss_index_->SetTensorData(dataset_points_);
+#else
+        utility::LogError(
+                "[NearestNeighborSearch::SetIndex] Open3D was not built with "
+                "FAISS support.");
+        return false;
+#endif
+    }
     nanoflann_index_.reset(new NanoFlannIndex());
     return nanoflann_index_->SetTensorData(dataset_points_);
 };
@@ -44,38 +86,70 @@ bool NearestNeighborSearch::MultiRadiusIndex() { return SetIndex(); };
 bool NearestNeighborSearch::FixedRadiusIndex() { return SetIndex(); }
 bool NearestNeighborSearch::HybridIndex() { return SetIndex(); };
 
+void NearestNeighborSearch::AssertIndexSet(const std::string& caller) const {
+    if (backend_ == NNSBackend::Auto ||
+#ifdef WITH_FAISS
+        (backend_ == NNSBackend::Faiss && !faiss_index_) ||
+#else
+        backend_ == NNSBackend::Faiss ||
+#endif
+        (backend_ == NNSBackend::BruteForce && !brute_force_index_) ||
+        (backend_ == NNSBackend::NanoFlann && !nanoflann_index_)) {
+        utility::LogError("[NearestNeighborSearch::{}] Index is not set.",
+                          caller);
+    }
+}
+
 std::pair<Tensor, Tensor> NearestNeighborSearch::KnnSearch(
-        const Tensor& query_points, int knn) {
+        const Tensor& query_points, int knn, double eps) {
     AssertNotCUDA(query_points);
-    if (!nanoflann_index_) {
+    AssertIndexSet("KnnSearch");
+    if (eps < 0) {
         utility::LogError(
-                "[NearestNeighborSearch::KnnSearch] Index is not set.");
+                "[NearestNeighborSearch::KnnSearch] eps should not be "
+                "negative.");
+    }
+    if (backend_ == NNSBackend::BruteForce) {
+        // Brute force is exact, which satisfies any eps.
+        return brute_force_index_->SearchKnn(query_points, knn);
+    }
+#ifdef WITH_FAISS
+    if (backend_ == NNSBackend::Faiss) {
+        if (eps != 0) {
+            utility::LogWarning(
+                    "[NearestNeighborSearch::KnnSearch] eps is ignored by the "
+                    "FAISS backend.");
+        }
+        return faiss_index_->SearchKnn(query_points, knn);
     }
-    return nanoflann_index_->SearchKnn(query_points, knn);
+#endif
+    return nanoflann_index_->SearchKnn(query_points, knn, eps);
 }
 
 std::tuple<Tensor, Tensor, Tensor> NearestNeighborSearch::FixedRadiusSearch(
         const Tensor& query_points, double radius) {
     AssertNotCUDA(query_points);
-    if (!nanoflann_index_) {
-        utility::LogError(
-                "[NearestNeighborSearch::FixedRadiusSearch] Index is not set.");
-    }
+    AssertIndexSet("FixedRadiusSearch");
     if (dataset_points_.GetDtype() != query_points.GetDtype()) {
         utility::LogError(
                 "[NearsetNeighborSearch::FixedRadiusSearch] reference and "
                 "query have different dtype.");
     }
+    if (backend_ == NNSBackend::BruteForce) {
+        return brute_force_index_->SearchRadius(query_points, radius);
+    }
+#ifdef WITH_FAISS
+    if (backend_ == NNSBackend::Faiss) {
+        return faiss_index_->SearchRadius(query_points, radius);
+    }
+#endif
     return nanoflann_index_->SearchRadius(query_points, radius);
 }
 
 std::tuple<Tensor, Tensor, Tensor> NearestNeighborSearch::MultiRadiusSearch(
         const Tensor& query_points, const Tensor& radii) {
     AssertNotCUDA(query_points);
-    if (!nanoflann_index_) {
-        utility::LogError(
-                "[NearestNeighborSearch::MultiRadiusSearch] Index is not set.");
-    }
+    AssertIndexSet("MultiRadiusSearch");
     Dtype dtype = dataset_points_.GetDtype();
     if (dtype != query_points.GetDtype()) {
         utility::LogError(
@@ -87,21 +161,25 @@ std::tuple<Tensor, Tensor, Tensor> NearestNeighborSearch::MultiRadiusSearch(
                 "[NearsetNeighborSearch::MultiRadiusSearch] radii and data "
                 "have different data type.");
     }
+    if (backend_ == NNSBackend::BruteForce) {
+        return brute_force_index_->SearchRadius(query_points, radii);
+    }
+#ifdef WITH_FAISS
+    if (backend_ == NNSBackend::Faiss) {
+        return faiss_index_->SearchRadius(query_points, radii);
+    }
+#endif
     return nanoflann_index_->SearchRadius(query_points, radii);
 }
 
 std::pair<Tensor, Tensor> NearestNeighborSearch::HybridSearch(
         const Tensor& query_points, double radius, int max_knn) {
     AssertNotCUDA(query_points);
-    if (!nanoflann_index_) {
-        utility::LogError(
-                "[NearestNeighborSearch::HybridSearch] Index is not set.");
-    }
+    AssertIndexSet("HybridSearch");
     // Search knn.
     Tensor indices;
     Tensor distances;
-    std::tie(indices, distances) =
-            nanoflann_index_->SearchKnn(query_points, max_knn);
+    std::tie(indices, distances) = KnnSearch(query_points, max_knn);
     SizeVector size = distances.GetShape();
 
     // Check radius.
@@ -125,6 +203,38 @@ std::pair<Tensor, Tensor> NearestNeighborSearch::HybridSearch(
     return std::make_pair(result_indices, result_distances);
 }
 
+void NearestNeighborSearch::SetFaissNumProbes(int64_t nprobe) {
+    if (nprobe <= 0) {
+        utility::LogError(
+                "[NearestNeighborSearch::SetFaissNumProbes] nprobe should be "
+                "larger than 0.");
+    }
+    faiss_nprobe_ = nprobe;
+#ifdef WITH_FAISS
+    if (faiss_index_) {
+        faiss_index_->SetNumProbes(nprobe);
+    }
+#endif
+}
+
+double NearestNeighborSearch::GetIndexBuildTime() const {
+#ifdef WITH_FAISS
+    if (faiss_index_) {
+        return faiss_index_->GetBuildTime();
+    }
+#endif
+    return 0.0;
+}
+
+double NearestNeighborSearch::GetLastSearchTime() const {
+#ifdef WITH_FAISS
+    if (faiss_index_) {
+        return faiss_index_->GetLastSearchTime();
+    }
+#endif
+    return 0.0;
+}
+
 void NearestNeighborSearch::AssertNotCUDA(const Tensor& t) const {
     if (t.GetDevice().GetType() == Device::DeviceType::CUDA) {
         utility::LogError(
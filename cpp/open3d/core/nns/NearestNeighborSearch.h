@@ -29,12 +29,27 @@
 #include <vector>
 
 #include "open3d/core/Tensor.h"
+#include "open3d/core/nns/BruteForceIndex.h"
+#include "open3d/core/nns/FaissIndex.h"
 #include "open3d/core/nns/NanoFlannIndex.h"
 
 namespace open3d {
 namespace core {
 namespace nns {
 
+/// Backends of NearestNeighborSearch.
+enum class NNSBackend {
+    /// NanoFlann KDTree. Supports all search types.
+    NanoFlann = 0,
+    /// FAISS index on CPU. Requires Open3D to be built with FAISS.
+    Faiss = 1,
+    /// Blocked brute force with BLAS. Supports all search types.
+    BruteForce = 2,
+    /// BruteForce or NanoFlann, picked from the size and dimension of the
+    /// dataset when the index is set.
+    Auto = 3,
+};
+
 /// \class NearestNeighborSearch
 ///
 /// \brief A Class for nearest neighbor search.
@@ -44,8 +59,16 @@ public:
     ///
     /// \param dataset_points Dataset points for constructing search index. Must
     /// be 2D, with shape {n, d}.
-    NearestNeighborSearch(const Tensor &dataset_points)
-        : dataset_points_(dataset_points) {
+    /// \param backend Backend used to build the index and search.
+    /// \param faiss_index_type Type of the FAISS index, only used by
+    /// NNSBackend::Faiss.
+    NearestNeighborSearch(
+            const Tensor &dataset_points,
+            NNSBackend backend = NNSBackend::Auto,
+            FaissIndexType faiss_index_type = FaissIndexType::Flat)
+        : dataset_points_(dataset_points),
+          backend_(backend),
+          faiss_index_type_(faiss_index_type) {
         AssertNotCUDA(dataset_points);
     };
 
@@ -78,10 +101,15 @@ public:
     ///
     /// \param query_points Query points. Must be 2D, with shape {n, d}.
     /// \param knn Number of neighbors to search per query point.
+    /// \param eps Approximation factor for approximate knn search. Neighbors
+    /// are found up to a factor of (1 + eps) of the exact distances, which
+    /// trades recall for speed. 0 gives an exact search.
     /// \return Pair of Tensors, (indices, distances):
     /// - indices: Tensor of shape {n, knn}, with dtype Int64.
     /// - distainces: Tensor of shape {n, knn}, same dtype with query_points.
-    std::pair<Tensor, Tensor> KnnSearch(const Tensor &query_points, int knn);
+    std::pair<Tensor, Tensor> KnnSearch(const Tensor &query_points,
+                                        int knn,
+                                        double eps = 0.0);
 
     /// Perform fixed radius search. All query points share the same radius.
     ///
@@ -125,15 +153,51 @@ public:
                                            double radius,
                                            int max_knn);
 
+    /// Get the backend of the search. NNSBackend::Auto is resolved once the
+    /// index is set.
+    NNSBackend GetBackend() const { return backend_; }
+
+    /// Backend picked by NNSBackend::Auto for a dataset.
+    ///
+    /// Brute force is used for small datasets, where building and traversing
+    /// a tree costs more than scanning all points, and for high dimensional
+    /// datasets of moderate size, where KDTrees degenerate to brute force.
+    ///
+    /// \param num_points Number of dataset points.
+    /// \param dimension Dimension of dataset points.
+    static NNSBackend SelectBackend(int64_t num_points, int64_t dimension);
+
+    /// Set the number of IVF cells visited per query, only used by
+    /// NNSBackend::Faiss with FaissIndexType::IVFFlat.
+    void SetFaissNumProbes(int64_t nprobe);
+
+    /// Get the time spent building the index, in milliseconds. Only measured
+    /// by NNSBackend::Faiss, 0 otherwise.
+    double GetIndexBuildTime() const;
+
+    /// Get the time spent in the last search, in milliseconds. Only measured
+    /// by NNSBackend::Faiss, 0 otherwise.
+    double GetLastSearchTime() const;
+
 private:
     bool SetIndex();
 
+    /// Check that the index of the current backend has been set.
+    void AssertIndexSet(const std::string &caller) const;
+
     /// Assert a Tensor is not CUDA tensoer. This will be removed in the future.
     void AssertNotCUDA(const Tensor &t) const;
 
 protected:
     std::unique_ptr<NanoFlannIndex> nanoflann_index_;
+    std::unique_ptr<BruteForceIndex> brute_force_index_;
+#ifdef WITH_FAISS
+    std::unique_ptr<FaissIndex> faiss_index_;
+#endif
     const Tensor dataset_points_;
+    NNSBackend backend_;
+    FaissIndexType faiss_index_type_;
+    int64_t faiss_nprobe_ = 8;
 };
 }  // namespace nns
 }  // namespace core
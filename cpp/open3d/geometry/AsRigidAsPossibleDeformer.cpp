@@ -0,0 +1,366 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/geometry/AsRigidAsPossibleDeformer.h"
+
+#include <Eigen/Dense>
+#include <Eigen/Sparse>
+#include <algorithm>
+
+#include "open3d/geometry/TriangleMesh.h"
+#include "open3d/utility/Console.h"
+
+namespace open3d {
+namespace geometry {
+
+namespace {
+
+/// Best rotation R minimizing sum_j w_ij |e1_ij - R e0_ij|^2 for the
+/// covariance S = sum_j w_ij e0_ij e1_ij^T.
+Eigen::Matrix3d FitRotation(const Eigen::Matrix3d &S) {
+    Eigen::JacobiSVD<Eigen::Matrix3d> svd(
+            S, Eigen::ComputeFullU | Eigen::ComputeFullV);
+    const Eigen::Matrix3d U = svd.matrixU();
+    const Eigen::Matrix3d V = svd.matrixV();
+    // ensure rotation:
+    // http://graphics.stanford.edu/~smr/ICP/comparison/eggert_comparison_mva97.pdf
+    const Eigen::Vector3d D(1, 1, (V * U.transpose()).determinant());
+    return V * D.asDiagonal() * U.transpose();
+}
+
+}  // namespace
+
+AsRigidAsPossibleDeformer::AsRigidAsPossibleDeformer(
+        const TriangleMesh &mesh,
+        const std::vector<int> &constraint_vertex_indices,
+        MeshBase::DeformAsRigidAsPossibleEnergy energy /* = Spokes */,
+        double smoothed_alpha /* = 0.01 */)
+    : energy_(energy),
+      smoothed_alpha_(smoothed_alpha),
+      vertices_(mesh.vertices_),
+      triangles_(mesh.triangles_),
+      constraint_vertex_indices_(constraint_vertex_indices) {
+    const int num_vertices = int(vertices_.size());
+    constraint_slots_.assign(num_vertices, -1);
+    for (size_t idx = 0; idx < constraint_vertex_indices_.size(); ++idx) {
+        const int vidx = constraint_vertex_indices_[idx];
+        if (vidx < 0 || vidx >= num_vertices) {
+            utility::LogError(
+                    "[AsRigidAsPossibleDeformer] Constraint vertex index {} is "
+                    "out of range [0, {}).",
+                    vidx, num_vertices);
+        }
+        constraint_slots_[vidx] = int(idx);
+    }
+    if (energy_ == MeshBase::DeformAsRigidAsPossibleEnergy::Smoothed) {
+        surface_area_ = mesh.GetSurfaceArea();
+    }
+
+    // Triangles incident to every vertex, in increasing order, each listed
+    // once even if the triangle is degenerate.
+    std::vector<int> triangle_offsets(num_vertices + 1, 0);
+    for (const Eigen::Vector3i &triangle : triangles_) {
+        for (int k = 0; k < 3; ++k) {
+            if (k == 0 || (triangle(k) != triangle(0) &&
+                           (k == 1 || triangle(k) != triangle(1)))) {
+                triangle_offsets[triangle(k) + 1]++;
+            }
+        }
+    }
+    for (int vidx = 0; vidx < num_vertices; ++vidx) {
+        triangle_offsets[vidx + 1] += triangle_offsets[vidx];
+    }
+    std::vector<int> incident_triangles(triangle_offsets.back());
+    {
+        std::vector<int> fill(triangle_offsets.begin(),
+                              triangle_offsets.end() - 1);
+        for (int tidx = 0; tidx < int(triangles_.size()); ++tidx) {
+            const Eigen::Vector3i &triangle = triangles_[tidx];
+            for (int k = 0; k < 3; ++k) {
+                if (k == 0 || (triangle(k) != triangle(0) &&
+                               (k == 1 || triangle(k) != triangle(1)))) {
+                    incident_triangles[fill[triangle(k)]++] = tidx;
+                }
+            }
+        }
+    }
+
+    // Sorted neighbors of every vertex.
+    std::vector<std::vector<int>> neighbors(num_vertices);
+#pragma omp parallel for schedule(static)
+    for (int vidx = 0; vidx < num_vertices; ++vidx) {
+        std::vector<int> &nbs = neighbors[vidx];
+        for (int t = triangle_offsets[vidx]; t < triangle_offsets[vidx + 1];
+             ++t) {
+            const Eigen::Vector3i &triangle = triangles_[incident_triangles[t]];
+            for (int k = 0; k < 3; ++k) {
+                if (triangle(k) != vidx) {
+                    nbs.push_back(triangle(k));
+                }
+            }
+        }
+        std::sort(nbs.begin(), nbs.end());
+        nbs.erase(std::unique(nbs.begin(), nbs.end()), nbs.end());
+    }
+    neighbor_offsets_.assign(num_vertices + 1, 0);
+    for (int vidx = 0; vidx < num_vertices; ++vidx) {
+        neighbor_offsets_[vidx + 1] =
+                neighbor_offsets_[vidx] + int(neighbors[vidx].size());
+    }
+    neighbor_indices_.resize(neighbor_offsets_.back());
+    edge_weights_.assign(neighbor_offsets_.back(), 0);
+
+    // Cotangent weight of every edge, the mean of the cotangents of the
+    // angles opposite to it, clamped to be non-negative. The triangles are
+    // visited in the same order from both end points, so the weights are
+    // exactly symmetric.
+#pragma omp parallel for schedule(static)
+    for (int vidx = 0; vidx < num_vertices; ++vidx) {
+        const std::vector<int> &nbs = neighbors[vidx];
+        const int offset = neighbor_offsets_[vidx];
+        std::copy(nbs.begin(), nbs.end(), neighbor_indices_.begin() + offset);
+        std::vector<int> counts(nbs.size(), 0);
+        for (int t = triangle_offsets[vidx]; t < triangle_offsets[vidx + 1];
+             ++t) {
+            const Eigen::Vector3i &triangle = triangles_[incident_triangles[t]];
+            for (int k = 0; k < 3; ++k) {
+                const int v0 = triangle(k);
+                const int v1 = triangle((k + 1) % 3);
+                const int v2 = triangle((k + 2) % 3);
+                int other;
+                if (v0 == vidx && v1 != vidx) {
+                    other = v1;
+                } else if (v1 == vidx && v0 != vidx) {
+                    other = v0;
+                } else {
+                    continue;
+                }
+                const size_t pos =
+                        std::lower_bound(nbs.begin(), nbs.end(), other) -
+                        nbs.begin();
+                const Eigen::Vector3d a = vertices_[v0] - vertices_[v2];
+                const Eigen::Vector3d b = vertices_[v1] - vertices_[v2];
+                edge_weights_[offset + pos] += a.dot(b) / (a.cross(b)).norm();
+                counts[pos]++;
+            }
+        }
+        for (size_t pos = 0; pos < nbs.size(); ++pos) {
+            double &weight = edge_weights_[offset + pos];
+            weight = counts[pos] > 0 ? weight / counts[pos] : 0;
+            if (!(weight > 0)) {
+                weight = 0;
+            }
+        }
+    }
+
+    // Laplacian restricted to the free vertices. The constrained neighbors
+    // move to the right-hand side. Free vertices without a weighted edge keep
+    // their rest position.
+    free_vertex_rows_.assign(num_vertices, -1);
+    int num_free = 0;
+    for (int vidx = 0; vidx < num_vertices; ++vidx) {
+        if (constraint_slots_[vidx] < 0) {
+            free_vertex_rows_[vidx] = num_free++;
+        }
+    }
+    std::vector<Eigen::Triplet<double>> triplets;
+    for (int vidx = 0; vidx < num_vertices; ++vidx) {
+        const int row = free_vertex_rows_[vidx];
+        if (row < 0) {
+            continue;
+        }
+        double W = 0;
+        for (int n = neighbor_offsets_[vidx]; n < neighbor_offsets_[vidx + 1];
+             ++n) {
+            const double w = edge_weights_[n];
+            const int col = free_vertex_rows_[neighbor_indices_[n]];
+            if (w > 0 && col >= 0) {
+                triplets.push_back(Eigen::Triplet<double>(row, col, -w));
+            }
+            W += w;
+        }
+        triplets.push_back(Eigen::Triplet<double>(row, row, W > 0 ? W : 1));
+    }
+    Eigen::SparseMatrix<double> L(num_free, num_free);
+    L.setFromTriplets(triplets.begin(), triplets.end());
+
+    solver_ = std::make_shared<Solver>();
+    solver_->compute(L);
+    if (solver_->info() != Eigen::Success) {
+        utility::LogError(
+                "[AsRigidAsPossibleDeformer] Failed to factorize the system "
+                "matrix.");
+    }
+}
+
+std::shared_ptr<AsRigidAsPossibleDeformer>
+AsRigidAsPossibleDeformer::CreateFromTriangleMesh(
+        const TriangleMesh &mesh,
+        const std::vector<int> &constraint_vertex_indices,
+        MeshBase::DeformAsRigidAsPossibleEnergy energy /* = Spokes */,
+        double smoothed_alpha /* = 0.01 */) {
+    return std::make_shared<AsRigidAsPossibleDeformer>(
+            mesh, constraint_vertex_indices, energy, smoothed_alpha);
+}
+
+std::shared_ptr<TriangleMesh> AsRigidAsPossibleDeformer::Deform(
+        const std::vector<Eigen::Vector3d> &constraint_vertex_positions,
+        size_t max_iter) const {
+    if (constraint_vertex_positions.size() !=
+        constraint_vertex_indices_.size()) {
+        utility::LogError(
+                "[AsRigidAsPossibleDeformer] Got {} constraint positions for "
+                "{} constraint vertices.",
+                constraint_vertex_positions.size(),
+                constraint_vertex_indices_.size());
+    }
+    const int num_vertices = int(vertices_.size());
+    const bool smoothed =
+            energy_ == MeshBase::DeformAsRigidAsPossibleEnergy::Smoothed;
+
+    auto prime = std::make_shared<TriangleMesh>();
+    prime->vertices_ = vertices_;
+    prime->triangles_ = triangles_;
+    if (num_vertices == 0) {
+        return prime;
+    }
+    std::vector<Eigen::Vector3d> &vertices_prime = prime->vertices_;
+    for (int vidx = 0; vidx < num_vertices; ++vidx) {
+        if (constraint_slots_[vidx] >= 0) {
+            vertices_prime[vidx] =
+                    constraint_vertex_positions[constraint_slots_[vidx]];
+        }
+    }
+    // The rotation fit of the first iteration compares the rest pose with
+    // itself, as the constrained vertices are only placed by the solve.
+    std::vector<Eigen::Vector3d> vertices_fit = vertices_;
+
+    std::vector<Eigen::Matrix3d> Rs(num_vertices, Eigen::Matrix3d::Identity());
+    std::vector<Eigen::Matrix3d> Rs_old;
+    if (smoothed) {
+        Rs_old.resize(num_vertices, Eigen::Matrix3d::Identity());
+    }
+    const int num_free = int(solver_->rows());
+    Eigen::MatrixXd B(num_free, 3);
+
+    for (size_t iter = 0; iter < max_iter; ++iter) {
+        if (smoothed) {
+            std::swap(Rs, Rs_old);
+        }
+        const std::vector<Eigen::Vector3d> &current =
+                iter == 0 ? vertices_fit : vertices_prime;
+
+        // Update rotations.
+#pragma omp parallel for schedule(static)
+        for (int i = 0; i < num_vertices; ++i) {
+            Eigen::Matrix3d S = Eigen::Matrix3d::Zero();
+            Eigen::Matrix3d R = Eigen::Matrix3d::Zero();
+            const int n_nbs = neighbor_offsets_[i + 1] - neighbor_offsets_[i];
+            for (int n = neighbor_offsets_[i]; n < neighbor_offsets_[i + 1];
+                 ++n) {
+                const int j = neighbor_indices_[n];
+                const Eigen::Vector3d e0 = vertices_[i] - vertices_[j];
+                const Eigen::Vector3d e1 = current[i] - current[j];
+                S += edge_weights_[n] * (e0 * e1.transpose());
+                if (smoothed) {
+                    R += Rs_old[j];
+                }
+            }
+            if (smoothed && iter > 0 && n_nbs > 0) {
+                S = 2 * S + (4 * smoothed_alpha_ * surface_area_ / n_nbs) *
+                                    R.transpose();
+            }
+            Rs[i] = FitRotation(S);
+        }
+
+        // Update the right-hand side of the free vertices.
+#pragma omp parallel for schedule(static)
+        for (int i = 0; i < num_vertices; ++i) {
+            const int row = free_vertex_rows_[i];
+            if (row < 0) {
+                continue;
+            }
+            Eigen::Vector3d bi(0, 0, 0);
+            bool has_weight = false;
+            for (int n = neighbor_offsets_[i]; n < neighbor_offsets_[i + 1];
+                 ++n) {
+                const int j = neighbor_indices_[n];
+                const double w = edge_weights_[n];
+                if (w > 0) {
+                    has_weight = true;
+                }
+                bi += w / 2 * ((Rs[i] + Rs[j]) * (vertices_[i] - vertices_[j]));
+                if (free_vertex_rows_[j] < 0) {
+                    bi += w * vertices_prime[j];
+                }
+            }
+            B.row(row) = (has_weight ? bi : vertices_[i]).transpose();
+        }
+
+        const Eigen::MatrixXd X = solver_->solve(B);
+        if (solver_->info() != Eigen::Success) {
+            utility::LogError(
+                    "[AsRigidAsPossibleDeformer] Cholesky solve failed.");
+        }
+#pragma omp parallel for schedule(static)
+        for (int i = 0; i < num_vertices; ++i) {
+            const int row = free_vertex_rows_[i];
+            if (row >= 0) {
+                vertices_prime[i] = X.row(row).transpose();
+            }
+        }
+
+        if (utility::GetVerbosityLevel() >= utility::VerbosityLevel::Debug) {
+            double energy = 0;
+            double reg = 0;
+            for (int i = 0; i < num_vertices; ++i) {
+                for (int n = neighbor_offsets_[i]; n < neighbor_offsets_[i + 1];
+                     ++n) {
+                    const int j = neighbor_indices_[n];
+                    const Eigen::Vector3d e0 = vertices_[i] - vertices_[j];
+                    const Eigen::Vector3d e1 =
+                            vertices_prime[i] - vertices_prime[j];
+                    energy +=
+                            edge_weights_[n] * (e1 - Rs[i] * e0).squaredNorm();
+                    if (smoothed) {
+                        reg += (Rs[i] - Rs[j]).squaredNorm();
+                    }
+                }
+            }
+            if (smoothed) {
+                energy += smoothed_alpha_ * surface_area_ * reg;
+            }
+            utility::LogDebug(
+                    "[AsRigidAsPossibleDeformer] iter={}, energy={:e}", iter,
+                    energy);
+        }
+    }
+
+    return prime;
+}
+
+}  // namespace geometry
+}  // namespace open3d
@@ -0,0 +1,139 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+#include <Eigen/SparseCholesky>
+#include <memory>
+#include <vector>
+
+#include "open3d/geometry/MeshBase.h"
+
+namespace open3d {
+namespace geometry {
+
+class TriangleMesh;
+
+/// \class AsRigidAsPossibleDeformer
+///
+/// \brief Reusable solver for the as-rigid-as-possible deformation of a
+/// TriangleMesh (Sorkine and Alexa, "As-Rigid-As-Possible Surface Modeling",
+/// 2007).
+///
+/// The system matrix only depends on the mesh and on which vertices are
+/// constrained, not on the positions they are moved to. The constructor
+/// therefore computes the cotangent weights and the sparse Cholesky
+/// factorization of the Laplacian restricted to the free vertices once, and
+/// every call to Deform reuses them. The rotation fitting and the right-hand
+/// side assembly of every iteration run in parallel over the vertices. Copies
+/// of a deformer share the factorization.
+class AsRigidAsPossibleDeformer {
+public:
+    typedef Eigen::SimplicialLDLT<Eigen::SparseMatrix<double>> Solver;
+
+    /// \brief Default Constructor.
+    AsRigidAsPossibleDeformer() {}
+    /// \brief Parameterized Constructor.
+    ///
+    /// \param mesh The triangle mesh in its rest pose.
+    /// \param constraint_vertex_indices Indices of the vertices whose
+    /// positions are prescribed by Deform.
+    /// \param energy Energy model that should be optimized.
+    /// \param smoothed_alpha Alpha parameter of the smoothed ARAP model.
+    AsRigidAsPossibleDeformer(
+            const TriangleMesh &mesh,
+            const std::vector<int> &constraint_vertex_indices,
+            MeshBase::DeformAsRigidAsPossibleEnergy energy =
+                    MeshBase::DeformAsRigidAsPossibleEnergy::Spokes,
+            double smoothed_alpha = 0.01);
+    ~AsRigidAsPossibleDeformer() {}
+
+public:
+    /// \brief Factory function to create an AsRigidAsPossibleDeformer.
+    ///
+    /// \param mesh The triangle mesh in its rest pose.
+    /// \param constraint_vertex_indices Indices of the vertices whose
+    /// positions are prescribed by Deform.
+    /// \param energy Energy model that should be optimized.
+    /// \param smoothed_alpha Alpha parameter of the smoothed ARAP model.
+    static std::shared_ptr<AsRigidAsPossibleDeformer> CreateFromTriangleMesh(
+            const TriangleMesh &mesh,
+            const std::vector<int> &constraint_vertex_indices,
+            MeshBase::DeformAsRigidAsPossibleEnergy energy =
+                    MeshBase::DeformAsRigidAsPossibleEnergy::Spokes,
+            double smoothed_alpha = 0.01);
+
+    /// Returns `true` if the deformer holds no vertices.
+    bool IsEmpty() const { return vertices_.empty(); }
+
+    /// \brief Function to deform the mesh.
+    ///
+    /// Every call starts from the rest pose, so results do not depend on
+    /// previous calls.
+    ///
+    /// \param constraint_vertex_positions Target positions of the vertices in
+    /// constraint_vertex_indices_, in the same order. If an index is given
+    /// several times, its last position is used.
+    /// \param max_iter Number of iterations to minimize the energy.
+    /// \return The deformed TriangleMesh.
+    std::shared_ptr<TriangleMesh> Deform(
+            const std::vector<Eigen::Vector3d> &constraint_vertex_positions,
+            size_t max_iter) const;
+
+public:
+    /// Energy model that is optimized.
+    MeshBase::DeformAsRigidAsPossibleEnergy energy_ =
+            MeshBase::DeformAsRigidAsPossibleEnergy::Spokes;
+    /// Alpha parameter of the smoothed ARAP model.
+    double smoothed_alpha_ = 0.01;
+    /// Vertices of the mesh in its rest pose.
+    std::vector<Eigen::Vector3d> vertices_;
+    /// Triangles of the mesh.
+    std::vector<Eigen::Vector3i> triangles_;
+    /// Surface area of the mesh, used by the smoothed energy.
+    double surface_area_ = 0;
+    /// Indices of the constrained vertices.
+    std::vector<int> constraint_vertex_indices_;
+    /// Neighbors of vertex i are neighbor_indices_[neighbor_offsets_[i],
+    /// neighbor_offsets_[i + 1]), sorted, without i itself.
+    std::vector<int> neighbor_offsets_;
+    /// Neighbor indices of all vertices, see neighbor_offsets_.
+    std::vector<int> neighbor_indices_;
+    /// Cotangent weight of every entry of neighbor_indices_.
+    std::vector<double> edge_weights_;
+    /// Row of every vertex in the reduced system, or -1 if it is constrained.
+    std::vector<int> free_vertex_rows_;
+    /// For every constrained vertex, position of its last occurrence in
+    /// constraint_vertex_indices_, -1 for free vertices.
+    std::vector<int> constraint_slots_;
+    /// Cholesky factorization of the Laplacian restricted to the free
+    /// vertices.
+    std::shared_ptr<Solver> solver_;
+};
+
+}  // namespace geometry
+}  // namespace open3d
@@ -33,6 +33,7 @@
 #include "open3d/geometry/Qhull.h"
 #include "open3d/geometry/TriangleMesh.h"
 #include "open3d/utility/Console.h"
+#include "open3d/utility/ParallelScan.h"
 
 namespace open3d {
 namespace geometry {
@@ -125,14 +126,16 @@ std::vector<size_t> OrientedBoundingBox::GetPointIndicesWithinBoundingBox(
     Eigen::Vector3d dx = R_ * Eigen::Vector3d(1, 0, 0);
     Eigen::Vector3d dy = R_ * Eigen::Vector3d(0, 1, 0);
     Eigen::Vector3d dz = R_ * Eigen::Vector3d(0, 0, 1);
-    for (size_t idx = 0; idx < points.size(); idx++) {
-        Eigen::Vector3d d = points[idx] - center_;
-        if (std::abs(d.dot(dx)) <= extent_(0) / 2 &&
-            std::abs(d.dot(dy)) <= extent_(1) / 2 &&
-            std::abs(d.dot(dz)) <= extent_(2) / 2) {
-            indices.push_back(idx);
-        }
-    }
+    utility::ParallelCompact(
+            int64_t(points.size()),
+            [&](int64_t idx) {
+                Eigen::Vector3d d = points[idx] - center_;
+                return std::abs(d.dot(dx)) <= extent_(0) / 2 &&
+                       std::abs(d.dot(dy)) <= extent_(1) / 2 &&
+                       std::abs(d.dot(dz)) <= extent_(2) / 2;
+            },
+            [&](int64_t count) { indices.resize(count); },
+            [&](int64_t idx, int64_t j) { indices[j] = size_t(idx); });
     return indices;
 }
 
@@ -316,14 +319,16 @@ std::vector<Eigen::Vector3d> AxisAlignedBoundingBox::GetBoxPoints() const {
 std::vector<size_t> AxisAlignedBoundingBox::GetPointIndicesWithinBoundingBox(
         const std::vector<Eigen::Vector3d>& points) const {
     std::vector<size_t> indices;
-    for (size_t idx = 0; idx < points.size(); idx++) {
-        const auto& point = points[idx];
-        if (point(0) >= min_bound_(0) && point(0) <= max_bound_(0) &&
-            point(1) >= min_bound_(1) && point(1) <= max_bound_(1) &&
-            point(2) >= min_bound_(2) && point(2) <= max_bound_(2)) {
-            indices.push_back(idx);
-        }
-    }
+    utility::ParallelCompact(
+            int64_t(points.size()),
+            [&](int64_t idx) {
+                const auto& point = points[idx];
+                return point(0) >= min_bound_(0) && point(0) <= max_bound_(0) &&
+                       point(1) >= min_bound_(1) && point(1) <= max_bound_(1) &&
+                       point(2) >= min_bound_(2) && point(2) <= max_bound_(2);
+            },
+            [&](int64_t count) { indices.resize(count); },
+            [&](int64_t idx, int64_t j) { indices[j] = size_t(idx); });
     return indices;
 }
 
@@ -0,0 +1,94 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#pragma once
+
+#include <atomic>
+#include <cstdint>
+#include <utility>
+#include <vector>
+
+namespace open3d {
+namespace geometry {
+
+/// \class ConcurrentUnionFind
+///
+/// \brief Lock-free union-find over the indices [0, size), for parallel
+/// clustering of points or vertices.
+///
+/// The root of every set is its smallest element, so the result does not
+/// depend on the order of unions.
+class ConcurrentUnionFind {
+public:
+    explicit ConcurrentUnionFind(int64_t size) : parent_(size) {
+        for (int64_t i = 0; i < size; ++i) {
+            parent_[i].store(i, std::memory_order_relaxed);
+        }
+    }
+
+    /// Root of the set of \p x.
+    int64_t Find(int64_t x) {
+        while (true) {
+            int64_t p = parent_[x].load(std::memory_order_relaxed);
+            if (p == x) {
+                return x;
+            }
+            // Path halving.
+            int64_t gp = parent_[p].load(std::memory_order_relaxed);
+            if (gp != p) {
+                parent_[x].compare_exchange_weak(p, gp,
+                                                 std::memory_order_relaxed);
+            }
+            x = gp;
+        }
+    }
+
+    /// Merge the sets of \p a and \p b.
+    void Union(int64_t a, int64_t b) {
+        while (true) {
+            a = Find(a);
+            b = Find(b);
+            if (a == b) {
+                return;
+            }
+            if (a < b) {
+                std::swap(a, b);
+            }
+            // Link the larger root under the smaller one.
+            int64_t expected = a;
+            if (parent_[a].compare_exchange_weak(expected, b,
+                                                 std::memory_order_relaxed)) {
+                return;
+            }
+        }
+    }
+
+private:
+    std::vector<std::atomic<int64_t>> parent_;
+};
+
+}  // namespace geometry
+}  // namespace open3d
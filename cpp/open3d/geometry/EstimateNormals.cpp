@@ -24,11 +24,17 @@
 // IN THE SOFTWARE.
 // ----------------------------------------------------------------------------
 
+#include <tbb/parallel_sort.h>
+
 #include <Eigen/Eigenvalues>
+#include <algorithm>
+#include <limits>
+#include <numeric>
 #include <queue>
 #include <tuple>
 
 #include "open3d/geometry/KDTreeFlann.h"
+#include "open3d/geometry/NeighborGraph.h"
 #include "open3d/geometry/PointCloud.h"
 #include "open3d/geometry/TetraMesh.h"
 #include "open3d/utility/Console.h"
@@ -258,6 +264,15 @@ public:
         return parent_[x];
     }
 
+    // find representative element for given x without modifying the set, so
+    // that it can be called concurrently
+    size_t FindConst(size_t x) const {
+        while (x != parent_[x]) {
+            x = parent_[x];
+        }
+        return x;
+    }
+
     // combine two sets using size of sets
     void Union(size_t x, size_t y) {
         x = Find(x);
@@ -279,6 +294,7 @@ private:
 };
 
 struct WeightedEdge {
+    WeightedEdge() {}
     WeightedEdge(size_t v0, size_t v1, double weight)
         : v0_(v0), v1_(v1), weight_(weight) {}
     size_t v0_;
@@ -286,45 +302,132 @@ struct WeightedEdge {
     double weight_;
 };
 
-// Minimum Spanning Tree algorithm (Kruskal's algorithm)
-std::vector<WeightedEdge> Kruskal(std::vector<WeightedEdge> &edges,
-                                  size_t n_vertices) {
-    std::sort(edges.begin(), edges.end(),
-              [](WeightedEdge &e0, WeightedEdge &e1) {
-                  return e0.weight_ < e1.weight_;
-              });
-    DisjointSet disjoint_set(n_vertices);
-    std::vector<WeightedEdge> mst;
-    for (size_t eidx = 0; eidx < edges.size(); ++eidx) {
-        size_t set0 = disjoint_set.Find(edges[eidx].v0_);
-        size_t set1 = disjoint_set.Find(edges[eidx].v1_);
-        if (set0 != set1) {
-            mst.push_back(edges[eidx]);
-            disjoint_set.Union(set0, set1);
+// Strict total order on edges with distinct endpoints, so that the minimum
+// spanning tree is unique.
+bool EdgeLess(const WeightedEdge &e0, const WeightedEdge &e1) {
+    return std::tie(e0.weight_, e0.v0_, e0.v1_) <
+           std::tie(e1.weight_, e1.v0_, e1.v1_);
+}
+
+// Number of edges below which FilterKruskal sorts instead of partitioning.
+constexpr std::ptrdiff_t kFilterKruskalBaseSize = 1 << 14;
+
+// Filter-Kruskal (Osipov et al., "The Filter-Kruskal Minimum Spanning Tree
+// Algorithm", 2009): partition the edges around a pivot, process the light
+// edges, then drop the heavy edges that would close a cycle before processing
+// them. The edges must be unique.
+void FilterKruskal(std::vector<WeightedEdge>::iterator begin,
+                   std::vector<WeightedEdge>::iterator end,
+                   DisjointSet &disjoint_set,
+                   std::vector<WeightedEdge> &mst) {
+    if (end - begin <= kFilterKruskalBaseSize) {
+        tbb::parallel_sort(begin, end, EdgeLess);
+        for (auto it = begin; it != end; ++it) {
+            size_t set0 = disjoint_set.Find(it->v0_);
+            size_t set1 = disjoint_set.Find(it->v1_);
+            if (set0 != set1) {
+                mst.push_back(*it);
+                disjoint_set.Union(set0, set1);
+            }
         }
+        return;
+    }
+
+    // The median of three distinct edges leaves both partitions non-empty.
+    WeightedEdge samples[3] = {*begin, *(begin + (end - begin) / 2),
+                               *(end - 1)};
+    std::sort(samples, samples + 3, EdgeLess);
+    const WeightedEdge pivot = samples[1];
+    auto middle = std::partition(begin, end, [&](const WeightedEdge &edge) {
+        return EdgeLess(edge, pivot);
+    });
+    FilterKruskal(begin, middle, disjoint_set, mst);
+
+    const std::ptrdiff_t num_heavy = end - middle;
+    std::vector<uint8_t> keep(num_heavy);
+#pragma omp parallel for schedule(static)
+    for (std::ptrdiff_t eidx = 0; eidx < num_heavy; ++eidx) {
+        const WeightedEdge &edge = *(middle + eidx);
+        keep[eidx] = disjoint_set.FindConst(edge.v0_) !=
+                     disjoint_set.FindConst(edge.v1_);
     }
+    auto filtered_end = middle;
+    for (std::ptrdiff_t eidx = 0; eidx < num_heavy; ++eidx) {
+        if (keep[eidx]) {
+            *filtered_end++ = *(middle + eidx);
+        }
+    }
+    FilterKruskal(middle, filtered_end, disjoint_set, mst);
+}
+
+// Minimum Spanning Tree (or forest) of a graph with unique edges
+std::vector<WeightedEdge> MinimumSpanningTree(std::vector<WeightedEdge> &edges,
+                                              size_t n_vertices) {
+    DisjointSet disjoint_set(n_vertices);
+    std::vector<WeightedEdge> mst;
+    mst.reserve(n_vertices);
+    FilterKruskal(edges.begin(), edges.end(), disjoint_set, mst);
     return mst;
 }
 
+// Number of points searched between progress updates.
+constexpr int64_t kOrientNormalsBlockSize = 1 << 16;
+
+// Sort edge keys v0 * n_vertices + v1 and remove duplicates and invalid keys.
+void SortUniqueEdgeKeys(std::vector<uint64_t> &keys) {
+    tbb::parallel_sort(keys.begin(), keys.end());
+    keys.erase(std::unique(keys.begin(), keys.end()), keys.end());
+    if (!keys.empty() && keys.back() == std::numeric_limits<uint64_t>::max()) {
+        keys.pop_back();
+    }
+}
+
+// Weighted edges from sorted unique edge keys, with weights computed in
+// parallel.
+template <typename WeightFunc>
+std::vector<WeightedEdge> EdgesFromKeys(const std::vector<uint64_t> &keys,
+                                        size_t n_vertices,
+                                        WeightFunc weight) {
+    std::vector<WeightedEdge> edges(keys.size());
+#pragma omp parallel for schedule(static)
+    for (int64_t eidx = 0; eidx < int64_t(keys.size()); ++eidx) {
+        const size_t v0 = size_t(keys[eidx] / n_vertices);
+        const size_t v1 = size_t(keys[eidx] % n_vertices);
+        edges[eidx] = WeightedEdge(v0, v1, weight(v0, v1));
+    }
+    return edges;
+}
+
 }  // unnamed namespace
 
 namespace geometry {
 
 void PointCloud::EstimateNormals(
         const KDTreeSearchParam &search_param /* = KDTreeSearchParamKNN()*/,
-        bool fast_normal_computation /* = true */) {
+        bool fast_normal_computation /* = true */,
+        const std::shared_ptr<NeighborGraph> neighbor_graph /* = nullptr */) {
     bool has_normal = HasNormals();
     if (!has_normal) {
         normals_.resize(points_.size());
     }
     KDTreeFlann kdtree;
-    kdtree.SetGeometry(*this);
+    if (neighbor_graph) {
+        neighbor_graph->AssertCovers(points_.size(), search_param,
+                                     "EstimateNormals");
+    } else {
+        kdtree.SetGeometry(*this);
+    }
 #pragma omp parallel for schedule(static)
     for (int i = 0; i < (int)points_.size(); i++) {
         std::vector<int> indices;
         std::vector<double> distance2;
         Eigen::Vector3d normal;
-        if (kdtree.Search(points_[i], search_param, indices, distance2) >= 3) {
+        const int num_neighbors =
+                neighbor_graph ? neighbor_graph->GetNeighbors(
+                                         i, search_param, indices, distance2)
+                               : kdtree.Search(points_[i], search_param,
+                                               indices, distance2);
+        if (num_neighbors >= 3) {
             normal = ComputeNormal(*this, indices, fast_normal_computation);
             if (normal.norm() == 0.0) {
                 if (has_normal) {
@@ -386,114 +489,160 @@ void PointCloud::OrientNormalsTowardsCameraLocation(
     }
 }
 
-void PointCloud::OrientNormalsConsistentTangentPlane(size_t k) {
+void PointCloud::OrientNormalsConsistentTangentPlane(
+        size_t k, bool print_progress /* = false */) {
     if (!HasNormals()) {
         utility::LogError(
                 "[OrientNormalsConsistentTangentPlane] No normals in the "
                 "PointCloud. Call EstimateNormals() first.");
     }
+    const size_t n_points = points_.size();
+    if (n_points == 0) {
+        return;
+    }
+    auto EdgeKey = [&](size_t v0, size_t v1) -> uint64_t {
+        return uint64_t(std::min(v0, v1)) * n_points + std::max(v0, v1);
+    };
 
     // Create Riemannian graph (Euclidian MST + kNN)
     // Euclidian MST is subgraph of Delaunay triangulation
+    utility::LogDebug("Compute Delaunay Graph");
     std::shared_ptr<TetraMesh> delaunay_mesh;
     std::vector<size_t> pt_map;
     std::tie(delaunay_mesh, pt_map) = TetraMesh::CreateFromPointCloud(*this);
-    std::vector<WeightedEdge> delaunay_graph;
-    std::unordered_set<size_t> graph_edges;
-    auto EdgeIndex = [&](size_t v0, size_t v1) -> size_t {
-        return std::min(v0, v1) * points_.size() + std::max(v0, v1);
-    };
-    auto AddEdgeToDelaunayGraph = [&](size_t v0, size_t v1) {
-        v0 = pt_map[v0];
-        v1 = pt_map[v1];
-        size_t edge = EdgeIndex(v0, v1);
-        if (graph_edges.count(edge) == 0) {
-            double dist = (points_[v0] - points_[v1]).squaredNorm();
-            delaunay_graph.push_back(WeightedEdge(v0, v1, dist));
-            graph_edges.insert(edge);
+    const int64_t n_tetras = int64_t(delaunay_mesh->tetras_.size());
+    std::vector<uint64_t> graph_keys(6 * n_tetras);
+#pragma omp parallel for schedule(static)
+    for (int64_t tidx = 0; tidx < n_tetras; ++tidx) {
+        const Eigen::Vector4i &tetra = delaunay_mesh->tetras_[tidx];
+        int eidx = 0;
+        for (int i = 0; i < 4; ++i) {
+            for (int j = i + 1; j < 4; ++j) {
+                graph_keys[6 * tidx + eidx++] =
+                        EdgeKey(pt_map[tetra[i]], pt_map[tetra[j]]);
+            }
         }
-    };
-    for (const Eigen::Vector4i &tetra : delaunay_mesh->tetras_) {
-        AddEdgeToDelaunayGraph(tetra[0], tetra[1]);
-        AddEdgeToDelaunayGraph(tetra[0], tetra[2]);
-        AddEdgeToDelaunayGraph(tetra[0], tetra[3]);
-        AddEdgeToDelaunayGraph(tetra[1], tetra[2]);
-        AddEdgeToDelaunayGraph(tetra[1], tetra[3]);
-        AddEdgeToDelaunayGraph(tetra[2], tetra[3]);
-    }
-
-    std::vector<WeightedEdge> mst = Kruskal(delaunay_graph, points_.size());
-
-    auto NormalWeight = [&](size_t v0, size_t v1) -> double {
-        return 1.0 - std::abs(normals_[v0].dot(normals_[v1]));
-    };
-    for (auto &edge : mst) {
-        edge.weight_ = NormalWeight(edge.v0_, edge.v1_);
     }
+    delaunay_mesh.reset();
+    SortUniqueEdgeKeys(graph_keys);
+
+    utility::LogDebug("Compute Euclidean MST");
+    std::vector<WeightedEdge> delaunay_graph =
+            EdgesFromKeys(graph_keys, n_points, [&](size_t v0, size_t v1) {
+                return (points_[v0] - points_[v1]).squaredNorm();
+            });
+    std::vector<WeightedEdge> emst =
+            MinimumSpanningTree(delaunay_graph, n_points);
+    delaunay_graph = std::vector<WeightedEdge>();
 
     // Add k nearest neighbors to Riemannian graph
+    utility::LogDebug("Compute kNN Graph");
+    graph_keys.resize(emst.size() + n_points * k);
+#pragma omp parallel for schedule(static)
+    for (int64_t eidx = 0; eidx < int64_t(emst.size()); ++eidx) {
+        graph_keys[eidx] = EdgeKey(emst[eidx].v0_, emst[eidx].v1_);
+    }
+    emst = std::vector<WeightedEdge>();
+    std::fill(graph_keys.end() - n_points * k, graph_keys.end(),
+              std::numeric_limits<uint64_t>::max());
+    const size_t knn_offset = graph_keys.size() - n_points * k;
     KDTreeFlann kdtree(*this);
-    for (size_t v0 = 0; v0 < points_.size(); ++v0) {
-        std::vector<int> neighbors;
-        std::vector<double> dists2;
-        kdtree.SearchKNN(points_[v0], int(k), neighbors, dists2);
-        for (size_t vidx1 = 0; vidx1 < neighbors.size(); ++vidx1) {
-            size_t v1 = size_t(neighbors[vidx1]);
-            if (v0 == v1) {
-                continue;
-            }
-            size_t edge = EdgeIndex(v0, v1);
-            if (graph_edges.count(edge) == 0) {
-                double weight = NormalWeight(v0, v1);
-                mst.push_back(WeightedEdge(v0, v1, weight));
-                graph_edges.insert(edge);
+    const int64_t n_blocks = (int64_t(n_points) + kOrientNormalsBlockSize - 1) /
+                             kOrientNormalsBlockSize;
+    utility::ConsoleProgressBar progress_bar(n_blocks, "Compute kNN Graph",
+                                             print_progress);
+    for (int64_t block = 0; block < n_blocks; ++block) {
+        const int64_t block_end = std::min(
+                (block + 1) * kOrientNormalsBlockSize, int64_t(n_points));
+#pragma omp parallel
+        {
+            std::vector<int> neighbors;
+            std::vector<double> dists2;
+#pragma omp for schedule(static)
+            for (int64_t v0 = block * kOrientNormalsBlockSize; v0 < block_end;
+                 ++v0) {
+                kdtree.SearchKNN(points_[v0], int(k), neighbors, dists2);
+                for (size_t vidx1 = 0; vidx1 < neighbors.size(); ++vidx1) {
+                    size_t v1 = size_t(neighbors[vidx1]);
+                    if (size_t(v0) != v1) {
+                        graph_keys[knn_offset + v0 * k + vidx1] =
+                                EdgeKey(v0, v1);
+                    }
+                }
             }
         }
+        ++progress_bar;
     }
+    SortUniqueEdgeKeys(graph_keys);
 
     // extract MST from Riemannian graph
-    mst = Kruskal(mst, points_.size());
-
-    // convert list of edges to graph
-    std::vector<std::unordered_set<size_t>> mst_graph(points_.size());
+    utility::LogDebug("Compute Riemannian MST");
+    std::vector<WeightedEdge> riemannian_graph =
+            EdgesFromKeys(graph_keys, n_points, [&](size_t v0, size_t v1) {
+                return 1.0 - std::abs(normals_[v0].dot(normals_[v1]));
+            });
+    graph_keys = std::vector<uint64_t>();
+    std::vector<WeightedEdge> mst =
+            MinimumSpanningTree(riemannian_graph, n_points);
+    riemannian_graph = std::vector<WeightedEdge>();
+
+    // convert list of edges to graph, in compressed sparse row layout
+    std::vector<size_t> adjacency_offsets(n_points + 1, 0);
     for (const auto &edge : mst) {
-        size_t v0 = edge.v0_;
-        size_t v1 = edge.v1_;
-        mst_graph[v0].insert(v1);
-        mst_graph[v1].insert(v0);
-    }
-
-    // find start node for tree traversal
-    // init with node that maximizes z
-    double max_z = std::numeric_limits<double>::lowest();
-    size_t v0;
-    for (size_t vidx = 0; vidx < points_.size(); ++vidx) {
-        const Eigen::Vector3d &v = points_[vidx];
-        if (v(2) > max_z) {
-            max_z = v(2);
-            v0 = vidx;
-        }
+        adjacency_offsets[edge.v0_ + 1]++;
+        adjacency_offsets[edge.v1_ + 1]++;
+    }
+    std::partial_sum(adjacency_offsets.begin(), adjacency_offsets.end(),
+                     adjacency_offsets.begin());
+    std::vector<size_t> adjacency(adjacency_offsets.back());
+    std::vector<size_t> fill(adjacency_offsets.begin(),
+                             adjacency_offsets.end() - 1);
+    for (const auto &edge : mst) {
+        adjacency[fill[edge.v0_]++] = edge.v1_;
+        adjacency[fill[edge.v1_]++] = edge.v0_;
     }
 
+    // start nodes for tree traversal, in order of decreasing z, so that the
+    // first tree starts at the node that maximizes z
+    std::vector<size_t> start_nodes(n_points);
+    std::iota(start_nodes.begin(), start_nodes.end(), 0);
+    tbb::parallel_sort(start_nodes.begin(), start_nodes.end(),
+                       [&](size_t v0, size_t v1) {
+                           return points_[v0](2) > points_[v1](2) ||
+                                  (points_[v0](2) == points_[v1](2) && v0 < v1);
+                       });
+
     // traverse MST and orient normals consistently
+    utility::LogDebug("Propagate Normal Orientation");
+    progress_bar.reset(n_points, "Propagate Normal Orientation",
+                       print_progress);
     std::queue<size_t> traversal_queue;
-    std::vector<bool> visited(points_.size(), false);
-    traversal_queue.push(v0);
+    std::vector<bool> visited(n_points, false);
     auto TestAndOrientNormal = [&](const Eigen::Vector3d &n0,
                                    Eigen::Vector3d &n1) {
         if (n0.dot(n1) < 0) {
             n1 *= -1;
         }
     };
-    TestAndOrientNormal(Eigen::Vector3d(0, 0, 1), normals_[v0]);
-    while (!traversal_queue.empty()) {
-        v0 = traversal_queue.front();
-        traversal_queue.pop();
-        visited[v0] = true;
-        for (size_t v1 : mst_graph[v0]) {
-            if (!visited[v1]) {
-                traversal_queue.push(v1);
-                TestAndOrientNormal(normals_[v0], normals_[v1]);
+    for (size_t start_node : start_nodes) {
+        if (visited[start_node]) {
+            continue;
+        }
+        visited[start_node] = true;
+        traversal_queue.push(start_node);
+        TestAndOrientNormal(Eigen::Vector3d(0, 0, 1), normals_[start_node]);
+        while (!traversal_queue.empty()) {
+            size_t v0 = traversal_queue.front();
+            traversal_queue.pop();
+            ++progress_bar;
+            for (size_t aidx = adjacency_offsets[v0];
+                 aidx < adjacency_offsets[v0 + 1]; ++aidx) {
+                size_t v1 = adjacency[aidx];
+                if (!visited[v1]) {
+                    visited[v1] = true;
+                    traversal_queue.push(v1);
+                    TestAndOrientNormal(normals_[v0], normals_[v1]);
+                }
             }
         }
     }
@@ -32,11 +32,13 @@
 #include <Eigen/Eigenvalues>
 #include <cmath>
 #include <memory>
+#include <numeric>
 #include <tuple>
 #include <vector>
 
 #include "open3d/geometry/KDTreeFlann.h"
 #include "open3d/geometry/Keypoint.h"
+#include "open3d/geometry/NeighborGraph.h"
 #include "open3d/geometry/PointCloud.h"
 #include "open3d/utility/Console.h"
 #include "open3d/utility/Eigen.h"
@@ -56,17 +58,40 @@ bool IsLocalMaxima(int query_idx,
     return true;
 }
 
-double ComputeModelResolution(const std::vector<Eigen::Vector3d>& points,
-                              const geometry::KDTreeFlann& kdtree) {
-    std::vector<int> indices(2);
-    std::vector<double> distances(2);
-    double resolution = 0.0;
+/// Search the neighbors of point \p i in the NeighborGraph if there is one,
+/// otherwise in the KDTree.
+int SearchNeighbors(const geometry::PointCloud& input,
+                    int i,
+                    const geometry::KDTreeSearchParam& search_param,
+                    const geometry::KDTreeFlann& kdtree,
+                    const std::shared_ptr<geometry::NeighborGraph>& graph,
+                    std::vector<int>& indices,
+                    std::vector<double>& distance2) {
+    if (graph) {
+        return graph->GetNeighbors(size_t(i), search_param, indices, distance2);
+    }
+    return kdtree.Search(input.points_[i], search_param, indices, distance2);
+}
 
-    for (const auto& point : points) {
-        if (kdtree.SearchKNN(point, 2, indices, distances) != 0) {
-            resolution += std::sqrt(distances[1]);
+double ComputeModelResolution(
+        const geometry::PointCloud& input,
+        const geometry::KDTreeFlann& kdtree,
+        const std::shared_ptr<geometry::NeighborGraph>& graph) {
+    // Summed in a fixed order, so that the result does not depend on the
+    // number of threads.
+    const auto& points = input.points_;
+    std::vector<double> nn_distances(points.size(), 0.0);
+#pragma omp parallel for schedule(static)
+    for (int i = 0; i < (int)points.size(); i++) {
+        std::vector<int> indices(2);
+        std::vector<double> distances(2);
+        if (SearchNeighbors(input, i, geometry::KDTreeSearchParamKNN(2), kdtree,
+                            graph, indices, distances) >= 2) {
+            nn_distances[i] = std::sqrt(distances[1]);
         }
     }
+    double resolution =
+            std::accumulate(nn_distances.begin(), nn_distances.end(), 0.0);
     resolution /= points.size();
     return resolution;
 }
@@ -81,16 +106,52 @@ std::shared_ptr<PointCloud> ComputeISSKeypoints(
         double non_max_radius /* = 0.0 */,
         double gamma_21 /* = 0.975 */,
         double gamma_32 /* = 0.975 */,
-        int min_neighbors /*= 5 */) {
+        int min_neighbors /*= 5 */,
+        const std::shared_ptr<NeighborGraph> neighbor_graph /* = nullptr */) {
     if (input.points_.empty()) {
         utility::LogWarning("[ComputeISSKeypoints] Input PointCloud is empty!");
         return std::make_shared<PointCloud>();
     }
+    return input.SelectByIndex(ComputeISSKeypointIndices(
+            input, salient_radius, non_max_radius, gamma_21, gamma_32,
+            min_neighbors, neighbor_graph));
+}
+
+std::vector<size_t> ComputeISSKeypointIndices(
+        const PointCloud& input,
+        double salient_radius /* = 0.0 */,
+        double non_max_radius /* = 0.0 */,
+        double gamma_21 /* = 0.975 */,
+        double gamma_32 /* = 0.975 */,
+        int min_neighbors /*= 5 */,
+        const std::shared_ptr<NeighborGraph> neighbor_graph /* = nullptr */) {
+    if (input.points_.empty()) {
+        utility::LogWarning(
+                "[ComputeISSKeypointIndices] Input PointCloud is empty!");
+        return std::vector<size_t>();
+    }
     const auto& points = input.points_;
-    KDTreeFlann kdtree(input);
+
+    // The KDTree is only built for the searches that the NeighborGraph does
+    // not cover.
+    KDTreeFlann kdtree;
+    bool has_kdtree = false;
+    auto get_graph = [&](const KDTreeSearchParam& search_param) {
+        if (neighbor_graph && neighbor_graph->Covers(search_param)) {
+            neighbor_graph->AssertCovers(points.size(), search_param,
+                                         "ComputeISSKeypoints");
+            return neighbor_graph;
+        }
+        if (!has_kdtree) {
+            kdtree.SetGeometry(input);
+            has_kdtree = true;
+        }
+        return std::shared_ptr<NeighborGraph>();
+    };
 
     if (salient_radius == 0.0 || non_max_radius == 0.0) {
-        const double resolution = ComputeModelResolution(points, kdtree);
+        const double resolution = ComputeModelResolution(
+                input, kdtree, get_graph(KDTreeSearchParamKNN(2)));
         salient_radius = 6 * resolution;
         non_max_radius = 4 * resolution;
         utility::LogDebug(
@@ -99,13 +160,27 @@ std::shared_ptr<PointCloud> ComputeISSKeypoints(
                 salient_radius, non_max_radius);
     }
 
+    // Searches return the neighbors with a squared distance below the float
+    // squared radius, so a salient neighborhood contains the non maxima
+    // suppression neighborhood iff non_max_radius <= salient_radius.
+    const bool cache_neighbors = non_max_radius <= salient_radius;
+    const double non_max_radius2 = float(non_max_radius * non_max_radius);
+    std::vector<std::vector<int>> nms_neighbors(cache_neighbors ? points.size()
+                                                                : 0);
+    const KDTreeSearchParamRadius salient_param(salient_radius);
+    const KDTreeSearchParamRadius non_max_param(non_max_radius);
+    const auto salient_graph = get_graph(salient_param);
+    const auto non_max_graph = cache_neighbors
+                                       ? std::shared_ptr<NeighborGraph>()
+                                       : get_graph(non_max_param);
+
     std::vector<double> third_eigen_values(points.size());
 #pragma omp parallel for schedule(static) shared(third_eigen_values)
     for (int i = 0; i < (int)points.size(); i++) {
         std::vector<int> indices;
         std::vector<double> dist;
-        int nb_neighbors =
-                kdtree.SearchRadius(points[i], salient_radius, indices, dist);
+        int nb_neighbors = SearchNeighbors(input, i, salient_param, kdtree,
+                                           salient_graph, indices, dist);
         if (nb_neighbors < min_neighbors) {
             continue;
         }
@@ -122,29 +197,47 @@ std::shared_ptr<PointCloud> ComputeISSKeypoints(
 
         if ((e2c / e1c) < gamma_21 && e3c / e2c < gamma_32) {
             third_eigen_values[i] = e3c;
+            if (cache_neighbors) {
+                // Only keypoint candidates keep their neighbors.
+                std::vector<int>& nn_indices = nms_neighbors[i];
+                for (size_t k = 0; k < indices.size(); k++) {
+                    if (dist[k] < non_max_radius2) {
+                        nn_indices.push_back(indices[k]);
+                    }
+                }
+            }
         }
     }
 
-    std::vector<size_t> kp_indices;
-    kp_indices.reserve(points.size());
-#pragma omp parallel for schedule(static) shared(kp_indices)
+    std::vector<uint8_t> is_keypoint(points.size(), 0);
+#pragma omp parallel for schedule(static) shared(is_keypoint)
     for (int i = 0; i < (int)points.size(); i++) {
         if (third_eigen_values[i] > 0.0) {
             std::vector<int> nn_indices;
-            std::vector<double> dist;
-            int nb_neighbors = kdtree.SearchRadius(points[i], non_max_radius,
-                                                   nn_indices, dist);
+            if (cache_neighbors) {
+                nn_indices.swap(nms_neighbors[i]);
+            } else {
+                std::vector<double> dist;
+                SearchNeighbors(input, i, non_max_param, kdtree, non_max_graph,
+                                nn_indices, dist);
+            }
 
-            if (nb_neighbors >= min_neighbors &&
+            if ((int)nn_indices.size() >= min_neighbors &&
                 IsLocalMaxima(i, nn_indices, third_eigen_values)) {
-                kp_indices.emplace_back(i);
+                is_keypoint[i] = 1;
             }
         }
     }
 
+    std::vector<size_t> kp_indices;
+    for (size_t i = 0; i < points.size(); i++) {
+        if (is_keypoint[i]) {
+            kp_indices.push_back(i);
+        }
+    }
     utility::LogDebug("[ComputeISSKeypoints] Extracted {} keypoints",
                       kp_indices.size());
-    return input.SelectByIndex(kp_indices);
+    return kp_indices;
 }
 
 }  // namespace keypoint
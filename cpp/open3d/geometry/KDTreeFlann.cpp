@@ -41,13 +41,24 @@
 namespace open3d {
 namespace geometry {
 
-KDTreeFlann::KDTreeFlann() {}
+KDTreeFlann::KDTreeFlann(const KDTreeIndexParam &index_param)
+    : index_param_(index_param) {}
 
-KDTreeFlann::KDTreeFlann(const Eigen::MatrixXd &data) { SetMatrixData(data); }
+KDTreeFlann::KDTreeFlann(const Eigen::MatrixXd &data,
+                         const KDTreeIndexParam &index_param)
+    : index_param_(index_param) {
+    SetMatrixData(data);
+}
 
-KDTreeFlann::KDTreeFlann(const Geometry &geometry) { SetGeometry(geometry); }
+KDTreeFlann::KDTreeFlann(const Geometry &geometry,
+                         const KDTreeIndexParam &index_param)
+    : index_param_(index_param) {
+    SetGeometry(geometry);
+}
 
-KDTreeFlann::KDTreeFlann(const pipelines::registration::Feature &feature) {
+KDTreeFlann::KDTreeFlann(const pipelines::registration::Feature &feature,
+                         const KDTreeIndexParam &index_param)
+    : index_param_(index_param) {
     SetFeature(feature);
 }
 
@@ -125,8 +136,9 @@ int KDTreeFlann::SearchKNN(const T &query,
     distance2.resize(knn);
     flann::Matrix<int> indices_flann(indices.data(), query_flann.rows, knn);
     flann::Matrix<double> dists_flann(distance2.data(), query_flann.rows, knn);
-    int k = flann_index_->knnSearch(query_flann, indices_flann, dists_flann,
-                                    knn, flann::SearchParams(-1, 0.0));
+    int k = flann_index_->knnSearch(
+            query_flann, indices_flann, dists_flann, knn,
+            flann::SearchParams(index_param_.checks_, 0.0));
     indices.resize(k);
     distance2.resize(k);
     return k;
@@ -146,7 +158,7 @@ int KDTreeFlann::SearchRadius(const T &query,
         return -1;
     }
     flann::Matrix<double> query_flann((double *)query.data(), 1, dimension_);
-    flann::SearchParams param(-1, 0.0);
+    flann::SearchParams param(index_param_.checks_, 0.0);
     param.max_neighbors = -1;
     std::vector<std::vector<int>> indices_vec(1);
     std::vector<std::vector<double>> dists_vec(1);
@@ -172,7 +184,7 @@ int KDTreeFlann::SearchHybrid(const T &query,
         return -1;
     }
     flann::Matrix<double> query_flann((double *)query.data(), 1, dimension_);
-    flann::SearchParams param(-1, 0.0);
+    flann::SearchParams param(index_param_.checks_, 0.0);
     param.max_neighbors = max_nn;
     indices.resize(max_nn);
     distance2.resize(max_nn);
@@ -198,8 +210,16 @@ bool KDTreeFlann::SetRawData(const Eigen::Map<const Eigen::MatrixXd> &data) {
            dataset_size_ * dimension_ * sizeof(double));
     flann_dataset_.reset(new flann::Matrix<double>((double *)data_.data(),
                                                    dataset_size_, dimension_));
-    flann_index_.reset(new flann::Index<flann::L2<double>>(
-            *flann_dataset_, flann::KDTreeSingleIndexParams(15)));
+    // FLANN's unlimited-checks search on a randomized forest is not exact, so
+    // the single KDTree is used unless the search is approximate.
+    if (index_param_.IsApproximate()) {
+        flann_index_.reset(new flann::Index<flann::L2<double>>(
+                *flann_dataset_,
+                flann::KDTreeIndexParams(index_param_.num_trees_)));
+    } else {
+        flann_index_.reset(new flann::Index<flann::L2<double>>(
+                *flann_dataset_, flann::KDTreeSingleIndexParams(15)));
+    }
     flann_index_->buildIndex();
     return true;
 }
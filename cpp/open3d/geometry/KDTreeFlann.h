@@ -54,20 +54,28 @@ namespace geometry {
 class KDTreeFlann {
 public:
     /// \brief Default Constructor.
-    KDTreeFlann();
+    ///
+    /// \param index_param Index parameters used when data is set.
+    KDTreeFlann(const KDTreeIndexParam &index_param = KDTreeIndexParam());
     /// \brief Parameterized Constructor.
     ///
     /// \param data Provides set of data points for KDTree construction.
-    KDTreeFlann(const Eigen::MatrixXd &data);
+    /// \param index_param Index parameters.
+    KDTreeFlann(const Eigen::MatrixXd &data,
+                const KDTreeIndexParam &index_param = KDTreeIndexParam());
     /// \brief Parameterized Constructor.
     ///
     /// \param geometry Provides geometry from which KDTree is constructed.
-    KDTreeFlann(const Geometry &geometry);
+    /// \param index_param Index parameters.
+    KDTreeFlann(const Geometry &geometry,
+                const KDTreeIndexParam &index_param = KDTreeIndexParam());
     /// \brief Parameterized Constructor.
     ///
     /// \param feature Provides a set of features from which the KDTree is
     /// constructed.
-    KDTreeFlann(const pipelines::registration::Feature &feature);
+    /// \param index_param Index parameters.
+    KDTreeFlann(const pipelines::registration::Feature &feature,
+                const KDTreeIndexParam &index_param = KDTreeIndexParam());
     ~KDTreeFlann();
     KDTreeFlann(const KDTreeFlann &) = delete;
     KDTreeFlann &operator=(const KDTreeFlann &) = delete;
@@ -86,6 +94,9 @@ public:
     /// \param feature Set of features for KDTree construction.
     bool SetFeature(const pipelines::registration::Feature &feature);
 
+    /// Returns the index parameters of the KDTree.
+    const KDTreeIndexParam &GetIndexParam() const { return index_param_; }
+
     template <typename T>
     int Search(const T &query,
                const KDTreeSearchParam &param,
@@ -119,6 +130,7 @@ private:
     bool SetRawData(const Eigen::Map<const Eigen::MatrixXd> &data);
 
 protected:
+    KDTreeIndexParam index_param_;
     std::vector<double> data_;
     std::unique_ptr<flann::Matrix<double>> flann_dataset_;
     std::unique_ptr<flann::Index<flann::L2<double>>> flann_index_;
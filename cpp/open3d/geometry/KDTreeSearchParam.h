@@ -111,5 +111,35 @@ public:
     int max_nn_;
 };
 
+/// \class KDTreeIndexParam
+///
+/// \brief KDTree index parameters, selecting between an exact single KDTree
+/// and an approximate forest of randomized KDTrees.
+///
+/// The randomized forest is much faster for high dimensional data such as
+/// FPFH features, where an exact KDTree search degenerates to brute force.
+class KDTreeIndexParam {
+public:
+    /// \brief Default Cosntructor.
+    ///
+    /// \param num_trees Number of randomized KDTrees. 0 builds a single exact
+    /// KDTree.
+    /// \param checks Number of leaves visited per query in the randomized
+    /// forest. Higher values give better recall at the cost of speed. -1
+    /// gives an exact search, using a single KDTree regardless of num_trees.
+    KDTreeIndexParam(int num_trees = 0, int checks = -1)
+        : num_trees_(num_trees), checks_(checks) {}
+
+public:
+    /// Returns true if the index parameters give an approximate search.
+    bool IsApproximate() const { return num_trees_ > 0 && checks_ > 0; }
+
+public:
+    /// Number of randomized KDTrees, 0 for a single exact KDTree.
+    int num_trees_;
+    /// Number of leaves visited per query, -1 for unlimited.
+    int checks_;
+};
+
 }  // namespace geometry
 }  // namespace open3d
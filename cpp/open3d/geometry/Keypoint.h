@@ -31,10 +31,12 @@
 #pragma once
 
 #include <memory>
+#include <vector>
 
 namespace open3d {
 namespace geometry {
 
+class NeighborGraph;
 class PointCloud;
 
 namespace keypoint {
@@ -52,14 +54,52 @@ namespace keypoint {
 /// gamma_21 The upper bound on the ratio between the second and the first
 /// eigenvalue \param gamma32 The upper bound on the ratio between the third and
 /// the second eigenvalue \param min_neighbors Minimum number of neighbors that
-/// has to be found to consider a keypoint. \authors Ignacio Vizzo and Cyrill
-/// Stachniss, University of Bonn.
-std::shared_ptr<PointCloud> ComputeISSKeypoints(const PointCloud &input,
-                                                double salient_radius = 0.0,
-                                                double non_max_radius = 0.0,
-                                                double gamma_21 = 0.975,
-                                                double gamma_32 = 0.975,
-                                                int min_neighbors = 5);
+/// has to be found to consider a keypoint. \param neighbor_graph Optional
+/// NeighborGraph of the input, used instead of searching a KDTree for the
+/// neighborhoods it covers. \authors Ignacio Vizzo and Cyrill Stachniss,
+/// University of Bonn.
+std::shared_ptr<PointCloud> ComputeISSKeypoints(
+        const PointCloud &input,
+        double salient_radius = 0.0,
+        double non_max_radius = 0.0,
+        double gamma_21 = 0.975,
+        double gamma_32 = 0.975,
+        int min_neighbors = 5,
+        const std::shared_ptr<NeighborGraph> neighbor_graph = nullptr);
+
+/// \brief Function that computes the indices of the ISS Keypoints of an input
+/// point cloud, in increasing order. Same as ComputeISSKeypoints, without
+/// copying the keypoints into a new PointCloud.
+///
+/// The model resolution, the eigenvalues and the non maxima suppression are
+/// computed in parallel. If non_max_radius <= salient_radius, the neighbors
+/// found for the eigenvalues of keypoint candidates are reused for the non
+/// maxima suppression instead of searching the KDTree again.
+///
+/// \param input The input PointCloud where to compute the ISS Keypoints.
+/// \param salient_radius The radius of the spherical neighborhood used to
+/// detect the keypoints.
+/// \param non_max_radius The non maxima supression radius. If non of the input
+/// parameters are specified or are 0.0, then they will be computed from the
+/// input data, taking into account the Model Resolution.
+/// \param gamma_21 The upper bound on the ratio between the second and the
+/// first eigenvalue.
+/// \param gamma_32 The upper bound on the ratio between the third and the
+/// second eigenvalue.
+/// \param min_neighbors Minimum number of neighbors that has to be found to
+/// consider a keypoint.
+/// \param neighbor_graph Optional NeighborGraph of the input, used instead of
+/// searching a KDTree for the neighborhoods it covers. With both radii given,
+/// a radius graph with a radius of at least both radii avoids building a
+/// KDTree.
+std::vector<size_t> ComputeISSKeypointIndices(
+        const PointCloud &input,
+        double salient_radius = 0.0,
+        double non_max_radius = 0.0,
+        double gamma_21 = 0.975,
+        double gamma_32 = 0.975,
+        int min_neighbors = 5,
+        const std::shared_ptr<NeighborGraph> neighbor_graph = nullptr);
 
 }  // namespace keypoint
 }  // namespace geometry
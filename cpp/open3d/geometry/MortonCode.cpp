@@ -0,0 +1,139 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/geometry/MortonCode.h"
+
+#include <tbb/parallel_sort.h>
+
+#include <algorithm>
+#include <limits>
+
+namespace open3d {
+namespace geometry {
+
+constexpr int MortonCode::kBitsPerAxis;
+
+namespace {
+
+/// Spread the lowest 21 bits of v so that there are two zero bits between
+/// consecutive bits.
+uint64_t SplitBy3(uint32_t v) {
+    uint64_t x = v & 0x1fffff;
+    x = (x | x << 32) & 0x1f00000000ffff;
+    x = (x | x << 16) & 0x1f0000ff0000ff;
+    x = (x | x << 8) & 0x100f00f00f00f00f;
+    x = (x | x << 4) & 0x10c30c30c30c30c3;
+    x = (x | x << 2) & 0x1249249249249249;
+    return x;
+}
+
+/// Inverse of SplitBy3.
+uint32_t CompactBy3(uint64_t x) {
+    x &= 0x1249249249249249;
+    x = (x ^ (x >> 2)) & 0x10c30c30c30c30c3;
+    x = (x ^ (x >> 4)) & 0x100f00f00f00f00f;
+    x = (x ^ (x >> 8)) & 0x1f0000ff0000ff;
+    x = (x ^ (x >> 16)) & 0x1f00000000ffff;
+    x = (x ^ (x >> 32)) & 0x1fffff;
+    return static_cast<uint32_t>(x);
+}
+
+}  // namespace
+
+uint64_t MortonCode::Encode(uint32_t x, uint32_t y, uint32_t z) {
+    return SplitBy3(x) | SplitBy3(y) << 1 | SplitBy3(z) << 2;
+}
+
+Eigen::Vector3i MortonCode::Decode(uint64_t code) {
+    return Eigen::Vector3i(CompactBy3(code), CompactBy3(code >> 1),
+                           CompactBy3(code >> 2));
+}
+
+template <typename T>
+std::vector<uint64_t> MortonCode::ComputeCodes(const T *points,
+                                               int64_t num_points) {
+    std::vector<uint64_t> codes(num_points);
+    if (num_points == 0) {
+        return codes;
+    }
+    Eigen::Vector3d min_bound =
+            Eigen::Vector3d::Constant(std::numeric_limits<double>::infinity());
+    Eigen::Vector3d max_bound = -min_bound;
+    for (int64_t i = 0; i < num_points; ++i) {
+        for (int j = 0; j < 3; ++j) {
+            const double v = points[i * 3 + j];
+            min_bound(j) = std::min(min_bound(j), v);
+            max_bound(j) = std::max(max_bound(j), v);
+        }
+    }
+    // Cubic cells keep the curve isotropic.
+    const double extent = (max_bound - min_bound).maxCoeff();
+    const double max_cell = double((1 << kBitsPerAxis) - 1);
+    const double scale = extent > 0 ? max_cell / extent : 0;
+
+#pragma omp parallel for schedule(static)
+    for (int64_t i = 0; i < num_points; ++i) {
+        uint32_t cell[3];
+        for (int j = 0; j < 3; ++j) {
+            const double v = (points[i * 3 + j] - min_bound(j)) * scale;
+            cell[j] =
+                    static_cast<uint32_t>(std::min(std::max(v, 0.0), max_cell));
+        }
+        codes[i] = Encode(cell[0], cell[1], cell[2]);
+    }
+    return codes;
+}
+
+template <typename T>
+std::vector<int64_t> MortonCode::ComputeOrder(const T *points,
+                                              int64_t num_points) {
+    const std::vector<uint64_t> codes = ComputeCodes(points, num_points);
+    std::vector<std::pair<uint64_t, int64_t>> keys(num_points);
+#pragma omp parallel for schedule(static)
+    for (int64_t i = 0; i < num_points; ++i) {
+        keys[i] = std::make_pair(codes[i], i);
+    }
+    // Keys are unique, so the parallel sort is deterministic.
+    tbb::parallel_sort(keys.begin(), keys.end());
+    std::vector<int64_t> order(num_points);
+#pragma omp parallel for schedule(static)
+    for (int64_t i = 0; i < num_points; ++i) {
+        order[i] = keys[i].second;
+    }
+    return order;
+}
+
+template std::vector<uint64_t> MortonCode::ComputeCodes<float>(const float *,
+                                                               int64_t);
+template std::vector<uint64_t> MortonCode::ComputeCodes<double>(const double *,
+                                                                int64_t);
+template std::vector<int64_t> MortonCode::ComputeOrder<float>(const float *,
+                                                              int64_t);
+template std::vector<int64_t> MortonCode::ComputeOrder<double>(const double *,
+                                                               int64_t);
+
+}  // namespace geometry
+}  // namespace open3d
@@ -0,0 +1,77 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+#include <cstdint>
+#include <vector>
+
+namespace open3d {
+namespace geometry {
+
+/// \class MortonCode
+///
+/// \brief Morton (Z-order) codes of 3D points.
+///
+/// Coordinates are quantized to kBitsPerAxis bits inside the bounding box of
+/// the points and their bits are interleaved into a 63 bit code. Sorting
+/// points by their codes puts points that are close in space close in memory.
+class MortonCode {
+public:
+    /// Number of quantization bits per axis.
+    static constexpr int kBitsPerAxis = 21;
+
+    /// Interleave the bits of three grid coordinates, each less than
+    /// 2^kBitsPerAxis, as x0 y0 z0 x1 y1 z1 ... from the lowest bit.
+    static uint64_t Encode(uint32_t x, uint32_t y, uint32_t z);
+
+    /// Inverse of Encode().
+    static Eigen::Vector3i Decode(uint64_t code);
+
+    /// Compute the Morton codes of points quantized in their bounding box.
+    /// Runs in parallel.
+    ///
+    /// \param points Pointer to \p num_points row-major 3D points.
+    /// \param num_points Number of points.
+    template <typename T>
+    static std::vector<uint64_t> ComputeCodes(const T *points,
+                                              int64_t num_points);
+
+    /// Compute the permutation sorting points along the Morton curve. Points
+    /// with the same code keep their relative order. Runs in parallel.
+    ///
+    /// \param points Pointer to \p num_points row-major 3D points.
+    /// \param num_points Number of points.
+    /// \return Permutation such that the i-th point of the sorted sequence is
+    /// the permutation[i]-th input point.
+    template <typename T>
+    static std::vector<int64_t> ComputeOrder(const T *points,
+                                             int64_t num_points);
+};
+
+}  // namespace geometry
+}  // namespace open3d
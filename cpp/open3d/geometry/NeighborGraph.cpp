@@ -0,0 +1,221 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/geometry/NeighborGraph.h"
+
+#include <algorithm>
+
+#include "open3d/geometry/KDTreeFlann.h"
+#include "open3d/geometry/PointCloud.h"
+#include "open3d/utility/Console.h"
+
+namespace open3d {
+namespace geometry {
+
+namespace {
+
+/// Number of points searched before their neighbors are compacted, bounding
+/// the memory used by the per point results.
+constexpr int64_t kNeighborGraphBlockSize = 1 << 16;
+
+/// Squared radius threshold of KDTreeFlann::SearchRadius().
+double RadiusThreshold(double radius) { return double(float(radius * radius)); }
+
+}  // namespace
+
+NeighborGraph::NeighborGraph(const PointCloud &cloud,
+                             const KDTreeSearchParam &search_param)
+    : search_type_(search_param.GetSearchType()) {
+    switch (search_type_) {
+        case KDTreeSearchParam::SearchType::Knn:
+            knn_ = ((const KDTreeSearchParamKNN &)search_param).knn_;
+            break;
+        case KDTreeSearchParam::SearchType::Radius:
+            radius_ = ((const KDTreeSearchParamRadius &)search_param).radius_;
+            break;
+        case KDTreeSearchParam::SearchType::Hybrid:
+            radius_ = ((const KDTreeSearchParamHybrid &)search_param).radius_;
+            knn_ = ((const KDTreeSearchParamHybrid &)search_param).max_nn_;
+            break;
+        default:
+            utility::LogError("[NeighborGraph] Unsupported search type.");
+    }
+    const int64_t num_points = int64_t(cloud.points_.size());
+    offsets_.assign(1, 0);
+    offsets_.reserve(num_points + 1);
+    if (num_points == 0) {
+        return;
+    }
+
+    KDTreeFlann kdtree(cloud);
+    std::vector<std::vector<int>> block_indices;
+    std::vector<std::vector<double>> block_distance2;
+    for (int64_t block_begin = 0; block_begin < num_points;
+         block_begin += kNeighborGraphBlockSize) {
+        const int64_t block_end =
+                std::min(block_begin + kNeighborGraphBlockSize, num_points);
+        const int64_t block_size = block_end - block_begin;
+        block_indices.resize(block_size);
+        block_distance2.resize(block_size);
+#pragma omp parallel for schedule(static)
+        for (int64_t i = 0; i < block_size; ++i) {
+            if (kdtree.Search(cloud.points_[block_begin + i], search_param,
+                              block_indices[i], block_distance2[i]) < 0) {
+                block_indices[i].clear();
+                block_distance2[i].clear();
+            }
+        }
+
+        for (int64_t i = 0; i < block_size; ++i) {
+            offsets_.push_back(offsets_.back() +
+                               int64_t(block_indices[i].size()));
+        }
+        indices_.resize(offsets_.back());
+        distances2_.resize(offsets_.back());
+#pragma omp parallel for schedule(static)
+        for (int64_t i = 0; i < block_size; ++i) {
+            const int64_t begin = offsets_[block_begin + i];
+            std::copy(block_indices[i].begin(), block_indices[i].end(),
+                      indices_.begin() + begin);
+            std::copy(block_distance2[i].begin(), block_distance2[i].end(),
+                      distances2_.begin() + begin);
+        }
+        utility::LogDebug("[NeighborGraph] Searched {:d} of {:d} points.",
+                          block_end, num_points);
+    }
+}
+
+std::shared_ptr<NeighborGraph> NeighborGraph::CreateFromPointCloud(
+        const PointCloud &cloud, const KDTreeSearchParam &search_param) {
+    return std::make_shared<NeighborGraph>(cloud, search_param);
+}
+
+bool NeighborGraph::Covers(const KDTreeSearchParam &search_param) const {
+    switch (search_param.GetSearchType()) {
+        case KDTreeSearchParam::SearchType::Knn: {
+            const int knn = ((const KDTreeSearchParamKNN &)search_param).knn_;
+            return search_type_ == KDTreeSearchParam::SearchType::Knn &&
+                   knn <= knn_;
+        }
+        case KDTreeSearchParam::SearchType::Radius: {
+            const double radius =
+                    ((const KDTreeSearchParamRadius &)search_param).radius_;
+            return search_type_ == KDTreeSearchParam::SearchType::Radius &&
+                   RadiusThreshold(radius) <= RadiusThreshold(radius_);
+        }
+        case KDTreeSearchParam::SearchType::Hybrid: {
+            const auto &param = (const KDTreeSearchParamHybrid &)search_param;
+            switch (search_type_) {
+                case KDTreeSearchParam::SearchType::Knn:
+                    // The hybrid neighbors are the Knn neighbors within the
+                    // radius.
+                    return param.max_nn_ <= knn_;
+                case KDTreeSearchParam::SearchType::Radius:
+                    return RadiusThreshold(param.radius_) <=
+                           RadiusThreshold(radius_);
+                case KDTreeSearchParam::SearchType::Hybrid:
+                    return param.max_nn_ <= knn_ &&
+                           RadiusThreshold(param.radius_) <=
+                                   RadiusThreshold(radius_);
+                default:
+                    return false;
+            }
+        }
+        default:
+            return false;
+    }
+}
+
+std::pair<int64_t, int64_t> NeighborGraph::NeighborRange(
+        size_t i, const KDTreeSearchParam &search_param) const {
+    const int64_t begin = offsets_[i];
+    int64_t end = offsets_[i + 1];
+    int max_nn = -1;
+    double radius = -1.0;
+    switch (search_param.GetSearchType()) {
+        case KDTreeSearchParam::SearchType::Knn:
+            max_nn = ((const KDTreeSearchParamKNN &)search_param).knn_;
+            break;
+        case KDTreeSearchParam::SearchType::Radius:
+            radius = ((const KDTreeSearchParamRadius &)search_param).radius_;
+            break;
+        case KDTreeSearchParam::SearchType::Hybrid:
+            radius = ((const KDTreeSearchParamHybrid &)search_param).radius_;
+            max_nn = ((const KDTreeSearchParamHybrid &)search_param).max_nn_;
+            break;
+        default:
+            break;
+    }
+    if (max_nn >= 0) {
+        end = std::min(end, begin + max_nn);
+    }
+    if (radius >= 0.0) {
+        // Neighbors are sorted by distance.
+        end = std::lower_bound(distances2_.begin() + begin,
+                               distances2_.begin() + end,
+                               RadiusThreshold(radius)) -
+              distances2_.begin();
+    }
+    return std::make_pair(begin, end);
+}
+
+int NeighborGraph::GetNeighbors(size_t i,
+                                const KDTreeSearchParam &search_param,
+                                std::vector<int> &indices,
+                                std::vector<double> &distance2) const {
+    const auto range = NeighborRange(i, search_param);
+    indices.assign(indices_.begin() + range.first,
+                   indices_.begin() + range.second);
+    distance2.assign(distances2_.begin() + range.first,
+                     distances2_.begin() + range.second);
+    return int(range.second - range.first);
+}
+
+int NeighborGraph::CountNeighbors(size_t i,
+                                  const KDTreeSearchParam &search_param) const {
+    const auto range = NeighborRange(i, search_param);
+    return int(range.second - range.first);
+}
+
+void NeighborGraph::AssertCovers(size_t num_points,
+                                 const KDTreeSearchParam &search_param,
+                                 const std::string &caller) const {
+    if (NumPoints() != num_points) {
+        utility::LogError(
+                "[{}] NeighborGraph has {:d} points, but the point cloud has "
+                "{:d} points.",
+                caller, NumPoints(), num_points);
+    }
+    if (!Covers(search_param)) {
+        utility::LogError(
+                "[{}] NeighborGraph does not cover the neighborhoods of the "
+                "search parameter.",
+                caller);
+    }
+}
+
+}  // namespace geometry
+}  // namespace open3d
@@ -0,0 +1,152 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#pragma once
+
+#include <cstdint>
+#include <memory>
+#include <string>
+#include <vector>
+
+#include "open3d/geometry/KDTreeSearchParam.h"
+
+namespace open3d {
+namespace geometry {
+
+class PointCloud;
+
+/// \class NeighborGraph
+///
+/// \brief Cache of the neighborhoods of all points of a point cloud, stored in
+/// compressed sparse row (CSR) layout.
+///
+/// The neighbors of point i are indices_[offsets_[i]] ...
+/// indices_[offsets_[i + 1] - 1], sorted by distance, with the point itself
+/// included, exactly as returned by KDTreeFlann::Search() for the search
+/// parameter of the graph.
+///
+/// A graph can be passed to the point cloud and feature functions that search
+/// neighborhoods, as long as it covers the neighborhoods they need, see
+/// Covers(). This way a chain of processing steps on the same point cloud
+/// only builds one KDTree and searches it once.
+class NeighborGraph {
+public:
+    /// \brief Default Constructor.
+    NeighborGraph() {}
+    /// \brief Parameterized Constructor.
+    ///
+    /// \param cloud The point cloud.
+    /// \param search_param The KDTree search parameters.
+    NeighborGraph(const PointCloud &cloud,
+                  const KDTreeSearchParam &search_param);
+    ~NeighborGraph() {}
+
+public:
+    /// \brief Factory function to create a NeighborGraph from a point cloud.
+    ///
+    /// \param cloud The point cloud.
+    /// \param search_param The KDTree search parameters.
+    static std::shared_ptr<NeighborGraph> CreateFromPointCloud(
+            const PointCloud &cloud, const KDTreeSearchParam &search_param);
+
+    /// Number of points of the graph.
+    size_t NumPoints() const {
+        return offsets_.empty() ? 0 : offsets_.size() - 1;
+    }
+
+    /// Number of neighbors of point \p i, including the point itself.
+    size_t NumNeighbors(size_t i) const {
+        return size_t(offsets_[i + 1] - offsets_[i]);
+    }
+
+    /// \brief Returns true if the neighborhoods of \p search_param can be read
+    /// from the graph.
+    ///
+    /// A Knn graph covers Knn and Hybrid searches with at most knn_
+    /// neighbors, a Radius graph covers Radius and Hybrid searches with a
+    /// radius of at most radius_, and a Hybrid graph covers Hybrid searches
+    /// within both limits.
+    bool Covers(const KDTreeSearchParam &search_param) const;
+
+    /// \brief Get the neighbors of point \p i for \p search_param.
+    ///
+    /// The result is the same as KDTreeFlann::Search() with \p search_param,
+    /// except for the order of neighbors at the same distance. The graph must
+    /// cover \p search_param.
+    ///
+    /// \param i Index of the point.
+    /// \param search_param The KDTree search parameters.
+    /// \param indices Output indices of the neighbors.
+    /// \param distance2 Output squared distances of the neighbors.
+    /// \return Number of neighbors.
+    int GetNeighbors(size_t i,
+                     const KDTreeSearchParam &search_param,
+                     std::vector<int> &indices,
+                     std::vector<double> &distance2) const;
+
+    /// \brief Count the neighbors of point \p i for \p search_param without
+    /// copying them.
+    ///
+    /// \param i Index of the point.
+    /// \param search_param The KDTree search parameters.
+    int CountNeighbors(size_t i, const KDTreeSearchParam &search_param) const;
+
+    /// \brief Check that the graph can be used by a function on a point cloud
+    /// of \p num_points points with \p search_param, and log an error
+    /// otherwise.
+    ///
+    /// \param num_points Number of points of the point cloud.
+    /// \param search_param The KDTree search parameters needed by the function.
+    /// \param caller Name of the function, for the error message.
+    void AssertCovers(size_t num_points,
+                      const KDTreeSearchParam &search_param,
+                      const std::string &caller) const;
+
+protected:
+    /// Range [begin, end) of the neighbors of point \p i for \p search_param.
+    std::pair<int64_t, int64_t> NeighborRange(
+            size_t i, const KDTreeSearchParam &search_param) const;
+
+public:
+    /// Search type of the graph.
+    KDTreeSearchParam::SearchType search_type_ =
+            KDTreeSearchParam::SearchType::Knn;
+    /// Number of neighbors for Knn graphs, max number of neighbors for Hybrid
+    /// graphs.
+    int knn_ = 0;
+    /// Search radius for Radius and Hybrid graphs.
+    double radius_ = 0.0;
+    /// Offsets of the neighbors of every point in indices_ and distances2_,
+    /// followed by the total number of neighbors.
+    std::vector<int64_t> offsets_;
+    /// Indices of the neighbors.
+    std::vector<int> indices_;
+    /// Squared distances of the neighbors.
+    std::vector<double> distances2_;
+};
+
+}  // namespace geometry
+}  // namespace open3d
@@ -30,16 +30,108 @@
 
 #include <Eigen/Dense>
 #include <algorithm>
+#include <bitset>
+#include <limits>
+#include <numeric>
 #include <unordered_map>
 
 #include "open3d/geometry/BoundingVolume.h"
+#include "open3d/geometry/MortonCode.h"
 #include "open3d/geometry/PointCloud.h"
 #include "open3d/geometry/VoxelGrid.h"
 #include "open3d/utility/Console.h"
+#include "open3d/utility/ParallelRadixSort.h"
 
 namespace open3d {
 namespace geometry {
 
+namespace {
+
+/// Code of points that are not within the bound of a LinearOctree. It is
+/// larger than any valid code, which has at most 3 * LinearOctree::kMaxDepth
+/// bits.
+constexpr uint64_t kInvalidCode = std::numeric_limits<uint64_t>::max();
+
+/// Number of elements processed by a thread at once in ComputeRunStarts.
+constexpr int64_t kRunChunkSize = int64_t(1) << 16;
+
+/// Compute the origin and size of the octree of a point cloud. The octree is a
+/// cube centered at the point cloud, expanded by size_expand.
+void ComputeOctreeBound(const PointCloud& point_cloud,
+                        double size_expand,
+                        Eigen::Vector3d& origin,
+                        double& size) {
+    Eigen::Array3d min_bound = point_cloud.GetMinBound();
+    Eigen::Array3d max_bound = point_cloud.GetMaxBound();
+    Eigen::Array3d center = (min_bound + max_bound) / 2;
+    Eigen::Array3d half_sizes = center - min_bound;
+    double max_half_size = half_sizes.maxCoeff();
+    origin = min_bound.min(center - max_half_size);
+    if (max_half_size == 0) {
+        size = size_expand;
+    } else {
+        size = max_half_size * 2 * (1 + size_expand);
+    }
+}
+
+/// Morton code of the leaf node at max_depth that contains point, or
+/// kInvalidCode if the point is out of bound.
+uint64_t ComputeLeafCode(const Eigen::Vector3d& point,
+                         const Eigen::Vector3d& origin,
+                         double size,
+                         size_t max_depth) {
+    if (!Octree::IsPointInBound(point, origin, size)) {
+        return kInvalidCode;
+    }
+    const uint32_t num_cells = uint32_t(1) << max_depth;
+    uint32_t cell[3];
+    for (int j = 0; j < 3; ++j) {
+        const double v = std::floor((point(j) - origin(j)) / size * num_cells);
+        cell[j] = std::min(static_cast<uint32_t>(std::max(v, 0.0)),
+                           num_cells - 1);
+    }
+    return MortonCode::Encode(cell[0], cell[1], cell[2]);
+}
+
+/// Start indices of the runs of equal keys[i] >> shift in the sorted keys,
+/// followed by keys.size(). Runs in parallel.
+std::vector<size_t> ComputeRunStarts(const std::vector<uint64_t>& keys,
+                                     int shift) {
+    const int64_t n = int64_t(keys.size());
+    const int64_t num_chunks = (n + kRunChunkSize - 1) / kRunChunkSize;
+    auto is_run_start = [&keys, shift](int64_t i) {
+        return i == 0 || (keys[i] >> shift) != (keys[i - 1] >> shift);
+    };
+    std::vector<size_t> chunk_offsets(num_chunks + 1, 0);
+#pragma omp parallel for schedule(static)
+    for (int64_t c = 0; c < num_chunks; ++c) {
+        const int64_t end = std::min(n, (c + 1) * kRunChunkSize);
+        size_t count = 0;
+        for (int64_t i = c * kRunChunkSize; i < end; ++i) {
+            count += is_run_start(i) ? 1 : 0;
+        }
+        chunk_offsets[c + 1] = count;
+    }
+    std::partial_sum(chunk_offsets.begin(), chunk_offsets.end(),
+                     chunk_offsets.begin());
+
+    std::vector<size_t> starts(chunk_offsets.back() + 1);
+#pragma omp parallel for schedule(static)
+    for (int64_t c = 0; c < num_chunks; ++c) {
+        const int64_t end = std::min(n, (c + 1) * kRunChunkSize);
+        size_t k = chunk_offsets[c];
+        for (int64_t i = c * kRunChunkSize; i < end; ++i) {
+            if (is_run_start(i)) {
+                starts[k++] = size_t(i);
+            }
+        }
+    }
+    starts.back() = size_t(n);
+    return starts;
+}
+
+}  // namespace
+
 std::shared_ptr<OctreeNode> OctreeNode::ConstructFromJsonValue(
         const Json::Value& value) {
     // Construct node from class name
@@ -399,17 +491,7 @@ void Octree::ConvertFromPointCloud(const geometry::PointCloud& point_cloud,
 
     // Set bounds
     Clear();
-    Eigen::Array3d min_bound = point_cloud.GetMinBound();
-    Eigen::Array3d max_bound = point_cloud.GetMaxBound();
-    Eigen::Array3d center = (min_bound + max_bound) / 2;
-    Eigen::Array3d half_sizes = center - min_bound;
-    double max_half_size = half_sizes.maxCoeff();
-    origin_ = min_bound.min(center - max_half_size);
-    if (max_half_size == 0) {
-        size_ = size_expand;
-    } else {
-        size_ = max_half_size * 2 * (1 + size_expand);
-    }
+    ComputeOctreeBound(point_cloud, size_expand, origin_, size_);
 
     // Insert points
     for (size_t idx = 0; idx < point_cloud.points_.size(); idx++) {
@@ -624,5 +706,227 @@ void Octree::CreateFromVoxelGrid(const geometry::VoxelGrid& voxel_grid) {
     }
 }
 
+constexpr size_t LinearOctree::kMaxDepth;
+
+LinearOctree& LinearOctree::Clear() {
+    node_codes_.clear();
+    level_offsets_.clear();
+    child_masks_.clear();
+    first_child_.clear();
+    leaf_colors_.clear();
+    origin_.setZero();
+    size_ = 0;
+    return *this;
+}
+
+void LinearOctree::ConvertFromPointCloud(
+        const geometry::PointCloud& point_cloud, double size_expand) {
+    if (size_expand > 1 || size_expand < 0) {
+        utility::LogError("size_expand shall be between 0 and 1");
+    }
+    if (max_depth_ > kMaxDepth) {
+        utility::LogError("max_depth {} of LinearOctree exceeds {}.",
+                          max_depth_, kMaxDepth);
+    }
+
+    // Set bounds
+    Clear();
+    ComputeOctreeBound(point_cloud, size_expand, origin_, size_);
+
+    // Sort the points by the code of their leaf node. The sort is stable, so
+    // the last point of every leaf node determines its color, as with
+    // Octree::ConvertFromPointCloud.
+    const int64_t num_points = int64_t(point_cloud.points_.size());
+    std::vector<uint64_t> codes(num_points);
+    std::vector<int64_t> point_indices(num_points);
+#pragma omp parallel for schedule(static)
+    for (int64_t i = 0; i < num_points; ++i) {
+        codes[i] = ComputeLeafCode(point_cloud.points_[i], origin_, size_,
+                                   max_depth_);
+        point_indices[i] = i;
+    }
+    utility::ParallelRadixSort(codes, point_indices);
+    const size_t num_valid =
+            std::lower_bound(codes.begin(), codes.end(), kInvalidCode) -
+            codes.begin();
+    codes.resize(num_valid);
+    if (num_valid == 0) {
+        return;
+    }
+
+    // Leaf nodes.
+    std::vector<std::vector<uint64_t>> level_codes(max_depth_ + 1);
+    std::vector<std::vector<uint8_t>> level_child_masks(max_depth_);
+    std::vector<std::vector<size_t>> level_first_child(max_depth_);
+    std::vector<size_t> starts = ComputeRunStarts(codes, 0);
+    const int64_t num_leaves = int64_t(starts.size()) - 1;
+    const bool has_colors = point_cloud.HasColors();
+    level_codes[max_depth_].resize(num_leaves);
+    leaf_colors_.resize(num_leaves);
+#pragma omp parallel for schedule(static)
+    for (int64_t k = 0; k < num_leaves; ++k) {
+        level_codes[max_depth_][k] = codes[starts[k]];
+        leaf_colors_[k] =
+                has_colors
+                        ? point_cloud.colors_[point_indices[starts[k + 1] - 1]]
+                        : Eigen::Vector3d::Zero();
+    }
+    std::vector<uint64_t>().swap(codes);
+    std::vector<int64_t>().swap(point_indices);
+
+    // Internal nodes, bottom-up. The parent of a node drops the last three
+    // bits of its code, so the children of a node form a run in their level.
+    for (size_t depth = max_depth_; depth > 0; --depth) {
+        const std::vector<uint64_t>& child_codes = level_codes[depth];
+        starts = ComputeRunStarts(child_codes, 3);
+        const int64_t num_nodes = int64_t(starts.size()) - 1;
+        std::vector<uint64_t>& node_codes = level_codes[depth - 1];
+        std::vector<uint8_t>& child_masks = level_child_masks[depth - 1];
+        std::vector<size_t>& first_child = level_first_child[depth - 1];
+        node_codes.resize(num_nodes);
+        child_masks.resize(num_nodes);
+        first_child.resize(num_nodes);
+#pragma omp parallel for schedule(static)
+        for (int64_t k = 0; k < num_nodes; ++k) {
+            node_codes[k] = child_codes[starts[k]] >> 3;
+            first_child[k] = starts[k];
+            uint8_t child_mask = 0;
+            for (size_t c = starts[k]; c < starts[k + 1]; ++c) {
+                child_mask |= uint8_t(1 << (child_codes[c] & 7));
+            }
+            child_masks[k] = child_mask;
+        }
+    }
+
+    // Flatten the levels, root first.
+    level_offsets_.resize(max_depth_ + 2, 0);
+    for (size_t depth = 0; depth <= max_depth_; ++depth) {
+        level_offsets_[depth + 1] =
+                level_offsets_[depth] + level_codes[depth].size();
+    }
+    node_codes_.resize(level_offsets_[max_depth_ + 1]);
+    child_masks_.resize(level_offsets_[max_depth_]);
+    first_child_.resize(level_offsets_[max_depth_]);
+    for (size_t depth = 0; depth <= max_depth_; ++depth) {
+        const size_t offset = level_offsets_[depth];
+        std::copy(level_codes[depth].begin(), level_codes[depth].end(),
+                  node_codes_.begin() + offset);
+        if (depth == max_depth_) {
+            break;
+        }
+        std::copy(level_child_masks[depth].begin(),
+                  level_child_masks[depth].end(),
+                  child_masks_.begin() + offset);
+        const std::vector<size_t>& first_child = level_first_child[depth];
+        const size_t child_offset = level_offsets_[depth + 1];
+        const int64_t num_nodes = int64_t(first_child.size());
+#pragma omp parallel for schedule(static)
+        for (int64_t k = 0; k < num_nodes; ++k) {
+            first_child_[offset + k] = child_offset + first_child[k];
+        }
+    }
+}
+
+std::vector<int64_t> LinearOctree::LocateLeafNodes(
+        const std::vector<Eigen::Vector3d>& points) const {
+    const int64_t num_points = int64_t(points.size());
+    std::vector<int64_t> leaf_indices(num_points, -1);
+    if (IsEmpty()) {
+        return leaf_indices;
+    }
+    const size_t leaf_offset = level_offsets_[max_depth_];
+#pragma omp parallel for schedule(static)
+    for (int64_t i = 0; i < num_points; ++i) {
+        const uint64_t code =
+                ComputeLeafCode(points[i], origin_, size_, max_depth_);
+        if (code == kInvalidCode) {
+            continue;
+        }
+        // Descend from the root, the rank of a child among the existing
+        // children of its parent is its offset from the first child.
+        size_t node = 0;
+        bool found = true;
+        for (size_t depth = 0; depth < max_depth_; ++depth) {
+            const int child_index =
+                    int(code >> (3 * (max_depth_ - 1 - depth))) & 7;
+            const uint8_t child_mask = child_masks_[node];
+            if (!(child_mask & (1 << child_index))) {
+                found = false;
+                break;
+            }
+            node = first_child_[node] +
+                   std::bitset<8>(child_mask & ((1 << child_index) - 1))
+                           .count();
+        }
+        if (found) {
+            leaf_indices[i] = int64_t(node - leaf_offset);
+        }
+    }
+    return leaf_indices;
+}
+
+OctreeNodeInfo LinearOctree::GetLeafNodeInfo(size_t leaf_index) const {
+    if (leaf_index >= GetNumLeafNodes()) {
+        utility::LogError("Leaf index {} out of range [0, {}).", leaf_index,
+                          GetNumLeafNodes());
+    }
+    const uint64_t code = node_codes_[level_offsets_[max_depth_] + leaf_index];
+    const double leaf_size = size_ / double(uint32_t(1) << max_depth_);
+    const Eigen::Vector3d leaf_origin =
+            origin_ + MortonCode::Decode(code).cast<double>() * leaf_size;
+    return OctreeNodeInfo(leaf_origin, leaf_size, max_depth_, size_t(code & 7));
+}
+
+std::shared_ptr<geometry::VoxelGrid> LinearOctree::ToVoxelGrid() const {
+    auto voxel_grid = std::make_shared<geometry::VoxelGrid>();
+    voxel_grid->origin_ = origin_;
+    voxel_grid->voxel_size_ = size_ / double(uint32_t(1) << max_depth_);
+    if (IsEmpty()) {
+        return voxel_grid;
+    }
+    const size_t leaf_offset = level_offsets_[max_depth_];
+    const int64_t num_leaves = int64_t(GetNumLeafNodes());
+    std::vector<Voxel> voxels(num_leaves);
+#pragma omp parallel for schedule(static)
+    for (int64_t k = 0; k < num_leaves; ++k) {
+        voxels[k] = Voxel(MortonCode::Decode(node_codes_[leaf_offset + k]),
+                          leaf_colors_[k]);
+    }
+    voxel_grid->voxels_.reserve(num_leaves);
+    for (const Voxel& voxel : voxels) {
+        voxel_grid->AddVoxel(voxel);
+    }
+    return voxel_grid;
+}
+
+std::shared_ptr<geometry::Octree> LinearOctree::ToOctree() const {
+    auto octree =
+            std::make_shared<geometry::Octree>(max_depth_, origin_, size_);
+    if (IsEmpty()) {
+        return octree;
+    }
+    // Deeper levels are stored after shallower ones, so iterating backwards
+    // creates the children before their parents.
+    std::vector<std::shared_ptr<OctreeNode>> nodes(GetNumNodes());
+    const size_t leaf_offset = level_offsets_[max_depth_];
+    for (size_t k = leaf_offset; k < nodes.size(); ++k) {
+        auto leaf_node = std::make_shared<OctreeColorLeafNode>();
+        leaf_node->color_ = leaf_colors_[k - leaf_offset];
+        nodes[k] = leaf_node;
+    }
+    for (size_t k = leaf_offset; k-- > 0;) {
+        auto internal_node = std::make_shared<OctreeInternalNode>();
+        size_t child = first_child_[k];
+        for (size_t child_index = 0; child_index < 8; ++child_index) {
+            if (child_masks_[k] & (1 << child_index)) {
+                internal_node->children_[child_index] = nodes[child++];
+            }
+        }
+        nodes[k] = internal_node;
+    }
+    octree->root_node_ = nodes[0];
+    return octree;
+}
+
 }  // namespace geometry
 }  // namespace open3d
@@ -27,6 +27,7 @@
 #pragma once
 
 #include <cstddef>
+#include <cstdint>
 #include <memory>
 #include <vector>
 
@@ -318,5 +319,113 @@ private:
                     f_update);
 };
 
+/// \class LinearOctree
+///
+/// \brief Pointerless octree that stores its nodes in flat arrays.
+///
+/// The nodes are identified by their Morton codes: the code of a node at depth
+/// d has 3 * d bits, the i-th triple from the top being the child index of its
+/// ancestor at depth i + 1, using the child ordering of OctreeInternalNode.
+/// Nodes are stored level by level from the root, and within a level sorted by
+/// code, i.e. in the DFS order of Octree::Traverse. The children of an
+/// internal node are stored contiguously. The leaves are the nodes at depth
+/// max_depth_ and hold a color, as OctreeColorLeafNode.
+///
+/// The tree is built bottom-up in parallel and does one allocation per array
+/// instead of one per node, so it is suited for very large point clouds.
+class LinearOctree {
+public:
+    /// Maximum supported max_depth_, limited by the 63 bit Morton codes.
+    static constexpr size_t kMaxDepth = 21;
+
+    /// \brief Default Constructor.
+    LinearOctree() : origin_(0, 0, 0), size_(0), max_depth_(0) {}
+    /// \brief Parameterized Constructor.
+    ///
+    /// \param max_depth Sets the value of the max depth of the LinearOctree.
+    LinearOctree(const size_t& max_depth)
+        : origin_(0, 0, 0), size_(0), max_depth_(max_depth) {}
+    /// \brief Parameterized Constructor.
+    ///
+    /// \param max_depth Sets the value of the max depth of the LinearOctree.
+    /// \param origin Sets the global min bound of the LinearOctree.
+    /// \param size Sets the outer bounding box edge size for the whole octree.
+    LinearOctree(const size_t& max_depth,
+                 const Eigen::Vector3d& origin,
+                 const double& size)
+        : origin_(origin), size_(size), max_depth_(max_depth) {}
+    ~LinearOctree() {}
+
+public:
+    /// Remove all nodes and reset the bounds.
+    LinearOctree& Clear();
+    /// Returns true if the octree has no nodes.
+    bool IsEmpty() const { return node_codes_.empty(); }
+    /// Number of internal and leaf nodes.
+    size_t GetNumNodes() const { return node_codes_.size(); }
+    /// Number of leaf nodes.
+    size_t GetNumLeafNodes() const { return leaf_colors_.size(); }
+
+    /// \brief Build the octree from a point cloud, with the same bounds as
+    /// Octree::ConvertFromPointCloud. The color of a leaf is the color of the
+    /// last point that falls into it.
+    ///
+    /// \param point_cloud Input point cloud.
+    /// \param size_expand A small expansion size such that the octree is
+    /// slightly bigger than the original point cloud bounds to accomodate all
+    /// points.
+    void ConvertFromPointCloud(const geometry::PointCloud& point_cloud,
+                               double size_expand = 0.01);
+
+    /// \brief Returns the index of the leaf node where each query point
+    /// resides, or -1 if the point is out of bound or its leaf node does not
+    /// exist. Runs in parallel.
+    ///
+    /// \param points Coordinates of the query points.
+    std::vector<int64_t> LocateLeafNodes(
+            const std::vector<Eigen::Vector3d>& points) const;
+
+    /// \brief Returns the OctreeNodeInfo of a leaf node.
+    ///
+    /// \param leaf_index Index of the leaf node, 0 <= leaf_index <
+    /// GetNumLeafNodes().
+    OctreeNodeInfo GetLeafNodeInfo(size_t leaf_index) const;
+
+    /// Convert to VoxelGrid, with one voxel of size size_ / 2^max_depth_ per
+    /// leaf node.
+    std::shared_ptr<geometry::VoxelGrid> ToVoxelGrid() const;
+
+    /// Convert to an Octree with OctreeColorLeafNode leaves.
+    std::shared_ptr<geometry::Octree> ToOctree() const;
+
+public:
+    /// Global min bound (include). A point is within bound iff
+    /// origin_ <= point < origin_ + size_.
+    Eigen::Vector3d origin_;
+
+    /// Outer bounding box edge size for the whole octree.
+    double size_;
+
+    /// Max depth of octree, at most kMaxDepth. All leaf nodes are at this
+    /// depth.
+    size_t max_depth_;
+
+    /// Morton codes of all nodes, level by level from the root.
+    std::vector<uint64_t> node_codes_;
+
+    /// Nodes at depth d are node_codes_[level_offsets_[d]] to
+    /// node_codes_[level_offsets_[d + 1] - 1].
+    std::vector<size_t> level_offsets_;
+
+    /// For every internal node, bit i is set iff child i exists.
+    std::vector<uint8_t> child_masks_;
+
+    /// For every internal node, the node index of its first child.
+    std::vector<size_t> first_child_;
+
+    /// Color of every leaf node.
+    std::vector<Eigen::Vector3d> leaf_colors_;
+};
+
 }  // namespace geometry
 }  // namespace open3d
@@ -27,14 +27,22 @@
 #include "open3d/geometry/PointCloud.h"
 
 #include <Eigen/Dense>
+#include <limits>
+#include <map>
 #include <numeric>
+#include <string>
+#include <tuple>
 
 #include "open3d/geometry/BoundingVolume.h"
 #include "open3d/geometry/KDTreeFlann.h"
+#include "open3d/geometry/MortonCode.h"
+#include "open3d/geometry/NeighborGraph.h"
 #include "open3d/geometry/Qhull.h"
 #include "open3d/geometry/TriangleMesh.h"
+#include "open3d/geometry/VoxelGrouping.h"
 #include "open3d/utility/Console.h"
 #include "open3d/utility/Eigen.h"
+#include "open3d/utility/ParallelScan.h"
 
 namespace open3d {
 namespace geometry {
@@ -174,131 +182,74 @@ PointCloud &PointCloud::RemoveNonFinitePoints(bool remove_nan,
 
 std::shared_ptr<PointCloud> PointCloud::SelectByIndex(
         const std::vector<size_t> &indices, bool invert /* = false */) const {
-    auto output = std::make_shared<PointCloud>();
-    bool has_normals = HasNormals();
-    bool has_colors = HasColors();
-
-    std::vector<bool> mask = std::vector<bool>(points_.size(), invert);
+    std::vector<bool> mask(points_.size(), false);
     for (size_t i : indices) {
-        mask[i] = !invert;
+        mask[i] = true;
     }
+    return SelectByMask(mask, invert);
+}
 
-    for (size_t i = 0; i < points_.size(); i++) {
-        if (mask[i]) {
-            output->points_.push_back(points_[i]);
-            if (has_normals) output->normals_.push_back(normals_[i]);
-            if (has_colors) output->colors_.push_back(colors_[i]);
-        }
+std::shared_ptr<PointCloud> PointCloud::SelectByMask(
+        const std::vector<bool> &mask, bool invert /* = false */) const {
+    if (mask.size() != points_.size()) {
+        utility::LogError("[SelectByMask] mask has {} entries for {} points.",
+                          mask.size(), points_.size());
     }
+    auto output = std::make_shared<PointCloud>();
+    const bool has_normals = HasNormals();
+    const bool has_colors = HasColors();
+    utility::ParallelCompact(
+            int64_t(points_.size()),
+            [&](int64_t i) { return mask[i] != invert; },
+            [&](int64_t count) {
+                output->points_.resize(count);
+                if (has_normals) output->normals_.resize(count);
+                if (has_colors) output->colors_.resize(count);
+            },
+            [&](int64_t i, int64_t j) {
+                output->points_[j] = points_[i];
+                if (has_normals) output->normals_[j] = normals_[i];
+                if (has_colors) output->colors_[j] = colors_[i];
+            });
     utility::LogDebug(
             "Pointcloud down sampled from {:d} points to {:d} points.",
             (int)points_.size(), (int)output->points_.size());
     return output;
 }
 
-// helper classes for VoxelDownSample and VoxelDownSampleAndTrace
-namespace {
-class AccumulatedPoint {
-public:
-    AccumulatedPoint()
-        : num_of_points_(0),
-          point_(0.0, 0.0, 0.0),
-          normal_(0.0, 0.0, 0.0),
-          color_(0.0, 0.0, 0.0) {}
-
-public:
-    void AddPoint(const PointCloud &cloud, int index) {
-        point_ += cloud.points_[index];
-        if (cloud.HasNormals()) {
-            if (!std::isnan(cloud.normals_[index](0)) &&
-                !std::isnan(cloud.normals_[index](1)) &&
-                !std::isnan(cloud.normals_[index](2))) {
-                normal_ += cloud.normals_[index];
-            }
-        }
-        if (cloud.HasColors()) {
-            color_ += cloud.colors_[index];
-        }
-        num_of_points_++;
+std::vector<size_t> PointCloud::SortByMortonCode() {
+    if (points_.empty()) {
+        return {};
     }
+    const int64_t num_points = static_cast<int64_t>(points_.size());
+    const std::vector<int64_t> order =
+            MortonCode::ComputeOrder(points_.data()->data(), num_points);
+    std::vector<size_t> permutation(order.begin(), order.end());
 
-    Eigen::Vector3d GetAveragePoint() const {
-        return point_ / double(num_of_points_);
-    }
-
-    Eigen::Vector3d GetAverageNormal() const {
-        // Call NormalizeNormals() afterwards if necessary
-        return normal_ / double(num_of_points_);
-    }
-
-    Eigen::Vector3d GetAverageColor() const {
-        return color_ / double(num_of_points_);
-    }
-
-public:
-    int num_of_points_;
-    Eigen::Vector3d point_;
-    Eigen::Vector3d normal_;
-    Eigen::Vector3d color_;
-};
-
-class point_cubic_id {
-public:
-    size_t point_id;
-    int cubic_id;
-};
-
-class AccumulatedPointForTrace : public AccumulatedPoint {
-public:
-    void AddPoint(const PointCloud &cloud,
-                  size_t index,
-                  int cubic_index,
-                  bool approximate_class) {
-        point_ += cloud.points_[index];
-        if (cloud.HasNormals()) {
-            if (!std::isnan(cloud.normals_[index](0)) &&
-                !std::isnan(cloud.normals_[index](1)) &&
-                !std::isnan(cloud.normals_[index](2))) {
-                normal_ += cloud.normals_[index];
-            }
-        }
-        if (cloud.HasColors()) {
-            if (approximate_class) {
-                auto got = classes.find(int(cloud.colors_[index][0]));
-                if (got == classes.end())
-                    classes[int(cloud.colors_[index][0])] = 1;
-                else
-                    classes[int(cloud.colors_[index][0])] += 1;
-            } else {
-                color_ += cloud.colors_[index];
-            }
-        }
-        point_cubic_id new_id;
-        new_id.point_id = index;
-        new_id.cubic_id = cubic_index;
-        original_id.push_back(new_id);
-        num_of_points_++;
-    }
-
-    Eigen::Vector3d GetMaxClass() {
-        int max_class = -1;
-        int max_count = -1;
-        for (auto it = classes.begin(); it != classes.end(); it++) {
-            if (it->second > max_count) {
-                max_count = it->second;
-                max_class = it->first;
-            }
+    auto reorder = [&](std::vector<Eigen::Vector3d> &values) {
+        std::vector<Eigen::Vector3d> sorted(values.size());
+#pragma omp parallel for schedule(static)
+        for (int64_t i = 0; i < num_points; ++i) {
+            sorted[i] = values[order[i]];
         }
-        return Eigen::Vector3d(max_class, max_class, max_class);
+        values.swap(sorted);
+    };
+    reorder(points_);
+    if (HasNormals()) {
+        reorder(normals_);
     }
+    if (HasColors()) {
+        reorder(colors_);
+    }
+    return permutation;
+}
 
-    std::vector<point_cubic_id> GetOriginalID() { return original_id; }
-
-private:
-    // original point cloud id in higher resolution + its cubic id
-    std::vector<point_cubic_id> original_id;
-    std::unordered_map<int, int> classes;
-};
+// helpers for VoxelDownSample and VoxelDownSampleAndTrace
+namespace {
+bool IsValidNormal(const Eigen::Vector3d &normal) {
+    return !std::isnan(normal(0)) && !std::isnan(normal(1)) &&
+           !std::isnan(normal(2));
+}
 }  // namespace
 
 std::shared_ptr<PointCloud> PointCloud::VoxelDownSample(
@@ -315,27 +266,46 @@ std::shared_ptr<PointCloud> PointCloud::VoxelDownSample(
         (voxel_max_bound - voxel_min_bound).maxCoeff()) {
         utility::LogError("[VoxelDownSample] voxel_size is too small.");
     }
-    std::unordered_map<Eigen::Vector3i, AccumulatedPoint,
-                       utility::hash_eigen<Eigen::Vector3i>>
-            voxelindex_to_accpoint;
+    std::vector<int64_t> sorted_points, voxel_starts;
+    VoxelGrouping::GroupPointsByVoxel(
+            VoxelGrouping::ComputeVoxelIndices(points_, voxel_min_bound,
+                                               voxel_size),
+            sorted_points, voxel_starts);
 
-    Eigen::Vector3d ref_coord;
-    Eigen::Vector3i voxel_index;
-    for (int i = 0; i < (int)points_.size(); i++) {
-        ref_coord = (points_[i] - voxel_min_bound) / voxel_size;
-        voxel_index << int(floor(ref_coord(0))), int(floor(ref_coord(1))),
-                int(floor(ref_coord(2)));
-        voxelindex_to_accpoint[voxel_index].AddPoint(*this, i);
-    }
+    const int64_t num_voxels = int64_t(voxel_starts.size()) - 1;
     bool has_normals = HasNormals();
     bool has_colors = HasColors();
-    for (auto accpoint : voxelindex_to_accpoint) {
-        output->points_.push_back(accpoint.second.GetAveragePoint());
+    output->points_.resize(num_voxels);
+    if (has_normals) {
+        output->normals_.resize(num_voxels);
+    }
+    if (has_colors) {
+        output->colors_.resize(num_voxels);
+    }
+#pragma omp parallel for schedule(static)
+    for (int64_t v = 0; v < num_voxels; v++) {
+        Eigen::Vector3d point(0.0, 0.0, 0.0);
+        Eigen::Vector3d normal(0.0, 0.0, 0.0);
+        Eigen::Vector3d color(0.0, 0.0, 0.0);
+        for (int64_t j = voxel_starts[v]; j < voxel_starts[v + 1]; j++) {
+            const int64_t index = sorted_points[j];
+            point += points_[index];
+            if (has_normals && IsValidNormal(normals_[index])) {
+                normal += normals_[index];
+            }
+            if (has_colors) {
+                color += colors_[index];
+            }
+        }
+        // Normals are averaged without normalization, call NormalizeNormals()
+        // afterwards if necessary.
+        const double num_points = double(voxel_starts[v + 1] - voxel_starts[v]);
+        output->points_[v] = point / num_points;
         if (has_normals) {
-            output->normals_.push_back(accpoint.second.GetAverageNormal());
+            output->normals_[v] = normal / num_points;
         }
         if (has_colors) {
-            output->colors_.push_back(accpoint.second.GetAverageColor());
+            output->colors_[v] = color / num_points;
         }
     }
     utility::LogDebug(
@@ -364,51 +334,79 @@ PointCloud::VoxelDownSampleAndTrace(double voxel_size,
         (voxel_max_bound - voxel_min_bound).maxCoeff()) {
         utility::LogError("[VoxelDownSample] voxel_size is too small.");
     }
-    std::unordered_map<Eigen::Vector3i, AccumulatedPointForTrace,
-                       utility::hash_eigen<Eigen::Vector3i>>
-            voxelindex_to_accpoint;
-    int cid_temp[3] = {1, 2, 4};
-    for (size_t i = 0; i < points_.size(); i++) {
-        auto ref_coord = (points_[i] - voxel_min_bound) / voxel_size;
-        auto voxel_index = Eigen::Vector3i(int(floor(ref_coord(0))),
-                                           int(floor(ref_coord(1))),
-                                           int(floor(ref_coord(2))));
-        int cid = 0;
-        for (int c = 0; c < 3; c++) {
-            if ((ref_coord(c) - voxel_index(c)) >= 0.5) {
-                cid += cid_temp[c];
-            }
-        }
-        voxelindex_to_accpoint[voxel_index].AddPoint(*this, i, cid,
-                                                     approximate_class);
-    }
+    const std::vector<Eigen::Vector3i> voxel_indices =
+            VoxelGrouping::ComputeVoxelIndices(points_, voxel_min_bound,
+                                               voxel_size);
+    std::vector<int64_t> sorted_points, voxel_starts;
+    VoxelGrouping::GroupPointsByVoxel(voxel_indices, sorted_points,
+                                      voxel_starts);
+
+    const int64_t num_voxels = int64_t(voxel_starts.size()) - 1;
     bool has_normals = HasNormals();
     bool has_colors = HasColors();
-    int cnt = 0;
-    cubic_id.resize(voxelindex_to_accpoint.size(), 8);
+    output->points_.resize(num_voxels);
+    if (has_normals) {
+        output->normals_.resize(num_voxels);
+    }
+    if (has_colors) {
+        output->colors_.resize(num_voxels);
+    }
+    cubic_id.resize(num_voxels, 8);
     cubic_id.setConstant(-1);
-    std::vector<std::vector<int>> original_indices(
-            voxelindex_to_accpoint.size());
-    for (auto accpoint : voxelindex_to_accpoint) {
-        output->points_.push_back(accpoint.second.GetAveragePoint());
+    std::vector<std::vector<int>> original_indices(num_voxels);
+    int cid_temp[3] = {1, 2, 4};
+#pragma omp parallel for schedule(static)
+    for (int64_t v = 0; v < num_voxels; v++) {
+        Eigen::Vector3d point(0.0, 0.0, 0.0);
+        Eigen::Vector3d normal(0.0, 0.0, 0.0);
+        Eigen::Vector3d color(0.0, 0.0, 0.0);
+        std::map<int, int> classes;
+        for (int64_t j = voxel_starts[v]; j < voxel_starts[v + 1]; j++) {
+            const int64_t index = sorted_points[j];
+            point += points_[index];
+            if (has_normals && IsValidNormal(normals_[index])) {
+                normal += normals_[index];
+            }
+            if (has_colors) {
+                if (approximate_class) {
+                    classes[int(colors_[index][0])]++;
+                } else {
+                    color += colors_[index];
+                }
+            }
+            Eigen::Vector3d ref_coord =
+                    (points_[index] - voxel_min_bound) / voxel_size;
+            int cid = 0;
+            for (int c = 0; c < 3; c++) {
+                if ((ref_coord(c) - voxel_indices[index](c)) >= 0.5) {
+                    cid += cid_temp[c];
+                }
+            }
+            cubic_id(v, cid) = int(index);
+            original_indices[v].push_back(int(index));
+        }
+        const double num_points = double(voxel_starts[v + 1] - voxel_starts[v]);
+        output->points_[v] = point / num_points;
         if (has_normals) {
-            output->normals_.push_back(accpoint.second.GetAverageNormal());
+            output->normals_[v] = normal / num_points;
         }
         if (has_colors) {
             if (approximate_class) {
-                output->colors_.push_back(accpoint.second.GetMaxClass());
+                // Most frequent class, the smallest one in case of a tie.
+                int max_class = -1;
+                int max_count = -1;
+                for (const auto &class_count : classes) {
+                    if (class_count.second > max_count) {
+                        max_count = class_count.second;
+                        max_class = class_count.first;
+                    }
+                }
+                output->colors_[v] =
+                        Eigen::Vector3d(max_class, max_class, max_class);
             } else {
-                output->colors_.push_back(accpoint.second.GetAverageColor());
+                output->colors_[v] = color / num_points;
             }
         }
-        auto original_id = accpoint.second.GetOriginalID();
-        for (int i = 0; i < (int)original_id.size(); i++) {
-            size_t pid = original_id[i].point_id;
-            int cid = original_id[i].cubic_id;
-            cubic_id(cnt, cid) = int(pid);
-            original_indices[cnt].push_back(int(pid));
-        }
-        cnt++;
     }
     utility::LogDebug(
             "Pointcloud down sampled from {:d} points to {:d} points.",
@@ -448,22 +446,37 @@ std::shared_ptr<PointCloud> PointCloud::Crop(
 }
 
 std::tuple<std::shared_ptr<PointCloud>, std::vector<size_t>>
-PointCloud::RemoveRadiusOutliers(size_t nb_points, double search_radius) const {
+PointCloud::RemoveRadiusOutliers(
+        size_t nb_points,
+        double search_radius,
+        const std::shared_ptr<NeighborGraph> neighbor_graph
+        /* = nullptr */) const {
     if (nb_points < 1 || search_radius <= 0) {
         utility::LogError(
                 "[RemoveRadiusOutliers] Illegal input parameters,"
                 "number of points and radius must be positive");
     }
+    const KDTreeSearchParamRadius search_param(search_radius);
     KDTreeFlann kdtree;
-    kdtree.SetGeometry(*this);
-    std::vector<bool> mask = std::vector<bool>(points_.size());
+    if (neighbor_graph) {
+        neighbor_graph->AssertCovers(points_.size(), search_param,
+                                     "RemoveRadiusOutliers");
+    } else {
+        kdtree.SetGeometry(*this);
+    }
+    std::vector<uint8_t> mask(points_.size());
 #pragma omp parallel for schedule(static)
     for (int i = 0; i < int(points_.size()); i++) {
-        std::vector<int> tmp_indices;
-        std::vector<double> dist;
-        size_t nb_neighbors = kdtree.SearchRadius(points_[i], search_radius,
-                                                  tmp_indices, dist);
-        mask[i] = (nb_neighbors > nb_points);
+        int nb_neighbors;
+        if (neighbor_graph) {
+            nb_neighbors = neighbor_graph->CountNeighbors(i, search_param);
+        } else {
+            std::vector<int> tmp_indices;
+            std::vector<double> dist;
+            nb_neighbors = kdtree.SearchRadius(points_[i], search_radius,
+                                               tmp_indices, dist);
+        }
+        mask[i] = (nb_neighbors > int(nb_points));
     }
     std::vector<size_t> indices;
     for (size_t i = 0; i < mask.size(); i++) {
@@ -475,8 +488,11 @@ PointCloud::RemoveRadiusOutliers(size_t nb_points, double search_radius) const {
 }
 
 std::tuple<std::shared_ptr<PointCloud>, std::vector<size_t>>
-PointCloud::RemoveStatisticalOutliers(size_t nb_neighbors,
-                                      double std_ratio) const {
+PointCloud::RemoveStatisticalOutliers(
+        size_t nb_neighbors,
+        double std_ratio,
+        const std::shared_ptr<NeighborGraph> neighbor_graph
+        /* = nullptr */) const {
     if (nb_neighbors < 1 || std_ratio <= 0) {
         utility::LogError(
                 "[RemoveStatisticalOutliers] Illegal input parameters, number "
@@ -486,17 +502,27 @@ PointCloud::RemoveStatisticalOutliers(size_t nb_neighbors,
         return std::make_tuple(std::make_shared<PointCloud>(),
                                std::vector<size_t>());
     }
+    const KDTreeSearchParamKNN search_param(static_cast<int>(nb_neighbors));
     KDTreeFlann kdtree;
-    kdtree.SetGeometry(*this);
+    if (neighbor_graph) {
+        neighbor_graph->AssertCovers(points_.size(), search_param,
+                                     "RemoveStatisticalOutliers");
+    } else {
+        kdtree.SetGeometry(*this);
+    }
     std::vector<double> avg_distances = std::vector<double>(points_.size());
     std::vector<size_t> indices;
     size_t valid_distances = 0;
 
-#pragma omp parallel for schedule(static)
+#pragma omp parallel for schedule(static) reduction(+ : valid_distances)
     for (int i = 0; i < int(points_.size()); i++) {
         std::vector<int> tmp_indices;
         std::vector<double> dist;
-        kdtree.SearchKNN(points_[i], int(nb_neighbors), tmp_indices, dist);
+        if (neighbor_graph) {
+            neighbor_graph->GetNeighbors(i, search_param, tmp_indices, dist);
+        } else {
+            kdtree.SearchKNN(points_[i], int(nb_neighbors), tmp_indices, dist);
+        }
         double mean = -1.0;
         if (dist.size() > 0u) {
             valid_distances++;
@@ -556,18 +582,31 @@ std::vector<double> PointCloud::ComputeMahalanobisDistance() const {
     return mahalanobis;
 }
 
-std::vector<double> PointCloud::ComputeNearestNeighborDistance() const {
+std::vector<double> PointCloud::ComputeNearestNeighborDistance(
+        const std::shared_ptr<NeighborGraph> neighbor_graph
+        /* = nullptr */) const {
     if (points_.size() < 2) {
         return std::vector<double>(points_.size(), 0);
     }
 
+    const KDTreeSearchParamKNN search_param(2);
     std::vector<double> nn_dis(points_.size());
-    KDTreeFlann kdtree(*this);
+    KDTreeFlann kdtree;
+    if (neighbor_graph) {
+        neighbor_graph->AssertCovers(points_.size(), search_param,
+                                     "ComputeNearestNeighborDistance");
+    } else {
+        kdtree.SetGeometry(*this);
+    }
 #pragma omp parallel for schedule(static)
     for (int i = 0; i < (int)points_.size(); i++) {
         std::vector<int> indices(2);
         std::vector<double> dists(2);
-        if (kdtree.SearchKNN(points_[i], 2, indices, dists) <= 1) {
+        const int k = neighbor_graph
+                              ? neighbor_graph->GetNeighbors(i, search_param,
+                                                             indices, dists)
+                              : kdtree.SearchKNN(points_[i], 2, indices, dists);
+        if (k <= 1) {
             utility::LogDebug(
                     "[ComputePointCloudNearestNeighborDistance] Found a point "
                     "without neighbors.");
@@ -584,6 +623,75 @@ PointCloud::ComputeConvexHull() const {
     return Qhull::ComputeConvexHull(points_);
 }
 
+namespace {
+
+/// Spherical flipping of \p points around \p camera_location, followed by
+/// the camera location itself at the origin.
+std::vector<Eigen::Vector3d> SphericalProjection(
+        const std::vector<Eigen::Vector3d> &points,
+        const Eigen::Vector3d &camera_location,
+        double radius) {
+    std::vector<Eigen::Vector3d> spherical_projection(points.size() + 1);
+#pragma omp parallel for schedule(static)
+    for (int64_t pidx = 0; pidx < int64_t(points.size()); ++pidx) {
+        Eigen::Vector3d projected_point = points[pidx] - camera_location;
+        double norm = projected_point.norm();
+        spherical_projection[pidx] =
+                projected_point + 2 * (radius - norm) * projected_point / norm;
+    }
+    spherical_projection.back() = Eigen::Vector3d(0, 0, 0);
+    return spherical_projection;
+}
+
+/// Visibility of \p points from \p camera_location with a cube map depth
+/// buffer of \p resolution x \p resolution pixels per face. \p depth is
+/// reused across calls.
+void ComputeZBufferVisibility(const std::vector<Eigen::Vector3d> &points,
+                              const Eigen::Vector3d &camera_location,
+                              int resolution,
+                              double depth_tolerance,
+                              std::vector<double> &depth,
+                              std::vector<bool> &visible) {
+    // Pixel of the cube map and depth along the axis of its face of a point,
+    // -1 if the point is at the camera location.
+    auto project = [&](const Eigen::Vector3d &point, double &z) {
+        const Eigen::Vector3d d = point - camera_location;
+        int axis;
+        z = d.cwiseAbs().maxCoeff(&axis);
+        if (z <= 0) {
+            return int64_t(-1);
+        }
+        const int face = 2 * axis + (d(axis) < 0 ? 1 : 0);
+        auto pixel = [&](double x) {
+            return std::min(resolution - 1,
+                            std::max(0, int((x / z + 1) / 2 * resolution)));
+        };
+        const int u = pixel(d((axis + 1) % 3));
+        const int v = pixel(d((axis + 2) % 3));
+        return (int64_t(face) * resolution + v) * resolution + u;
+    };
+
+    depth.assign(6 * size_t(resolution) * resolution,
+                 std::numeric_limits<double>::infinity());
+    for (const Eigen::Vector3d &point : points) {
+        double z;
+        const int64_t pixel = project(point, z);
+        if (pixel >= 0) {
+            depth[pixel] = std::min(depth[pixel], z);
+        }
+    }
+    visible.assign(points.size(), true);
+    for (size_t pidx = 0; pidx < points.size(); ++pidx) {
+        double z;
+        const int64_t pixel = project(points[pidx], z);
+        if (pixel >= 0) {
+            visible[pidx] = z <= (1 + depth_tolerance) * depth[pixel];
+        }
+    }
+}
+
+}  // namespace
+
 std::tuple<std::shared_ptr<TriangleMesh>, std::vector<size_t>>
 PointCloud::HiddenPointRemoval(const Eigen::Vector3d &camera_location,
                                const double radius) const {
@@ -592,18 +700,10 @@ PointCloud::HiddenPointRemoval(const Eigen::Vector3d &camera_location,
                 "[HiddenPointRemoval] radius must be larger than zero.");
     }
 
-    // perform spherical projection
-    std::vector<Eigen::Vector3d> spherical_projection;
-    for (size_t pidx = 0; pidx < points_.size(); ++pidx) {
-        Eigen::Vector3d projected_point = points_[pidx] - camera_location;
-        double norm = projected_point.norm();
-        spherical_projection.push_back(
-                projected_point + 2 * (radius - norm) * projected_point / norm);
-    }
-
-    // add origin
-    size_t origin_pidx = spherical_projection.size();
-    spherical_projection.push_back(Eigen::Vector3d(0, 0, 0));
+    // perform spherical projection, with the origin added last
+    std::vector<Eigen::Vector3d> spherical_projection =
+            SphericalProjection(points_, camera_location, radius);
+    size_t origin_pidx = points_.size();
 
     // calculate convex hull of spherical projection
     std::shared_ptr<TriangleMesh> visible_mesh;
@@ -646,5 +746,65 @@ PointCloud::HiddenPointRemoval(const Eigen::Vector3d &camera_location,
     return std::make_tuple(visible_mesh, pt_map);
 }
 
+std::vector<std::vector<bool>> PointCloud::ComputePointVisibility(
+        const std::vector<Eigen::Vector3d> &camera_locations,
+        double radius,
+        VisibilityMethod method /* = VisibilityMethod::HiddenPointRemoval */,
+        int resolution /* = 256 */,
+        double depth_tolerance /* = 0.01 */) const {
+    if (method == VisibilityMethod::HiddenPointRemoval && radius <= 0) {
+        utility::LogError(
+                "[ComputePointVisibility] radius must be larger than zero.");
+    }
+    if (method == VisibilityMethod::ZBuffer && resolution <= 0) {
+        utility::LogError(
+                "[ComputePointVisibility] resolution must be larger than "
+                "zero.");
+    }
+
+    std::vector<std::vector<bool>> visibility(camera_locations.size());
+    std::string error;
+#pragma omp parallel
+    {
+        std::vector<double> depth;
+#pragma omp for schedule(dynamic)
+        for (int64_t cidx = 0; cidx < int64_t(camera_locations.size());
+             ++cidx) {
+            std::vector<bool> &visible = visibility[cidx];
+            if (method == VisibilityMethod::ZBuffer) {
+                ComputeZBufferVisibility(points_, camera_locations[cidx],
+                                         resolution, depth_tolerance, depth,
+                                         visible);
+                continue;
+            }
+            // An exception must not escape the parallel region, the first
+            // error is reported after it.
+            try {
+                std::vector<size_t> pt_map;
+                std::tie(std::ignore, pt_map) =
+                        Qhull::ComputeConvexHull(SphericalProjection(
+                                points_, camera_locations[cidx], radius));
+                visible.assign(points_.size(), false);
+                for (size_t pidx : pt_map) {
+                    if (pidx < points_.size()) {
+                        visible[pidx] = true;
+                    }
+                }
+            } catch (const std::exception &e) {
+#pragma omp critical
+                {
+                    if (error.empty()) {
+                        error = e.what();
+                    }
+                }
+            }
+        }
+    }
+    if (!error.empty()) {
+        utility::LogError("[ComputePointVisibility] {}", error);
+    }
+    return visibility;
+}
+
 }  // namespace geometry
 }  // namespace open3d
@@ -43,6 +43,7 @@ class PinholeCameraIntrinsic;
 namespace geometry {
 
 class Image;
+class NeighborGraph;
 class RGBDImage;
 class TriangleMesh;
 class VoxelGrid;
@@ -53,6 +54,18 @@ class VoxelGrid;
 /// colors and point normals.
 class PointCloud : public Geometry3D {
 public:
+    /// \enum VisibilityMethod
+    ///
+    /// \brief Method of ComputePointVisibility.
+    enum class VisibilityMethod {
+        /// Hidden Point Removal operator, with a convex hull per camera
+        /// location as in HiddenPointRemoval.
+        HiddenPointRemoval,
+        /// Approximation with a cube map depth buffer around every camera
+        /// location.
+        ZBuffer,
+    };
+
     /// \brief Default Constructor.
     PointCloud() : Geometry3D(Geometry::GeometryType::PointCloud) {}
     /// \brief Parameterized Constructor.
@@ -130,10 +143,35 @@ public:
     std::shared_ptr<PointCloud> SelectByIndex(
             const std::vector<size_t> &indices, bool invert = false) const;
 
+    /// \brief Function to select points from \p input pointcloud into
+    /// \p output pointcloud.
+    ///
+    /// Points with a true entry in \p mask are selected, in order. Points,
+    /// normals and colors are copied in one parallel pass.
+    ///
+    /// \param mask Mask of points to be selected, one entry per point.
+    /// \param invert Set to `True` to invert the selection.
+    std::shared_ptr<PointCloud> SelectByMask(const std::vector<bool> &mask,
+                                             bool invert = false) const;
+
+    /// \brief Reorder points, normals and colors along a Morton (Z-order)
+    /// curve, so that points close in space are close in memory.
+    ///
+    /// Nearest neighbor queries, normal estimation and correspondence search
+    /// iterate over points in storage order, so running them on a sorted
+    /// point cloud gives fewer cache misses than sensor order.
+    ///
+    /// \return Permutation such that the i-th point of the sorted point cloud
+    /// is the permutation[i]-th point of the original point cloud.
+    std::vector<size_t> SortByMortonCode();
+
     /// \brief Function to downsample input pointcloud into output pointcloud
     /// with a voxel.
     ///
-    /// Normals and colors are averaged if they exist.
+    /// Normals and colors are averaged if they exist. Points are grouped by
+    /// voxel with a parallel radix sort, output points are ordered by voxel
+    /// index, so the output is deterministic and does not depend on the number
+    /// of threads.
     ///
     /// \param voxel_size Defines the resolution of the voxel grid,
     /// smaller value leads to denser output point cloud.
@@ -141,7 +179,8 @@ public:
 
     /// \brief Function to downsample using geometry.PointCloud.VoxelDownSample
     ///
-    /// Also records point cloud index before downsampling.
+    /// Also records point cloud index before downsampling. Output points are
+    /// ordered by voxel index, as in VoxelDownSample.
     ///
     /// \param voxel_size Voxel size to downsample into.
     /// \param min_bound Minimum coordinate of voxel boundaries
@@ -186,16 +225,28 @@ public:
     ///
     /// \param nb_points Number of points within the radius.
     /// \param search_radius Radius of the sphere.
+    /// \param neighbor_graph Optional NeighborGraph of the point cloud,
+    /// covering radius search with \p search_radius, used instead of
+    /// searching a KDTree.
     std::tuple<std::shared_ptr<PointCloud>, std::vector<size_t>>
-    RemoveRadiusOutliers(size_t nb_points, double search_radius) const;
+    RemoveRadiusOutliers(size_t nb_points,
+                         double search_radius,
+                         const std::shared_ptr<NeighborGraph> neighbor_graph =
+                                 nullptr) const;
 
     /// \brief Function to remove points that are further away from their
     /// \p nb_neighbor neighbors in average.
     ///
     /// \param nb_neighbors Number of neighbors around the target point.
     /// \param std_ratio Standard deviation ratio.
+    /// \param neighbor_graph Optional NeighborGraph of the point cloud,
+    /// covering KNN search with \p nb_neighbors, used instead of searching a
+    /// KDTree.
     std::tuple<std::shared_ptr<PointCloud>, std::vector<size_t>>
-    RemoveStatisticalOutliers(size_t nb_neighbors, double std_ratio) const;
+    RemoveStatisticalOutliers(size_t nb_neighbors,
+                              double std_ratio,
+                              const std::shared_ptr<NeighborGraph>
+                                      neighbor_graph = nullptr) const;
 
     /// \brief Function to compute the normals of a point cloud.
     ///
@@ -206,9 +257,12 @@ public:
     /// search. \param fast_normal_computation If true, the normal estiamtion
     /// uses a non-iterative method to extract the eigenvector from the
     /// covariance matrix. This is faster, but is not as numerical stable.
+    /// \param neighbor_graph Optional NeighborGraph of the point cloud,
+    /// covering \p search_param, used instead of searching a KDTree.
     void EstimateNormals(
             const KDTreeSearchParam &search_param = KDTreeSearchParamKNN(),
-            bool fast_normal_computation = true);
+            bool fast_normal_computation = true,
+            const std::shared_ptr<NeighborGraph> neighbor_graph = nullptr);
 
     /// \brief Function to orient the normals of a point cloud.
     ///
@@ -229,9 +283,16 @@ public:
     /// consistent tangent planes as described in Hoppe et al., "Surface
     /// Reconstruction from Unorganized Points", 1992.
     ///
+    /// The Riemannian graph is built in parallel, and its minimum spanning
+    /// tree is extracted with the Filter-Kruskal algorithm and a parallel
+    /// sort. Each connected component is traversed from its highest point.
+    ///
     /// \param k k nearest neighbour for graph reconstruction for normal
     /// propagation.
-    void OrientNormalsConsistentTangentPlane(size_t k);
+    /// \param print_progress If `true` the progress is visualized in the
+    /// console.
+    void OrientNormalsConsistentTangentPlane(size_t k,
+                                             bool print_progress = false);
 
     /// \brief Function to compute the point to point distances between point
     /// clouds.
@@ -253,9 +314,15 @@ public:
     /// See: https://en.wikipedia.org/wiki/Mahalanobis_distance
     std::vector<double> ComputeMahalanobisDistance() const;
 
-    /// Function to compute the distance from a point to its nearest neighbor in
-    /// the input point cloud
-    std::vector<double> ComputeNearestNeighborDistance() const;
+    /// \brief Function to compute the distance from a point to its nearest
+    /// neighbor in the input point cloud.
+    ///
+    /// \param neighbor_graph Optional NeighborGraph of the point cloud,
+    /// covering KNN search with 2 neighbors, used instead of searching a
+    /// KDTree.
+    std::vector<double> ComputeNearestNeighborDistance(
+            const std::shared_ptr<NeighborGraph> neighbor_graph =
+                    nullptr) const;
 
     /// Function that computes the convex hull of the point cloud using qhull
     std::tuple<std::shared_ptr<TriangleMesh>, std::vector<size_t>>
@@ -274,34 +341,123 @@ public:
     HiddenPointRemoval(const Eigen::Vector3d &camera_location,
                        const double radius) const;
 
+    /// \brief Function to compute which points are visible from each of many
+    /// camera locations, in parallel over the camera locations.
+    ///
+    /// With VisibilityMethod::HiddenPointRemoval, a point is visible if it is
+    /// kept by HiddenPointRemoval. With VisibilityMethod::ZBuffer, the points
+    /// are projected on the six faces of a cube map around the camera
+    /// location, each a pinhole camera with a 90 degree field of view as
+    /// used by CreateFromDepthImage, and a point is visible if its depth is
+    /// at most (1 + \p depth_tolerance) times the smallest depth in its
+    /// pixel. The resolution should be low enough for the
+    /// points to cover the pixels, otherwise hidden points are seen through
+    /// the gaps.
+    ///
+    /// \param camera_locations Camera locations.
+    /// \param radius The radius of the spherical projection of
+    /// VisibilityMethod::HiddenPointRemoval.
+    /// \param method Visibility method.
+    /// \param resolution Width and height in pixels of every face of the cube
+    /// map of VisibilityMethod::ZBuffer.
+    /// \param depth_tolerance Relative depth tolerance of
+    /// VisibilityMethod::ZBuffer.
+    /// \return One visibility mask per camera location, with one entry per
+    /// point.
+    std::vector<std::vector<bool>> ComputePointVisibility(
+            const std::vector<Eigen::Vector3d> &camera_locations,
+            double radius,
+            VisibilityMethod method = VisibilityMethod::HiddenPointRemoval,
+            int resolution = 256,
+            double depth_tolerance = 0.01) const;
+
     /// \brief Cluster PointCloud using the DBSCAN algorithm
     /// Ester et al., "A Density-Based Algorithm for Discovering Clusters
     /// in Large Spatial Databases with Noise", 1996
     ///
     /// Returns a list of point labels, -1 indicates noise according to
-    /// the algorithm.
+    /// the algorithm. Clusters are numbered in the order of their first core
+    /// point, and a border point gets the smallest label among the clusters
+    /// it is reachable from.
+    ///
+    /// Points are bucketed in a grid of cells with a diagonal shorter than
+    /// \p eps, core points are found and connected with a concurrent
+    /// union-find in parallel, and neighbors are never stored. If a
+    /// NeighborGraph is given, the neighbors are read from it instead.
     ///
     /// \param eps Density parameter that is used to find neighbouring points.
     /// \param min_points Minimum number of points to form a cluster.
     /// \param print_progress If `true` the progress is visualized in the
     /// console.
+    /// \param neighbor_graph Optional NeighborGraph of the point cloud,
+    /// covering radius search with \p eps.
     std::vector<int> ClusterDBSCAN(double eps,
                                    size_t min_points,
-                                   bool print_progress = false) const;
+                                   bool print_progress = false,
+                                   const std::shared_ptr<NeighborGraph>
+                                           neighbor_graph = nullptr) const;
 
     /// \brief Segment PointCloud plane using the RANSAC algorithm.
     ///
+    /// RANSAC iterations are evaluated in parallel, in batches of fixed size.
+    /// After every batch, the number of iterations is reduced to the number
+    /// needed to sample an all-inlier set with the given probability, for the
+    /// best inlier ratio found so far.
+    ///
     /// \param distance_threshold Max distance a point can be from the plane
     /// model, and still be considered an inlier.
     /// \param ransac_n Number of initial points to be considered inliers in
     /// each iteration.
-    /// \param num_iterations Number of iterations.
+    /// \param num_iterations Maximum number of iterations.
+    /// \param probability Expected probability of finding the optimal plane,
+    /// in (0, 1]. Set to 1 to always run num_iterations iterations.
+    /// \param preemptive_sample_size If positive, every plane hypothesis is
+    /// first scored on a random subset of this many points, and only scored on
+    /// all points if it does at least as well on the subset as the best plane
+    /// so far. 0 disables preemptive scoring.
+    /// \param seed Sets the seed value used in the random generator, set to -1
+    /// to use a random seed value with each function call. The result does not
+    /// depend on the number of threads.
     /// \return Returns the plane model ax + by + cz + d = 0 and the indices of
     /// the plane inliers.
     std::tuple<Eigen::Vector4d, std::vector<size_t>> SegmentPlane(
             const double distance_threshold = 0.01,
             const int ransac_n = 3,
-            const int num_iterations = 100) const;
+            const int num_iterations = 100,
+            const double probability = 0.99999999,
+            const size_t preemptive_sample_size = 0,
+            int seed = -1) const;
+
+    /// \brief Segment up to \p num_planes planes, one after the other, with
+    /// the RANSAC algorithm of SegmentPlane.
+    ///
+    /// Inliers of a plane are removed before segmenting the next one.
+    /// Segmentation stops early when a plane has fewer than \p min_num_inliers
+    /// inliers.
+    ///
+    /// \param num_planes Maximum number of planes.
+    /// \param distance_threshold Max distance a point can be from the plane
+    /// model, and still be considered an inlier.
+    /// \param ransac_n Number of initial points to be considered inliers in
+    /// each iteration.
+    /// \param num_iterations Maximum number of iterations per plane.
+    /// \param probability Expected probability of finding the optimal plane.
+    /// \param min_num_inliers Minimum number of inliers of a plane.
+    /// \param preemptive_sample_size Size of the subset used for preemptive
+    /// scoring, 0 to disable it.
+    /// \param seed Sets the seed value used in the random generator, set to -1
+    /// to use a random seed value with each function call.
+    /// \return Returns the plane models and the indices of their inliers, in
+    /// the order of extraction.
+    std::vector<std::tuple<Eigen::Vector4d, std::vector<size_t>>> SegmentPlanes(
+            const size_t num_planes,
+            const double distance_threshold = 0.01,
+            const int ransac_n = 3,
+            const int num_iterations = 100,
+            const double probability = 0.99999999,
+            const size_t min_num_inliers = 3,
+            const size_t preemptive_sample_size = 0,
+            int seed = -1) const;
 
     /// \brief Factory function to create a pointcloud from a depth image and a
     /// camera model.
@@ -25,82 +25,343 @@
 // ----------------------------------------------------------------------------
 
 #include <Eigen/Dense>
-#include <unordered_set>
+#include <algorithm>
+#include <cmath>
+#include <limits>
+#include <unordered_map>
 
-#include "open3d/geometry/KDTreeFlann.h"
+#include "open3d/geometry/ConcurrentUnionFind.h"
+#include "open3d/geometry/NeighborGraph.h"
 #include "open3d/geometry/PointCloud.h"
+#include "open3d/geometry/VoxelGrouping.h"
 #include "open3d/utility/Console.h"
+#include "open3d/utility/Helper.h"
 
 namespace open3d {
 namespace geometry {
 
-std::vector<int> PointCloud::ClusterDBSCAN(double eps,
-                                           size_t min_points,
-                                           bool print_progress) const {
-    KDTreeFlann kdtree(*this);
+namespace {
 
-    // precompute all neighbours
-    utility::LogDebug("Precompute Neighbours");
-    utility::ConsoleProgressBar progress_bar(
-            points_.size(), "Precompute Neighbours", print_progress);
-    std::vector<std::vector<int>> nbs(points_.size());
+/// Label the core points by cluster, numbering clusters in the order of their
+/// smallest core point. Returns the number of clusters.
+int LabelCorePoints(ConcurrentUnionFind &union_find,
+                    const std::vector<uint8_t> &is_core_point,
+                    std::vector<int> &labels) {
+    const int64_t num_points = int64_t(is_core_point.size());
+    std::vector<int> root_labels(num_points, -1);
+    int cluster_label = 0;
+    for (int64_t idx = 0; idx < num_points; ++idx) {
+        if (is_core_point[idx] && union_find.Find(idx) == idx) {
+            root_labels[idx] = cluster_label++;
+        }
+    }
 #pragma omp parallel for schedule(static)
-    for (int idx = 0; idx < int(points_.size()); ++idx) {
-        std::vector<double> dists2;
-        kdtree.SearchRadius(points_[idx], eps, nbs[idx], dists2);
+    for (int64_t idx = 0; idx < num_points; ++idx) {
+        if (is_core_point[idx]) {
+            labels[idx] = root_labels[union_find.Find(idx)];
+        }
+    }
+    return cluster_label;
+}
+
+/// DBSCAN on the neighborhoods of a NeighborGraph.
+std::vector<int> ClusterDBSCANWithNeighborGraph(
+        const NeighborGraph &neighbor_graph,
+        double eps,
+        size_t min_points,
+        bool print_progress) {
+    const KDTreeSearchParamRadius search_param(eps);
+    const int64_t num_points = int64_t(neighbor_graph.NumPoints());
+    std::vector<int> labels(num_points, -1);
+
+    utility::LogDebug("Compute Core Points");
+    std::vector<uint8_t> is_core_point(num_points, 0);
+#pragma omp parallel for schedule(static)
+    for (int64_t idx = 0; idx < num_points; ++idx) {
+        is_core_point[idx] = size_t(neighbor_graph.CountNeighbors(
+                                     idx, search_param)) >= min_points;
+    }
 
+    utility::LogDebug("Connect Core Points");
+    utility::ConsoleProgressBar progress_bar(num_points, "Connect Core Points",
+                                             print_progress);
+    ConcurrentUnionFind union_find(num_points);
+#pragma omp parallel
+    {
+        std::vector<int> nbs;
+        std::vector<double> dists2;
+#pragma omp for schedule(dynamic, 256)
+        for (int64_t idx = 0; idx < num_points; ++idx) {
+            if (is_core_point[idx]) {
+                neighbor_graph.GetNeighbors(idx, search_param, nbs, dists2);
+                for (int nb : nbs) {
+                    if (nb > idx && is_core_point[nb]) {
+                        union_find.Union(idx, nb);
+                    }
+                }
+            }
 #pragma omp critical
-        { ++progress_bar; }
+            { ++progress_bar; }
+        }
     }
-    utility::LogDebug("Done Precompute Neighbours");
 
-    // set all labels to undefined (-2)
     utility::LogDebug("Compute Clusters");
-    progress_bar.reset(points_.size(), "Clustering", print_progress);
-    std::vector<int> labels(points_.size(), -2);
-    int cluster_label = 0;
-    for (size_t idx = 0; idx < points_.size(); ++idx) {
-        if (labels[idx] != -2) {  // label is not undefined
-            continue;
+    const int num_clusters = LabelCorePoints(union_find, is_core_point, labels);
+#pragma omp parallel
+    {
+        std::vector<int> nbs;
+        std::vector<double> dists2;
+#pragma omp for schedule(dynamic, 256)
+        for (int64_t idx = 0; idx < num_points; ++idx) {
+            if (is_core_point[idx]) {
+                continue;
+            }
+            neighbor_graph.GetNeighbors(idx, search_param, nbs, dists2);
+            int label = -1;
+            for (int nb : nbs) {
+                if (is_core_point[nb] && (label == -1 || labels[nb] < label)) {
+                    label = labels[nb];
+                }
+            }
+            labels[idx] = label;
         }
+    }
 
-        // check density
-        if (nbs[idx].size() < min_points) {
-            labels[idx] = -1;
-            continue;
-        }
+    utility::LogDebug("Done Compute Clusters: {:d}", num_clusters);
+    return labels;
+}
+
+}  // namespace
 
-        std::unordered_set<int> nbs_next(nbs[idx].begin(), nbs[idx].end());
-        std::unordered_set<int> nbs_visited;
-        nbs_visited.insert(int(idx));
+std::vector<int> PointCloud::ClusterDBSCAN(
+        double eps,
+        size_t min_points,
+        bool print_progress,
+        const std::shared_ptr<NeighborGraph> neighbor_graph
+        /* = nullptr */) const {
+    if (neighbor_graph) {
+        neighbor_graph->AssertCovers(
+                points_.size(), KDTreeSearchParamRadius(eps), "ClusterDBSCAN");
+        return ClusterDBSCANWithNeighborGraph(*neighbor_graph, eps, min_points,
+                                              print_progress);
+    }
+    const int64_t num_points = int64_t(points_.size());
+    std::vector<int> labels(num_points, -1);
+    if (num_points == 0) {
+        return labels;
+    }
 
-        labels[idx] = cluster_label;
-        ++progress_bar;
-        while (!nbs_next.empty()) {
-            int nb = *nbs_next.begin();
-            nbs_next.erase(nbs_next.begin());
-            nbs_visited.insert(nb);
+    // Same neighborhood as KDTreeFlann::SearchRadius: a point is a neighbor
+    // of another one if their squared distance, accumulated as in FLANN, is
+    // less than float(eps * eps). Every point is its own neighbor.
+    const double radius2 = double(float(eps * eps));
+    auto is_neighbor = [&](const Eigen::Vector3d &p, const Eigen::Vector3d &q) {
+        double dist2 = 0;
+        for (int c = 0; c < 3; ++c) {
+            double diff = p(c) - q(c);
+            dist2 += diff * diff;
+        }
+        return dist2 < radius2;
+    };
+    if (!(radius2 > 0)) {
+        // No neighbors at all, not even the point itself.
+        if (min_points > 0) {
+            return labels;
+        }
+        for (int64_t idx = 0; idx < num_points; ++idx) {
+            labels[idx] = int(idx);
+        }
+        return labels;
+    }
 
-            if (labels[nb] == -1) {  // noise label
-                labels[nb] = cluster_label;
-                ++progress_bar;
+    // Grid of cells with a diagonal shorter than eps, so that all points of a
+    // cell are neighbors of each other.
+    const double cell_size = std::sqrt(radius2 / 3.0) * (1.0 - 1e-6);
+    const Eigen::Vector3d min_bound = GetMinBound();
+    if (cell_size * std::numeric_limits<int>::max() <
+        (GetMaxBound() - min_bound).maxCoeff()) {
+        utility::LogError("[ClusterDBSCAN] eps is too small.");
+    }
+    utility::LogDebug("Build Grid");
+    const std::vector<Eigen::Vector3i> cell_indices =
+            VoxelGrouping::ComputeVoxelIndices(points_, min_bound, cell_size);
+    std::vector<int64_t> sorted_points, cell_starts;
+    VoxelGrouping::GroupPointsByVoxel(cell_indices, sorted_points, cell_starts);
+    const int64_t num_cells = int64_t(cell_starts.size()) - 1;
+    std::unordered_map<Eigen::Vector3i, int64_t,
+                       utility::hash_eigen<Eigen::Vector3i>>
+            cell_map;
+    cell_map.reserve(num_cells);
+    for (int64_t c = 0; c < num_cells; ++c) {
+        cell_map[cell_indices[sorted_points[cell_starts[c]]]] = c;
+    }
+    // Points in cell order, for locality.
+    std::vector<Eigen::Vector3d> sorted_coords(num_points);
+#pragma omp parallel for schedule(static)
+    for (int64_t i = 0; i < num_points; ++i) {
+        sorted_coords[i] = points_[sorted_points[i]];
+    }
+
+    // Offsets of the cells that may hold neighbors of a point of a cell.
+    const int range = int(std::ceil(std::sqrt(radius2) / cell_size));
+    std::vector<Eigen::Vector3i> cell_offsets;
+    for (int x = -range; x <= range; ++x) {
+        for (int y = -range; y <= range; ++y) {
+            for (int z = -range; z <= range; ++z) {
+                Eigen::Vector3d gap(std::max(std::abs(x) - 1, 0),
+                                    std::max(std::abs(y) - 1, 0),
+                                    std::max(std::abs(z) - 1, 0));
+                if ((gap * cell_size).squaredNorm() < radius2) {
+                    cell_offsets.emplace_back(x, y, z);
+                }
             }
-            if (labels[nb] != -2) {  // not undefined label
-                continue;
+        }
+    }
+    auto neighbor_cells = [&](int64_t c, std::vector<int64_t> &cells) {
+        cells.clear();
+        const Eigen::Vector3i &cell =
+                cell_indices[sorted_points[cell_starts[c]]];
+        for (const Eigen::Vector3i &offset : cell_offsets) {
+            auto it = cell_map.find(cell + offset);
+            if (it != cell_map.end()) {
+                cells.push_back(it->second);
             }
-            labels[nb] = cluster_label;
-            ++progress_bar;
+        }
+    };
 
-            if (nbs[nb].size() >= min_points) {
-                for (int qnb : nbs[nb]) {
-                    if (nbs_visited.count(qnb) == 0) {
-                        nbs_next.insert(qnb);
+    // Core points, counting neighbors without storing them. Cells with at
+    // least min_points points only hold core points.
+    utility::LogDebug("Compute Core Points");
+    utility::ConsoleProgressBar progress_bar(num_cells, "Compute Core Points",
+                                             print_progress);
+    std::vector<uint8_t> is_core(num_points, 0);
+#pragma omp parallel
+    {
+        std::vector<int64_t> cells;
+#pragma omp for schedule(dynamic, 64)
+        for (int64_t c = 0; c < num_cells; ++c) {
+            if (size_t(cell_starts[c + 1] - cell_starts[c]) >= min_points) {
+                std::fill(is_core.begin() + cell_starts[c],
+                          is_core.begin() + cell_starts[c + 1], 1);
+            } else {
+                neighbor_cells(c, cells);
+                for (int64_t i = cell_starts[c]; i < cell_starts[c + 1]; ++i) {
+                    size_t count = 0;
+                    for (int64_t nc : cells) {
+                        for (int64_t j = cell_starts[nc];
+                             j < cell_starts[nc + 1] && count < min_points;
+                             ++j) {
+                            count += is_neighbor(sorted_coords[i],
+                                                 sorted_coords[j]);
+                        }
                     }
+                    is_core[i] = count >= min_points;
                 }
             }
+#pragma omp critical
+            { ++progress_bar; }
         }
+    }
 
-        cluster_label++;
+    // Connect core points. Core points of a cell are all connected, so it
+    // is enough to connect cells that have a pair of neighboring core points.
+    // Union-find works on original point indices, so that the root of a
+    // cluster is its smallest core point.
+    utility::LogDebug("Connect Core Points");
+    progress_bar.reset(num_cells, "Connect Core Points", print_progress);
+    ConcurrentUnionFind union_find(num_points);
+    std::vector<int64_t> cell_core(num_cells, -1);
+#pragma omp parallel for schedule(static)
+    for (int64_t c = 0; c < num_cells; ++c) {
+        for (int64_t i = cell_starts[c]; i < cell_starts[c + 1]; ++i) {
+            if (is_core[i]) {
+                if (cell_core[c] == -1) {
+                    cell_core[c] = sorted_points[i];
+                } else {
+                    union_find.Union(cell_core[c], sorted_points[i]);
+                }
+            }
+        }
+    }
+#pragma omp parallel
+    {
+        std::vector<int64_t> cells;
+#pragma omp for schedule(dynamic, 64)
+        for (int64_t c = 0; c < num_cells; ++c) {
+            if (cell_core[c] != -1) {
+                neighbor_cells(c, cells);
+            } else {
+                cells.clear();
+            }
+            for (int64_t nc : cells) {
+                if (nc <= c || cell_core[nc] == -1 ||
+                    union_find.Find(cell_core[c]) ==
+                            union_find.Find(cell_core[nc])) {
+                    continue;
+                }
+                bool connected = false;
+                for (int64_t i = cell_starts[c];
+                     i < cell_starts[c + 1] && !connected; ++i) {
+                    if (!is_core[i]) {
+                        continue;
+                    }
+                    for (int64_t j = cell_starts[nc];
+                         j < cell_starts[nc + 1] && !connected; ++j) {
+                        connected = is_core[j] && is_neighbor(sorted_coords[i],
+                                                              sorted_coords[j]);
+                    }
+                }
+                if (connected) {
+                    union_find.Union(cell_core[c], cell_core[nc]);
+                }
+            }
+#pragma omp critical
+            { ++progress_bar; }
+        }
+    }
+
+    // Clusters are numbered in the order of their smallest core point.
+    utility::LogDebug("Compute Clusters");
+    std::vector<uint8_t> is_core_point(num_points, 0);
+#pragma omp parallel for schedule(static)
+    for (int64_t i = 0; i < num_points; ++i) {
+        is_core_point[sorted_points[i]] = is_core[i];
+    }
+    const int cluster_label =
+            LabelCorePoints(union_find, is_core_point, labels);
+
+    // Border points join the cluster with the smallest label among their core
+    // neighbors, other points are noise.
+    progress_bar.reset(num_cells, "Label Border Points", print_progress);
+#pragma omp parallel
+    {
+        std::vector<int64_t> cells;
+#pragma omp for schedule(dynamic, 64)
+        for (int64_t c = 0; c < num_cells; ++c) {
+            neighbor_cells(c, cells);
+            for (int64_t i = cell_starts[c]; i < cell_starts[c + 1]; ++i) {
+                if (is_core[i]) {
+                    continue;
+                }
+                int label = -1;
+                for (int64_t nc : cells) {
+                    for (int64_t j = cell_starts[nc]; j < cell_starts[nc + 1];
+                         ++j) {
+                        if (!is_core[j]) {
+                            continue;
+                        }
+                        const int nb_label = labels[sorted_points[j]];
+                        if ((label == -1 || nb_label < label) &&
+                            is_neighbor(sorted_coords[i], sorted_coords[j])) {
+                            label = nb_label;
+                        }
+                    }
+                }
+                labels[sorted_points[i]] = label;
+            }
+#pragma omp critical
+            { ++progress_bar; }
+        }
     }
 
     utility::LogDebug("Done Compute Clusters: {:d}", cluster_label);
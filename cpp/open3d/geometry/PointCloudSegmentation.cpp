@@ -27,6 +27,7 @@
 #include <Eigen/Dense>
 #include <algorithm>
 #include <iterator>
+#include <limits>
 #include <numeric>
 #include <random>
 #include <unordered_set>
@@ -51,34 +52,33 @@ public:
     double inlier_rmse_;
 };
 
-// Calculates the number of inliers given a list of points and a plane model,
+// Calculates the number of inliers among points[indices] given a plane model,
 // and the total distance between the inliers and the plane. These numbers are
 // then used to evaluate how well the plane model fits the given points.
 RANSACResult EvaluateRANSACBasedOnDistance(
         const std::vector<Eigen::Vector3d> &points,
+        const std::vector<size_t> &indices,
         const Eigen::Vector4d plane_model,
-        std::vector<size_t> &inliers,
-        double distance_threshold,
-        double error) {
+        double distance_threshold) {
     RANSACResult result;
-
-    for (size_t idx = 0; idx < points.size(); ++idx) {
+    double error = 0;
+    size_t inlier_num = 0;
+    for (size_t idx : indices) {
         Eigen::Vector4d point(points[idx](0), points[idx](1), points[idx](2),
                               1);
         double distance = std::abs(plane_model.dot(point));
 
         if (distance < distance_threshold) {
             error += distance;
-            inliers.emplace_back(idx);
+            inlier_num++;
         }
     }
 
-    size_t inlier_num = inliers.size();
     if (inlier_num == 0) {
         result.fitness_ = 0;
         result.inlier_rmse_ = 0;
     } else {
-        result.fitness_ = (double)inlier_num / (double)points.size();
+        result.fitness_ = (double)inlier_num / (double)indices.size();
         result.inlier_rmse_ = error / std::sqrt((double)inlier_num);
     }
     return result;
@@ -132,72 +132,122 @@ Eigen::Vector4d GetPlaneFromPoints(const std::vector<Eigen::Vector3d> &points,
     return Eigen::Vector4d(abc(0), abc(1), abc(2), d);
 }
 
-std::tuple<Eigen::Vector4d, std::vector<size_t>> PointCloud::SegmentPlane(
-        const double distance_threshold /* = 0.01 */,
-        const int ransac_n /* = 3 */,
-        const int num_iterations /* = 100 */) const {
-    RANSACResult result;
-    double error = 0;
-
-    // Initialize the plane model ax + by + cz + d = 0.
-    Eigen::Vector4d plane_model = Eigen::Vector4d(0, 0, 0, 0);
-    // Initialize the best plane model.
-    Eigen::Vector4d best_plane_model = Eigen::Vector4d(0, 0, 0, 0);
-
-    // Initialize consensus set.
-    std::vector<size_t> inliers;
-
-    size_t num_points = points_.size();
-    std::vector<size_t> indices(num_points);
-    std::iota(std::begin(indices), std::end(indices), 0);
+namespace {
 
-    std::random_device rd;
-    std::mt19937 rng(rd());
+/// Number of RANSAC iterations evaluated in parallel between two checks of
+/// the termination criterion. It does not depend on the number of threads, so
+/// that results are reproducible for a given seed.
+constexpr int kRANSACBatchSize = 64;
 
-    // Return if ransac_n is less than the required plane model parameters.
-    if (ransac_n < 3) {
-        utility::LogError(
-                "ransac_n should be set to higher than or equal to 3.");
-        return std::make_tuple(best_plane_model, inliers);
+/// Number of iterations needed to sample an all-inlier set with the given
+/// probability, for the given inlier ratio.
+int RequiredRANSACIterations(double fitness, int ransac_n, double probability) {
+    if (probability >= 1.0 || fitness <= 0.0) {
+        return std::numeric_limits<int>::max();
     }
-    if (num_points < size_t(ransac_n)) {
-        utility::LogError("There must be at least 'ransac_n' points.");
-        return std::make_tuple(best_plane_model, inliers);
+    if (fitness >= 1.0) {
+        return 0;
     }
+    double iterations = std::log(1.0 - probability) /
+                        std::log(1.0 - std::pow(fitness, ransac_n));
+    return iterations >= std::numeric_limits<int>::max()
+                   ? std::numeric_limits<int>::max()
+                   : int(std::ceil(iterations));
+}
 
-    for (int itr = 0; itr < num_iterations; itr++) {
-        for (int i = 0; i < ransac_n; ++i) {
-            std::swap(indices[i], indices[rng() % num_points]);
-        }
-        inliers.clear();
-        for (int idx = 0; idx < ransac_n; ++idx) {
-            inliers.emplace_back(indices[idx]);
+/// Segment a plane among points[indices]. Returns the plane model and the
+/// inliers, as indices into points.
+std::tuple<Eigen::Vector4d, std::vector<size_t>> SegmentPlaneRANSAC(
+        const std::vector<Eigen::Vector3d> &points,
+        const std::vector<size_t> &indices,
+        double distance_threshold,
+        int ransac_n,
+        int num_iterations,
+        double probability,
+        size_t preemptive_sample_size,
+        unsigned int seed) {
+    const size_t num_points = indices.size();
+
+    // Points used to score hypotheses before the full evaluation.
+    std::vector<size_t> preemptive_sample;
+    if (preemptive_sample_size > 0 && preemptive_sample_size < num_points) {
+        std::vector<size_t> shuffled = indices;
+        std::mt19937 rng(seed);
+        for (size_t i = 0; i < preemptive_sample_size; ++i) {
+            std::swap(shuffled[i], shuffled[i + rng() % (num_points - i)]);
         }
+        preemptive_sample.assign(shuffled.begin(),
+                                 shuffled.begin() + preemptive_sample_size);
+    }
+
+    RANSACResult result;
+    RANSACResult sample_result;
+    Eigen::Vector4d best_plane_model = Eigen::Vector4d(0, 0, 0, 0);
+    int max_iterations = num_iterations;
+    int itr = 0;
+    for (; itr < max_iterations; itr += kRANSACBatchSize) {
+        const int batch_size = std::min(kRANSACBatchSize, max_iterations - itr);
+        std::vector<Eigen::Vector4d> plane_models(batch_size);
+        std::vector<RANSACResult> results(batch_size);
+        std::vector<RANSACResult> sample_results(batch_size);
+#pragma omp parallel for schedule(dynamic)
+        for (int b = 0; b < batch_size; ++b) {
+            // Every iteration has its own generator, seeded from the global
+            // seed and the iteration number.
+            std::seed_seq seq{seed, static_cast<unsigned int>(itr + b)};
+            std::mt19937 rng(seq);
+            std::vector<size_t> sample;
+            while (sample.size() < size_t(ransac_n)) {
+                size_t idx = indices[rng() % num_points];
+                if (std::find(sample.begin(), sample.end(), idx) ==
+                    sample.end()) {
+                    sample.push_back(idx);
+                }
+            }
 
-        // Fit model to num_model_parameters randomly selected points among the
-        // inliers.
-        plane_model = TriangleMesh::ComputeTrianglePlane(
-                points_[inliers[0]], points_[inliers[1]], points_[inliers[2]]);
-        if (plane_model.isZero(0)) {
-            continue;
+            // Fit model to num_model_parameters randomly selected points among
+            // the inliers.
+            Eigen::Vector4d plane_model = TriangleMesh::ComputeTrianglePlane(
+                    points[sample[0]], points[sample[1]], points[sample[2]]);
+            if (plane_model.isZero(0)) {
+                continue;
+            }
+            plane_models[b] = plane_model;
+
+            // Skip the full evaluation of hypotheses that score worse than the
+            // best one so far on the preemptive sample.
+            if (!preemptive_sample.empty()) {
+                sample_results[b] = EvaluateRANSACBasedOnDistance(
+                        points, preemptive_sample, plane_model,
+                        distance_threshold);
+                if (sample_results[b].fitness_ < sample_result.fitness_) {
+                    continue;
+                }
+            }
+            results[b] = EvaluateRANSACBasedOnDistance(
+                    points, indices, plane_model, distance_threshold);
         }
 
-        error = 0;
-        inliers.clear();
-        auto this_result = EvaluateRANSACBasedOnDistance(
-                points_, plane_model, inliers, distance_threshold, error);
-        if (this_result.fitness_ > result.fitness_ ||
-            (this_result.fitness_ == result.fitness_ &&
-             this_result.inlier_rmse_ < result.inlier_rmse_)) {
-            result = this_result;
-            best_plane_model = plane_model;
+        for (int b = 0; b < batch_size; ++b) {
+            const RANSACResult &this_result = results[b];
+            if (this_result.fitness_ > result.fitness_ ||
+                (this_result.fitness_ == result.fitness_ &&
+                 this_result.inlier_rmse_ < result.inlier_rmse_)) {
+                result = this_result;
+                sample_result = sample_results[b];
+                best_plane_model = plane_models[b];
+            }
         }
+        max_iterations =
+                std::min(num_iterations,
+                         RequiredRANSACIterations(result.fitness_, ransac_n,
+                                                  probability));
     }
 
     // Find the final inliers using best_plane_model.
-    inliers.clear();
-    for (size_t idx = 0; idx < points_.size(); ++idx) {
-        Eigen::Vector4d point(points_[idx](0), points_[idx](1), points_[idx](2),
+    std::vector<size_t> inliers;
+    for (size_t idx : indices) {
+        Eigen::Vector4d point(points[idx](0), points[idx](1), points[idx](2),
                               1);
         double distance = std::abs(best_plane_model.dot(point));
 
@@ -207,12 +257,91 @@ std::tuple<Eigen::Vector4d, std::vector<size_t>> PointCloud::SegmentPlane(
     }
 
     // Improve best_plane_model using the final inliers.
-    best_plane_model = GetPlaneFromPoints(points_, inliers);
+    best_plane_model = GetPlaneFromPoints(points, inliers);
 
-    utility::LogDebug("RANSAC | Inliers: {:d}, Fitness: {:e}, RMSE: {:e}",
-                      inliers.size(), result.fitness_, result.inlier_rmse_);
+    utility::LogDebug(
+            "RANSAC | Iterations: {:d}, Inliers: {:d}, Fitness: {:e}, RMSE: "
+            "{:e}",
+            std::min(itr, num_iterations), inliers.size(), result.fitness_,
+            result.inlier_rmse_);
     return std::make_tuple(best_plane_model, inliers);
 }
 
+void CheckRANSACParameters(int ransac_n, double probability) {
+    // Return if ransac_n is less than the required plane model parameters.
+    if (ransac_n < 3) {
+        utility::LogError(
+                "ransac_n should be set to higher than or equal to 3.");
+    }
+    if (probability <= 0 || probability > 1) {
+        utility::LogError("probability should be in the range (0, 1].");
+    }
+}
+
+}  // namespace
+
+std::tuple<Eigen::Vector4d, std::vector<size_t>> PointCloud::SegmentPlane(
+        const double distance_threshold /* = 0.01 */,
+        const int ransac_n /* = 3 */,
+        const int num_iterations /* = 100 */,
+        const double probability /* = 0.99999999 */,
+        const size_t preemptive_sample_size /* = 0 */,
+        int seed /* = -1 */) const {
+    CheckRANSACParameters(ransac_n, probability);
+    if (points_.size() < size_t(ransac_n)) {
+        utility::LogError("There must be at least 'ransac_n' points.");
+    }
+    if (seed == -1) {
+        std::random_device rd;
+        seed = rd();
+    }
+
+    std::vector<size_t> indices(points_.size());
+    std::iota(std::begin(indices), std::end(indices), 0);
+    return SegmentPlaneRANSAC(points_, indices, distance_threshold, ransac_n,
+                              num_iterations, probability,
+                              preemptive_sample_size, seed);
+}
+
+std::vector<std::tuple<Eigen::Vector4d, std::vector<size_t>>>
+PointCloud::SegmentPlanes(const size_t num_planes,
+                          const double distance_threshold /* = 0.01 */,
+                          const int ransac_n /* = 3 */,
+                          const int num_iterations /* = 100 */,
+                          const double probability /* = 0.99999999 */,
+                          const size_t min_num_inliers /* = 3 */,
+                          const size_t preemptive_sample_size /* = 0 */,
+                          int seed /* = -1 */) const {
+    CheckRANSACParameters(ransac_n, probability);
+    if (seed == -1) {
+        std::random_device rd;
+        seed = rd();
+    }
+
+    std::vector<std::tuple<Eigen::Vector4d, std::vector<size_t>>> planes;
+    std::vector<size_t> remaining(points_.size());
+    std::iota(std::begin(remaining), std::end(remaining), 0);
+    while (planes.size() < num_planes && remaining.size() >= size_t(ransac_n)) {
+        Eigen::Vector4d plane_model;
+        std::vector<size_t> inliers;
+        std::tie(plane_model, inliers) = SegmentPlaneRANSAC(
+                points_, remaining, distance_threshold, ransac_n,
+                num_iterations, probability, preemptive_sample_size,
+                static_cast<unsigned int>(seed) + planes.size());
+        if (inliers.size() < std::max(min_num_inliers, size_t(ransac_n))) {
+            break;
+        }
+
+        // Both remaining and inliers are sorted.
+        std::vector<size_t> outliers;
+        outliers.reserve(remaining.size() - inliers.size());
+        std::set_difference(remaining.begin(), remaining.end(), inliers.begin(),
+                            inliers.end(), std::back_inserter(outliers));
+        remaining.swap(outliers);
+        planes.emplace_back(plane_model, std::move(inliers));
+    }
+    return planes;
+}
+
 }  // namespace geometry
 }  // namespace open3d
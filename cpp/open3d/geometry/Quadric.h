@@ -0,0 +1,90 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Dense>
+#include <cmath>
+
+namespace open3d {
+namespace geometry {
+
+/// Error quadric that is used to minimize the squared distance of a point to
+/// its neigbhouring triangle planes.
+/// Cf. "Simplifying Surfaces with Color and Texture using Quadric Error
+/// Metrics" by Garland and Heckbert.
+class Quadric {
+public:
+    Quadric() {
+        A_.fill(0);
+        b_.fill(0);
+        c_ = 0;
+    }
+
+    Quadric(const Eigen::Vector4d& plane, double weight = 1) {
+        Eigen::Vector3d n = plane.head<3>();
+        A_ = weight * n * n.transpose();
+        b_ = weight * plane(3) * n;
+        c_ = weight * plane(3) * plane(3);
+    }
+
+    Quadric& operator+=(const Quadric& other) {
+        A_ += other.A_;
+        b_ += other.b_;
+        c_ += other.c_;
+        return *this;
+    }
+
+    Quadric operator+(const Quadric& other) const {
+        Quadric res;
+        res.A_ = A_ + other.A_;
+        res.b_ = b_ + other.b_;
+        res.c_ = c_ + other.c_;
+        return res;
+    }
+
+    double Eval(const Eigen::Vector3d& v) const {
+        Eigen::Vector3d Av = A_ * v;
+        double q = v.dot(Av) + 2 * b_.dot(v) + c_;
+        return q;
+    }
+
+    bool IsInvertible() const { return std::fabs(A_.determinant()) > 1e-4; }
+
+    Eigen::Vector3d Minimum() const { return -A_.ldlt().solve(b_); }
+
+public:
+    /// A_ = n . n^T, where n is the plane normal
+    Eigen::Matrix3d A_;
+    /// b_ = d . n, where n is the plane normal and d the non-normal component
+    /// of the plane parameters
+    Eigen::Vector3d b_;
+    /// c_ = d . d, where d the non-normal component pf the plane parameters
+    double c_;
+};
+
+}  // namespace geometry
+}  // namespace open3d
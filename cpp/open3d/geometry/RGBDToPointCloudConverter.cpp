@@ -0,0 +1,298 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/geometry/RGBDToPointCloudConverter.h"
+
+#include <Eigen/Dense>
+#include <limits>
+
+#include "open3d/geometry/Image.h"
+#include "open3d/geometry/PointCloud.h"
+#include "open3d/geometry/RGBDImage.h"
+#include "open3d/utility/Console.h"
+#include "open3d/utility/ParallelScan.h"
+
+namespace open3d {
+namespace geometry {
+
+namespace {
+
+/// Depth of a pixel in the units of the point cloud, 0 if it is invalid.
+template <typename TD>
+float ScaleDepth(TD value, float depth_scale, double depth_trunc);
+
+template <>
+inline float ScaleDepth<float>(float value,
+                               float depth_scale,
+                               double depth_trunc) {
+    return value;
+}
+
+/// Same as Image::ConvertDepthToFloatImage.
+template <>
+inline float ScaleDepth<uint16_t>(uint16_t value,
+                                  float depth_scale,
+                                  double depth_trunc) {
+    const float depth = float(value) / depth_scale;
+    return depth >= depth_trunc ? 0.0f : depth;
+}
+
+/// Converts \p depth and, if NC > 0, the NC channels of type TC of \p color
+/// into \p output.
+template <typename TD, typename TC, int NC>
+void ConvertImage(const RGBDToPointCloudConverter &converter,
+                  const Image &depth,
+                  const Image *color,
+                  const Eigen::Matrix4d &extrinsic,
+                  PointCloud &output) {
+    const int num_rows = int(converter.y_factors_.size());
+    const int num_cols = int(converter.x_factors_.size());
+    const int64_t stride = converter.stride_;
+    const float depth_scale = float(converter.depth_scale_);
+    const double depth_trunc = converter.depth_trunc_;
+    const bool valid_only = converter.project_valid_depth_only_;
+    auto depth_row = [&](int r) {
+        return (const TD *)(depth.data_.data() +
+                            r * stride * depth.BytesPerLine());
+    };
+
+    // Output index of the first point of every sampled row.
+    std::vector<int64_t> row_offsets(num_rows + 1, 0);
+    if (valid_only) {
+#pragma omp parallel for schedule(static)
+        for (int r = 0; r < num_rows; ++r) {
+            const TD *p = depth_row(r);
+            int64_t count = 0;
+            for (int c = 0; c < num_cols; ++c) {
+                if (ScaleDepth<TD>(p[c * stride], depth_scale, depth_trunc) >
+                    0) {
+                    ++count;
+                }
+            }
+            row_offsets[r + 1] = count;
+        }
+        utility::InclusivePrefixSum(row_offsets.data() + 1,
+                                    row_offsets.data() + num_rows + 1,
+                                    row_offsets.data() + 1);
+    } else {
+        for (int r = 0; r <= num_rows; ++r) {
+            row_offsets[r] = int64_t(r) * num_cols;
+        }
+    }
+
+    // resize keeps the capacity, so a stream converted into the same output
+    // only allocates when a frame has more points than the previous ones.
+    output.points_.resize(row_offsets[num_rows]);
+    if (NC > 0) {
+        output.colors_.resize(row_offsets[num_rows]);
+    } else {
+        output.colors_.clear();
+    }
+    output.normals_.clear();
+
+    const Eigen::Matrix4d camera_pose = extrinsic.inverse();
+    const Eigen::Matrix3d rotation = camera_pose.block<3, 3>(0, 0);
+    const Eigen::Vector3d translation = camera_pose.block<3, 1>(0, 3);
+    const double color_scale = (sizeof(TC) == 1) ? 255.0 : 1.0;
+    const Eigen::Vector3d nan_point =
+            Eigen::Vector3d::Constant(std::numeric_limits<float>::quiet_NaN());
+    const Eigen::Vector3d nan_color =
+            Eigen::Vector3d::Constant(std::numeric_limits<TC>::quiet_NaN());
+#pragma omp parallel for schedule(static)
+    for (int r = 0; r < num_rows; ++r) {
+        const TD *p = depth_row(r);
+        const TC *pc = nullptr;
+        if (NC > 0) {
+            pc = (const TC *)(color->data_.data() +
+                              r * stride * color->BytesPerLine());
+        }
+        const double y_factor = converter.y_factors_[r];
+        int64_t idx = row_offsets[r];
+        for (int c = 0; c < num_cols; ++c) {
+            const double z =
+                    ScaleDepth<TD>(p[c * stride], depth_scale, depth_trunc);
+            if (z > 0) {
+                output.points_[idx] =
+                        rotation * Eigen::Vector3d(converter.x_factors_[c] * z,
+                                                   y_factor * z, z) +
+                        translation;
+                if (NC > 0) {
+                    const TC *q = pc + c * stride * NC;
+                    output.colors_[idx] =
+                            Eigen::Vector3d(q[0], q[(NC - 1) / 2], q[NC - 1]) /
+                            color_scale;
+                }
+                ++idx;
+            } else if (!valid_only) {
+                output.points_[idx] = nan_point;
+                if (NC > 0) {
+                    output.colors_[idx] = nan_color;
+                }
+                ++idx;
+            }
+        }
+    }
+}
+
+}  // unnamed namespace
+
+RGBDToPointCloudConverter::RGBDToPointCloudConverter(
+        const camera::PinholeCameraIntrinsic &intrinsic,
+        double depth_scale /* = 1000.0*/,
+        double depth_trunc /* = 1000.0*/,
+        int stride /* = 1*/,
+        bool project_valid_depth_only /* = true*/)
+    : intrinsic_(intrinsic),
+      depth_scale_(depth_scale),
+      depth_trunc_(depth_trunc),
+      stride_(stride),
+      project_valid_depth_only_(project_valid_depth_only) {
+    if (stride <= 0) {
+        utility::LogError(
+                "[RGBDToPointCloudConverter] stride must be positive, but got "
+                "{}.",
+                stride);
+    }
+    if (intrinsic.width_ <= 0 || intrinsic.height_ <= 0) {
+        return;
+    }
+    const auto focal_length = intrinsic.GetFocalLength();
+    const auto principal_point = intrinsic.GetPrincipalPoint();
+    x_factors_.reserve((intrinsic.width_ + stride - 1) / stride);
+    for (int u = 0; u < intrinsic.width_; u += stride) {
+        x_factors_.push_back((u - principal_point.first) / focal_length.first);
+    }
+    y_factors_.reserve((intrinsic.height_ + stride - 1) / stride);
+    for (int v = 0; v < intrinsic.height_; v += stride) {
+        y_factors_.push_back((v - principal_point.second) /
+                             focal_length.second);
+    }
+}
+
+std::shared_ptr<RGBDToPointCloudConverter>
+RGBDToPointCloudConverter::CreateFromIntrinsic(
+        const camera::PinholeCameraIntrinsic &intrinsic,
+        double depth_scale /* = 1000.0*/,
+        double depth_trunc /* = 1000.0*/,
+        int stride /* = 1*/,
+        bool project_valid_depth_only /* = true*/) {
+    return std::make_shared<RGBDToPointCloudConverter>(
+            intrinsic, depth_scale, depth_trunc, stride,
+            project_valid_depth_only);
+}
+
+void RGBDToPointCloudConverter::ConvertDepthImage(
+        const Image &depth,
+        PointCloud &output,
+        const Eigen::Matrix4d &extrinsic /* = Eigen::Matrix4d::Identity()*/)
+        const {
+    if (depth.width_ != intrinsic_.width_ ||
+        depth.height_ != intrinsic_.height_) {
+        utility::LogError(
+                "[RGBDToPointCloudConverter] depth image size is ({} x {}), "
+                "but got ({} x {}) from intrinsic.",
+                depth.width_, depth.height_, intrinsic_.width_,
+                intrinsic_.height_);
+    }
+    if (depth.num_of_channels_ == 1) {
+        if (depth.bytes_per_channel_ == 2) {
+            ConvertImage<uint16_t, uint8_t, 0>(*this, depth, nullptr, extrinsic,
+                                               output);
+            return;
+        } else if (depth.bytes_per_channel_ == 4) {
+            ConvertImage<float, uint8_t, 0>(*this, depth, nullptr, extrinsic,
+                                            output);
+            return;
+        }
+    }
+    utility::LogError(
+            "[RGBDToPointCloudConverter::ConvertDepthImage] Unsupported image "
+            "format.");
+}
+
+std::shared_ptr<PointCloud> RGBDToPointCloudConverter::ConvertDepthImage(
+        const Image &depth,
+        const Eigen::Matrix4d &extrinsic /* = Eigen::Matrix4d::Identity()*/)
+        const {
+    auto pointcloud = std::make_shared<PointCloud>();
+    ConvertDepthImage(depth, *pointcloud, extrinsic);
+    return pointcloud;
+}
+
+void RGBDToPointCloudConverter::ConvertRGBDImage(
+        const RGBDImage &image,
+        PointCloud &output,
+        const Eigen::Matrix4d &extrinsic /* = Eigen::Matrix4d::Identity()*/)
+        const {
+    const Image &depth = image.depth_;
+    const Image &color = image.color_;
+    if (depth.width_ != intrinsic_.width_ ||
+        depth.height_ != intrinsic_.height_) {
+        utility::LogError(
+                "[RGBDToPointCloudConverter] depth image size is ({} x {}), "
+                "but got ({} x {}) from intrinsic.",
+                depth.width_, depth.height_, intrinsic_.width_,
+                intrinsic_.height_);
+    }
+    if (color.width_ != depth.width_ || color.height_ != depth.height_) {
+        utility::LogError(
+                "[RGBDToPointCloudConverter] color image size is ({} x {}), "
+                "but depth image size is ({} x {}).",
+                color.width_, color.height_, depth.width_, depth.height_);
+    }
+    if (depth.num_of_channels_ == 1 && depth.bytes_per_channel_ == 4) {
+        if (color.bytes_per_channel_ == 1 && color.num_of_channels_ == 3) {
+            ConvertImage<float, uint8_t, 3>(*this, depth, &color, extrinsic,
+                                            output);
+            return;
+        } else if (color.bytes_per_channel_ == 1 &&
+                   color.num_of_channels_ == 4) {
+            ConvertImage<float, uint8_t, 4>(*this, depth, &color, extrinsic,
+                                            output);
+            return;
+        } else if (color.bytes_per_channel_ == 4 &&
+                   color.num_of_channels_ == 1) {
+            ConvertImage<float, float, 1>(*this, depth, &color, extrinsic,
+                                          output);
+            return;
+        }
+    }
+    utility::LogError(
+            "[RGBDToPointCloudConverter::ConvertRGBDImage] Unsupported image "
+            "format.");
+}
+
+std::shared_ptr<PointCloud> RGBDToPointCloudConverter::ConvertRGBDImage(
+        const RGBDImage &image,
+        const Eigen::Matrix4d &extrinsic /* = Eigen::Matrix4d::Identity()*/)
+        const {
+    auto pointcloud = std::make_shared<PointCloud>();
+    ConvertRGBDImage(image, *pointcloud, extrinsic);
+    return pointcloud;
+}
+
+}  // namespace geometry
+}  // namespace open3d
@@ -0,0 +1,169 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+#include <memory>
+#include <vector>
+
+#include "open3d/camera/PinholeCameraIntrinsic.h"
+
+namespace open3d {
+namespace geometry {
+
+class Image;
+class PointCloud;
+class RGBDImage;
+
+/// \class RGBDToPointCloudConverter
+///
+/// \brief Converter from depth and RGBD images to point clouds, bound to one
+/// camera intrinsic.
+///
+/// PointCloud::CreateFromDepthImage and PointCloud::CreateFromRGBDImage
+/// recompute the back projection of every pixel and allocate a new point cloud
+/// (and a float copy of 16 bit depth images) for every frame. The converter
+/// instead computes the ray table of the sampled pixels once, reads 16 bit
+/// depth directly and writes into the buffers of a given PointCloud, which are
+/// only reallocated when a frame has more points than any previous one. Both
+/// passes, counting the valid pixels and back projecting them, run in parallel
+/// over the rows. The points are ordered as in
+/// PointCloud::CreateFromDepthImage.
+class RGBDToPointCloudConverter {
+public:
+    /// \brief Default Constructor.
+    RGBDToPointCloudConverter() {}
+    /// \brief Parameterized Constructor.
+    ///
+    /// \param intrinsic Intrinsic parameters of the camera. Every converted
+    /// image must have its width and height.
+    /// \param depth_scale The 16 bit depth values are divided by depth_scale.
+    /// \param depth_trunc 16 bit depth values larger or equal to depth_trunc
+    /// after scaling are invalid.
+    /// \param stride Sampling factor to support coarse point cloud extraction.
+    /// \param project_valid_depth_only If `false`, invalid pixels are kept as
+    /// NaN points, so that the output has one point per sampled pixel.
+    RGBDToPointCloudConverter(const camera::PinholeCameraIntrinsic &intrinsic,
+                              double depth_scale = 1000.0,
+                              double depth_trunc = 1000.0,
+                              int stride = 1,
+                              bool project_valid_depth_only = true);
+    ~RGBDToPointCloudConverter() {}
+
+public:
+    /// \brief Factory function to create an RGBDToPointCloudConverter.
+    ///
+    /// \param intrinsic Intrinsic parameters of the camera.
+    /// \param depth_scale The 16 bit depth values are divided by depth_scale.
+    /// \param depth_trunc 16 bit depth values larger or equal to depth_trunc
+    /// after scaling are invalid.
+    /// \param stride Sampling factor to support coarse point cloud extraction.
+    /// \param project_valid_depth_only If `false`, invalid pixels are kept as
+    /// NaN points.
+    static std::shared_ptr<RGBDToPointCloudConverter> CreateFromIntrinsic(
+            const camera::PinholeCameraIntrinsic &intrinsic,
+            double depth_scale = 1000.0,
+            double depth_trunc = 1000.0,
+            int stride = 1,
+            bool project_valid_depth_only = true);
+
+    /// Returns `true` if the converter is not bound to a camera with pixels.
+    bool IsEmpty() const { return x_factors_.empty() || y_factors_.empty(); }
+
+    /// Number of sampled pixels, which is the size of the output if
+    /// project_valid_depth_only_ is `false`.
+    int64_t NumSampledPixels() const {
+        return int64_t(x_factors_.size()) * int64_t(y_factors_.size());
+    }
+
+    /// \brief Converts a depth image into \p output.
+    ///
+    /// The points of \p output are overwritten, its colors and normals are
+    /// cleared. The capacity of its buffers is kept, so that converting every
+    /// frame of a stream into the same PointCloud does not allocate.
+    ///
+    /// \param depth The input depth image, with 16 bit or float pixels.
+    /// \param output The point cloud to write into.
+    /// \param extrinsic The extrinsic parameters of the camera.
+    void ConvertDepthImage(const Image &depth,
+                           PointCloud &output,
+                           const Eigen::Matrix4d &extrinsic =
+                                   Eigen::Matrix4d::Identity()) const;
+
+    /// \brief Converts a depth image into a new PointCloud.
+    ///
+    /// \param depth The input depth image, with 16 bit or float pixels.
+    /// \param extrinsic The extrinsic parameters of the camera.
+    std::shared_ptr<PointCloud> ConvertDepthImage(
+            const Image &depth,
+            const Eigen::Matrix4d &extrinsic =
+                    Eigen::Matrix4d::Identity()) const;
+
+    /// \brief Converts an RGBD image into \p output.
+    ///
+    /// The points and colors of \p output are overwritten, its normals are
+    /// cleared. The capacity of its buffers is kept. The supported formats are
+    /// the ones of PointCloud::CreateFromRGBDImage. Invalid pixels kept with
+    /// project_valid_depth_only_ == `false` get the same colors as there.
+    ///
+    /// \param image The input RGBD image, with float depth.
+    /// \param output The point cloud to write into.
+    /// \param extrinsic The extrinsic parameters of the camera.
+    void ConvertRGBDImage(const RGBDImage &image,
+                          PointCloud &output,
+                          const Eigen::Matrix4d &extrinsic =
+                                  Eigen::Matrix4d::Identity()) const;
+
+    /// \brief Converts an RGBD image into a new PointCloud.
+    ///
+    /// \param image The input RGBD image, with float depth.
+    /// \param extrinsic The extrinsic parameters of the camera.
+    std::shared_ptr<PointCloud> ConvertRGBDImage(
+            const RGBDImage &image,
+            const Eigen::Matrix4d &extrinsic =
+                    Eigen::Matrix4d::Identity()) const;
+
+public:
+    /// Intrinsic parameters of the camera.
+    camera::PinholeCameraIntrinsic intrinsic_;
+    /// Divisor of the 16 bit depth values.
+    double depth_scale_ = 1000.0;
+    /// Truncation of the scaled 16 bit depth values.
+    double depth_trunc_ = 1000.0;
+    /// Sampling factor of the rows and columns.
+    int stride_ = 1;
+    /// If `false`, invalid pixels are kept as NaN points.
+    bool project_valid_depth_only_ = true;
+    /// (u - cx) / fx for every sampled column u, so that the point of a pixel
+    /// with depth z is z * (x_factors_[c], y_factors_[r], 1) in camera space.
+    std::vector<double> x_factors_;
+    /// (v - cy) / fy for every sampled row v.
+    std::vector<double> y_factors_;
+};
+
+}  // namespace geometry
+}  // namespace open3d
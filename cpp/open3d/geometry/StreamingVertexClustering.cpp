@@ -0,0 +1,221 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/geometry/StreamingVertexClustering.h"
+
+#include <limits>
+
+#include "open3d/utility/Console.h"
+
+namespace open3d {
+namespace geometry {
+
+StreamingVertexClustering::StreamingVertexClustering(
+        double voxel_size,
+        MeshBase::SimplificationContraction contraction /* = Average */,
+        const Eigen::Vector3d &origin /* = Eigen::Vector3d::Zero() */)
+    : voxel_size_(voxel_size), contraction_(contraction), origin_(origin) {
+    if (voxel_size <= 0.0) {
+        utility::LogError("[StreamingVertexClustering] voxel_size <= 0.0");
+    }
+}
+
+void StreamingVertexClustering::AddVertices(
+        const std::vector<Eigen::Vector3d> &vertices,
+        const std::vector<Eigen::Vector3d> &vertex_normals /* = {} */,
+        const std::vector<Eigen::Vector3d> &vertex_colors /* = {} */) {
+    if (vertices.empty()) {
+        return;
+    }
+    if ((!vertex_normals.empty() && vertex_normals.size() != vertices.size()) ||
+        (!vertex_colors.empty() && vertex_colors.size() != vertices.size())) {
+        utility::LogError(
+                "[StreamingVertexClustering] The numbers of vertices, normals "
+                "and colors differ.");
+    }
+    if (vertex_clusters_.empty()) {
+        has_vertex_normals_ = !vertex_normals.empty();
+        has_vertex_colors_ = !vertex_colors.empty();
+    } else if (has_vertex_normals_ != !vertex_normals.empty() ||
+               has_vertex_colors_ != !vertex_colors.empty()) {
+        utility::LogError(
+                "[StreamingVertexClustering] Either all or no chunks of "
+                "vertices must have normals, and colors.");
+    }
+
+    // Voxel of every vertex.
+    const int64_t num_vertices = int64_t(vertices.size());
+    const double max_coordinate = double(std::numeric_limits<int>::max());
+    std::vector<Eigen::Vector3i> voxels(num_vertices);
+    bool valid = true;
+#pragma omp parallel for schedule(static) reduction(&& : valid)
+    for (int64_t i = 0; i < num_vertices; ++i) {
+        const Eigen::Vector3d coordinate =
+                ((vertices[i] - origin_) / voxel_size_).array().floor();
+        if (!(coordinate.cwiseAbs().maxCoeff() < max_coordinate)) {
+            valid = false;
+            continue;
+        }
+        voxels[i] = coordinate.cast<int>();
+    }
+    if (!valid) {
+        utility::LogError(
+                "[StreamingVertexClustering] voxel_size is too small, or a "
+                "vertex is not finite.");
+    }
+
+    const bool is_quadric =
+            contraction_ == MeshBase::SimplificationContraction::Quadric;
+    vertex_clusters_.reserve(vertex_clusters_.size() + num_vertices);
+    for (int64_t i = 0; i < num_vertices; ++i) {
+        auto inserted =
+                voxel_clusters_.emplace(voxels[i], int(cluster_sizes_.size()));
+        const int cluster = inserted.first->second;
+        if (inserted.second) {
+            cluster_sizes_.push_back(0);
+            cluster_vertex_sums_.push_back(Eigen::Vector3d::Zero());
+            if (has_vertex_normals_) {
+                cluster_normal_sums_.push_back(Eigen::Vector3d::Zero());
+            }
+            if (has_vertex_colors_) {
+                cluster_color_sums_.push_back(Eigen::Vector3d::Zero());
+            }
+            if (is_quadric) {
+                cluster_quadrics_.emplace_back();
+            }
+        }
+        cluster_sizes_[cluster]++;
+        cluster_vertex_sums_[cluster] += vertices[i];
+        if (has_vertex_normals_) {
+            cluster_normal_sums_[cluster] += vertex_normals[i];
+        }
+        if (has_vertex_colors_) {
+            cluster_color_sums_[cluster] += vertex_colors[i];
+        }
+        vertex_clusters_.push_back(cluster);
+        if (is_quadric) {
+            vertex_positions_.push_back(vertices[i].cast<float>());
+        }
+    }
+}
+
+void StreamingVertexClustering::AddTriangles(
+        const std::vector<Eigen::Vector3i> &triangles) {
+    const int64_t num_triangles = int64_t(triangles.size());
+    const int num_vertices = int(vertex_clusters_.size());
+    bool valid = true;
+#pragma omp parallel for schedule(static) reduction(&& : valid)
+    for (int64_t tidx = 0; tidx < num_triangles; ++tidx) {
+        const Eigen::Vector3i &triangle = triangles[tidx];
+        valid = valid && triangle.minCoeff() >= 0 &&
+                triangle.maxCoeff() < num_vertices;
+    }
+    if (!valid) {
+        utility::LogError(
+                "[StreamingVertexClustering] A triangle indexes a vertex that "
+                "has not been added.");
+    }
+
+    // Error quadric of every triangle, added to the clusters of its vertices.
+    if (contraction_ == MeshBase::SimplificationContraction::Quadric) {
+        std::vector<Quadric> quadrics(num_triangles);
+#pragma omp parallel for schedule(static)
+        for (int64_t tidx = 0; tidx < num_triangles; ++tidx) {
+            const Eigen::Vector3i &triangle = triangles[tidx];
+            const Eigen::Vector3d vertex0 =
+                    vertex_positions_[triangle(0)].cast<double>();
+            const Eigen::Vector3d vertex1 =
+                    vertex_positions_[triangle(1)].cast<double>();
+            const Eigen::Vector3d vertex2 =
+                    vertex_positions_[triangle(2)].cast<double>();
+            quadrics[tidx] = Quadric(TriangleMesh::ComputeTrianglePlane(
+                                             vertex0, vertex1, vertex2),
+                                     TriangleMesh::ComputeTriangleArea(
+                                             vertex0, vertex1, vertex2));
+        }
+        for (int64_t tidx = 0; tidx < num_triangles; ++tidx) {
+            for (int k = 0; k < 3; ++k) {
+                cluster_quadrics_[vertex_clusters_[triangles[tidx](k)]] +=
+                        quadrics[tidx];
+            }
+        }
+    }
+
+    // Connect the clusters, with the smallest cluster index first.
+    for (const Eigen::Vector3i &triangle : triangles) {
+        int vidx0 = vertex_clusters_[triangle(0)];
+        int vidx1 = vertex_clusters_[triangle(1)];
+        int vidx2 = vertex_clusters_[triangle(2)];
+        if (vidx0 == vidx1 || vidx0 == vidx2 || vidx1 == vidx2) {
+            continue;
+        }
+        Eigen::Vector3i cluster_triangle(vidx0, vidx1, vidx2);
+        if (vidx1 < vidx0 && vidx1 < vidx2) {
+            cluster_triangle = Eigen::Vector3i(vidx1, vidx2, vidx0);
+        } else if (vidx2 < vidx0 && vidx2 < vidx1) {
+            cluster_triangle = Eigen::Vector3i(vidx2, vidx0, vidx1);
+        }
+        if (triangle_set_.insert(cluster_triangle).second) {
+            triangles_.push_back(cluster_triangle);
+        }
+    }
+}
+
+std::shared_ptr<TriangleMesh> StreamingVertexClustering::GetSimplifiedMesh()
+        const {
+    auto mesh = std::make_shared<TriangleMesh>();
+    const int64_t num_clusters = int64_t(cluster_sizes_.size());
+    mesh->vertices_.resize(num_clusters);
+    if (has_vertex_normals_) {
+        mesh->vertex_normals_.resize(num_clusters);
+    }
+    if (has_vertex_colors_) {
+        mesh->vertex_colors_.resize(num_clusters);
+    }
+    const bool is_quadric =
+            contraction_ == MeshBase::SimplificationContraction::Quadric;
+#pragma omp parallel for schedule(static)
+    for (int64_t cluster = 0; cluster < num_clusters; ++cluster) {
+        const double size = double(cluster_sizes_[cluster]);
+        if (is_quadric && cluster_quadrics_[cluster].IsInvertible()) {
+            mesh->vertices_[cluster] = cluster_quadrics_[cluster].Minimum();
+        } else {
+            mesh->vertices_[cluster] = cluster_vertex_sums_[cluster] / size;
+        }
+        if (has_vertex_normals_) {
+            mesh->vertex_normals_[cluster] =
+                    cluster_normal_sums_[cluster] / size;
+        }
+        if (has_vertex_colors_) {
+            mesh->vertex_colors_[cluster] = cluster_color_sums_[cluster] / size;
+        }
+    }
+    mesh->triangles_ = triangles_;
+    return mesh;
+}
+
+}  // namespace geometry
+}  // namespace open3d
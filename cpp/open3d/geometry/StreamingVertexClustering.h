@@ -0,0 +1,124 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+#include <memory>
+#include <unordered_map>
+#include <unordered_set>
+#include <vector>
+
+#include "open3d/geometry/Quadric.h"
+#include "open3d/geometry/TriangleMesh.h"
+#include "open3d/utility/Helper.h"
+
+namespace open3d {
+namespace geometry {
+
+/// \class StreamingVertexClustering
+///
+/// \brief Vertex clustering simplification of a mesh that is received chunk
+/// by chunk, for meshes that do not fit in memory.
+///
+/// Vertices are pooled in the cells of a grid anchored at an origin, as in
+/// TriangleMesh::SimplifyVertexClustering. The mesh is added as a stream of
+/// vertex chunks and triangle chunks, where the triangles index all vertices
+/// added before them. Only the clusters and the simplified triangles are
+/// kept, plus a 4 byte cluster index per input vertex, and its position in
+/// single precision for the Quadric contraction. Input triangles, normals
+/// and colors are never stored.
+class StreamingVertexClustering {
+public:
+    /// \brief Parameterized Constructor.
+    ///
+    /// \param voxel_size The size of the voxel within vertices are pooled.
+    /// \param contraction Method to aggregate vertex information. Average
+    /// computes a simple average, Quadric minimizes the distance to the
+    /// adjacent planes.
+    /// \param origin Corner of the voxel (0, 0, 0) of the grid.
+    StreamingVertexClustering(
+            double voxel_size,
+            MeshBase::SimplificationContraction contraction =
+                    MeshBase::SimplificationContraction::Average,
+            const Eigen::Vector3d &origin = Eigen::Vector3d::Zero());
+    ~StreamingVertexClustering() {}
+
+public:
+    /// \brief Adds a chunk of vertices, indexed after the previous ones.
+    ///
+    /// \param vertices Positions of the vertices.
+    /// \param vertex_normals Normals of the vertices, or empty. Either all or
+    /// no chunks have normals.
+    /// \param vertex_colors Colors of the vertices, or empty. Either all or
+    /// no chunks have colors.
+    void AddVertices(const std::vector<Eigen::Vector3d> &vertices,
+                     const std::vector<Eigen::Vector3d> &vertex_normals = {},
+                     const std::vector<Eigen::Vector3d> &vertex_colors = {});
+
+    /// \brief Adds a chunk of triangles, indexing the vertices added so far.
+    void AddTriangles(const std::vector<Eigen::Vector3i> &triangles);
+
+    /// Returns the number of vertices added so far.
+    size_t GetNumberOfInputVertices() const { return vertex_clusters_.size(); }
+
+    /// Returns the simplified mesh of the vertices and triangles added so
+    /// far.
+    std::shared_ptr<TriangleMesh> GetSimplifiedMesh() const;
+
+protected:
+    double voxel_size_;
+    MeshBase::SimplificationContraction contraction_;
+    Eigen::Vector3d origin_;
+    bool has_vertex_normals_ = false;
+    bool has_vertex_colors_ = false;
+
+    /// Cluster of every input vertex.
+    std::vector<int> vertex_clusters_;
+    /// Position of every input vertex, for the Quadric contraction only.
+    std::vector<Eigen::Vector3f> vertex_positions_;
+
+    /// Cluster of every voxel holding vertices.
+    std::unordered_map<Eigen::Vector3i,
+                       int,
+                       utility::hash_eigen<Eigen::Vector3i>>
+            voxel_clusters_;
+    /// Number of vertices, sums of positions, normals and colors, and error
+    /// quadric of every cluster.
+    std::vector<int64_t> cluster_sizes_;
+    std::vector<Eigen::Vector3d> cluster_vertex_sums_;
+    std::vector<Eigen::Vector3d> cluster_normal_sums_;
+    std::vector<Eigen::Vector3d> cluster_color_sums_;
+    std::vector<Quadric> cluster_quadrics_;
+
+    /// Triangles between three different clusters, in order of insertion.
+    std::vector<Eigen::Vector3i> triangles_;
+    std::unordered_set<Eigen::Vector3i, utility::hash_eigen<Eigen::Vector3i>>
+            triangle_set_;
+};
+
+}  // namespace geometry
+}  // namespace open3d
@@ -25,166 +25,97 @@
 // ----------------------------------------------------------------------------
 
 #include <Eigen/Dense>
-#include <iostream>
-#include <list>
+#include <algorithm>
+#include <cmath>
+#include <deque>
+#include <limits>
+#include <memory>
+#include <numeric>
+#include <unordered_map>
 
 #include "open3d/geometry/IntersectionTest.h"
 #include "open3d/geometry/KDTreeFlann.h"
 #include "open3d/geometry/PointCloud.h"
 #include "open3d/geometry/TriangleMesh.h"
+#include "open3d/geometry/VoxelGrouping.h"
 #include "open3d/utility/Console.h"
+#include "open3d/utility/Helper.h"
 
 namespace open3d {
 namespace geometry {
 
-class BallPivotingVertex;
-class BallPivotingEdge;
-class BallPivotingTriangle;
-
-typedef BallPivotingVertex* BallPivotingVertexPtr;
-typedef std::shared_ptr<BallPivotingEdge> BallPivotingEdgePtr;
-typedef std::shared_ptr<BallPivotingTriangle> BallPivotingTrianglePtr;
-
-class BallPivotingVertex {
-public:
-    enum Type { Orphan = 0, Front = 1, Inner = 2 };
-
-    BallPivotingVertex(int idx,
-                       const Eigen::Vector3d& point,
-                       const Eigen::Vector3d& normal)
-        : idx_(idx), point_(point), normal_(normal), type_(Orphan) {}
-
-    void UpdateType();
-
-public:
-    int idx_;
-    const Eigen::Vector3d& point_;
-    const Eigen::Vector3d& normal_;
-    std::unordered_set<BallPivotingEdgePtr> edges_;
-    Type type_;
-};
-
-class BallPivotingEdge {
-public:
-    enum Type { Border = 0, Front = 1, Inner = 2 };
-
-    BallPivotingEdge(BallPivotingVertexPtr source, BallPivotingVertexPtr target)
-        : source_(source), target_(target), type_(Type::Front) {}
-
-    void AddAdjacentTriangle(BallPivotingTrianglePtr triangle);
-    BallPivotingVertexPtr GetOppositeVertex();
-
-public:
-    BallPivotingVertexPtr source_;
-    BallPivotingVertexPtr target_;
-    BallPivotingTrianglePtr triangle0_;
-    BallPivotingTrianglePtr triangle1_;
-    Type type_;
-};
-
-class BallPivotingTriangle {
+/// \class BallPivoting
+///
+/// \brief Ball pivoting on a point cloud, with the vertices, edges and
+/// triangles of the front stored in index based arrays.
+///
+/// The edges of a vertex form a linked list through the edges, starting at
+/// vertex_edges_[vertex], see Edge::source_next_ and Edge::target_next_.
+class BallPivoting {
 public:
-    BallPivotingTriangle(BallPivotingVertexPtr vert0,
-                         BallPivotingVertexPtr vert1,
-                         BallPivotingVertexPtr vert2,
-                         Eigen::Vector3d ball_center)
-        : vert0_(vert0),
-          vert1_(vert1),
-          vert2_(vert2),
-          ball_center_(ball_center) {}
+    enum class VertexType : uint8_t { Orphan = 0, Front = 1, Inner = 2 };
+    enum class EdgeType : uint8_t { Border = 0, Front = 1, Inner = 2 };
+
+    struct Edge {
+        Edge(int source, int target) : source_(source), target_(target) {}
+
+        int source_;
+        int target_;
+        /// Next edge of the source vertex, -1 for the last one.
+        int source_next_ = -1;
+        /// Next edge of the target vertex, -1 for the last one.
+        int target_next_ = -1;
+        int triangle0_ = -1;
+        int triangle1_ = -1;
+        EdgeType type_ = EdgeType::Front;
+    };
+
+    struct Triangle {
+        Triangle(int vert0, int vert1, int vert2, const Eigen::Vector3d &center)
+            : vert0_(vert0),
+              vert1_(vert1),
+              vert2_(vert2),
+              ball_center_(center) {}
+
+        int vert0_;
+        int vert1_;
+        int vert2_;
+        Eigen::Vector3d ball_center_;
+    };
 
 public:
-    BallPivotingVertexPtr vert0_;
-    BallPivotingVertexPtr vert1_;
-    BallPivotingVertexPtr vert2_;
-    Eigen::Vector3d ball_center_;
-};
-
-void BallPivotingVertex::UpdateType() {
-    if (edges_.empty()) {
-        type_ = Type::Orphan;
-    } else {
-        for (const BallPivotingEdgePtr& edge : edges_) {
-            if (edge->type_ != BallPivotingEdge::Type::Inner) {
-                type_ = Type::Front;
-                return;
-            }
-        }
-        type_ = Type::Inner;
+    BallPivoting(const PointCloud &pcd)
+        : points_(pcd.points_),
+          normals_(pcd.normals_),
+          kdtree_(pcd),
+          vertex_types_(pcd.points_.size(), VertexType::Orphan),
+          vertex_edges_(pcd.points_.size(), -1) {
+        owned_min_bound_.setConstant(-std::numeric_limits<double>::infinity());
+        owned_max_bound_.setConstant(std::numeric_limits<double>::infinity());
     }
-}
 
-void BallPivotingEdge::AddAdjacentTriangle(BallPivotingTrianglePtr triangle) {
-    if (triangle != triangle0_ && triangle != triangle1_) {
-        if (triangle0_ == nullptr) {
-            triangle0_ = triangle;
-            type_ = Type::Front;
-            // update orientation
-            BallPivotingVertexPtr opp = GetOppositeVertex();
-            Eigen::Vector3d tr_norm =
-                    (target_->point_ - source_->point_)
-                            .cross(opp->point_ - source_->point_);
-            tr_norm /= tr_norm.norm();
-            Eigen::Vector3d pt_norm =
-                    source_->normal_ + target_->normal_ + opp->normal_;
-            pt_norm /= pt_norm.norm();
-            if (pt_norm.dot(tr_norm) < 0) {
-                std::swap(target_, source_);
-            }
-        } else if (triangle1_ == nullptr) {
-            triangle1_ = triangle;
-            type_ = Type::Inner;
-        } else {
-            utility::LogDebug("!!! This case should not happen");
-        }
-    }
-}
-
-BallPivotingVertexPtr BallPivotingEdge::GetOppositeVertex() {
-    if (triangle0_ != nullptr) {
-        if (triangle0_->vert0_->idx_ != source_->idx_ &&
-            triangle0_->vert0_->idx_ != target_->idx_) {
-            return triangle0_->vert0_;
-        } else if (triangle0_->vert1_->idx_ != source_->idx_ &&
-                   triangle0_->vert1_->idx_ != target_->idx_) {
-            return triangle0_->vert1_;
-        } else {
-            return triangle0_->vert2_;
-        }
-    } else {
-        return nullptr;
-    }
-}
-
-class BallPivoting {
-public:
-    BallPivoting(const PointCloud& pcd)
-        : has_normals_(pcd.HasNormals()), kdtree_(pcd) {
-        mesh_ = std::make_shared<TriangleMesh>();
-        mesh_->vertices_ = pcd.points_;
-        mesh_->vertex_normals_ = pcd.normals_;
-        mesh_->vertex_colors_ = pcd.colors_;
-        for (size_t vidx = 0; vidx < pcd.points_.size(); ++vidx) {
-            vertices.emplace_back(new BallPivotingVertex(static_cast<int>(vidx),
-                                                         pcd.points_[vidx],
-                                                         pcd.normals_[vidx]));
-        }
+    /// Only create triangles whose ball center is inside the box from
+    /// \p min_bound to \p max_bound. The edges whose next triangle is outside
+    /// are left in the front.
+    void SetOwnedBox(const Eigen::Vector3d &min_bound,
+                     const Eigen::Vector3d &max_bound) {
+        owned_min_bound_ = min_bound;
+        owned_max_bound_ = max_bound;
     }
 
-    virtual ~BallPivoting() {
-        for (auto vert : vertices) {
-            delete vert;
-        }
+    bool Owns(const Eigen::Vector3d &center) const {
+        return (center.array() >= owned_min_bound_.array()).all() &&
+               (center.array() < owned_max_bound_.array()).all();
     }
 
     bool ComputeBallCenter(int vidx1,
                            int vidx2,
                            int vidx3,
                            double radius,
-                           Eigen::Vector3d& center) {
-        const Eigen::Vector3d& v1 = vertices[vidx1]->point_;
-        const Eigen::Vector3d& v2 = vertices[vidx2]->point_;
-        const Eigen::Vector3d& v3 = vertices[vidx3]->point_;
+                           Eigen::Vector3d &center) const {
+        const Eigen::Vector3d &v1 = points_[vidx1];
+        const Eigen::Vector3d &v2 = points_[vidx2];
+        const Eigen::Vector3d &v3 = points_[vidx3];
         double c = (v2 - v1).squaredNorm();
         double b = (v1 - v3).squaredNorm();
         double a = (v3 - v2).squaredNorm();
@@ -215,9 +146,8 @@ public:
         if (height >= 0.0) {
             Eigen::Vector3d tr_norm = (v2 - v1).cross(v3 - v1);
             tr_norm /= tr_norm.norm();
-            Eigen::Vector3d pt_norm = vertices[vidx1]->normal_ +
-                                      vertices[vidx2]->normal_ +
-                                      vertices[vidx3]->normal_;
+            Eigen::Vector3d pt_norm =
+                    normals_[vidx1] + normals_[vidx2] + normals_[vidx3];
             pt_norm /= pt_norm.norm();
             if (tr_norm.dot(pt_norm) < 0) {
                 tr_norm *= -1;
@@ -230,72 +160,112 @@ public:
         return false;
     }
 
-    BallPivotingEdgePtr GetLinkingEdge(const BallPivotingVertexPtr& v0,
-                                       const BallPivotingVertexPtr& v1) {
-        for (BallPivotingEdgePtr edge0 : v0->edges_) {
-            for (BallPivotingEdgePtr edge1 : v1->edges_) {
-                if (edge0->source_->idx_ == edge1->source_->idx_ &&
-                    edge0->target_->idx_ == edge1->target_->idx_) {
-                    return edge0;
-                }
+    int NextEdge(int eidx, int vidx) const {
+        const Edge &edge = edges_[eidx];
+        return edge.source_ == vidx ? edge.source_next_ : edge.target_next_;
+    }
+
+    int GetLinkingEdge(int v0, int v1) const {
+        for (int eidx = vertex_edges_[v0]; eidx != -1;
+             eidx = NextEdge(eidx, v0)) {
+            if (edges_[eidx].source_ == v1 || edges_[eidx].target_ == v1) {
+                return eidx;
             }
         }
-        return nullptr;
+        return -1;
     }
 
-    void CreateTriangle(const BallPivotingVertexPtr& v0,
-                        const BallPivotingVertexPtr& v1,
-                        const BallPivotingVertexPtr& v2,
-                        const Eigen::Vector3d& center) {
-        utility::LogDebug(
-                "[CreateTriangle] with v0.idx={}, v1.idx={}, v2.idx={}",
-                v0->idx_, v1->idx_, v2->idx_);
-        BallPivotingTrianglePtr triangle =
-                std::make_shared<BallPivotingTriangle>(v0, v1, v2, center);
-
-        BallPivotingEdgePtr e0 = GetLinkingEdge(v0, v1);
-        if (e0 == nullptr) {
-            e0 = std::make_shared<BallPivotingEdge>(v0, v1);
-        }
-        e0->AddAdjacentTriangle(triangle);
-        v0->edges_.insert(e0);
-        v1->edges_.insert(e0);
-
-        BallPivotingEdgePtr e1 = GetLinkingEdge(v1, v2);
-        if (e1 == nullptr) {
-            e1 = std::make_shared<BallPivotingEdge>(v1, v2);
-        }
-        e1->AddAdjacentTriangle(triangle);
-        v1->edges_.insert(e1);
-        v2->edges_.insert(e1);
-
-        BallPivotingEdgePtr e2 = GetLinkingEdge(v2, v0);
-        if (e2 == nullptr) {
-            e2 = std::make_shared<BallPivotingEdge>(v2, v0);
-        }
-        e2->AddAdjacentTriangle(triangle);
-        v2->edges_.insert(e2);
-        v0->edges_.insert(e2);
-
-        v0->UpdateType();
-        v1->UpdateType();
-        v2->UpdateType();
-
-        Eigen::Vector3d face_normal =
-                ComputeFaceNormal(v0->point_, v1->point_, v2->point_);
-        if (face_normal.dot(v0->normal_) > -1e-16) {
-            mesh_->triangles_.emplace_back(
-                    Eigen::Vector3i(v0->idx_, v1->idx_, v2->idx_));
+    int GetOppositeVertex(int eidx) const {
+        const Edge &edge = edges_[eidx];
+        if (edge.triangle0_ == -1) {
+            return -1;
+        }
+        const Triangle &triangle = triangles_[edge.triangle0_];
+        if (triangle.vert0_ != edge.source_ &&
+            triangle.vert0_ != edge.target_) {
+            return triangle.vert0_;
+        } else if (triangle.vert1_ != edge.source_ &&
+                   triangle.vert1_ != edge.target_) {
+            return triangle.vert1_;
         } else {
-            mesh_->triangles_.emplace_back(
-                    Eigen::Vector3i(v0->idx_, v2->idx_, v1->idx_));
+            return triangle.vert2_;
+        }
+    }
+
+    void UpdateVertexType(int vidx) {
+        if (vertex_edges_[vidx] == -1) {
+            vertex_types_[vidx] = VertexType::Orphan;
+            return;
+        }
+        for (int eidx = vertex_edges_[vidx]; eidx != -1;
+             eidx = NextEdge(eidx, vidx)) {
+            if (edges_[eidx].type_ != EdgeType::Inner) {
+                vertex_types_[vidx] = VertexType::Front;
+                return;
+            }
+        }
+        vertex_types_[vidx] = VertexType::Inner;
+    }
+
+    void AddAdjacentTriangle(int eidx, int tidx) {
+        Edge &edge = edges_[eidx];
+        if (tidx != edge.triangle0_ && tidx != edge.triangle1_) {
+            if (edge.triangle0_ == -1) {
+                edge.triangle0_ = tidx;
+                edge.type_ = EdgeType::Front;
+                // update orientation
+                const int opp = GetOppositeVertex(eidx);
+                Eigen::Vector3d tr_norm =
+                        (points_[edge.target_] - points_[edge.source_])
+                                .cross(points_[opp] - points_[edge.source_]);
+                tr_norm /= tr_norm.norm();
+                Eigen::Vector3d pt_norm = normals_[edge.source_] +
+                                          normals_[edge.target_] +
+                                          normals_[opp];
+                pt_norm /= pt_norm.norm();
+                if (pt_norm.dot(tr_norm) < 0) {
+                    std::swap(edge.target_, edge.source_);
+                    std::swap(edge.target_next_, edge.source_next_);
+                }
+            } else if (edge.triangle1_ == -1) {
+                edge.triangle1_ = tidx;
+                edge.type_ = EdgeType::Inner;
+            } else {
+                utility::LogDebug("!!! This case should not happen");
+            }
+        }
+    }
+
+    int GetOrCreateEdge(int v0, int v1) {
+        int eidx = GetLinkingEdge(v0, v1);
+        if (eidx == -1) {
+            eidx = int(edges_.size());
+            edges_.emplace_back(v0, v1);
+            edges_.back().source_next_ = vertex_edges_[v0];
+            edges_.back().target_next_ = vertex_edges_[v1];
+            vertex_edges_[v0] = eidx;
+            vertex_edges_[v1] = eidx;
         }
-        mesh_->triangle_normals_.push_back(face_normal);
+        return eidx;
     }
 
-    Eigen::Vector3d ComputeFaceNormal(const Eigen::Vector3d& v0,
-                                      const Eigen::Vector3d& v1,
-                                      const Eigen::Vector3d& v2) {
+    void CreateTriangle(int v0, int v1, int v2, const Eigen::Vector3d &center) {
+        utility::LogDebug(
+                "[CreateTriangle] with v0.idx={}, v1.idx={}, v2.idx={}", v0, v1,
+                v2);
+        const int tidx = int(triangles_.size());
+        triangles_.emplace_back(v0, v1, v2, center);
+        AddAdjacentTriangle(GetOrCreateEdge(v0, v1), tidx);
+        AddAdjacentTriangle(GetOrCreateEdge(v1, v2), tidx);
+        AddAdjacentTriangle(GetOrCreateEdge(v2, v0), tidx);
+        UpdateVertexType(v0);
+        UpdateVertexType(v1);
+        UpdateVertexType(v2);
+    }
+
+    static Eigen::Vector3d ComputeFaceNormal(const Eigen::Vector3d &v0,
+                                             const Eigen::Vector3d &v1,
+                                             const Eigen::Vector3d &v2) {
         Eigen::Vector3d normal = (v1 - v0).cross(v2 - v0);
         double norm = normal.norm();
         if (norm > 0) {
@@ -304,121 +274,83 @@ public:
         return normal;
     }
 
-    bool IsCompatible(const BallPivotingVertexPtr& v0,
-                      const BallPivotingVertexPtr& v1,
-                      const BallPivotingVertexPtr& v2) {
-        utility::LogDebug("[IsCompatible] v0.idx={}, v1.idx={}, v2.idx={}",
-                          v0->idx_, v1->idx_, v2->idx_);
+    bool IsCompatible(int v0, int v1, int v2) const {
+        utility::LogDebug("[IsCompatible] v0.idx={}, v1.idx={}, v2.idx={}", v0,
+                          v1, v2);
         Eigen::Vector3d normal =
-                ComputeFaceNormal(v0->point_, v1->point_, v2->point_);
-        if (normal.dot(v0->normal_) < -1e-16) {
+                ComputeFaceNormal(points_[v0], points_[v1], points_[v2]);
+        if (normal.dot(normals_[v0]) < -1e-16) {
             normal *= -1;
         }
-        bool ret = normal.dot(v0->normal_) > -1e-16 &&
-                   normal.dot(v1->normal_) > -1e-16 &&
-                   normal.dot(v2->normal_) > -1e-16;
+        bool ret = normal.dot(normals_[v0]) > -1e-16 &&
+                   normal.dot(normals_[v1]) > -1e-16 &&
+                   normal.dot(normals_[v2]) > -1e-16;
         utility::LogDebug("[IsCompatible] returns = {}", ret);
         return ret;
     }
 
-    BallPivotingVertexPtr FindCandidateVertex(
-            const BallPivotingEdgePtr& edge,
-            double radius,
-            Eigen::Vector3d& candidate_center) {
-        utility::LogDebug("[FindCandidateVertex] edge=({}, {}), radius={}",
-                          edge->source_->idx_, edge->target_->idx_, radius);
-        BallPivotingVertexPtr src = edge->source_;
-        BallPivotingVertexPtr tgt = edge->target_;
-
-        const BallPivotingVertexPtr opp = edge->GetOppositeVertex();
-        utility::LogDebug("[FindCandidateVertex] edge=({}, {}), opp={}",
-                          src->idx_, tgt->idx_, opp->idx_);
-        utility::LogDebug("[FindCandidateVertex] src={} => {}", src->idx_,
-                          src->point_.transpose());
-        utility::LogDebug("[FindCandidateVertex] tgt={} => {}", tgt->idx_,
-                          tgt->point_.transpose());
-        utility::LogDebug("[FindCandidateVertex] src={} => {}", opp->idx_,
-                          opp->point_.transpose());
-
-        Eigen::Vector3d mp = 0.5 * (src->point_ + tgt->point_);
-        utility::LogDebug("[FindCandidateVertex] edge=({}, {}), mp={}",
-                          edge->source_->idx_, edge->target_->idx_,
-                          mp.transpose());
-
-        BallPivotingTrianglePtr triangle = edge->triangle0_;
-        const Eigen::Vector3d& center = triangle->ball_center_;
-        utility::LogDebug("[FindCandidateVertex] edge=({}, {}), center={}",
-                          edge->source_->idx_, edge->target_->idx_,
-                          center.transpose());
-
-        Eigen::Vector3d v = tgt->point_ - src->point_;
+    int FindCandidateVertex(int eidx,
+                            double radius,
+                            Eigen::Vector3d &candidate_center) {
+        const int src = edges_[eidx].source_;
+        const int tgt = edges_[eidx].target_;
+        const int opp = GetOppositeVertex(eidx);
+        utility::LogDebug("[FindCandidateVertex] edge=({}, {}), opp={}", src,
+                          tgt, opp);
+
+        Eigen::Vector3d mp = 0.5 * (points_[src] + points_[tgt]);
+        const Eigen::Vector3d &center =
+                triangles_[edges_[eidx].triangle0_].ball_center_;
+
+        Eigen::Vector3d v = points_[tgt] - points_[src];
         v /= v.norm();
 
         Eigen::Vector3d a = center - mp;
         a /= a.norm();
 
-        std::vector<int> indices;
-        std::vector<double> dists2;
-        kdtree_.SearchRadius(mp, 2 * radius, indices, dists2);
+        std::vector<int> &indices = candidate_indices_;
+        kdtree_.SearchRadius(mp, 2 * radius, indices, candidate_dists2_);
         utility::LogDebug("[FindCandidateVertex] found {} potential candidates",
                           indices.size());
 
-        BallPivotingVertexPtr min_candidate = nullptr;
+        int min_candidate = -1;
         double min_angle = 2 * M_PI;
-        for (auto nbidx : indices) {
-            utility::LogDebug("[FindCandidateVertex] nbidx {:d}", nbidx);
-            const BallPivotingVertexPtr& candidate = vertices[nbidx];
-            if (candidate->idx_ == src->idx_ || candidate->idx_ == tgt->idx_ ||
-                candidate->idx_ == opp->idx_) {
-                utility::LogDebug(
-                        "[FindCandidateVertex] candidate {:d} is a triangle "
-                        "vertex of the edge",
-                        candidate->idx_);
+        for (int candidate : indices) {
+            if (candidate == src || candidate == tgt || candidate == opp) {
                 continue;
             }
-            utility::LogDebug("[FindCandidateVertex] candidate={:d} => {}",
-                              candidate->idx_, candidate->point_.transpose());
 
             bool coplanar = IntersectionTest::PointsCoplanar(
-                    src->point_, tgt->point_, opp->point_, candidate->point_);
+                    points_[src], points_[tgt], points_[opp],
+                    points_[candidate]);
             if (coplanar && (IntersectionTest::LineSegmentsMinimumDistance(
-                                     mp, candidate->point_, src->point_,
-                                     opp->point_) < 1e-12 ||
+                                     mp, points_[candidate], points_[src],
+                                     points_[opp]) < 1e-12 ||
                              IntersectionTest::LineSegmentsMinimumDistance(
-                                     mp, candidate->point_, tgt->point_,
-                                     opp->point_) < 1e-12)) {
+                                     mp, points_[candidate], points_[tgt],
+                                     points_[opp]) < 1e-12)) {
                 utility::LogDebug(
                         "[FindCandidateVertex] candidate {:d} is intersecting "
                         "the existing triangle",
-                        candidate->idx_);
+                        candidate);
                 continue;
             }
 
             Eigen::Vector3d new_center;
-            if (!ComputeBallCenter(src->idx_, tgt->idx_, candidate->idx_,
-                                   radius, new_center)) {
+            if (!ComputeBallCenter(src, tgt, candidate, radius, new_center)) {
                 utility::LogDebug(
                         "[FindCandidateVertex] candidate {:d} can not compute "
                         "ball",
-                        candidate->idx_);
+                        candidate);
                 continue;
             }
-            utility::LogDebug("[FindCandidateVertex] candidate {:d} center={}",
-                              candidate->idx_, new_center.transpose());
 
             Eigen::Vector3d b = new_center - mp;
             b /= b.norm();
-            utility::LogDebug(
-                    "[FindCandidateVertex] candidate {:d} v={}, a={}, b={}",
-                    candidate->idx_, v.transpose(), a.transpose(),
-                    b.transpose());
 
             double cosinus = a.dot(b);
             cosinus = std::min(cosinus, 1.0);
             cosinus = std::max(cosinus, -1.0);
-            utility::LogDebug(
-                    "[FindCandidateVertex] candidate {:d} cosinus={:f}",
-                    candidate->idx_, cosinus);
 
             double angle = std::acos(cosinus);
 
@@ -431,22 +363,20 @@ public:
                 utility::LogDebug(
                         "[FindCandidateVertex] candidate {:d} angle {:f} > "
                         "min_angle {:f}",
-                        candidate->idx_, angle, min_angle);
+                        candidate, angle, min_angle);
                 continue;
             }
 
             bool empty_ball = true;
-            for (auto nbidx2 : indices) {
-                const BallPivotingVertexPtr& nb = vertices[nbidx2];
-                if (nb->idx_ == src->idx_ || nb->idx_ == tgt->idx_ ||
-                    nb->idx_ == candidate->idx_) {
+            for (int nb : indices) {
+                if (nb == src || nb == tgt || nb == candidate) {
                     continue;
                 }
-                if ((new_center - nb->point_).norm() < radius - 1e-16) {
+                if ((new_center - points_[nb]).norm() < radius - 1e-16) {
                     utility::LogDebug(
                             "[FindCandidateVertex] candidate {:d} not an empty "
                             "ball",
-                            candidate->idx_);
+                            candidate);
                     empty_ball = false;
                     break;
                 }
@@ -454,95 +384,95 @@ public:
 
             if (empty_ball) {
                 utility::LogDebug("[FindCandidateVertex] candidate {:d} works",
-                                  candidate->idx_);
+                                  candidate);
                 min_angle = angle;
-                min_candidate = vertices[nbidx];
+                min_candidate = candidate;
                 candidate_center = new_center;
             }
         }
 
-        if (min_candidate == nullptr) {
-            utility::LogDebug("[FindCandidateVertex] returns nullptr");
-        } else {
-            utility::LogDebug("[FindCandidateVertex] returns {:d}",
-                              min_candidate->idx_);
-        }
+        utility::LogDebug("[FindCandidateVertex] returns {:d}", min_candidate);
         return min_candidate;
     }
 
     void ExpandTriangulation(double radius) {
         utility::LogDebug("[ExpandTriangulation] radius={}", radius);
         while (!edge_front_.empty()) {
-            BallPivotingEdgePtr edge = edge_front_.front();
+            const int eidx = edge_front_.front();
             edge_front_.pop_front();
-            if (edge->type_ != BallPivotingEdge::Front) {
+            if (edges_[eidx].type_ != EdgeType::Front) {
                 continue;
             }
 
             Eigen::Vector3d center;
-            BallPivotingVertexPtr candidate =
-                    FindCandidateVertex(edge, radius, center);
-            if (candidate == nullptr ||
-                candidate->type_ == BallPivotingVertex::Type::Inner ||
-                !IsCompatible(candidate, edge->source_, edge->target_)) {
-                edge->type_ = BallPivotingEdge::Type::Border;
-                border_edges_.push_back(edge);
+            const int candidate = FindCandidateVertex(eidx, radius, center);
+            if (candidate != -1 && !Owns(center)) {
+                // Left in the front for the owner of the next triangle.
+                continue;
+            }
+            const int src = edges_[eidx].source_;
+            const int tgt = edges_[eidx].target_;
+            if (candidate == -1 ||
+                vertex_types_[candidate] == VertexType::Inner ||
+                !IsCompatible(candidate, src, tgt)) {
+                edges_[eidx].type_ = EdgeType::Border;
+                border_edges_.push_back(eidx);
                 continue;
             }
 
-            BallPivotingEdgePtr e0 = GetLinkingEdge(candidate, edge->source_);
-            BallPivotingEdgePtr e1 = GetLinkingEdge(candidate, edge->target_);
-            if ((e0 != nullptr && e0->type_ != BallPivotingEdge::Type::Front) ||
-                (e1 != nullptr && e1->type_ != BallPivotingEdge::Type::Front)) {
-                edge->type_ = BallPivotingEdge::Type::Border;
-                border_edges_.push_back(edge);
+            int e0 = GetLinkingEdge(candidate, src);
+            int e1 = GetLinkingEdge(candidate, tgt);
+            if ((e0 != -1 && edges_[e0].type_ != EdgeType::Front) ||
+                (e1 != -1 && edges_[e1].type_ != EdgeType::Front)) {
+                edges_[eidx].type_ = EdgeType::Border;
+                border_edges_.push_back(eidx);
                 continue;
             }
 
-            CreateTriangle(edge->source_, edge->target_, candidate, center);
+            CreateTriangle(src, tgt, candidate, center);
 
-            e0 = GetLinkingEdge(candidate, edge->source_);
-            e1 = GetLinkingEdge(candidate, edge->target_);
-            if (e0->type_ == BallPivotingEdge::Type::Front) {
+            e0 = GetLinkingEdge(candidate, src);
+            e1 = GetLinkingEdge(candidate, tgt);
+            if (edges_[e0].type_ == EdgeType::Front) {
                 edge_front_.push_front(e0);
             }
-            if (e1->type_ == BallPivotingEdge::Type::Front) {
+            if (edges_[e1].type_ == EdgeType::Front) {
                 edge_front_.push_front(e1);
             }
         }
     }
 
-    bool TryTriangleSeed(const BallPivotingVertexPtr& v0,
-                         const BallPivotingVertexPtr& v1,
-                         const BallPivotingVertexPtr& v2,
-                         const std::vector<int>& nb_indices,
+    bool TryTriangleSeed(int v0,
+                         int v1,
+                         int v2,
+                         const std::vector<int> &nb_indices,
                          double radius,
-                         Eigen::Vector3d& center) {
+                         Eigen::Vector3d &center) const {
         utility::LogDebug(
                 "[TryTriangleSeed] v0.idx={}, v1.idx={}, v2.idx={}, "
                 "radius={}",
-                v0->idx_, v1->idx_, v2->idx_, radius);
+                v0, v1, v2, radius);
 
         if (!IsCompatible(v0, v1, v2)) {
             return false;
         }
 
-        BallPivotingEdgePtr e0 = GetLinkingEdge(v0, v2);
-        BallPivotingEdgePtr e1 = GetLinkingEdge(v1, v2);
-        if (e0 != nullptr && e0->type_ == BallPivotingEdge::Type::Inner) {
+        const int e0 = GetLinkingEdge(v0, v2);
+        const int e1 = GetLinkingEdge(v1, v2);
+        if (e0 != -1 && edges_[e0].type_ == EdgeType::Inner) {
             utility::LogDebug(
                     "[TryTriangleSeed] returns {} because e0 is inner edge",
                     false);
             return false;
         }
-        if (e1 != nullptr && e1->type_ == BallPivotingEdge::Type::Inner) {
+        if (e1 != -1 && edges_[e1].type_ == EdgeType::Inner) {
             utility::LogDebug(
                     "[TryTriangleSeed] returns {} because e1 is inner edge",
                     false);
             return false;
         }
 
-        if (!ComputeBallCenter(v0->idx_, v1->idx_, v2->idx_, radius, center)) {
+        if (!ComputeBallCenter(v0, v1, v2, radius, center) || !Owns(center)) {
             utility::LogDebug(
                     "[TryTriangleSeed] returns {} could not compute ball "
                     "center",
@@ -551,13 +481,11 @@ public:
         }
 
         // test if no other point is within the ball
-        for (const auto& nbidx : nb_indices) {
-            const BallPivotingVertexPtr& v = vertices[nbidx];
-            if (v->idx_ == v0->idx_ || v->idx_ == v1->idx_ ||
-                v->idx_ == v2->idx_) {
+        for (int nb : nb_indices) {
+            if (nb == v0 || nb == v1 || nb == v2) {
                 continue;
             }
-            if ((center - v->point_).norm() < radius - 1e-16) {
+            if ((center - points_[nb]).norm() < radius - 1e-16) {
                 utility::LogDebug(
                         "[TryTriangleSeed] returns {} computed ball is not "
                         "empty",
@@ -570,58 +498,47 @@ public:
         return true;
     }
 
-    bool TrySeed(BallPivotingVertexPtr& v, double radius) {
-        utility::LogDebug("[TrySeed] with v.idx={}, radius={}", v->idx_,
-                          radius);
-        std::vector<int> indices;
-        std::vector<double> dists2;
-        kdtree_.SearchRadius(v->point_, 2 * radius, indices, dists2);
+    bool TrySeed(int v, double radius) {
+        utility::LogDebug("[TrySeed] with v.idx={}, radius={}", v, radius);
+        std::vector<int> &indices = seed_indices_;
+        kdtree_.SearchRadius(points_[v], 2 * radius, indices, seed_dists2_);
         if (indices.size() < 3u) {
             return false;
         }
 
         for (size_t nbidx0 = 0; nbidx0 < indices.size(); ++nbidx0) {
-            const BallPivotingVertexPtr& nb0 = vertices[indices[nbidx0]];
-            if (nb0->type_ != BallPivotingVertex::Type::Orphan) {
-                continue;
-            }
-            if (nb0->idx_ == v->idx_) {
+            const int nb0 = indices[nbidx0];
+            if (vertex_types_[nb0] != VertexType::Orphan || nb0 == v) {
                 continue;
             }
 
-            int candidate_vidx2 = -1;
+            int nb1 = -1;
             Eigen::Vector3d center;
             for (size_t nbidx1 = nbidx0 + 1; nbidx1 < indices.size();
                  ++nbidx1) {
-                const BallPivotingVertexPtr& nb1 = vertices[indices[nbidx1]];
-                if (nb1->type_ != BallPivotingVertex::Type::Orphan) {
+                const int candidate = indices[nbidx1];
+                if (vertex_types_[candidate] != VertexType::Orphan ||
+                    candidate == v) {
                     continue;
                 }
-                if (nb1->idx_ == v->idx_) {
-                    continue;
-                }
-                if (TryTriangleSeed(v, nb0, nb1, indices, radius, center)) {
-                    candidate_vidx2 = nb1->idx_;
+                if (TryTriangleSeed(v, nb0, candidate, indices, radius,
+                                    center)) {
+                    nb1 = candidate;
                     break;
                 }
             }
 
-            if (candidate_vidx2 >= 0) {
-                const BallPivotingVertexPtr& nb1 = vertices[candidate_vidx2];
-
-                BallPivotingEdgePtr e0 = GetLinkingEdge(v, nb1);
-                if (e0 != nullptr &&
-                    e0->type_ != BallPivotingEdge::Type::Front) {
+            if (nb1 >= 0) {
+                int e0 = GetLinkingEdge(v, nb1);
+                if (e0 != -1 && edges_[e0].type_ != EdgeType::Front) {
                     continue;
                 }
-                BallPivotingEdgePtr e1 = GetLinkingEdge(nb0, nb1);
-                if (e1 != nullptr &&
-                    e1->type_ != BallPivotingEdge::Type::Front) {
+                int e1 = GetLinkingEdge(nb0, nb1);
+                if (e1 != -1 && edges_[e1].type_ != EdgeType::Front) {
                     continue;
                 }
-                BallPivotingEdgePtr e2 = GetLinkingEdge(v, nb0);
-                if (e2 != nullptr &&
-                    e2->type_ != BallPivotingEdge::Type::Front) {
+                int e2 = GetLinkingEdge(v, nb0);
+                if (e2 != -1 && edges_[e2].type_ != EdgeType::Front) {
                     continue;
                 }
 
@@ -630,13 +547,13 @@ public:
                 e0 = GetLinkingEdge(v, nb1);
                 e1 = GetLinkingEdge(nb0, nb1);
                 e2 = GetLinkingEdge(v, nb0);
-                if (e0->type_ == BallPivotingEdge::Type::Front) {
+                if (edges_[e0].type_ == EdgeType::Front) {
                     edge_front_.push_front(e0);
                 }
-                if (e1->type_ == BallPivotingEdge::Type::Front) {
+                if (edges_[e1].type_ == EdgeType::Front) {
                     edge_front_.push_front(e1);
                 }
-                if (e2->type_ == BallPivotingEdge::Type::Front) {
+                if (edges_[e2].type_ == EdgeType::Front) {
                     edge_front_.push_front(e2);
                 }
 
@@ -653,103 +570,334 @@ public:
         return false;
     }
 
-    void FindSeedTriangle(double radius) {
-        for (size_t vidx = 0; vidx < vertices.size(); ++vidx) {
+    /// Try the vertices \p seed_vertices in order as seeds, and expand the
+    /// triangulation from every seed triangle.
+    void FindSeedTriangle(const std::vector<int> &seed_vertices,
+                          double radius) {
+        for (int vidx : seed_vertices) {
             utility::LogDebug("[FindSeedTriangle] with radius={}, vidx={}",
                               radius, vidx);
-            if (vertices[vidx]->type_ == BallPivotingVertex::Type::Orphan) {
-                if (TrySeed(vertices[vidx], radius)) {
+            if (vertex_types_[vidx] == VertexType::Orphan) {
+                if (TrySeed(vidx, radius)) {
                     ExpandTriangulation(radius);
                 }
             }
         }
     }
 
-    std::shared_ptr<TriangleMesh> Run(const std::vector<double>& radii) {
-        if (!has_normals_) {
-            utility::LogError("ReconstructBallPivoting requires normals");
-        }
-
-        mesh_->triangles_.clear();
-
-        for (double radius : radii) {
-            utility::LogDebug("[Run] ################################");
-            utility::LogDebug("[Run] change to radius {:.4f}", radius);
-            if (radius <= 0) {
-                utility::LogError(
-                        "got an invalid, negative radius as parameter");
-            }
+    /// Move the border edges whose triangle has an empty ball of radius
+    /// \p radius back to the front.
+    void UpdateBorderEdges(double radius) {
+        size_t num_border_edges = 0;
+        for (int eidx : border_edges_) {
+            const Triangle &triangle = triangles_[edges_[eidx].triangle0_];
+            utility::LogDebug(
+                    "[Run] try edge {:d}-{:d} of triangle {:d}-{:d}-{:d}",
+                    edges_[eidx].source_, edges_[eidx].target_, triangle.vert0_,
+                    triangle.vert1_, triangle.vert2_);
 
-            // update radius => update border edges
-            for (auto it = border_edges_.begin(); it != border_edges_.end();) {
-                BallPivotingEdgePtr edge = *it;
-                BallPivotingTrianglePtr triangle = edge->triangle0_;
-                utility::LogDebug(
-                        "[Run] try edge {:d}-{:d} of triangle {:d}-{:d}-{:d}",
-                        edge->source_->idx_, edge->target_->idx_,
-                        triangle->vert0_->idx_, triangle->vert1_->idx_,
-                        triangle->vert2_->idx_);
-
-                Eigen::Vector3d center;
-                if (ComputeBallCenter(triangle->vert0_->idx_,
-                                      triangle->vert1_->idx_,
-                                      triangle->vert2_->idx_, radius, center)) {
-                    utility::LogDebug("[Run]   yes, we can work on this");
-                    std::vector<int> indices;
-                    std::vector<double> dists2;
-                    kdtree_.SearchRadius(center, radius, indices, dists2);
-                    bool empty_ball = true;
-                    for (auto idx : indices) {
-                        if (idx != triangle->vert0_->idx_ &&
-                            idx != triangle->vert1_->idx_ &&
-                            idx != triangle->vert2_->idx_) {
-                            utility::LogDebug(
-                                    "[Run]   but no, the ball is not empty");
-                            empty_ball = false;
-                            break;
-                        }
+            Eigen::Vector3d center;
+            if (ComputeBallCenter(triangle.vert0_, triangle.vert1_,
+                                  triangle.vert2_, radius, center)) {
+                kdtree_.SearchRadius(center, radius, seed_indices_,
+                                     seed_dists2_);
+                bool empty_ball = true;
+                for (int idx : seed_indices_) {
+                    if (idx != triangle.vert0_ && idx != triangle.vert1_ &&
+                        idx != triangle.vert2_) {
+                        empty_ball = false;
+                        break;
                     }
+                }
 
-                    if (empty_ball) {
-                        utility::LogDebug(
-                                "[Run]   yeah, add edge to edge_front_: {:d}",
-                                edge_front_.size());
-                        edge->type_ = BallPivotingEdge::Type::Front;
-                        edge_front_.push_back(edge);
-                        it = border_edges_.erase(it);
-                        continue;
-                    }
+                if (empty_ball) {
+                    edges_[eidx].type_ = EdgeType::Front;
+                    edge_front_.push_back(eidx);
+                    continue;
                 }
-                ++it;
             }
+            border_edges_[num_border_edges++] = eidx;
+        }
+        border_edges_.resize(num_border_edges);
+    }
+
+    void Run(const std::vector<double> &radii,
+             const std::vector<int> &seed_vertices) {
+        for (double radius : radii) {
+            utility::LogDebug("[Run] change to radius {:.4f}", radius);
+            // update radius => update border edges
+            UpdateBorderEdges(radius);
 
             // do the reconstruction
             if (edge_front_.empty()) {
-                FindSeedTriangle(radius);
+                FindSeedTriangle(seed_vertices, radius);
             } else {
                 ExpandTriangulation(radius);
             }
+            utility::LogDebug("[Run] {:d} triangles", triangles_.size());
+        }
+    }
 
-            utility::LogDebug("[Run] mesh_ has {:d} triangles",
-                              mesh_->triangles_.size());
-            utility::LogDebug("[Run] ################################");
+    /// \brief Add a triangle found independently of the current state, unless
+    /// it would make the triangulation non-manifold or repeat a triangle.
+    bool AddTriangle(int v0, int v1, int v2, const Eigen::Vector3d &center) {
+        if (vertex_types_[v0] == VertexType::Inner ||
+            vertex_types_[v1] == VertexType::Inner ||
+            vertex_types_[v2] == VertexType::Inner) {
+            return false;
+        }
+        const int vertices[3] = {v0, v1, v2};
+        for (int k = 0; k < 3; ++k) {
+            const int eidx = GetLinkingEdge(vertices[k], vertices[(k + 1) % 3]);
+            if (eidx != -1 &&
+                (edges_[eidx].type_ == EdgeType::Inner ||
+                 GetOppositeVertex(eidx) == vertices[(k + 2) % 3])) {
+                return false;
+            }
         }
-        return mesh_;
+        CreateTriangle(v0, v1, v2, center);
+        return true;
     }
 
-private:
-    bool has_normals_;
+    /// Mesh of the triangles, with the points, normals and colors of \p pcd.
+    std::shared_ptr<TriangleMesh> CreateMesh(const PointCloud &pcd) const {
+        auto mesh = std::make_shared<TriangleMesh>();
+        mesh->vertices_ = pcd.points_;
+        mesh->vertex_normals_ = pcd.normals_;
+        mesh->vertex_colors_ = pcd.colors_;
+        const int64_t num_triangles = int64_t(triangles_.size());
+        mesh->triangles_.resize(num_triangles);
+        mesh->triangle_normals_.resize(num_triangles);
+#pragma omp parallel for schedule(static)
+        for (int64_t tidx = 0; tidx < num_triangles; ++tidx) {
+            const Triangle &triangle = triangles_[tidx];
+            const Eigen::Vector3d face_normal = ComputeFaceNormal(
+                    points_[triangle.vert0_], points_[triangle.vert1_],
+                    points_[triangle.vert2_]);
+            if (face_normal.dot(normals_[triangle.vert0_]) > -1e-16) {
+                mesh->triangles_[tidx] = Eigen::Vector3i(
+                        triangle.vert0_, triangle.vert1_, triangle.vert2_);
+            } else {
+                mesh->triangles_[tidx] = Eigen::Vector3i(
+                        triangle.vert0_, triangle.vert2_, triangle.vert1_);
+            }
+            mesh->triangle_normals_[tidx] = face_normal;
+        }
+        return mesh;
+    }
+
+public:
+    const std::vector<Eigen::Vector3d> &points_;
+    const std::vector<Eigen::Vector3d> &normals_;
     KDTreeFlann kdtree_;
-    std::list<BallPivotingEdgePtr> edge_front_;
-    std::list<BallPivotingEdgePtr> border_edges_;
-    std::vector<BallPivotingVertexPtr> vertices;
-    std::shared_ptr<TriangleMesh> mesh_;
+    std::vector<VertexType> vertex_types_;
+    /// First edge of every vertex, -1 if the vertex has no edges.
+    std::vector<int> vertex_edges_;
+    std::vector<Edge> edges_;
+    std::vector<Triangle> triangles_;
+    std::deque<int> edge_front_;
+    std::vector<int> border_edges_;
+    Eigen::Vector3d owned_min_bound_;
+    Eigen::Vector3d owned_max_bound_;
+
+private:
+    std::vector<int> candidate_indices_;
+    std::vector<double> candidate_dists2_;
+    std::vector<int> seed_indices_;
+    std::vector<double> seed_dists2_;
+};
+
+namespace {
+
+/// Number of points per block of the parallel ball pivoting, for a surface.
+constexpr double kBallPivotingBlockPoints = 1 << 14;
+
+/// Minimum size of the blocks of the parallel ball pivoting, relative to the
+/// largest radius.
+constexpr double kBallPivotingMinBlockSize = 20;
+
+/// Triangles and border edges of one block, in point cloud indices.
+struct BallPivotingBlockResult {
+    std::vector<BallPivoting::Triangle> triangles_;
+    std::vector<Eigen::Vector2i> border_edges_;
 };
 
+}  // namespace
+
 std::shared_ptr<TriangleMesh> TriangleMesh::CreateFromPointCloudBallPivoting(
-        const PointCloud& pcd, const std::vector<double>& radii) {
-    BallPivoting bp(pcd);
-    return bp.Run(radii);
+        const PointCloud &pcd,
+        const std::vector<double> &radii,
+        bool parallel /* = false */) {
+    if (!pcd.HasNormals()) {
+        utility::LogError("ReconstructBallPivoting requires normals");
+    }
+    for (double radius : radii) {
+        if (radius <= 0) {
+            utility::LogError("got an invalid, negative radius as parameter");
+        }
+    }
+    const int64_t num_points = int64_t(pcd.points_.size());
+    std::vector<int> all_vertices(num_points);
+    std::iota(all_vertices.begin(), all_vertices.end(), 0);
+
+    // Blocks of points with halos of three times the largest radius, which
+    // hold every point that the triangles of a block can be pivoted on.
+    const double max_radius =
+            radii.empty() ? 0.0 : *std::max_element(radii.begin(), radii.end());
+    const double halo = 3 * max_radius;
+    const Eigen::Vector3d min_bound = pcd.GetMinBound();
+    const double extent = (pcd.GetMaxBound() - min_bound).maxCoeff();
+    const double block_size = std::max(
+            kBallPivotingMinBlockSize * max_radius,
+            extent * std::sqrt(kBallPivotingBlockPoints / double(num_points)));
+    if (!parallel || !(block_size < extent)) {
+        BallPivoting bp(pcd);
+        bp.Run(radii, all_vertices);
+        return bp.CreateMesh(pcd);
+    }
+
+    const std::vector<Eigen::Vector3i> block_indices =
+            VoxelGrouping::ComputeVoxelIndices(pcd.points_, min_bound,
+                                               block_size);
+    std::vector<int64_t> sorted_points, block_starts;
+    VoxelGrouping::GroupPointsByVoxel(block_indices, sorted_points,
+                                      block_starts);
+    const int64_t num_blocks = int64_t(block_starts.size()) - 1;
+    std::unordered_map<Eigen::Vector3i, int64_t,
+                       utility::hash_eigen<Eigen::Vector3i>>
+            block_map;
+    block_map.reserve(num_blocks);
+    for (int64_t b = 0; b < num_blocks; ++b) {
+        block_map[block_indices[sorted_points[block_starts[b]]]] = b;
+    }
+
+    // Points closer to a neighboring block than the halo, where the blocks
+    // are stitched together.
+    std::vector<uint8_t> near_seam(num_points);
+#pragma omp parallel for schedule(static)
+    for (int64_t pidx = 0; pidx < num_points; ++pidx) {
+        const Eigen::Vector3d block_min =
+                min_bound + block_indices[pidx].cast<double>() * block_size;
+        const Eigen::Array3d offset = (pcd.points_[pidx] - block_min).array();
+        near_seam[pidx] =
+                (offset < halo).any() || (offset > block_size - halo).any();
+    }
+
+    // Ball pivoting in every block, on the points of the block and its halo,
+    // creating only the triangles whose ball center is in the block. The
+    // whole point cloud is searched by the stitching, built meanwhile.
+    std::vector<BallPivotingBlockResult> results(num_blocks);
+    std::unique_ptr<BallPivoting> stitching;
+#pragma omp parallel
+    {
+#pragma omp single nowait
+        { stitching.reset(new BallPivoting(pcd)); }
+#pragma omp for schedule(dynamic, 1)
+        for (int64_t b = 0; b < num_blocks; ++b) {
+            const Eigen::Vector3i &block =
+                    block_indices[sorted_points[block_starts[b]]];
+            const Eigen::Vector3d block_min =
+                    min_bound + block.cast<double>() * block_size;
+            const Eigen::Vector3d block_max =
+                    block_min + Eigen::Vector3d::Constant(block_size);
+            // Points of the block first, then of its halo.
+            std::vector<int> indices(
+                    sorted_points.begin() + block_starts[b],
+                    sorted_points.begin() + block_starts[b + 1]);
+            const int num_block_points = int(indices.size());
+            for (int x = -1; x <= 1; ++x) {
+                for (int y = -1; y <= 1; ++y) {
+                    for (int z = -1; z <= 1; ++z) {
+                        auto it = block_map.find(block +
+                                                 Eigen::Vector3i(x, y, z));
+                        if (it == block_map.end() || it->second == b) {
+                            continue;
+                        }
+                        for (int64_t i = block_starts[it->second];
+                             i < block_starts[it->second + 1]; ++i) {
+                            const Eigen::Vector3d &point =
+                                    pcd.points_[sorted_points[i]];
+                            if ((point.array() >= block_min.array() - halo)
+                                        .all() &&
+                                (point.array() < block_max.array() + halo)
+                                        .all()) {
+                                indices.push_back(int(sorted_points[i]));
+                            }
+                        }
+                    }
+                }
+            }
+            PointCloud block_pcd;
+            block_pcd.points_.resize(indices.size());
+            block_pcd.normals_.resize(indices.size());
+            for (size_t i = 0; i < indices.size(); ++i) {
+                block_pcd.points_[i] = pcd.points_[indices[i]];
+                block_pcd.normals_[i] = pcd.normals_[indices[i]];
+            }
+            std::vector<int> seed_vertices(num_block_points);
+            std::iota(seed_vertices.begin(), seed_vertices.end(), 0);
+
+            BallPivoting bp(block_pcd);
+            bp.SetOwnedBox(block_min, block_max);
+            bp.Run(radii, seed_vertices);
+
+            BallPivotingBlockResult &result = results[b];
+            for (const BallPivoting::Triangle &triangle : bp.triangles_) {
+                result.triangles_.emplace_back(
+                        indices[triangle.vert0_], indices[triangle.vert1_],
+                        indices[triangle.vert2_], triangle.ball_center_);
+            }
+            for (int eidx : bp.border_edges_) {
+                const BallPivoting::Edge &edge = bp.edges_[eidx];
+                if (edge.type_ == BallPivoting::EdgeType::Border) {
+                    result.border_edges_.emplace_back(indices[edge.source_],
+                                                      indices[edge.target_]);
+                }
+            }
+        }
+    }
+
+    // Merge the blocks in order, skipping the triangles that conflict across
+    // seams, and keep their border edges.
+    BallPivoting &bp = *stitching;
+    for (BallPivotingBlockResult &result : results) {
+        for (const BallPivoting::Triangle &triangle : result.triangles_) {
+            bp.AddTriangle(triangle.vert0_, triangle.vert1_, triangle.vert2_,
+                           triangle.ball_center_);
+        }
+        for (const Eigen::Vector2i &border_edge : result.border_edges_) {
+            const int eidx = bp.GetLinkingEdge(border_edge(0), border_edge(1));
+            if (eidx != -1 &&
+                bp.edges_[eidx].type_ == BallPivoting::EdgeType::Front) {
+                bp.edges_[eidx].type_ = BallPivoting::EdgeType::Border;
+            }
+        }
+        result = BallPivotingBlockResult();
+    }
+
+    // Stitch the seams: pivot over the edges left in the front and the border
+    // edges near seams, and seed from the orphan points near seams.
+    for (int eidx = 0; eidx < int(bp.edges_.size()); ++eidx) {
+        const BallPivoting::Edge &edge = bp.edges_[eidx];
+        if (edge.type_ == BallPivoting::EdgeType::Front) {
+            bp.edge_front_.push_back(eidx);
+        } else if (edge.type_ == BallPivoting::EdgeType::Border &&
+                   (near_seam[edge.source_] || near_seam[edge.target_])) {
+            bp.border_edges_.push_back(eidx);
+        }
+    }
+    std::vector<int> seam_vertices;
+    for (int64_t pidx = 0; pidx < num_points; ++pidx) {
+        if (near_seam[pidx]) {
+            seam_vertices.push_back(int(pidx));
+        }
+    }
+    for (double radius : radii) {
+        bp.UpdateBorderEdges(radius);
+        bp.ExpandTriangulation(radius);
+        bp.FindSeedTriangle(seam_vertices, radius);
+    }
+    return bp.CreateMesh(pcd);
 }
 
 }  // namespace geometry
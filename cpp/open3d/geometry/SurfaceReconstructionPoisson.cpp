@@ -29,12 +29,14 @@
 #include <cmath>
 #include <cstdio>
 #include <cstdlib>
+#include <cstring>
 #include <iostream>
 #include <list>
 
 #include "open3d/geometry/PointCloud.h"
 #include "open3d/geometry/TriangleMesh.h"
 #include "open3d/utility/Console.h"
+#include "open3d/utility/FileSystem.h"
 
 // clang-format off
 #include "PoissonRecon/Src/PreProcessor.h"
@@ -91,24 +93,30 @@ public:
     Eigen::Vector3d color_;
 };
 
+// Streams the points of a point cloud into the octree. PoissonRecon reads the
+// stream sequentially, so the points are transformed into the frame of the
+// tree in parallel up front.
 template <typename Real>
 class Open3DPointStream
     : public InputPointStreamWithData<Real, DIMENSION, Open3DData> {
 public:
-    Open3DPointStream(const open3d::geometry::PointCloud* pcd)
-        : pcd_(pcd), xform_(nullptr), current_(0) {}
+    Open3DPointStream(const open3d::geometry::PointCloud* pcd,
+                      const XForm<Real, 4>& xform)
+        : pcd_(pcd), points_(pcd->points_.size()), current_(0) {
+#pragma omp parallel for schedule(static)
+        for (int64_t pidx = 0; pidx < int64_t(points_.size()); ++pidx) {
+            const Eigen::Vector3d& point = pcd_->points_[pidx];
+            points_[pidx] = xform * Point<Real, 3>(static_cast<Real>(point(0)),
+                                                   static_cast<Real>(point(1)),
+                                                   static_cast<Real>(point(2)));
+        }
+    }
     void reset(void) { current_ = 0; }
     bool nextPoint(Point<Real, 3>& p, Open3DData& d) {
-        if (current_ >= pcd_->points_.size()) {
+        if (current_ >= points_.size()) {
             return false;
         }
-        p.coords[0] = static_cast<Real>(pcd_->points_[current_](0));
-        p.coords[1] = static_cast<Real>(pcd_->points_[current_](1));
-        p.coords[2] = static_cast<Real>(pcd_->points_[current_](2));
-
-        if (xform_ != nullptr) {
-            p = (*xform_) * p;
-        }
+        p = points_[current_];
 
         if (pcd_->HasNormals()) {
             d.normal_ = pcd_->normals_[current_];
@@ -128,7 +136,7 @@ public:
 
 public:
     const open3d::geometry::PointCloud* pcd_;
-    XForm<Real, 4>* xform_;
+    std::vector<Point<Real, 3>> points_;
     size_t current_;
 };
 
@@ -177,13 +185,16 @@ public:
 template <unsigned int Dim, class Real>
 struct FEMTreeProfiler {
     FEMTree<Dim, Real>& tree;
+    PoissonReconstructionInfo* info;
     double t;
 
-    FEMTreeProfiler(FEMTree<Dim, Real>& t) : tree(t) {}
+    FEMTreeProfiler(FEMTree<Dim, Real>& t,
+                    PoissonReconstructionInfo* info = nullptr)
+        : tree(t), info(info) {}
     void start(void) {
         t = Time(), FEMTree<Dim, Real>::ResetLocalMemoryUsage();
     }
-    void dumpOutput(const char* header) const {
+    void dumpOutput(const char* header, const char* stage = nullptr) const {
         FEMTree<Dim, Real>::MemoryUsage();
         if (header) {
             utility::LogDebug("{} {} (s), {} (MB) / {} (MB) / {} (MB)", header,
@@ -197,9 +208,43 @@ struct FEMTreeProfiler {
                               FEMTree<Dim, Real>::MaxMemoryUsage(),
                               MemoryInfo::PeakMemoryUsageMB());
         }
+        if (info && stage) {
+            info->stages_.emplace_back(stage, Time() - t,
+                                       FEMTree<Dim, Real>::LocalMemoryUsage(),
+                                       double(MemoryInfo::PeakMemoryUsageMB()));
+        }
     }
 };
 
+// Axis aligned bounds of the points of pcd, computed in parallel.
+template <class Real, unsigned int Dim>
+void ComputeBoundingBox(const open3d::geometry::PointCloud& pcd,
+                        Point<Real, Dim>& min,
+                        Point<Real, Dim>& max) {
+    Eigen::Vector3d min_bound =
+            pcd.points_.empty() ? Eigen::Vector3d::Zero() : pcd.points_[0];
+    Eigen::Vector3d max_bound = min_bound;
+#pragma omp parallel
+    {
+        Eigen::Vector3d local_min = min_bound;
+        Eigen::Vector3d local_max = max_bound;
+#pragma omp for nowait
+        for (int64_t pidx = 0; pidx < int64_t(pcd.points_.size()); ++pidx) {
+            local_min = local_min.cwiseMin(pcd.points_[pidx]);
+            local_max = local_max.cwiseMax(pcd.points_[pidx]);
+        }
+#pragma omp critical
+        {
+            min_bound = min_bound.cwiseMin(local_min);
+            max_bound = max_bound.cwiseMax(local_max);
+        }
+    }
+    for (unsigned int d = 0; d < Dim; d++) {
+        min[d] = static_cast<Real>(min_bound(d));
+        max[d] = static_cast<Real>(max_bound(d));
+    }
+}
+
 template <class Real, unsigned int Dim>
 XForm<Real, Dim + 1> GetBoundingBoxXForm(Point<Real, Dim> min,
                                          Point<Real, Dim> max,
@@ -253,20 +298,20 @@ XForm<Real, Dim + 1> GetBoundingBoxXForm(Point<Real, Dim> min,
 }
 
 template <class Real, unsigned int Dim>
-XForm<Real, Dim + 1> GetPointXForm(InputPointStream<Real, Dim>& stream,
+XForm<Real, Dim + 1> GetPointXForm(const open3d::geometry::PointCloud& pcd,
                                    Real width,
                                    Real scaleFactor,
                                    int& depth) {
     Point<Real, Dim> min, max;
-    stream.boundingBox(min, max);
+    ComputeBoundingBox<Real, Dim>(pcd, min, max);
     return GetBoundingBoxXForm(min, max, width, scaleFactor, depth);
 }
 
 template <class Real, unsigned int Dim>
-XForm<Real, Dim + 1> GetPointXForm(InputPointStream<Real, Dim>& stream,
+XForm<Real, Dim + 1> GetPointXForm(const open3d::geometry::PointCloud& pcd,
                                    Real scaleFactor) {
     Point<Real, Dim> min, max;
-    stream.boundingBox(min, max);
+    ComputeBoundingBox<Real, Dim>(pcd, min, max);
     return GetBoundingBoxXForm(min, max, scaleFactor);
 }
 
@@ -313,7 +358,7 @@ template <typename Vertex,
           typename SetVertexFunction,
           unsigned int... FEMSigs,
           typename... SampleData>
-void ExtractMesh(
+std::unique_ptr<CoredMeshData<Vertex, node_index_type>> ExtractMesh(
         float datax,
         bool linear_fit,
         UIntPack<FEMSigs...>,
@@ -321,16 +366,15 @@ void ExtractMesh(
         FEMTree<sizeof...(FEMSigs), Real>& tree,
         const DenseNodeData<Real, UIntPack<FEMSigs...>>& solution,
         Real isoValue,
-        const std::vector<typename FEMTree<sizeof...(FEMSigs),
-                                           Real>::PointSample>* samples,
+        std::vector<typename FEMTree<sizeof...(FEMSigs), Real>::PointSample>*
+                samples,
         std::vector<Open3DData>* sampleData,
         const typename FEMTree<sizeof...(FEMSigs),
                                Real>::template DensityEstimator<WEIGHT_DEGREE>*
                 density,
         const SetVertexFunction& SetVertex,
-        XForm<Real, sizeof...(FEMSigs) + 1> iXForm,
-        std::shared_ptr<open3d::geometry::TriangleMesh>& out_mesh,
-        std::vector<double>& out_densities) {
+        bool out_of_core,
+        const std::string& temp_header) {
     static const int Dim = sizeof...(FEMSigs);
     typedef UIntPack<FEMSigs...> Sigs;
     static const unsigned int DataSig =
@@ -339,15 +383,19 @@ void ExtractMesh(
                              Real>::template DensityEstimator<WEIGHT_DEGREE>
             DensityEstimator;
 
-    FEMTreeProfiler<Dim, Real> profiler(tree);
-
-    CoredMeshData<Vertex, node_index_type>* mesh;
-    mesh = new CoredVectorMeshData<Vertex, node_index_type>();
+    // Out-of-core meshes spool the vertices and polygons to temporary files
+    // instead of keeping them in memory next to the tree.
+    std::unique_ptr<CoredMeshData<Vertex, node_index_type>> mesh;
+    if (out_of_core) {
+        mesh.reset(new CoredFileMeshData<Vertex, node_index_type>(
+                temp_header.c_str()));
+    } else {
+        mesh.reset(new CoredVectorMeshData<Vertex, node_index_type>());
+    }
 
     bool non_manifold = true;
     bool polygon_mesh = false;
 
-    profiler.start();
     typename IsoSurfaceExtractor<Dim, Real, Vertex>::IsoStats isoStats;
     if (sampleData) {
         SparseNodeData<ProjectiveData<Open3DData, Real>,
@@ -355,12 +403,28 @@ void ExtractMesh(
                 _sampleData =
                         tree.template setMultiDepthDataField<DataSig, false>(
                                 *samples, *sampleData, (DensityEstimator*)NULL);
+        if (out_of_core) {
+            // The splatted colors are all that is needed from the samples.
+            std::vector<typename FEMTree<Dim, Real>::PointSample>().swap(
+                    *samples);
+            std::vector<Open3DData>().swap(*sampleData);
+        }
+        // The tree can only be traversed serially, so collect the splatted
+        // data first and scale it in parallel.
+        std::vector<ProjectiveData<Open3DData, Real>*> clrs;
+        std::vector<int> clr_depths;
         for (const RegularTreeNode<Dim, FEMTreeNodeData, depth_and_offset_type>*
                      n = tree.tree().nextNode();
              n; n = tree.tree().nextNode(n)) {
             ProjectiveData<Open3DData, Real>* clr = _sampleData(n);
-            if (clr) (*clr) *= (Real)pow(datax, tree.depth(n));
+            if (clr) {
+                clrs.push_back(clr);
+                clr_depths.push_back(tree.depth(n));
+            }
         }
+        ThreadPool::Parallel_for(0, clrs.size(), [&](unsigned int, size_t i) {
+            (*clrs[i]) *= (Real)pow(datax, clr_depths[i]);
+        });
         isoStats = IsoSurfaceExtractor<Dim, Real, Vertex>::template Extract<
                 Open3DData>(Sigs(), UIntPack<WEIGHT_DEGREE>(),
                             UIntPack<DataSig>(), tree, density, &_sampleData,
@@ -374,41 +438,174 @@ void ExtractMesh(
                             !non_manifold, polygon_mesh, false);
     }
 
-    mesh->resetIterator();
-    out_densities.clear();
-    for (size_t vidx = 0; vidx < mesh->outOfCorePointCount(); ++vidx) {
-        Vertex v;
-        mesh->nextOutOfCorePoint(v);
-        v.point = iXForm * v.point;
-        out_mesh->vertices_.push_back(
-                Eigen::Vector3d(v.point[0], v.point[1], v.point[2]));
-        out_mesh->vertex_normals_.push_back(v.normal_);
-        out_mesh->vertex_colors_.push_back(v.color_);
-        out_densities.push_back(v.w_);
-    }
-    for (size_t tidx = 0; tidx < mesh->polygonCount(); ++tidx) {
-        std::vector<CoredVertexIndex<node_index_type>> triangle;
-        mesh->nextPolygon(triangle);
+    return mesh;
+}
+
+// Converts the extracted mesh into out_mesh. The mesh can only be read
+// sequentially, the transformation back into the input frame is done in
+// parallel afterwards.
+template <typename Real>
+void ConvertMesh(CoredMeshData<Open3DVertex<Real>, node_index_type>& mesh,
+                 const XForm<Real, DIMENSION + 1>& iXForm,
+                 open3d::geometry::TriangleMesh& out_mesh,
+                 std::vector<double>& out_densities) {
+    const size_t n_vertices = mesh.outOfCorePointCount();
+    const size_t n_triangles = mesh.polygonCount();
+    std::vector<Point<Real, DIMENSION>> points(n_vertices);
+    out_mesh.vertices_.resize(n_vertices);
+    out_mesh.vertex_normals_.resize(n_vertices);
+    out_mesh.vertex_colors_.resize(n_vertices);
+    out_mesh.triangles_.resize(n_triangles);
+    out_densities.resize(n_vertices);
+
+    mesh.resetIterator();
+    for (size_t vidx = 0; vidx < n_vertices; ++vidx) {
+        Open3DVertex<Real> v;
+        mesh.nextOutOfCorePoint(v);
+        points[vidx] = v.point;
+        out_mesh.vertex_normals_[vidx] = v.normal_;
+        out_mesh.vertex_colors_[vidx] = v.color_;
+        out_densities[vidx] = v.w_;
+    }
+    std::vector<CoredVertexIndex<node_index_type>> triangle;
+    for (size_t tidx = 0; tidx < n_triangles; ++tidx) {
+        mesh.nextPolygon(triangle);
         if (triangle.size() != 3) {
             open3d::utility::LogError("got polygon");
-        } else {
-            out_mesh->triangles_.push_back(Eigen::Vector3i(
-                    triangle[0].idx, triangle[1].idx, triangle[2].idx));
         }
+        out_mesh.triangles_[tidx] = Eigen::Vector3i(
+                triangle[0].idx, triangle[1].idx, triangle[2].idx);
     }
 
-    delete mesh;
+#pragma omp parallel for schedule(static)
+    for (int64_t vidx = 0; vidx < int64_t(n_vertices); ++vidx) {
+        const Point<Real, DIMENSION> p = iXForm * points[vidx];
+        out_mesh.vertices_[vidx] = Eigen::Vector3d(p[0], p[1], p[2]);
+    }
 }
 
+// Streams the extracted mesh into a binary PLY file, chunk by chunk, without
+// holding more than kPLYChunkSize elements in memory.
+template <typename Real>
+bool WriteMeshToPLY(const std::string& filename,
+                    CoredMeshData<Open3DVertex<Real>, node_index_type>& mesh,
+                    const XForm<Real, DIMENSION + 1>& iXForm,
+                    bool write_colors) {
+    static const size_t kPLYChunkSize = 1 << 16;
+    // x, y, z, nx, ny, nz, [red, green, blue,] density
+    const size_t vertex_bytes = 7 * sizeof(float) + (write_colors ? 3 : 0);
+    // Vertex count and three vertex indices.
+    const size_t triangle_bytes = 1 + 3 * sizeof(int32_t);
+
+    FILE* file = utility::filesystem::FOpen(filename, "wb");
+    if (file == nullptr) {
+        utility::LogWarning("Write PLY failed: unable to open file: {}",
+                            filename);
+        return false;
+    }
+
+    const size_t n_vertices = mesh.outOfCorePointCount();
+    const size_t n_triangles = mesh.polygonCount();
+    std::string header = fmt::format(
+            "ply\nformat binary_little_endian 1.0\ncomment Created by "
+            "Open3D\nelement vertex {}\nproperty float x\nproperty float "
+            "y\nproperty float z\nproperty float nx\nproperty float "
+            "ny\nproperty float nz\n",
+            n_vertices);
+    if (write_colors) {
+        header +=
+                "property uchar red\nproperty uchar green\nproperty uchar "
+                "blue\n";
+    }
+    header += fmt::format(
+            "property float density\nelement face {}\nproperty list uchar "
+            "int vertex_indices\nend_header\n",
+            n_triangles);
+    bool success =
+            fwrite(header.data(), 1, header.size(), file) == header.size();
+
+    auto WriteBuffer = [&](const std::vector<char>& buffer, size_t size) {
+        success = success && fwrite(buffer.data(), 1, size, file) == size;
+    };
+
+    mesh.resetIterator();
+    std::vector<Open3DVertex<Real>> vertices;
+    std::vector<char> buffer(kPLYChunkSize *
+                             std::max(vertex_bytes, triangle_bytes));
+    for (size_t begin = 0; begin < n_vertices && success;
+         begin += kPLYChunkSize) {
+        const size_t count = std::min(kPLYChunkSize, n_vertices - begin);
+        vertices.resize(count);
+        for (size_t i = 0; i < count; ++i) {
+            mesh.nextOutOfCorePoint(vertices[i]);
+        }
+#pragma omp parallel for schedule(static)
+        for (int64_t i = 0; i < int64_t(count); ++i) {
+            const Open3DVertex<Real>& v = vertices[i];
+            const Point<Real, DIMENSION> p = iXForm * v.point;
+            float values[6] = {float(p[0]),         float(p[1]),
+                               float(p[2]),         float(v.normal_(0)),
+                               float(v.normal_(1)), float(v.normal_(2))};
+            char* dst = buffer.data() + i * vertex_bytes;
+            std::memcpy(dst, values, sizeof(values));
+            dst += sizeof(values);
+            if (write_colors) {
+                for (int c = 0; c < 3; ++c) {
+                    *dst++ = char(uint8_t(std::round(
+                            std::min(std::max(v.color_(c), 0.0), 1.0) *
+                            255.0)));
+                }
+            }
+            const float density = float(v.w_);
+            std::memcpy(dst, &density, sizeof(float));
+        }
+        WriteBuffer(buffer, count * vertex_bytes);
+    }
+
+    std::vector<CoredVertexIndex<node_index_type>> triangle;
+    for (size_t begin = 0; begin < n_triangles && success;
+         begin += kPLYChunkSize) {
+        const size_t count = std::min(kPLYChunkSize, n_triangles - begin);
+        char* dst = buffer.data();
+        for (size_t i = 0; i < count; ++i) {
+            mesh.nextPolygon(triangle);
+            if (triangle.size() != 3) {
+                fclose(file);
+                open3d::utility::LogError("got polygon");
+            }
+            const int32_t indices[3] = {int32_t(triangle[0].idx),
+                                        int32_t(triangle[1].idx),
+                                        int32_t(triangle[2].idx)};
+            *dst++ = char(3);
+            std::memcpy(dst, indices, sizeof(indices));
+            dst += sizeof(indices);
+        }
+        WriteBuffer(buffer, count * triangle_bytes);
+    }
+
+    fclose(file);
+    if (!success) {
+        utility::LogWarning("Write PLY failed: unable to write file: {}",
+                            filename);
+    }
+    return success;
+}
+
+// Reconstructs the surface of pcd and returns it in the normalized frame of the
+// tree, iXForm maps it back to the frame of pcd. The tree, the samples and the
+// solution are released when this function returns.
 template <class Real, typename... SampleData, unsigned int... FEMSigs>
-void Execute(const open3d::geometry::PointCloud& pcd,
-             std::shared_ptr<open3d::geometry::TriangleMesh>& out_mesh,
-             std::vector<double>& out_densities,
-             int depth,
-             size_t width,
-             float scale,
-             bool linear_fit,
-             UIntPack<FEMSigs...>) {
+std::unique_ptr<CoredMeshData<Open3DVertex<Real>, node_index_type>> Execute(
+        const open3d::geometry::PointCloud& pcd,
+        int depth,
+        size_t width,
+        float scale,
+        bool linear_fit,
+        bool out_of_core,
+        const std::string& temp_header,
+        XForm<Real, sizeof...(FEMSigs) + 1>& iXForm,
+        PoissonReconstructionInfo* info,
+        UIntPack<FEMSigs...>) {
     static const int Dim = sizeof...(FEMSigs);
     typedef UIntPack<FEMSigs...> Sigs;
     typedef UIntPack<FEMSignature<FEMSigs>::Degree...> Degrees;
@@ -422,7 +619,7 @@ void Execute(const open3d::geometry::PointCloud& pcd,
     typedef typename FEMTree<Dim, Real>::template InterpolationInfo<Real, 0>
             InterpolationInfo;
 
-    XForm<Real, Dim + 1> xForm, iXForm;
+    XForm<Real, Dim + 1> xForm;
     xForm = XForm<Real, Dim + 1>::Identity();
 
     float datax = 32.f;
@@ -441,7 +638,7 @@ void Execute(const open3d::geometry::PointCloud& pcd,
     Real isoValue = 0;
 
     FEMTree<Dim, Real> tree(MEMORY_ALLOCATOR_BLOCK_SIZE);
-    FEMTreeProfiler<Dim, Real> profiler(tree);
+    FEMTreeProfiler<Dim, Real> profiler(tree, info);
 
     size_t pointCount;
 
@@ -454,21 +651,19 @@ void Execute(const open3d::geometry::PointCloud& pcd,
 
     // Read in the samples (and color data)
     {
-        Open3DPointStream<Real> pointStream(&pcd);
-
+        profiler.start();
         if (width > 0) {
-            xForm = GetPointXForm<Real, Dim>(pointStream, (Real)width,
+            xForm = GetPointXForm<Real, Dim>(pcd, (Real)width,
                                              (Real)(scale > 0 ? scale : 1.),
                                              depth) *
                     xForm;
         } else {
-            xForm = scale > 0 ? GetPointXForm<Real, Dim>(pointStream,
-                                                         (Real)scale) *
-                                        xForm
-                              : xForm;
+            xForm = scale > 0
+                            ? GetPointXForm<Real, Dim>(pcd, (Real)scale) * xForm
+                            : xForm;
         }
 
-        pointStream.xform_ = &xForm;
+        Open3DPointStream<Real> pointStream(&pcd, xForm);
 
         {
             auto ProcessDataWithConfidence = [&](const Point<Real, Dim>& p,
@@ -498,9 +693,15 @@ void Execute(const open3d::geometry::PointCloud& pcd,
             }
         }
         iXForm = xForm.inverse();
+        profiler.dumpOutput("#  Read input samples:", "read_samples");
 
         utility::LogDebug("Input Points / Samples: {} / {}", pointCount,
                           samples.size());
+        if (info) {
+            info->input_point_count_ = pointCount;
+            info->sample_count_ = samples.size();
+            info->depth_ = depth;
+        }
     }
 
     int kernelDepth = depth - 2;
@@ -523,7 +724,7 @@ void Execute(const open3d::geometry::PointCloud& pcd,
             profiler.start();
             density = tree.template setDensityEstimator<WEIGHT_DEGREE>(
                     samples, kernelDepth, samples_per_node, 1);
-            profiler.dumpOutput("#   Got kernel density:");
+            profiler.dumpOutput("#   Got kernel density:", "kernel_density");
         }
 
         // Transform the Hermite samples into a vector field
@@ -574,7 +775,7 @@ void Execute(const open3d::geometry::PointCloud& pcd,
                                      [&](unsigned int, size_t i) {
                                          (*normalInfo)[i] *= (Real)-1.;
                                      });
-            profiler.dumpOutput("#     Got normal field:");
+            profiler.dumpOutput("#     Got normal field:", "normal_field");
             utility::LogDebug("Point weight / Estimated Area: {:e} / {:e}",
                               pointWeightSum, pointCount * pointWeightSum);
         }
@@ -590,7 +791,7 @@ void Execute(const open3d::geometry::PointCloud& pcd,
                     typename FEMTree<Dim, Real>::template HasNormalDataFunctor<
                             NormalSigs>(*normalInfo),
                     normalInfo, density);
-            profiler.dumpOutput("#       Finalized tree:");
+            profiler.dumpOutput("#       Finalized tree:", "finalize_tree");
         }
 
         // Add the FEM constraints
@@ -615,7 +816,7 @@ void Execute(const open3d::geometry::PointCloud& pcd,
                                  derivatives2)] = 1;
             }
             tree.addFEMConstraints(F, *normalInfo, constraints, solveDepth);
-            profiler.dumpOutput("#  Set FEM constraints:");
+            profiler.dumpOutput("#  Set FEM constraints:", "fem_constraints");
         }
 
         // Free up the normal info
@@ -647,7 +848,7 @@ void Execute(const open3d::geometry::PointCloud& pcd,
                                 true, 1);
             }
             tree.addInterpolationConstraints(constraints, solveDepth, *iInfo);
-            profiler.dumpOutput("#Set point constraints:");
+            profiler.dumpOutput("#Set point constraints:", "point_constraints");
         }
 
         utility::LogDebug(
@@ -674,7 +875,7 @@ void Execute(const open3d::geometry::PointCloud& pcd,
                     F({0., 1.});
             solution = tree.solveSystem(Sigs(), F, constraints, solveDepth,
                                         sInfo, iInfo);
-            profiler.dumpOutput("# Linear system solved:");
+            profiler.dumpOutput("# Linear system solved:", "solve");
             if (iInfo) delete iInfo, iInfo = NULL;
         }
     }
@@ -701,9 +902,12 @@ void Execute(const open3d::geometry::PointCloud& pcd,
         for (size_t t = 0; t < valueSums.size(); t++)
             valueSum += valueSums[t], weightSum += weightSums[t];
         isoValue = (Real)(valueSum / weightSum);
-        profiler.dumpOutput("Got average:");
+        profiler.dumpOutput("Got average:", "iso_value");
         utility::LogDebug("Iso-Value: {:e} = {:e} / {:e}", isoValue, valueSum,
                           weightSum);
+        if (info) {
+            info->iso_value_ = isoValue;
+        }
     }
 
     auto SetVertex = [](Open3DVertex<Real>& v, Point<Real, Dim> p, Real w,
@@ -713,29 +917,34 @@ void Execute(const open3d::geometry::PointCloud& pcd,
         v.color_ = d.color_;
         v.w_ = w;
     };
-    ExtractMesh<Open3DVertex<Real>, Real>(
+    profiler.start();
+    auto mesh = ExtractMesh<Open3DVertex<Real>, Real>(
             datax, linear_fit, UIntPack<FEMSigs...>(),
             std::tuple<SampleData...>(), tree, solution, isoValue, &samples,
-            &sampleData, density, SetVertex, iXForm, out_mesh, out_densities);
+            &sampleData, density, SetVertex, out_of_core, temp_header);
+    profiler.dumpOutput("#    Extracted surface:", "extract");
 
     if (density) delete density, density = NULL;
     utility::LogDebug("#          Total Solve: {:9.1f} (s), {:9.1f} (MB)",
                       Time() - startTime, FEMTree<Dim, Real>::MaxMemoryUsage());
+    return mesh;
 }
 
-}  // namespace poisson
-
-std::tuple<std::shared_ptr<TriangleMesh>, std::vector<double>>
-TriangleMesh::CreateFromPointCloudPoisson(const PointCloud& pcd,
-                                          size_t depth,
-                                          size_t width,
-                                          float scale,
-                                          bool linear_fit,
-                                          int n_threads) {
-    static const BoundaryType BType = poisson::DEFAULT_FEM_BOUNDARY;
+// Runs the reconstruction on the PoissonRecon thread pool.
+std::unique_ptr<CoredMeshData<Open3DVertex<float>, node_index_type>>
+Reconstruct(const open3d::geometry::PointCloud& pcd,
+            size_t depth,
+            size_t width,
+            float scale,
+            bool linear_fit,
+            int n_threads,
+            bool out_of_core,
+            const std::string& temp_header,
+            XForm<float, DIMENSION + 1>& iXForm,
+            PoissonReconstructionInfo* info) {
+    static const BoundaryType BType = DEFAULT_FEM_BOUNDARY;
     typedef IsotropicUIntPack<
-            poisson::DIMENSION,
-            FEMDegreeAndBType</* Degree */ 1, BType>::Signature>
+            DIMENSION, FEMDegreeAndBType</* Degree */ 1, BType>::Signature>
             FEMSigs;
 
     if (!pcd.HasNormals()) {
@@ -745,6 +954,10 @@ TriangleMesh::CreateFromPointCloudPoisson(const PointCloud& pcd,
     if (n_threads <= 0) {
         n_threads = (int)std::thread::hardware_concurrency();
     }
+    if (info) {
+        info->Clear();
+        info->thread_count_ = n_threads;
+    }
 
 #ifdef _OPENMP
     ThreadPool::Init((ThreadPool::ParallelType)(int)ThreadPool::OPEN_MP,
@@ -754,15 +967,86 @@ TriangleMesh::CreateFromPointCloudPoisson(const PointCloud& pcd,
                      n_threads);
 #endif
 
-    auto mesh = std::make_shared<TriangleMesh>();
-    std::vector<double> densities;
-    poisson::Execute<float>(pcd, mesh, densities, static_cast<int>(depth),
-                            width, scale, linear_fit, FEMSigs());
+    auto mesh = Execute<float>(pcd, static_cast<int>(depth), width, scale,
+                               linear_fit, out_of_core, temp_header, iXForm,
+                               info, FEMSigs());
 
     ThreadPool::Terminate();
 
+    return mesh;
+}
+
+// Records the stage that converts or writes the extracted mesh, after the tree
+// has been released, and the totals of the reconstruction.
+void AddOutputStage(PoissonReconstructionInfo* info,
+                    double start_time,
+                    double output_start_time,
+                    size_t vertex_count,
+                    size_t triangle_count) {
+    if (info == nullptr) {
+        return;
+    }
+    info->stages_.emplace_back("output", Time() - output_start_time,
+                               double(MemoryInfo::Usage()) / (1 << 20),
+                               double(MemoryInfo::PeakMemoryUsageMB()));
+    info->vertex_count_ = vertex_count;
+    info->triangle_count_ = triangle_count;
+    info->total_time_ = Time() - start_time;
+    info->peak_memory_mb_ = double(MemoryInfo::PeakMemoryUsageMB());
+}
+
+}  // namespace poisson
+
+std::tuple<std::shared_ptr<TriangleMesh>, std::vector<double>>
+TriangleMesh::CreateFromPointCloudPoisson(const PointCloud& pcd,
+                                          size_t depth /* = 8 */,
+                                          size_t width /* = 0 */,
+                                          float scale /* = 1.1f */,
+                                          bool linear_fit /* = false */,
+                                          int n_threads /* = -1 */,
+                                          PoissonReconstructionInfo* info
+                                          /* = nullptr */) {
+    const double start_time = Time();
+    XForm<float, poisson::DIMENSION + 1> iXForm;
+    auto cored_mesh = poisson::Reconstruct(pcd, depth, width, scale, linear_fit,
+                                           n_threads, false, "", iXForm, info);
+
+    const double output_start_time = Time();
+    auto mesh = std::make_shared<TriangleMesh>();
+    std::vector<double> densities;
+    poisson::ConvertMesh(*cored_mesh, iXForm, *mesh, densities);
+    poisson::AddOutputStage(info, start_time, output_start_time,
+                            mesh->vertices_.size(), mesh->triangles_.size());
+
     return std::make_tuple(mesh, densities);
 }
 
+bool TriangleMesh::CreateFromPointCloudPoissonToFile(
+        const PointCloud& pcd,
+        const std::string& filename,
+        size_t depth /* = 8 */,
+        size_t width /* = 0 */,
+        float scale /* = 1.1f */,
+        bool linear_fit /* = false */,
+        int n_threads /* = -1 */,
+        PoissonReconstructionInfo* info /* = nullptr */) {
+    const double start_time = Time();
+    // The temporary files of the out-of-core mesh are placed next to the
+    // output file.
+    XForm<float, poisson::DIMENSION + 1> iXForm;
+    auto cored_mesh = poisson::Reconstruct(
+            pcd, depth, width, scale, linear_fit, n_threads, true,
+            filename + ".poisson_", iXForm, info);
+
+    const double output_start_time = Time();
+    bool success = poisson::WriteMeshToPLY(filename, *cored_mesh, iXForm,
+                                           pcd.HasColors());
+    poisson::AddOutputStage(info, start_time, output_start_time,
+                            cored_mesh->outOfCorePointCount(),
+                            cored_mesh->polygonCount());
+
+    return success;
+}
+
 }  // namespace geometry
 }  // namespace open3d
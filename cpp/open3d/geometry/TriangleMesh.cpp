@@ -26,18 +26,27 @@
 
 #include "open3d/geometry/TriangleMesh.h"
 
+#include <tbb/parallel_sort.h>
+
 #include <Eigen/Dense>
+#include <cstring>
+#include <limits>
 #include <numeric>
 #include <queue>
 #include <random>
 #include <tuple>
+#include <unordered_map>
 
 #include "open3d/geometry/BoundingVolume.h"
+#include "open3d/geometry/ConcurrentUnionFind.h"
 #include "open3d/geometry/IntersectionTest.h"
-#include "open3d/geometry/KDTreeFlann.h"
 #include "open3d/geometry/PointCloud.h"
 #include "open3d/geometry/Qhull.h"
+#include "open3d/geometry/TriangleMeshBVH.h"
+#include "open3d/geometry/VoxelGrouping.h"
 #include "open3d/utility/Console.h"
+#include "open3d/utility/ParallelRadixSort.h"
+#include "open3d/utility/ParallelScan.h"
 
 namespace open3d {
 namespace geometry {
@@ -151,6 +160,102 @@ TriangleMesh &TriangleMesh::ComputeAdjacencyList() {
     return *this;
 }
 
+std::tuple<std::vector<int64_t>, std::vector<int>>
+TriangleMesh::ComputeAdjacencyCSR() const {
+    const int64_t num_vertices = int64_t(vertices_.size());
+    std::vector<int64_t> offsets(num_vertices + 1, 0);
+    std::vector<int> neighbors;
+
+    if (HasAdjacencyList()) {
+#pragma omp parallel for schedule(static)
+        for (int64_t vidx = 0; vidx < num_vertices; ++vidx) {
+            offsets[vidx + 1] = int64_t(adjacency_list_[vidx].size());
+        }
+        utility::InclusivePrefixSum(offsets.data() + 1,
+                                    offsets.data() + offsets.size(),
+                                    offsets.data() + 1);
+        neighbors.resize(offsets.back());
+#pragma omp parallel for schedule(static)
+        for (int64_t vidx = 0; vidx < num_vertices; ++vidx) {
+            std::copy(adjacency_list_[vidx].begin(),
+                      adjacency_list_[vidx].end(),
+                      neighbors.begin() + offsets[vidx]);
+            std::sort(neighbors.begin() + offsets[vidx],
+                      neighbors.begin() + offsets[vidx + 1]);
+        }
+        return std::make_tuple(std::move(offsets), std::move(neighbors));
+    }
+
+    // Triangles incident to every vertex, once per corner.
+    const int64_t num_triangles = int64_t(triangles_.size());
+    std::vector<int64_t> triangle_offsets(num_vertices + 1, 0);
+#pragma omp parallel for schedule(static)
+    for (int64_t tidx = 0; tidx < num_triangles; ++tidx) {
+        for (int k = 0; k < 3; ++k) {
+#pragma omp atomic
+            triangle_offsets[triangles_[tidx](k) + 1]++;
+        }
+    }
+    utility::InclusivePrefixSum(
+            triangle_offsets.data() + 1,
+            triangle_offsets.data() + triangle_offsets.size(),
+            triangle_offsets.data() + 1);
+    std::vector<int64_t> fill(triangle_offsets.begin(),
+                              triangle_offsets.end() - 1);
+    std::vector<int64_t> incident_triangles(triangle_offsets.back());
+#pragma omp parallel for schedule(static)
+    for (int64_t tidx = 0; tidx < num_triangles; ++tidx) {
+        for (int k = 0; k < 3; ++k) {
+            int64_t pos;
+#pragma omp atomic capture
+            pos = fill[triangles_[tidx](k)]++;
+            incident_triangles[pos] = tidx;
+        }
+    }
+
+    // Sorted, unique neighbors of a vertex. As in ComputeAdjacencyList, a
+    // vertex that appears twice in a triangle is its own neighbor.
+    auto gather = [&](int64_t vidx, std::vector<int> &nbs) {
+        nbs.clear();
+        for (int64_t t = triangle_offsets[vidx]; t < triangle_offsets[vidx + 1];
+             ++t) {
+            const Eigen::Vector3i &triangle = triangles_[incident_triangles[t]];
+            for (int k = 0; k < 3; ++k) {
+                if (triangle(k) == vidx) {
+                    nbs.push_back(triangle((k + 1) % 3));
+                    nbs.push_back(triangle((k + 2) % 3));
+                }
+            }
+        }
+        std::sort(nbs.begin(), nbs.end());
+        nbs.erase(std::unique(nbs.begin(), nbs.end()), nbs.end());
+    };
+#pragma omp parallel
+    {
+        std::vector<int> nbs;
+#pragma omp for schedule(static)
+        for (int64_t vidx = 0; vidx < num_vertices; ++vidx) {
+            gather(vidx, nbs);
+            offsets[vidx + 1] = int64_t(nbs.size());
+        }
+    }
+    utility::InclusivePrefixSum(offsets.data() + 1,
+                                offsets.data() + offsets.size(),
+                                offsets.data() + 1);
+    neighbors.resize(offsets.back());
+#pragma omp parallel
+    {
+        std::vector<int> nbs;
+#pragma omp for schedule(static)
+        for (int64_t vidx = 0; vidx < num_vertices; ++vidx) {
+            gather(vidx, nbs);
+            std::copy(nbs.begin(), nbs.end(),
+                      neighbors.begin() + offsets[vidx]);
+        }
+    }
+    return std::make_tuple(std::move(offsets), std::move(neighbors));
+}
+
 std::shared_ptr<TriangleMesh> TriangleMesh::FilterSharpen(
         int number_of_iterations, double strength, FilterScope scope) const {
     bool filter_vertex =
@@ -172,16 +277,18 @@ std::shared_ptr<TriangleMesh> TriangleMesh::FilterSharpen(
     mesh->vertex_colors_.resize(vertex_colors_.size());
     mesh->triangles_ = triangles_;
     mesh->adjacency_list_ = adjacency_list_;
-    if (!mesh->HasAdjacencyList()) {
-        mesh->ComputeAdjacencyList();
-    }
+    std::vector<int64_t> offsets;
+    std::vector<int> neighbors;
+    std::tie(offsets, neighbors) = ComputeAdjacencyCSR();
 
     for (int iter = 0; iter < number_of_iterations; ++iter) {
-        for (size_t vidx = 0; vidx < mesh->vertices_.size(); ++vidx) {
+#pragma omp parallel for schedule(static)
+        for (int64_t vidx = 0; vidx < int64_t(vertices_.size()); ++vidx) {
             Eigen::Vector3d vertex_sum(0, 0, 0);
             Eigen::Vector3d normal_sum(0, 0, 0);
             Eigen::Vector3d color_sum(0, 0, 0);
-            for (int nbidx : mesh->adjacency_list_[vidx]) {
+            for (int64_t n = offsets[vidx]; n < offsets[vidx + 1]; ++n) {
+                const int nbidx = neighbors[n];
                 if (filter_vertex) {
                     vertex_sum += prev_vertices[nbidx];
                 }
@@ -193,7 +300,7 @@ std::shared_ptr<TriangleMesh> TriangleMesh::FilterSharpen(
                 }
             }
 
-            size_t nb_size = mesh->adjacency_list_[vidx].size();
+            const double nb_size = double(offsets[vidx + 1] - offsets[vidx]);
             if (filter_vertex) {
                 mesh->vertices_[vidx] =
                         prev_vertices[vidx] +
@@ -243,16 +350,18 @@ std::shared_ptr<TriangleMesh> TriangleMesh::FilterSmoothSimple(
     mesh->vertex_colors_.resize(vertex_colors_.size());
     mesh->triangles_ = triangles_;
     mesh->adjacency_list_ = adjacency_list_;
-    if (!mesh->HasAdjacencyList()) {
-        mesh->ComputeAdjacencyList();
-    }
+    std::vector<int64_t> offsets;
+    std::vector<int> neighbors;
+    std::tie(offsets, neighbors) = ComputeAdjacencyCSR();
 
     for (int iter = 0; iter < number_of_iterations; ++iter) {
-        for (size_t vidx = 0; vidx < mesh->vertices_.size(); ++vidx) {
+#pragma omp parallel for schedule(static)
+        for (int64_t vidx = 0; vidx < int64_t(vertices_.size()); ++vidx) {
             Eigen::Vector3d vertex_sum(0, 0, 0);
             Eigen::Vector3d normal_sum(0, 0, 0);
             Eigen::Vector3d color_sum(0, 0, 0);
-            for (int nbidx : mesh->adjacency_list_[vidx]) {
+            for (int64_t n = offsets[vidx]; n < offsets[vidx + 1]; ++n) {
+                const int nbidx = neighbors[n];
                 if (filter_vertex) {
                     vertex_sum += prev_vertices[nbidx];
                 }
@@ -264,7 +373,7 @@ std::shared_ptr<TriangleMesh> TriangleMesh::FilterSmoothSimple(
                 }
             }
 
-            size_t nb_size = mesh->adjacency_list_[vidx].size();
+            const double nb_size = double(offsets[vidx + 1] - offsets[vidx]);
             if (filter_vertex) {
                 mesh->vertices_[vidx] =
                         (prev_vertices[vidx] + vertex_sum) / (1 + nb_size);
@@ -293,17 +402,21 @@ void TriangleMesh::FilterSmoothLaplacianHelper(
         const std::vector<Eigen::Vector3d> &prev_vertices,
         const std::vector<Eigen::Vector3d> &prev_vertex_normals,
         const std::vector<Eigen::Vector3d> &prev_vertex_colors,
-        const std::vector<std::unordered_set<int>> &adjacency_list,
+        const std::vector<int64_t> &adjacency_offsets,
+        const std::vector<int> &adjacency_neighbors,
         double lambda,
         bool filter_vertex,
         bool filter_normal,
         bool filter_color) const {
-    for (size_t vidx = 0; vidx < mesh->vertices_.size(); ++vidx) {
+#pragma omp parallel for schedule(static)
+    for (int64_t vidx = 0; vidx < int64_t(mesh->vertices_.size()); ++vidx) {
         Eigen::Vector3d vertex_sum(0, 0, 0);
         Eigen::Vector3d normal_sum(0, 0, 0);
         Eigen::Vector3d color_sum(0, 0, 0);
         double total_weight = 0;
-        for (int nbidx : mesh->adjacency_list_[vidx]) {
+        for (int64_t n = adjacency_offsets[vidx];
+             n < adjacency_offsets[vidx + 1]; ++n) {
+            const int nbidx = adjacency_neighbors[n];
             auto diff = prev_vertices[vidx] - prev_vertices[nbidx];
             double dist = diff.norm();
             double weight = 1. / (dist + 1e-12);
@@ -359,13 +472,13 @@ std::shared_ptr<TriangleMesh> TriangleMesh::FilterSmoothLaplacian(
     mesh->vertex_colors_.resize(vertex_colors_.size());
     mesh->triangles_ = triangles_;
     mesh->adjacency_list_ = adjacency_list_;
-    if (!mesh->HasAdjacencyList()) {
-        mesh->ComputeAdjacencyList();
-    }
+    std::vector<int64_t> offsets;
+    std::vector<int> neighbors;
+    std::tie(offsets, neighbors) = ComputeAdjacencyCSR();
 
     for (int iter = 0; iter < number_of_iterations; ++iter) {
         FilterSmoothLaplacianHelper(mesh, prev_vertices, prev_vertex_normals,
-                                    prev_vertex_colors, mesh->adjacency_list_,
+                                    prev_vertex_colors, offsets, neighbors,
                                     lambda, filter_vertex, filter_normal,
                                     filter_color);
         if (iter < number_of_iterations - 1) {
@@ -401,21 +514,20 @@ std::shared_ptr<TriangleMesh> TriangleMesh::FilterSmoothTaubin(
     mesh->vertex_colors_.resize(vertex_colors_.size());
     mesh->triangles_ = triangles_;
     mesh->adjacency_list_ = adjacency_list_;
-    if (!mesh->HasAdjacencyList()) {
-        mesh->ComputeAdjacencyList();
-    }
+    std::vector<int64_t> offsets;
+    std::vector<int> neighbors;
+    std::tie(offsets, neighbors) = ComputeAdjacencyCSR();
     for (int iter = 0; iter < number_of_iterations; ++iter) {
         FilterSmoothLaplacianHelper(mesh, prev_vertices, prev_vertex_normals,
-                                    prev_vertex_colors, mesh->adjacency_list_,
+                                    prev_vertex_colors, offsets, neighbors,
                                     lambda, filter_vertex, filter_normal,
                                     filter_color);
         std::swap(mesh->vertices_, prev_vertices);
         std::swap(mesh->vertex_normals_, prev_vertex_normals);
         std::swap(mesh->vertex_colors_, prev_vertex_colors);
         FilterSmoothLaplacianHelper(mesh, prev_vertices, prev_vertex_normals,
-                                    prev_vertex_colors, mesh->adjacency_list_,
-                                    mu, filter_vertex, filter_normal,
-                                    filter_color);
+                                    prev_vertex_colors, offsets, neighbors, mu,
+                                    filter_vertex, filter_normal, filter_color);
         if (iter < number_of_iterations - 1) {
             std::swap(mesh->vertices_, prev_vertices);
             std::swap(mesh->vertex_normals_, prev_vertex_normals);
@@ -425,6 +537,112 @@ std::shared_ptr<TriangleMesh> TriangleMesh::FilterSmoothTaubin(
     return mesh;
 }
 
+namespace {
+
+/// Number of points sampled with the same random stream. The streams are
+/// seeded with the seed and the index of their block of points, so that the
+/// samples do not depend on the number of threads.
+constexpr int64_t kSamplingBlockSize = 4096;
+
+/// Relative tolerance on the weights of the points eliminated together in one
+/// round of Poisson disk sample elimination.
+constexpr double kEliminationTolerance = 0.1;
+
+/// \brief Neighbors of every point closer than \p radius, the point itself
+/// excluded, found on a grid of cells of size \p radius.
+///
+/// The neighbors of point i are neighbors[offsets[i]] ...
+/// neighbors[offsets[i + 1] - 1], with their squared distances in distances2.
+void ComputeRadiusNeighbors(const PointCloud &pcl,
+                            double radius,
+                            std::vector<int64_t> &offsets,
+                            std::vector<int> &neighbors,
+                            std::vector<double> &distances2) {
+    const int64_t num_points = int64_t(pcl.points_.size());
+    const Eigen::Vector3d min_bound = pcl.GetMinBound();
+    if (radius * std::numeric_limits<int>::max() <
+        (pcl.GetMaxBound() - min_bound).maxCoeff()) {
+        utility::LogError(
+                "[SamplePointsPoissonDisk] number_of_points is too large for "
+                "the extent of the mesh.");
+    }
+    const std::vector<Eigen::Vector3i> cell_indices =
+            VoxelGrouping::ComputeVoxelIndices(pcl.points_, min_bound, radius);
+    std::vector<int64_t> sorted_points, cell_starts;
+    VoxelGrouping::GroupPointsByVoxel(cell_indices, sorted_points, cell_starts);
+    const int64_t num_cells = int64_t(cell_starts.size()) - 1;
+    std::unordered_map<Eigen::Vector3i, int64_t,
+                       utility::hash_eigen<Eigen::Vector3i>>
+            cell_map;
+    cell_map.reserve(num_cells);
+    for (int64_t c = 0; c < num_cells; ++c) {
+        cell_map[cell_indices[sorted_points[cell_starts[c]]]] = c;
+    }
+    auto neighbor_cells = [&](int64_t c, std::vector<int64_t> &cells) {
+        cells.clear();
+        const Eigen::Vector3i &cell =
+                cell_indices[sorted_points[cell_starts[c]]];
+        for (int x = -1; x <= 1; ++x) {
+            for (int y = -1; y <= 1; ++y) {
+                for (int z = -1; z <= 1; ++z) {
+                    auto it = cell_map.find(cell + Eigen::Vector3i(x, y, z));
+                    if (it != cell_map.end()) {
+                        cells.push_back(it->second);
+                    }
+                }
+            }
+        }
+    };
+
+    // Count the neighbors, then store them at their offsets.
+    const double radius2 = radius * radius;
+    std::vector<int64_t> counts(num_points + 1, 0);
+    for (int pass = 0; pass < 2; ++pass) {
+#pragma omp parallel
+        {
+            std::vector<int64_t> cells;
+#pragma omp for schedule(dynamic, 64)
+            for (int64_t c = 0; c < num_cells; ++c) {
+                neighbor_cells(c, cells);
+                for (int64_t i = cell_starts[c]; i < cell_starts[c + 1]; ++i) {
+                    const int64_t pidx0 = sorted_points[i];
+                    const Eigen::Vector3d &point = pcl.points_[pidx0];
+                    int64_t next = pass == 0 ? 0 : offsets[pidx0];
+                    for (int64_t nc : cells) {
+                        for (int64_t j = cell_starts[nc];
+                             j < cell_starts[nc + 1]; ++j) {
+                            const int64_t pidx1 = sorted_points[j];
+                            const double dist2 =
+                                    (pcl.points_[pidx1] - point).squaredNorm();
+                            if (pidx1 == pidx0 || dist2 >= radius2) {
+                                continue;
+                            }
+                            if (pass == 1) {
+                                neighbors[next] = int(pidx1);
+                                distances2[next] = dist2;
+                            }
+                            ++next;
+                        }
+                    }
+                    if (pass == 0) {
+                        counts[pidx0 + 1] = next;
+                    }
+                }
+            }
+        }
+        if (pass == 0) {
+            offsets.resize(num_points + 1);
+            utility::InclusivePrefixSum(counts.data(),
+                                        counts.data() + counts.size(),
+                                        offsets.data());
+            neighbors.resize(offsets.back());
+            distances2.resize(offsets.back());
+        }
+    }
+}
+
+}  // namespace
+
 std::shared_ptr<PointCloud> TriangleMesh::SamplePointsUniformlyImpl(
         size_t number_of_points,
         std::vector<double> &triangle_areas,
@@ -438,6 +656,20 @@ std::shared_ptr<PointCloud> TriangleMesh::SamplePointsUniformlyImpl(
                 triangle_areas[tidx] / surface_area + triangle_areas[tidx - 1];
     }
 
+    // Points of triangle tidx are point_starts[tidx] ...
+    // point_starts[tidx + 1] - 1.
+    const int64_t num_triangles = int64_t(triangles_.size());
+    const int64_t num_points = int64_t(number_of_points);
+    std::vector<int64_t> point_starts(num_triangles + 1);
+    point_starts[0] = 0;
+    point_starts[num_triangles] = num_points;
+#pragma omp parallel for schedule(static)
+    for (int64_t tidx = 0; tidx < num_triangles - 1; ++tidx) {
+        point_starts[tidx + 1] = std::min(
+                num_points, int64_t(std::round(triangle_areas[tidx] *
+                                               double(number_of_points))));
+    }
+
     // sample point cloud
     bool has_vert_normal = HasVertexNormals();
     bool has_vert_color = HasVertexColors();
@@ -445,8 +677,6 @@ std::shared_ptr<PointCloud> TriangleMesh::SamplePointsUniformlyImpl(
         std::random_device rd;
         seed = rd();
     }
-    std::mt19937 mt(seed);
-    std::uniform_real_distribution<double> dist(0.0, 1.0);
     auto pcd = std::make_shared<PointCloud>();
     pcd->points_.resize(number_of_points);
     if (has_vert_normal || use_triangle_normal) {
@@ -458,10 +688,22 @@ std::shared_ptr<PointCloud> TriangleMesh::SamplePointsUniformlyImpl(
     if (has_vert_color) {
         pcd->colors_.resize(number_of_points);
     }
-    size_t point_idx = 0;
-    for (size_t tidx = 0; tidx < triangles_.size(); ++tidx) {
-        size_t n = size_t(std::round(triangle_areas[tidx] * number_of_points));
-        while (point_idx < n) {
+    const int64_t num_blocks =
+            (num_points + kSamplingBlockSize - 1) / kSamplingBlockSize;
+#pragma omp parallel for schedule(static)
+    for (int64_t block = 0; block < num_blocks; ++block) {
+        std::seed_seq seed_sequence{uint32_t(seed), uint32_t(block)};
+        std::mt19937 mt(seed_sequence);
+        std::uniform_real_distribution<double> dist(0.0, 1.0);
+        const int64_t begin = block * kSamplingBlockSize;
+        const int64_t end = std::min(begin + kSamplingBlockSize, num_points);
+        int64_t tidx = std::upper_bound(point_starts.begin(),
+                                        point_starts.end(), begin) -
+                       point_starts.begin() - 1;
+        for (int64_t point_idx = begin; point_idx < end; ++point_idx) {
+            while (point_starts[tidx + 1] <= point_idx) {
+                ++tidx;
+            }
             double r1 = dist(mt);
             double r2 = dist(mt);
             double a = (1 - std::sqrt(r1));
@@ -485,8 +727,6 @@ std::shared_ptr<PointCloud> TriangleMesh::SamplePointsUniformlyImpl(
                                           b * vertex_colors_[triangle(1)] +
                                           c * vertex_colors_[triangle(2)];
             }
-
-            point_idx++;
         }
     }
 
@@ -563,10 +803,6 @@ std::shared_ptr<PointCloud> TriangleMesh::SamplePointsPoissonDisk(
                                  (2 * std::sqrt(3.)));
     double r_min = r_max * beta * (1 - std::pow(ratio, gamma));
 
-    std::vector<double> weights(pcl->points_.size());
-    std::vector<bool> deleted(pcl->points_.size(), false);
-    KDTreeFlann kdtree(*pcl);
-
     auto WeightFcn = [&](double d2) {
         double d = std::sqrt(d2);
         if (d < r_min) {
@@ -575,60 +811,140 @@ std::shared_ptr<PointCloud> TriangleMesh::SamplePointsPoissonDisk(
         return std::pow(1 - d / r_max, alpha);
     };
 
-    auto ComputePointWeight = [&](int pidx0) {
-        std::vector<int> nbs;
-        std::vector<double> dists2;
-        kdtree.SearchRadius(pcl->points_[pidx0], r_max, nbs, dists2);
+    // Neighbors within r_max and their contributions to the weights.
+    const int64_t num_points = int64_t(pcl->points_.size());
+    std::vector<int64_t> offsets;
+    std::vector<int> neighbors;
+    std::vector<double> neighbor_weights;
+    ComputeRadiusNeighbors(*pcl, r_max, offsets, neighbors, neighbor_weights);
+#pragma omp parallel for schedule(static)
+    for (int64_t k = 0; k < int64_t(neighbors.size()); ++k) {
+        neighbor_weights[k] = WeightFcn(neighbor_weights[k]);
+    }
+
+    std::vector<double> weights(num_points);
+    std::vector<uint8_t> deleted(num_points, 0);
+    auto ComputePointWeight = [&](int64_t pidx0) {
         double weight = 0;
-        for (size_t nbidx = 0; nbidx < nbs.size(); ++nbidx) {
-            int pidx1 = nbs[nbidx];
-            // only count weights if not the same point if not deleted
-            if (pidx0 == pidx1 || deleted[pidx1]) {
-                continue;
+        for (int64_t k = offsets[pidx0]; k < offsets[pidx0 + 1]; ++k) {
+            if (!deleted[neighbors[k]]) {
+                weight += neighbor_weights[k];
             }
-            weight += WeightFcn(dists2[nbidx]);
         }
-
         weights[pidx0] = weight;
     };
-
-    // init weights and priority queue
-    typedef std::tuple<int, double> QueueEntry;
-    auto WeightCmp = [](const QueueEntry &a, const QueueEntry &b) {
-        return std::get<1>(a) < std::get<1>(b);
+    // Order of elimination: by decreasing weight, then by increasing index.
+    auto EliminatedBefore = [&](int64_t pidx0, int64_t pidx1) {
+        return weights[pidx0] > weights[pidx1] ||
+               (weights[pidx0] == weights[pidx1] && pidx0 < pidx1);
     };
-    std::priority_queue<QueueEntry, std::vector<QueueEntry>,
-                        decltype(WeightCmp)>
-            queue(WeightCmp);
-    for (size_t pidx0 = 0; pidx0 < pcl->points_.size(); ++pidx0) {
-        ComputePointWeight(int(pidx0));
-        queue.push(QueueEntry(int(pidx0), weights[pidx0]));
+    // A point can be eliminated together with others if it comes before all
+    // of its remaining neighbors, so that their weights do not change before
+    // it is eliminated.
+    auto IsLocalMaximum = [&](int64_t pidx0) {
+        for (int64_t k = offsets[pidx0]; k < offsets[pidx0 + 1]; ++k) {
+            const int pidx1 = neighbors[k];
+            if (!deleted[pidx1] && EliminatedBefore(pidx1, pidx0)) {
+                return false;
+            }
+        }
+        return true;
     };
 
-    // sample elimination
-    size_t current_number_of_points = pcl->points_.size();
-    while (current_number_of_points > number_of_points) {
-        int pidx;
-        double weight;
-        std::tie(pidx, weight) = queue.top();
-        queue.pop();
-
-        // test if the entry is up to date (because of reinsert)
-        if (deleted[pidx] || weight != weights[pidx]) {
-            continue;
+#pragma omp parallel for schedule(static)
+    for (int64_t pidx = 0; pidx < num_points; ++pidx) {
+        ComputePointWeight(pidx);
+    }
+
+    // Sample elimination in rounds. Every round eliminates the local maxima
+    // whose weight is within kEliminationTolerance of the largest weight of
+    // the other remaining points, so that the points are eliminated in almost
+    // the same order as one by one, but many at a time.
+    std::vector<int64_t> points_to_check(num_points);
+    std::iota(points_to_check.begin(), points_to_check.end(), 0);
+    std::vector<uint8_t> is_local_maximum(num_points, 0);
+    std::vector<int64_t> last_update(num_points, -1);
+    std::vector<int64_t> eliminated, updated, kept;
+    int64_t current_number_of_points = num_points;
+    for (int64_t round = 0;
+         current_number_of_points > int64_t(number_of_points); ++round) {
+        // Only the points whose neighborhood changed since they were last
+        // checked can become local maxima.
+#pragma omp parallel for schedule(dynamic, 256)
+        for (int64_t k = 0; k < int64_t(points_to_check.size()); ++k) {
+            is_local_maximum[points_to_check[k]] =
+                    IsLocalMaximum(points_to_check[k]);
+        }
+        double max_weight = -1;
+#pragma omp parallel
+        {
+            double thread_max_weight = -1;
+#pragma omp for schedule(static)
+            for (int64_t pidx = 0; pidx < num_points; ++pidx) {
+                if (!deleted[pidx] && !is_local_maximum[pidx]) {
+                    thread_max_weight =
+                            std::max(thread_max_weight, weights[pidx]);
+                }
+            }
+#pragma omp critical
+            { max_weight = std::max(max_weight, thread_max_weight); }
+        }
+        const double threshold = max_weight * (1 - kEliminationTolerance);
+        eliminated.clear();
+        kept.clear();
+        for (int64_t pidx : points_to_check) {
+            if (is_local_maximum[pidx]) {
+                (weights[pidx] >= threshold ? eliminated : kept)
+                        .push_back(pidx);
+            }
         }
-
-        // delete current sample
-        deleted[pidx] = true;
-        current_number_of_points--;
-
-        // update weights
-        std::vector<int> nbs;
-        std::vector<double> dists2;
-        kdtree.SearchRadius(pcl->points_[pidx], r_max, nbs, dists2);
-        for (int nb : nbs) {
-            ComputePointWeight(nb);
-            queue.push(QueueEntry(nb, weights[nb]));
+        const int64_t excess =
+                current_number_of_points - int64_t(number_of_points);
+        if (int64_t(eliminated.size()) > excess) {
+            std::sort(eliminated.begin(), eliminated.end(), EliminatedBefore);
+            kept.insert(kept.end(), eliminated.begin() + excess,
+                        eliminated.end());
+            eliminated.resize(excess);
+        }
+        for (int64_t pidx : eliminated) {
+            deleted[pidx] = 1;
+            is_local_maximum[pidx] = 0;
+        }
+        current_number_of_points -= int64_t(eliminated.size());
+
+        // update weights of the remaining neighbors
+        updated.clear();
+        for (int64_t pidx0 : eliminated) {
+            for (int64_t k = offsets[pidx0]; k < offsets[pidx0 + 1]; ++k) {
+                const int pidx1 = neighbors[k];
+                if (!deleted[pidx1] && last_update[pidx1] != round) {
+                    last_update[pidx1] = round;
+                    updated.push_back(pidx1);
+                }
+            }
+        }
+#pragma omp parallel for schedule(static)
+        for (int64_t k = 0; k < int64_t(updated.size()); ++k) {
+            ComputePointWeight(updated[k]);
+        }
+
+        // Points to check in the next round: the updated points, their
+        // remaining neighbors, and the local maxima that were kept.
+        points_to_check = updated;
+        for (int64_t pidx0 : updated) {
+            for (int64_t k = offsets[pidx0]; k < offsets[pidx0 + 1]; ++k) {
+                const int pidx1 = neighbors[k];
+                if (!deleted[pidx1] && last_update[pidx1] != round) {
+                    last_update[pidx1] = round;
+                    points_to_check.push_back(pidx1);
+                }
+            }
+        }
+        for (int64_t pidx : kept) {
+            if (last_update[pidx] != round) {
+                last_update[pidx] = round;
+                points_to_check.push_back(pidx);
+            }
         }
     }
 
@@ -659,38 +975,140 @@ std::shared_ptr<PointCloud> TriangleMesh::SamplePointsPoissonDisk(
     return pcl;
 }
 
+namespace {
+
+/// Hash of the coordinates of a vertex, equal for equal coordinates, -0.0 and
+/// 0.0 included.
+uint64_t CoordinateHash(const Eigen::Vector3d &vertex) {
+    uint64_t hash = 0;
+    for (int i = 0; i < 3; ++i) {
+        const double x = vertex(i) + 0.0;
+        uint64_t bits;
+        std::memcpy(&bits, &x, sizeof(bits));
+        // Mix as in splitmix64.
+        hash = (hash ^ bits) + 0x9e3779b97f4a7c15ull;
+        hash = (hash ^ (hash >> 30)) * 0xbf58476d1ce4e5b9ull;
+        hash = (hash ^ (hash >> 27)) * 0x94d049bb133111ebull;
+        hash ^= hash >> 31;
+    }
+    return hash;
+}
+
+/// Number the elements with a non-zero flag in order, with a parallel prefix
+/// sum. Returns the number of flagged elements.
+int NumberFlaggedElements(const std::vector<int> &flags,
+                          std::vector<int> &new_indices) {
+    new_indices.resize(flags.size());
+    if (flags.empty()) {
+        return 0;
+    }
+    utility::InclusivePrefixSum(flags.data(), flags.data() + flags.size(),
+                                new_indices.data());
+    const int count = new_indices.back();
+#pragma omp parallel for schedule(static)
+    for (int64_t i = 0; i < int64_t(flags.size()); ++i) {
+        new_indices[i] -= 1;
+    }
+    return count;
+}
+
+/// Keep the flagged elements of \p values, moving them to their new indices.
+template <typename T>
+void CompactFlaggedElements(std::vector<T> &values,
+                            const std::vector<int> &flags,
+                            const std::vector<int> &new_indices,
+                            int count) {
+    std::vector<T> compacted(count);
+#pragma omp parallel for schedule(static)
+    for (int64_t i = 0; i < int64_t(values.size()); ++i) {
+        if (flags[i]) {
+            compacted[new_indices[i]] = values[i];
+        }
+    }
+    values.swap(compacted);
+}
+
+void RemapTriangleVertices(std::vector<Eigen::Vector3i> &triangles,
+                           const std::vector<int> &vertex_remap) {
+#pragma omp parallel for schedule(static)
+    for (int64_t tidx = 0; tidx < int64_t(triangles.size()); ++tidx) {
+        Eigen::Vector3i &triangle = triangles[tidx];
+        triangle(0) = vertex_remap[triangle(0)];
+        triangle(1) = vertex_remap[triangle(1)];
+        triangle(2) = vertex_remap[triangle(2)];
+    }
+}
+
+}  // namespace
+
 TriangleMesh &TriangleMesh::RemoveDuplicatedVertices() {
-    typedef std::tuple<double, double, double> Coordinate3;
-    std::unordered_map<Coordinate3, size_t, utility::hash_tuple<Coordinate3>>
-            point_to_old_index;
-    std::vector<int> index_old_to_new(vertices_.size());
+    std::vector<int> vertex_remap;
+    return RemoveDuplicatedVertices(vertex_remap);
+}
+
+TriangleMesh &TriangleMesh::RemoveDuplicatedVertices(
+        std::vector<int> &vertex_remap) {
+    const int64_t old_vertex_num = int64_t(vertices_.size());
     bool has_vert_normal = HasVertexNormals();
     bool has_vert_color = HasVertexColors();
-    size_t old_vertex_num = vertices_.size();
-    size_t k = 0;                                  // new index
-    for (size_t i = 0; i < old_vertex_num; i++) {  // old index
-        Coordinate3 coord = std::make_tuple(vertices_[i](0), vertices_[i](1),
-                                            vertices_[i](2));
-        if (point_to_old_index.find(coord) == point_to_old_index.end()) {
-            point_to_old_index[coord] = i;
-            vertices_[k] = vertices_[i];
-            if (has_vert_normal) vertex_normals_[k] = vertex_normals_[i];
-            if (has_vert_color) vertex_colors_[k] = vertex_colors_[i];
-            index_old_to_new[i] = (int)k;
-            k++;
-        } else {
-            index_old_to_new[i] = index_old_to_new[point_to_old_index[coord]];
+
+    // Group the vertices by a hash of their coordinates with a stable radix
+    // sort, so that the vertices of a group are in index order. Duplicates
+    // are in the same group and the first of them is kept.
+    std::vector<uint64_t> keys(old_vertex_num);
+#pragma omp parallel for schedule(static)
+    for (int64_t i = 0; i < old_vertex_num; ++i) {
+        keys[i] = CoordinateHash(vertices_[i]);
+    }
+    std::vector<int> sorted_vertices(old_vertex_num);
+    std::iota(sorted_vertices.begin(), sorted_vertices.end(), 0);
+    utility::ParallelRadixSort(keys, sorted_vertices);
+    std::vector<int> first_vertex(old_vertex_num);
+#pragma omp parallel for schedule(static)
+    for (int64_t begin = 0; begin < old_vertex_num; ++begin) {
+        if (begin > 0 && keys[begin] == keys[begin - 1]) {
+            continue;
+        }
+        int64_t end = begin + 1;
+        while (end < old_vertex_num && keys[end] == keys[begin]) {
+            ++end;
+        }
+        for (int64_t k = begin; k < end; ++k) {
+            const int vidx = sorted_vertices[k];
+            first_vertex[vidx] = vidx;
+            // Hashes may collide, and coordinates with NaN are never equal.
+            for (int64_t l = begin; l < k; ++l) {
+                const int first = sorted_vertices[l];
+                if (first_vertex[first] == first &&
+                    vertices_[first] == vertices_[vidx]) {
+                    first_vertex[vidx] = first;
+                    break;
+                }
+            }
         }
     }
-    vertices_.resize(k);
-    if (has_vert_normal) vertex_normals_.resize(k);
-    if (has_vert_color) vertex_colors_.resize(k);
+
+    std::vector<int> is_first(old_vertex_num);
+#pragma omp parallel for schedule(static)
+    for (int64_t i = 0; i < old_vertex_num; ++i) {
+        is_first[i] = first_vertex[i] == int(i);
+    }
+    std::vector<int> new_indices;
+    const int k = NumberFlaggedElements(is_first, new_indices);
+    vertex_remap.resize(old_vertex_num);
+#pragma omp parallel for schedule(static)
+    for (int64_t i = 0; i < old_vertex_num; ++i) {
+        vertex_remap[i] = new_indices[first_vertex[i]];
+    }
+    CompactFlaggedElements(vertices_, is_first, new_indices, k);
+    if (has_vert_normal) {
+        CompactFlaggedElements(vertex_normals_, is_first, new_indices, k);
+    }
+    if (has_vert_color) {
+        CompactFlaggedElements(vertex_colors_, is_first, new_indices, k);
+    }
     if (k < old_vertex_num) {
-        for (auto &triangle : triangles_) {
-            triangle(0) = index_old_to_new[triangle(0)];
-            triangle(1) = index_old_to_new[triangle(1)];
-            triangle(2) = index_old_to_new[triangle(2)];
-        }
+        RemapTriangleVertices(triangles_, vertex_remap);
         if (HasAdjacencyList()) {
             ComputeAdjacencyList();
         }
@@ -708,42 +1126,49 @@ TriangleMesh &TriangleMesh::RemoveDuplicatedTriangles() {
                 "[RemoveDuplicatedTriangles] This mesh contains triangle uvs "
                 "that are not handled in this function");
     }
-    typedef std::tuple<int, int, int> Index3;
-    std::unordered_map<Index3, size_t, utility::hash_tuple<Index3>>
-            triangle_to_old_index;
     bool has_tri_normal = HasTriangleNormals();
-    size_t old_triangle_num = triangles_.size();
-    size_t k = 0;
-    for (size_t i = 0; i < old_triangle_num; i++) {
-        Index3 index;
+    const int64_t old_triangle_num = int64_t(triangles_.size());
+
+    // Sort the triangles by their vertices, and by index for equal vertices,
+    // so that every group of duplicates starts with its first triangle.
+    typedef std::tuple<int, int, int, int> TriangleKey;
+    std::vector<TriangleKey> keys(old_triangle_num);
+#pragma omp parallel for schedule(static)
+    for (int64_t i = 0; i < old_triangle_num; i++) {
+        const Eigen::Vector3i &t = triangles_[i];
         // We first need to find the minimum index. Because triangle (0-1-2)
         // and triangle (2-0-1) are the same.
-        if (triangles_[i](0) <= triangles_[i](1)) {
-            if (triangles_[i](0) <= triangles_[i](2)) {
-                index = std::make_tuple(triangles_[i](0), triangles_[i](1),
-                                        triangles_[i](2));
+        if (t(0) <= t(1)) {
+            if (t(0) <= t(2)) {
+                keys[i] = std::make_tuple(t(0), t(1), t(2), int(i));
             } else {
-                index = std::make_tuple(triangles_[i](2), triangles_[i](0),
-                                        triangles_[i](1));
+                keys[i] = std::make_tuple(t(2), t(0), t(1), int(i));
             }
         } else {
-            if (triangles_[i](1) <= triangles_[i](2)) {
-                index = std::make_tuple(triangles_[i](1), triangles_[i](2),
-                                        triangles_[i](0));
+            if (t(1) <= t(2)) {
+                keys[i] = std::make_tuple(t(1), t(2), t(0), int(i));
             } else {
-                index = std::make_tuple(triangles_[i](2), triangles_[i](0),
-                                        triangles_[i](1));
+                keys[i] = std::make_tuple(t(2), t(0), t(1), int(i));
             }
         }
-        if (triangle_to_old_index.find(index) == triangle_to_old_index.end()) {
-            triangle_to_old_index[index] = i;
-            triangles_[k] = triangles_[i];
-            if (has_tri_normal) triangle_normals_[k] = triangle_normals_[i];
-            k++;
+    }
+    tbb::parallel_sort(keys.begin(), keys.end());
+    std::vector<int> is_first(old_triangle_num, 0);
+#pragma omp parallel for schedule(static)
+    for (int64_t k = 0; k < old_triangle_num; ++k) {
+        if (k == 0 || std::get<0>(keys[k]) != std::get<0>(keys[k - 1]) ||
+            std::get<1>(keys[k]) != std::get<1>(keys[k - 1]) ||
+            std::get<2>(keys[k]) != std::get<2>(keys[k - 1])) {
+            is_first[std::get<3>(keys[k])] = 1;
         }
     }
-    triangles_.resize(k);
-    if (has_tri_normal) triangle_normals_.resize(k);
+
+    std::vector<int> new_indices;
+    const int k = NumberFlaggedElements(is_first, new_indices);
+    CompactFlaggedElements(triangles_, is_first, new_indices, k);
+    if (has_tri_normal) {
+        CompactFlaggedElements(triangle_normals_, is_first, new_indices, k);
+    }
     if (k < old_triangle_num && HasAdjacencyList()) {
         ComputeAdjacencyList();
     }
@@ -908,79 +1333,144 @@ TriangleMesh &TriangleMesh::RemoveNonManifoldEdges() {
 }
 
 TriangleMesh &TriangleMesh::MergeCloseVertices(double eps) {
-    KDTreeFlann kdtree(*this);
-    // precompute all neighbours
-    utility::LogDebug("Precompute Neighbours");
-    std::vector<std::vector<int>> nbs(vertices_.size());
+    std::vector<int> vertex_remap;
+    return MergeCloseVertices(eps, vertex_remap);
+}
+
+TriangleMesh &TriangleMesh::MergeCloseVertices(double eps,
+                                               std::vector<int> &vertex_remap) {
+    const int64_t old_vertex_num = int64_t(vertices_.size());
+    ConcurrentUnionFind union_find(old_vertex_num);
+    if (eps > 0.0 && old_vertex_num > 1) {
+        // Grid of cells not smaller than eps, so that the vertices close to a
+        // vertex are in its cell or in one of the 26 cells around it.
+        utility::LogDebug("Build Grid");
+        const Eigen::Vector3d min_bound = GetMinBound();
+        const double cell_size =
+                std::max(eps, (GetMaxBound() - min_bound).maxCoeff() /
+                                      (std::numeric_limits<int>::max() / 2));
+        const std::vector<Eigen::Vector3i> cell_indices =
+                VoxelGrouping::ComputeVoxelIndices(vertices_, min_bound,
+                                                   cell_size);
+        std::vector<int64_t> sorted_vertices, cell_starts;
+        VoxelGrouping::GroupPointsByVoxel(cell_indices, sorted_vertices,
+                                          cell_starts);
+        const int64_t num_cells = int64_t(cell_starts.size()) - 1;
+        std::unordered_map<Eigen::Vector3i, int64_t,
+                           utility::hash_eigen<Eigen::Vector3i>>
+                cell_map;
+        cell_map.reserve(num_cells);
+        for (int64_t c = 0; c < num_cells; ++c) {
+            cell_map[cell_indices[sorted_vertices[cell_starts[c]]]] = c;
+        }
+
+        // Connect the close vertices of every pair of neighboring cells.
+        utility::LogDebug("Connect Close Vertices");
+        const double eps2 = eps * eps;
+#pragma omp parallel for schedule(dynamic, 64)
+        for (int64_t c = 0; c < num_cells; ++c) {
+            const Eigen::Vector3i &cell =
+                    cell_indices[sorted_vertices[cell_starts[c]]];
+            for (int x = -1; x <= 1; ++x) {
+                for (int y = -1; y <= 1; ++y) {
+                    for (int z = -1; z <= 1; ++z) {
+                        auto it =
+                                cell_map.find(cell + Eigen::Vector3i(x, y, z));
+                        if (it == cell_map.end() || it->second < c) {
+                            continue;
+                        }
+                        const int64_t nc = it->second;
+                        for (int64_t i = cell_starts[c]; i < cell_starts[c + 1];
+                             ++i) {
+                            const Eigen::Vector3d &vertex =
+                                    vertices_[sorted_vertices[i]];
+                            for (int64_t j = nc == c ? i + 1 : cell_starts[nc];
+                                 j < cell_starts[nc + 1]; ++j) {
+                                if ((vertices_[sorted_vertices[j]] - vertex)
+                                            .squaredNorm() < eps2) {
+                                    union_find.Union(sorted_vertices[i],
+                                                     sorted_vertices[j]);
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+    // Merged vertices are numbered in the order of their first vertex.
+    std::vector<int> is_root(old_vertex_num);
+#pragma omp parallel for schedule(static)
+    for (int64_t i = 0; i < old_vertex_num; ++i) {
+        is_root[i] = union_find.Find(i) == i;
+    }
+    std::vector<int> new_indices;
+    const int k = NumberFlaggedElements(is_root, new_indices);
+    vertex_remap.resize(old_vertex_num);
 #pragma omp parallel for schedule(static)
-    for (int idx = 0; idx < int(vertices_.size()); ++idx) {
-        std::vector<double> dists2;
-        kdtree.SearchRadius(vertices_[idx], eps, nbs[idx], dists2);
+    for (int64_t i = 0; i < old_vertex_num; ++i) {
+        vertex_remap[i] = new_indices[union_find.Find(i)];
+    }
+
+    // Vertices of every merged vertex, in compressed sparse row layout.
+    std::vector<int> merged_starts(k + 1, 0);
+    for (int64_t i = 0; i < old_vertex_num; ++i) {
+        merged_starts[vertex_remap[i] + 1]++;
+    }
+    std::partial_sum(merged_starts.begin(), merged_starts.end(),
+                     merged_starts.begin());
+    std::vector<int> merged_vertices(old_vertex_num);
+    std::vector<int> next_vertex(merged_starts.begin(),
+                                 merged_starts.end() - 1);
+    for (int64_t i = 0; i < old_vertex_num; ++i) {
+        merged_vertices[next_vertex[vertex_remap[i]]++] = int(i);
     }
-    utility::LogDebug("Done Precompute Neighbours");
 
     bool has_vertex_normals = HasVertexNormals();
     bool has_vertex_colors = HasVertexColors();
-    std::vector<Eigen::Vector3d> new_vertices;
-    std::vector<Eigen::Vector3d> new_vertex_normals;
-    std::vector<Eigen::Vector3d> new_vertex_colors;
-    std::unordered_map<int, int> new_vert_mapping;
-    for (int vidx = 0; vidx < int(vertices_.size()); ++vidx) {
-        if (new_vert_mapping.count(vidx) > 0) {
-            continue;
-        }
-
-        int new_vidx = int(new_vertices.size());
-        new_vert_mapping[vidx] = new_vidx;
-
-        Eigen::Vector3d vertex = vertices_[vidx];
-        Eigen::Vector3d normal;
-        if (has_vertex_normals) {
-            normal = vertex_normals_[vidx];
-        }
-        Eigen::Vector3d color;
-        if (has_vertex_colors) {
-            color = vertex_colors_[vidx];
-        }
-        int n = 1;
-        for (int nb : nbs[vidx]) {
-            if (vidx == nb || new_vert_mapping.count(nb) > 0) {
-                continue;
-            }
-            vertex += vertices_[nb];
+    std::vector<Eigen::Vector3d> new_vertices(k);
+    std::vector<Eigen::Vector3d> new_vertex_normals(has_vertex_normals ? k : 0);
+    std::vector<Eigen::Vector3d> new_vertex_colors(has_vertex_colors ? k : 0);
+#pragma omp parallel for schedule(static)
+    for (int new_vidx = 0; new_vidx < k; ++new_vidx) {
+        Eigen::Vector3d vertex = Eigen::Vector3d::Zero();
+        Eigen::Vector3d normal = Eigen::Vector3d::Zero();
+        Eigen::Vector3d color = Eigen::Vector3d::Zero();
+        for (int m = merged_starts[new_vidx]; m < merged_starts[new_vidx + 1];
+             ++m) {
+            const int vidx = merged_vertices[m];
+            vertex += vertices_[vidx];
             if (has_vertex_normals) {
-                normal += vertex_normals_[nb];
+                normal += vertex_normals_[vidx];
             }
             if (has_vertex_colors) {
-                color += vertex_colors_[nb];
+                color += vertex_colors_[vidx];
             }
-            new_vert_mapping[nb] = new_vidx;
-            n += 1;
         }
-        new_vertices.push_back(vertex / n);
+        const int n = merged_starts[new_vidx + 1] - merged_starts[new_vidx];
+        new_vertices[new_vidx] = vertex / n;
         if (has_vertex_normals) {
-            new_vertex_normals.push_back(normal / n);
+            new_vertex_normals[new_vidx] = normal / n;
         }
         if (has_vertex_colors) {
-            new_vertex_colors.push_back(color / n);
+            new_vertex_colors[new_vidx] = color / n;
         }
     }
-    utility::LogDebug("Merged {} vertices",
-                      vertices_.size() - new_vertices.size());
+    utility::LogDebug("Merged {} vertices", old_vertex_num - k);
 
     std::swap(vertices_, new_vertices);
     std::swap(vertex_normals_, new_vertex_normals);
     std::swap(vertex_colors_, new_vertex_colors);
 
-    for (auto &triangle : triangles_) {
-        triangle(0) = new_vert_mapping[triangle(0)];
-        triangle(1) = new_vert_mapping[triangle(1)];
-        triangle(2) = new_vert_mapping[triangle(2)];
-    }
+    RemapTriangleVertices(triangles_, vertex_remap);
 
     if (HasTriangleNormals()) {
         ComputeTriangleNormals();
     }
+    if (HasAdjacencyList()) {
+        ComputeAdjacencyList();
+    }
 
     return *this;
 }
@@ -1342,34 +1832,7 @@ bool TriangleMesh::IsVertexManifold() const {
 
 std::vector<Eigen::Vector2i> TriangleMesh::GetSelfIntersectingTriangles()
         const {
-    std::vector<Eigen::Vector2i> self_intersecting_triangles;
-    for (size_t tidx0 = 0; tidx0 < triangles_.size() - 1; ++tidx0) {
-        const Eigen::Vector3i &tria_p = triangles_[tidx0];
-        const Eigen::Vector3d &p0 = vertices_[tria_p(0)];
-        const Eigen::Vector3d &p1 = vertices_[tria_p(1)];
-        const Eigen::Vector3d &p2 = vertices_[tria_p(2)];
-        for (size_t tidx1 = tidx0 + 1; tidx1 < triangles_.size(); ++tidx1) {
-            const Eigen::Vector3i &tria_q = triangles_[tidx1];
-            // check if neighbour triangle
-            if (tria_p(0) == tria_q(0) || tria_p(0) == tria_q(1) ||
-                tria_p(0) == tria_q(2) || tria_p(1) == tria_q(0) ||
-                tria_p(1) == tria_q(1) || tria_p(1) == tria_q(2) ||
-                tria_p(2) == tria_q(0) || tria_p(2) == tria_q(1) ||
-                tria_p(2) == tria_q(2)) {
-                continue;
-            }
-
-            // check for intersection
-            const Eigen::Vector3d &q0 = vertices_[tria_q(0)];
-            const Eigen::Vector3d &q1 = vertices_[tria_q(1)];
-            const Eigen::Vector3d &q2 = vertices_[tria_q(2)];
-            if (IntersectionTest::TriangleTriangle3d(p0, p1, p2, q0, q1, q2)) {
-                self_intersecting_triangles.push_back(
-                        Eigen::Vector2i(tidx0, tidx1));
-            }
-        }
-    }
-    return self_intersecting_triangles;
+    return TriangleMeshBVH(*this).GetSelfIntersectingTriangles();
 }
 
 bool TriangleMesh::IsSelfIntersecting() const {
@@ -1385,22 +1848,7 @@ bool TriangleMesh::IsIntersecting(const TriangleMesh &other) const {
     if (!IsBoundingBoxIntersecting(other)) {
         return false;
     }
-    for (size_t tidx0 = 0; tidx0 < triangles_.size(); ++tidx0) {
-        const Eigen::Vector3i &tria_p = triangles_[tidx0];
-        const Eigen::Vector3d &p0 = vertices_[tria_p(0)];
-        const Eigen::Vector3d &p1 = vertices_[tria_p(1)];
-        const Eigen::Vector3d &p2 = vertices_[tria_p(2)];
-        for (size_t tidx1 = 0; tidx1 < other.triangles_.size(); ++tidx1) {
-            const Eigen::Vector3i &tria_q = other.triangles_[tidx1];
-            const Eigen::Vector3d &q0 = other.vertices_[tria_q(0)];
-            const Eigen::Vector3d &q1 = other.vertices_[tria_q(1)];
-            const Eigen::Vector3d &q2 = other.vertices_[tria_q(2)];
-            if (IntersectionTest::TriangleTriangle3d(p0, p1, p2, q0, q1, q2)) {
-                return true;
-            }
-        }
-    }
-    return false;
+    return TriangleMeshBVH(*this).IsIntersecting(TriangleMeshBVH(other));
 }
 
 std::tuple<std::vector<int>, std::vector<size_t>, std::vector<double>>
@@ -1492,20 +1940,25 @@ void TriangleMesh::RemoveTrianglesByMask(
         utility::LogError("triangle_mask has a different size than triangles_");
     }
 
-    bool has_tri_normal = HasTriangleNormals();
-    int to_tidx = 0;
-    for (size_t from_tidx = 0; from_tidx < triangles_.size(); ++from_tidx) {
-        if (!triangle_mask[from_tidx]) {
-            triangles_[to_tidx] = triangles_[from_tidx];
-            if (has_tri_normal) {
-                triangle_normals_[to_tidx] = triangle_normals_[from_tidx];
-            }
-            to_tidx++;
-        }
-    }
-    triangles_.resize(to_tidx);
+    const bool has_tri_normal = HasTriangleNormals();
+    std::vector<Eigen::Vector3i> triangles;
+    std::vector<Eigen::Vector3d> triangle_normals;
+    utility::ParallelCompact(
+            int64_t(triangles_.size()),
+            [&](int64_t tidx) { return !triangle_mask[tidx]; },
+            [&](int64_t count) {
+                triangles.resize(count);
+                if (has_tri_normal) triangle_normals.resize(count);
+            },
+            [&](int64_t from_tidx, int64_t to_tidx) {
+                triangles[to_tidx] = triangles_[from_tidx];
+                if (has_tri_normal) {
+                    triangle_normals[to_tidx] = triangle_normals_[from_tidx];
+                }
+            });
+    triangles_.swap(triangles);
     if (has_tri_normal) {
-        triangle_normals_.resize(to_tidx);
+        triangle_normals_.swap(triangle_normals);
     }
 }
 
@@ -1531,45 +1984,117 @@ void TriangleMesh::RemoveVerticesByMask(const std::vector<bool> &vertex_mask) {
         utility::LogError("vertex_mask has a different size than vertices_");
     }
 
-    bool has_normal = HasVertexNormals();
-    bool has_color = HasVertexColors();
-    int to_vidx = 0;
-    std::unordered_map<int, int> vertex_map;
-    for (size_t from_vidx = 0; from_vidx < vertices_.size(); ++from_vidx) {
-        if (!vertex_mask[from_vidx]) {
-            vertex_map[static_cast<int>(from_vidx)] = static_cast<int>(to_vidx);
-            vertices_[to_vidx] = vertices_[from_vidx];
-            if (has_normal) {
-                vertex_normals_[to_vidx] = vertex_normals_[from_vidx];
-            }
-            if (has_color) {
-                vertex_colors_[to_vidx] = vertex_colors_[from_vidx];
-            }
-            to_vidx++;
-        }
-    }
-    vertices_.resize(to_vidx);
+    const bool has_normal = HasVertexNormals();
+    const bool has_color = HasVertexColors();
+    std::vector<Eigen::Vector3d> vertices;
+    std::vector<Eigen::Vector3d> vertex_normals;
+    std::vector<Eigen::Vector3d> vertex_colors;
+    std::vector<int> vertex_map(vertices_.size(), -1);
+    utility::ParallelCompact(
+            int64_t(vertices_.size()),
+            [&](int64_t vidx) { return !vertex_mask[vidx]; },
+            [&](int64_t count) {
+                vertices.resize(count);
+                if (has_normal) vertex_normals.resize(count);
+                if (has_color) vertex_colors.resize(count);
+            },
+            [&](int64_t from_vidx, int64_t to_vidx) {
+                vertex_map[from_vidx] = int(to_vidx);
+                vertices[to_vidx] = vertices_[from_vidx];
+                if (has_normal) {
+                    vertex_normals[to_vidx] = vertex_normals_[from_vidx];
+                }
+                if (has_color) {
+                    vertex_colors[to_vidx] = vertex_colors_[from_vidx];
+                }
+            });
+    vertices_.swap(vertices);
     if (has_normal) {
-        vertex_normals_.resize(to_vidx);
+        vertex_normals_.swap(vertex_normals);
     }
     if (has_color) {
-        vertex_colors_.resize(to_vidx);
+        vertex_colors_.swap(vertex_colors);
+    }
+
+    // Keep the triangles whose vertices are all kept, and renumber them.
+    const bool has_tri_normal = HasTriangleNormals();
+    std::vector<Eigen::Vector3i> triangles;
+    std::vector<Eigen::Vector3d> triangle_normals;
+    utility::ParallelCompact(
+            int64_t(triangles_.size()),
+            [&](int64_t tidx) {
+                const Eigen::Vector3i &tria = triangles_[tidx];
+                return vertex_map[tria(0)] >= 0 && vertex_map[tria(1)] >= 0 &&
+                       vertex_map[tria(2)] >= 0;
+            },
+            [&](int64_t count) {
+                triangles.resize(count);
+                if (has_tri_normal) triangle_normals.resize(count);
+            },
+            [&](int64_t from_tidx, int64_t to_tidx) {
+                const Eigen::Vector3i &tria = triangles_[from_tidx];
+                triangles[to_tidx] = Eigen::Vector3i(vertex_map[tria(0)],
+                                                     vertex_map[tria(1)],
+                                                     vertex_map[tria(2)]);
+                if (has_tri_normal) {
+                    triangle_normals[to_tidx] = triangle_normals_[from_tidx];
+                }
+            });
+    triangles_.swap(triangles);
+    if (has_tri_normal) {
+        triangle_normals_.swap(triangle_normals);
     }
+}
 
-    std::vector<bool> triangle_mask(triangles_.size());
-    for (size_t tidx = 0; tidx < triangles_.size(); ++tidx) {
-        auto &tria = triangles_[tidx];
-        triangle_mask[tidx] = vertex_mask[tria(0)] || vertex_mask[tria(1)] ||
-                              vertex_mask[tria(2)];
-        if (!triangle_mask[tidx]) {
-            tria(0) = vertex_map[tria(0)];
-            tria(1) = vertex_map[tria(1)];
-            tria(2) = vertex_map[tria(2)];
-        }
+namespace {
+
+/// Copy the triangles of \p mesh whose vertices are all selected into
+/// \p output, renumbered with \p new_vert_ind, and clean up \p output.
+void SelectTrianglesOfVertices(const TriangleMesh &mesh,
+                               const std::vector<int> &new_vert_ind,
+                               bool cleanup,
+                               TriangleMesh &output) {
+    const bool has_triangle_normals = mesh.HasTriangleNormals();
+    utility::ParallelCompact(
+            int64_t(mesh.triangles_.size()),
+            [&](int64_t tidx) {
+                const Eigen::Vector3i &triangle = mesh.triangles_[tidx];
+                return new_vert_ind[triangle(0)] >= 0 &&
+                       new_vert_ind[triangle(1)] >= 0 &&
+                       new_vert_ind[triangle(2)] >= 0;
+            },
+            [&](int64_t count) {
+                output.triangles_.resize(count);
+                if (has_triangle_normals) {
+                    output.triangle_normals_.resize(count);
+                }
+            },
+            [&](int64_t tidx, int64_t new_tidx) {
+                const Eigen::Vector3i &triangle = mesh.triangles_[tidx];
+                output.triangles_[new_tidx] = Eigen::Vector3i(
+                        new_vert_ind[triangle(0)], new_vert_ind[triangle(1)],
+                        new_vert_ind[triangle(2)]);
+                if (has_triangle_normals) {
+                    output.triangle_normals_[new_tidx] =
+                            mesh.triangle_normals_[tidx];
+                }
+            });
+
+    if (cleanup) {
+        output.RemoveDuplicatedVertices();
+        output.RemoveDuplicatedTriangles();
+        output.RemoveUnreferencedVertices();
+        output.RemoveDegenerateTriangles();
     }
-    RemoveTrianglesByMask(triangle_mask);
+    utility::LogDebug(
+            "Triangle mesh sampled from {:d} vertices and {:d} triangles to "
+            "{:d} vertices and {:d} triangles.",
+            (int)mesh.vertices_.size(), (int)mesh.triangles_.size(),
+            (int)output.vertices_.size(), (int)output.triangles_.size());
 }
 
+}  // namespace
+
 std::shared_ptr<TriangleMesh> TriangleMesh::SelectByIndex(
         const std::vector<size_t> &indices, bool cleanup) const {
     if (HasTriangleUvs()) {
@@ -1578,11 +2103,12 @@ std::shared_ptr<TriangleMesh> TriangleMesh::SelectByIndex(
                 "not handled in this function");
     }
     auto output = std::make_shared<TriangleMesh>();
-    bool has_triangle_normals = HasTriangleNormals();
     bool has_vertex_normals = HasVertexNormals();
     bool has_vertex_colors = HasVertexColors();
 
+    // Vertices are numbered in the order of their first occurrence.
     std::vector<int> new_vert_ind(vertices_.size(), -1);
+    std::vector<int> selected;
     for (const auto &sel_vidx : indices) {
         if (sel_vidx < 0 || sel_vidx >= vertices_.size()) {
             utility::LogWarning(
@@ -1594,41 +2120,71 @@ std::shared_ptr<TriangleMesh> TriangleMesh::SelectByIndex(
         if (new_vert_ind[sel_vidx] >= 0) {
             continue;
         }
-        new_vert_ind[sel_vidx] = int(output->vertices_.size());
-        output->vertices_.push_back(vertices_[sel_vidx]);
-        if (has_vertex_colors) {
-            output->vertex_colors_.push_back(vertex_colors_[sel_vidx]);
-        }
+        new_vert_ind[sel_vidx] = int(selected.size());
+        selected.push_back(int(sel_vidx));
+    }
+    output->vertices_.resize(selected.size());
+    if (has_vertex_normals) {
+        output->vertex_normals_.resize(selected.size());
+    }
+    if (has_vertex_colors) {
+        output->vertex_colors_.resize(selected.size());
+    }
+#pragma omp parallel for schedule(static)
+    for (int64_t new_vidx = 0; new_vidx < int64_t(selected.size());
+         ++new_vidx) {
+        const int vidx = selected[new_vidx];
+        output->vertices_[new_vidx] = vertices_[vidx];
         if (has_vertex_normals) {
-            output->vertex_normals_.push_back(vertex_normals_[sel_vidx]);
+            output->vertex_normals_[new_vidx] = vertex_normals_[vidx];
         }
-    }
-    for (size_t tidx = 0; tidx < triangles_.size(); ++tidx) {
-        int nvidx0 = new_vert_ind[triangles_[tidx](0)];
-        int nvidx1 = new_vert_ind[triangles_[tidx](1)];
-        int nvidx2 = new_vert_ind[triangles_[tidx](2)];
-        if (nvidx0 >= 0 && nvidx1 >= 0 && nvidx2 >= 0) {
-            output->triangles_.push_back(
-                    Eigen::Vector3i(nvidx0, nvidx1, nvidx2));
-            if (has_triangle_normals) {
-                output->triangle_normals_.push_back(triangle_normals_[tidx]);
-            }
+        if (has_vertex_colors) {
+            output->vertex_colors_[new_vidx] = vertex_colors_[vidx];
         }
     }
 
-    if (cleanup) {
-        output->RemoveDuplicatedVertices();
-        output->RemoveDuplicatedTriangles();
-        output->RemoveUnreferencedVertices();
-        output->RemoveDegenerateTriangles();
+    SelectTrianglesOfVertices(*this, new_vert_ind, cleanup, *output);
+    return output;
+}
+
+std::shared_ptr<TriangleMesh> TriangleMesh::SelectByMask(
+        const std::vector<bool> &mask, bool cleanup) const {
+    if (mask.size() != vertices_.size()) {
+        utility::LogError("[SelectByMask] mask has {} entries for {} vertices.",
+                          mask.size(), vertices_.size());
     }
-    utility::LogDebug(
-            "Triangle mesh sampled from {:d} vertices and {:d} triangles to "
-            "{:d} vertices and {:d} triangles.",
-            (int)vertices_.size(), (int)triangles_.size(),
-            (int)output->vertices_.size(), (int)output->triangles_.size());
+    if (HasTriangleUvs()) {
+        utility::LogWarning(
+                "[SelectByMask] This mesh contains triangle uvs that are "
+                "not handled in this function");
+    }
+    auto output = std::make_shared<TriangleMesh>();
+    const bool has_vertex_normals = HasVertexNormals();
+    const bool has_vertex_colors = HasVertexColors();
+
+    std::vector<int> new_vert_ind(vertices_.size(), -1);
+    utility::ParallelCompact(
+            int64_t(vertices_.size()),
+            [&](int64_t vidx) { return bool(mask[vidx]); },
+            [&](int64_t count) {
+                output->vertices_.resize(count);
+                if (has_vertex_normals) output->vertex_normals_.resize(count);
+                if (has_vertex_colors) output->vertex_colors_.resize(count);
+            },
+            [&](int64_t vidx, int64_t new_vidx) {
+                new_vert_ind[vidx] = int(new_vidx);
+                output->vertices_[new_vidx] = vertices_[vidx];
+                if (has_vertex_normals) {
+                    output->vertex_normals_[new_vidx] = vertex_normals_[vidx];
+                }
+                if (has_vertex_colors) {
+                    output->vertex_colors_[new_vidx] = vertex_colors_[vidx];
+                }
+            });
+
+    SelectTrianglesOfVertices(*this, new_vert_ind, cleanup, *output);
     return output;
-}  // namespace geometry
+}
 
 std::shared_ptr<TriangleMesh> TriangleMesh::Crop(
         const AxisAlignedBoundingBox &bbox) const {
@@ -27,8 +27,10 @@
 #pragma once
 
 #include <Eigen/Core>
+#include <limits>
 #include <memory>
 #include <numeric>
+#include <string>
 #include <tuple>
 #include <unordered_map>
 #include <unordered_set>
@@ -44,6 +46,71 @@ namespace geometry {
 class PointCloud;
 class TetraMesh;
 
+/// \class PoissonReconstructionInfo
+///
+/// \brief Per-stage timing and memory statistics of a Screened Poisson
+/// reconstruction, filled by TriangleMesh::CreateFromPointCloudPoisson and
+/// TriangleMesh::CreateFromPointCloudPoissonToFile.
+///
+/// The reading of the samples into the octree ("read_samples"), the kernel
+/// density ("kernel_density") and the splatting of the normals
+/// ("normal_field") run inside the bundled PoissonRecon. Comparing their
+/// times across values of n_threads shows how far they scale.
+class PoissonReconstructionInfo {
+public:
+    /// \brief Statistics of a single reconstruction stage.
+    class Stage {
+    public:
+        Stage() {}
+        Stage(const std::string &name,
+              double time,
+              double memory_mb,
+              double peak_memory_mb)
+            : name_(name),
+              time_(time),
+              memory_mb_(memory_mb),
+              peak_memory_mb_(peak_memory_mb) {}
+
+    public:
+        /// Name of the stage, e.g. "solve".
+        std::string name_;
+        /// Wall-clock time spent in the stage in seconds.
+        double time_ = 0;
+        /// Largest memory usage observed during the stage in MB.
+        double memory_mb_ = 0;
+        /// Peak memory usage of the process at the end of the stage in MB.
+        double peak_memory_mb_ = 0;
+    };
+
+public:
+    PoissonReconstructionInfo() {}
+
+    /// Resets all statistics.
+    void Clear() { *this = PoissonReconstructionInfo(); }
+
+public:
+    /// Stages in the order they were run.
+    std::vector<Stage> stages_;
+    /// Number of input points.
+    size_t input_point_count_ = 0;
+    /// Number of samples splatted into the octree.
+    size_t sample_count_ = 0;
+    /// Depth of the octree actually used for the reconstruction.
+    int depth_ = 0;
+    /// Number of threads the reconstruction ran with.
+    int thread_count_ = 0;
+    /// Iso-value of the extracted surface.
+    double iso_value_ = 0;
+    /// Number of vertices of the extracted surface.
+    size_t vertex_count_ = 0;
+    /// Number of triangles of the extracted surface.
+    size_t triangle_count_ = 0;
+    /// Total wall-clock time of the reconstruction in seconds.
+    double total_time_ = 0;
+    /// Peak memory usage of the process during the reconstruction in MB.
+    double peak_memory_mb_ = 0;
+};
+
 /// \class TriangleMesh
 ///
 /// \brief Triangle mesh contains vertices and triangles represented by the
@@ -135,10 +202,32 @@ public:
     /// needed.
     TriangleMesh &ComputeAdjacencyList();
 
+    /// \brief Function to compute the adjacency of the vertices in compressed
+    /// sparse row (CSR) format, in parallel.
+    ///
+    /// If \ref adjacency_list_ is set, it is converted. Otherwise the
+    /// adjacency is computed from the triangles, with the same neighbors as
+    /// ComputeAdjacencyList.
+    ///
+    /// \return Tuple (offsets, neighbors): the neighbors of vertex i are
+    /// neighbors[offsets[i]], ..., neighbors[offsets[i + 1] - 1], sorted.
+    std::tuple<std::vector<int64_t>, std::vector<int>> ComputeAdjacencyCSR()
+            const;
+
     /// \brief Function that removes duplicated verties, i.e., vertices that
     /// have identical coordinates.
+    ///
+    /// Duplicates are found by sorting the vertices by coordinates in
+    /// parallel. The first vertex of every group of duplicates is kept.
     TriangleMesh &RemoveDuplicatedVertices();
 
+    /// \brief Function that removes duplicated verties, i.e., vertices that
+    /// have identical coordinates, and returns the vertex remap.
+    ///
+    /// \param vertex_remap Output index of the new vertex of every vertex
+    /// before the call, to update per vertex data held outside of the mesh.
+    TriangleMesh &RemoveDuplicatedVertices(std::vector<int> &vertex_remap);
+
     /// \brief Function that removes duplicated triangles, i.e., removes
     /// triangles that reference the same three vertices, independent of their
     /// order.
@@ -164,10 +253,24 @@ public:
     /// The vertex position, normal and color will be the average of the
     /// vertices.
     ///
+    /// Vertices closer than \p eps are merged transitively, i.e., a chain of
+    /// close vertices becomes a single vertex. They are found on a grid with
+    /// cells of size \p eps and merged with a concurrent union-find. Merged
+    /// vertices are ordered by their first vertex.
+    ///
     /// \param eps defines the maximum distance of close by vertices.
     /// This function might help to close triangle soups.
     TriangleMesh &MergeCloseVertices(double eps);
 
+    /// \brief Function that will merge close by vertices to a single one, and
+    /// returns the vertex remap.
+    ///
+    /// \param eps defines the maximum distance of close by vertices.
+    /// \param vertex_remap Output index of the merged vertex of every vertex
+    /// before the call, to update per vertex data held outside of the mesh.
+    TriangleMesh &MergeCloseVertices(double eps,
+                                     std::vector<int> &vertex_remap);
+
     /// \brief Function to sharpen triangle mesh.
     ///
     /// The output value (\f$v_o\f$) is the input value (\f$v_i\f$) plus
@@ -254,11 +357,12 @@ public:
     bool IsVertexManifold() const;
 
     /// Function that returns a list of triangles that are intersecting the
-    /// mesh.
+    /// mesh. Candidate pairs are found with a TriangleMeshBVH.
     std::vector<Eigen::Vector2i> GetSelfIntersectingTriangles() const;
 
     /// Function that tests if the triangle mesh is self-intersecting.
-    /// Tests each triangle pair for intersection.
+    /// Tests each triangle pair with overlapping bounding boxes for
+    /// intersection.
     bool IsSelfIntersecting() const;
 
     /// Function that tests if the bounding boxes of the triangle meshes are
@@ -266,7 +370,8 @@ public:
     bool IsBoundingBoxIntersecting(const TriangleMesh &other) const;
 
     /// Function that tests if the triangle mesh intersects another triangle
-    /// mesh. Tests each triangle against each other triangle.
+    /// mesh. Tests the triangle pairs with overlapping bounding boxes, found by
+    /// traversing the TriangleMeshBVH of both meshes.
     bool IsIntersecting(const TriangleMesh &other) const;
 
     /// Function that tests if the given triangle mesh is orientable, i.e.
@@ -367,6 +472,9 @@ public:
     /// normals. The triangle normals will be computed and added to the mesh
     /// if necessary. \param seed Sets the seed value used in the random
     /// generator, set to -1 to use a random seed value with each function call.
+    /// The points are sampled in parallel, with one random stream per block of
+    /// points, so that the result for a given seed does not depend on the
+    /// number of threads.
     std::shared_ptr<PointCloud> SamplePointsUniformly(
             size_t number_of_points,
             bool use_triangle_normal = false,
@@ -383,6 +491,9 @@ public:
     /// normals. The triangle normals will be computed and added to the mesh
     /// if necessary. \p seed Sets the seed value used in the random
     /// generator, set to -1 to use a random seed value with each function call.
+    /// The samples are eliminated in parallel rounds of points that are not
+    /// neighbors of each other, found on a grid, and the result for a given
+    /// seed does not depend on the number of threads.
     std::shared_ptr<PointCloud> SamplePointsPoissonDisk(
             size_t number_of_points,
             double init_factor = 5,
@@ -422,13 +533,21 @@ public:
     /// the simplified mesh should have. It is not guaranteed that this number
     /// will be reached.
     /// \param maximum_error defines the maximum error where a vertex is allowed
-    /// to be merged
+    /// to be merged. Decimation stops at the first edge whose error exceeds
+    /// it, so with a target_number_of_triangles of 0 the mesh is simplified up
+    /// to this error.
     /// \param boundary_weight a weight applied to edge vertices used to
     /// preserve boundaries
+    /// \param parallel if true, the mesh is partitioned into spatial clusters
+    /// that are decimated concurrently, with the vertices on the seams between
+    /// clusters locked. The seams move between passes, and the remaining
+    /// triangles are decimated serially. The result does not depend on the
+    /// number of threads, but differs from the serial decimation.
     std::shared_ptr<TriangleMesh> SimplifyQuadricDecimation(
             int target_number_of_triangles,
-            double maximum_error,
-            double boundary_weight) const;
+            double maximum_error = std::numeric_limits<double>::infinity(),
+            double boundary_weight = 1.0,
+            bool parallel = false) const;
 
     /// Function to select points from \p input TriangleMesh into
     /// output TriangleMesh
@@ -442,6 +561,22 @@ public:
     std::shared_ptr<TriangleMesh> SelectByIndex(
             const std::vector<size_t> &indices, bool cleanup = true) const;
 
+    /// \brief Function to select vertices from input TriangleMesh into
+    /// output TriangleMesh.
+    ///
+    /// Vertices with a true entry in \p mask are selected, in order, with
+    /// the triangles whose vertices are all selected. Every attribute is
+    /// copied in one parallel pass.
+    ///
+    /// \param mask Mask of vertices to be selected, one entry per vertex.
+    /// \param cleanup If true it automatically calls
+    /// TriangleMesh::RemoveDuplicatedVertices,
+    /// TriangleMesh::RemoveDuplicatedTriangles,
+    /// TriangleMesh::RemoveUnreferencedVertices, and
+    /// TriangleMesh::RemoveDegenerateTriangles
+    std::shared_ptr<TriangleMesh> SelectByMask(const std::vector<bool> &mask,
+                                               bool cleanup = true) const;
+
     /// Function to crop pointcloud into output pointcloud
     /// All points with coordinates outside the bounding box \param bbox are
     /// clipped.
@@ -498,6 +633,8 @@ public:
 
     /// \brief This function deforms the mesh using the method by
     /// Sorkine and Alexa, "As-Rigid-As-Possible Surface Modeling", 2007.
+    /// To deform the mesh repeatedly with the same constrained vertices, use
+    /// AsRigidAsPossibleDeformer, which factorizes the system only once.
     ///
     /// \param constraint_vertex_indices Indices of the triangle vertices that
     /// should be constrained by the vertex positions in
@@ -547,8 +684,15 @@ public:
     /// reconstructed. Has to contain normals.
     /// \param radii defines the radii of
     /// the ball that are used for the surface reconstruction.
+    /// \param parallel If true, the point cloud is split into blocks that are
+    /// reconstructed concurrently, each with a halo of three times the largest
+    /// radius, and the seams between the blocks are stitched afterwards. The
+    /// result does not depend on the number of threads, but can differ from
+    /// the serial reconstruction near the seams.
     static std::shared_ptr<TriangleMesh> CreateFromPointCloudBallPivoting(
-            const PointCloud &pcd, const std::vector<double> &radii);
+            const PointCloud &pcd,
+            const std::vector<double> &radii,
+            bool parallel = false);
 
     /// \brief Function that computes a triangle mesh from an oriented
     /// PointCloud pcd. This implements the Screened Poisson Reconstruction
@@ -571,6 +715,7 @@ public:
     /// linear interpolation to estimate the positions of iso-vertices.
     /// \param n_threads Number of threads used for reconstruction. Set to -1
     /// to automatically determine it.
+    /// \param info Optional output of the per-stage timings and memory usage.
     /// \return The estimated TriangleMesh, and per vertex densitie values that
     /// can be used to to trim the mesh.
     static std::tuple<std::shared_ptr<TriangleMesh>, std::vector<double>>
@@ -579,7 +724,41 @@ public:
                                 size_t width = 0,
                                 float scale = 1.1f,
                                 bool linear_fit = false,
-                                int n_threads = -1);
+                                int n_threads = -1,
+                                PoissonReconstructionInfo *info = nullptr);
+
+    /// \brief Memory-bounded variant of CreateFromPointCloudPoisson that
+    /// streams the reconstructed surface to a binary PLY file.
+    ///
+    /// The iso-surface is extracted out-of-core into temporary files next to
+    /// \p filename, and the octree, the samples and the solution are released
+    /// before the surface is written. The mesh is never held as a
+    /// TriangleMesh, so the peak memory is bounded by the octree instead of
+    /// the octree plus the output mesh. The PLY file contains the vertex
+    /// positions, normals, colors and a per vertex `density` property.
+    ///
+    /// \param pcd PointCloud with normals and optionally colors.
+    /// \param filename Path of the output PLY file.
+    /// \param depth Maximum depth of the tree, see CreateFromPointCloudPoisson.
+    /// \param width Target width of the finest level octree cells, see
+    /// CreateFromPointCloudPoisson.
+    /// \param scale Ratio between the diameter of the reconstruction cube and
+    /// the diameter of the samples' bounding cube.
+    /// \param linear_fit If true, the reconstructor use linear interpolation
+    /// to estimate the positions of iso-vertices.
+    /// \param n_threads Number of threads used for reconstruction. Set to -1
+    /// to automatically determine it.
+    /// \param info Optional output of the per-stage timings and memory usage.
+    /// \return true if the file was written successfully.
+    static bool CreateFromPointCloudPoissonToFile(
+            const PointCloud &pcd,
+            const std::string &filename,
+            size_t depth = 8,
+            size_t width = 0,
+            float scale = 1.1f,
+            bool linear_fit = false,
+            int n_threads = -1,
+            PoissonReconstructionInfo *info = nullptr);
 
     /// Factory function to create a tetrahedron mesh (trianglemeshfactory.cpp).
     /// the mesh centroid will be at (0,0,0) and \param radius defines the
@@ -728,7 +907,8 @@ protected:
             const std::vector<Eigen::Vector3d> &prev_vertices,
             const std::vector<Eigen::Vector3d> &prev_vertex_normals,
             const std::vector<Eigen::Vector3d> &prev_vertex_colors,
-            const std::vector<std::unordered_set<int>> &adjacency_list,
+            const std::vector<int64_t> &adjacency_offsets,
+            const std::vector<int> &adjacency_neighbors,
             double lambda,
             bool filter_vertex,
             bool filter_normal,
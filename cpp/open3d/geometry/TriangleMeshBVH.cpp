@@ -0,0 +1,593 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/geometry/TriangleMeshBVH.h"
+
+#include <algorithm>
+#include <limits>
+#include <numeric>
+
+#include "open3d/geometry/IntersectionTest.h"
+#include "open3d/geometry/TriangleMesh.h"
+#include "open3d/utility/Console.h"
+
+namespace open3d {
+namespace geometry {
+
+namespace {
+
+/// Number of bins per axis for the SAH evaluation.
+constexpr int kSAHNumBins = 16;
+
+double SurfaceArea(const Eigen::Vector3d &min_bound,
+                   const Eigen::Vector3d &max_bound) {
+    const Eigen::Vector3d extent = max_bound - min_bound;
+    return 2.0 * (extent(0) * extent(1) + extent(1) * extent(2) +
+                  extent(2) * extent(0));
+}
+
+bool BoxesOverlap(const Eigen::Vector3d &min0,
+                  const Eigen::Vector3d &max0,
+                  const Eigen::Vector3d &min1,
+                  const Eigen::Vector3d &max1) {
+    return (min0.array() <= max1.array()).all() &&
+           (min1.array() <= max0.array()).all();
+}
+
+double PointBoxDistance2(const Eigen::Vector3d &point,
+                         const Eigen::Vector3d &min_bound,
+                         const Eigen::Vector3d &max_bound) {
+    const Eigen::Vector3d gap = (min_bound - point)
+                                        .cwiseMax(point - max_bound)
+                                        .cwiseMax(Eigen::Vector3d::Zero());
+    return gap.squaredNorm();
+}
+
+/// Slab test of the ray origin + t * direction, t in [0, t_max], with the
+/// box.
+bool RayBoxOverlap(const Eigen::Vector3d &origin,
+                   const Eigen::Vector3d &inv_direction,
+                   double t_max,
+                   const Eigen::Vector3d &min_bound,
+                   const Eigen::Vector3d &max_bound) {
+    double t_near = 0.0;
+    double t_far = t_max;
+    for (int axis = 0; axis < 3; ++axis) {
+        double t0 = (min_bound(axis) - origin(axis)) * inv_direction(axis);
+        double t1 = (max_bound(axis) - origin(axis)) * inv_direction(axis);
+        if (t0 > t1) {
+            std::swap(t0, t1);
+        }
+        // NaN, from a ray in the plane of a slab, leaves the range unchanged.
+        t_near = std::max(t_near, t0);
+        t_far = std::min(t_far, t1);
+        if (t_near > t_far) {
+            return false;
+        }
+    }
+    return true;
+}
+
+/// Moller-Trumbore ray-triangle intersection. Sets \p t to the ray parameter
+/// of the hit.
+bool RayTriangle(const Eigen::Vector3d &origin,
+                 const Eigen::Vector3d &direction,
+                 const Eigen::Vector3d &v0,
+                 const Eigen::Vector3d &v1,
+                 const Eigen::Vector3d &v2,
+                 double &t) {
+    const Eigen::Vector3d e1 = v1 - v0;
+    const Eigen::Vector3d e2 = v2 - v0;
+    const Eigen::Vector3d p = direction.cross(e2);
+    const double det = e1.dot(p);
+    if (det == 0.0) {
+        return false;
+    }
+    const double inv_det = 1.0 / det;
+    const Eigen::Vector3d s = origin - v0;
+    const double u = s.dot(p) * inv_det;
+    if (u < 0.0 || u > 1.0) {
+        return false;
+    }
+    const Eigen::Vector3d q = s.cross(e1);
+    const double v = direction.dot(q) * inv_det;
+    if (v < 0.0 || u + v > 1.0) {
+        return false;
+    }
+    t = e2.dot(q) * inv_det;
+    return t >= 0.0;
+}
+
+/// Closest point to \p p on the triangle (a, b, c), from Ericson,
+/// "Real-Time Collision Detection", 2004.
+Eigen::Vector3d ClosestPointOnTriangle(const Eigen::Vector3d &p,
+                                       const Eigen::Vector3d &a,
+                                       const Eigen::Vector3d &b,
+                                       const Eigen::Vector3d &c) {
+    const Eigen::Vector3d ab = b - a;
+    const Eigen::Vector3d ac = c - a;
+    const Eigen::Vector3d ap = p - a;
+    const double d1 = ab.dot(ap);
+    const double d2 = ac.dot(ap);
+    if (d1 <= 0.0 && d2 <= 0.0) {
+        return a;
+    }
+    const Eigen::Vector3d bp = p - b;
+    const double d3 = ab.dot(bp);
+    const double d4 = ac.dot(bp);
+    if (d3 >= 0.0 && d4 <= d3) {
+        return b;
+    }
+    const double vc = d1 * d4 - d3 * d2;
+    if (vc <= 0.0 && d1 >= 0.0 && d3 <= 0.0) {
+        return a + d1 / (d1 - d3) * ab;
+    }
+    const Eigen::Vector3d cp = p - c;
+    const double d5 = ab.dot(cp);
+    const double d6 = ac.dot(cp);
+    if (d6 >= 0.0 && d5 <= d6) {
+        return c;
+    }
+    const double vb = d5 * d2 - d1 * d6;
+    if (vb <= 0.0 && d2 >= 0.0 && d6 <= 0.0) {
+        return a + d2 / (d2 - d6) * ac;
+    }
+    const double va = d3 * d6 - d5 * d4;
+    if (va <= 0.0 && d4 - d3 >= 0.0 && d5 - d6 >= 0.0) {
+        return b + (d4 - d3) / ((d4 - d3) + (d5 - d6)) * (c - b);
+    }
+    const double denom = 1.0 / (va + vb + vc);
+    return a + ab * (vb * denom) + ac * (vc * denom);
+}
+
+}  // namespace
+
+TriangleMeshBVH::TriangleMeshBVH(const TriangleMesh &mesh,
+                                 int max_leaf_size /* = 4 */)
+    : max_leaf_size_(std::max(max_leaf_size, 1)),
+      vertices_(mesh.vertices_),
+      triangles_(mesh.triangles_) {
+    const int num_triangles = int(triangles_.size());
+    if (num_triangles == 0) {
+        return;
+    }
+    std::vector<Eigen::Vector3d> triangle_min_bounds(num_triangles);
+    std::vector<Eigen::Vector3d> triangle_max_bounds(num_triangles);
+    std::vector<Eigen::Vector3d> centroids(num_triangles);
+#pragma omp parallel for schedule(static)
+    for (int tidx = 0; tidx < num_triangles; ++tidx) {
+        const Eigen::Vector3i &triangle = triangles_[tidx];
+        const Eigen::Vector3d &v0 = vertices_[triangle(0)];
+        const Eigen::Vector3d &v1 = vertices_[triangle(1)];
+        const Eigen::Vector3d &v2 = vertices_[triangle(2)];
+        triangle_min_bounds[tidx] = v0.cwiseMin(v1).cwiseMin(v2);
+        triangle_max_bounds[tidx] = v0.cwiseMax(v1).cwiseMax(v2);
+        centroids[tidx] = (v0 + v1 + v2) / 3.0;
+    }
+    triangle_indices_.resize(num_triangles);
+    std::iota(triangle_indices_.begin(), triangle_indices_.end(), 0);
+    nodes_.reserve(2 * (num_triangles / max_leaf_size_) + 1);
+    BuildNode(0, num_triangles, triangle_min_bounds, triangle_max_bounds,
+              centroids);
+}
+
+std::shared_ptr<TriangleMeshBVH> TriangleMeshBVH::CreateFromTriangleMesh(
+        const TriangleMesh &mesh, int max_leaf_size /* = 4 */) {
+    return std::make_shared<TriangleMeshBVH>(mesh, max_leaf_size);
+}
+
+int TriangleMeshBVH::BuildNode(
+        int begin,
+        int end,
+        const std::vector<Eigen::Vector3d> &triangle_min_bounds,
+        const std::vector<Eigen::Vector3d> &triangle_max_bounds,
+        const std::vector<Eigen::Vector3d> &centroids) {
+    const int node_index = int(nodes_.size());
+    nodes_.emplace_back();
+
+    Eigen::Vector3d min_bound =
+            Eigen::Vector3d::Constant(std::numeric_limits<double>::infinity());
+    Eigen::Vector3d max_bound = -min_bound;
+    Eigen::Vector3d centroid_min_bound = min_bound;
+    Eigen::Vector3d centroid_max_bound = max_bound;
+    for (int i = begin; i < end; ++i) {
+        const int tidx = triangle_indices_[i];
+        min_bound = min_bound.cwiseMin(triangle_min_bounds[tidx]);
+        max_bound = max_bound.cwiseMax(triangle_max_bounds[tidx]);
+        centroid_min_bound = centroid_min_bound.cwiseMin(centroids[tidx]);
+        centroid_max_bound = centroid_max_bound.cwiseMax(centroids[tidx]);
+    }
+    nodes_[node_index].min_bound_ = min_bound;
+    nodes_[node_index].max_bound_ = max_bound;
+    if (end - begin <= max_leaf_size_) {
+        nodes_[node_index].offset_ = begin;
+        nodes_[node_index].num_triangles_ = end - begin;
+        return node_index;
+    }
+
+    // Binned SAH: the cost of a split is the sum over both sides of the
+    // surface area times the number of triangles.
+    const Eigen::Vector3d centroid_extent =
+            centroid_max_bound - centroid_min_bound;
+    auto BinIndex = [&](int tidx, int axis) {
+        int bin = int(kSAHNumBins *
+                      (centroids[tidx](axis) - centroid_min_bound(axis)) /
+                      centroid_extent(axis));
+        return std::min(bin, kSAHNumBins - 1);
+    };
+    double best_cost = std::numeric_limits<double>::infinity();
+    int best_axis = -1;
+    int best_split = 0;
+    for (int axis = 0; axis < 3; ++axis) {
+        if (!(centroid_extent(axis) > 0.0)) {
+            continue;
+        }
+        int bin_counts[kSAHNumBins] = {0};
+        Eigen::Vector3d bin_min_bounds[kSAHNumBins];
+        Eigen::Vector3d bin_max_bounds[kSAHNumBins];
+        for (int b = 0; b < kSAHNumBins; ++b) {
+            bin_min_bounds[b] = Eigen::Vector3d::Constant(
+                    std::numeric_limits<double>::infinity());
+            bin_max_bounds[b] = -bin_min_bounds[b];
+        }
+        for (int i = begin; i < end; ++i) {
+            const int tidx = triangle_indices_[i];
+            const int b = BinIndex(tidx, axis);
+            bin_counts[b]++;
+            bin_min_bounds[b] =
+                    bin_min_bounds[b].cwiseMin(triangle_min_bounds[tidx]);
+            bin_max_bounds[b] =
+                    bin_max_bounds[b].cwiseMax(triangle_max_bounds[tidx]);
+        }
+        // Cost of the left side of every split, then sweep from the right.
+        double left_costs[kSAHNumBins];
+        Eigen::Vector3d left_min = bin_min_bounds[0];
+        Eigen::Vector3d left_max = bin_max_bounds[0];
+        int left_count = 0;
+        for (int b = 0; b < kSAHNumBins - 1; ++b) {
+            left_count += bin_counts[b];
+            left_min = left_min.cwiseMin(bin_min_bounds[b]);
+            left_max = left_max.cwiseMax(bin_max_bounds[b]);
+            left_costs[b + 1] =
+                    left_count > 0
+                            ? left_count * SurfaceArea(left_min, left_max)
+                            : -1.0;
+        }
+        Eigen::Vector3d right_min = bin_min_bounds[kSAHNumBins - 1];
+        Eigen::Vector3d right_max = bin_max_bounds[kSAHNumBins - 1];
+        int right_count = 0;
+        for (int b = kSAHNumBins - 1; b > 0; --b) {
+            right_count += bin_counts[b];
+            right_min = right_min.cwiseMin(bin_min_bounds[b]);
+            right_max = right_max.cwiseMax(bin_max_bounds[b]);
+            if (right_count == 0 || left_costs[b] < 0.0) {
+                continue;
+            }
+            const double cost = left_costs[b] +
+                                right_count * SurfaceArea(right_min, right_max);
+            if (cost < best_cost) {
+                best_cost = cost;
+                best_axis = axis;
+                best_split = b;
+            }
+        }
+    }
+
+    int middle;
+    if (best_axis >= 0) {
+        middle = int(std::partition(triangle_indices_.begin() + begin,
+                                    triangle_indices_.begin() + end,
+                                    [&](int tidx) {
+                                        return BinIndex(tidx, best_axis) <
+                                               best_split;
+                                    }) -
+                     triangle_indices_.begin());
+    } else {
+        // All centroids coincide, split in the middle.
+        middle = begin + (end - begin) / 2;
+    }
+    BuildNode(begin, middle, triangle_min_bounds, triangle_max_bounds,
+              centroids);
+    const int second_child = BuildNode(middle, end, triangle_min_bounds,
+                                       triangle_max_bounds, centroids);
+    nodes_[node_index].offset_ = second_child;
+    nodes_[node_index].num_triangles_ = 0;
+    return node_index;
+}
+
+std::vector<Eigen::Vector2i> TriangleMeshBVH::GetSelfIntersectingTriangles()
+        const {
+    std::vector<Eigen::Vector2i> self_intersecting_triangles;
+    if (IsEmpty()) {
+        return self_intersecting_triangles;
+    }
+    const int num_triangles = int(triangles_.size());
+#pragma omp parallel
+    {
+        std::vector<Eigen::Vector2i> local_triangles;
+        std::vector<int> stack;
+#pragma omp for schedule(dynamic, 256) nowait
+        for (int tidx0 = 0; tidx0 < num_triangles; ++tidx0) {
+            const Eigen::Vector3i &tria_p = triangles_[tidx0];
+            const Eigen::Vector3d &p0 = vertices_[tria_p(0)];
+            const Eigen::Vector3d &p1 = vertices_[tria_p(1)];
+            const Eigen::Vector3d &p2 = vertices_[tria_p(2)];
+            const Eigen::Vector3d min_bound = p0.cwiseMin(p1).cwiseMin(p2);
+            const Eigen::Vector3d max_bound = p0.cwiseMax(p1).cwiseMax(p2);
+            stack.assign(1, 0);
+            while (!stack.empty()) {
+                const Node &node = nodes_[stack.back()];
+                const int node_index = stack.back();
+                stack.pop_back();
+                if (!BoxesOverlap(min_bound, max_bound, node.min_bound_,
+                                  node.max_bound_)) {
+                    continue;
+                }
+                if (!node.IsLeaf()) {
+                    stack.push_back(node.offset_);
+                    stack.push_back(node_index + 1);
+                    continue;
+                }
+                for (int i = node.offset_;
+                     i < node.offset_ + node.num_triangles_; ++i) {
+                    const int tidx1 = triangle_indices_[i];
+                    if (tidx1 <= tidx0) {
+                        continue;
+                    }
+                    const Eigen::Vector3i &tria_q = triangles_[tidx1];
+                    // check if neighbour triangle
+                    if (tria_p(0) == tria_q(0) || tria_p(0) == tria_q(1) ||
+                        tria_p(0) == tria_q(2) || tria_p(1) == tria_q(0) ||
+                        tria_p(1) == tria_q(1) || tria_p(1) == tria_q(2) ||
+                        tria_p(2) == tria_q(0) || tria_p(2) == tria_q(1) ||
+                        tria_p(2) == tria_q(2)) {
+                        continue;
+                    }
+                    if (IntersectionTest::TriangleTriangle3d(
+                                p0, p1, p2, vertices_[tria_q(0)],
+                                vertices_[tria_q(1)], vertices_[tria_q(2)])) {
+                        local_triangles.emplace_back(tidx0, tidx1);
+                    }
+                }
+            }
+        }
+#pragma omp critical
+        {
+            self_intersecting_triangles.insert(
+                    self_intersecting_triangles.end(), local_triangles.begin(),
+                    local_triangles.end());
+        }
+    }
+    std::sort(self_intersecting_triangles.begin(),
+              self_intersecting_triangles.end(),
+              [](const Eigen::Vector2i &a, const Eigen::Vector2i &b) {
+                  return a(0) < b(0) || (a(0) == b(0) && a(1) < b(1));
+              });
+    return self_intersecting_triangles;
+}
+
+bool TriangleMeshBVH::IsIntersecting(const TriangleMeshBVH &other) const {
+    if (IsEmpty() || other.IsEmpty()) {
+        return false;
+    }
+    // Simultaneous traversal of both hierarchies, descending into the larger
+    // node of every overlapping pair.
+    std::vector<std::pair<int, int>> stack(1, std::make_pair(0, 0));
+    while (!stack.empty()) {
+        const int index0 = stack.back().first;
+        const int index1 = stack.back().second;
+        stack.pop_back();
+        const Node &node0 = nodes_[index0];
+        const Node &node1 = other.nodes_[index1];
+        if (!BoxesOverlap(node0.min_bound_, node0.max_bound_, node1.min_bound_,
+                          node1.max_bound_)) {
+            continue;
+        }
+        if (node0.IsLeaf() && node1.IsLeaf()) {
+            for (int i = node0.offset_;
+                 i < node0.offset_ + node0.num_triangles_; ++i) {
+                const Eigen::Vector3i &tria_p =
+                        triangles_[triangle_indices_[i]];
+                for (int j = node1.offset_;
+                     j < node1.offset_ + node1.num_triangles_; ++j) {
+                    const Eigen::Vector3i &tria_q =
+                            other.triangles_[other.triangle_indices_[j]];
+                    if (IntersectionTest::TriangleTriangle3d(
+                                vertices_[tria_p(0)], vertices_[tria_p(1)],
+                                vertices_[tria_p(2)],
+                                other.vertices_[tria_q(0)],
+                                other.vertices_[tria_q(1)],
+                                other.vertices_[tria_q(2)])) {
+                        return true;
+                    }
+                }
+            }
+        } else if (node1.IsLeaf() ||
+                   (!node0.IsLeaf() &&
+                    SurfaceArea(node0.min_bound_, node0.max_bound_) >=
+                            SurfaceArea(node1.min_bound_, node1.max_bound_))) {
+            stack.emplace_back(node0.offset_, index1);
+            stack.emplace_back(index0 + 1, index1);
+        } else {
+            stack.emplace_back(index0, node1.offset_);
+            stack.emplace_back(index0, index1 + 1);
+        }
+    }
+    return false;
+}
+
+std::tuple<std::vector<double>, std::vector<int>> TriangleMeshBVH::CastRays(
+        const std::vector<Eigen::Vector3d> &origins,
+        const std::vector<Eigen::Vector3d> &directions) const {
+    if (origins.size() != directions.size()) {
+        utility::LogError(
+                "[CastRays] Number of origins ({}) and directions ({}) "
+                "mismatch.",
+                origins.size(), directions.size());
+    }
+    const int64_t num_rays = int64_t(origins.size());
+    std::vector<double> t_hit(num_rays,
+                              std::numeric_limits<double>::infinity());
+    std::vector<int> triangle_ids(num_rays, -1);
+    if (IsEmpty()) {
+        return std::make_tuple(t_hit, triangle_ids);
+    }
+#pragma omp parallel
+    {
+        std::vector<int> stack;
+#pragma omp for schedule(dynamic, 256)
+        for (int64_t ridx = 0; ridx < num_rays; ++ridx) {
+            const Eigen::Vector3d &origin = origins[ridx];
+            const Eigen::Vector3d &direction = directions[ridx];
+            const Eigen::Vector3d inv_direction = direction.cwiseInverse();
+            double &t_best = t_hit[ridx];
+            stack.assign(1, 0);
+            while (!stack.empty()) {
+                const int node_index = stack.back();
+                const Node &node = nodes_[node_index];
+                stack.pop_back();
+                if (!RayBoxOverlap(origin, inv_direction, t_best,
+                                   node.min_bound_, node.max_bound_)) {
+                    continue;
+                }
+                if (!node.IsLeaf()) {
+                    stack.push_back(node.offset_);
+                    stack.push_back(node_index + 1);
+                    continue;
+                }
+                for (int i = node.offset_;
+                     i < node.offset_ + node.num_triangles_; ++i) {
+                    const int tidx = triangle_indices_[i];
+                    const Eigen::Vector3i &triangle = triangles_[tidx];
+                    double t;
+                    if (RayTriangle(origin, direction, vertices_[triangle(0)],
+                                    vertices_[triangle(1)],
+                                    vertices_[triangle(2)], t) &&
+                        (t < t_best ||
+                         (t == t_best && tidx < triangle_ids[ridx]))) {
+                        t_best = t;
+                        triangle_ids[ridx] = tidx;
+                    }
+                }
+            }
+        }
+    }
+    return std::make_tuple(t_hit, triangle_ids);
+}
+
+int TriangleMeshBVH::ClosestPoint(const Eigen::Vector3d &query,
+                                  double max_distance2,
+                                  std::vector<int> &stack,
+                                  Eigen::Vector3d &closest_point) const {
+    int closest_triangle = -1;
+    double best_distance2 = max_distance2;
+    stack.assign(1, 0);
+    while (!stack.empty()) {
+        const int node_index = stack.back();
+        const Node &node = nodes_[node_index];
+        stack.pop_back();
+        if (PointBoxDistance2(query, node.min_bound_, node.max_bound_) >
+            best_distance2) {
+            continue;
+        }
+        if (!node.IsLeaf()) {
+            // Visit the nearer child first.
+            const Node &child0 = nodes_[node_index + 1];
+            const Node &child1 = nodes_[node.offset_];
+            if (PointBoxDistance2(query, child0.min_bound_, child0.max_bound_) <
+                PointBoxDistance2(query, child1.min_bound_,
+                                  child1.max_bound_)) {
+                stack.push_back(node.offset_);
+                stack.push_back(node_index + 1);
+            } else {
+                stack.push_back(node_index + 1);
+                stack.push_back(node.offset_);
+            }
+            continue;
+        }
+        for (int i = node.offset_; i < node.offset_ + node.num_triangles_;
+             ++i) {
+            const int tidx = triangle_indices_[i];
+            const Eigen::Vector3i &triangle = triangles_[tidx];
+            const Eigen::Vector3d point = ClosestPointOnTriangle(
+                    query, vertices_[triangle(0)], vertices_[triangle(1)],
+                    vertices_[triangle(2)]);
+            const double distance2 = (point - query).squaredNorm();
+            if (distance2 < best_distance2 ||
+                (distance2 == best_distance2 &&
+                 (closest_triangle == -1 || tidx < closest_triangle))) {
+                best_distance2 = distance2;
+                closest_triangle = tidx;
+                closest_point = point;
+            }
+        }
+    }
+    return closest_triangle;
+}
+
+std::tuple<std::vector<Eigen::Vector3d>, std::vector<int>>
+TriangleMeshBVH::ComputeClosestPoints(
+        const std::vector<Eigen::Vector3d> &query_points) const {
+    const int64_t num_queries = int64_t(query_points.size());
+    std::vector<Eigen::Vector3d> closest_points(
+            num_queries, Eigen::Vector3d::Constant(
+                                 std::numeric_limits<double>::quiet_NaN()));
+    std::vector<int> triangle_ids(num_queries, -1);
+    if (IsEmpty()) {
+        return std::make_tuple(closest_points, triangle_ids);
+    }
+#pragma omp parallel
+    {
+        std::vector<int> stack;
+#pragma omp for schedule(dynamic, 256)
+        for (int64_t qidx = 0; qidx < num_queries; ++qidx) {
+            triangle_ids[qidx] = ClosestPoint(
+                    query_points[qidx], std::numeric_limits<double>::infinity(),
+                    stack, closest_points[qidx]);
+        }
+    }
+    return std::make_tuple(closest_points, triangle_ids);
+}
+
+std::vector<double> TriangleMeshBVH::ComputeDistance(
+        const std::vector<Eigen::Vector3d> &query_points) const {
+    std::vector<Eigen::Vector3d> closest_points;
+    std::vector<int> triangle_ids;
+    std::tie(closest_points, triangle_ids) = ComputeClosestPoints(query_points);
+    std::vector<double> distances(query_points.size(),
+                                  std::numeric_limits<double>::infinity());
+#pragma omp parallel for schedule(static)
+    for (int64_t qidx = 0; qidx < int64_t(query_points.size()); ++qidx) {
+        if (triangle_ids[qidx] >= 0) {
+            distances[qidx] =
+                    (closest_points[qidx] - query_points[qidx]).norm();
+        }
+    }
+    return distances;
+}
+
+}  // namespace geometry
+}  // namespace open3d
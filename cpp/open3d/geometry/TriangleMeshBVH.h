@@ -0,0 +1,156 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+#include <memory>
+#include <tuple>
+#include <vector>
+
+namespace open3d {
+namespace geometry {
+
+class TriangleMesh;
+
+/// \class TriangleMeshBVH
+///
+/// \brief Bounding volume hierarchy over the triangles of a TriangleMesh, for
+/// intersection, ray casting and closest point queries.
+///
+/// The hierarchy is built top-down with the surface area heuristic (SAH),
+/// evaluated on a fixed number of bins per axis. Nodes are stored in a flat
+/// array in depth-first order: the first child of an inner node directly
+/// follows it, and the node stores the index of its second child. The
+/// vertices and triangles of the mesh are copied, so the BVH does not depend
+/// on the lifetime of the mesh. Batched queries run in parallel.
+class TriangleMeshBVH {
+public:
+    /// Node of the hierarchy.
+    struct Node {
+        /// Lower corner of the bounding box of the node.
+        Eigen::Vector3d min_bound_;
+        /// Upper corner of the bounding box of the node.
+        Eigen::Vector3d max_bound_;
+        /// For a leaf, position of its first triangle in triangle_indices_.
+        /// For an inner node, index of its second child.
+        int offset_;
+        /// Number of triangles of a leaf, 0 for an inner node.
+        int num_triangles_;
+
+        bool IsLeaf() const { return num_triangles_ > 0; }
+    };
+
+    /// \brief Default Constructor.
+    TriangleMeshBVH() {}
+    /// \brief Parameterized Constructor.
+    ///
+    /// \param mesh The triangle mesh.
+    /// \param max_leaf_size Maximum number of triangles in a leaf.
+    TriangleMeshBVH(const TriangleMesh &mesh, int max_leaf_size = 4);
+    ~TriangleMeshBVH() {}
+
+public:
+    /// \brief Factory function to create a TriangleMeshBVH from a mesh.
+    ///
+    /// \param mesh The triangle mesh.
+    /// \param max_leaf_size Maximum number of triangles in a leaf.
+    static std::shared_ptr<TriangleMeshBVH> CreateFromTriangleMesh(
+            const TriangleMesh &mesh, int max_leaf_size = 4);
+
+    /// Returns `true` if the BVH holds no triangles.
+    bool IsEmpty() const { return nodes_.empty(); }
+
+    /// \brief Function that returns the pairs of intersecting triangles that
+    /// do not share a vertex.
+    ///
+    /// Each pair (i, j) has i < j, and pairs are sorted.
+    std::vector<Eigen::Vector2i> GetSelfIntersectingTriangles() const;
+
+    /// Returns `true` if a triangle of this BVH intersects a triangle of
+    /// \p other.
+    bool IsIntersecting(const TriangleMeshBVH &other) const;
+
+    /// \brief Function to cast rays on the mesh.
+    ///
+    /// The hit of ray i is at origins[i] + t_hit[i] * directions[i], for the
+    /// smallest non-negative t_hit[i].
+    ///
+    /// \param origins Origins of the rays.
+    /// \param directions Directions of the rays, not necessarily normalized.
+    /// \return Tuple (t_hit, triangle_ids), with t_hit set to infinity and
+    /// triangle_ids set to -1 for rays that miss the mesh.
+    std::tuple<std::vector<double>, std::vector<int>> CastRays(
+            const std::vector<Eigen::Vector3d> &origins,
+            const std::vector<Eigen::Vector3d> &directions) const;
+
+    /// \brief Function to compute the closest points on the mesh.
+    ///
+    /// \param query_points Query points.
+    /// \return Tuple (closest_points, triangle_ids) holding, for every query
+    /// point, the closest point on the mesh and the triangle it lies on.
+    std::tuple<std::vector<Eigen::Vector3d>, std::vector<int>>
+    ComputeClosestPoints(
+            const std::vector<Eigen::Vector3d> &query_points) const;
+
+    /// \brief Function to compute the distance from points to the mesh.
+    ///
+    /// \param query_points Query points.
+    std::vector<double> ComputeDistance(
+            const std::vector<Eigen::Vector3d> &query_points) const;
+
+protected:
+    /// Build the subtree of the triangles triangle_indices_[begin, end).
+    /// Returns the index of its root.
+    int BuildNode(int begin,
+                  int end,
+                  const std::vector<Eigen::Vector3d> &triangle_min_bounds,
+                  const std::vector<Eigen::Vector3d> &triangle_max_bounds,
+                  const std::vector<Eigen::Vector3d> &centroids);
+
+    /// Closest point to \p query on the mesh, among triangles closer than
+    /// \p max_distance2. Returns the triangle index, or -1 if there is none.
+    int ClosestPoint(const Eigen::Vector3d &query,
+                     double max_distance2,
+                     std::vector<int> &stack,
+                     Eigen::Vector3d &closest_point) const;
+
+public:
+    /// Maximum number of triangles in a leaf.
+    int max_leaf_size_ = 4;
+    /// Vertices of the mesh.
+    std::vector<Eigen::Vector3d> vertices_;
+    /// Triangles of the mesh.
+    std::vector<Eigen::Vector3i> triangles_;
+    /// Nodes in depth-first order, the root first.
+    std::vector<Node> nodes_;
+    /// Triangle indices, ordered such that the triangles of every leaf are
+    /// contiguous.
+    std::vector<int> triangle_indices_;
+};
+
+}  // namespace geometry
+}  // namespace open3d
@@ -24,70 +24,19 @@
 // IN THE SOFTWARE.
 // ----------------------------------------------------------------------------
 
-#include <Eigen/Dense>
+#include <atomic>
+#include <numeric>
 #include <queue>
 #include <tuple>
 
+#include "open3d/geometry/Quadric.h"
 #include "open3d/geometry/TriangleMesh.h"
+#include "open3d/geometry/VoxelGrouping.h"
 #include "open3d/utility/Console.h"
 
 namespace open3d {
 namespace geometry {
 
-/// Error quadric that is used to minimize the squared distance of a point to
-/// its neigbhouring triangle planes.
-/// Cf. "Simplifying Surfaces with Color and Texture using Quadric Error
-/// Metrics" by Garland and Heckbert.
-class Quadric {
-public:
-    Quadric() {
-        A_.fill(0);
-        b_.fill(0);
-        c_ = 0;
-    }
-
-    Quadric(const Eigen::Vector4d& plane, double weight = 1) {
-        Eigen::Vector3d n = plane.head<3>();
-        A_ = weight * n * n.transpose();
-        b_ = weight * plane(3) * n;
-        c_ = weight * plane(3) * plane(3);
-    }
-
-    Quadric& operator+=(const Quadric& other) {
-        A_ += other.A_;
-        b_ += other.b_;
-        c_ += other.c_;
-        return *this;
-    }
-
-    Quadric operator+(const Quadric& other) const {
-        Quadric res;
-        res.A_ = A_ + other.A_;
-        res.b_ = b_ + other.b_;
-        res.c_ = c_ + other.c_;
-        return res;
-    }
-
-    double Eval(const Eigen::Vector3d& v) const {
-        Eigen::Vector3d Av = A_ * v;
-        double q = v.dot(Av) + 2 * b_.dot(v) + c_;
-        return q;
-    }
-
-    bool IsInvertible() const { return std::fabs(A_.determinant()) > 1e-4; }
-
-    Eigen::Vector3d Minimum() const { return -A_.ldlt().solve(b_); }
-
-public:
-    /// A_ = n . n^T, where n is the plane normal
-    Eigen::Matrix3d A_;
-    /// b_ = d . n, where n is the plane normal and d the non-normal component
-    /// of the plane parameters
-    Eigen::Vector3d b_;
-    /// c_ = d . d, where d the non-normal component pf the plane parameters
-    double c_;
-};
-
 std::shared_ptr<TriangleMesh> TriangleMesh::SimplifyVertexClustering(
         double voxel_size,
         SimplificationContraction
@@ -262,16 +211,375 @@ std::shared_ptr<TriangleMesh> TriangleMesh::SimplifyVertexClustering(
     return mesh;
 }
 
+namespace {
+
+/// Number of triangles per cluster of the parallel quadric decimation.
+constexpr int64_t kDecimationClusterSize = 1 << 12;
+
+/// State of the quadric decimation, shared by the regions of the mesh that are
+/// decimated concurrently.
+class QuadricDecimation {
+public:
+    QuadricDecimation(TriangleMesh& mesh, std::vector<Quadric>& Qs)
+        : mesh_(mesh),
+          Qs_(Qs),
+          vertices_deleted_(mesh.vertices_.size(), 0),
+          triangles_deleted_(mesh.triangles_.size(), 0),
+          vert_to_triangles_(mesh.vertices_.size()) {
+        for (size_t tidx = 0; tidx < mesh.triangles_.size(); ++tidx) {
+            const Eigen::Vector3i& tria = mesh.triangles_[tidx];
+            vert_to_triangles_[tria(0)].emplace(static_cast<int>(tidx));
+            vert_to_triangles_[tria(1)].emplace(static_cast<int>(tidx));
+            vert_to_triangles_[tria(2)].emplace(static_cast<int>(tidx));
+        }
+    }
+
+    /// \brief Incremental edge collapse on a region of the mesh.
+    ///
+    /// Collapses the edges of the triangles \p region_triangles whose
+    /// vertices are both accepted by \p is_collapsible, in the order of their
+    /// cost, until \p num_triangles_to_remove triangles have been removed or
+    /// the cost exceeds \p maximum_error. Regions whose collapsible vertices
+    /// only belong to triangles of the region can be decimated concurrently.
+    /// Returns the number of removed triangles.
+    template <typename IsCollapsible>
+    int64_t CollapseEdges(const int64_t* region_triangles,
+                          int64_t num_region_triangles,
+                          IsCollapsible is_collapsible,
+                          int64_t num_triangles_to_remove,
+                          double maximum_error) {
+        typedef std::tuple<double, int, int> CostEdge;
+
+        // Get valid edges and compute cost
+        // Note: We could also select all vertex pairs as edges with dist < eps
+        std::unordered_map<Eigen::Vector2i, Eigen::Vector3d,
+                           utility::hash_eigen<Eigen::Vector2i>>
+                vbars;
+        std::unordered_map<Eigen::Vector2i, double,
+                           utility::hash_eigen<Eigen::Vector2i>>
+                costs;
+        auto CostEdgeComp = [](const CostEdge& a, const CostEdge& b) {
+            return std::get<0>(a) > std::get<0>(b);
+        };
+        std::priority_queue<CostEdge, std::vector<CostEdge>,
+                            decltype(CostEdgeComp)>
+                queue(CostEdgeComp);
+
+        auto AddEdge = [&](int vidx0, int vidx1, bool update) {
+            if (!is_collapsible(vidx0) || !is_collapsible(vidx1)) {
+                return;
+            }
+            int min = std::min(vidx0, vidx1);
+            int max = std::max(vidx0, vidx1);
+            Eigen::Vector2i edge(min, max);
+            if (update || vbars.count(edge) == 0) {
+                const Quadric& Q0 = Qs_[min];
+                const Quadric& Q1 = Qs_[max];
+                Quadric Qbar = Q0 + Q1;
+                double cost;
+                Eigen::Vector3d vbar;
+                if (Qbar.IsInvertible()) {
+                    vbar = Qbar.Minimum();
+                    cost = Qbar.Eval(vbar);
+                } else {
+                    const Eigen::Vector3d& v0 = mesh_.vertices_[vidx0];
+                    const Eigen::Vector3d& v1 = mesh_.vertices_[vidx1];
+                    Eigen::Vector3d vmid = (v0 + v1) / 2;
+                    double cost0 = Qbar.Eval(v0);
+                    double cost1 = Qbar.Eval(v1);
+                    double costmid = Qbar.Eval(vmid);
+                    cost = std::min(cost0, std::min(cost1, costmid));
+                    if (cost == costmid) {
+                        vbar = vmid;
+                    } else if (cost == cost0) {
+                        vbar = v0;
+                    } else {
+                        vbar = v1;
+                    }
+                }
+                vbars[edge] = vbar;
+                costs[edge] = cost;
+                queue.push(CostEdge(cost, min, max));
+            }
+        };
+
+        // add all edges to priority queue
+        for (int64_t i = 0; i < num_region_triangles; ++i) {
+            const Eigen::Vector3i& triangle =
+                    mesh_.triangles_[region_triangles[i]];
+            AddEdge(triangle(0), triangle(1), false);
+            AddEdge(triangle(1), triangle(2), false);
+            AddEdge(triangle(2), triangle(0), false);
+        }
+
+        // perform incremental edge collapse
+        bool has_vert_normal = mesh_.HasVertexNormals();
+        bool has_vert_color = mesh_.HasVertexColors();
+        int64_t num_removed = 0;
+        while (num_removed < num_triangles_to_remove && !queue.empty()) {
+            // retrieve edge from queue
+            double cost;
+            int vidx0, vidx1;
+            std::tie(cost, vidx0, vidx1) = queue.top();
+            queue.pop();
+
+            if (cost > maximum_error) {
+                break;
+            }
+
+            // test if the edge has been updated (reinserted into queue)
+            Eigen::Vector2i edge(vidx0, vidx1);
+            bool valid = !vertices_deleted_[vidx0] &&
+                         !vertices_deleted_[vidx1] && cost == costs[edge];
+            if (!valid) {
+                continue;
+            }
+
+            // avoid flip of triangle normal
+            bool flipped = false;
+            for (int tidx : vert_to_triangles_[vidx1]) {
+                if (triangles_deleted_[tidx]) {
+                    continue;
+                }
+
+                const Eigen::Vector3i& tria = mesh_.triangles_[tidx];
+                bool has_vidx0 = vidx0 == tria(0) || vidx0 == tria(1) ||
+                                 vidx0 == tria(2);
+                bool has_vidx1 = vidx1 == tria(0) || vidx1 == tria(1) ||
+                                 vidx1 == tria(2);
+                if (has_vidx0 && has_vidx1) {
+                    continue;
+                }
+
+                Eigen::Vector3d vert0 = mesh_.vertices_[tria(0)];
+                Eigen::Vector3d vert1 = mesh_.vertices_[tria(1)];
+                Eigen::Vector3d vert2 = mesh_.vertices_[tria(2)];
+                Eigen::Vector3d norm_before =
+                        (vert1 - vert0).cross(vert2 - vert0);
+                norm_before /= norm_before.norm();
+
+                if (vidx1 == tria(0)) {
+                    vert0 = vbars[edge];
+                } else if (vidx1 == tria(1)) {
+                    vert1 = vbars[edge];
+                } else if (vidx1 == tria(2)) {
+                    vert2 = vbars[edge];
+                }
+
+                Eigen::Vector3d norm_after =
+                        (vert1 - vert0).cross(vert2 - vert0);
+                norm_after /= norm_after.norm();
+                if (norm_before.dot(norm_after) < 0) {
+                    flipped = true;
+                    break;
+                }
+            }
+            if (flipped) {
+                continue;
+            }
+
+            // Connect triangles from vidx1 to vidx0, or mark deleted
+            for (int tidx : vert_to_triangles_[vidx1]) {
+                if (triangles_deleted_[tidx]) {
+                    continue;
+                }
+
+                Eigen::Vector3i& tria = mesh_.triangles_[tidx];
+                bool has_vidx0 = vidx0 == tria(0) || vidx0 == tria(1) ||
+                                 vidx0 == tria(2);
+                bool has_vidx1 = vidx1 == tria(0) || vidx1 == tria(1) ||
+                                 vidx1 == tria(2);
+
+                if (has_vidx0 && has_vidx1) {
+                    triangles_deleted_[tidx] = 1;
+                    num_removed++;
+                    continue;
+                }
+
+                if (vidx1 == tria(0)) {
+                    tria(0) = vidx0;
+                } else if (vidx1 == tria(1)) {
+                    tria(1) = vidx0;
+                } else if (vidx1 == tria(2)) {
+                    tria(2) = vidx0;
+                }
+                vert_to_triangles_[vidx0].insert(tidx);
+            }
+
+            // update vertex vidx0 to vbar
+            mesh_.vertices_[vidx0] = vbars[edge];
+            Qs_[vidx0] += Qs_[vidx1];
+            if (has_vert_normal) {
+                mesh_.vertex_normals_[vidx0] =
+                        0.5 * (mesh_.vertex_normals_[vidx0] +
+                               mesh_.vertex_normals_[vidx1]);
+            }
+            if (has_vert_color) {
+                mesh_.vertex_colors_[vidx0] =
+                        0.5 * (mesh_.vertex_colors_[vidx0] +
+                               mesh_.vertex_colors_[vidx1]);
+            }
+            vertices_deleted_[vidx1] = 1;
+
+            // Update edge costs for all triangles connecting to vidx0
+            for (const auto& tidx : vert_to_triangles_[vidx0]) {
+                if (triangles_deleted_[tidx]) {
+                    continue;
+                }
+                const Eigen::Vector3i& tria = mesh_.triangles_[tidx];
+                if (tria(0) == vidx0 || tria(1) == vidx0) {
+                    AddEdge(tria(0), tria(1), true);
+                }
+                if (tria(1) == vidx0 || tria(2) == vidx0) {
+                    AddEdge(tria(1), tria(2), true);
+                }
+                if (tria(2) == vidx0 || tria(0) == vidx0) {
+                    AddEdge(tria(2), tria(0), true);
+                }
+            }
+        }
+        return num_removed;
+    }
+
+    /// \brief Decimation passes on clusters of about kDecimationClusterSize
+    /// triangles, collapsed concurrently.
+    ///
+    /// Triangles are clustered by the grid cell of their centroid. Vertices
+    /// on the seams between clusters are locked during a pass, and the grid
+    /// is shifted between passes so that the seams move. Every pass removes
+    /// half of the excess triangles. Passes stop when the target is reached,
+    /// when less than two clusters of triangles are left, or when a pass
+    /// removes less than one percent of the excess triangles. Returns the
+    /// number of removed triangles.
+    int64_t CollapseEdgesOfClusters(int64_t num_triangles,
+                                    int64_t target_number_of_triangles,
+                                    double maximum_error,
+                                    double surface_area) {
+        const int64_t num_vertices = int64_t(mesh_.vertices_.size());
+        const Eigen::Vector3d min_bound = mesh_.GetMinBound();
+        std::vector<std::atomic<int>> vertex_clusters(num_vertices);
+        int64_t num_removed = 0;
+        for (int pass = 0;; ++pass) {
+            const int64_t num_alive = num_triangles - num_removed;
+            const int64_t excess = num_alive - target_number_of_triangles;
+            if (excess <= 0 || num_alive < 2 * kDecimationClusterSize) {
+                break;
+            }
+
+            // Cells covering about kDecimationClusterSize triangles of the
+            // surface.
+            const double cell_size = std::sqrt(
+                    surface_area * kDecimationClusterSize / num_alive);
+            const Eigen::Vector3d grid_min_bound =
+                    min_bound -
+                    Eigen::Vector3d::Constant((pass % 2 + 1) * 0.5 * cell_size);
+            std::vector<int64_t> alive_triangles;
+            alive_triangles.reserve(num_alive);
+            for (int64_t tidx = 0; tidx < num_triangles; ++tidx) {
+                if (!triangles_deleted_[tidx]) {
+                    alive_triangles.push_back(tidx);
+                }
+            }
+            std::vector<Eigen::Vector3d> centroids(alive_triangles.size());
+#pragma omp parallel for schedule(static)
+            for (int64_t i = 0; i < int64_t(alive_triangles.size()); ++i) {
+                const Eigen::Vector3i& tria =
+                        mesh_.triangles_[alive_triangles[i]];
+                centroids[i] =
+                        (mesh_.vertices_[tria(0)] + mesh_.vertices_[tria(1)] +
+                         mesh_.vertices_[tria(2)]) /
+                        3.0;
+            }
+            std::vector<int64_t> sorted_triangles, cluster_starts;
+            VoxelGrouping::GroupPointsByVoxel(
+                    VoxelGrouping::ComputeVoxelIndices(
+                            centroids, grid_min_bound, cell_size),
+                    sorted_triangles, cluster_starts);
+#pragma omp parallel for schedule(static)
+            for (int64_t i = 0; i < int64_t(sorted_triangles.size()); ++i) {
+                sorted_triangles[i] = alive_triangles[sorted_triangles[i]];
+            }
+            const int64_t num_clusters = int64_t(cluster_starts.size()) - 1;
+
+            // A vertex is collapsible in the cluster that holds all of its
+            // triangles, and locked if it is on a seam.
+            constexpr int kUnassigned = -2;
+            constexpr int kSeam = -1;
+#pragma omp parallel for schedule(static)
+            for (int64_t vidx = 0; vidx < num_vertices; ++vidx) {
+                vertex_clusters[vidx].store(kUnassigned,
+                                            std::memory_order_relaxed);
+            }
+#pragma omp parallel for schedule(static)
+            for (int64_t c = 0; c < num_clusters; ++c) {
+                for (int64_t i = cluster_starts[c]; i < cluster_starts[c + 1];
+                     ++i) {
+                    const Eigen::Vector3i& tria =
+                            mesh_.triangles_[sorted_triangles[i]];
+                    for (int k = 0; k < 3; ++k) {
+                        std::atomic<int>& cluster = vertex_clusters[tria(k)];
+                        int expected = kUnassigned;
+                        if (!cluster.compare_exchange_strong(
+                                    expected, int(c),
+                                    std::memory_order_relaxed) &&
+                            expected != int(c)) {
+                            cluster.store(kSeam, std::memory_order_relaxed);
+                        }
+                    }
+                }
+            }
+
+            // Every cluster removes its share of half of the excess triangles,
+            // so that the seams of this pass are decimated in the next ones.
+            int64_t num_removed_in_pass = 0;
+#pragma omp parallel for schedule(dynamic) reduction(+ : num_removed_in_pass)
+            for (int64_t c = 0; c < num_clusters; ++c) {
+                const int64_t cluster_size =
+                        cluster_starts[c + 1] - cluster_starts[c];
+                const int64_t cluster_target =
+                        (cluster_size * excess + 2 * num_alive - 1) /
+                        (2 * num_alive);
+                num_removed_in_pass += CollapseEdges(
+                        sorted_triangles.data() + cluster_starts[c],
+                        cluster_size,
+                        [&](int vidx) {
+                            return vertex_clusters[vidx].load(
+                                           std::memory_order_relaxed) == int(c);
+                        },
+                        cluster_target, maximum_error);
+            }
+            num_removed += num_removed_in_pass;
+            utility::LogDebug(
+                    "[SimplifyQuadricDecimation] Pass {:d} removed {:d} "
+                    "triangles in {:d} clusters.",
+                    pass, num_removed_in_pass, num_clusters);
+            if (num_removed_in_pass * 100 < excess) {
+                break;
+            }
+        }
+        return num_removed;
+    }
+
+public:
+    TriangleMesh& mesh_;
+    std::vector<Quadric>& Qs_;
+    std::vector<uint8_t> vertices_deleted_;
+    std::vector<uint8_t> triangles_deleted_;
+    std::vector<std::unordered_set<int>> vert_to_triangles_;
+};
+
+}  // namespace
+
 std::shared_ptr<TriangleMesh> TriangleMesh::SimplifyQuadricDecimation(
         int target_number_of_triangles,
-        double maximum_error = std::numeric_limits<double>::infinity(),
-        double boundary_weight = 1.0) const {
+        double maximum_error /* = std::numeric_limits<double>::infinity() */,
+        double boundary_weight /* = 1.0 */,
+        bool parallel /* = false */) const {
     if (HasTriangleUvs()) {
         utility::LogWarning(
                 "[SimplifyQuadricDecimation] This mesh contains triangle uvs "
                 "that are not handled in this function");
     }
-    typedef std::tuple<double, int, int> CostEdge;
 
     auto mesh = std::make_shared<TriangleMesh>();
     mesh->vertices_ = vertices_;
@@ -279,26 +587,21 @@ std::shared_ptr<TriangleMesh> TriangleMesh::SimplifyQuadricDecimation(
     mesh->vertex_colors_ = vertex_colors_;
     mesh->triangles_ = triangles_;
 
-    std::vector<bool> vertices_deleted(vertices_.size(), false);
-    std::vector<bool> triangles_deleted(triangles_.size(), false);
-
-    // Map vertices to triangles and compute triangle planes and areas
-    std::vector<std::unordered_set<int>> vert_to_triangles(vertices_.size());
+    // Compute triangle planes and areas
     std::vector<Eigen::Vector4d> triangle_planes(triangles_.size());
     std::vector<double> triangle_areas(triangles_.size());
-    for (size_t tidx = 0; tidx < triangles_.size(); ++tidx) {
-        vert_to_triangles[triangles_[tidx](0)].emplace(static_cast<int>(tidx));
-        vert_to_triangles[triangles_[tidx](1)].emplace(static_cast<int>(tidx));
-        vert_to_triangles[triangles_[tidx](2)].emplace(static_cast<int>(tidx));
-
+#pragma omp parallel for schedule(static)
+    for (int64_t tidx = 0; tidx < int64_t(triangles_.size()); ++tidx) {
         triangle_planes[tidx] = GetTrianglePlane(tidx);
         triangle_areas[tidx] = GetTriangleArea(tidx);
     }
 
     // Compute the error metric per vertex
     std::vector<Quadric> Qs(vertices_.size());
-    for (size_t vidx = 0; vidx < vertices_.size(); ++vidx) {
-        for (int tidx : vert_to_triangles[vidx]) {
+    QuadricDecimation decimation(*mesh, Qs);
+#pragma omp parallel for schedule(static)
+    for (int64_t vidx = 0; vidx < int64_t(vertices_.size()); ++vidx) {
+        for (int tidx : decimation.vert_to_triangles_[vidx]) {
             Qs[vidx] += Quadric(triangle_planes[tidx], triangle_areas[tidx]);
         }
     }
@@ -330,191 +633,42 @@ std::shared_ptr<TriangleMesh> TriangleMesh::SimplifyQuadricDecimation(
         AddPerpPlaneQuadric(tria(2), tria(0), tria(1), area);
     }
 
-    // Get valid edges and compute cost
-    // Note: We could also select all vertex pairs as edges with dist < eps
-    std::unordered_map<Eigen::Vector2i, Eigen::Vector3d,
-                       utility::hash_eigen<Eigen::Vector2i>>
-            vbars;
-    std::unordered_map<Eigen::Vector2i, double,
-                       utility::hash_eigen<Eigen::Vector2i>>
-            costs;
-    auto CostEdgeComp = [](const CostEdge& a, const CostEdge& b) {
-        return std::get<0>(a) > std::get<0>(b);
-    };
-    std::priority_queue<CostEdge, std::vector<CostEdge>, decltype(CostEdgeComp)>
-            queue(CostEdgeComp);
-
-    auto AddEdge = [&](int vidx0, int vidx1, bool update) {
-        int min = std::min(vidx0, vidx1);
-        int max = std::max(vidx0, vidx1);
-        Eigen::Vector2i edge(min, max);
-        if (update || vbars.count(edge) == 0) {
-            const Quadric& Q0 = Qs[min];
-            const Quadric& Q1 = Qs[max];
-            Quadric Qbar = Q0 + Q1;
-            double cost;
-            Eigen::Vector3d vbar;
-            if (Qbar.IsInvertible()) {
-                vbar = Qbar.Minimum();
-                cost = Qbar.Eval(vbar);
-            } else {
-                const Eigen::Vector3d& v0 = mesh->vertices_[vidx0];
-                const Eigen::Vector3d& v1 = mesh->vertices_[vidx1];
-                Eigen::Vector3d vmid = (v0 + v1) / 2;
-                double cost0 = Qbar.Eval(v0);
-                double cost1 = Qbar.Eval(v1);
-                double costmid = Qbar.Eval(vmid);
-                cost = std::min(cost0, std::min(cost1, costmid));
-                if (cost == costmid) {
-                    vbar = vmid;
-                } else if (cost == cost0) {
-                    vbar = v0;
-                } else {
-                    vbar = v1;
-                }
-            }
-            vbars[edge] = vbar;
-            costs[edge] = cost;
-            queue.push(CostEdge(cost, min, max));
-        }
-    };
-
-    // add all edges to priority queue
-    for (const auto& triangle : triangles_) {
-        AddEdge(triangle(0), triangle(1), false);
-        AddEdge(triangle(1), triangle(2), false);
-        AddEdge(triangle(2), triangle(0), false);
+    const int64_t num_triangles = int64_t(triangles_.size());
+    int64_t num_removed = 0;
+    if (parallel) {
+        const double surface_area = std::accumulate(triangle_areas.begin(),
+                                                    triangle_areas.end(), 0.0);
+        num_removed = decimation.CollapseEdgesOfClusters(
+                num_triangles, target_number_of_triangles, maximum_error,
+                surface_area);
     }
-
-    // perform incremental edge collapse
-    bool has_vert_normal = HasVertexNormals();
-    bool has_vert_color = HasVertexColors();
-    int n_triangles = int(triangles_.size());
-    while (n_triangles > target_number_of_triangles && !queue.empty()) {
-        // retrieve edge from queue
-        double cost;
-        int vidx0, vidx1;
-        std::tie(cost, vidx0, vidx1) = queue.top();
-        queue.pop();
-
-        if (cost > maximum_error) {
-            break;
-        }
-
-        // test if the edge has been updated (reinserted into queue)
-        Eigen::Vector2i edge(vidx0, vidx1);
-        bool valid = !vertices_deleted[vidx0] && !vertices_deleted[vidx1] &&
-                     cost == costs[edge];
-        if (!valid) {
-            continue;
-        }
-
-        // avoid flip of triangle normal
-        bool flipped = false;
-        for (int tidx : vert_to_triangles[vidx1]) {
-            if (triangles_deleted[tidx]) {
-                continue;
-            }
-
-            const Eigen::Vector3i& tria = mesh->triangles_[tidx];
-            bool has_vidx0 =
-                    vidx0 == tria(0) || vidx0 == tria(1) || vidx0 == tria(2);
-            bool has_vidx1 =
-                    vidx1 == tria(0) || vidx1 == tria(1) || vidx1 == tria(2);
-            if (has_vidx0 && has_vidx1) {
-                continue;
-            }
-
-            Eigen::Vector3d vert0 = mesh->vertices_[tria(0)];
-            Eigen::Vector3d vert1 = mesh->vertices_[tria(1)];
-            Eigen::Vector3d vert2 = mesh->vertices_[tria(2)];
-            Eigen::Vector3d norm_before = (vert1 - vert0).cross(vert2 - vert0);
-            norm_before /= norm_before.norm();
-
-            if (vidx1 == tria(0)) {
-                vert0 = vbars[edge];
-            } else if (vidx1 == tria(1)) {
-                vert1 = vbars[edge];
-            } else if (vidx1 == tria(2)) {
-                vert2 = vbars[edge];
-            }
-
-            Eigen::Vector3d norm_after = (vert1 - vert0).cross(vert2 - vert0);
-            norm_after /= norm_after.norm();
-            if (norm_before.dot(norm_after) < 0) {
-                flipped = true;
-                break;
-            }
-        }
-        if (flipped) {
-            continue;
-        }
-
-        // Connect triangles from vidx1 to vidx0, or mark deleted
-        for (int tidx : vert_to_triangles[vidx1]) {
-            if (triangles_deleted[tidx]) {
-                continue;
-            }
-
-            Eigen::Vector3i& tria = mesh->triangles_[tidx];
-            bool has_vidx0 =
-                    vidx0 == tria(0) || vidx0 == tria(1) || vidx0 == tria(2);
-            bool has_vidx1 =
-                    vidx1 == tria(0) || vidx1 == tria(1) || vidx1 == tria(2);
-
-            if (has_vidx0 && has_vidx1) {
-                triangles_deleted[tidx] = true;
-                n_triangles--;
-                continue;
-            }
-
-            if (vidx1 == tria(0)) {
-                tria(0) = vidx0;
-            } else if (vidx1 == tria(1)) {
-                tria(1) = vidx0;
-            } else if (vidx1 == tria(2)) {
-                tria(2) = vidx0;
-            }
-            vert_to_triangles[vidx0].insert(tidx);
-        }
-
-        // update vertex vidx0 to vbar
-        mesh->vertices_[vidx0] = vbars[edge];
-        Qs[vidx0] += Qs[vidx1];
-        if (has_vert_normal) {
-            mesh->vertex_normals_[vidx0] = 0.5 * (mesh->vertex_normals_[vidx0] +
-                                                  mesh->vertex_normals_[vidx1]);
-        }
-        if (has_vert_color) {
-            mesh->vertex_colors_[vidx0] = 0.5 * (mesh->vertex_colors_[vidx0] +
-                                                 mesh->vertex_colors_[vidx1]);
-        }
-        vertices_deleted[vidx1] = true;
-
-        // Update edge costs for all triangles connecting to vidx0
-        for (const auto& tidx : vert_to_triangles[vidx0]) {
-            if (triangles_deleted[tidx]) {
-                continue;
-            }
-            const Eigen::Vector3i& tria = mesh->triangles_[tidx];
-            if (tria(0) == vidx0 || tria(1) == vidx0) {
-                AddEdge(tria(0), tria(1), true);
-            }
-            if (tria(1) == vidx0 || tria(2) == vidx0) {
-                AddEdge(tria(1), tria(2), true);
-            }
-            if (tria(2) == vidx0 || tria(0) == vidx0) {
-                AddEdge(tria(2), tria(0), true);
+    // Serial decimation of the whole mesh, or of what is left of it.
+    if (num_triangles - num_removed > target_number_of_triangles) {
+        std::vector<int64_t> alive_triangles;
+        alive_triangles.reserve(num_triangles - num_removed);
+        for (int64_t tidx = 0; tidx < num_triangles; ++tidx) {
+            if (!decimation.triangles_deleted_[tidx]) {
+                alive_triangles.push_back(tidx);
             }
         }
+        num_removed += decimation.CollapseEdges(
+                alive_triangles.data(), int64_t(alive_triangles.size()),
+                [](int vidx) { return true; },
+                num_triangles - num_removed - target_number_of_triangles,
+                maximum_error);
     }
+    const std::vector<uint8_t>& vertices_deleted = decimation.vertices_deleted_;
+    const std::vector<uint8_t>& triangles_deleted =
+            decimation.triangles_deleted_;
 
     // Apply changes to the triangle mesh
+    bool has_vert_normal = HasVertexNormals();
+    bool has_vert_color = HasVertexColors();
     int next_free = 0;
-    std::unordered_map<int, int> vert_remapping;
+    std::vector<int> vert_remapping(mesh->vertices_.size(), -1);
     for (size_t idx = 0; idx < mesh->vertices_.size(); ++idx) {
         if (!vertices_deleted[idx]) {
-            vert_remapping[int(idx)] = next_free;
+            vert_remapping[idx] = next_free;
             mesh->vertices_[next_free] = mesh->vertices_[idx];
             if (has_vert_normal) {
                 mesh->vertex_normals_[next_free] = mesh->vertex_normals_[idx];
@@ -0,0 +1,156 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/geometry/VoxelGrouping.h"
+
+#include <tbb/parallel_sort.h>
+
+#include <algorithm>
+#include <cmath>
+#include <numeric>
+#include <tuple>
+
+#include "open3d/utility/ParallelRadixSort.h"
+
+namespace open3d {
+namespace geometry {
+
+std::vector<Eigen::Vector3i> VoxelGrouping::ComputeVoxelIndices(
+        const std::vector<Eigen::Vector3d> &points,
+        const Eigen::Vector3d &voxel_min_bound,
+        double voxel_size) {
+    std::vector<Eigen::Vector3i> voxel_indices(points.size());
+#pragma omp parallel for schedule(static)
+    for (int64_t i = 0; i < int64_t(points.size()); i++) {
+        Eigen::Vector3d ref_coord = (points[i] - voxel_min_bound) / voxel_size;
+        voxel_indices[i] << int(floor(ref_coord(0))), int(floor(ref_coord(1))),
+                int(floor(ref_coord(2)));
+    }
+    return voxel_indices;
+}
+
+void VoxelGrouping::GroupPointsByVoxel(
+        const std::vector<Eigen::Vector3i> &voxel_indices,
+        std::vector<int64_t> &sorted_points,
+        std::vector<int64_t> &voxel_starts) {
+    const int64_t num_points = int64_t(voxel_indices.size());
+    sorted_points.resize(num_points);
+    std::iota(sorted_points.begin(), sorted_points.end(), 0);
+    voxel_starts.assign(1, 0);
+    if (num_points == 0) {
+        return;
+    }
+
+    Eigen::Vector3i min_index = voxel_indices[0];
+    Eigen::Vector3i max_index = voxel_indices[0];
+#pragma omp parallel
+    {
+        Eigen::Vector3i local_min = voxel_indices[0];
+        Eigen::Vector3i local_max = voxel_indices[0];
+#pragma omp for nowait
+        for (int64_t i = 0; i < num_points; i++) {
+            local_min = local_min.cwiseMin(voxel_indices[i]);
+            local_max = local_max.cwiseMax(voxel_indices[i]);
+        }
+#pragma omp critical
+        {
+            min_index = min_index.cwiseMin(local_min);
+            max_index = max_index.cwiseMax(local_max);
+        }
+    }
+    int bits[3];
+    for (int c = 0; c < 3; c++) {
+        uint64_t range = uint64_t(int64_t(max_index(c)) - min_index(c));
+        bits[c] = 0;
+        while (range >> bits[c]) {
+            bits[c]++;
+        }
+    }
+
+    // Sorted packed keys, empty if the voxel indices do not fit in 64 bits.
+    std::vector<uint64_t> keys;
+    if (bits[0] + bits[1] + bits[2] <= 64) {
+        // Pack the voxel indices into 64 bit keys, in lexicographic order.
+        keys.resize(num_points);
+#pragma omp parallel for schedule(static)
+        for (int64_t i = 0; i < num_points; i++) {
+            Eigen::Vector3i offset = voxel_indices[i] - min_index;
+            keys[i] = (uint64_t(uint32_t(offset(0))) << (bits[1] + bits[2])) |
+                      (uint64_t(uint32_t(offset(1))) << bits[2]) |
+                      uint64_t(uint32_t(offset(2)));
+        }
+        utility::ParallelRadixSort(keys, sorted_points,
+                                   bits[0] + bits[1] + bits[2]);
+    } else {
+        tbb::parallel_sort(sorted_points.begin(), sorted_points.end(),
+                           [&](int64_t a, int64_t b) {
+                               const Eigen::Vector3i &va = voxel_indices[a];
+                               const Eigen::Vector3i &vb = voxel_indices[b];
+                               return std::tie(va(0), va(1), va(2), a) <
+                                      std::tie(vb(0), vb(1), vb(2), b);
+                           });
+    }
+
+    // Collect the first sorted position of every voxel, block by block.
+    const int64_t block_size = 1 << 16;
+    const int64_t num_blocks = (num_points + block_size - 1) / block_size;
+    auto is_voxel_start = [&](int64_t i) {
+        if (i == 0) {
+            return true;
+        }
+        if (!keys.empty()) {
+            return keys[i] != keys[i - 1];
+        }
+        return voxel_indices[sorted_points[i]] !=
+               voxel_indices[sorted_points[i - 1]];
+    };
+    std::vector<int64_t> block_offsets(num_blocks + 1, 0);
+#pragma omp parallel for schedule(static)
+    for (int64_t b = 0; b < num_blocks; b++) {
+        const int64_t end = std::min(num_points, (b + 1) * block_size);
+        for (int64_t i = b * block_size; i < end; i++) {
+            block_offsets[b + 1] += is_voxel_start(i) ? 1 : 0;
+        }
+    }
+    std::partial_sum(block_offsets.begin(), block_offsets.end(),
+                     block_offsets.begin());
+    const int64_t num_voxels = block_offsets[num_blocks];
+    voxel_starts.resize(num_voxels + 1);
+#pragma omp parallel for schedule(static)
+    for (int64_t b = 0; b < num_blocks; b++) {
+        const int64_t end = std::min(num_points, (b + 1) * block_size);
+        int64_t k = block_offsets[b];
+        for (int64_t i = b * block_size; i < end; i++) {
+            if (is_voxel_start(i)) {
+                voxel_starts[k++] = i;
+            }
+        }
+    }
+    voxel_starts[num_voxels] = num_points;
+}
+
+}  // namespace geometry
+}  // namespace open3d
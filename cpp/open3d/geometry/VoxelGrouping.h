@@ -0,0 +1,67 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#pragma once
+
+#include <Eigen/Core>
+#include <cstdint>
+#include <vector>
+
+namespace open3d {
+namespace geometry {
+
+/// \class VoxelGrouping
+///
+/// \brief Parallel grouping of points by voxel, shared by voxel downsampling
+/// and grid based algorithms.
+class VoxelGrouping {
+public:
+    /// Compute floor((point - voxel_min_bound) / voxel_size) for every point.
+    static std::vector<Eigen::Vector3i> ComputeVoxelIndices(
+            const std::vector<Eigen::Vector3d> &points,
+            const Eigen::Vector3d &voxel_min_bound,
+            double voxel_size);
+
+    /// \brief Group points by voxel with a parallel radix sort.
+    ///
+    /// On return, \p sorted_points holds the point indices ordered by voxel
+    /// index (lexicographically), and by point index inside a voxel. The
+    /// points of the i-th voxel are sorted_points[voxel_starts[i]] ...
+    /// sorted_points[voxel_starts[i + 1] - 1]. The result does not depend on
+    /// the number of threads.
+    ///
+    /// \param voxel_indices Voxel index of every point.
+    /// \param sorted_points Output point indices, grouped by voxel.
+    /// \param voxel_starts Output offsets of the voxels in sorted_points,
+    /// followed by the number of points.
+    static void GroupPointsByVoxel(
+            const std::vector<Eigen::Vector3i> &voxel_indices,
+            std::vector<int64_t> &sorted_points,
+            std::vector<int64_t> &voxel_starts);
+};
+
+}  // namespace geometry
+}  // namespace open3d
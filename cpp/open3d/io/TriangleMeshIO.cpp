@@ -28,6 +28,7 @@
 
 #include <unordered_map>
 
+#include "open3d/geometry/StreamingVertexClustering.h"
 #include "open3d/utility/Console.h"
 #include "open3d/utility/FileSystem.h"
 
@@ -69,6 +70,18 @@ static const std::unordered_map<
                 {"glb", WriteTriangleMeshToGLTF},
         };
 
+static const std::unordered_map<
+        std::string,
+        std::function<bool(const std::string &,
+                           const TriangleMeshVerticesCallback &,
+                           const TriangleMeshTrianglesCallback &,
+                           int,
+                           bool)>>
+        file_extension_to_trianglemesh_read_in_chunks_function{
+                {"ply", ReadTriangleMeshInChunksFromPLY},
+                {"obj", ReadTriangleMeshInChunksFromOBJ},
+        };
+
 }  // unnamed namespace
 
 namespace io {
@@ -144,6 +157,61 @@ bool WriteTriangleMesh(const std::string &filename,
     return success;
 }
 
+bool ReadTriangleMeshInChunks(const std::string &filename,
+                              const TriangleMeshVerticesCallback &on_vertices,
+                              const TriangleMeshTrianglesCallback &on_triangles,
+                              int chunk_size /* = 1 << 16 */,
+                              bool print_progress /* = false */) {
+    if (chunk_size <= 0) {
+        utility::LogError("chunk_size must be positive, but got {:d}.",
+                          chunk_size);
+    }
+    std::string filename_ext =
+            utility::filesystem::GetFileExtensionInLowerCase(filename);
+    auto map_itr = file_extension_to_trianglemesh_read_in_chunks_function.find(
+            filename_ext);
+    if (map_itr ==
+        file_extension_to_trianglemesh_read_in_chunks_function.end()) {
+        utility::LogWarning(
+                "Read geometry::TriangleMesh in chunks failed: unknown file "
+                "extension.");
+        return false;
+    }
+    return map_itr->second(filename, on_vertices, on_triangles, chunk_size,
+                           print_progress);
+}
+
+bool SimplifyTriangleMeshFileVertexClustering(
+        const std::string &input_filename,
+        const std::string &output_filename,
+        double voxel_size,
+        geometry::MeshBase::SimplificationContraction contraction
+        /* = geometry::MeshBase::SimplificationContraction::Average */,
+        bool print_progress /* = false */) {
+    geometry::StreamingVertexClustering clustering(voxel_size, contraction);
+    bool success = ReadTriangleMeshInChunks(
+            input_filename,
+            [&](const std::vector<Eigen::Vector3d> &vertices,
+                const std::vector<Eigen::Vector3d> &vertex_normals,
+                const std::vector<Eigen::Vector3d> &vertex_colors) {
+                clustering.AddVertices(vertices, vertex_normals, vertex_colors);
+            },
+            [&](const std::vector<Eigen::Vector3i> &triangles) {
+                clustering.AddTriangles(triangles);
+            },
+            1 << 16, print_progress);
+    if (!success) {
+        return false;
+    }
+    auto mesh = clustering.GetSimplifiedMesh();
+    utility::LogDebug(
+            "Simplified {:d} vertices to {:d} vertices and {:d} triangles.",
+            clustering.GetNumberOfInputVertices(), mesh->vertices_.size(),
+            mesh->triangles_.size());
+    return WriteTriangleMesh(output_filename, *mesh, false, false, true, true,
+                             true, print_progress);
+}
+
 // Reference: https://stackoverflow.com/a/43896965
 bool IsPointInsidePolygon(const Eigen::MatrixX2d &polygon, double x, double y) {
     bool inside = false;
@@ -26,6 +26,7 @@
 
 #pragma once
 
+#include <functional>
 #include <string>
 
 #include "open3d/geometry/TriangleMesh.h"
@@ -61,6 +62,53 @@ bool WriteTriangleMesh(const std::string &filename,
                        bool write_triangle_uvs = true,
                        bool print_progress = false);
 
+/// Callback receiving a chunk of vertices with their normals and colors. The
+/// normals and colors are empty if the file has none.
+using TriangleMeshVerticesCallback =
+        std::function<void(const std::vector<Eigen::Vector3d> &vertices,
+                           const std::vector<Eigen::Vector3d> &vertex_normals,
+                           const std::vector<Eigen::Vector3d> &vertex_colors)>;
+
+/// Callback receiving a chunk of triangles, indexing the vertices received
+/// before them.
+using TriangleMeshTrianglesCallback =
+        std::function<void(const std::vector<Eigen::Vector3i> &triangles)>;
+
+/// \brief The general entrance for reading a TriangleMesh from a file chunk
+/// by chunk, without holding it in memory.
+///
+/// The function calls read functions based on the extension name of filename.
+/// Supported formats are .ply and .obj. The vertices and triangles are passed
+/// to the callbacks in chunks of about chunk_size elements, in the order of
+/// the file. Polygons are split into triangle fans. Vertex normals of .obj
+/// files are ignored, as they belong to face corners.
+/// \return return true if the read function is successful, false otherwise.
+bool ReadTriangleMeshInChunks(const std::string &filename,
+                              const TriangleMeshVerticesCallback &on_vertices,
+                              const TriangleMeshTrianglesCallback &on_triangles,
+                              int chunk_size = 1 << 16,
+                              bool print_progress = false);
+
+/// \brief Function to simplify a mesh file that does not fit in memory with
+/// vertex clustering, and to write the simplified mesh.
+///
+/// The input mesh is read chunk by chunk with ReadTriangleMeshInChunks and
+/// simplified with geometry::StreamingVertexClustering, on a grid anchored at
+/// the origin of the coordinates.
+/// \param input_filename Path to the input .ply or .obj file.
+/// \param output_filename Path to the simplified mesh.
+/// \param voxel_size The size of the voxel within vertices are pooled.
+/// \param contraction Method to aggregate vertex information.
+/// \return return true if reading and writing are successful, false
+/// otherwise.
+bool SimplifyTriangleMeshFileVertexClustering(
+        const std::string &input_filename,
+        const std::string &output_filename,
+        double voxel_size,
+        geometry::MeshBase::SimplificationContraction contraction =
+                geometry::MeshBase::SimplificationContraction::Average,
+        bool print_progress = false);
+
 bool ReadTriangleMeshFromPLY(const std::string &filename,
                              geometry::TriangleMesh &mesh,
                              bool print_progress);
@@ -74,6 +122,13 @@ bool WriteTriangleMeshToPLY(const std::string &filename,
                             bool write_triangle_uvs,
                             bool print_progress);
 
+bool ReadTriangleMeshInChunksFromPLY(
+        const std::string &filename,
+        const TriangleMeshVerticesCallback &on_vertices,
+        const TriangleMeshTrianglesCallback &on_triangles,
+        int chunk_size,
+        bool print_progress);
+
 bool ReadTriangleMeshFromSTL(const std::string &filename,
                              geometry::TriangleMesh &mesh,
                              bool print_progress);
@@ -91,6 +146,13 @@ bool ReadTriangleMeshFromOBJ(const std::string &filename,
                              geometry::TriangleMesh &mesh,
                              bool print_progress);
 
+bool ReadTriangleMeshInChunksFromOBJ(
+        const std::string &filename,
+        const TriangleMeshVerticesCallback &on_vertices,
+        const TriangleMeshTrianglesCallback &on_triangles,
+        int chunk_size,
+        bool print_progress);
+
 bool WriteTriangleMeshToOBJ(const std::string &filename,
                             const geometry::TriangleMesh &mesh,
                             bool write_ascii,
@@ -26,6 +26,7 @@
 
 #include <tiny_obj_loader.h>
 
+#include <cstdlib>
 #include <fstream>
 #include <numeric>
 #include <vector>
@@ -222,6 +223,133 @@ bool ReadTriangleMeshFromOBJ(const std::string& filename,
     return true;
 }
 
+bool ReadTriangleMeshInChunksFromOBJ(
+        const std::string& filename,
+        const TriangleMeshVerticesCallback& on_vertices,
+        const TriangleMeshTrianglesCallback& on_triangles,
+        int chunk_size,
+        bool print_progress) {
+    try {
+        utility::filesystem::CFile file;
+        if (!file.Open(filename, "r")) {
+            utility::LogWarning("Read OBJ failed: unable to open file: {}",
+                                filename);
+            return false;
+        }
+        const int64_t file_size = std::max(file.GetFileSize(), int64_t(1));
+        utility::ConsoleProgressBar progress_bar(
+                100, "Reading OBJ: ", print_progress);
+        int64_t percent = 0;
+        int64_t num_lines = 0;
+
+        std::vector<Eigen::Vector3d> vertices, vertex_colors;
+        std::vector<Eigen::Vector3i> triangles;
+        std::vector<int> face;
+        int64_t num_vertices = 0;
+        int has_colors = -1;
+        const std::vector<Eigen::Vector3d> no_normals;
+        auto FlushVertices = [&]() {
+            if (!vertices.empty()) {
+                on_vertices(vertices, no_normals, vertex_colors);
+                vertices.clear();
+                vertex_colors.clear();
+            }
+        };
+        auto FlushTriangles = [&]() {
+            if (!triangles.empty()) {
+                on_triangles(triangles);
+                triangles.clear();
+            }
+        };
+
+        const char* line;
+        while ((line = file.ReadLine())) {
+            while (*line == ' ' || *line == '\t') {
+                ++line;
+            }
+            if (line[0] == 'v' && (line[1] == ' ' || line[1] == '\t')) {
+                // v x y z [r g b]
+                double values[6];
+                int num_values = 0;
+                const char* ptr = line + 2;
+                char* end;
+                while (num_values < 6) {
+                    const double value = std::strtod(ptr, &end);
+                    if (end == ptr) {
+                        break;
+                    }
+                    values[num_values++] = value;
+                    ptr = end;
+                }
+                if (num_values < 3) {
+                    utility::LogWarning("Read OBJ failed: invalid vertex: {}",
+                                        line);
+                    return false;
+                }
+                if (has_colors == -1) {
+                    has_colors = num_values == 6;
+                }
+                vertices.emplace_back(values[0], values[1], values[2]);
+                if (has_colors) {
+                    vertex_colors.push_back(num_values == 6
+                                                    ? Eigen::Vector3d(values[3],
+                                                                      values[4],
+                                                                      values[5])
+                                                    : Eigen::Vector3d::Ones());
+                }
+                num_vertices++;
+                if (int(vertices.size()) == chunk_size) {
+                    FlushVertices();
+                }
+            } else if (line[0] == 'f' && (line[1] == ' ' || line[1] == '\t')) {
+                // f v0[/vt0][/vn0] v1[/vt1][/vn1] ..., with 1-based or
+                // negative relative indices.
+                face.clear();
+                const char* ptr = line + 2;
+                char* end;
+                while (true) {
+                    const long index = std::strtol(ptr, &end, 10);
+                    if (end == ptr) {
+                        break;
+                    }
+                    face.push_back(
+                            int(index < 0 ? num_vertices + index : index - 1));
+                    ptr = end;
+                    while (*ptr != '\0' && *ptr != ' ' && *ptr != '\t' &&
+                           *ptr != '\r' && *ptr != '\n') {
+                        ++ptr;
+                    }
+                }
+                if (face.size() < 3) {
+                    utility::LogWarning("Read OBJ failed: invalid face: {}",
+                                        line);
+                    return false;
+                }
+                // The triangles only index vertices that have been passed.
+                FlushVertices();
+                for (size_t i = 2; i < face.size(); ++i) {
+                    triangles.emplace_back(face[0], face[i - 1], face[i]);
+                }
+                if (int(triangles.size()) >= chunk_size) {
+                    FlushTriangles();
+                }
+            }
+            if (++num_lines % 4096 == 0) {
+                for (int64_t current = file.CurPos() * 100 / file_size;
+                     percent < current; ++percent) {
+                    ++progress_bar;
+                }
+            }
+        }
+        FlushVertices();
+        FlushTriangles();
+        return true;
+    } catch (const std::exception& e) {
+        utility::LogWarning("Read OBJ failed with exception: {}", e.what());
+        return false;
+    }
+}
+
 bool WriteTriangleMeshToOBJ(const std::string& filename,
                             const geometry::TriangleMesh& mesh,
                             bool write_ascii /* = false*/,
@@ -212,6 +212,174 @@ int ReadFaceCallBack(p_ply_argument argument) {
 
 }  // namespace ply_trianglemesh_reader
 
+namespace ply_trianglemesh_chunk_reader {
+
+struct PLYReaderState {
+    utility::ConsoleProgressBar *progress_bar;
+    const TriangleMeshVerticesCallback *on_vertices;
+    const TriangleMeshTrianglesCallback *on_triangles;
+    long chunk_size;
+    long vertex_index;
+    long vertex_num;
+    long normal_index;
+    long normal_num;
+    long color_index;
+    long color_num;
+    long face_index;
+    long face_num;
+    // Index of the first vertex of the current chunk.
+    long chunk_begin;
+    std::vector<Eigen::Vector3d> vertices;
+    std::vector<Eigen::Vector3d> normals;
+    std::vector<Eigen::Vector3d> colors;
+    std::vector<unsigned int> face;
+    std::vector<Eigen::Vector3i> triangles;
+    std::string error;
+};
+
+// Passes the chunk of vertices once all of their properties are read.
+bool FlushVertices(PLYReaderState *state_ptr) {
+    long end = state_ptr->vertex_index;
+    if (state_ptr->normal_num > 0) {
+        end = std::min(end, state_ptr->normal_index);
+    }
+    if (state_ptr->color_num > 0) {
+        end = std::min(end, state_ptr->color_index);
+    }
+    long count = end - state_ptr->chunk_begin;
+    if (count == 0 ||
+        (count < state_ptr->chunk_size && end < state_ptr->vertex_num)) {
+        return true;
+    }
+    state_ptr->vertices.resize(count);
+    state_ptr->normals.resize(state_ptr->normal_num > 0 ? count : 0);
+    state_ptr->colors.resize(state_ptr->color_num > 0 ? count : 0);
+    try {
+        (*state_ptr->on_vertices)(state_ptr->vertices, state_ptr->normals,
+                                  state_ptr->colors);
+    } catch (const std::exception &e) {
+        state_ptr->error = e.what();
+        return false;
+    }
+    state_ptr->chunk_begin = end;
+    state_ptr->vertices.resize(state_ptr->chunk_size);
+    state_ptr->normals.resize(state_ptr->normal_num > 0 ? state_ptr->chunk_size
+                                                        : 0);
+    state_ptr->colors.resize(state_ptr->color_num > 0 ? state_ptr->chunk_size
+                                                      : 0);
+    return true;
+}
+
+bool FlushTriangles(PLYReaderState *state_ptr) {
+    if (state_ptr->triangles.empty()) {
+        return true;
+    }
+    try {
+        (*state_ptr->on_triangles)(state_ptr->triangles);
+    } catch (const std::exception &e) {
+        state_ptr->error = e.what();
+        return false;
+    }
+    state_ptr->triangles.clear();
+    return true;
+}
+
+int ReadVertexCallback(p_ply_argument argument) {
+    PLYReaderState *state_ptr;
+    long index;
+    ply_get_argument_user_data(argument, reinterpret_cast<void **>(&state_ptr),
+                               &index);
+    if (state_ptr->vertex_index >= state_ptr->vertex_num) {
+        return 0;
+    }
+
+    double value = ply_get_argument_value(argument);
+    state_ptr->vertices[state_ptr->vertex_index - state_ptr->chunk_begin](
+            index) = value;
+    if (index == 2) {  // reading 'z'
+        state_ptr->vertex_index++;
+        ++(*state_ptr->progress_bar);
+        return FlushVertices(state_ptr);
+    }
+    return 1;
+}
+
+int ReadNormalCallback(p_ply_argument argument) {
+    PLYReaderState *state_ptr;
+    long index;
+    ply_get_argument_user_data(argument, reinterpret_cast<void **>(&state_ptr),
+                               &index);
+    if (state_ptr->normal_index >= state_ptr->normal_num) {
+        return 0;
+    }
+
+    double value = ply_get_argument_value(argument);
+    state_ptr->normals[state_ptr->normal_index - state_ptr->chunk_begin](
+            index) = value;
+    if (index == 2) {  // reading 'nz'
+        state_ptr->normal_index++;
+        return FlushVertices(state_ptr);
+    }
+    return 1;
+}
+
+int ReadColorCallback(p_ply_argument argument) {
+    PLYReaderState *state_ptr;
+    long index;
+    ply_get_argument_user_data(argument, reinterpret_cast<void **>(&state_ptr),
+                               &index);
+    if (state_ptr->color_index >= state_ptr->color_num) {
+        return 0;
+    }
+
+    double value = ply_get_argument_value(argument);
+    state_ptr->colors[state_ptr->color_index - state_ptr->chunk_begin](index) =
+            value / 255.0;
+    if (index == 2) {  // reading 'blue'
+        state_ptr->color_index++;
+        return FlushVertices(state_ptr);
+    }
+    return 1;
+}
+
+int ReadFaceCallBack(p_ply_argument argument) {
+    PLYReaderState *state_ptr;
+    long dummy, length, index;
+    ply_get_argument_user_data(argument, reinterpret_cast<void **>(&state_ptr),
+                               &dummy);
+    double value = ply_get_argument_value(argument);
+    if (state_ptr->face_index >= state_ptr->face_num) {
+        return 0;
+    }
+    if (state_ptr->chunk_begin < state_ptr->vertex_num) {
+        state_ptr->error = "faces must follow the vertices in the file.";
+        return 0;
+    }
+
+    ply_get_argument_property(argument, NULL, &length, &index);
+    if (index == -1) {
+        state_ptr->face.clear();
+    } else {
+        state_ptr->face.push_back(int(value));
+    }
+    if (long(state_ptr->face.size()) == length) {
+        // Triangle fan of the polygon.
+        for (long i = 2; i < length; ++i) {
+            state_ptr->triangles.emplace_back(state_ptr->face[0],
+                                              state_ptr->face[i - 1],
+                                              state_ptr->face[i]);
+        }
+        state_ptr->face_index++;
+        ++(*state_ptr->progress_bar);
+        if (long(state_ptr->triangles.size()) >= state_ptr->chunk_size) {
+            return FlushTriangles(state_ptr);
+        }
+    }
+    return 1;
+}
+
+}  // namespace ply_trianglemesh_chunk_reader
+
 namespace ply_lineset_reader {
 
 struct PLYReaderState {
@@ -608,6 +776,86 @@ bool ReadTriangleMeshFromPLY(const std::string &filename,
     return true;
 }
 
+bool ReadTriangleMeshInChunksFromPLY(
+        const std::string &filename,
+        const TriangleMeshVerticesCallback &on_vertices,
+        const TriangleMeshTrianglesCallback &on_triangles,
+        int chunk_size,
+        bool print_progress) {
+    using namespace ply_trianglemesh_chunk_reader;
+
+    p_ply ply_file = ply_open(filename.c_str(), NULL, 0, NULL);
+    if (!ply_file) {
+        utility::LogWarning("Read PLY failed: unable to open file: {}",
+                            filename);
+        return false;
+    }
+    if (!ply_read_header(ply_file)) {
+        utility::LogWarning("Read PLY failed: unable to parse header.");
+        ply_close(ply_file);
+        return false;
+    }
+
+    PLYReaderState state;
+    state.on_vertices = &on_vertices;
+    state.on_triangles = &on_triangles;
+    state.chunk_size = chunk_size;
+    state.vertex_num = ply_set_read_cb(ply_file, "vertex", "x",
+                                       ReadVertexCallback, &state, 0);
+    ply_set_read_cb(ply_file, "vertex", "y", ReadVertexCallback, &state, 1);
+    ply_set_read_cb(ply_file, "vertex", "z", ReadVertexCallback, &state, 2);
+
+    state.normal_num = ply_set_read_cb(ply_file, "vertex", "nx",
+                                       ReadNormalCallback, &state, 0);
+    ply_set_read_cb(ply_file, "vertex", "ny", ReadNormalCallback, &state, 1);
+    ply_set_read_cb(ply_file, "vertex", "nz", ReadNormalCallback, &state, 2);
+
+    state.color_num = ply_set_read_cb(ply_file, "vertex", "red",
+                                      ReadColorCallback, &state, 0);
+    ply_set_read_cb(ply_file, "vertex", "green", ReadColorCallback, &state, 1);
+    ply_set_read_cb(ply_file, "vertex", "blue", ReadColorCallback, &state, 2);
+
+    if (state.vertex_num <= 0) {
+        utility::LogWarning("Read PLY failed: number of vertex <= 0.");
+        ply_close(ply_file);
+        return false;
+    }
+
+    state.face_num = ply_set_read_cb(ply_file, "face", "vertex_indices",
+                                     ReadFaceCallBack, &state, 0);
+    if (state.face_num == 0) {
+        state.face_num = ply_set_read_cb(ply_file, "face", "vertex_index",
+                                         ReadFaceCallBack, &state, 0);
+    }
+
+    state.vertex_index = 0;
+    state.normal_index = 0;
+    state.color_index = 0;
+    state.face_index = 0;
+    state.chunk_begin = 0;
+    state.vertices.resize(chunk_size);
+    state.normals.resize(state.normal_num > 0 ? chunk_size : 0);
+    state.colors.resize(state.color_num > 0 ? chunk_size : 0);
+
+    utility::ConsoleProgressBar progress_bar(state.vertex_num + state.face_num,
+                                             "Reading PLY: ", print_progress);
+    state.progress_bar = &progress_bar;
+
+    if (!ply_read(ply_file) || !FlushTriangles(&state)) {
+        if (state.error.empty()) {
+            utility::LogWarning("Read PLY failed: unable to read file: {}",
+                                filename);
+        } else {
+            utility::LogWarning("Read PLY failed: {}", state.error);
+        }
+        ply_close(ply_file);
+        return false;
+    }
+
+    ply_close(ply_file);
+    return true;
+}
+
 bool WriteTriangleMeshToPLY(const std::string &filename,
                             const geometry::TriangleMesh &mesh,
                             bool write_ascii /* = false*/,
@@ -29,6 +29,7 @@
 #include <Eigen/Dense>
 
 #include "open3d/geometry/KDTreeFlann.h"
+#include "open3d/geometry/NeighborGraph.h"
 #include "open3d/geometry/PointCloud.h"
 #include "open3d/utility/Console.h"
 
@@ -70,9 +71,26 @@ static Eigen::Vector4d ComputePairFeatures(const Eigen::Vector3d &p1,
     return result;
 }
 
+/// Neighbors of point i, read from the neighbor graph if there is one.
+static int SearchNeighbors(
+        const geometry::PointCloud &input,
+        const geometry::KDTreeFlann &kdtree,
+        const std::shared_ptr<geometry::NeighborGraph> &neighbor_graph,
+        const geometry::KDTreeSearchParam &search_param,
+        int i,
+        std::vector<int> &indices,
+        std::vector<double> &distance2) {
+    if (neighbor_graph) {
+        return neighbor_graph->GetNeighbors(i, search_param, indices,
+                                            distance2);
+    }
+    return kdtree.Search(input.points_[i], search_param, indices, distance2);
+}
+
 static std::shared_ptr<Feature> ComputeSPFHFeature(
         const geometry::PointCloud &input,
         const geometry::KDTreeFlann &kdtree,
+        const std::shared_ptr<geometry::NeighborGraph> &neighbor_graph,
         const geometry::KDTreeSearchParam &search_param) {
     auto feature = std::make_shared<Feature>();
     feature->Resize(33, (int)input.points_.size());
@@ -82,7 +100,8 @@ static std::shared_ptr<Feature> ComputeSPFHFeature(
         const auto &normal = input.normals_[i];
         std::vector<int> indices;
         std::vector<double> distance2;
-        if (kdtree.Search(point, search_param, indices, distance2) > 1) {
+        if (SearchNeighbors(input, kdtree, neighbor_graph, search_param, i,
+                            indices, distance2) > 1) {
             // only compute SPFH feature when a point has neighbors
             double hist_incr = 100.0 / (double)(indices.size() - 1);
             for (size_t k = 1; k < indices.size(); k++) {
@@ -111,7 +130,9 @@ static std::shared_ptr<Feature> ComputeSPFHFeature(
 std::shared_ptr<Feature> ComputeFPFHFeature(
         const geometry::PointCloud &input,
         const geometry::KDTreeSearchParam
-                &search_param /* = geometry::KDTreeSearchParamKNN()*/) {
+                &search_param /* = geometry::KDTreeSearchParamKNN()*/,
+        const std::shared_ptr<geometry::NeighborGraph> neighbor_graph
+        /* = nullptr */) {
     auto feature = std::make_shared<Feature>();
     feature->Resize(33, (int)input.points_.size());
     if (!input.HasNormals()) {
@@ -119,14 +140,20 @@ std::shared_ptr<Feature> ComputeFPFHFeature(
                 "[ComputeFPFHFeature] Failed because input point cloud has no "
                 "normal.");
     }
-    geometry::KDTreeFlann kdtree(input);
-    auto spfh = ComputeSPFHFeature(input, kdtree, search_param);
+    geometry::KDTreeFlann kdtree;
+    if (neighbor_graph) {
+        neighbor_graph->AssertCovers(input.points_.size(), search_param,
+                                     "ComputeFPFHFeature");
+    } else {
+        kdtree.SetGeometry(input);
+    }
+    auto spfh = ComputeSPFHFeature(input, kdtree, neighbor_graph, search_param);
 #pragma omp parallel for schedule(static)
     for (int i = 0; i < (int)input.points_.size(); i++) {
-        const auto &point = input.points_[i];
         std::vector<int> indices;
         std::vector<double> distance2;
-        if (kdtree.Search(point, search_param, indices, distance2) > 1) {
+        if (SearchNeighbors(input, kdtree, neighbor_graph, search_param, i,
+                            indices, distance2) > 1) {
             double sum[3] = {0.0, 0.0, 0.0};
             for (size_t k = 1; k < indices.size(); k++) {
                 // skip the point itself
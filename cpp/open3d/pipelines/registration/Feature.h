@@ -35,8 +35,9 @@
 namespace open3d {
 
 namespace geometry {
+class NeighborGraph;
 class PointCloud;
-}
+}  // namespace geometry
 
 namespace pipelines {
 namespace registration {
@@ -68,10 +69,14 @@ public:
 ///
 /// \param input The Input point cloud.
 /// \param search_param KDTree KNN search parameter.
+/// \param neighbor_graph Optional NeighborGraph of the input point cloud,
+/// covering \p search_param, used instead of searching a KDTree.
 std::shared_ptr<Feature> ComputeFPFHFeature(
         const geometry::PointCloud &input,
         const geometry::KDTreeSearchParam &search_param =
-                geometry::KDTreeSearchParamKNN());
+                geometry::KDTreeSearchParamKNN(),
+        const std::shared_ptr<geometry::NeighborGraph> neighbor_graph =
+                nullptr);
 
 }  // namespace registration
 }  // namespace pipelines
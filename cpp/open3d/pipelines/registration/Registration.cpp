@@ -242,7 +242,9 @@ RegistrationResult RegistrationRANSACBasedOnFeatureMatching(
         const std::vector<std::reference_wrapper<const CorrespondenceChecker>>
                 &checkers /* = {}*/,
         const RANSACConvergenceCriteria &criteria
-        /* = RANSACConvergenceCriteria()*/) {
+        /* = RANSACConvergenceCriteria()*/,
+        const geometry::KDTreeIndexParam &feature_index_param
+        /* = geometry::KDTreeIndexParam()*/) {
     if (ransac_n < 3 || max_correspondence_distance <= 0.0) {
         return RegistrationResult();
     }
@@ -253,11 +255,13 @@ RegistrationResult RegistrationRANSACBasedOnFeatureMatching(
     int num_similar_features = 1;
     std::vector<std::vector<int>> similar_features(source.points_.size());
 
+    // The KDTrees are only queried, so they are shared by all threads.
+    geometry::KDTreeFlann kdtree(target);
+    geometry::KDTreeFlann kdtree_feature(target_feature, feature_index_param);
+
 #pragma omp parallel
     {
         CorrespondenceSet ransac_corres(ransac_n);
-        geometry::KDTreeFlann kdtree(target);
-        geometry::KDTreeFlann kdtree_feature(target_feature);
         RegistrationResult result_private;
 
 #pragma omp for nowait
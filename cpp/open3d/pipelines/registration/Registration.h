@@ -30,6 +30,7 @@
 #include <tuple>
 #include <vector>
 
+#include "open3d/geometry/KDTreeSearchParam.h"
 #include "open3d/pipelines/registration/CorrespondenceChecker.h"
 #include "open3d/pipelines/registration/TransformationEstimation.h"
 #include "open3d/utility/Eigen.h"
@@ -196,6 +197,8 @@ RegistrationResult RegistrationRANSACBasedOnCorrespondence(
 /// \param max_correspondence_distance Maximum correspondence points-pair
 /// distance. \param ransac_n Fit ransac with `ransac_n` correspondences. \param
 /// checkers Correspondence checker. \param criteria Convergence criteria.
+/// \param feature_index_param Index parameters of the KDTree used for feature
+/// matching. Use a randomized KDTree forest for approximate matching.
 RegistrationResult RegistrationRANSACBasedOnFeatureMatching(
         const geometry::PointCloud &source,
         const geometry::PointCloud &target,
@@ -207,8 +210,9 @@ RegistrationResult RegistrationRANSACBasedOnFeatureMatching(
         int ransac_n = 4,
         const std::vector<std::reference_wrapper<const CorrespondenceChecker>>
                 &checkers = {},
-        const RANSACConvergenceCriteria &criteria =
-                RANSACConvergenceCriteria());
+        const RANSACConvergenceCriteria &criteria = RANSACConvergenceCriteria(),
+        const geometry::KDTreeIndexParam &feature_index_param =
+                geometry::KDTreeIndexParam());
 
 /// \param source The source point cloud.
 /// \param target The target point cloud.
@@ -34,6 +34,7 @@
 #include "open3d/core/ShapeUtil.h"
 #include "open3d/core/Tensor.h"
 #include "open3d/core/TensorList.h"
+#include "open3d/geometry/MortonCode.h"
 
 namespace open3d {
 namespace t {
@@ -101,6 +102,36 @@ PointCloud &PointCloud::Rotate(const core::Tensor &R,
     return *this;
 }
 
+core::Tensor PointCloud::SortByMortonCode() {
+    const core::Tensor points =
+            GetPoints().AsTensor().Copy(core::Device("CPU:0")).Contiguous();
+    const int64_t num_points = points.GetShape()[0];
+    std::vector<int64_t> order;
+    if (points.GetDtype() == core::Dtype::Float32) {
+        order = open3d::geometry::MortonCode::ComputeOrder(
+                static_cast<const float *>(points.GetDataPtr()), num_points);
+    } else if (points.GetDtype() == core::Dtype::Float64) {
+        order = open3d::geometry::MortonCode::ComputeOrder(
+                static_cast<const double *>(points.GetDataPtr()), num_points);
+    } else {
+        utility::LogError("Unsupported dtype {} of points.",
+                          points.GetDtype().ToString());
+    }
+    core::Tensor permutation(order, {num_points}, core::Dtype::Int64);
+    if (num_points == 0) {
+        return permutation;
+    }
+
+    const core::Tensor permutation_device = permutation.Copy(device_);
+    for (auto &kv : point_attr_) {
+        // Assigning to the rvalue view copies the values in place, so that the
+        // TensorList keeps its buffer and stays resizable.
+        kv.second.AsTensor() =
+                kv.second.AsTensor().IndexGet({permutation_device});
+    }
+    return permutation;
+}
+
 geometry::PointCloud PointCloud::FromLegacyPointCloud(
         const open3d::geometry::PointCloud &pcd_legacy,
         core::Dtype dtype,
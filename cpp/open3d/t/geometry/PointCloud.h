@@ -260,6 +260,15 @@ public:
     /// Rotate points and normals (if exist).
     PointCloud &Rotate(const core::Tensor &R, const core::Tensor &center);
 
+    /// Reorder points and all point attributes along a Morton (Z-order)
+    /// curve, so that points close in space are close in memory. Codes are
+    /// computed on CPU, attributes are gathered on the device of the point
+    /// cloud.
+    ///
+    /// \return Int64 Tensor of shape {n,}, on CPU, such that the i-th point of
+    /// the sorted point cloud is the permutation[i]-th original point.
+    core::Tensor SortByMortonCode();
+
     core::Device GetDevice() const { return device_; }
 
     /// Create a PointCloud from a legacy Open3D PointCloud.
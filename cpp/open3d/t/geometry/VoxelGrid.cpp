@@ -0,0 +1,760 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+#include "open3d/t/geometry/VoxelGrid.h"
+
+#include <Eigen/Core>
+#include <algorithm>
+#include <cmath>
+#include <cstring>
+#include <limits>
+#include <numeric>
+
+#include "open3d/camera/PinholeCameraParameters.h"
+#include "open3d/core/Dispatch.h"
+#include "open3d/geometry/Image.h"
+#include "open3d/t/geometry/PointCloud.h"
+
+namespace open3d {
+namespace t {
+namespace geometry {
+
+namespace {
+
+void CheckColorDtype(core::Dtype color_dtype) {
+    if (color_dtype != core::Dtype::UInt8 &&
+        color_dtype != core::Dtype::Float32 &&
+        color_dtype != core::Dtype::Float64) {
+        utility::LogError(
+                "[VoxelGrid] Unsupported color dtype {}, expected UInt8, "
+                "Float32 or Float64.",
+                color_dtype.ToString());
+    }
+}
+
+void CheckShape(const core::Tensor &tensor, const std::string &name) {
+    if (tensor.NumDims() != 2 || tensor.GetShape()[1] != 3) {
+        utility::LogError("[VoxelGrid] {} must have shape {{n, 3}}, got {}.",
+                          name, tensor.GetShape().ToString());
+    }
+}
+
+/// Conversion between the double precision colors of geometry::VoxelGrid and
+/// the stored colors.
+template <typename scalar_t>
+struct ColorConverter {
+    static scalar_t FromDouble(double color) {
+        return static_cast<scalar_t>(color);
+    }
+    static double ToDouble(scalar_t color) {
+        return static_cast<double>(color);
+    }
+};
+
+template <>
+struct ColorConverter<uint8_t> {
+    static uint8_t FromDouble(double color) {
+        return static_cast<uint8_t>(
+                std::round(std::min(std::max(color, 0.0), 1.0) * 255.0));
+    }
+    static double ToDouble(uint8_t color) { return color / 255.0; }
+};
+
+// Grid indices of the points, as geometry::VoxelGrid::GetVoxel.
+template <typename scalar_t>
+void ComputeGridIndices(const scalar_t *points,
+                        int64_t num_points,
+                        const Eigen::Vector3d &origin,
+                        double voxel_size,
+                        int32_t *grid_indices) {
+#pragma omp parallel for schedule(static)
+    for (int64_t pidx = 0; pidx < num_points; ++pidx) {
+        for (int d = 0; d < 3; ++d) {
+            const double coord = static_cast<double>(points[3 * pidx + d]);
+            grid_indices[3 * pidx + d] = static_cast<int32_t>(
+                    std::floor((coord - origin(d)) / voxel_size));
+        }
+    }
+}
+
+// Average color of the points of every voxel, points of voxel i are
+// voxel_points[offsets[i]:offsets[i + 1]].
+template <typename scalar_t>
+void AverageColors(const double *point_colors,
+                   const std::vector<int64_t> &offsets,
+                   const std::vector<int64_t> &voxel_points,
+                   scalar_t *colors) {
+    const int64_t num_voxels = int64_t(offsets.size()) - 1;
+#pragma omp parallel for schedule(static)
+    for (int64_t vidx = 0; vidx < num_voxels; ++vidx) {
+        Eigen::Vector3d color(0, 0, 0);
+        for (int64_t k = offsets[vidx]; k < offsets[vidx + 1]; ++k) {
+            color += Eigen::Vector3d(point_colors[3 * voxel_points[k]],
+                                     point_colors[3 * voxel_points[k] + 1],
+                                     point_colors[3 * voxel_points[k] + 2]);
+        }
+        color /= double(offsets[vidx + 1] - offsets[vidx]);
+        for (int d = 0; d < 3; ++d) {
+            colors[3 * vidx + d] =
+                    ColorConverter<scalar_t>::FromDouble(color(d));
+        }
+    }
+}
+
+template <typename scalar_t>
+void FromLegacyVoxels(
+        const std::vector<const open3d::geometry::Voxel *> &voxels,
+        int32_t *grid_indices,
+        scalar_t *colors) {
+#pragma omp parallel for schedule(static)
+    for (int64_t vidx = 0; vidx < int64_t(voxels.size()); ++vidx) {
+        for (int d = 0; d < 3; ++d) {
+            grid_indices[3 * vidx + d] = voxels[vidx]->grid_index_(d);
+            colors[3 * vidx + d] = ColorConverter<scalar_t>::FromDouble(
+                    voxels[vidx]->color_(d));
+        }
+    }
+}
+
+template <typename scalar_t>
+void ToLegacyVoxels(const int32_t *grid_indices,
+                    const scalar_t *colors,
+                    std::vector<open3d::geometry::Voxel> &voxels) {
+#pragma omp parallel for schedule(static)
+    for (int64_t vidx = 0; vidx < int64_t(voxels.size()); ++vidx) {
+        for (int d = 0; d < 3; ++d) {
+            voxels[vidx].grid_index_(d) = grid_indices[3 * vidx + d];
+            voxels[vidx].color_(d) =
+                    ColorConverter<scalar_t>::ToDouble(colors[3 * vidx + d]);
+        }
+    }
+}
+
+// The row table maps a grid index to its row with open addressing and linear
+// probing. A slot holds a row of the grid indices, kEmptySlot or kDeletedSlot,
+// so that every grid index is only stored once, in the grid indices. The
+// number of used and deleted slots is at most half the number of slots.
+constexpr int32_t kEmptySlot = -1;
+constexpr int32_t kDeletedSlot = -2;
+constexpr int64_t kMinNumSlots = 16;
+
+inline uint64_t HashGridIndex(const int32_t *key) {
+    uint64_t hash = (uint64_t(uint32_t(key[0])) * 73856093) ^
+                    (uint64_t(uint32_t(key[1])) * 19349669) ^
+                    (uint64_t(uint32_t(key[2])) * 83492791);
+    // Finalizer of MurmurHash3, the slot is taken from the low bits.
+    hash ^= hash >> 33;
+    hash *= 0xff51afd7ed558ccdULL;
+    hash ^= hash >> 33;
+    return hash;
+}
+
+inline bool GridIndexEqual(const int32_t *a, const int32_t *b) {
+    return a[0] == b[0] && a[1] == b[1] && a[2] == b[2];
+}
+
+// Returns the row of key, -1 if it is not in the table. key_at(row) returns
+// the grid index of a row.
+template <typename KeyAt>
+int32_t FindRow(const std::vector<int32_t> &table,
+                const KeyAt &key_at,
+                const int32_t *key) {
+    if (table.empty()) {
+        return -1;
+    }
+    const uint64_t mask = table.size() - 1;
+    for (uint64_t slot = HashGridIndex(key) & mask;; slot = (slot + 1) & mask) {
+        const int32_t row = table[slot];
+        if (row == kEmptySlot) {
+            return -1;
+        }
+        if (row >= 0 && GridIndexEqual(key_at(row), key)) {
+            return row;
+        }
+    }
+}
+
+// Refills the table with the rows [0, num_rows), whose grid indices are
+// unique, with room for at least min_rows rows. Deleted slots are dropped.
+template <typename KeyAt>
+void FillRowTable(std::vector<int32_t> &table,
+                  int64_t &num_deleted,
+                  int64_t num_rows,
+                  int64_t min_rows,
+                  const KeyAt &key_at) {
+    int64_t num_slots = kMinNumSlots;
+    while (num_slots < 2 * std::max(num_rows, min_rows)) {
+        num_slots *= 2;
+    }
+    table.assign(num_slots, kEmptySlot);
+    table.shrink_to_fit();
+    num_deleted = 0;
+    const uint64_t mask = num_slots - 1;
+    for (int64_t row = 0; row < num_rows; ++row) {
+        uint64_t slot = HashGridIndex(key_at(row)) & mask;
+        while (table[slot] != kEmptySlot) {
+            slot = (slot + 1) & mask;
+        }
+        table[slot] = static_cast<int32_t>(row);
+    }
+}
+
+// Returns the row of key. If it is not in the table, it is inserted with row
+// num_rows, which is returned, and the caller must make key_at(num_rows)
+// return key. The table grows by doubling.
+template <typename KeyAt>
+int32_t FindOrInsertRow(std::vector<int32_t> &table,
+                        int64_t &num_deleted,
+                        int64_t num_rows,
+                        const KeyAt &key_at,
+                        const int32_t *key) {
+    if (2 * (num_rows + num_deleted + 1) > int64_t(table.size())) {
+        FillRowTable(table, num_deleted, num_rows, num_rows + 1, key_at);
+    }
+    const uint64_t mask = table.size() - 1;
+    int64_t free_slot = -1;
+    for (uint64_t slot = HashGridIndex(key) & mask;; slot = (slot + 1) & mask) {
+        const int32_t row = table[slot];
+        if (row == kEmptySlot) {
+            if (free_slot < 0) {
+                free_slot = int64_t(slot);
+            } else {
+                --num_deleted;
+            }
+            break;
+        }
+        if (row == kDeletedSlot) {
+            if (free_slot < 0) {
+                free_slot = int64_t(slot);
+            }
+        } else if (GridIndexEqual(key_at(row), key)) {
+            return row;
+        }
+    }
+    table[free_slot] = static_cast<int32_t>(num_rows);
+    return static_cast<int32_t>(num_rows);
+}
+
+// Rows of the grid indices, -1 for grid indices without voxel.
+template <typename KeyAt>
+std::vector<int32_t> FindRows(const std::vector<int32_t> &table,
+                              const KeyAt &key_at,
+                              const int32_t *grid_indices,
+                              int64_t count) {
+    std::vector<int32_t> rows(count);
+#pragma omp parallel for schedule(static)
+    for (int64_t i = 0; i < count; ++i) {
+        rows[i] = FindRow(table, key_at, grid_indices + 3 * i);
+    }
+    return rows;
+}
+
+// Returns for every voxel whether it is kept by a carving step. A voxel is
+// kept if one of its boundary points projects to a pixel for which keep(z, d)
+// holds, with z the depth of the point and d the pixel value, or outside of
+// the image if keep_voxels_outside_image is true.
+template <typename KeepFunction>
+std::vector<uint8_t> ComputeCarveMask(
+        const int32_t *grid_indices,
+        int64_t num_voxels,
+        double voxel_size,
+        const Eigen::Vector3d &origin,
+        const open3d::geometry::Image &image,
+        const camera::PinholeCameraParameters &camera_parameter,
+        bool keep_voxels_outside_image,
+        const KeepFunction &keep) {
+    const Eigen::Matrix3d rot = camera_parameter.extrinsic_.block<3, 3>(0, 0);
+    const Eigen::Vector3d trans = camera_parameter.extrinsic_.block<3, 1>(0, 3);
+    const Eigen::Matrix3d intrinsic =
+            camera_parameter.intrinsic_.intrinsic_matrix_;
+    const double r = voxel_size / 2.0;
+
+    std::vector<uint8_t> mask(num_voxels);
+#pragma omp parallel for schedule(static)
+    for (int64_t vidx = 0; vidx < num_voxels; ++vidx) {
+        const Eigen::Vector3d center =
+                ((Eigen::Vector3d(grid_indices[3 * vidx],
+                                  grid_indices[3 * vidx + 1],
+                                  grid_indices[3 * vidx + 2]) +
+                  Eigen::Vector3d(0.5, 0.5, 0.5)) *
+                 voxel_size) +
+                origin;
+        bool carve = true;
+        for (int corner = 0; corner < 8 && carve; ++corner) {
+            const Eigen::Vector3d x =
+                    center + Eigen::Vector3d(corner & 4 ? r : -r,
+                                             corner & 2 ? r : -r,
+                                             corner & 1 ? r : -r);
+            const Eigen::Vector3d uvz = intrinsic * (rot * x + trans);
+            const double z = uvz(2);
+            const double u = uvz(0) / z;
+            const double v = uvz(1) / z;
+            bool within_boundary;
+            double d;
+            std::tie(within_boundary, d) = image.FloatValueAt(u, v);
+            if ((!within_boundary && keep_voxels_outside_image) ||
+                (within_boundary && keep(z, d))) {
+                carve = false;
+            }
+        }
+        mask[vidx] = carve ? 0 : 1;
+    }
+    return mask;
+}
+
+}  // namespace
+
+VoxelGrid::VoxelGrid(double voxel_size,
+                     const Eigen::Vector3d &origin,
+                     core::Dtype color_dtype,
+                     const core::Device &device)
+    : Geometry(Geometry::GeometryType::VoxelGrid, 3),
+      voxel_size_(voxel_size),
+      origin_(origin),
+      color_dtype_(color_dtype),
+      device_(device),
+      grid_indices_({0, 3}, core::Dtype::Int32, device),
+      colors_({0, 3}, color_dtype, device) {
+    if (device.GetType() != core::Device::DeviceType::CPU) {
+        utility::LogError("[VoxelGrid] Unsupported device {}.",
+                          device.ToString());
+    }
+    CheckColorDtype(color_dtype);
+}
+
+VoxelGrid::VoxelGrid(const VoxelGrid &other)
+    : Geometry(Geometry::GeometryType::VoxelGrid, 3),
+      voxel_size_(other.voxel_size_),
+      origin_(other.origin_),
+      color_dtype_(other.color_dtype_),
+      device_(other.device_),
+      grid_indices_(other.grid_indices_.Copy()),
+      colors_(other.colors_.Copy()),
+      row_table_(other.row_table_),
+      num_deleted_slots_(other.num_deleted_slots_) {}
+
+VoxelGrid &VoxelGrid::operator=(const VoxelGrid &other) {
+    if (this != &other) {
+        voxel_size_ = other.voxel_size_;
+        origin_ = other.origin_;
+        color_dtype_ = other.color_dtype_;
+        device_ = other.device_;
+        grid_indices_ = other.grid_indices_.Copy();
+        colors_ = other.colors_.Copy();
+        row_table_ = other.row_table_;
+        num_deleted_slots_ = other.num_deleted_slots_;
+    }
+    return *this;
+}
+
+VoxelGrid &VoxelGrid::Clear() {
+    grid_indices_ = core::Tensor({0, 3}, core::Dtype::Int32, device_);
+    colors_ = core::Tensor({0, 3}, color_dtype_, device_);
+    row_table_.clear();
+    row_table_.shrink_to_fit();
+    num_deleted_slots_ = 0;
+    return *this;
+}
+
+void VoxelGrid::RebuildRowTable() {
+    const int32_t *grid_indices =
+            static_cast<const int32_t *>(grid_indices_.GetDataPtr());
+    FillRowTable(
+            row_table_, num_deleted_slots_, GetSize(), GetSize(),
+            [grid_indices](int64_t row) { return grid_indices + 3 * row; });
+}
+
+void VoxelGrid::SelectByMask(const std::vector<uint8_t> &mask) {
+    const int64_t num_voxels = GetSize();
+    std::vector<int32_t> new_rows(num_voxels);
+    int32_t num_kept = 0;
+    for (int64_t vidx = 0; vidx < num_voxels; ++vidx) {
+        new_rows[vidx] = mask[vidx] ? num_kept++ : -1;
+    }
+    if (num_kept == num_voxels) {
+        return;
+    }
+
+    core::Tensor grid_indices({num_kept, 3}, core::Dtype::Int32, device_);
+    core::Tensor colors({num_kept, 3}, color_dtype_, device_);
+    const int32_t *src_grid_indices =
+            static_cast<const int32_t *>(grid_indices_.GetDataPtr());
+    int32_t *dst_grid_indices =
+            static_cast<int32_t *>(grid_indices.GetDataPtr());
+    const uint8_t *src_colors =
+            static_cast<const uint8_t *>(colors_.GetDataPtr());
+    uint8_t *dst_colors = static_cast<uint8_t *>(colors.GetDataPtr());
+    const int64_t color_bytes = 3 * color_dtype_.ByteSize();
+#pragma omp parallel for schedule(static)
+    for (int64_t vidx = 0; vidx < num_voxels; ++vidx) {
+        const int64_t row = new_rows[vidx];
+        if (row >= 0) {
+            std::memcpy(dst_grid_indices + 3 * row, src_grid_indices + 3 * vidx,
+                        3 * sizeof(int32_t));
+            std::memcpy(dst_colors + color_bytes * row,
+                        src_colors + color_bytes * vidx, color_bytes);
+        }
+    }
+    grid_indices_ = grid_indices;
+    colors_ = colors;
+
+    // Renumber the rows in place, the slots of removed voxels are marked as
+    // deleted. Only when most of the table is unused, it is rebuilt smaller.
+    const int64_t num_slots = int64_t(row_table_.size());
+#pragma omp parallel for schedule(static)
+    for (int64_t slot = 0; slot < num_slots; ++slot) {
+        const int32_t row = row_table_[slot];
+        if (row >= 0) {
+            row_table_[slot] =
+                    new_rows[row] >= 0 ? new_rows[row] : kDeletedSlot;
+        }
+    }
+    num_deleted_slots_ += num_voxels - num_kept;
+    if (8 * int64_t(num_kept) < num_slots && num_slots > kMinNumSlots) {
+        RebuildRowTable();
+    }
+}
+
+core::Tensor VoxelGrid::GetVoxelIndices(const core::Tensor &points) const {
+    CheckShape(points, "points");
+    const core::Tensor points_contiguous = points.Contiguous();
+    const int64_t num_points = points.GetShape()[0];
+    core::Tensor grid_indices({num_points, 3}, core::Dtype::Int32, device_);
+    if (points.GetDtype() == core::Dtype::Float32) {
+        ComputeGridIndices(
+                static_cast<const float *>(points_contiguous.GetDataPtr()),
+                num_points, origin_, voxel_size_,
+                static_cast<int32_t *>(grid_indices.GetDataPtr()));
+    } else if (points.GetDtype() == core::Dtype::Float64) {
+        ComputeGridIndices(
+                static_cast<const double *>(points_contiguous.GetDataPtr()),
+                num_points, origin_, voxel_size_,
+                static_cast<int32_t *>(grid_indices.GetDataPtr()));
+    } else {
+        utility::LogError("[VoxelGrid] Unsupported dtype {} of points.",
+                          points.GetDtype().ToString());
+    }
+    return grid_indices;
+}
+
+void VoxelGrid::AddVoxels(const core::Tensor &grid_indices,
+                          const core::Tensor &colors) {
+    CheckShape(grid_indices, "grid_indices");
+    CheckShape(colors, "colors");
+    if (grid_indices.GetDtype() != core::Dtype::Int32) {
+        utility::LogError("[VoxelGrid] grid_indices must be Int32, got {}.",
+                          grid_indices.GetDtype().ToString());
+    }
+    if (colors.GetDtype() != color_dtype_) {
+        utility::LogError("[VoxelGrid] colors must be {}, got {}.",
+                          color_dtype_.ToString(),
+                          colors.GetDtype().ToString());
+    }
+    const int64_t count = grid_indices.GetShape()[0];
+    if (colors.GetShape()[0] != count) {
+        utility::LogError(
+                "[VoxelGrid] grid_indices and colors differ in length ({} vs "
+                "{}).",
+                count, colors.GetShape()[0]);
+    }
+    const core::Tensor keys = grid_indices.Contiguous();
+    const core::Tensor values = colors.Contiguous();
+    const int32_t *keys_ptr = static_cast<const int32_t *>(keys.GetDataPtr());
+
+    // Grid indices of new voxels are collected in new_keys, the table refers
+    // to them with rows from old_size on.
+    const int64_t old_size = GetSize();
+    const int32_t *old_keys =
+            static_cast<const int32_t *>(grid_indices_.GetDataPtr());
+    std::vector<int32_t> new_keys;
+    auto key_at = [&](int64_t row) {
+        return row < old_size ? old_keys + 3 * row
+                              : new_keys.data() + 3 * (row - old_size);
+    };
+    std::vector<int32_t> rows(count);
+    for (int64_t i = 0; i < count; ++i) {
+        const int64_t num_rows = old_size + int64_t(new_keys.size()) / 3;
+        rows[i] = FindOrInsertRow(row_table_, num_deleted_slots_, num_rows,
+                                  key_at, keys_ptr + 3 * i);
+        if (rows[i] == num_rows) {
+            new_keys.insert(new_keys.end(), keys_ptr + 3 * i,
+                            keys_ptr + 3 * i + 3);
+        }
+    }
+
+    const int64_t num_new = int64_t(new_keys.size()) / 3;
+    const int64_t new_size = old_size + num_new;
+    const int64_t color_bytes = 3 * color_dtype_.ByteSize();
+    if (num_new > 0) {
+        core::Tensor new_grid_indices({new_size, 3}, core::Dtype::Int32,
+                                      device_);
+        core::Tensor new_colors({new_size, 3}, color_dtype_, device_);
+        int32_t *new_grid_indices_ptr =
+                static_cast<int32_t *>(new_grid_indices.GetDataPtr());
+        std::memcpy(new_grid_indices_ptr, old_keys,
+                    3 * sizeof(int32_t) * old_size);
+        std::memcpy(new_grid_indices_ptr + 3 * old_size, new_keys.data(),
+                    3 * sizeof(int32_t) * num_new);
+        std::memcpy(new_colors.GetDataPtr(), colors_.GetDataPtr(),
+                    color_bytes * old_size);
+        grid_indices_ = new_grid_indices;
+        colors_ = new_colors;
+    }
+
+    // Repeated grid indices keep the last color.
+    uint8_t *dst_colors = static_cast<uint8_t *>(colors_.GetDataPtr());
+    const uint8_t *src_colors =
+            static_cast<const uint8_t *>(values.GetDataPtr());
+    for (int64_t i = 0; i < count; ++i) {
+        std::memcpy(dst_colors + color_bytes * rows[i],
+                    src_colors + color_bytes * i, color_bytes);
+    }
+}
+
+core::Tensor VoxelGrid::FindVoxels(const core::Tensor &grid_indices) const {
+    CheckShape(grid_indices, "grid_indices");
+    if (grid_indices.GetDtype() != core::Dtype::Int32) {
+        utility::LogError("[VoxelGrid] grid_indices must be Int32, got {}.",
+                          grid_indices.GetDtype().ToString());
+    }
+    const core::Tensor keys = grid_indices.Contiguous();
+    const int64_t count = grid_indices.GetShape()[0];
+    const int32_t *grid_indices_ptr =
+            static_cast<const int32_t *>(grid_indices_.GetDataPtr());
+    const std::vector<int32_t> rows = FindRows(
+            row_table_,
+            [grid_indices_ptr](int64_t row) {
+                return grid_indices_ptr + 3 * row;
+            },
+            static_cast<const int32_t *>(keys.GetDataPtr()), count);
+    return core::Tensor(std::vector<int64_t>(rows.begin(), rows.end()), {count},
+                        core::Dtype::Int64, device_);
+}
+
+core::Tensor VoxelGrid::CheckIfIncluded(const core::Tensor &queries) const {
+    const core::Tensor keys = GetVoxelIndices(queries);
+    const int64_t count = keys.GetShape()[0];
+    const int32_t *keys_ptr = static_cast<const int32_t *>(keys.GetDataPtr());
+    const int32_t *grid_indices_ptr =
+            static_cast<const int32_t *>(grid_indices_.GetDataPtr());
+    auto key_at = [grid_indices_ptr](int64_t row) {
+        return grid_indices_ptr + 3 * row;
+    };
+    core::Tensor masks({count}, core::Dtype::Bool, device_);
+    bool *masks_ptr = static_cast<bool *>(masks.GetDataPtr());
+#pragma omp parallel for schedule(static)
+    for (int64_t i = 0; i < count; ++i) {
+        masks_ptr[i] = FindRow(row_table_, key_at, keys_ptr + 3 * i) >= 0;
+    }
+    return masks;
+}
+
+VoxelGrid &VoxelGrid::CarveDepthMap(
+        const open3d::geometry::Image &depth_map,
+        const camera::PinholeCameraParameters &camera_parameter,
+        bool keep_voxels_outside_image) {
+    if (depth_map.height_ != camera_parameter.intrinsic_.height_ ||
+        depth_map.width_ != camera_parameter.intrinsic_.width_) {
+        utility::LogError(
+                "[VoxelGrid] provided depth_map dimensions are not compatible "
+                "with the provided camera_parameters");
+    }
+    SelectByMask(ComputeCarveMask(
+            static_cast<const int32_t *>(grid_indices_.GetDataPtr()), GetSize(),
+            voxel_size_, origin_, depth_map, camera_parameter,
+            keep_voxels_outside_image,
+            [](double z, double d) { return d > 0 && z >= d; }));
+    return *this;
+}
+
+VoxelGrid &VoxelGrid::CarveSilhouette(
+        const open3d::geometry::Image &silhouette_mask,
+        const camera::PinholeCameraParameters &camera_parameter,
+        bool keep_voxels_outside_image) {
+    if (silhouette_mask.height_ != camera_parameter.intrinsic_.height_ ||
+        silhouette_mask.width_ != camera_parameter.intrinsic_.width_) {
+        utility::LogError(
+                "[VoxelGrid] provided silhouette_mask dimensions are not "
+                "compatible with the provided camera_parameters");
+    }
+    SelectByMask(ComputeCarveMask(
+            static_cast<const int32_t *>(grid_indices_.GetDataPtr()), GetSize(),
+            voxel_size_, origin_, silhouette_mask, camera_parameter,
+            keep_voxels_outside_image,
+            [](double z, double d) { return d > 0; }));
+    return *this;
+}
+
+VoxelGrid VoxelGrid::CreateFromPointCloud(const PointCloud &pcd,
+                                          double voxel_size,
+                                          core::Dtype color_dtype) {
+    if (!pcd.HasPoints()) {
+        return VoxelGrid(voxel_size, Eigen::Vector3d::Zero(), color_dtype,
+                         pcd.GetDevice());
+    }
+    const std::vector<double> min_bound =
+            pcd.GetMinBound().To(core::Dtype::Float64).ToFlatVector<double>();
+    const std::vector<double> max_bound =
+            pcd.GetMaxBound().To(core::Dtype::Float64).ToFlatVector<double>();
+    const Eigen::Vector3d half_voxel(0.5 * voxel_size, 0.5 * voxel_size,
+                                     0.5 * voxel_size);
+    return CreateFromPointCloudWithinBounds(
+            pcd, voxel_size,
+            Eigen::Vector3d(min_bound[0], min_bound[1], min_bound[2]) -
+                    half_voxel,
+            Eigen::Vector3d(max_bound[0], max_bound[1], max_bound[2]) +
+                    half_voxel,
+            color_dtype);
+}
+
+VoxelGrid VoxelGrid::CreateFromPointCloudWithinBounds(
+        const PointCloud &pcd,
+        double voxel_size,
+        const Eigen::Vector3d &min_bound,
+        const Eigen::Vector3d &max_bound,
+        core::Dtype color_dtype) {
+    if (voxel_size <= 0.0) {
+        utility::LogError("[VoxelGridFromPointCloud] voxel_size <= 0.");
+    }
+    if (voxel_size * std::numeric_limits<int>::max() <
+        (max_bound - min_bound).maxCoeff()) {
+        utility::LogError("[VoxelGridFromPointCloud] voxel_size is too small.");
+    }
+    VoxelGrid voxel_grid(voxel_size, min_bound, color_dtype, pcd.GetDevice());
+    if (!pcd.HasPoints()) {
+        return voxel_grid;
+    }
+
+    // Grid index of every point, and the row of its voxel.
+    const core::Tensor keys =
+            voxel_grid.GetVoxelIndices(pcd.GetPoints().AsTensor());
+    const int32_t *keys_ptr = static_cast<const int32_t *>(keys.GetDataPtr());
+    const int64_t num_points = keys.GetShape()[0];
+    // Rows are numbered in the order of the first point of every voxel, and
+    // the table refers to the grid index of that point.
+    std::vector<int64_t> first_points;
+    auto key_at = [&](int64_t row) { return keys_ptr + 3 * first_points[row]; };
+    std::vector<int32_t> rows(num_points);
+    for (int64_t pidx = 0; pidx < num_points; ++pidx) {
+        const int64_t num_rows = int64_t(first_points.size());
+        rows[pidx] = FindOrInsertRow(voxel_grid.row_table_,
+                                     voxel_grid.num_deleted_slots_, num_rows,
+                                     key_at, keys_ptr + 3 * pidx);
+        if (rows[pidx] == num_rows) {
+            first_points.push_back(pidx);
+        }
+    }
+    const int64_t num_voxels = int64_t(first_points.size());
+
+    voxel_grid.grid_indices_ =
+            core::Tensor({num_voxels, 3}, core::Dtype::Int32, pcd.GetDevice());
+    voxel_grid.colors_ =
+            core::Tensor::Zeros({num_voxels, 3}, color_dtype, pcd.GetDevice());
+    int32_t *grid_indices_ptr =
+            static_cast<int32_t *>(voxel_grid.grid_indices_.GetDataPtr());
+#pragma omp parallel for schedule(static)
+    for (int64_t vidx = 0; vidx < num_voxels; ++vidx) {
+        std::memcpy(grid_indices_ptr + 3 * vidx,
+                    keys_ptr + 3 * first_points[vidx], 3 * sizeof(int32_t));
+    }
+
+    if (pcd.HasPointColors()) {
+        // Points of every voxel in input order, so that the average is summed
+        // in the same order as by geometry::VoxelGrid.
+        std::vector<int64_t> offsets(num_voxels + 1, 0);
+        for (int64_t pidx = 0; pidx < num_points; ++pidx) {
+            offsets[rows[pidx] + 1]++;
+        }
+        std::partial_sum(offsets.begin(), offsets.end(), offsets.begin());
+        std::vector<int64_t> voxel_points(num_points);
+        std::vector<int64_t> fill(offsets.begin(), offsets.end() - 1);
+        for (int64_t pidx = 0; pidx < num_points; ++pidx) {
+            voxel_points[fill[rows[pidx]]++] = pidx;
+        }
+
+        const core::Tensor point_colors = pcd.GetPointColors()
+                                                  .AsTensor()
+                                                  .To(core::Dtype::Float64)
+                                                  .Contiguous();
+        DISPATCH_DTYPE_TO_TEMPLATE(color_dtype, [&]() {
+            AverageColors(
+                    static_cast<const double *>(point_colors.GetDataPtr()),
+                    offsets, voxel_points,
+                    static_cast<scalar_t *>(voxel_grid.colors_.GetDataPtr()));
+        });
+    }
+    utility::LogDebug(
+            "Pointcloud is voxelized from {:d} points to {:d} voxels.",
+            num_points, num_voxels);
+    return voxel_grid;
+}
+
+VoxelGrid VoxelGrid::FromLegacyVoxelGrid(
+        const open3d::geometry::VoxelGrid &voxel_grid_legacy,
+        core::Dtype color_dtype,
+        const core::Device &device) {
+    VoxelGrid voxel_grid(voxel_grid_legacy.voxel_size_,
+                         voxel_grid_legacy.origin_, color_dtype, device);
+    const int64_t num_voxels = int64_t(voxel_grid_legacy.voxels_.size());
+    std::vector<const open3d::geometry::Voxel *> voxels;
+    voxels.reserve(num_voxels);
+    for (const auto &it : voxel_grid_legacy.voxels_) {
+        voxels.push_back(&it.second);
+    }
+
+    voxel_grid.grid_indices_ =
+            core::Tensor({num_voxels, 3}, core::Dtype::Int32, device);
+    voxel_grid.colors_ = core::Tensor({num_voxels, 3}, color_dtype, device);
+    DISPATCH_DTYPE_TO_TEMPLATE(color_dtype, [&]() {
+        FromLegacyVoxels(
+                voxels,
+                static_cast<int32_t *>(voxel_grid.grid_indices_.GetDataPtr()),
+                static_cast<scalar_t *>(voxel_grid.colors_.GetDataPtr()));
+    });
+    voxel_grid.RebuildRowTable();
+    return voxel_grid;
+}
+
+open3d::geometry::VoxelGrid VoxelGrid::ToLegacyVoxelGrid() const {
+    open3d::geometry::VoxelGrid voxel_grid_legacy;
+    voxel_grid_legacy.voxel_size_ = voxel_size_;
+    voxel_grid_legacy.origin_ = origin_;
+    const int64_t num_voxels = GetSize();
+    std::vector<open3d::geometry::Voxel> voxels(num_voxels);
+    DISPATCH_DTYPE_TO_TEMPLATE(color_dtype_, [&]() {
+        ToLegacyVoxels(static_cast<const int32_t *>(grid_indices_.GetDataPtr()),
+                       static_cast<const scalar_t *>(colors_.GetDataPtr()),
+                       voxels);
+    });
+    voxel_grid_legacy.voxels_.reserve(num_voxels);
+    for (const open3d::geometry::Voxel &voxel : voxels) {
+        voxel_grid_legacy.AddVoxel(voxel);
+    }
+    return voxel_grid_legacy;
+}
+
+}  // namespace geometry
+}  // namespace t
+}  // namespace open3d
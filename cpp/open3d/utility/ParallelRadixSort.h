@@ -0,0 +1,104 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#pragma once
+
+#include <tbb/parallel_for.h>
+
+#include <algorithm>
+#include <array>
+#include <cstdint>
+#include <vector>
+
+namespace open3d {
+namespace utility {
+
+/// \brief Stable parallel LSD radix sort of key-value pairs by 64-bit keys.
+///
+/// The input is split into fixed-size chunks, so that the result does not
+/// depend on the number of threads. Passes over 8-bit digits in which all keys
+/// are equal are skipped.
+///
+/// \param keys Keys to sort, sorted in place.
+/// \param values Values to permute together with the keys, same size as keys.
+/// \param num_key_bits Only the lowest num_key_bits bits of the keys are used.
+template <class Value>
+void ParallelRadixSort(std::vector<uint64_t>& keys,
+                       std::vector<Value>& values,
+                       int num_key_bits = 64) {
+    constexpr int kDigitBits = 8;
+    constexpr size_t kNumBuckets = size_t(1) << kDigitBits;
+    constexpr size_t kChunkSize = size_t(1) << 16;
+
+    const size_t n = keys.size();
+    const size_t num_chunks = (n + kChunkSize - 1) / kChunkSize;
+    std::vector<uint64_t> keys_tmp(n);
+    std::vector<Value> values_tmp(n);
+    std::vector<std::array<size_t, kNumBuckets>> offsets(num_chunks);
+
+    for (int shift = 0; shift < num_key_bits; shift += kDigitBits) {
+        tbb::parallel_for(size_t(0), num_chunks, [&](size_t c) {
+            std::array<size_t, kNumBuckets>& count = offsets[c];
+            count.fill(0);
+            const size_t end = std::min(n, (c + 1) * kChunkSize);
+            for (size_t i = c * kChunkSize; i < end; ++i) {
+                ++count[(keys[i] >> shift) & (kNumBuckets - 1)];
+            }
+        });
+
+        // Exclusive scan over (digit, chunk), in this order.
+        size_t sum = 0;
+        bool single_bucket = false;
+        for (size_t d = 0; d < kNumBuckets; ++d) {
+            const size_t bucket_begin = sum;
+            for (size_t c = 0; c < num_chunks; ++c) {
+                const size_t count = offsets[c][d];
+                offsets[c][d] = sum;
+                sum += count;
+            }
+            single_bucket = single_bucket || (sum - bucket_begin == n);
+        }
+        if (single_bucket) {
+            continue;
+        }
+
+        tbb::parallel_for(size_t(0), num_chunks, [&](size_t c) {
+            std::array<size_t, kNumBuckets>& offset = offsets[c];
+            const size_t end = std::min(n, (c + 1) * kChunkSize);
+            for (size_t i = c * kChunkSize; i < end; ++i) {
+                const size_t dst =
+                        offset[(keys[i] >> shift) & (kNumBuckets - 1)]++;
+                keys_tmp[dst] = keys[i];
+                values_tmp[dst] = values[i];
+            }
+        });
+        keys.swap(keys_tmp);
+        values.swap(values_tmp);
+    }
+}
+
+}  // namespace utility
+}  // namespace open3d
@@ -28,6 +28,10 @@
 
 #include <tbb/parallel_for.h>
 
+#include <algorithm>
+#include <cstdint>
+#include <vector>
+
 #include "tbb/parallel_scan.h"
 #if TBB_INTERFACE_VERSION >= 10000
 #include "pstl/execution"
@@ -75,5 +79,49 @@ void InclusivePrefixSum(const Tin* first, const Tin* last, Tout* out) {
 #endif
 }
 
+/// \brief Parallel stream compaction of the elements i in [0, n) for which
+/// \p keep(i) is true.
+///
+/// The elements are split in blocks. A first parallel pass counts the kept
+/// elements of every block, a prefix sum over the blocks gives their output
+/// offsets and \p resize(count) is called with the total. A second parallel
+/// pass calls \p copy(i, j) for every kept element i with its output
+/// position j, which preserves the order of the elements. \p keep is called
+/// twice per element and must return the same value both times.
+///
+/// \return The number of kept elements.
+template <class Keep, class Resize, class Copy>
+int64_t ParallelCompact(int64_t n, Keep keep, Resize resize, Copy copy) {
+    const int64_t block_size = 1 << 14;
+    const int64_t num_blocks = (n + block_size - 1) / block_size;
+    std::vector<int64_t> offsets(num_blocks + 1, 0);
+#pragma omp parallel for schedule(static)
+    for (int64_t block = 0; block < num_blocks; ++block) {
+        const int64_t end = std::min(n, (block + 1) * block_size);
+        int64_t count = 0;
+        for (int64_t i = block * block_size; i < end; ++i) {
+            if (keep(i)) {
+                count++;
+            }
+        }
+        offsets[block + 1] = count;
+    }
+    for (int64_t block = 0; block < num_blocks; ++block) {
+        offsets[block + 1] += offsets[block];
+    }
+    resize(offsets.back());
+#pragma omp parallel for schedule(static)
+    for (int64_t block = 0; block < num_blocks; ++block) {
+        const int64_t end = std::min(n, (block + 1) * block_size);
+        int64_t j = offsets[block];
+        for (int64_t i = block * block_size; i < end; ++i) {
+            if (keep(i)) {
+                copy(i, j++);
+            }
+        }
+    }
+    return offsets.back();
+}
+
 }  // namespace utility
 }  // namespace open3d
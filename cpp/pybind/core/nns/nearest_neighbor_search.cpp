@@ -27,6 +27,7 @@
 #include "pybind/core/nns/nearest_neighbor_search.h"
 
 #include "open3d/core/Tensor.h"
+#include "open3d/core/nns/DynamicNanoFlannIndex.h"
 #include "open3d/core/nns/NearestNeighborSearch.h"
 #include "pybind/core/core.h"
 #include "pybind/docstring.h"
@@ -48,7 +49,29 @@ void pybind_core_nns(py::module &m) {
                     {"radius", "Radius value for radius search."},
                     {"max_knn",
                      "Maximum number of neighbors to search per query point."},
-                    {"knn", "Number of neighbors to search per query point."}};
+                    {"knn", "Number of neighbors to search per query point."},
+                    {"eps",
+                     "Approximation factor. Neighbors are found up to a factor "
+                     "of (1 + eps) of the exact distances, which trades recall "
+                     "for speed. 0 gives an exact search."}};
+
+    py::enum_<NNSBackend>(m_nns, "NNSBackend",
+                          "Backends of NearestNeighborSearch.")
+            .value("NanoFlann", NNSBackend::NanoFlann,
+                   "NanoFlann KDTree. Supports all search types.")
+            .value("Faiss", NNSBackend::Faiss,
+                   "FAISS index on CPU. Requires Open3D to be built with "
+                   "FAISS.")
+            .value("BruteForce", NNSBackend::BruteForce,
+                   "Blocked brute force with BLAS. Supports all search types.")
+            .value("Auto", NNSBackend::Auto,
+                   "BruteForce or NanoFlann, picked from the size and "
+                   "dimension of the dataset.");
+    py::enum_<FaissIndexType>(m_nns, "FaissIndexType",
+                              "Index types of the FAISS backend.")
+            .value("Flat", FaissIndexType::Flat, "Exact brute force search.")
+            .value("IVFFlat", FaissIndexType::IVFFlat,
+                   "Approximate search with an inverted file index.");
 
     py::class_<NearestNeighborSearch, std::shared_ptr<NearestNeighborSearch>>
             nns(m_nns, "NearestNeighborSearch",
@@ -57,7 +80,9 @@ void pybind_core_nns(py::module &m) {
                 "dataset_points of shape {n_dataset, d}.");
 
     // Constructors.
-    nns.def(py::init<const Tensor &>(), "dataset_points"_a);
+    nns.def(py::init<const Tensor &, NNSBackend, FaissIndexType>(),
+            "dataset_points"_a, "backend"_a = NNSBackend::Auto,
+            "faiss_index_type"_a = FaissIndexType::Flat);
 
     // Index functions.
     nns.def("knn_index", &NearestNeighborSearch::KnnIndex,
@@ -71,7 +96,7 @@ void pybind_core_nns(py::module &m) {
 
     // Search functions.
     nns.def("knn_search", &NearestNeighborSearch::KnnSearch, "query_points"_a,
-            "knn"_a, "Perform knn search.");
+            "knn"_a, "eps"_a = 0.0, "Perform knn search.");
     nns.def("fixed_radius_search", &NearestNeighborSearch::FixedRadiusSearch,
             "query_points"_a, "radius"_a,
             "Perform fixed radius search. All query points share the same "
@@ -84,6 +109,17 @@ void pybind_core_nns(py::module &m) {
             "query_points"_a, "radius"_a, "max_knn"_a,
             "Perform hybrid search.");
 
+    // Backend functions.
+    nns.def_property_readonly("backend", &NearestNeighborSearch::GetBackend);
+    nns.def("set_faiss_num_probes", &NearestNeighborSearch::SetFaissNumProbes,
+            "nprobe"_a,
+            "Set the number of IVF cells visited per query by the FAISS "
+            "IVFFlat index.");
+    nns.def("get_index_build_time", &NearestNeighborSearch::GetIndexBuildTime,
+            "Time spent building the FAISS index, in milliseconds.");
+    nns.def("get_last_search_time", &NearestNeighborSearch::GetLastSearchTime,
+            "Time spent in the last FAISS search, in milliseconds.");
+
     // Docstrings.
     docstring::ClassMethodDocInject(m_nns, "NearestNeighborSearch",
                                     "knn_search",
@@ -97,6 +133,32 @@ void pybind_core_nns(py::module &m) {
     docstring::ClassMethodDocInject(m_nns, "NearestNeighborSearch",
                                     "hybrid_search",
                                     map_nearest_neighbor_search_method_docs);
+
+    py::class_<DynamicNanoFlannIndex, std::shared_ptr<DynamicNanoFlannIndex>>
+            dynamic_index(m_nns, "DynamicNanoFlannIndex",
+                          "KDTree index supporting incremental insertion and "
+                          "removal of points, e.g. for streaming maps.");
+    dynamic_index.def(py::init<int, Dtype, int64_t>(), "dimension"_a, "dtype"_a,
+                      "leaf_size"_a = 1024);
+    dynamic_index.def("add_points", &DynamicNanoFlannIndex::AddPoints,
+                      "points"_a,
+                      "Insert points of shape {n, d}. Returns the Int64 "
+                      "indices assigned to the inserted points.");
+    dynamic_index.def("remove_points", &DynamicNanoFlannIndex::RemovePoints,
+                      "indices"_a,
+                      "Remove points by the indices returned by add_points.");
+    dynamic_index.def("knn_search", &DynamicNanoFlannIndex::SearchKnn,
+                      "query_points"_a, "knn"_a, "Perform knn search.");
+    dynamic_index.def("radius_search", &DynamicNanoFlannIndex::SearchRadius,
+                      "query_points"_a, "radius"_a,
+                      "Perform fixed radius search.");
+    dynamic_index.def("__len__", &DynamicNanoFlannIndex::GetDatasetSize);
+    docstring::ClassMethodDocInject(m_nns, "DynamicNanoFlannIndex",
+                                    "knn_search",
+                                    map_nearest_neighbor_search_method_docs);
+    docstring::ClassMethodDocInject(m_nns, "DynamicNanoFlannIndex",
+                                    "radius_search",
+                                    map_nearest_neighbor_search_method_docs);
 }
 
 }  // namespace nns
@@ -0,0 +1,108 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/geometry/AsRigidAsPossibleDeformer.h"
+
+#include "open3d/geometry/TriangleMesh.h"
+#include "pybind/docstring.h"
+#include "pybind/geometry/geometry.h"
+
+namespace open3d {
+namespace geometry {
+
+void pybind_asrigidaspossibledeformer(py::module &m) {
+    // open3d.geometry.AsRigidAsPossibleDeformer
+    static const std::unordered_map<std::string, std::string>
+            map_asrigidaspossibledeformer_method_docs = {
+                    {"mesh", "The triangle mesh in its rest pose."},
+                    {"constraint_vertex_indices",
+                     "Indices of the vertices whose positions are prescribed "
+                     "by ``deform``."},
+                    {"energy", "Energy model that should be optimized."},
+                    {"smoothed_alpha",
+                     "Alpha parameter of the smoothed ARAP model."},
+                    {"constraint_vertex_positions",
+                     "Target positions of the constrained vertices, in the "
+                     "order of ``constraint_vertex_indices``."},
+                    {"max_iter",
+                     "Number of iterations to minimize the energy."}};
+    py::class_<AsRigidAsPossibleDeformer,
+               std::shared_ptr<AsRigidAsPossibleDeformer>>
+            deformer(m, "AsRigidAsPossibleDeformer",
+                     "Reusable as-rigid-as-possible deformation solver. The "
+                     "cotangent weights and the sparse Cholesky factorization "
+                     "of the system matrix are computed once for a mesh and a "
+                     "set of constrained vertices, and reused by every call "
+                     "to ``deform``.");
+    deformer.def(py::init<const TriangleMesh &, const std::vector<int> &,
+                          MeshBase::DeformAsRigidAsPossibleEnergy, double>(),
+                 "mesh"_a, "constraint_vertex_indices"_a,
+                 "energy"_a = MeshBase::DeformAsRigidAsPossibleEnergy::Spokes,
+                 "smoothed_alpha"_a = 0.01)
+            .def("__repr__",
+                 [](const AsRigidAsPossibleDeformer &deformer) {
+                     return std::string("AsRigidAsPossibleDeformer with ") +
+                            std::to_string(deformer.vertices_.size()) +
+                            " vertices and " +
+                            std::to_string(deformer.constraint_vertex_indices_
+                                                   .size()) +
+                            " constraints.";
+                 })
+            .def_static(
+                    "create_from_triangle_mesh",
+                    &AsRigidAsPossibleDeformer::CreateFromTriangleMesh,
+                    "Function to create an AsRigidAsPossibleDeformer from a "
+                    "triangle mesh.",
+                    "mesh"_a, "constraint_vertex_indices"_a,
+                    "energy"_a =
+                            MeshBase::DeformAsRigidAsPossibleEnergy::Spokes,
+                    "smoothed_alpha"_a = 0.01)
+            .def("is_empty", &AsRigidAsPossibleDeformer::IsEmpty,
+                 "Returns ``True`` if the deformer holds no vertices.")
+            .def("deform", &AsRigidAsPossibleDeformer::Deform,
+                 py::call_guard<py::gil_scoped_release>(),
+                 "Deforms the mesh such that the constrained vertices reach "
+                 "the given positions. Every call starts from the rest pose.",
+                 "constraint_vertex_positions"_a, "max_iter"_a)
+            .def_readonly(
+                    "constraint_vertex_indices",
+                    &AsRigidAsPossibleDeformer::constraint_vertex_indices_,
+                    "Indices of the constrained vertices.")
+            .def_readonly("energy", &AsRigidAsPossibleDeformer::energy_,
+                          "Energy model that is optimized.")
+            .def_readonly("smoothed_alpha",
+                          &AsRigidAsPossibleDeformer::smoothed_alpha_,
+                          "Alpha parameter of the smoothed ARAP model.");
+    docstring::ClassMethodDocInject(m, "AsRigidAsPossibleDeformer",
+                                    "create_from_triangle_mesh",
+                                    map_asrigidaspossibledeformer_method_docs);
+    docstring::ClassMethodDocInject(m, "AsRigidAsPossibleDeformer", "is_empty");
+    docstring::ClassMethodDocInject(m, "AsRigidAsPossibleDeformer", "deform",
+                                    map_asrigidaspossibledeformer_method_docs);
+}
+
+}  // namespace geometry
+}  // namespace open3d
@@ -202,8 +202,12 @@ void pybind_geometry(py::module &m) {
     pybind_lineset(m_submodule);
     pybind_meshbase(m_submodule);
     pybind_trianglemesh(m_submodule);
+    pybind_trianglemeshbvh(m_submodule);
+    pybind_asrigidaspossibledeformer(m_submodule);
+    pybind_streamingvertexclustering(m_submodule);
     pybind_halfedgetrianglemesh(m_submodule);
     pybind_image(m_submodule);
+    pybind_rgbdtopointcloudconverter(m_submodule);
     pybind_tetramesh(m_submodule);
     pybind_pointcloud_methods(m_submodule);
     pybind_voxelgrid_methods(m_submodule);
@@ -26,11 +26,32 @@
 
 #pragma once
 
+#include "open3d/utility/Console.h"
 #include "pybind/open3d_pybind.h"
 
 namespace open3d {
 namespace geometry {
 
+/// NumPy bool array taken by the mask overloads. Without forcecast, arrays of
+/// any other dtype fail to convert, so that they reach the std::vector<bool>
+/// overloads instead of being cast to bool.
+using PyBoolArray = py::array_t<bool, py::array::c_style>;
+
+/// Converts a 1D NumPy bool array to a mask without creating a Python object
+/// per entry, as the default std::vector<bool> conversion does.
+inline std::vector<bool> PyArrayToMask(const PyBoolArray &array) {
+    if (array.dtype().kind() != 'b') {
+        utility::LogError("Expected a bool mask, got dtype {}.",
+                          std::string(py::str(array.dtype())));
+    }
+    if (array.ndim() != 1) {
+        utility::LogError("Expected a 1D mask, got {} dimensions.",
+                          array.ndim());
+    }
+    const bool *data = array.data();
+    return std::vector<bool>(data, data + array.size());
+}
+
 void pybind_geometry(py::module &m);
 
 void pybind_pointcloud(py::module &m);
@@ -39,6 +60,10 @@ void pybind_voxelgrid(py::module &m);
 void pybind_lineset(py::module &m);
 void pybind_meshbase(py::module &m);
 void pybind_trianglemesh(py::module &m);
+void pybind_trianglemeshbvh(py::module &m);
+void pybind_asrigidaspossibledeformer(py::module &m);
+void pybind_rgbdtopointcloudconverter(py::module &m);
+void pybind_streamingvertexclustering(py::module &m);
 void pybind_halfedgetrianglemesh(py::module &m);
 void pybind_image(py::module &m);
 void pybind_tetramesh(py::module &m);
@@ -26,6 +26,8 @@
 
 #include "open3d/geometry/KDTreeFlann.h"
 
+#include "open3d/geometry/NeighborGraph.h"
+#include "open3d/geometry/PointCloud.h"
 #include "pybind/docstring.h"
 #include "pybind/geometry/geometry.h"
 #include "pybind/geometry/geometry_trampoline.h"
@@ -106,6 +108,30 @@ void pybind_kdtreeflann(py::module &m) {
                     "max_nn", &KDTreeSearchParamHybrid::max_nn_,
                     "At maximum, ``max_nn`` neighbors will be searched.");
 
+    // open3d.geometry.KDTreeIndexParam
+    py::class_<KDTreeIndexParam> kdtreeindexparam(
+            m, "KDTreeIndexParam",
+            "KDTree index parameters, selecting between an exact single KDTree "
+            "and an approximate forest of randomized KDTrees.");
+    kdtreeindexparam
+            .def(py::init<int, int>(), "num_trees"_a = 0, "checks"_a = -1)
+            .def("__repr__",
+                 [](const KDTreeIndexParam &param) {
+                     return std::string("KDTreeIndexParam with num_trees = ") +
+                            std::to_string(param.num_trees_) +
+                            " and checks = " + std::to_string(param.checks_);
+                 })
+            .def("is_approximate", &KDTreeIndexParam::IsApproximate,
+                 "Returns true if the index parameters give an approximate "
+                 "search.")
+            .def_readwrite("num_trees", &KDTreeIndexParam::num_trees_,
+                           "Number of randomized KDTrees, 0 for a single exact "
+                           "KDTree.")
+            .def_readwrite("checks", &KDTreeIndexParam::checks_,
+                           "Number of leaves visited per query. Higher values "
+                           "give better recall at the cost of speed. -1 for an "
+                           "exact search.");
+
     // open3d.geometry.KDTreeFlann
     static const std::unordered_map<std::string, std::string>
             map_kd_tree_flann_method_docs = {
@@ -115,18 +141,23 @@ void pybind_kdtreeflann(py::module &m) {
                      "At maximum, ``max_nn`` neighbors will be searched."},
                     {"knn", "``knn`` neighbors will be searched."},
                     {"feature", "Feature data."},
-                    {"data", "Matrix data."}};
+                    {"data", "Matrix data."},
+                    {"index_param", "Index parameters."}};
     py::class_<KDTreeFlann, std::shared_ptr<KDTreeFlann>> kdtreeflann(
             m, "KDTreeFlann", "KDTree with FLANN for nearest neighbor search.");
     kdtreeflann.def(py::init<>())
-            .def(py::init<const Eigen::MatrixXd &>(), "data"_a)
+            .def(py::init<const KDTreeIndexParam &>(), "index_param"_a)
+            .def(py::init<const Eigen::MatrixXd &, const KDTreeIndexParam &>(),
+                 "data"_a, "index_param"_a = KDTreeIndexParam())
             .def("set_matrix_data", &KDTreeFlann::SetMatrixData,
                  "Sets the data for the KDTree from a matrix.", "data"_a)
-            .def(py::init<const Geometry &>(), "geometry"_a)
+            .def(py::init<const Geometry &, const KDTreeIndexParam &>(),
+                 "geometry"_a, "index_param"_a = KDTreeIndexParam())
             .def("set_geometry", &KDTreeFlann::SetGeometry,
                  "Sets the data for the KDTree from geometry.", "geometry"_a)
-            .def(py::init<const pipelines::registration::Feature &>(),
-                 "feature"_a)
+            .def(py::init<const pipelines::registration::Feature &,
+                          const KDTreeIndexParam &>(),
+                 "feature"_a, "index_param"_a = KDTreeIndexParam())
             .def("set_feature", &KDTreeFlann::SetFeature,
                  "Sets the data for the KDTree from the feature data.",
                  "feature"_a)
@@ -277,6 +308,82 @@ void pybind_kdtreeflann(py::module &m) {
                                     map_kd_tree_flann_method_docs);
     docstring::ClassMethodDocInject(m, "KDTreeFlann", "set_matrix_data",
                                     map_kd_tree_flann_method_docs);
+
+    // open3d.geometry.NeighborGraph
+    static const std::unordered_map<std::string, std::string>
+            map_neighbor_graph_method_docs = {
+                    {"cloud", "The point cloud."},
+                    {"search_param", "The KDTree search parameters."},
+                    {"index", "Index of the point."}};
+    py::class_<NeighborGraph, std::shared_ptr<NeighborGraph>> neighbor_graph(
+            m, "NeighborGraph",
+            "Cache of the neighborhoods of all points of a point cloud, in "
+            "compressed sparse row layout. It can be passed to the point "
+            "cloud and feature functions that search neighborhoods covered "
+            "by the graph, so that the neighborhoods are only searched once.");
+    neighbor_graph
+            .def(py::init<const PointCloud &, const KDTreeSearchParam &>(),
+                 "cloud"_a, "search_param"_a)
+            .def("__repr__",
+                 [](const NeighborGraph &graph) {
+                     return std::string("NeighborGraph with ") +
+                            std::to_string(graph.NumPoints()) + " points and " +
+                            std::to_string(graph.indices_.size()) +
+                            " neighbors.";
+                 })
+            .def_static("create_from_point_cloud",
+                        &NeighborGraph::CreateFromPointCloud,
+                        "Function to create a NeighborGraph from a point "
+                        "cloud.",
+                        "cloud"_a, "search_param"_a)
+            .def("num_points", &NeighborGraph::NumPoints,
+                 "Number of points of the graph.")
+            .def("num_neighbors", &NeighborGraph::NumNeighbors,
+                 "Number of neighbors of a point, including the point itself.",
+                 "index"_a)
+            .def("covers", &NeighborGraph::Covers,
+                 "Returns ``True`` if the neighborhoods of the search "
+                 "parameter can be read from the graph.",
+                 "search_param"_a)
+            .def(
+                    "get_neighbors",
+                    [](const NeighborGraph &graph, size_t index,
+                       const KDTreeSearchParam &param) {
+                        if (index >= graph.NumPoints()) {
+                            throw std::out_of_range(
+                                    "get_neighbors() index out of range!");
+                        }
+                        if (!graph.Covers(param)) {
+                            throw std::runtime_error(
+                                    "get_neighbors() search_param is not "
+                                    "covered by the graph!");
+                        }
+                        std::vector<int> indices;
+                        std::vector<double> distance2;
+                        int k = graph.GetNeighbors(index, param, indices,
+                                                   distance2);
+                        return std::make_tuple(k, indices, distance2);
+                    },
+                    "Get the neighbors of a point for the search parameter, "
+                    "as ``(k, indices, distance2)``.",
+                    "index"_a, "search_param"_a)
+            .def_readonly("search_type", &NeighborGraph::search_type_,
+                          "Search type of the graph.")
+            .def_readonly("knn", &NeighborGraph::knn_,
+                          "Number of neighbors for KNN graphs, max number of "
+                          "neighbors for hybrid graphs.")
+            .def_readonly("radius", &NeighborGraph::radius_,
+                          "Search radius for radius and hybrid graphs.");
+    docstring::ClassMethodDocInject(m, "NeighborGraph",
+                                    "create_from_point_cloud",
+                                    map_neighbor_graph_method_docs);
+    docstring::ClassMethodDocInject(m, "NeighborGraph", "num_points");
+    docstring::ClassMethodDocInject(m, "NeighborGraph", "num_neighbors",
+                                    map_neighbor_graph_method_docs);
+    docstring::ClassMethodDocInject(m, "NeighborGraph", "covers",
+                                    map_neighbor_graph_method_docs);
+    docstring::ClassMethodDocInject(m, "NeighborGraph", "get_neighbors",
+                                    map_neighbor_graph_method_docs);
 }
 
 }  // namespace geometry
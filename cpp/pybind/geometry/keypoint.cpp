@@ -30,6 +30,7 @@
 
 #include "open3d/geometry/Keypoint.h"
 
+#include "open3d/geometry/NeighborGraph.h"
 #include "open3d/geometry/PointCloud.h"
 #include "pybind/docstring.h"
 #include "pybind/geometry/geometry.h"
@@ -45,7 +46,8 @@ void pybind_keypoint_methods(py::module &m) {
           "proposed in Yu Zhong, 'Intrinsic Shape Signatures: A Shape "
           "Descriptor for 3D Object Recognition', 2009.",
           "input"_a, "salient_radius"_a = 0.0, "non_max_radius"_a = 0.0,
-          "gamma_21"_a = 0.975, "gamma_32"_a = 0.975, "min_neighbors"_a = 5);
+          "gamma_21"_a = 0.975, "gamma_32"_a = 0.975, "min_neighbors"_a = 5,
+          "neighbor_graph"_a = nullptr);
 
     docstring::FunctionDocInject(
             m, "compute_iss_keypoints",
@@ -65,7 +67,39 @@ void pybind_keypoint_methods(py::module &m) {
              {"min_neighbors",
               "Minimum number of neighbors that has to be found to "
               "consider a "
-              "keypoint"}});
+              "keypoint"},
+             {"neighbor_graph",
+              "Optional NeighborGraph of the input, used instead of "
+              "searching a KDTree for the neighborhoods it covers."}});
+
+    m.def("compute_iss_keypoint_indices", &keypoint::ComputeISSKeypointIndices,
+          "Function that computes the indices of the ISS keypoints of an "
+          "input point cloud, in increasing order. Same as "
+          "compute_iss_keypoints, without copying the keypoints into a new "
+          "point cloud.",
+          "input"_a, "salient_radius"_a = 0.0, "non_max_radius"_a = 0.0,
+          "gamma_21"_a = 0.975, "gamma_32"_a = 0.975, "min_neighbors"_a = 5,
+          "neighbor_graph"_a = nullptr);
+
+    docstring::FunctionDocInject(
+            m, "compute_iss_keypoint_indices",
+            {{"input", "The Input point cloud."},
+             {"salient_radius",
+              "The radius of the spherical neighborhood used to detect "
+              "keypoints."},
+             {"non_max_radius", "The non maxima supression radius"},
+             {"gamma_21",
+              "The upper bound on the ratio between the second and the "
+              "first eigenvalue returned by the EVD"},
+             {"gamma_32",
+              "The upper bound on the ratio between the third and the "
+              "second eigenvalue returned by the EVD"},
+             {"min_neighbors",
+              "Minimum number of neighbors that has to be found to "
+              "consider a keypoint"},
+             {"neighbor_graph",
+              "Optional NeighborGraph of the input, used instead of "
+              "searching a KDTree for the neighborhoods it covers."}});
 }
 
 void pybind_keypoint(py::module &m) {
@@ -251,6 +251,82 @@ void pybind_octree(py::module &m) {
     docstring::ClassMethodDocInject(
             m, "Octree", "create_from_voxel_grid",
             {{"voxel_grid", "geometry.VoxelGrid: The source voxel grid."}});
+
+    // LinearOctree
+    py::class_<LinearOctree, std::shared_ptr<LinearOctree>> linear_octree(
+            m, "LinearOctree",
+            "Pointerless octree that stores its nodes in flat arrays, sorted "
+            "by Morton code.");
+    py::detail::bind_default_constructor<LinearOctree>(linear_octree);
+    py::detail::bind_copy_functions<LinearOctree>(linear_octree);
+    linear_octree
+            .def(py::init([](size_t max_depth) {
+                     return new LinearOctree(max_depth);
+                 }),
+                 "max_depth"_a)
+            .def(py::init([](size_t max_depth, const Eigen::Vector3d &origin,
+                             double size) {
+                     return new LinearOctree(max_depth, origin, size);
+                 }),
+                 "max_depth"_a, "origin"_a, "size"_a)
+            .def("__repr__",
+                 [](const LinearOctree &octree) {
+                     std::ostringstream repr;
+                     repr << "LinearOctree with ";
+                     repr << "origin: [" << octree.origin_(0) << ", "
+                          << octree.origin_(1) << ", " << octree.origin_(2)
+                          << "]";
+                     repr << ", size: " << octree.size_;
+                     repr << ", max_depth: " << octree.max_depth_;
+                     repr << ", " << octree.GetNumLeafNodes() << " leaf nodes";
+                     return repr.str();
+                 })
+            .def("clear", &LinearOctree::Clear,
+                 "Remove all nodes and reset the bounds.")
+            .def("is_empty", &LinearOctree::IsEmpty,
+                 "Returns True if the octree has no nodes.")
+            .def("get_num_nodes", &LinearOctree::GetNumNodes,
+                 "Number of internal and leaf nodes.")
+            .def("get_num_leaf_nodes", &LinearOctree::GetNumLeafNodes,
+                 "Number of leaf nodes.")
+            .def("convert_from_point_cloud",
+                 &LinearOctree::ConvertFromPointCloud, "point_cloud"_a,
+                 "size_expand"_a = 0.01,
+                 "Convert octree from point cloud, in parallel.")
+            .def("locate_leaf_nodes", &LinearOctree::LocateLeafNodes,
+                 "points"_a,
+                 "Returns the index of the leaf node where each query point "
+                 "resides, or -1 if there is none.")
+            .def("get_leaf_node_info", &LinearOctree::GetLeafNodeInfo,
+                 "leaf_index"_a, "Returns the OctreeNodeInfo of a leaf node.")
+            .def("to_voxel_grid", &LinearOctree::ToVoxelGrid,
+                 "Convert to VoxelGrid.")
+            .def("to_octree", &LinearOctree::ToOctree, "Convert to Octree.")
+            .def_readwrite("origin", &LinearOctree::origin_,
+                           "(3, 1) float numpy array: Global min bound "
+                           "(include). A point is within bound iff origin <= "
+                           "point < origin + size.")
+            .def_readwrite("size", &LinearOctree::size_,
+                           "float: Outer bounding box edge size for the whole "
+                           "octree.")
+            .def_readwrite("max_depth", &LinearOctree::max_depth_,
+                           "int: Maximum depth of the octree. All leaf nodes "
+                           "are at this depth.")
+            .def_readonly("leaf_colors", &LinearOctree::leaf_colors_,
+                          "``float64`` array of shape ``(num_leaf_nodes, "
+                          "3)``, use ``numpy.asarray()`` to access data: "
+                          "Color of every leaf node.");
+
+    docstring::ClassMethodDocInject(m, "LinearOctree", "__init__");
+    docstring::ClassMethodDocInject(m, "LinearOctree",
+                                    "convert_from_point_cloud",
+                                    map_octree_argument_docstrings);
+    docstring::ClassMethodDocInject(
+            m, "LinearOctree", "locate_leaf_nodes",
+            {{"points", "Coordinates of the query points."}});
+    docstring::ClassMethodDocInject(
+            m, "LinearOctree", "get_leaf_node_info",
+            {{"leaf_index", "Index of the leaf node."}});
 }
 
 void pybind_octree_methods(py::module &m) {}
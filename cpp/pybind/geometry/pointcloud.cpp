@@ -30,6 +30,7 @@
 
 #include "open3d/camera/PinholeCameraIntrinsic.h"
 #include "open3d/geometry/Image.h"
+#include "open3d/geometry/NeighborGraph.h"
 #include "open3d/geometry/RGBDImage.h"
 #include "pybind/docstring.h"
 #include "pybind/geometry/geometry.h"
@@ -39,6 +40,16 @@ namespace open3d {
 namespace geometry {
 
 void pybind_pointcloud(py::module &m) {
+    py::enum_<PointCloud::VisibilityMethod>(m, "VisibilityMethod")
+            .value("HiddenPointRemoval",
+                   PointCloud::VisibilityMethod::HiddenPointRemoval,
+                   "Hidden Point Removal operator, with a convex hull per "
+                   "camera location.")
+            .value("ZBuffer", PointCloud::VisibilityMethod::ZBuffer,
+                   "Approximation with a cube map depth buffer around every "
+                   "camera location.")
+            .export_values();
+
     py::class_<PointCloud, PyGeometry3D<PointCloud>,
                std::shared_ptr<PointCloud>, Geometry3D>
             pointcloud(m, "PointCloud",
@@ -72,6 +83,24 @@ void pybind_pointcloud(py::module &m) {
                  "Function to select points from input pointcloud into output "
                  "pointcloud.",
                  "indices"_a, "invert"_a = false)
+            .def(
+                    "select_by_mask",
+                    [](const PointCloud &pcd, const PyBoolArray &mask,
+                       bool invert) {
+                        return pcd.SelectByMask(PyArrayToMask(mask), invert);
+                    },
+                    "Function to select points from input pointcloud into "
+                    "output pointcloud with a boolean mask, in parallel.",
+                    "mask"_a, "invert"_a = false)
+            .def("select_by_mask", &PointCloud::SelectByMask,
+                 "Function to select points from input pointcloud into "
+                 "output pointcloud with a boolean mask, in parallel.",
+                 "mask"_a, "invert"_a = false)
+            .def("sort_by_morton_code", &PointCloud::SortByMortonCode,
+                 "Function to reorder points, normals and colors along a "
+                 "Morton (Z-order) curve. Returns the permutation such that "
+                 "the i-th sorted point is the permutation[i]-th original "
+                 "point.")
             .def("voxel_down_sample", &PointCloud::VoxelDownSample,
                  "Function to downsample input pointcloud into output "
                  "pointcloud with "
@@ -109,18 +138,19 @@ void pybind_pointcloud(py::module &m) {
             .def("remove_radius_outlier", &PointCloud::RemoveRadiusOutliers,
                  "Function to remove points that have less than nb_points"
                  " in a given sphere of a given radius",
-                 "nb_points"_a, "radius"_a)
+                 "nb_points"_a, "radius"_a, "neighbor_graph"_a = nullptr)
             .def("remove_statistical_outlier",
                  &PointCloud::RemoveStatisticalOutliers,
                  "Function to remove points that are further away from their "
                  "neighbors in average",
-                 "nb_neighbors"_a, "std_ratio"_a)
+                 "nb_neighbors"_a, "std_ratio"_a, "neighbor_graph"_a = nullptr)
             .def("estimate_normals", &PointCloud::EstimateNormals,
                  "Function to compute the normals of a point cloud. Normals "
                  "are oriented with respect to the input point cloud if "
                  "normals exist",
                  "search_param"_a = KDTreeSearchParamKNN(),
-                 "fast_normal_computation"_a = true)
+                 "fast_normal_computation"_a = true,
+                 "neighbor_graph"_a = nullptr)
             .def("orient_normals_to_align_with_direction",
                  &PointCloud::OrientNormalsToAlignWithDirection,
                  "Function to orient the normals of a point cloud",
@@ -133,7 +163,7 @@ void pybind_pointcloud(py::module &m) {
                  &PointCloud::OrientNormalsConsistentTangentPlane,
                  "Function to orient the normals with respect to consistent "
                  "tangent planes",
-                 "k"_a)
+                 "k"_a, "print_progress"_a = false)
             .def("compute_point_cloud_distance",
                  &PointCloud::ComputePointCloudDistance,
                  "For each point in the source point cloud, compute the "
@@ -154,7 +184,8 @@ void pybind_pointcloud(py::module &m) {
             .def("compute_nearest_neighbor_distance",
                  &PointCloud::ComputeNearestNeighborDistance,
                  "Function to compute the distance from a point to its nearest "
-                 "neighbor in the point cloud")
+                 "neighbor in the point cloud",
+                 "neighbor_graph"_a = nullptr)
             .def("compute_convex_hull", &PointCloud::ComputeConvexHull,
                  "Computes the convex hull of the point cloud.")
             .def("hidden_point_removal", &PointCloud::HiddenPointRemoval,
@@ -165,16 +196,57 @@ void pybind_pointcloud(py::module &m) {
                  "found in Mehra et. al. 'Visibility of Noisy Point Cloud "
                  "Data', 2010.",
                  "camera_location"_a, "radius"_a)
+            .def(
+                    "compute_point_visibility",
+                    [](const PointCloud &pcd,
+                       const std::vector<Eigen::Vector3d> &camera_locations,
+                       double radius, PointCloud::VisibilityMethod method,
+                       int resolution, double depth_tolerance) {
+                        std::vector<std::vector<bool>> visibility;
+                        {
+                            py::gil_scoped_release release;
+                            visibility = pcd.ComputePointVisibility(
+                                    camera_locations, radius, method,
+                                    resolution, depth_tolerance);
+                        }
+                        py::array_t<bool> array(
+                                {visibility.size(), pcd.points_.size()});
+                        bool *data = array.mutable_data();
+                        for (const std::vector<bool> &visible : visibility) {
+                            data = std::copy(visible.begin(), visible.end(),
+                                             data);
+                        }
+                        return array;
+                    },
+                    "Computes which points are visible from each camera "
+                    "location, in parallel over the camera locations. "
+                    "Returns a bool array with one row per camera location "
+                    "and one column per point.",
+                    "camera_locations"_a, "radius"_a,
+                    "method"_a =
+                            PointCloud::VisibilityMethod::HiddenPointRemoval,
+                    "resolution"_a = 256, "depth_tolerance"_a = 0.01)
             .def("cluster_dbscan", &PointCloud::ClusterDBSCAN,
                  "Cluster PointCloud using the DBSCAN algorithm  Ester et al., "
                  "'A Density-Based Algorithm for Discovering Clusters in Large "
                  "Spatial Databases with Noise', 1996. Returns a list of point "
                  "labels, -1 indicates noise according to the algorithm.",
-                 "eps"_a, "min_points"_a, "print_progress"_a = false)
+                 "eps"_a, "min_points"_a, "print_progress"_a = false,
+                 "neighbor_graph"_a = nullptr)
             .def("segment_plane", &PointCloud::SegmentPlane,
                  "Segments a plane in the point cloud using the RANSAC "
                  "algorithm.",
-                 "distance_threshold"_a, "ransac_n"_a, "num_iterations"_a)
+                 "distance_threshold"_a, "ransac_n"_a, "num_iterations"_a,
+                 "probability"_a = 0.99999999, "preemptive_sample_size"_a = 0,
+                 "seed"_a = -1)
+            .def("segment_planes", &PointCloud::SegmentPlanes,
+                 "Segments up to num_planes planes in the point cloud, one "
+                 "after the other, using the RANSAC algorithm. Returns a list "
+                 "of (plane_model, inliers) tuples.",
+                 "num_planes"_a, "distance_threshold"_a = 0.01,
+                 "ransac_n"_a = 3, "num_iterations"_a = 100,
+                 "probability"_a = 0.99999999, "min_num_inliers"_a = 3,
+                 "preemptive_sample_size"_a = 0, "seed"_a = -1)
             .def_static(
                     "create_from_depth_image",
                     &PointCloud::CreateFromDepthImage,
@@ -226,6 +298,12 @@ void pybind_pointcloud(py::module &m) {
             {{"indices", "Indices of points to be selected."},
              {"invert",
               "Set to ``True`` to invert the selection of indices."}});
+    docstring::ClassMethodDocInject(
+            m, "PointCloud", "select_by_mask",
+            {{"mask",
+              "1D bool array with one entry per point, True values indicate "
+              "points to be selected."},
+             {"invert", "Set to ``True`` to invert the selection."}});
     docstring::ClassMethodDocInject(
             m, "PointCloud", "voxel_down_sample",
             {{"voxel_size", "Voxel size to downsample into."},
@@ -250,11 +328,17 @@ void pybind_pointcloud(py::module &m) {
     docstring::ClassMethodDocInject(
             m, "PointCloud", "remove_radius_outlier",
             {{"nb_points", "Number of points within the radius."},
-             {"radius", "Radius of the sphere."}});
+             {"radius", "Radius of the sphere."},
+             {"neighbor_graph",
+              "Optional NeighborGraph of the point cloud, covering radius "
+              "search with ``radius``."}});
     docstring::ClassMethodDocInject(
             m, "PointCloud", "remove_statistical_outlier",
             {{"nb_neighbors", "Number of neighbors around the target point."},
-             {"std_ratio", "Standard deviation ratio."}});
+             {"std_ratio", "Standard deviation ratio."},
+             {"neighbor_graph",
+              "Optional NeighborGraph of the point cloud, covering KNN search "
+              "with ``nb_neighbors``."}});
     docstring::ClassMethodDocInject(
             m, "PointCloud", "estimate_normals",
             {{"search_param",
@@ -262,7 +346,10 @@ void pybind_pointcloud(py::module &m) {
              {"fast_normal_computation",
               "If true, the normal estiamtion uses a non-iterative method to "
               "extract the eigenvector from the covariance matrix. This is "
-              "faster, but is not as numerical stable."}});
+              "faster, but is not as numerical stable."},
+             {"neighbor_graph",
+              "Optional NeighborGraph of the point cloud, covering "
+              "``search_param``."}});
     docstring::ClassMethodDocInject(
             m, "PointCloud", "orient_normals_to_align_with_direction",
             {{"orientation_reference",
@@ -275,7 +362,9 @@ void pybind_pointcloud(py::module &m) {
             m, "PointCloud", "orient_normals_consistent_tangent_plane",
             {{"k",
               "Number of k nearest neighbors used in constructing the "
-              "Riemannian graph used to propogate normal orientation."}});
+              "Riemannian graph used to propogate normal orientation."},
+             {"print_progress",
+              "If true the progress is visualized in the console."}});
     docstring::ClassMethodDocInject(m, "PointCloud",
                                     "compute_point_cloud_distance",
                                     {{"target", "The target point cloud."}});
@@ -283,8 +372,11 @@ void pybind_pointcloud(py::module &m) {
                                     "compute_mean_and_covariance");
     docstring::ClassMethodDocInject(m, "PointCloud",
                                     "compute_mahalanobis_distance");
-    docstring::ClassMethodDocInject(m, "PointCloud",
-                                    "compute_nearest_neighbor_distance");
+    docstring::ClassMethodDocInject(
+            m, "PointCloud", "compute_nearest_neighbor_distance",
+            {{"neighbor_graph",
+              "Optional NeighborGraph of the point cloud, covering KNN search "
+              "with 2 neighbors."}});
     docstring::ClassMethodDocInject(m, "PointCloud", "compute_convex_hull",
                                     {{"input", "The input point cloud."}});
     docstring::ClassMethodDocInject(
@@ -293,13 +385,28 @@ void pybind_pointcloud(py::module &m) {
              {"camera_location",
               "All points not visible from that location will be reomved"},
              {"radius", "The radius of the sperical projection"}});
+    docstring::ClassMethodDocInject(
+            m, "PointCloud", "compute_point_visibility",
+            {{"camera_locations", "Camera locations."},
+             {"radius",
+              "The radius of the spherical projection of the "
+              "HiddenPointRemoval method."},
+             {"method", "Visibility method."},
+             {"resolution",
+              "Width and height in pixels of every face of the cube map of "
+              "the ZBuffer method."},
+             {"depth_tolerance",
+              "Relative depth tolerance of the ZBuffer method."}});
     docstring::ClassMethodDocInject(
             m, "PointCloud", "cluster_dbscan",
             {{"eps",
               "Density parameter that is used to find neighbouring points."},
              {"min_points", "Minimum number of points to form a cluster."},
              {"print_progress",
-              "If true the progress is visualized in the console."}});
+              "If true the progress is visualized in the console."},
+             {"neighbor_graph",
+              "Optional NeighborGraph of the point cloud, covering radius "
+              "search with ``eps``."}});
     docstring::ClassMethodDocInject(
             m, "PointCloud", "segment_plane",
             {{"distance_threshold",
@@ -308,7 +415,36 @@ void pybind_pointcloud(py::module &m) {
              {"ransac_n",
               "Number of initial points to be considered inliers in each "
               "iteration."},
-             {"num_iterations", "Number of iterations."}});
+             {"num_iterations", "Maximum number of iterations."},
+             {"probability",
+              "Expected probability of finding the optimal plane, in (0, 1]. "
+              "Iterations stop early once it is reached."},
+             {"preemptive_sample_size",
+              "If positive, plane hypotheses are first scored on a random "
+              "subset of this many points. 0 disables preemptive scoring."},
+             {"seed",
+              "Seed value used in the random generator, -1 to use a random "
+              "seed value with each function call."}});
+    docstring::ClassMethodDocInject(
+            m, "PointCloud", "segment_planes",
+            {{"num_planes", "Maximum number of planes."},
+             {"distance_threshold",
+              "Max distance a point can be from the plane model, and still be "
+              "considered an inlier."},
+             {"ransac_n",
+              "Number of initial points to be considered inliers in each "
+              "iteration."},
+             {"num_iterations", "Maximum number of iterations per plane."},
+             {"probability",
+              "Expected probability of finding the optimal plane, in (0, 1]."},
+             {"min_num_inliers",
+              "Segmentation stops at the first plane with fewer inliers."},
+             {"preemptive_sample_size",
+              "Size of the subset used for preemptive scoring, 0 to disable "
+              "it."},
+             {"seed",
+              "Seed value used in the random generator, -1 to use a random "
+              "seed value with each function call."}});
     docstring::ClassMethodDocInject(
             m, "PointCloud", "create_from_depth_image",
             {{"depth",
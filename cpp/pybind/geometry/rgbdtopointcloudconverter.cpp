@@ -0,0 +1,160 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/geometry/RGBDToPointCloudConverter.h"
+
+#include "open3d/geometry/Image.h"
+#include "open3d/geometry/PointCloud.h"
+#include "open3d/geometry/RGBDImage.h"
+#include "pybind/docstring.h"
+#include "pybind/geometry/geometry.h"
+
+namespace open3d {
+namespace geometry {
+
+void pybind_rgbdtopointcloudconverter(py::module &m) {
+    // open3d.geometry.RGBDToPointCloudConverter
+    static const std::unordered_map<std::string, std::string>
+            map_rgbdtopointcloudconverter_method_docs = {
+                    {"intrinsic",
+                     "Intrinsic parameters of the camera. Every converted "
+                     "image must have its width and height."},
+                    {"depth_scale",
+                     "The 16 bit depth values are divided by depth_scale."},
+                    {"depth_trunc",
+                     "16 bit depth values larger or equal to depth_trunc "
+                     "after scaling are invalid."},
+                    {"stride",
+                     "Sampling factor to support coarse point cloud "
+                     "extraction."},
+                    {"project_valid_depth_only",
+                     "If ``False``, invalid pixels are kept as NaN points."},
+                    {"depth",
+                     "The input depth image, with 16 bit or float pixels."},
+                    {"image", "The input RGBD image, with float depth."},
+                    {"extrinsic", "The extrinsic parameters of the camera."},
+                    {"output",
+                     "Point cloud to write into and return. Its buffers are "
+                     "reused, so that converting every frame of a stream into "
+                     "the same point cloud does not allocate. A new point "
+                     "cloud is returned if ``None``."}};
+    py::class_<RGBDToPointCloudConverter,
+               std::shared_ptr<RGBDToPointCloudConverter>>
+            converter(m, "RGBDToPointCloudConverter",
+                      "Converter from depth and RGBD images to point clouds, "
+                      "bound to one camera intrinsic. The ray table of the "
+                      "pixels is computed once, 16 bit depth is read "
+                      "directly, and the rows are converted in parallel into "
+                      "reusable point cloud buffers.");
+    converter
+            .def(py::init<const camera::PinholeCameraIntrinsic &, double,
+                          double, int, bool>(),
+                 "intrinsic"_a, "depth_scale"_a = 1000.0,
+                 "depth_trunc"_a = 1000.0, "stride"_a = 1,
+                 "project_valid_depth_only"_a = true)
+            .def("__repr__",
+                 [](const RGBDToPointCloudConverter &converter) {
+                     return std::string("RGBDToPointCloudConverter for ") +
+                            std::to_string(converter.intrinsic_.width_) +
+                            " x " +
+                            std::to_string(converter.intrinsic_.height_) +
+                            " images with stride " +
+                            std::to_string(converter.stride_) + ".";
+                 })
+            .def_static("create_from_intrinsic",
+                        &RGBDToPointCloudConverter::CreateFromIntrinsic,
+                        "Function to create an RGBDToPointCloudConverter "
+                        "from a camera intrinsic.",
+                        "intrinsic"_a, "depth_scale"_a = 1000.0,
+                        "depth_trunc"_a = 1000.0, "stride"_a = 1,
+                        "project_valid_depth_only"_a = true)
+            .def("is_empty", &RGBDToPointCloudConverter::IsEmpty,
+                 "Returns ``True`` if the converter is not bound to a camera "
+                 "with pixels.")
+            .def(
+                    "convert_depth_image",
+                    [](const RGBDToPointCloudConverter &converter,
+                       const Image &depth, const Eigen::Matrix4d &extrinsic,
+                       std::shared_ptr<PointCloud> output) {
+                        if (!output) {
+                            output = std::make_shared<PointCloud>();
+                        }
+                        {
+                            py::gil_scoped_release release;
+                            converter.ConvertDepthImage(depth, *output,
+                                                        extrinsic);
+                        }
+                        return output;
+                    },
+                    "Converts a depth image into a point cloud.", "depth"_a,
+                    "extrinsic"_a = Eigen::Matrix4d::Identity(),
+                    "output"_a = nullptr)
+            .def(
+                    "convert_rgbd_image",
+                    [](const RGBDToPointCloudConverter &converter,
+                       const RGBDImage &image, const Eigen::Matrix4d &extrinsic,
+                       std::shared_ptr<PointCloud> output) {
+                        if (!output) {
+                            output = std::make_shared<PointCloud>();
+                        }
+                        {
+                            py::gil_scoped_release release;
+                            converter.ConvertRGBDImage(image, *output,
+                                                       extrinsic);
+                        }
+                        return output;
+                    },
+                    "Converts an RGBD image into a colored point cloud.",
+                    "image"_a, "extrinsic"_a = Eigen::Matrix4d::Identity(),
+                    "output"_a = nullptr)
+            .def_readonly("intrinsic", &RGBDToPointCloudConverter::intrinsic_,
+                          "Intrinsic parameters of the camera.")
+            .def_readonly("depth_scale",
+                          &RGBDToPointCloudConverter::depth_scale_,
+                          "Divisor of the 16 bit depth values.")
+            .def_readonly("depth_trunc",
+                          &RGBDToPointCloudConverter::depth_trunc_,
+                          "Truncation of the scaled 16 bit depth values.")
+            .def_readonly("stride", &RGBDToPointCloudConverter::stride_,
+                          "Sampling factor of the rows and columns.")
+            .def_readonly(
+                    "project_valid_depth_only",
+                    &RGBDToPointCloudConverter::project_valid_depth_only_,
+                    "If ``False``, invalid pixels are kept as NaN points.");
+    docstring::ClassMethodDocInject(m, "RGBDToPointCloudConverter",
+                                    "create_from_intrinsic",
+                                    map_rgbdtopointcloudconverter_method_docs);
+    docstring::ClassMethodDocInject(m, "RGBDToPointCloudConverter", "is_empty");
+    docstring::ClassMethodDocInject(m, "RGBDToPointCloudConverter",
+                                    "convert_depth_image",
+                                    map_rgbdtopointcloudconverter_method_docs);
+    docstring::ClassMethodDocInject(m, "RGBDToPointCloudConverter",
+                                    "convert_rgbd_image",
+                                    map_rgbdtopointcloudconverter_method_docs);
+}
+
+}  // namespace geometry
+}  // namespace open3d
@@ -0,0 +1,99 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/geometry/StreamingVertexClustering.h"
+
+#include "pybind/docstring.h"
+#include "pybind/geometry/geometry.h"
+
+namespace open3d {
+namespace geometry {
+
+void pybind_streamingvertexclustering(py::module &m) {
+    // open3d.geometry.StreamingVertexClustering
+    static const std::unordered_map<std::string, std::string>
+            map_streamingvertexclustering_method_docs = {
+                    {"vertices", "Positions of the vertices."},
+                    {"vertex_normals",
+                     "Normals of the vertices, or empty. Either all or no "
+                     "chunks have normals."},
+                    {"vertex_colors",
+                     "Colors of the vertices, or empty. Either all or no "
+                     "chunks have colors."},
+                    {"triangles",
+                     "Triangles indexing the vertices added so far."}};
+    py::class_<StreamingVertexClustering,
+               std::shared_ptr<StreamingVertexClustering>>
+            clustering(m, "StreamingVertexClustering",
+                       "Vertex clustering simplification of a mesh that is "
+                       "added chunk by chunk, for meshes that do not fit in "
+                       "memory. Only the clusters, the simplified triangles "
+                       "and a cluster index per input vertex are kept.");
+    clustering
+            .def(py::init<double, MeshBase::SimplificationContraction,
+                          const Eigen::Vector3d &>(),
+                 "voxel_size"_a,
+                 "contraction"_a = MeshBase::SimplificationContraction::Average,
+                 "origin"_a = Eigen::Vector3d::Zero())
+            .def("__repr__",
+                 [](const StreamingVertexClustering &clustering) {
+                     return std::string("StreamingVertexClustering with ") +
+                            std::to_string(
+                                    clustering.GetNumberOfInputVertices()) +
+                            " input vertices.";
+                 })
+            .def("add_vertices", &StreamingVertexClustering::AddVertices,
+                 py::call_guard<py::gil_scoped_release>(),
+                 "Adds a chunk of vertices, indexed after the previous ones.",
+                 "vertices"_a,
+                 "vertex_normals"_a = std::vector<Eigen::Vector3d>(),
+                 "vertex_colors"_a = std::vector<Eigen::Vector3d>())
+            .def("add_triangles", &StreamingVertexClustering::AddTriangles,
+                 py::call_guard<py::gil_scoped_release>(),
+                 "Adds a chunk of triangles, indexing the vertices added so "
+                 "far.",
+                 "triangles"_a)
+            .def("get_number_of_input_vertices",
+                 &StreamingVertexClustering::GetNumberOfInputVertices,
+                 "Returns the number of vertices added so far.")
+            .def("get_simplified_mesh",
+                 &StreamingVertexClustering::GetSimplifiedMesh,
+                 "Returns the simplified mesh of the vertices and triangles "
+                 "added so far.");
+    docstring::ClassMethodDocInject(m, "StreamingVertexClustering",
+                                    "add_vertices",
+                                    map_streamingvertexclustering_method_docs);
+    docstring::ClassMethodDocInject(m, "StreamingVertexClustering",
+                                    "add_triangles",
+                                    map_streamingvertexclustering_method_docs);
+    docstring::ClassMethodDocInject(m, "StreamingVertexClustering",
+                                    "get_number_of_input_vertices");
+    docstring::ClassMethodDocInject(m, "StreamingVertexClustering",
+                                    "get_simplified_mesh");
+}
+
+}  // namespace geometry
+}  // namespace open3d
@@ -36,6 +36,85 @@ namespace open3d {
 namespace geometry {
 
 void pybind_trianglemesh(py::module &m) {
+    py::class_<PoissonReconstructionInfo> poisson_info(
+            m, "PoissonReconstructionInfo",
+            "Per-stage timing and memory statistics of a Screened Poisson "
+            "reconstruction.");
+    py::detail::bind_default_constructor<PoissonReconstructionInfo>(
+            poisson_info);
+    py::detail::bind_copy_functions<PoissonReconstructionInfo>(poisson_info);
+    py::class_<PoissonReconstructionInfo::Stage> poisson_stage(
+            poisson_info, "Stage",
+            "Statistics of a single stage of a Screened Poisson "
+            "reconstruction.");
+    py::detail::bind_default_constructor<PoissonReconstructionInfo::Stage>(
+            poisson_stage);
+    py::detail::bind_copy_functions<PoissonReconstructionInfo::Stage>(
+            poisson_stage);
+    poisson_stage
+            .def_readwrite("name", &PoissonReconstructionInfo::Stage::name_,
+                           "str: Name of the stage.")
+            .def_readwrite("time", &PoissonReconstructionInfo::Stage::time_,
+                           "float: Wall-clock time spent in the stage in "
+                           "seconds.")
+            .def_readwrite("memory_mb",
+                           &PoissonReconstructionInfo::Stage::memory_mb_,
+                           "float: Largest memory usage observed during the "
+                           "stage in MB.")
+            .def_readwrite("peak_memory_mb",
+                           &PoissonReconstructionInfo::Stage::peak_memory_mb_,
+                           "float: Peak memory usage of the process at the "
+                           "end of the stage in MB.")
+            .def("__repr__", [](const PoissonReconstructionInfo::Stage &s) {
+                return fmt::format(
+                        "PoissonReconstructionInfo.Stage {}: {:.3f} (s), "
+                        "{:.1f} (MB) / {:.1f} (MB)",
+                        s.name_, s.time_, s.memory_mb_, s.peak_memory_mb_);
+            });
+    poisson_info
+            .def_readwrite("stages", &PoissonReconstructionInfo::stages_,
+                           "List[open3d.geometry.PoissonReconstructionInfo."
+                           "Stage]: Stages in the order they were run.")
+            .def_readwrite("input_point_count",
+                           &PoissonReconstructionInfo::input_point_count_,
+                           "int: Number of input points.")
+            .def_readwrite("sample_count",
+                           &PoissonReconstructionInfo::sample_count_,
+                           "int: Number of samples splatted into the octree.")
+            .def_readwrite("depth", &PoissonReconstructionInfo::depth_,
+                           "int: Depth of the octree actually used for the "
+                           "reconstruction.")
+            .def_readwrite("thread_count",
+                           &PoissonReconstructionInfo::thread_count_,
+                           "int: Number of threads the reconstruction ran "
+                           "with.")
+            .def_readwrite("iso_value", &PoissonReconstructionInfo::iso_value_,
+                           "float: Iso-value of the extracted surface.")
+            .def_readwrite("vertex_count",
+                           &PoissonReconstructionInfo::vertex_count_,
+                           "int: Number of vertices of the extracted surface.")
+            .def_readwrite("triangle_count",
+                           &PoissonReconstructionInfo::triangle_count_,
+                           "int: Number of triangles of the extracted "
+                           "surface.")
+            .def_readwrite("total_time",
+                           &PoissonReconstructionInfo::total_time_,
+                           "float: Total wall-clock time of the "
+                           "reconstruction in seconds.")
+            .def_readwrite("peak_memory_mb",
+                           &PoissonReconstructionInfo::peak_memory_mb_,
+                           "float: Peak memory usage of the process during "
+                           "the reconstruction in MB.")
+            .def("__repr__", [](const PoissonReconstructionInfo &info) {
+                return fmt::format(
+                        "PoissonReconstructionInfo with {} stages, {} "
+                        "vertices and {} triangles in {:.3f} (s), peak "
+                        "memory {:.1f} (MB)",
+                        info.stages_.size(), info.vertex_count_,
+                        info.triangle_count_, info.total_time_,
+                        info.peak_memory_mb_);
+            });
+
     py::class_<TriangleMesh, PyGeometry3D<TriangleMesh>,
                std::shared_ptr<TriangleMesh>, MeshBase>
             trianglemesh(m, "TriangleMesh",
@@ -82,10 +161,28 @@ void pybind_trianglemesh(py::module &m) {
             .def("compute_adjacency_list", &TriangleMesh::ComputeAdjacencyList,
                  "Function to compute adjacency list, call before adjacency "
                  "list is needed")
+            .def("compute_adjacency_csr", &TriangleMesh::ComputeAdjacencyCSR,
+                 py::call_guard<py::gil_scoped_release>(),
+                 "Function to compute the vertex adjacency in compressed "
+                 "sparse row format, in parallel. Returns ``(offsets, "
+                 "neighbors)``, the sorted neighbors of vertex i are "
+                 "``neighbors[offsets[i]:offsets[i + 1]]``. If the adjacency "
+                 "list is set, it is converted.")
             .def("remove_duplicated_vertices",
-                 &TriangleMesh::RemoveDuplicatedVertices,
+                 (TriangleMesh & (TriangleMesh::*)()) &
+                         TriangleMesh::RemoveDuplicatedVertices,
                  "Function that removes duplicated verties, i.e., vertices "
                  "that have identical coordinates.")
+            .def(
+                    "remove_duplicated_vertices_with_remap",
+                    [](TriangleMesh &mesh) {
+                        std::vector<int> vertex_remap;
+                        mesh.RemoveDuplicatedVertices(vertex_remap);
+                        return vertex_remap;
+                    },
+                    "Function that removes duplicated verties, i.e., vertices "
+                    "that have identical coordinates, and returns the index of "
+                    "the new vertex of every vertex before the call.")
             .def("remove_duplicated_triangles",
                  &TriangleMesh::RemoveDuplicatedTriangles,
                  "Function that removes duplicated triangles, i.e., removes "
@@ -107,7 +204,9 @@ void pybind_trianglemesh(py::module &m) {
                  "successively deleting  triangles with the smallest surface "
                  "area adjacent to the non-manifold edge until the number of "
                  "adjacent triangles to the edge is `<= 2`.")
-            .def("merge_close_vertices", &TriangleMesh::MergeCloseVertices,
+            .def("merge_close_vertices",
+                 (TriangleMesh & (TriangleMesh::*)(double)) &
+                         TriangleMesh::MergeCloseVertices,
                  "Function that will merge close by vertices to a single one. "
                  "The vertex position, "
                  "normal and color will be the average of the vertices. The "
@@ -116,6 +215,17 @@ void pybind_trianglemesh(py::module &m) {
                  "function might help to "
                  "close triangle soups.",
                  "eps"_a)
+            .def(
+                    "merge_close_vertices_with_remap",
+                    [](TriangleMesh &mesh, double eps) {
+                        std::vector<int> vertex_remap;
+                        mesh.MergeCloseVertices(eps, vertex_remap);
+                        return vertex_remap;
+                    },
+                    "Function that will merge close by vertices to a single "
+                    "one, and returns the index of the merged vertex of every "
+                    "vertex before the call.",
+                    "eps"_a)
             .def("filter_sharpen", &TriangleMesh::FilterSharpen,
                  "Function to sharpen triangle mesh. The output value "
                  "(:math:`v_o`) is the input value (:math:`v_i`) plus strength "
@@ -215,6 +325,21 @@ void pybind_trianglemesh(py::module &m) {
                  "``indices``: "
                  "Indices of vertices to be selected.",
                  "indices"_a, "cleanup"_a = true)
+            .def(
+                    "select_by_mask",
+                    [](const TriangleMesh &mesh, const PyBoolArray &mask,
+                       bool cleanup) {
+                        return mesh.SelectByMask(PyArrayToMask(mask), cleanup);
+                    },
+                    "Function to select mesh from input triangle mesh into "
+                    "output triangle mesh with a boolean vertex mask, in "
+                    "parallel.",
+                    "mask"_a, "cleanup"_a = true)
+            .def("select_by_mask", &TriangleMesh::SelectByMask,
+                 "Function to select mesh from input triangle mesh into "
+                 "output triangle mesh with a boolean vertex mask, in "
+                 "parallel.",
+                 "mask"_a, "cleanup"_a = true)
             .def("crop",
                  (std::shared_ptr<TriangleMesh>(TriangleMesh::*)(
                          const AxisAlignedBoundingBox &) const) &
@@ -271,7 +396,7 @@ void pybind_trianglemesh(py::module &m) {
                  "Garland and Heckbert",
                  "target_number_of_triangles"_a,
                  "maximum_error"_a = std::numeric_limits<double>::infinity(),
-                 "boundary_weight"_a = 1.0)
+                 "boundary_weight"_a = 1.0, "parallel"_a = false)
             .def("compute_convex_hull", &TriangleMesh::ComputeConvexHull,
                  "Computes the convex hull of the triangle mesh.")
             .def("cluster_connected_triangles",
@@ -288,6 +413,16 @@ void pybind_trianglemesh(py::module &m) {
                  "triangle_indices.  Call remove_unreferenced_vertices to "
                  "clean up vertices afterwards.",
                  "triangle_indices"_a)
+            .def(
+                    "remove_triangles_by_mask",
+                    [](TriangleMesh &mesh, const PyBoolArray &triangle_mask) {
+                        mesh.RemoveTrianglesByMask(
+                                PyArrayToMask(triangle_mask));
+                    },
+                    "This function removes the triangles where triangle_mask "
+                    "is set to true.  Call remove_unreferenced_vertices to "
+                    "clean up vertices afterwards.",
+                    "triangle_mask"_a)
             .def("remove_triangles_by_mask",
                  &TriangleMesh::RemoveTrianglesByMask,
                  "This function removes the triangles where triangle_mask is "
@@ -300,6 +435,15 @@ void pybind_trianglemesh(py::module &m) {
                  "vertex_indices. Note that also all triangles associated with "
                  "the vertices are removed.",
                  "vertex_indices"_a)
+            .def(
+                    "remove_vertices_by_mask",
+                    [](TriangleMesh &mesh, const PyBoolArray &vertex_mask) {
+                        mesh.RemoveVerticesByMask(PyArrayToMask(vertex_mask));
+                    },
+                    "This function removes the vertices that are masked in "
+                    "vertex_mask. Note that also all triangles associated with "
+                    "the vertices are removed.",
+                    "vertex_mask"_a)
             .def("remove_vertices_by_mask", &TriangleMesh::RemoveVerticesByMask,
                  "This function removes the vertices that are masked in "
                  "vertex_mask. Note that also all triangles associated with "
@@ -345,7 +489,7 @@ void pybind_trianglemesh(py::module &m) {
                     "reconstruction is done by rolling a ball with a given "
                     "radius over the point cloud, whenever the ball touches "
                     "three points a triangle is created.",
-                    "pcd"_a, "radii"_a)
+                    "pcd"_a, "radii"_a, "parallel"_a = false)
             .def_static("create_from_point_cloud_poisson",
                         &TriangleMesh::CreateFromPointCloudPoisson,
                         "Function that computes a triangle mesh from a "
@@ -355,7 +499,17 @@ void pybind_trianglemesh(py::module &m) {
                         "This function uses the original implementation by "
                         "Kazhdan. See https://github.com/mkazhdan/PoissonRecon",
                         "pcd"_a, "depth"_a = 8, "width"_a = 0, "scale"_a = 1.1,
-                        "linear_fit"_a = false, "n_threads"_a = -1)
+                        "linear_fit"_a = false, "n_threads"_a = -1,
+                        "info"_a = py::none())
+            .def_static("create_from_point_cloud_poisson_to_file",
+                        &TriangleMesh::CreateFromPointCloudPoissonToFile,
+                        "Memory-bounded variant of "
+                        "create_from_point_cloud_poisson that streams the "
+                        "reconstructed surface with its per vertex densities "
+                        "to a binary PLY file instead of returning it.",
+                        "pcd"_a, "filename"_a, "depth"_a = 8, "width"_a = 0,
+                        "scale"_a = 1.1, "linear_fit"_a = false,
+                        "n_threads"_a = -1, "info"_a = py::none())
             .def_static("create_box", &TriangleMesh::CreateBox,
                         "Factory function to create a box. The left bottom "
                         "corner on the "
@@ -459,6 +613,7 @@ void pybind_trianglemesh(py::module &m) {
                            "open3d.geometry.Image: The texture images.");
     docstring::ClassMethodDocInject(m, "TriangleMesh",
                                     "compute_adjacency_list");
+    docstring::ClassMethodDocInject(m, "TriangleMesh", "compute_adjacency_csr");
     docstring::ClassMethodDocInject(m, "TriangleMesh",
                                     "compute_triangle_normals");
     docstring::ClassMethodDocInject(m, "TriangleMesh",
@@ -523,6 +678,12 @@ void pybind_trianglemesh(py::module &m) {
             m, "TriangleMesh", "merge_close_vertices",
             {{"eps",
               "Parameter that defines the distance between close vertices."}});
+    docstring::ClassMethodDocInject(m, "TriangleMesh",
+                                    "remove_duplicated_vertices_with_remap");
+    docstring::ClassMethodDocInject(
+            m, "TriangleMesh", "merge_close_vertices_with_remap",
+            {{"eps",
+              "Parameter that defines the distance between close vertices."}});
     docstring::ClassMethodDocInject(
             m, "TriangleMesh", "filter_sharpen",
             {{"number_of_iterations",
@@ -612,7 +773,10 @@ void pybind_trianglemesh(py::module &m) {
               "The maximum error where a vertex is allowed to be merged"},
              {"boundary_weight",
               "A weight applied to edge vertices used to preserve "
-              "boundaries"}});
+              "boundaries"},
+             {"parallel",
+              "If true, spatial clusters of the mesh are decimated "
+              "concurrently, with the vertices on their seams locked."}});
     docstring::ClassMethodDocInject(m, "TriangleMesh", "compute_convex_hull");
     docstring::ClassMethodDocInject(m, "TriangleMesh",
                                     "cluster_connected_triangles");
@@ -626,6 +790,14 @@ void pybind_trianglemesh(py::module &m) {
                                     {{"triangle_mask",
                                       "1D bool array, True values indicate "
                                       "triangles that should be removed."}});
+    docstring::ClassMethodDocInject(
+            m, "TriangleMesh", "select_by_mask",
+            {{"mask",
+              "1D bool array with one entry per vertex, True values indicate "
+              "vertices to be selected."},
+             {"cleanup",
+              "If true calls number of mesh cleanup functions to remove "
+              "unreferenced vertices and degenerate triangles"}});
     docstring::ClassMethodDocInject(
             m, "TriangleMesh", "remove_vertices_by_index",
             {{"vertex_indices",
@@ -671,7 +843,10 @@ void pybind_trianglemesh(py::module &m) {
               "reconstructed. Has to contain normals."},
              {"radii",
               "The radii of the ball that are used for the surface "
-              "reconstruction."}});
+              "reconstruction."},
+             {"parallel",
+              "If True, reconstruct blocks of the point cloud concurrently "
+              "and stitch their seams afterwards."}});
     docstring::ClassMethodDocInject(
             m, "TriangleMesh", "create_from_point_cloud_poisson",
             {{"pcd",
@@ -695,7 +870,34 @@ void pybind_trianglemesh(py::module &m) {
               "estimate the positions of iso-vertices."},
              {"n_threads",
               "Number of threads used for reconstruction. Set to -1 to "
-              "automatically determine it."}});
+              "automatically determine it."},
+             {"info",
+              "Optional PoissonReconstructionInfo that receives the timing "
+              "and memory usage of every stage."}});
+    docstring::ClassMethodDocInject(
+            m, "TriangleMesh", "create_from_point_cloud_poisson_to_file",
+            {{"pcd",
+              "PointCloud from which the TriangleMesh surface is "
+              "reconstructed. Has to contain normals."},
+             {"filename", "Path of the output PLY file."},
+             {"depth",
+              "Maximum depth of the tree that will be used for surface "
+              "reconstruction."},
+             {"width",
+              "Specifies the target width of the finest level octree cells. "
+              "This parameter is ignored if depth is specified"},
+             {"scale",
+              "Specifies the ratio between the diameter of the cube used for "
+              "reconstruction and the diameter of the samples' bounding cube."},
+             {"linear_fit",
+              "If true, the reconstructor will use linear interpolation to "
+              "estimate the positions of iso-vertices."},
+             {"n_threads",
+              "Number of threads used for reconstruction. Set to -1 to "
+              "automatically determine it."},
+             {"info",
+              "Optional PoissonReconstructionInfo that receives the timing "
+              "and memory usage of every stage."}});
     docstring::ClassMethodDocInject(m, "TriangleMesh", "create_box",
                                     {{"width", "x-directional length."},
                                      {"height", "y-directional length."},
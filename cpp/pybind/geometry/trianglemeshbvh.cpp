@@ -0,0 +1,118 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/geometry/TriangleMeshBVH.h"
+
+#include "open3d/geometry/TriangleMesh.h"
+#include "pybind/docstring.h"
+#include "pybind/geometry/geometry.h"
+
+namespace open3d {
+namespace geometry {
+
+void pybind_trianglemeshbvh(py::module &m) {
+    // open3d.geometry.TriangleMeshBVH
+    static const std::unordered_map<std::string, std::string>
+            map_trianglemeshbvh_method_docs = {
+                    {"mesh", "The triangle mesh."},
+                    {"max_leaf_size", "Maximum number of triangles in a leaf."},
+                    {"other", "The BVH of the other triangle mesh."},
+                    {"origins", "Origins of the rays."},
+                    {"directions",
+                     "Directions of the rays, not necessarily normalized."},
+                    {"query_points", "Query points."}};
+    py::class_<TriangleMeshBVH, std::shared_ptr<TriangleMeshBVH>>
+            trianglemeshbvh(m, "TriangleMeshBVH",
+                            "Bounding volume hierarchy over the triangles of "
+                            "a triangle mesh, built with the surface area "
+                            "heuristic, for intersection, ray casting and "
+                            "closest point queries. Batched queries release "
+                            "the GIL and run in parallel.");
+    trianglemeshbvh
+            .def(py::init<const TriangleMesh &, int>(), "mesh"_a,
+                 "max_leaf_size"_a = 4)
+            .def("__repr__",
+                 [](const TriangleMeshBVH &bvh) {
+                     return std::string("TriangleMeshBVH with ") +
+                            std::to_string(bvh.triangles_.size()) +
+                            " triangles and " +
+                            std::to_string(bvh.nodes_.size()) + " nodes.";
+                 })
+            .def_static("create_from_triangle_mesh",
+                        &TriangleMeshBVH::CreateFromTriangleMesh,
+                        "Function to create a TriangleMeshBVH from a triangle "
+                        "mesh.",
+                        "mesh"_a, "max_leaf_size"_a = 4)
+            .def("is_empty", &TriangleMeshBVH::IsEmpty,
+                 "Returns ``True`` if the BVH holds no triangles.")
+            .def("get_self_intersecting_triangles",
+                 &TriangleMeshBVH::GetSelfIntersectingTriangles,
+                 py::call_guard<py::gil_scoped_release>(),
+                 "Returns the sorted pairs (i, j), i < j, of intersecting "
+                 "triangles that do not share a vertex.")
+            .def("is_intersecting", &TriangleMeshBVH::IsIntersecting,
+                 py::call_guard<py::gil_scoped_release>(),
+                 "Returns ``True`` if a triangle of this BVH intersects a "
+                 "triangle of the other BVH.",
+                 "other"_a)
+            .def("cast_rays", &TriangleMeshBVH::CastRays,
+                 py::call_guard<py::gil_scoped_release>(),
+                 "Casts rays on the mesh. Returns ``(t_hit, triangle_ids)``, "
+                 "where the hit of ray i is at ``origins[i] + t_hit[i] * "
+                 "directions[i]``. Rays that miss the mesh have ``t_hit`` set "
+                 "to infinity and triangle id -1.",
+                 "origins"_a, "directions"_a)
+            .def("compute_closest_points",
+                 &TriangleMeshBVH::ComputeClosestPoints,
+                 py::call_guard<py::gil_scoped_release>(),
+                 "Computes the closest points on the mesh. Returns "
+                 "``(closest_points, triangle_ids)``.",
+                 "query_points"_a)
+            .def("compute_distance", &TriangleMeshBVH::ComputeDistance,
+                 py::call_guard<py::gil_scoped_release>(),
+                 "Computes the distance from the query points to the mesh.",
+                 "query_points"_a)
+            .def_readonly("max_leaf_size", &TriangleMeshBVH::max_leaf_size_,
+                          "Maximum number of triangles in a leaf.");
+    docstring::ClassMethodDocInject(m, "TriangleMeshBVH",
+                                    "create_from_triangle_mesh",
+                                    map_trianglemeshbvh_method_docs);
+    docstring::ClassMethodDocInject(m, "TriangleMeshBVH", "is_empty");
+    docstring::ClassMethodDocInject(m, "TriangleMeshBVH",
+                                    "get_self_intersecting_triangles");
+    docstring::ClassMethodDocInject(m, "TriangleMeshBVH", "is_intersecting",
+                                    map_trianglemeshbvh_method_docs);
+    docstring::ClassMethodDocInject(m, "TriangleMeshBVH", "cast_rays",
+                                    map_trianglemeshbvh_method_docs);
+    docstring::ClassMethodDocInject(m, "TriangleMeshBVH",
+                                    "compute_closest_points",
+                                    map_trianglemeshbvh_method_docs);
+    docstring::ClassMethodDocInject(m, "TriangleMeshBVH", "compute_distance",
+                                    map_trianglemeshbvh_method_docs);
+}
+
+}  // namespace geometry
+}  // namespace open3d
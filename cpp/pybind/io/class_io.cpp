@@ -239,6 +239,37 @@ void pybind_class_io(py::module &m_io) {
     docstring::FunctionDocInject(m_io, "write_triangle_mesh",
                                  map_shared_argument_docstrings);
 
+    m_io.def(
+            "simplify_triangle_mesh_file_vertex_clustering",
+            [](const std::string &input_filename,
+               const std::string &output_filename, double voxel_size,
+               geometry::MeshBase::SimplificationContraction contraction,
+               bool print_progress) {
+                py::gil_scoped_release release;
+                return SimplifyTriangleMeshFileVertexClustering(
+                        input_filename, output_filename, voxel_size,
+                        contraction, print_progress);
+            },
+            "Function to simplify a .ply or .obj mesh file that does not fit "
+            "in memory with vertex clustering, reading it chunk by chunk, and "
+            "to write the simplified mesh",
+            "input_filename"_a, "output_filename"_a, "voxel_size"_a,
+            "contraction"_a =
+                    geometry::MeshBase::SimplificationContraction::Average,
+            "print_progress"_a = false);
+    docstring::FunctionDocInject(
+            m_io, "simplify_triangle_mesh_file_vertex_clustering",
+            {{"input_filename", "Path to the input .ply or .obj file."},
+             {"output_filename", "Path to the simplified mesh."},
+             {"voxel_size",
+              "The size of the voxel within vertices are pooled."},
+             {"contraction",
+              "Method to aggregate vertex information. Average computes a "
+              "simple average, Quadric minimizes the distance to the adjacent "
+              "planes."},
+             {"print_progress",
+              "If set to true a progress bar is visualized in the console"}});
+
     // open3d::geometry::VoxelGrid
     m_io.def(
             "read_voxel_grid",
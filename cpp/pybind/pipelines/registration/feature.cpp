@@ -26,6 +26,7 @@
 
 #include "open3d/pipelines/registration/Feature.h"
 
+#include "open3d/geometry/NeighborGraph.h"
 #include "open3d/geometry/PointCloud.h"
 #include "pybind/docstring.h"
 #include "pybind/pipelines/registration/registration.h"
@@ -67,11 +68,14 @@ void pybind_feature(py::module &m) {
 void pybind_feature_methods(py::module &m) {
     m.def("compute_fpfh_feature", &ComputeFPFHFeature,
           "Function to compute FPFH feature for a point cloud", "input"_a,
-          "search_param"_a);
+          "search_param"_a, "neighbor_graph"_a = nullptr);
     docstring::FunctionDocInject(
             m, "compute_fpfh_feature",
             {{"input", "The Input point cloud."},
-             {"search_param", "KDTree KNN search parameter."}});
+             {"search_param", "KDTree KNN search parameter."},
+             {"neighbor_graph",
+              "Optional NeighborGraph of the input point cloud, covering "
+              "``search_param``."}});
 }
 
 }  // namespace registration
@@ -539,6 +539,9 @@ static const std::unordered_map<std::string, std::string>
                  "TransformationEstimationPointToPlane``, "
                  "``"
                  "TransformationEstimationForColoredICP``)"},
+                {"feature_index_param",
+                 "Index parameters of the KDTree used for feature matching. "
+                 "Use a randomized KDTree forest for approximate matching."},
                 {"init", "Initial transformation estimation"},
                 {"lambda_geometric", "lambda_geometric value"},
                 {"kernel", "Robust Kernel used in the Optimization"},
@@ -599,7 +602,8 @@ void pybind_registration_methods(py::module &m) {
           "ransac_n"_a = 4,
           "checkers"_a = std::vector<
                   std::reference_wrapper<const CorrespondenceChecker>>(),
-          "criteria"_a = RANSACConvergenceCriteria(100000, 100));
+          "criteria"_a = RANSACConvergenceCriteria(100000, 100),
+          "feature_index_param"_a = geometry::KDTreeIndexParam());
     docstring::FunctionDocInject(
             m, "registration_ransac_based_on_feature_matching",
             map_shared_argument_docstrings);
@@ -51,6 +51,7 @@ void pybind_geometry(py::module& m) {
     pybind_geometry_class(m_submodule);
     pybind_tensorlistmap(m_submodule);
     pybind_pointcloud(m_submodule);
+    pybind_voxelgrid(m_submodule);
 }
 
 }  // namespace geometry
@@ -52,6 +52,7 @@ void pybind_geometry(py::module& m);
 void pybind_geometry_class(py::module& m);
 void pybind_tensorlistmap(py::module& m);
 void pybind_pointcloud(py::module& m);
+void pybind_voxelgrid(py::module& m);
 
 }  // namespace geometry
 }  // namespace t
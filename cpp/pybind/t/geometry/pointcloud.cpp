@@ -75,6 +75,9 @@ void pybind_pointcloud(py::module& m) {
                    "Scale points.");
     pointcloud.def("rotate", &PointCloud::Rotate, "R"_a, "center"_a,
                    "Rotate points and normals (if exist).");
+    pointcloud.def("sort_by_morton_code", &PointCloud::SortByMortonCode,
+                   "Reorder points and all point attributes along a Morton "
+                   "(Z-order) curve. Returns the Int64 permutation.");
     pointcloud.def_static(
             "from_legacy_pointcloud", &PointCloud::FromLegacyPointCloud,
             "pcd_legacy"_a, "dtype"_a = core::Dtype::Float32,
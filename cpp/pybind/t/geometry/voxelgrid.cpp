@@ -0,0 +1,116 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2020 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/t/geometry/VoxelGrid.h"
+
+#include "open3d/camera/PinholeCameraParameters.h"
+#include "open3d/geometry/Image.h"
+#include "open3d/t/geometry/PointCloud.h"
+#include "pybind/t/geometry/geometry.h"
+
+namespace open3d {
+namespace t {
+namespace geometry {
+
+void pybind_voxelgrid(py::module& m) {
+    py::class_<VoxelGrid, PyGeometry<VoxelGrid>, std::unique_ptr<VoxelGrid>,
+               Geometry>
+            voxelgrid(m, "VoxelGrid",
+                      "A compact voxel grid that stores the grid indices and "
+                      "colors of its voxels as tensors, indexed by a flat "
+                      "table of rows.");
+
+    // Constructors.
+    voxelgrid.def(py::init<double, const Eigen::Vector3d&, core::Dtype,
+                           const core::Device&>(),
+                  "voxel_size"_a = 1.0, "origin"_a = Eigen::Vector3d::Zero(),
+                  "color_dtype"_a = core::Dtype::Float32,
+                  "device"_a = core::Device("CPU:0"));
+
+    voxelgrid.def_property_readonly("grid_indices", &VoxelGrid::GetGridIndices,
+                                    "Int32 tensor of shape {n, 3} with the "
+                                    "grid index of every voxel.");
+    voxelgrid.def_property_readonly(
+            "colors", &VoxelGrid::GetColors,
+            "Tensor of shape {n, 3} with the color of every voxel.");
+    voxelgrid.def_property_readonly("voxel_size", &VoxelGrid::GetVoxelSize);
+    voxelgrid.def_property_readonly("origin", &VoxelGrid::GetOrigin);
+    voxelgrid.def_property_readonly("color_dtype", &VoxelGrid::GetColorDtype);
+    voxelgrid.def_property_readonly("device", &VoxelGrid::GetDevice);
+
+    // VoxelGrid specific functions.
+    voxelgrid.def("has_voxels", &VoxelGrid::HasVoxels,
+                  "Returns True if the voxel grid contains voxels.");
+    voxelgrid.def("get_size", &VoxelGrid::GetSize, "Number of voxels.");
+    voxelgrid.def("get_voxel_indices", &VoxelGrid::GetVoxelIndices, "points"_a,
+                  "Returns the Int32 grid indices of the voxels that contain "
+                  "the points.");
+    voxelgrid.def("add_voxels", &VoxelGrid::AddVoxels, "grid_indices"_a,
+                  "colors"_a,
+                  "Insert voxels in a batch. Colors of existing voxels are "
+                  "overwritten.");
+    voxelgrid.def("find_voxels", &VoxelGrid::FindVoxels, "grid_indices"_a,
+                  "Returns the Int64 rows of the voxels with the given grid "
+                  "indices, -1 for grid indices without voxel.");
+    voxelgrid.def("check_if_included", &VoxelGrid::CheckIfIncluded, "queries"_a,
+                  "Element-wise check if the queries are included in the "
+                  "voxel grid.");
+    voxelgrid.def("carve_depth_map", &VoxelGrid::CarveDepthMap, "depth_map"_a,
+                  "camera_params"_a, "keep_voxels_outside_image"_a = false,
+                  "Remove all voxels where none of the boundary points of "
+                  "the voxel projects to a depth value that is smaller, or "
+                  "equal than the projected depth of the boundary point.");
+    voxelgrid.def("carve_silhouette", &VoxelGrid::CarveSilhouette,
+                  "silhouette_mask"_a, "camera_params"_a,
+                  "keep_voxels_outside_image"_a = false,
+                  "Remove all voxels where none of the boundary points of "
+                  "the voxel projects to a valid mask pixel (pixel value > "
+                  "0).");
+    voxelgrid.def_static("create_from_point_cloud",
+                         &VoxelGrid::CreateFromPointCloud, "input"_a,
+                         "voxel_size"_a, "color_dtype"_a = core::Dtype::Float32,
+                         "Creates a VoxelGrid from a PointCloud. The color of "
+                         "a voxel is the average color of its points.");
+    voxelgrid.def_static("create_from_point_cloud_within_bounds",
+                         &VoxelGrid::CreateFromPointCloudWithinBounds,
+                         "input"_a, "voxel_size"_a, "min_bound"_a,
+                         "max_bound"_a, "color_dtype"_a = core::Dtype::Float32,
+                         "Creates a VoxelGrid from a PointCloud whose origin "
+                         "is min_bound.");
+    voxelgrid.def_static("from_legacy_voxel_grid",
+                         &VoxelGrid::FromLegacyVoxelGrid, "voxel_grid_legacy"_a,
+                         "color_dtype"_a = core::Dtype::Float64,
+                         "device"_a = core::Device("CPU:0"),
+                         "Create a VoxelGrid from a legacy Open3D VoxelGrid. "
+                         "The conversion is lossless with the default Float64 "
+                         "colors.");
+    voxelgrid.def("to_legacy_voxel_grid", &VoxelGrid::ToLegacyVoxelGrid,
+                  "Convert to a legacy Open3D VoxelGrid.");
+}
+
+}  // namespace geometry
+}  // namespace t
+}  // namespace open3d
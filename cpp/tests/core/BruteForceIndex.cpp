@@ -0,0 +1,162 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/core/nns/BruteForceIndex.h"
+
+#include <cmath>
+#include <limits>
+#include <random>
+
+#include "open3d/core/Dtype.h"
+#include "open3d/core/SizeVector.h"
+#include "open3d/core/nns/NanoFlannIndex.h"
+#include "open3d/core/nns/NearestNeighborSearch.h"
+#include "tests/UnitTest.h"
+
+namespace open3d {
+namespace tests {
+
+TEST(BruteForceIndex, SearchKnn) {
+    int size = 10;
+    std::vector<double> points{0.0, 0.0, 0.0, 0.0, 0.0, 0.1, 0.0, 0.0,
+                               0.2, 0.0, 0.1, 0.0, 0.0, 0.1, 0.1, 0.0,
+                               0.1, 0.2, 0.0, 0.2, 0.0, 0.0, 0.2, 0.1,
+                               0.0, 0.2, 0.2, 0.1, 0.0, 0.0};
+    core::Tensor ref(points, {size, 3}, core::Dtype::Float64);
+    core::nns::BruteForceIndex index(ref);
+
+    core::Tensor query(std::vector<double>({0.064705, 0.043921, 0.087843}),
+                       {1, 3}, core::Dtype::Float64);
+
+    // if k is smaller or equal to 0
+    EXPECT_THROW(index.SearchKnn(query, -1), std::runtime_error);
+    EXPECT_THROW(index.SearchKnn(query, 0), std::runtime_error);
+
+    // if k == 3
+    core::Tensor indices;
+    core::Tensor distances;
+    std::tie(indices, distances) = index.SearchKnn(query, 3);
+    ExpectEQ(indices.ToFlatVector<int64_t>(), std::vector<int64_t>({1, 4, 9}));
+    ExpectEQ(distances.ToFlatVector<double>(),
+             std::vector<double>({0.00626358, 0.00747938, 0.0108912}));
+    EXPECT_EQ(indices.GetShape(), core::SizeVector({1, 3}));
+    EXPECT_EQ(distances.GetShape(), core::SizeVector({1, 3}));
+
+    // if k > size
+    std::tie(indices, distances) = index.SearchKnn(query, 12);
+    ExpectEQ(indices.ToFlatVector<int64_t>(),
+             std::vector<int64_t>({1, 4, 9, 0, 3, 2, 5, 7, 6, 8}));
+    ExpectEQ(distances.ToFlatVector<double>(),
+             std::vector<double>({0.00626358, 0.00747938, 0.0108912, 0.0138322,
+                                  0.015048, 0.018695, 0.0199108, 0.0286952,
+                                  0.0362638, 0.0411266}));
+    EXPECT_EQ(indices.GetShape(), core::SizeVector({1, 10}));
+}
+
+TEST(BruteForceIndex, SearchRadius) {
+    int size = 10;
+    std::vector<float> points{0.0, 0.0, 0.0, 0.0, 0.0, 0.1, 0.0, 0.0, 0.2, 0.0,
+                              0.1, 0.0, 0.0, 0.1, 0.1, 0.0, 0.1, 0.2, 0.0, 0.2,
+                              0.0, 0.0, 0.2, 0.1, 0.0, 0.2, 0.2, 0.1, 0.0, 0.0};
+    core::Tensor ref(points, {size, 3}, core::Dtype::Float32);
+    core::nns::BruteForceIndex index(ref);
+
+    core::Tensor query(std::vector<float>({0.064705, 0.043921, 0.087843,
+                                           0.064705, 0.043921, 0.087843}),
+                       {2, 3}, core::Dtype::Float32);
+
+    // if radius <= 0
+    EXPECT_THROW(index.SearchRadius(query, -1.0), std::runtime_error);
+    EXPECT_THROW(index.SearchRadius(query, 0.0), std::runtime_error);
+
+    core::Tensor radii(std::vector<float>({0.1, 0.08}), {2},
+                       core::Dtype::Float32);
+    core::Tensor indices, distances, num_neighbors;
+    std::tie(indices, distances, num_neighbors) =
+            index.SearchRadius(query, radii);
+    ExpectEQ(indices.ToFlatVector<int64_t>(), std::vector<int64_t>({1, 4, 1}));
+    ExpectEQ(distances.ToFlatVector<float>(),
+             std::vector<float>({0.00626358, 0.00747938, 0.00626358}));
+    ExpectEQ(num_neighbors.ToFlatVector<int64_t>(),
+             std::vector<int64_t>({2, 1}));
+}
+
+TEST(BruteForceIndex, CompareNanoFlann) {
+    // Several query and dataset tiles.
+    const int64_t num_points = 3000;
+    const int64_t num_queries = 150;
+    std::mt19937 rng(0);
+    std::uniform_real_distribution<double> dist(0.0, 10.0);
+    std::vector<double> points(num_points * 3);
+    std::vector<double> queries(num_queries * 3);
+    for (double &v : points) {
+        v = dist(rng);
+    }
+    for (double &v : queries) {
+        v = dist(rng);
+    }
+    core::Tensor dataset(points, {num_points, 3}, core::Dtype::Float64);
+    core::Tensor query(queries, {num_queries, 3}, core::Dtype::Float64);
+
+    core::nns::BruteForceIndex index(dataset);
+    core::nns::NanoFlannIndex ref_index(dataset);
+
+    core::Tensor indices, distances, ref_indices, ref_distances;
+    std::tie(indices, distances) = index.SearchKnn(query, 7);
+    std::tie(ref_indices, ref_distances) = ref_index.SearchKnn(query, 7);
+    ExpectEQ(indices.ToFlatVector<int64_t>(),
+             ref_indices.ToFlatVector<int64_t>());
+    ExpectEQ(distances.ToFlatVector<double>(),
+             ref_distances.ToFlatVector<double>());
+
+    core::Tensor num_neighbors, ref_num_neighbors;
+    std::tie(indices, distances, num_neighbors) =
+            index.SearchRadius(query, 0.5);
+    std::tie(ref_indices, ref_distances, ref_num_neighbors) =
+            ref_index.SearchRadius(query, 0.5);
+    ExpectEQ(num_neighbors.ToFlatVector<int64_t>(),
+             ref_num_neighbors.ToFlatVector<int64_t>());
+    ExpectEQ(indices.ToFlatVector<int64_t>(),
+             ref_indices.ToFlatVector<int64_t>());
+}
+
+TEST(BruteForceIndex, NearestNeighborSearchAuto) {
+    EXPECT_EQ(core::nns::NearestNeighborSearch::SelectBackend(1000, 3),
+              core::nns::NNSBackend::BruteForce);
+    EXPECT_EQ(core::nns::NearestNeighborSearch::SelectBackend(100000, 33),
+              core::nns::NNSBackend::BruteForce);
+    EXPECT_EQ(core::nns::NearestNeighborSearch::SelectBackend(100000, 3),
+              core::nns::NNSBackend::NanoFlann);
+
+    core::Tensor dataset = core::Tensor::Ones({100, 3}, core::Dtype::Float32);
+    core::nns::NearestNeighborSearch nns(dataset);
+    EXPECT_EQ(nns.GetBackend(), core::nns::NNSBackend::Auto);
+    nns.KnnIndex();
+    EXPECT_EQ(nns.GetBackend(), core::nns::NNSBackend::BruteForce);
+}
+
+}  // namespace tests
+}  // namespace open3d
@@ -0,0 +1,202 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/core/nns/DynamicNanoFlannIndex.h"
+
+#include <algorithm>
+#include <numeric>
+
+#include "open3d/core/Dtype.h"
+#include "open3d/core/SizeVector.h"
+#include "tests/UnitTest.h"
+
+namespace open3d {
+namespace tests {
+
+static core::Tensor MakeLinePoints(int64_t begin, int64_t end) {
+    std::vector<double> points;
+    for (int64_t i = begin; i < end; ++i) {
+        points.push_back(0.1 * i);
+        points.push_back(0.0);
+        points.push_back(0.0);
+    }
+    return core::Tensor(points, {end - begin, 3}, core::Dtype::Float64);
+}
+
+TEST(DynamicNanoFlannIndex, AddPoints) {
+    core::nns::DynamicNanoFlannIndex index(3, core::Dtype::Float64, 4);
+
+    core::Tensor indices = index.AddPoints(MakeLinePoints(0, 3));
+    ExpectEQ(indices.ToFlatVector<int64_t>(), std::vector<int64_t>({0, 1, 2}));
+    indices = index.AddPoints(MakeLinePoints(3, 10));
+    ExpectEQ(indices.ToFlatVector<int64_t>(),
+             std::vector<int64_t>({3, 4, 5, 6, 7, 8, 9}));
+    indices = index.AddPoints(MakeLinePoints(10, 12));
+    EXPECT_EQ(index.GetDatasetSize(), 12);
+    EXPECT_EQ(index.GetNumTrees(), 2);
+
+    // Wrong dimension or dtype.
+    EXPECT_THROW(
+            index.AddPoints(core::Tensor::Zeros({2, 2}, core::Dtype::Float64)),
+            std::runtime_error);
+    EXPECT_THROW(
+            index.AddPoints(core::Tensor::Zeros({2, 3}, core::Dtype::Float32)),
+            std::runtime_error);
+}
+
+TEST(DynamicNanoFlannIndex, SearchKnn) {
+    core::nns::DynamicNanoFlannIndex index(3, core::Dtype::Float64, 4);
+    for (int64_t i = 0; i < 20; i += 5) {
+        index.AddPoints(MakeLinePoints(i, i + 5));
+    }
+    core::Tensor query(std::vector<double>({0.52, 0.0, 0.0}), {1, 3},
+                       core::Dtype::Float64);
+
+    EXPECT_THROW(index.SearchKnn(query, 0), std::runtime_error);
+
+    core::Tensor indices;
+    core::Tensor distances;
+    std::tie(indices, distances) = index.SearchKnn(query, 3);
+    ExpectEQ(indices.ToFlatVector<int64_t>(), std::vector<int64_t>({5, 6, 4}));
+    ExpectEQ(distances.ToFlatVector<double>(),
+             std::vector<double>({0.0004, 0.0064, 0.0144}));
+
+    // Removed points are never returned.
+    index.RemovePoints(core::Tensor(std::vector<int64_t>({4, 5}), {2},
+                                    core::Dtype::Int64));
+    std::tie(indices, distances) = index.SearchKnn(query, 3);
+    ExpectEQ(indices.ToFlatVector<int64_t>(), std::vector<int64_t>({6, 7, 3}));
+    EXPECT_EQ(index.GetDatasetSize(), 18);
+
+    // Removing twice is a no-op, out of range indices are rejected.
+    index.RemovePoints(
+            core::Tensor(std::vector<int64_t>({4}), {1}, core::Dtype::Int64));
+    EXPECT_EQ(index.GetDatasetSize(), 18);
+    EXPECT_THROW(index.RemovePoints(core::Tensor(std::vector<int64_t>({20}),
+                                                 {1}, core::Dtype::Int64)),
+                 std::runtime_error);
+
+    // knn is clamped to the number of points in the index.
+    std::tie(indices, distances) = index.SearchKnn(query, 30);
+    EXPECT_EQ(indices.GetShape(), core::SizeVector({1, 18}));
+    EXPECT_EQ(distances.GetShape(), core::SizeVector({1, 18}));
+}
+
+TEST(DynamicNanoFlannIndex, SearchRadius) {
+    core::nns::DynamicNanoFlannIndex index(3, core::Dtype::Float64, 2);
+    for (int64_t i = 0; i < 20; i += 3) {
+        index.AddPoints(MakeLinePoints(i, std::min<int64_t>(i + 3, 20)));
+    }
+    core::Tensor query(std::vector<double>({0.52, 0.0, 0.0, 1.01, 0.0, 0.0}),
+                       {2, 3}, core::Dtype::Float64);
+
+    core::Tensor indices;
+    core::Tensor distances;
+    core::Tensor num_neighbors;
+    std::tie(indices, distances, num_neighbors) =
+            index.SearchRadius(query, 0.15);
+    ExpectEQ(indices.ToFlatVector<int64_t>(),
+             std::vector<int64_t>({5, 6, 4, 10, 11, 9}));
+    ExpectEQ(num_neighbors.ToFlatVector<int64_t>(),
+             std::vector<int64_t>({3, 3}));
+
+    // Remove most points to trigger a compaction, then re-insert them.
+    std::vector<int64_t> removed;
+    for (int64_t i = 0; i < 20; ++i) {
+        if (i != 5 && i != 10) {
+            removed.push_back(i);
+        }
+    }
+    index.RemovePoints(core::Tensor(removed, {18}, core::Dtype::Int64));
+    std::tie(indices, distances, num_neighbors) =
+            index.SearchRadius(query, 0.15);
+    ExpectEQ(indices.ToFlatVector<int64_t>(), std::vector<int64_t>({5, 10}));
+
+    index.AddPoints(MakeLinePoints(4, 7));
+    std::tie(indices, distances, num_neighbors) =
+            index.SearchRadius(query, 0.15);
+    ExpectEQ(indices.ToFlatVector<int64_t>(),
+             std::vector<int64_t>({5, 21, 22, 20, 10}));
+    ExpectEQ(num_neighbors.ToFlatVector<int64_t>(),
+             std::vector<int64_t>({4, 1}));
+}
+
+// Exposes the number of rows stored in the forest, removed or not.
+class DynamicNanoFlannIndexRows : public core::nns::DynamicNanoFlannIndex {
+public:
+    using DynamicNanoFlannIndex::DynamicNanoFlannIndex;
+
+    int64_t NumStoredRows() const {
+        int64_t num_rows = 0;
+        for (const Tree &tree : trees_) {
+            num_rows += static_cast<int64_t>(tree.indices_.size() +
+                                             tree.removed_.size());
+        }
+        return num_rows;
+    }
+};
+
+TEST(DynamicNanoFlannIndex, SlidingWindow) {
+    // Stream batches into the index and remove the oldest one every time, so
+    // that it holds a window of 10 batches. The memory of the forest must not
+    // grow with the number of points ever inserted.
+    DynamicNanoFlannIndexRows index(3, core::Dtype::Float64, 4);
+    const int64_t batch_size = 5;
+    const int64_t window = 10;
+    int64_t max_stored_rows = 0;
+    for (int64_t batch = 0; batch < 400; ++batch) {
+        index.AddPoints(
+                MakeLinePoints(batch * batch_size, (batch + 1) * batch_size));
+        if (batch >= window) {
+            std::vector<int64_t> oldest(batch_size);
+            std::iota(oldest.begin(), oldest.end(),
+                      (batch - window) * batch_size);
+            index.RemovePoints(
+                    core::Tensor(oldest, {batch_size}, core::Dtype::Int64));
+        }
+        if (batch == 100) {
+            max_stored_rows = index.NumStoredRows();
+        }
+    }
+    EXPECT_EQ(index.GetDatasetSize(), window * batch_size);
+    EXPECT_LE(index.NumStoredRows(), 8 * window * batch_size);
+    EXPECT_LE(index.NumStoredRows(), 2 * max_stored_rows);
+
+    // The window holds the points of the last 10 batches.
+    core::Tensor query(std::vector<double>({0.1 * 1995, 0.0, 0.0}), {1, 3},
+                       core::Dtype::Float64);
+    core::Tensor indices;
+    core::Tensor distances;
+    std::tie(indices, distances) = index.SearchKnn(query, 100);
+    std::vector<int64_t> found = indices.ToFlatVector<int64_t>();
+    std::sort(found.begin(), found.end());
+    std::vector<int64_t> expected(window * batch_size);
+    std::iota(expected.begin(), expected.end(), (400 - window) * batch_size);
+    ExpectEQ(found, expected);
+}
+
+}  // namespace tests
+}  // namespace open3d
@@ -0,0 +1,153 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/core/nns/FaissIndex.h"
+
+#include <cmath>
+#include <limits>
+
+#include "open3d/core/Dtype.h"
+#include "open3d/core/SizeVector.h"
+#include "open3d/core/nns/NearestNeighborSearch.h"
+#include "tests/UnitTest.h"
+
+namespace open3d {
+namespace tests {
+
+static const std::vector<double> kPoints{0.0, 0.0, 0.0, 0.0, 0.0, 0.1, 0.0, 0.0,
+                                         0.2, 0.0, 0.1, 0.0, 0.0, 0.1, 0.1, 0.0,
+                                         0.1, 0.2, 0.0, 0.2, 0.0, 0.0, 0.2, 0.1,
+                                         0.0, 0.2, 0.2, 0.1, 0.0, 0.0};
+
+TEST(FaissIndex, SearchKnn) {
+    core::Tensor ref(kPoints, {10, 3}, core::Dtype::Float64);
+    core::nns::FaissIndex index(ref);
+
+    core::Tensor query(std::vector<double>({0.064705, 0.043921, 0.087843}),
+                       {1, 3}, core::Dtype::Float64);
+
+    // if k is smaller or equal to 0
+    EXPECT_THROW(index.SearchKnn(query, -1), std::runtime_error);
+    EXPECT_THROW(index.SearchKnn(query, 0), std::runtime_error);
+    // if dtype mismatch
+    EXPECT_THROW(index.SearchKnn(query.To(core::Dtype::Float32), 3),
+                 std::runtime_error);
+
+    // if k == 3
+    core::Tensor indices;
+    core::Tensor distances;
+    std::tie(indices, distances) = index.SearchKnn(query, 3);
+    ExpectEQ(indices.ToFlatVector<int64_t>(), std::vector<int64_t>({1, 4, 9}));
+    ExpectEQ(distances.ToFlatVector<double>(),
+             std::vector<double>({0.00626358, 0.00747938, 0.0108912}), 1e-6);
+    EXPECT_EQ(distances.GetDtype(), core::Dtype::Float64);
+
+    // if k > size
+    std::tie(indices, distances) = index.SearchKnn(query, 12);
+    ExpectEQ(indices.ToFlatVector<int64_t>(),
+             std::vector<int64_t>({1, 4, 9, 0, 3, 2, 5, 7, 6, 8}));
+    EXPECT_EQ(indices.GetShape(), core::SizeVector({1, 10}));
+    EXPECT_EQ(distances.GetShape(), core::SizeVector({1, 10}));
+    EXPECT_GE(index.GetBuildTime(), 0.0);
+    EXPECT_GE(index.GetLastSearchTime(), 0.0);
+}
+
+TEST(FaissIndex, SearchRadius) {
+    core::Tensor ref(kPoints, {10, 3}, core::Dtype::Float32);
+    core::nns::FaissIndex index(ref);
+
+    core::Tensor query(std::vector<float>({0.064705, 0.043921, 0.087843,
+                                           0.064705, 0.043921, 0.087843}),
+                       {2, 3}, core::Dtype::Float32);
+
+    // if radius <= 0
+    EXPECT_THROW(index.SearchRadius(query, -1.0), std::runtime_error);
+    EXPECT_THROW(index.SearchRadius(query, 0.0), std::runtime_error);
+
+    // Neighbors are sorted by distance, and each query has its own radius.
+    core::Tensor radii(std::vector<float>({0.1, 0.09}), {2},
+                       core::Dtype::Float32);
+    core::Tensor indices, distances, num_neighbors;
+    std::tie(indices, distances, num_neighbors) =
+            index.SearchRadius(query, radii);
+    ExpectEQ(indices.ToFlatVector<int64_t>(),
+             std::vector<int64_t>({1, 4, 1, 4}));
+    ExpectEQ(distances.ToFlatVector<float>(),
+             std::vector<float>(
+                     {0.00626358, 0.00747938, 0.00626358, 0.00747938}),
+             1e-6);
+    ExpectEQ(num_neighbors.ToFlatVector<int64_t>(),
+             std::vector<int64_t>({2, 2}));
+
+    std::tie(indices, distances, num_neighbors) =
+            index.SearchRadius(query, 0.08);
+    ExpectEQ(indices.ToFlatVector<int64_t>(), std::vector<int64_t>({1, 1}));
+    ExpectEQ(num_neighbors.ToFlatVector<int64_t>(),
+             std::vector<int64_t>({1, 1}));
+}
+
+TEST(FaissIndex, IVFFlat) {
+    // Visiting every cell gives the exact result.
+    core::Tensor ref(kPoints, {10, 3}, core::Dtype::Float32);
+    core::nns::FaissIndex index(core::nns::FaissIndexType::IVFFlat, 2, 2);
+    index.SetTensorData(ref);
+    EXPECT_EQ(index.GetIndexType(), core::nns::FaissIndexType::IVFFlat);
+
+    core::Tensor query(std::vector<float>({0.064705, 0.043921, 0.087843}),
+                       {1, 3}, core::Dtype::Float32);
+    core::Tensor indices, distances;
+    std::tie(indices, distances) = index.SearchKnn(query, 3);
+    ExpectEQ(indices.ToFlatVector<int64_t>(), std::vector<int64_t>({1, 4, 9}));
+
+    EXPECT_THROW(index.SetNumProbes(0), std::runtime_error);
+}
+
+TEST(FaissIndex, NearestNeighborSearch) {
+    core::Tensor ref(kPoints, {10, 3}, core::Dtype::Float64);
+    core::Tensor query(std::vector<double>({0.064705, 0.043921, 0.087843}),
+                       {1, 3}, core::Dtype::Float64);
+
+    core::nns::NearestNeighborSearch nns(ref, core::nns::NNSBackend::Faiss);
+    EXPECT_THROW(nns.KnnSearch(query, 3), std::runtime_error);
+    nns.KnnIndex();
+    core::Tensor indices, distances;
+    std::tie(indices, distances) = nns.KnnSearch(query, 3);
+    ExpectEQ(indices.ToFlatVector<int64_t>(), std::vector<int64_t>({1, 4, 9}));
+
+    core::Tensor num_neighbors;
+    nns.FixedRadiusIndex();
+    std::tie(indices, distances, num_neighbors) =
+            nns.FixedRadiusSearch(query, 0.1);
+    ExpectEQ(indices.ToFlatVector<int64_t>(), std::vector<int64_t>({1, 4}));
+
+    nns.HybridIndex();
+    std::tie(indices, distances) = nns.HybridSearch(query, 0.0070, 3);
+    ExpectEQ(indices.ToFlatVector<int64_t>(),
+             std::vector<int64_t>({1, -1, -1}));
+}
+
+}  // namespace tests
+}  // namespace open3d
@@ -90,6 +90,14 @@ TEST(NearestNeighborSearch, KnnSearch) {
     ExpectEQ(distances.ToFlatVector<double>(),
              std::vector<double>({0.00626358, 0.00747938, 0.0108912, 0.00626358,
                                   0.00747938, 0.0108912}));
+    // Approximate search.
+    EXPECT_THROW(nns.KnnSearch(query, 3, -1.0), std::runtime_error);
+    result = nns.KnnSearch(query, 3, 0.0);
+    ExpectEQ(result.first.ToFlatVector<int64_t>(),
+             std::vector<int64_t>({1, 4, 9, 1, 4, 9}));
+    result = nns.KnnSearch(query, 3, 0.5);
+    EXPECT_EQ(result.first.GetShape(), core::SizeVector({2, 3}));
+    EXPECT_EQ(result.second.GetShape(), core::SizeVector({2, 3}));
 }
 
 TEST(NearestNeighborSearch, FixedRadiusSearch) {
@@ -0,0 +1,185 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/geometry/AsRigidAsPossibleDeformer.h"
+
+#include <Eigen/Dense>
+#include <Eigen/Sparse>
+
+#include "open3d/geometry/TriangleMesh.h"
+#include "tests/UnitTest.h"
+
+namespace open3d {
+namespace tests {
+
+namespace {
+
+/// Spokes ARAP on the full system, constrained rows replaced by identity rows
+/// and factorized with SparseLU.
+std::vector<Eigen::Vector3d> ReferenceDeform(
+        const geometry::TriangleMesh &mesh,
+        const std::vector<int> &constraint_ids,
+        const std::vector<Eigen::Vector3d> &constraint_pos,
+        size_t max_iter) {
+    const int n = int(mesh.vertices_.size());
+    geometry::TriangleMesh prime = mesh;
+    prime.ComputeAdjacencyList();
+    std::unordered_map<Eigen::Vector2i, double,
+                       utility::hash_eigen<Eigen::Vector2i>>
+            weights;
+    for (const auto &edge_v2s : mesh.GetEdgeToVerticesMap()) {
+        const Eigen::Vector2i edge = edge_v2s.first;
+        double sum = 0;
+        for (int v2 : edge_v2s.second) {
+            const Eigen::Vector3d a =
+                    mesh.vertices_[edge(0)] - mesh.vertices_[v2];
+            const Eigen::Vector3d b =
+                    mesh.vertices_[edge(1)] - mesh.vertices_[v2];
+            sum += a.dot(b) / a.cross(b).norm();
+        }
+        weights[edge] = std::max(0.0, sum / edge_v2s.second.size());
+    }
+    auto w = [&](int i, int j) {
+        return weights[geometry::TriangleMesh::GetOrderedEdge(i, j)];
+    };
+    std::unordered_map<int, Eigen::Vector3d> constraints;
+    for (size_t idx = 0; idx < constraint_ids.size(); ++idx) {
+        constraints[constraint_ids[idx]] = constraint_pos[idx];
+    }
+
+    std::vector<Eigen::Triplet<double>> triplets;
+    for (int i = 0; i < n; ++i) {
+        if (constraints.count(i) > 0) {
+            triplets.emplace_back(i, i, 1);
+            continue;
+        }
+        double W = 0;
+        for (int j : prime.adjacency_list_[i]) {
+            triplets.emplace_back(i, j, -w(i, j));
+            W += w(i, j);
+        }
+        triplets.emplace_back(i, i, W);
+    }
+    Eigen::SparseMatrix<double> L(n, n);
+    L.setFromTriplets(triplets.begin(), triplets.end());
+    Eigen::SparseLU<Eigen::SparseMatrix<double>> solver(L);
+
+    std::vector<Eigen::Matrix3d> Rs(n);
+    Eigen::MatrixXd b(n, 3);
+    for (size_t iter = 0; iter < max_iter; ++iter) {
+        for (int i = 0; i < n; ++i) {
+            Eigen::Matrix3d S = Eigen::Matrix3d::Zero();
+            for (int j : prime.adjacency_list_[i]) {
+                S += w(i, j) * (mesh.vertices_[i] - mesh.vertices_[j]) *
+                     (prime.vertices_[i] - prime.vertices_[j]).transpose();
+            }
+            Eigen::JacobiSVD<Eigen::Matrix3d> svd(
+                    S, Eigen::ComputeFullU | Eigen::ComputeFullV);
+            const Eigen::Matrix3d U = svd.matrixU();
+            const Eigen::Matrix3d V = svd.matrixV();
+            const Eigen::Vector3d D(1, 1, (V * U.transpose()).determinant());
+            Rs[i] = V * D.asDiagonal() * U.transpose();
+        }
+        for (int i = 0; i < n; ++i) {
+            Eigen::Vector3d bi(0, 0, 0);
+            if (constraints.count(i) > 0) {
+                bi = constraints[i];
+            } else {
+                for (int j : prime.adjacency_list_[i]) {
+                    bi += w(i, j) / 2 * (Rs[i] + Rs[j]) *
+                          (mesh.vertices_[i] - mesh.vertices_[j]);
+                }
+            }
+            b.row(i) = bi.transpose();
+        }
+        const Eigen::MatrixXd x = solver.solve(b);
+        for (int i = 0; i < n; ++i) {
+            prime.vertices_[i] = x.row(i).transpose();
+        }
+    }
+    return prime.vertices_;
+}
+
+}  // namespace
+
+TEST(AsRigidAsPossibleDeformer, Deform) {
+    auto mesh = geometry::TriangleMesh::CreateSphere(1.0, 10);
+    std::vector<int> constraint_ids;
+    std::vector<Eigen::Vector3d> pos_up, pos_side;
+    for (int i = 0; i < int(mesh->vertices_.size()); ++i) {
+        const Eigen::Vector3d &v = mesh->vertices_[i];
+        if (v(2) < -0.8) {
+            constraint_ids.push_back(i);
+            pos_up.push_back(v);
+            pos_side.push_back(v);
+        } else if (v(2) > 0.8) {
+            constraint_ids.push_back(i);
+            pos_up.push_back(v + Eigen::Vector3d(0, 0, 0.5));
+            pos_side.push_back(v + Eigen::Vector3d(0.4, 0, 0));
+        }
+    }
+
+    geometry::AsRigidAsPossibleDeformer deformer(*mesh, constraint_ids);
+    EXPECT_FALSE(deformer.IsEmpty());
+    auto up = deformer.Deform(pos_up, 10);
+    ExpectEQ(up->vertices_, ReferenceDeform(*mesh, constraint_ids, pos_up, 10),
+             1e-8);
+    ExpectEQ(up->triangles_, mesh->triangles_);
+    for (size_t idx = 0; idx < constraint_ids.size(); ++idx) {
+        ExpectEQ(up->vertices_[constraint_ids[idx]], pos_up[idx]);
+    }
+    ExpectEQ(up->vertices_,
+             mesh->DeformAsRigidAsPossible(constraint_ids, pos_up, 10)
+                     ->vertices_);
+
+    // Repeated solves reuse the factorization and do not depend on each
+    // other.
+    auto side = deformer.Deform(pos_side, 10);
+    ExpectEQ(side->vertices_,
+             ReferenceDeform(*mesh, constraint_ids, pos_side, 10), 1e-8);
+    geometry::AsRigidAsPossibleDeformer copy = deformer;
+    EXPECT_EQ(copy.solver_, deformer.solver_);
+    ExpectEQ(copy.Deform(pos_up, 10)->vertices_, up->vertices_);
+
+    // The smoothed energy regularizes the rotations.
+    auto smoothed = geometry::AsRigidAsPossibleDeformer::CreateFromTriangleMesh(
+            *mesh, constraint_ids,
+            geometry::MeshBase::DeformAsRigidAsPossibleEnergy::Smoothed, 0.1);
+    ExpectEQ(smoothed->Deform(pos_up, 10)->vertices_,
+             mesh->DeformAsRigidAsPossible(
+                         constraint_ids, pos_up, 10,
+                         geometry::MeshBase::DeformAsRigidAsPossibleEnergy::
+                                 Smoothed,
+                         0.1)
+                     ->vertices_);
+
+    EXPECT_ANY_THROW(deformer.Deform({Eigen::Vector3d::Zero()}, 10));
+    EXPECT_ANY_THROW(geometry::AsRigidAsPossibleDeformer(
+            *mesh, {int(mesh->vertices_.size())}));
+}
+
+}  // namespace tests
+}  // namespace open3d
@@ -0,0 +1,140 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include <Eigen/Eigenvalues>
+
+#include "open3d/geometry/KDTreeFlann.h"
+#include "open3d/geometry/Keypoint.h"
+#include "open3d/geometry/NeighborGraph.h"
+#include "open3d/geometry/PointCloud.h"
+#include "open3d/utility/Eigen.h"
+#include "tests/UnitTest.h"
+
+namespace open3d {
+namespace tests {
+
+// Serial ISS keypoint detection that queries the KDTree for every point.
+static std::vector<size_t> ComputeISSKeypointIndicesReference(
+        const geometry::PointCloud& pcd,
+        double salient_radius,
+        double non_max_radius,
+        int min_neighbors) {
+    const std::vector<Eigen::Vector3d>& points = pcd.points_;
+    geometry::KDTreeFlann kdtree(pcd);
+    std::vector<int> indices;
+    std::vector<double> dist;
+    std::vector<double> third_eigen_values(points.size(), 0.0);
+    for (size_t i = 0; i < points.size(); i++) {
+        if (kdtree.SearchRadius(points[i], salient_radius, indices, dist) <
+            min_neighbors) {
+            continue;
+        }
+        Eigen::Matrix3d cov = utility::ComputeCovariance(points, indices);
+        if (cov.isZero()) {
+            continue;
+        }
+        Eigen::SelfAdjointEigenSolver<Eigen::Matrix3d> solver(cov);
+        const Eigen::Vector3d& e = solver.eigenvalues();
+        if (e(1) / e(2) < 0.975 && e(0) / e(1) < 0.975) {
+            third_eigen_values[i] = e(0);
+        }
+    }
+    std::vector<size_t> kp_indices;
+    for (size_t i = 0; i < points.size(); i++) {
+        if (third_eigen_values[i] <= 0.0 ||
+            kdtree.SearchRadius(points[i], non_max_radius, indices, dist) <
+                    min_neighbors) {
+            continue;
+        }
+        bool is_maximum = true;
+        for (int idx : indices) {
+            is_maximum = is_maximum &&
+                         third_eigen_values[i] >= third_eigen_values[idx];
+        }
+        if (is_maximum) {
+            kp_indices.push_back(i);
+        }
+    }
+    return kp_indices;
+}
+
+TEST(ISSKeypoints, ComputeISSKeypointIndices) {
+    geometry::PointCloud pcd;
+    pcd.points_.resize(3000);
+    Rand(pcd.points_, Eigen::Vector3d(0, 0, 0), Eigen::Vector3d(1, 1, 0.3), 0);
+
+    // The non maxima suppression reuses the salient neighborhoods if
+    // non_max_radius <= salient_radius and queries the KDTree otherwise.
+    for (const Eigen::Vector2d& radii :
+         {Eigen::Vector2d(0.1, 0.07), Eigen::Vector2d(0.1, 0.1),
+          Eigen::Vector2d(0.07, 0.1)}) {
+        const std::vector<size_t> kp_indices =
+                geometry::keypoint::ComputeISSKeypointIndices(
+                        pcd, radii(0), radii(1), 0.975, 0.975, 5);
+        EXPECT_GT(kp_indices.size(), 0u);
+        EXPECT_EQ(kp_indices, ComputeISSKeypointIndicesReference(pcd, radii(0),
+                                                                 radii(1), 5));
+
+        // Same neighborhoods from a NeighborGraph.
+        auto graph = geometry::NeighborGraph::CreateFromPointCloud(
+                pcd, geometry::KDTreeSearchParamRadius(0.1));
+        EXPECT_EQ(geometry::keypoint::ComputeISSKeypointIndices(
+                          pcd, radii(0), radii(1), 0.975, 0.975, 5, graph),
+                  kp_indices);
+    }
+
+    // A NeighborGraph of another point cloud is rejected.
+    geometry::PointCloud other;
+    other.points_.assign(pcd.points_.begin(), pcd.points_.begin() + 100);
+    EXPECT_ANY_THROW(geometry::keypoint::ComputeISSKeypointIndices(
+            pcd, 0.1, 0.07, 0.975, 0.975, 5,
+            geometry::NeighborGraph::CreateFromPointCloud(
+                    other, geometry::KDTreeSearchParamRadius(0.1))));
+}
+
+TEST(ISSKeypoints, ComputeISSKeypoints) {
+    geometry::PointCloud pcd;
+    pcd.points_.resize(2000);
+    Rand(pcd.points_, Eigen::Vector3d(0, 0, 0), Eigen::Vector3d(1, 1, 0.3), 1);
+
+    // Radii from the model resolution.
+    const std::vector<size_t> kp_indices =
+            geometry::keypoint::ComputeISSKeypointIndices(pcd);
+    auto keypoints = geometry::keypoint::ComputeISSKeypoints(pcd);
+    ASSERT_EQ(keypoints->points_.size(), kp_indices.size());
+    for (size_t i = 0; i < kp_indices.size(); i++) {
+        ExpectEQ(keypoints->points_[i], pcd.points_[kp_indices[i]]);
+    }
+
+    EXPECT_TRUE(geometry::keypoint::ComputeISSKeypointIndices(
+                        geometry::PointCloud())
+                        .empty());
+    EXPECT_TRUE(geometry::keypoint::ComputeISSKeypoints(geometry::PointCloud())
+                        ->IsEmpty());
+}
+
+}  // namespace tests
+}  // namespace open3d
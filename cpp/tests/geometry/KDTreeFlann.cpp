@@ -26,6 +26,8 @@
 
 #include "open3d/geometry/KDTreeFlann.h"
 
+#include <algorithm>
+
 #include "open3d/geometry/PointCloud.h"
 #include "open3d/geometry/TriangleMesh.h"
 #include "tests/UnitTest.h"
@@ -144,5 +146,41 @@ TEST(KDTreeFlann, SearchHybrid) {
     ExpectEQ(ref_distance2, distance2);
 }
 
+TEST(KDTreeFlann, SearchKNNRandomizedForest) {
+    std::vector<int> ref_indices = {27, 48, 4,  77, 90, 7,  54, 17, 76, 38,
+                                    39, 60, 15, 84, 11, 57, 3,  32, 99, 36,
+                                    52, 40, 26, 59, 22, 97, 20, 42, 73, 24};
+
+    int size = 100;
+
+    geometry::PointCloud pc;
+
+    Eigen::Vector3d vmin(0.0, 0.0, 0.0);
+    Eigen::Vector3d vmax(10.0, 10.0, 10.0);
+
+    pc.points_.resize(size);
+    Rand(pc.points_, vmin, vmax, 0);
+
+    Eigen::Vector3d query = {1.647059, 4.392157, 8.784314};
+    int knn = 30;
+    std::vector<int> indices;
+    std::vector<double> distance2;
+
+    // Unlimited checks give the exact result.
+    geometry::KDTreeFlann exact_kdtree(pc, geometry::KDTreeIndexParam(4, -1));
+    EXPECT_FALSE(exact_kdtree.GetIndexParam().IsApproximate());
+    int result = exact_kdtree.SearchKNN(query, knn, indices, distance2);
+    EXPECT_EQ(result, 30);
+    ExpectEQ(ref_indices, indices);
+
+    // Limited checks give valid, sorted neighbors.
+    geometry::KDTreeFlann kdtree(pc, geometry::KDTreeIndexParam(4, 8));
+    EXPECT_TRUE(kdtree.GetIndexParam().IsApproximate());
+    result = kdtree.SearchKNN(query, knn, indices, distance2);
+    EXPECT_EQ(result, 30);
+    EXPECT_EQ(indices[0], 27);
+    EXPECT_TRUE(std::is_sorted(distance2.begin(), distance2.end()));
+}
+
 }  // namespace tests
 }  // namespace open3d
@@ -0,0 +1,184 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/geometry/NeighborGraph.h"
+
+#include "open3d/geometry/KDTreeFlann.h"
+#include "open3d/geometry/PointCloud.h"
+#include "tests/UnitTest.h"
+
+namespace open3d {
+namespace tests {
+
+namespace {
+
+geometry::PointCloud RandomPointCloud(int size) {
+    geometry::PointCloud pc;
+    pc.points_.resize(size);
+    Rand(pc.points_, Eigen::Vector3d(0.0, 0.0, 0.0),
+         Eigen::Vector3d(10.0, 10.0, 10.0), 0);
+    return pc;
+}
+
+}  // namespace
+
+TEST(NeighborGraph, CreateFromPointCloud) {
+    const geometry::PointCloud pc = RandomPointCloud(1000);
+    geometry::KDTreeFlann kdtree(pc);
+    const geometry::KDTreeSearchParamKNN knn(20);
+    const geometry::KDTreeSearchParamRadius radius(1.0);
+    const geometry::KDTreeSearchParamHybrid hybrid(1.0, 10);
+
+    for (const geometry::KDTreeSearchParam *param :
+         std::vector<const geometry::KDTreeSearchParam *>{&knn, &radius,
+                                                          &hybrid}) {
+        auto graph = geometry::NeighborGraph::CreateFromPointCloud(pc, *param);
+        EXPECT_EQ(graph->NumPoints(), pc.points_.size());
+        EXPECT_EQ(graph->offsets_.size(), pc.points_.size() + 1);
+        EXPECT_EQ(graph->offsets_.back(), int64_t(graph->indices_.size()));
+        EXPECT_EQ(graph->indices_.size(), graph->distances2_.size());
+        EXPECT_TRUE(graph->Covers(*param));
+        for (size_t i = 0; i < pc.points_.size(); ++i) {
+            std::vector<int> ref_indices, indices;
+            std::vector<double> ref_distance2, distance2;
+            kdtree.Search(pc.points_[i], *param, ref_indices, ref_distance2);
+            EXPECT_EQ(graph->NumNeighbors(i), ref_indices.size());
+            EXPECT_EQ(graph->GetNeighbors(i, *param, indices, distance2),
+                      int(ref_indices.size()));
+            ExpectEQ(indices, ref_indices);
+            ExpectEQ(distance2, ref_distance2);
+        }
+    }
+
+    auto graph = geometry::NeighborGraph::CreateFromPointCloud(
+            geometry::PointCloud(), knn);
+    EXPECT_EQ(graph->NumPoints(), 0u);
+}
+
+TEST(NeighborGraph, Covers) {
+    const geometry::PointCloud pc = RandomPointCloud(100);
+
+    geometry::NeighborGraph knn_graph(pc, geometry::KDTreeSearchParamKNN(10));
+    EXPECT_TRUE(knn_graph.Covers(geometry::KDTreeSearchParamKNN(5)));
+    EXPECT_FALSE(knn_graph.Covers(geometry::KDTreeSearchParamKNN(11)));
+    EXPECT_FALSE(knn_graph.Covers(geometry::KDTreeSearchParamRadius(0.1)));
+    EXPECT_TRUE(knn_graph.Covers(geometry::KDTreeSearchParamHybrid(5.0, 10)));
+    EXPECT_FALSE(knn_graph.Covers(geometry::KDTreeSearchParamHybrid(5.0, 11)));
+
+    geometry::NeighborGraph radius_graph(
+            pc, geometry::KDTreeSearchParamRadius(2.0));
+    EXPECT_FALSE(radius_graph.Covers(geometry::KDTreeSearchParamKNN(1)));
+    EXPECT_TRUE(radius_graph.Covers(geometry::KDTreeSearchParamRadius(2.0)));
+    EXPECT_FALSE(radius_graph.Covers(geometry::KDTreeSearchParamRadius(2.1)));
+    EXPECT_TRUE(
+            radius_graph.Covers(geometry::KDTreeSearchParamHybrid(1.0, 1000)));
+
+    geometry::NeighborGraph hybrid_graph(
+            pc, geometry::KDTreeSearchParamHybrid(2.0, 10));
+    EXPECT_FALSE(hybrid_graph.Covers(geometry::KDTreeSearchParamKNN(5)));
+    EXPECT_FALSE(hybrid_graph.Covers(geometry::KDTreeSearchParamRadius(1.0)));
+    EXPECT_TRUE(hybrid_graph.Covers(geometry::KDTreeSearchParamHybrid(1.0, 5)));
+    EXPECT_FALSE(
+            hybrid_graph.Covers(geometry::KDTreeSearchParamHybrid(1.0, 20)));
+}
+
+TEST(NeighborGraph, GetNeighbors) {
+    const geometry::PointCloud pc = RandomPointCloud(1000);
+    geometry::KDTreeFlann kdtree(pc);
+    geometry::NeighborGraph knn_graph(pc, geometry::KDTreeSearchParamKNN(30));
+    geometry::NeighborGraph radius_graph(
+            pc, geometry::KDTreeSearchParamRadius(1.5));
+
+    const geometry::KDTreeSearchParamKNN knn(7);
+    const geometry::KDTreeSearchParamRadius radius(1.0);
+    const geometry::KDTreeSearchParamHybrid hybrid(1.0, 5);
+    const std::vector<std::pair<const geometry::NeighborGraph *,
+                                const geometry::KDTreeSearchParam *>>
+            cases = {{&knn_graph, &knn},
+                     {&knn_graph, &hybrid},
+                     {&radius_graph, &radius},
+                     {&radius_graph, &hybrid}};
+    for (const auto &c : cases) {
+        for (size_t i = 0; i < pc.points_.size(); ++i) {
+            std::vector<int> ref_indices, indices;
+            std::vector<double> ref_distance2, distance2;
+            kdtree.Search(pc.points_[i], *c.second, ref_indices, ref_distance2);
+            EXPECT_EQ(c.first->GetNeighbors(i, *c.second, indices, distance2),
+                      int(ref_indices.size()));
+            EXPECT_EQ(c.first->CountNeighbors(i, *c.second),
+                      int(ref_indices.size()));
+            // Neighbors at the same distance may come in another order.
+            ExpectEQ(distance2, ref_distance2);
+            for (size_t k = 0; k < indices.size(); ++k) {
+                EXPECT_EQ(
+                        (pc.points_[indices[k]] - pc.points_[i]).squaredNorm(),
+                        (pc.points_[ref_indices[k]] - pc.points_[i])
+                                .squaredNorm());
+            }
+        }
+    }
+}
+
+TEST(NeighborGraph, PointCloudMethods) {
+    geometry::PointCloud pc = RandomPointCloud(1000);
+    auto knn_graph = geometry::NeighborGraph::CreateFromPointCloud(
+            pc, geometry::KDTreeSearchParamKNN(30));
+    auto radius_graph = geometry::NeighborGraph::CreateFromPointCloud(
+            pc, geometry::KDTreeSearchParamRadius(2.0));
+
+    std::vector<size_t> ref_indices, indices;
+    std::tie(std::ignore, ref_indices) = pc.RemoveRadiusOutliers(8, 1.5);
+    std::tie(std::ignore, indices) =
+            pc.RemoveRadiusOutliers(8, 1.5, radius_graph);
+    EXPECT_EQ(indices, ref_indices);
+
+    std::tie(std::ignore, ref_indices) = pc.RemoveStatisticalOutliers(20, 1.0);
+    std::tie(std::ignore, indices) =
+            pc.RemoveStatisticalOutliers(20, 1.0, knn_graph);
+    EXPECT_EQ(indices, ref_indices);
+
+    ExpectEQ(pc.ComputeNearestNeighborDistance(knn_graph),
+             pc.ComputeNearestNeighborDistance());
+
+    EXPECT_EQ(pc.ClusterDBSCAN(0.9, 5, false, radius_graph),
+              pc.ClusterDBSCAN(0.9, 5));
+
+    geometry::PointCloud pc_graph = pc;
+    pc.EstimateNormals(geometry::KDTreeSearchParamHybrid(2.0, 20));
+    pc_graph.EstimateNormals(geometry::KDTreeSearchParamHybrid(2.0, 20), true,
+                             knn_graph);
+    ExpectEQ(pc_graph.normals_, pc.normals_);
+
+    // The graph must cover the neighborhoods and match the point cloud.
+    EXPECT_ANY_THROW(pc.RemoveRadiusOutliers(8, 1.5, knn_graph));
+    EXPECT_ANY_THROW(pc.RemoveStatisticalOutliers(40, 1.0, knn_graph));
+    EXPECT_ANY_THROW(pc.ClusterDBSCAN(2.5, 5, false, radius_graph));
+    EXPECT_ANY_THROW(
+            RandomPointCloud(10).ComputeNearestNeighborDistance(knn_graph));
+}
+
+}  // namespace tests
+}  // namespace open3d
@@ -317,5 +317,110 @@ TEST(Octree, ConvertToJsonValue) {
     EXPECT_TRUE(src_octree == dst_octree);
 }
 
+static geometry::PointCloud CreateOctreeTestPointCloud() {
+    geometry::PointCloud pcd;
+    pcd.points_.resize(5000);
+    pcd.colors_.resize(5000);
+    Rand(pcd.points_, Eigen::Vector3d(-1, -2, 0), Eigen::Vector3d(3, 1, 0.5),
+         0);
+    Rand(pcd.colors_, Eigen::Vector3d(0, 0, 0), Eigen::Vector3d(1, 1, 1), 1);
+    // Repeat some points with new colors.
+    for (size_t idx = 0; idx < 1000; idx += 10) {
+        pcd.points_.push_back(pcd.points_[idx]);
+        pcd.colors_.push_back(Eigen::Vector3d(0.1, 0.2, 0.3));
+    }
+    return pcd;
+}
+
+TEST(Octree, LinearOctreeConvertFromPointCloud) {
+    const geometry::PointCloud pcd = CreateOctreeTestPointCloud();
+    for (size_t max_depth : {0, 1, 4, 7}) {
+        geometry::Octree octree(max_depth);
+        octree.ConvertFromPointCloud(pcd, 0.01);
+        geometry::LinearOctree linear_octree(max_depth);
+        linear_octree.ConvertFromPointCloud(pcd, 0.01);
+
+        ExpectEQ(linear_octree.origin_, octree.origin_);
+        EXPECT_EQ(linear_octree.size_, octree.size_);
+        EXPECT_EQ(linear_octree.level_offsets_.size(), max_depth + 2);
+        EXPECT_TRUE(*linear_octree.ToOctree() == octree);
+    }
+
+    geometry::LinearOctree linear_octree(3);
+    linear_octree.ConvertFromPointCloud(geometry::PointCloud(), 0.01);
+    EXPECT_TRUE(linear_octree.IsEmpty());
+    EXPECT_TRUE(linear_octree.ToOctree()->IsEmpty());
+
+    linear_octree.max_depth_ = geometry::LinearOctree::kMaxDepth + 1;
+    EXPECT_ANY_THROW(linear_octree.ConvertFromPointCloud(pcd, 0.01));
+}
+
+TEST(Octree, LinearOctreeLocateLeafNodes) {
+    const geometry::PointCloud pcd = CreateOctreeTestPointCloud();
+    const size_t max_depth = 6;
+    geometry::Octree octree(max_depth);
+    octree.ConvertFromPointCloud(pcd, 0.01);
+    geometry::LinearOctree linear_octree(max_depth);
+    linear_octree.ConvertFromPointCloud(pcd, 0.01);
+
+    // Points of the point cloud, points in empty leaf nodes and points out of
+    // bound.
+    std::vector<Eigen::Vector3d> queries(2000);
+    Rand(queries, Eigen::Vector3d(-2, -3, -1), Eigen::Vector3d(4, 2, 1.5), 2);
+    for (size_t idx = 0; idx < pcd.points_.size(); idx += 5) {
+        queries.push_back(pcd.points_[idx]);
+    }
+    const std::vector<int64_t> leaf_indices =
+            linear_octree.LocateLeafNodes(queries);
+    ASSERT_EQ(leaf_indices.size(), queries.size());
+
+    size_t num_found = 0;
+    for (size_t idx = 0; idx < queries.size(); ++idx) {
+        std::shared_ptr<geometry::OctreeLeafNode> node;
+        std::shared_ptr<geometry::OctreeNodeInfo> node_info;
+        std::tie(node, node_info) = octree.LocateLeafNode(queries[idx]);
+        if (node == nullptr) {
+            EXPECT_EQ(leaf_indices[idx], -1);
+            continue;
+        }
+        ASSERT_GE(leaf_indices[idx], 0);
+        num_found++;
+        const geometry::OctreeNodeInfo leaf_info =
+                linear_octree.GetLeafNodeInfo(size_t(leaf_indices[idx]));
+        ExpectEQ(leaf_info.origin_, node_info->origin_);
+        EXPECT_DOUBLE_EQ(leaf_info.size_, node_info->size_);
+        EXPECT_EQ(leaf_info.depth_, max_depth);
+        EXPECT_EQ(leaf_info.child_index_, node_info->child_index_);
+        ExpectEQ(linear_octree.leaf_colors_[leaf_indices[idx]],
+                 std::dynamic_pointer_cast<geometry::OctreeColorLeafNode>(node)
+                         ->color_);
+    }
+    EXPECT_GT(num_found, pcd.points_.size() / 5);
+    EXPECT_LT(num_found, queries.size());
+}
+
+TEST(Octree, LinearOctreeToVoxelGrid) {
+    const geometry::PointCloud pcd = CreateOctreeTestPointCloud();
+    geometry::LinearOctree linear_octree(5);
+    linear_octree.ConvertFromPointCloud(pcd, 0.01);
+    auto voxel_grid = linear_octree.ToVoxelGrid();
+
+    EXPECT_EQ(voxel_grid->voxel_size_, linear_octree.size_ / 32);
+    ExpectEQ(voxel_grid->origin_, linear_octree.origin_);
+    ASSERT_EQ(voxel_grid->voxels_.size(), linear_octree.GetNumLeafNodes());
+    std::vector<Eigen::Vector3d> centers;
+    std::vector<Eigen::Vector3d> colors;
+    for (const auto& it : voxel_grid->voxels_) {
+        centers.push_back(voxel_grid->GetVoxelCenterCoordinate(it.first));
+        colors.push_back(it.second.color_);
+    }
+    const std::vector<int64_t> leaf_indices =
+            linear_octree.LocateLeafNodes(centers);
+    for (size_t idx = 0; idx < centers.size(); ++idx) {
+        ASSERT_GE(leaf_indices[idx], 0);
+        ExpectEQ(linear_octree.leaf_colors_[leaf_indices[idx]], colors[idx]);
+    }
+}
+
 }  // namespace tests
 }  // namespace open3d
@@ -27,10 +27,16 @@
 #include "open3d/geometry/PointCloud.h"
 
 #include <algorithm>
+#include <map>
+#include <numeric>
+#include <random>
+#include <tuple>
 
 #include "open3d/camera/PinholeCameraIntrinsic.h"
 #include "open3d/geometry/BoundingVolume.h"
 #include "open3d/geometry/Image.h"
+#include "open3d/geometry/KDTreeFlann.h"
+#include "open3d/geometry/MortonCode.h"
 #include "open3d/geometry/RGBDImage.h"
 #include "open3d/geometry/TriangleMesh.h"
 #include "open3d/io/ImageIO.h"
@@ -473,6 +479,58 @@ TEST(PointCloud, PaintUniformColor) {
     EXPECT_EQ(pcd.colors_, std::vector<Eigen::Vector3d>({color, color}));
 }
 
+TEST(PointCloud, SortByMortonCode) {
+    geometry::PointCloud pcd;
+    // 2x2x2 grid in reverse Morton order.
+    for (int i = 7; i >= 0; --i) {
+        Eigen::Vector3d point(i & 1, (i >> 1) & 1, (i >> 2) & 1);
+        pcd.points_.push_back(point);
+        pcd.colors_.push_back(point * 0.5);
+        pcd.normals_.push_back(point * 10);
+    }
+    const geometry::PointCloud original = pcd;
+
+    std::vector<size_t> permutation = pcd.SortByMortonCode();
+    EXPECT_EQ(permutation, std::vector<size_t>({7, 6, 5, 4, 3, 2, 1, 0}));
+    for (size_t i = 0; i < permutation.size(); ++i) {
+        ExpectEQ(pcd.points_[i], original.points_[permutation[i]]);
+        ExpectEQ(pcd.colors_[i], original.colors_[permutation[i]]);
+        ExpectEQ(pcd.normals_[i], original.normals_[permutation[i]]);
+    }
+
+    // Sorting again is the identity.
+    permutation = pcd.SortByMortonCode();
+    EXPECT_EQ(permutation, std::vector<size_t>({0, 1, 2, 3, 4, 5, 6, 7}));
+}
+
+TEST(PointCloud, SortByMortonCodeEmpty) {
+    geometry::PointCloud pcd;
+    EXPECT_TRUE(pcd.SortByMortonCode().empty());
+    EXPECT_TRUE(pcd.IsEmpty());
+    EXPECT_FALSE(pcd.HasNormals());
+    EXPECT_FALSE(pcd.HasColors());
+}
+
+TEST(PointCloud, MortonCodeEncodeDecode) {
+    EXPECT_EQ(geometry::MortonCode::Encode(1, 0, 0), 1u);
+    EXPECT_EQ(geometry::MortonCode::Encode(0, 1, 0), 2u);
+    EXPECT_EQ(geometry::MortonCode::Encode(0, 0, 1), 4u);
+    EXPECT_EQ(geometry::MortonCode::Encode(3, 3, 3), 63u);
+
+    const uint32_t max_coord = (1u << geometry::MortonCode::kBitsPerAxis) - 1;
+    const std::vector<Eigen::Vector3i> coords = {
+            {0, 0, 0},
+            {5, 1023, 77},
+            {static_cast<int>(max_coord), 0, 12345},
+            {static_cast<int>(max_coord), static_cast<int>(max_coord),
+             static_cast<int>(max_coord)}};
+    for (const Eigen::Vector3i& coord : coords) {
+        uint64_t code =
+                geometry::MortonCode::Encode(coord(0), coord(1), coord(2));
+        ExpectEQ(geometry::MortonCode::Decode(code), coord);
+    }
+}
+
 TEST(PointCloud, SelectByIndex) {
     std::vector<Eigen::Vector3d> points({
             {0, 0, 0},
@@ -530,6 +588,45 @@ TEST(PointCloud, SelectByIndex) {
                             }));
 }
 
+TEST(PointCloud, SelectByMask) {
+    // Enough points for several blocks of the parallel compaction.
+    geometry::PointCloud pcd;
+    pcd.points_.resize(100000);
+    Rand(pcd.points_, Eigen::Vector3d(-1, -1, -1), Eigen::Vector3d(1, 1, 1), 0);
+    pcd.normals_.resize(pcd.points_.size());
+    Rand(pcd.normals_, Eigen::Vector3d(-1, -1, -1), Eigen::Vector3d(1, 1, 1),
+         1);
+    pcd.colors_.resize(pcd.points_.size());
+    Rand(pcd.colors_, Eigen::Vector3d(0, 0, 0), Eigen::Vector3d(1, 1, 1), 2);
+
+    std::vector<bool> mask(pcd.points_.size());
+    std::vector<size_t> indices;
+    for (size_t i = 0; i < pcd.points_.size(); ++i) {
+        mask[i] = pcd.points_[i](0) > 0.3;
+        if (mask[i]) {
+            indices.push_back(i);
+        }
+    }
+
+    auto selected = pcd.SelectByMask(mask);
+    ASSERT_EQ(selected->points_.size(), indices.size());
+    for (size_t j = 0; j < indices.size(); ++j) {
+        ExpectEQ(selected->points_[j], pcd.points_[indices[j]]);
+        ExpectEQ(selected->normals_[j], pcd.normals_[indices[j]]);
+        ExpectEQ(selected->colors_[j], pcd.colors_[indices[j]]);
+    }
+
+    auto inverted = pcd.SelectByMask(mask, /*invert=*/true);
+    auto inverted_ref = pcd.SelectByIndex(indices, /*invert=*/true);
+    EXPECT_EQ(inverted->points_.size() + selected->points_.size(),
+              pcd.points_.size());
+    ExpectEQ(inverted->points_, inverted_ref->points_);
+    ExpectEQ(inverted->normals_, inverted_ref->normals_);
+    ExpectEQ(inverted->colors_, inverted_ref->colors_);
+
+    EXPECT_ANY_THROW(pcd.SelectByMask(std::vector<bool>(10, true)));
+}
+
 TEST(PointCloud, VoxelDownSample) {
     // voxel_size: 1
     // points_min_bound: (0.5, 0.5, 0.5)
@@ -592,6 +689,86 @@ TEST(PointCloud, VoxelDownSample) {
     ExpectEQ(ApplyIndices(pc_down->points_, sort_indices), points_down);
     ExpectEQ(ApplyIndices(pc_down->normals_, sort_indices), normals_down);
     ExpectEQ(ApplyIndices(pc_down->colors_, sort_indices), colors_down);
+
+    // Output points are ordered by voxel index.
+    ExpectEQ(pc_down->points_, points_down);
+}
+
+TEST(PointCloud, VoxelDownSampleLargeCloud) {
+    std::mt19937 rng(0);
+    std::uniform_real_distribution<double> dist(-10.0, 10.0);
+    geometry::PointCloud pcd;
+    for (int i = 0; i < 100000; i++) {
+        pcd.points_.emplace_back(dist(rng), dist(rng), dist(rng));
+        pcd.normals_.emplace_back(dist(rng), dist(rng), dist(rng));
+        pcd.colors_.emplace_back(dist(rng), dist(rng), dist(rng));
+    }
+    const double voxel_size = 0.5;
+
+    // Reference: accumulate points per voxel in input order.
+    std::map<std::tuple<int, int, int>, std::vector<size_t>> voxels;
+    Eigen::Vector3d voxel_min_bound =
+            pcd.GetMinBound() - Eigen::Vector3d::Constant(voxel_size * 0.5);
+    for (size_t i = 0; i < pcd.points_.size(); i++) {
+        Eigen::Vector3d ref_coord =
+                (pcd.points_[i] - voxel_min_bound) / voxel_size;
+        voxels[std::make_tuple(int(floor(ref_coord(0))),
+                               int(floor(ref_coord(1))),
+                               int(floor(ref_coord(2))))]
+                .push_back(i);
+    }
+    std::vector<Eigen::Vector3d> points_down, normals_down, colors_down;
+    for (const auto& voxel : voxels) {
+        Eigen::Vector3d point(0, 0, 0), normal(0, 0, 0), color(0, 0, 0);
+        for (size_t i : voxel.second) {
+            point += pcd.points_[i];
+            normal += pcd.normals_[i];
+            color += pcd.colors_[i];
+        }
+        points_down.push_back(point / double(voxel.second.size()));
+        normals_down.push_back(normal / double(voxel.second.size()));
+        colors_down.push_back(color / double(voxel.second.size()));
+    }
+
+    std::shared_ptr<geometry::PointCloud> pc_down =
+            pcd.VoxelDownSample(voxel_size);
+    EXPECT_EQ(pc_down->points_, points_down);
+    EXPECT_EQ(pc_down->normals_, normals_down);
+    EXPECT_EQ(pc_down->colors_, colors_down);
+}
+
+TEST(PointCloud, VoxelDownSampleAndTrace) {
+    std::vector<Eigen::Vector3d> points{
+            {0.5, 1.6, 2.4}, {0.2, 0.2, 0.2}, {0.6, 1.5, 2.3},
+            {0.6, 0.7, 0.8}, {0.9, 0.1, 0.1},
+    };
+    std::vector<Eigen::Vector3d> colors{
+            {1, 1, 1}, {2, 2, 2}, {1, 1, 1}, {2, 2, 2}, {3, 3, 3},
+    };
+    geometry::PointCloud pcd;
+    pcd.points_ = points;
+    pcd.colors_ = colors;
+
+    std::shared_ptr<geometry::PointCloud> pc_down;
+    Eigen::MatrixXi cubic_id;
+    std::vector<std::vector<int>> original_indices;
+    std::tie(pc_down, cubic_id, original_indices) = pcd.VoxelDownSampleAndTrace(
+            1.0, Eigen::Vector3d(0, 0, 0), Eigen::Vector3d(3, 3, 3), true);
+
+    ExpectEQ(pc_down->points_, std::vector<Eigen::Vector3d>({
+                                       {1.7 / 3, 1.0 / 3, 1.1 / 3},
+                                       {0.55, 1.55, 2.35},
+                               }));
+    ExpectEQ(pc_down->colors_, std::vector<Eigen::Vector3d>({
+                                       {2, 2, 2},
+                                       {1, 1, 1},
+                               }));
+    EXPECT_EQ(original_indices,
+              std::vector<std::vector<int>>({{1, 3, 4}, {0, 2}}));
+    Eigen::MatrixXi cubic_id_ref(2, 8);
+    cubic_id_ref << 1, 4, -1, -1, -1, -1, -1, 3,  //
+            -1, -1, -1, 2, -1, -1, -1, -1;
+    EXPECT_EQ(cubic_id, cubic_id_ref);
 }
 
 TEST(PointCloud, UniformDownSample) {
@@ -855,6 +1032,27 @@ TEST(PointCloud, OrientNormalsConsistentTangentPlane) {
                                                          {c, -b, -b}}));
 }
 
+TEST(PointCloud, OrientNormalsConsistentTangentPlaneSphere) {
+    // Fibonacci sphere, with normals flipped at random.
+    const int n = 2000;
+    geometry::PointCloud pcd;
+    for (int i = 0; i < n; ++i) {
+        double z = 1.0 - 2.0 * (i + 0.5) / n;
+        double r = std::sqrt(1.0 - z * z);
+        double phi = i * M_PI * (3.0 - std::sqrt(5.0));
+        pcd.points_.emplace_back(r * std::cos(phi), r * std::sin(phi), z);
+    }
+    pcd.EstimateNormals(geometry::KDTreeSearchParamKNN(/*knn=*/10));
+    for (int i = 0; i < n; i += 3) {
+        pcd.normals_[i] *= -1.0;
+    }
+
+    pcd.OrientNormalsConsistentTangentPlane(/*k=*/10);
+    for (int i = 0; i < n; ++i) {
+        EXPECT_GT(pcd.normals_[i].dot(pcd.points_[i]), 0.9);
+    }
+}
+
 TEST(PointCloud, ComputePointCloudToPointCloudDistance) {
     geometry::PointCloud pc0({{0, 0, 0}, {1, 2, 0}, {2, 2, 0}});
     geometry::PointCloud pc1({{-1, 0, 0}, {-2, 0, 0}, {-1, 2, 0}});
@@ -1007,6 +1205,71 @@ TEST(PointCloud, HiddenPointRemoval) {
     EXPECT_EQ(mesh->vertices_.size(), 24581);
 }
 
+TEST(PointCloud, ComputePointVisibilityHiddenPointRemoval) {
+    geometry::PointCloud pcd;
+    io::ReadPointCloud(std::string(TEST_DATA_DIR) + "/fragment.ply", pcd);
+    const std::vector<Eigen::Vector3d> camera_locations = {{0, 0, 5},
+                                                           {5, 0, 0}};
+    std::vector<std::vector<bool>> visibility =
+            pcd.ComputePointVisibility(camera_locations, 5 * 100);
+    ASSERT_EQ(visibility.size(), camera_locations.size());
+    for (size_t cidx = 0; cidx < camera_locations.size(); ++cidx) {
+        std::vector<size_t> pt_map;
+        std::tie(std::ignore, pt_map) =
+                pcd.HiddenPointRemoval(camera_locations[cidx], 5 * 100);
+        std::vector<bool> ref(pcd.points_.size(), false);
+        for (size_t pidx : pt_map) {
+            ref[pidx] = true;
+        }
+        EXPECT_EQ(visibility[cidx], ref);
+    }
+}
+
+TEST(PointCloud, ComputePointVisibilityZBuffer) {
+    // A small plane at z = 1 hides the center of a large plane at z = 2 from
+    // the origin, and is hidden by it from z = 3. From z = 3, the border of
+    // the large plane is seen at grazing angles on the side faces of the cube
+    // map and not checked.
+    geometry::PointCloud pcd;
+    for (int i = -50; i <= 50; ++i) {
+        for (int j = -50; j <= 50; ++j) {
+            pcd.points_.push_back(Eigen::Vector3d(0.01 * i, 0.01 * j, 1));
+        }
+    }
+    const size_t num_near = pcd.points_.size();
+    for (int i = -100; i <= 100; ++i) {
+        for (int j = -100; j <= 100; ++j) {
+            pcd.points_.push_back(Eigen::Vector3d(0.02 * i, 0.02 * j, 2));
+        }
+    }
+
+    std::vector<std::vector<bool>> visibility = pcd.ComputePointVisibility(
+            {{0, 0, 0}, {0, 0, 3}}, 0,
+            geometry::PointCloud::VisibilityMethod::ZBuffer, 64);
+    ASSERT_EQ(visibility.size(), 2u);
+    for (size_t pidx = 0; pidx < pcd.points_.size(); ++pidx) {
+        ASSERT_EQ(visibility[0].size(), pcd.points_.size());
+        const Eigen::Vector3d& point = pcd.points_[pidx];
+        const double r = point.head<2>().cwiseAbs().maxCoeff();
+        if (pidx < num_near) {
+            EXPECT_TRUE(visibility[0][pidx]);
+            EXPECT_FALSE(visibility[1][pidx]);
+        } else {
+            if (r < 0.9) {
+                EXPECT_FALSE(visibility[0][pidx]);
+                EXPECT_TRUE(visibility[1][pidx]);
+            } else if (r > 1.1) {
+                EXPECT_TRUE(visibility[0][pidx]);
+            }
+        }
+    }
+
+    EXPECT_ANY_THROW(pcd.ComputePointVisibility(
+            {{0, 0, 0}}, 0, geometry::PointCloud::VisibilityMethod::ZBuffer,
+            0));
+    EXPECT_ANY_THROW(pcd.ComputePointVisibility({{0, 0, 0}}, 0));
+}
+
 TEST(PointCloud, ClusterDBSCAN) {
     geometry::PointCloud pcd;
     io::ReadPointCloud(std::string(TEST_DATA_DIR) + "/fragment.ply", pcd);
@@ -1021,6 +1284,71 @@ TEST(PointCloud, ClusterDBSCAN) {
     EXPECT_EQ(cluster_sum, 398580);
 }
 
+// Serial DBSCAN on precomputed KDTreeFlann neighbors, as a reference for the
+// labels of ClusterDBSCAN.
+static std::vector<int> ClusterDBSCANReference(const geometry::PointCloud& pcd,
+                                               double eps,
+                                               size_t min_points) {
+    geometry::KDTreeFlann kdtree(pcd);
+    std::vector<std::vector<int>> nbs(pcd.points_.size());
+    for (size_t idx = 0; idx < pcd.points_.size(); ++idx) {
+        std::vector<double> dists2;
+        kdtree.SearchRadius(pcd.points_[idx], eps, nbs[idx], dists2);
+    }
+    std::vector<int> labels(pcd.points_.size(), -2);
+    int cluster_label = 0;
+    for (size_t idx = 0; idx < pcd.points_.size(); ++idx) {
+        if (labels[idx] != -2) {
+            continue;
+        }
+        if (nbs[idx].size() < min_points) {
+            labels[idx] = -1;
+            continue;
+        }
+        std::vector<int> stack(nbs[idx].begin(), nbs[idx].end());
+        labels[idx] = cluster_label;
+        while (!stack.empty()) {
+            int nb = stack.back();
+            stack.pop_back();
+            if (labels[nb] == -1) {
+                labels[nb] = cluster_label;
+            }
+            if (labels[nb] != -2) {
+                continue;
+            }
+            labels[nb] = cluster_label;
+            if (nbs[nb].size() >= min_points) {
+                stack.insert(stack.end(), nbs[nb].begin(), nbs[nb].end());
+            }
+        }
+        cluster_label++;
+    }
+    return labels;
+}
+
+TEST(PointCloud, ClusterDBSCANMatchesReference) {
+    geometry::PointCloud pcd;
+    io::ReadPointCloud(std::string(TEST_DATA_DIR) + "/fragment.pcd", pcd);
+    EXPECT_EQ(pcd.ClusterDBSCAN(0.02, 10),
+              ClusterDBSCANReference(pcd, 0.02, 10));
+    EXPECT_EQ(pcd.ClusterDBSCAN(0.01, 30),
+              ClusterDBSCANReference(pcd, 0.01, 30));
+
+    // Grid points at distance exactly eps are not neighbors.
+    geometry::PointCloud grid;
+    std::mt19937 rng(0);
+    std::uniform_int_distribution<int> dist(0, 30);
+    for (int i = 0; i < 3000; ++i) {
+        grid.points_.emplace_back(dist(rng), dist(rng), dist(rng));
+    }
+    for (size_t min_points : {0, 1, 3, 5}) {
+        EXPECT_EQ(grid.ClusterDBSCAN(1.0, min_points),
+                  ClusterDBSCANReference(grid, 1.0, min_points));
+        EXPECT_EQ(grid.ClusterDBSCAN(1.5, min_points),
+                  ClusterDBSCANReference(grid, 1.5, min_points));
+    }
+}
+
 TEST(PointCloud, SegmentPlane) {
     geometry::PointCloud pcd;
     io::ReadPointCloud(std::string(TEST_DATA_DIR) + "/fragment.pcd", pcd);
@@ -1035,6 +1363,59 @@ TEST(PointCloud, SegmentPlane) {
     ExpectEQ(plane_model, Eigen::Vector4d(-0.06, -0.10, 0.99, -1.06), 0.1);
 }
 
+TEST(PointCloud, SegmentPlaneSeed) {
+    geometry::PointCloud pcd;
+    io::ReadPointCloud(std::string(TEST_DATA_DIR) + "/fragment.pcd", pcd);
+
+    Eigen::Vector4d plane_model0, plane_model1;
+    std::vector<size_t> inliers0, inliers1;
+    std::tie(plane_model0, inliers0) =
+            pcd.SegmentPlane(0.01, 3, 1000, 0.99999999, 0, 42);
+    std::tie(plane_model1, inliers1) =
+            pcd.SegmentPlane(0.01, 3, 1000, 0.99999999, 0, 42);
+    EXPECT_EQ(plane_model0, plane_model1);
+    EXPECT_EQ(inliers0, inliers1);
+    ExpectEQ(plane_model0, Eigen::Vector4d(-0.06, -0.10, 0.99, -1.06), 0.1);
+
+    // Preemptive scoring on a subset.
+    std::tie(plane_model1, inliers1) =
+            pcd.SegmentPlane(0.01, 3, 1000, 0.99999999, 1000, 42);
+    ExpectEQ(plane_model1, Eigen::Vector4d(-0.06, -0.10, 0.99, -1.06), 0.1);
+}
+
+TEST(PointCloud, SegmentPlanes) {
+    geometry::PointCloud pcd;
+    // Plane z = 0 with 400 points, plane x = 5 with 225 points.
+    for (int i = 0; i < 20; ++i) {
+        for (int j = 0; j < 20; ++j) {
+            pcd.points_.push_back(Eigen::Vector3d(0.1 * i, 0.1 * j, 0.0));
+        }
+    }
+    for (int i = 0; i < 15; ++i) {
+        for (int j = 0; j < 15; ++j) {
+            pcd.points_.push_back(Eigen::Vector3d(5.0, 0.1 * i, 1.0 + 0.1 * j));
+        }
+    }
+
+    std::vector<std::tuple<Eigen::Vector4d, std::vector<size_t>>> planes =
+            pcd.SegmentPlanes(3, 0.01, 3, 1000, 0.99999999, 3, 0, 0);
+    ASSERT_EQ(planes.size(), 2);
+
+    Eigen::Vector4d plane_model = std::get<0>(planes[0]);
+    ExpectEQ(Eigen::Vector4d(plane_model * plane_model(2)),
+             Eigen::Vector4d(0, 0, 1, 0));
+    std::vector<size_t> inliers_ref(400);
+    std::iota(inliers_ref.begin(), inliers_ref.end(), 0);
+    EXPECT_EQ(std::get<1>(planes[0]), inliers_ref);
+
+    plane_model = std::get<0>(planes[1]);
+    ExpectEQ(Eigen::Vector4d(plane_model * plane_model(0)),
+             Eigen::Vector4d(1, 0, 0, -5));
+    inliers_ref.resize(225);
+    std::iota(inliers_ref.begin(), inliers_ref.end(), 400);
+    EXPECT_EQ(std::get<1>(planes[1]), inliers_ref);
+}
+
 TEST(PointCloud, SegmentPlaneKnownPlane) {
     // Points sampled from the plane x + y + z + 1 = 0
     std::vector<Eigen::Vector3d> ref = {{1.0, 1.0, -3.0},
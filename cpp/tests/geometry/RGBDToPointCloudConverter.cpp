@@ -0,0 +1,189 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/geometry/RGBDToPointCloudConverter.h"
+
+#include <cmath>
+
+#include "open3d/camera/PinholeCameraTrajectory.h"
+#include "open3d/geometry/Image.h"
+#include "open3d/geometry/PointCloud.h"
+#include "open3d/geometry/RGBDImage.h"
+#include "open3d/io/ImageIO.h"
+#include "open3d/io/PinholeCameraTrajectoryIO.h"
+#include "tests/UnitTest.h"
+
+namespace open3d {
+namespace tests {
+
+namespace {
+
+/// Element-wise comparison, where NaN equals NaN.
+void ExpectEQWithNaN(const std::vector<Eigen::Vector3d> &v0,
+                     const std::vector<Eigen::Vector3d> &v1,
+                     double threshold) {
+    ASSERT_EQ(v0.size(), v1.size());
+    for (size_t i = 0; i < v0.size(); ++i) {
+        for (int k = 0; k < 3; ++k) {
+            if (std::isnan(v0[i](k))) {
+                EXPECT_TRUE(std::isnan(v1[i](k)));
+            } else {
+                EXPECT_NEAR(v0[i](k), v1[i](k), threshold);
+            }
+        }
+    }
+}
+
+void ReadFrame(int frame,
+               camera::PinholeCameraIntrinsic &intrinsic,
+               Eigen::Matrix4d &extrinsic,
+               std::shared_ptr<geometry::Image> &depth,
+               std::shared_ptr<geometry::Image> &color) {
+    camera::PinholeCameraTrajectory trajectory;
+    io::ReadPinholeCameraTrajectory(
+            std::string(TEST_DATA_DIR) + "/RGBD/trajectory.log", trajectory);
+    intrinsic = trajectory.parameters_[frame].intrinsic_;
+    extrinsic = trajectory.parameters_[frame].extrinsic_;
+    depth = io::CreateImageFromFile(std::string(TEST_DATA_DIR) +
+                                    "/RGBD/depth/0000" + std::to_string(frame) +
+                                    ".png");
+    color = io::CreateImageFromFile(std::string(TEST_DATA_DIR) +
+                                    "/RGBD/color/0000" + std::to_string(frame) +
+                                    ".jpg");
+}
+
+}  // namespace
+
+TEST(RGBDToPointCloudConverter, Constructor) {
+    geometry::RGBDToPointCloudConverter converter;
+    EXPECT_TRUE(converter.IsEmpty());
+
+    camera::PinholeCameraIntrinsic intrinsic(5, 4, 2.0, 4.0, 2.0, 1.5);
+    converter = geometry::RGBDToPointCloudConverter(intrinsic, 1000.0, 3.0, 2);
+    EXPECT_FALSE(converter.IsEmpty());
+    EXPECT_EQ(converter.NumSampledPixels(), 6);
+    ExpectEQ(converter.x_factors_, std::vector<double>({-1.0, 0.0, 1.0}));
+    ExpectEQ(converter.y_factors_, std::vector<double>({-0.375, 0.125}));
+
+    EXPECT_ANY_THROW(
+            geometry::RGBDToPointCloudConverter(intrinsic, 1000.0, 3.0, 0));
+}
+
+TEST(RGBDToPointCloudConverter, ConvertDepthImage) {
+    camera::PinholeCameraIntrinsic intrinsic;
+    Eigen::Matrix4d extrinsic;
+    std::shared_ptr<geometry::Image> depth, color;
+    ReadFrame(0, intrinsic, extrinsic, depth, color);
+    auto depth_float = depth->ConvertDepthToFloatImage(1000.0, 3.0);
+
+    for (int stride : {1, 2}) {
+        for (bool valid_only : {true, false}) {
+            geometry::RGBDToPointCloudConverter converter(
+                    intrinsic, 1000.0, 3.0, stride, valid_only);
+            auto ref = geometry::PointCloud::CreateFromDepthImage(
+                    *depth, intrinsic, extrinsic, 1000.0, 3.0, stride,
+                    valid_only);
+            auto pcd = converter.ConvertDepthImage(*depth, extrinsic);
+            ExpectEQWithNaN(pcd->points_, ref->points_, 1e-10);
+            EXPECT_FALSE(pcd->HasColors());
+
+            // Float depth is not truncated, as in CreateFromDepthImage.
+            ref = geometry::PointCloud::CreateFromDepthImage(
+                    *depth_float, intrinsic, extrinsic, 1000.0, 3.0, stride,
+                    valid_only);
+            pcd = converter.ConvertDepthImage(*depth_float, extrinsic);
+            ExpectEQWithNaN(pcd->points_, ref->points_, 1e-10);
+        }
+    }
+
+    geometry::RGBDToPointCloudConverter converter(intrinsic);
+    geometry::Image small;
+    small.Prepare(intrinsic.width_ / 2, intrinsic.height_ / 2, 1, 2);
+    EXPECT_ANY_THROW(converter.ConvertDepthImage(small));
+    geometry::Image rgb;
+    rgb.Prepare(intrinsic.width_, intrinsic.height_, 3, 1);
+    EXPECT_ANY_THROW(converter.ConvertDepthImage(rgb));
+}
+
+TEST(RGBDToPointCloudConverter, ConvertRGBDImage) {
+    camera::PinholeCameraIntrinsic intrinsic;
+    Eigen::Matrix4d extrinsic;
+    std::shared_ptr<geometry::Image> depth, color;
+    ReadFrame(0, intrinsic, extrinsic, depth, color);
+    auto depth_float = depth->ConvertDepthToFloatImage(1000.0, 3.0);
+    auto gray = color->CreateFloatImage();
+
+    for (bool valid_only : {true, false}) {
+        geometry::RGBDToPointCloudConverter converter(intrinsic, 1000.0, 3.0, 1,
+                                                      valid_only);
+        for (const auto &image : {geometry::RGBDImage(*color, *depth_float),
+                                  geometry::RGBDImage(*gray, *depth_float)}) {
+            auto ref = geometry::PointCloud::CreateFromRGBDImage(
+                    image, intrinsic, extrinsic, valid_only);
+            auto pcd = converter.ConvertRGBDImage(image, extrinsic);
+            ExpectEQWithNaN(pcd->points_, ref->points_, 1e-10);
+            ExpectEQWithNaN(pcd->colors_, ref->colors_, 1e-10);
+        }
+    }
+
+    geometry::RGBDToPointCloudConverter converter(intrinsic);
+    geometry::Image small;
+    small.Prepare(intrinsic.width_ / 2, intrinsic.height_ / 2, 3, 1);
+    EXPECT_ANY_THROW(
+            converter.ConvertRGBDImage(geometry::RGBDImage(small, *depth)));
+    EXPECT_ANY_THROW(
+            converter.ConvertRGBDImage(geometry::RGBDImage(*color, *depth)));
+}
+
+TEST(RGBDToPointCloudConverter, ReuseOutput) {
+    camera::PinholeCameraIntrinsic intrinsic;
+    Eigen::Matrix4d extrinsic;
+    std::shared_ptr<geometry::Image> depth, color;
+    ReadFrame(0, intrinsic, extrinsic, depth, color);
+    auto depth_float = depth->ConvertDepthToFloatImage();
+    geometry::RGBDImage rgbd(*color, *depth_float);
+
+    geometry::RGBDToPointCloudConverter converter(intrinsic, 1000.0, 3.0);
+    geometry::PointCloud pcd;
+    pcd.normals_.resize(10);
+    converter.ConvertRGBDImage(rgbd, pcd, extrinsic);
+    EXPECT_FALSE(pcd.HasNormals());
+    EXPECT_EQ(pcd.colors_.size(), pcd.points_.size());
+    const Eigen::Vector3d *points = pcd.points_.data();
+
+    // Fewer valid pixels with a smaller truncation, converted into the same
+    // buffers.
+    geometry::RGBDToPointCloudConverter near_converter(intrinsic, 1000.0, 2.0);
+    near_converter.ConvertDepthImage(*depth, pcd, extrinsic);
+    EXPECT_EQ(pcd.points_.data(), points);
+    EXPECT_FALSE(pcd.HasColors());
+    auto ref = geometry::PointCloud::CreateFromDepthImage(
+            *depth, intrinsic, extrinsic, 1000.0, 2.0);
+    ExpectEQ(pcd.points_, ref->points_, 1e-10);
+}
+
+}  // namespace tests
+}  // namespace open3d
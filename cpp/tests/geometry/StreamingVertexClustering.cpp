@@ -0,0 +1,142 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/geometry/StreamingVertexClustering.h"
+
+#include <algorithm>
+
+#include "open3d/geometry/TriangleMesh.h"
+#include "tests/UnitTest.h"
+
+namespace open3d {
+namespace tests {
+
+namespace {
+
+/// Simplifies the mesh with chunks of at most chunk_size vertices and
+/// triangles.
+std::shared_ptr<geometry::TriangleMesh> SimplifyInChunks(
+        const geometry::TriangleMesh &mesh,
+        double voxel_size,
+        geometry::MeshBase::SimplificationContraction contraction,
+        const Eigen::Vector3d &origin,
+        size_t chunk_size) {
+    geometry::StreamingVertexClustering clustering(voxel_size, contraction,
+                                                   origin);
+    auto Slice = [](const std::vector<Eigen::Vector3d> &values, size_t begin,
+                    size_t end) {
+        return values.empty()
+                       ? values
+                       : std::vector<Eigen::Vector3d>(values.begin() + begin,
+                                                      values.begin() + end);
+    };
+    for (size_t begin = 0; begin < mesh.vertices_.size(); begin += chunk_size) {
+        size_t end = std::min(begin + chunk_size, mesh.vertices_.size());
+        clustering.AddVertices(Slice(mesh.vertices_, begin, end),
+                               Slice(mesh.vertex_normals_, begin, end),
+                               Slice(mesh.vertex_colors_, begin, end));
+    }
+    for (size_t begin = 0; begin < mesh.triangles_.size();
+         begin += chunk_size) {
+        size_t end = std::min(begin + chunk_size, mesh.triangles_.size());
+        clustering.AddTriangles({mesh.triangles_.begin() + begin,
+                                 mesh.triangles_.begin() + end});
+    }
+    EXPECT_EQ(clustering.GetNumberOfInputVertices(), mesh.vertices_.size());
+    return clustering.GetSimplifiedMesh();
+}
+
+std::vector<Eigen::Vector3i> SortedTriangles(
+        const geometry::TriangleMesh &mesh) {
+    std::vector<Eigen::Vector3i> triangles = mesh.triangles_;
+    std::sort(triangles.begin(), triangles.end(),
+              [](const Eigen::Vector3i &a, const Eigen::Vector3i &b) {
+                  return std::lexicographical_compare(a.data(), a.data() + 3,
+                                                      b.data(), b.data() + 3);
+              });
+    return triangles;
+}
+
+}  // namespace
+
+TEST(StreamingVertexClustering, EqualsSimplifyVertexClustering) {
+    auto mesh = geometry::TriangleMesh::CreateSphere(1.0, 40);
+    mesh->ComputeVertexNormals();
+    // Triangle normals would make SimplifyVertexClustering normalize the
+    // vertex normals.
+    mesh->triangle_normals_.clear();
+    mesh->vertex_colors_.resize(mesh->vertices_.size());
+    Rand(mesh->vertex_colors_, Eigen::Vector3d(0.0, 0.0, 0.0),
+         Eigen::Vector3d(1.0, 1.0, 1.0), 0);
+
+    const double voxel_size = 0.1;
+    const Eigen::Vector3d origin =
+            mesh->GetMinBound() - Eigen::Vector3d::Constant(0.5 * voxel_size);
+    for (auto contraction :
+         {geometry::MeshBase::SimplificationContraction::Average,
+          geometry::MeshBase::SimplificationContraction::Quadric}) {
+        auto expected = mesh->SimplifyVertexClustering(voxel_size, contraction);
+        auto simplified =
+                SimplifyInChunks(*mesh, voxel_size, contraction, origin, 500);
+        // Clusters are numbered in the order of their first vertex in both.
+        ExpectEQ(simplified->vertices_, expected->vertices_, 1e-5);
+        ExpectEQ(simplified->vertex_normals_, expected->vertex_normals_);
+        ExpectEQ(simplified->vertex_colors_, expected->vertex_colors_);
+        EXPECT_EQ(SortedTriangles(*simplified), SortedTriangles(*expected));
+    }
+}
+
+TEST(StreamingVertexClustering, ChunkSize) {
+    auto mesh = geometry::TriangleMesh::CreateSphere(1.0, 20);
+    auto simplified = SimplifyInChunks(
+            *mesh, 0.3, geometry::MeshBase::SimplificationContraction::Average,
+            Eigen::Vector3d::Zero(), mesh->vertices_.size());
+    for (size_t chunk_size : {1, 7, 100}) {
+        auto chunked = SimplifyInChunks(
+                *mesh, 0.3,
+                geometry::MeshBase::SimplificationContraction::Average,
+                Eigen::Vector3d::Zero(), chunk_size);
+        ExpectEQ(chunked->vertices_, simplified->vertices_);
+        EXPECT_EQ(chunked->triangles_, simplified->triangles_);
+    }
+    EXPECT_FALSE(simplified->HasVertexNormals());
+    EXPECT_FALSE(simplified->HasVertexColors());
+}
+
+TEST(StreamingVertexClustering, InvalidInput) {
+    EXPECT_ANY_THROW(geometry::StreamingVertexClustering(0.0));
+
+    geometry::StreamingVertexClustering clustering(0.1);
+    clustering.AddVertices({{0.0, 0.0, 0.0}, {1.0, 0.0, 0.0}});
+    // Normals in only some chunks.
+    EXPECT_ANY_THROW(
+            clustering.AddVertices({{0.0, 1.0, 0.0}}, {{0.0, 0.0, 1.0}}));
+    // Triangle indexing a vertex that has not been added.
+    EXPECT_ANY_THROW(clustering.AddTriangles({{0, 1, 2}}));
+}
+
+}  // namespace tests
+}  // namespace open3d
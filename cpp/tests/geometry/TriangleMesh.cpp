@@ -26,8 +26,13 @@
 
 #include "open3d/geometry/TriangleMesh.h"
 
+#include <chrono>
+#include <cstdlib>
+
 #include "open3d/geometry/BoundingVolume.h"
 #include "open3d/geometry/PointCloud.h"
+#include "open3d/io/TriangleMeshIO.h"
+#include "open3d/utility/FileSystem.h"
 #include "tests/UnitTest.h"
 
 namespace open3d {
@@ -487,6 +492,36 @@ TEST(TriangleMesh, ComputeAdjacencyList) {
     EXPECT_TRUE(tm.adjacency_list_[4] == std::unordered_set<int>({0, 1, 2, 3}));
 }
 
+TEST(TriangleMesh, ComputeAdjacencyCSR) {
+    auto mesh = geometry::TriangleMesh::CreateSphere(1.0, 20);
+    // Degenerate triangle, vertex 0 becomes its own neighbor.
+    mesh->triangles_.push_back(Eigen::Vector3i(0, 0, 5));
+
+    std::vector<int64_t> offsets;
+    std::vector<int> neighbors;
+    std::tie(offsets, neighbors) = mesh->ComputeAdjacencyCSR();
+    EXPECT_FALSE(mesh->HasAdjacencyList());
+
+    mesh->ComputeAdjacencyList();
+    ASSERT_EQ(offsets.size(), mesh->vertices_.size() + 1);
+    EXPECT_EQ(offsets[0], 0);
+    for (size_t vidx = 0; vidx < mesh->vertices_.size(); ++vidx) {
+        std::vector<int> ref(mesh->adjacency_list_[vidx].begin(),
+                             mesh->adjacency_list_[vidx].end());
+        std::sort(ref.begin(), ref.end());
+        EXPECT_EQ(std::vector<int>(neighbors.begin() + offsets[vidx],
+                                   neighbors.begin() + offsets[vidx + 1]),
+                  ref);
+    }
+
+    // An adjacency list that is already set is converted as is.
+    mesh->adjacency_list_[1] = {3, 2};
+    std::tie(offsets, neighbors) = mesh->ComputeAdjacencyCSR();
+    EXPECT_EQ(std::vector<int>(neighbors.begin() + offsets[1],
+                               neighbors.begin() + offsets[2]),
+              std::vector<int>({2, 3}));
+}
+
 TEST(TriangleMesh, Purge) {
     std::vector<Eigen::Vector3d> ref_vertices = {
             {839.215686, 392.156863, 780.392157},
@@ -699,6 +734,84 @@ TEST(TriangleMesh, MergeCloseVertices) {
     ExpectMeshEQ(mesh, ref);
 }
 
+TEST(TriangleMesh, RemoveDuplicatedVerticesRemap) {
+    geometry::TriangleMesh mesh;
+    mesh.vertices_.resize(1000);
+    Rand(mesh.vertices_, Eigen::Vector3d(0.0, 0.0, 0.0),
+         Eigen::Vector3d(1.0, 1.0, 1.0), 0);
+    // Duplicate half of the vertices, with -0.0 equal to 0.0.
+    mesh.vertices_[0](0) = 0.0;
+    for (int i = 0; i < 500; ++i) {
+        mesh.vertices_.push_back(mesh.vertices_[3 * i % 1000]);
+    }
+    mesh.vertices_.push_back(
+            Eigen::Vector3d(-0.0, mesh.vertices_[0](1), mesh.vertices_[0](2)));
+    mesh.vertex_colors_ = mesh.vertices_;
+    mesh.triangles_.resize(1000);
+    Rand(mesh.triangles_, Eigen::Vector3i(0, 0, 0),
+         Eigen::Vector3i(1500, 1500, 1500), 0);
+    const geometry::TriangleMesh ref = mesh;
+
+    std::vector<int> vertex_remap;
+    mesh.RemoveDuplicatedVertices(vertex_remap);
+    EXPECT_EQ(mesh.vertices_.size(), 1000u);
+    ASSERT_EQ(vertex_remap.size(), ref.vertices_.size());
+    for (size_t i = 0; i < ref.vertices_.size(); ++i) {
+        EXPECT_EQ(mesh.vertices_[vertex_remap[i]], ref.vertices_[i]);
+    }
+    // The first vertex of every group of duplicates is kept.
+    for (int i = 0; i < 1000; ++i) {
+        EXPECT_EQ(vertex_remap[i], i);
+    }
+    EXPECT_EQ(vertex_remap.back(), 0);
+    ExpectEQ(mesh.vertex_colors_, mesh.vertices_);
+    for (size_t t = 0; t < ref.triangles_.size(); ++t) {
+        for (int k = 0; k < 3; ++k) {
+            EXPECT_EQ(mesh.triangles_[t](k),
+                      vertex_remap[ref.triangles_[t](k)]);
+        }
+    }
+}
+
+TEST(TriangleMesh, MergeCloseVerticesRemap) {
+    // Triangle soup of a sphere, with every vertex moved by less than 1e-4.
+    const auto sphere = geometry::TriangleMesh::CreateSphere(1.0, 20);
+    geometry::TriangleMesh soup;
+    std::vector<Eigen::Vector3d> noise(3 * sphere->triangles_.size());
+    Rand(noise, Eigen::Vector3d(-3e-5, -3e-5, -3e-5),
+         Eigen::Vector3d(3e-5, 3e-5, 3e-5), 0);
+    for (const Eigen::Vector3i& triangle : sphere->triangles_) {
+        const int vidx = int(soup.vertices_.size());
+        for (int k = 0; k < 3; ++k) {
+            soup.vertices_.push_back(sphere->vertices_[triangle(k)] +
+                                     noise[vidx + k]);
+        }
+        soup.triangles_.push_back(Eigen::Vector3i(vidx, vidx + 1, vidx + 2));
+    }
+
+    std::vector<int> vertex_remap;
+    soup.MergeCloseVertices(1e-3, vertex_remap);
+    EXPECT_EQ(soup.vertices_.size(), sphere->vertices_.size());
+    ASSERT_EQ(vertex_remap.size(), 3 * sphere->triangles_.size());
+    for (size_t t = 0; t < sphere->triangles_.size(); ++t) {
+        for (int k = 0; k < 3; ++k) {
+            EXPECT_EQ(soup.triangles_[t](k), vertex_remap[3 * t + k]);
+            EXPECT_LT((soup.vertices_[soup.triangles_[t](k)] -
+                       sphere->vertices_[sphere->triangles_[t](k)])
+                              .norm(),
+                      1e-4);
+        }
+    }
+    EXPECT_TRUE(soup.IsEdgeManifold());
+
+    // Chains of close vertices are merged into one vertex.
+    geometry::TriangleMesh chain;
+    chain.vertices_ = {{0.0, 0.0, 0.0}, {0.6, 0.0, 0.0}, {1.2, 0.0, 0.0}};
+    chain.MergeCloseVertices(1.0, vertex_remap);
+    ExpectEQ(chain.vertices_, std::vector<Eigen::Vector3d>({{0.6, 0.0, 0.0}}));
+    EXPECT_EQ(vertex_remap, std::vector<int>({0, 0, 0}));
+}
+
 TEST(TriangleMesh, SamplePointsUniformly) {
     auto mesh_empty = geometry::TriangleMesh();
     EXPECT_THROW(mesh_empty.SamplePointsUniformly(100), std::runtime_error);
@@ -755,6 +868,126 @@ TEST(TriangleMesh, SamplePointsUniformly) {
         ExpectEQ(pcd_simple->colors_[pidx], Eigen::Vector3d(1, 0, 0));
         ExpectEQ(pcd_simple->normals_[pidx], Eigen::Vector3d(0, 0, 1));
     }
+
+    // Several blocks of points, all of them on the surface, and the same
+    // points for the same seed.
+    const auto sphere = geometry::TriangleMesh::CreateSphere(1.0, 20);
+    n_points = 10000;
+    auto pcd = sphere->SamplePointsUniformly(n_points, false, 7);
+    EXPECT_EQ(pcd->points_.size(), n_points);
+    for (const Eigen::Vector3d& point : pcd->points_) {
+        EXPECT_LE(point.norm(), 1.0 + 1e-9);
+        EXPECT_GT(point.norm(), 0.95);
+    }
+    ExpectEQ(pcd->points_,
+             sphere->SamplePointsUniformly(n_points, false, 7)->points_);
+}
+
+TEST(TriangleMesh, SamplePointsPoissonDisk) {
+    auto mesh_empty = geometry::TriangleMesh();
+    EXPECT_THROW(mesh_empty.SamplePointsPoissonDisk(100), std::runtime_error);
+
+    auto MinDistance = [](const std::vector<Eigen::Vector3d>& points) {
+        double min_distance = std::numeric_limits<double>::infinity();
+        for (size_t i = 0; i < points.size(); ++i) {
+            for (size_t j = i + 1; j < points.size(); ++j) {
+                min_distance =
+                        std::min(min_distance, (points[i] - points[j]).norm());
+            }
+        }
+        return min_distance;
+    };
+
+    const auto sphere = geometry::TriangleMesh::CreateSphere(1.0, 20);
+    const size_t n_points = 500;
+    auto pcd = sphere->SamplePointsPoissonDisk(n_points, 5, nullptr, false, 3);
+    EXPECT_EQ(pcd->points_.size(), n_points);
+    ExpectEQ(pcd->points_,
+             sphere->SamplePointsPoissonDisk(n_points, 5, nullptr, false, 3)
+                     ->points_);
+
+    // The samples are much better spread than uniform samples.
+    auto pcd_init = sphere->SamplePointsUniformly(5 * n_points, false, 3);
+    auto pcd_uniform = sphere->SamplePointsUniformly(n_points, false, 3);
+    EXPECT_GT(MinDistance(pcd->points_), 2 * MinDistance(pcd_uniform->points_));
+    ExpectEQ(pcd->points_,
+             sphere->SamplePointsPoissonDisk(n_points, 5, pcd_init)->points_);
+    EXPECT_THROW(sphere->SamplePointsPoissonDisk(10 * n_points, 5, pcd_init),
+                 std::runtime_error);
+}
+
+TEST(TriangleMesh, CreateFromPointCloudBallPivoting) {
+    // Height field on a perturbed grid, large enough for several blocks.
+    const int resolution = 200;
+    const double spacing = 1.0 / resolution;
+    geometry::PointCloud pcd;
+    for (int i = 0; i < resolution; ++i) {
+        for (int j = 0; j < resolution; ++j) {
+            const double x = (i + 0.2 * std::sin(7.0 * i + 3.0 * j)) * spacing;
+            const double y = (j + 0.2 * std::cos(5.0 * i - 11.0 * j)) * spacing;
+            pcd.points_.emplace_back(x, y, 0.1 * std::sin(3 * x));
+            pcd.normals_.push_back(
+                    Eigen::Vector3d(-0.3 * std::cos(3 * x), 0, 1).normalized());
+        }
+    }
+    const std::vector<double> radii = {1.5 * spacing, 3 * spacing};
+    EXPECT_THROW(geometry::TriangleMesh::CreateFromPointCloudBallPivoting(
+                         pcd, {-1.0}),
+                 std::runtime_error);
+
+    auto mesh = geometry::TriangleMesh::CreateFromPointCloudBallPivoting(pcd,
+                                                                         radii);
+    const size_t num_grid_triangles =
+            2 * size_t(resolution - 1) * size_t(resolution - 1);
+    EXPECT_GT(mesh->triangles_.size(), num_grid_triangles * 99 / 100);
+    EXPECT_LT(mesh->triangles_.size(), num_grid_triangles * 101 / 100);
+    EXPECT_TRUE(mesh->IsEdgeManifold(true));
+    EXPECT_EQ(mesh->triangle_normals_.size(), mesh->triangles_.size());
+
+    // The blocks are stitched without missing or overlapping triangles.
+    auto mesh_parallel =
+            geometry::TriangleMesh::CreateFromPointCloudBallPivoting(pcd, radii,
+                                                                     true);
+    EXPECT_NEAR(double(mesh_parallel->triangles_.size()),
+                double(mesh->triangles_.size()),
+                1e-3 * double(mesh->triangles_.size()));
+    EXPECT_TRUE(mesh_parallel->IsEdgeManifold(true));
+    ExpectEQ(mesh_parallel->vertices_, pcd.points_);
+
+    geometry::PointCloud no_normals;
+    no_normals.points_ = pcd.points_;
+    EXPECT_THROW(geometry::TriangleMesh::CreateFromPointCloudBallPivoting(
+                         no_normals, radii),
+                 std::runtime_error);
+}
+
+TEST(TriangleMesh, SimplifyQuadricDecimation) {
+    // Large enough for the parallel decimation to use several clusters.
+    const auto sphere = geometry::TriangleMesh::CreateSphere(1.0, 100);
+    const double inf = std::numeric_limits<double>::infinity();
+    auto MaxDeviation = [](const geometry::TriangleMesh& mesh) {
+        double max_deviation = 0.0;
+        for (const Eigen::Vector3d& vertex : mesh.vertices_) {
+            max_deviation =
+                    std::max(max_deviation, std::abs(vertex.norm() - 1.0));
+        }
+        return max_deviation;
+    };
+
+    for (bool parallel : {false, true}) {
+        auto mesh = sphere->SimplifyQuadricDecimation(2000, inf, 1.0, parallel);
+        EXPECT_EQ(mesh->triangles_.size(), 2000u);
+        EXPECT_TRUE(mesh->IsEdgeManifold());
+        EXPECT_TRUE(mesh->IsVertexManifold());
+        EXPECT_LT(MaxDeviation(*mesh), 5e-3);
+
+        // Decimation up to a maximum error.
+        mesh = sphere->SimplifyQuadricDecimation(0, 1e-6, 1.0, parallel);
+        EXPECT_GT(mesh->triangles_.size(), 1000u);
+        EXPECT_LT(mesh->triangles_.size(), 4000u);
+        EXPECT_TRUE(mesh->IsEdgeManifold());
+        EXPECT_LT(MaxDeviation(*mesh), 5e-3);
+    }
 }
 
 TEST(TriangleMesh, FilterSharpen) {
@@ -1573,6 +1806,35 @@ TEST(TriangleMesh, SelectByIndex) {
     ExpectEQ(ref_triangle_normals, output_tm->triangle_normals_);
 }
 
+TEST(TriangleMesh, SelectByMask) {
+    auto mesh = geometry::TriangleMesh::CreateSphere(1.0, 100);
+    mesh->ComputeVertexNormals();
+    mesh->vertex_colors_ = mesh->vertices_;
+    std::vector<bool> mask(mesh->vertices_.size());
+    std::vector<size_t> indices;
+    for (size_t vidx = 0; vidx < mesh->vertices_.size(); ++vidx) {
+        mask[vidx] = mesh->vertices_[vidx](2) > 0.2;
+        if (mask[vidx]) {
+            indices.push_back(vidx);
+        }
+    }
+
+    auto selected = mesh->SelectByMask(mask, /*cleanup=*/false);
+    ExpectMeshEQ(*selected, *mesh->SelectByIndex(indices, /*cleanup=*/false));
+    EXPECT_GT(selected->triangles_.size(), 0u);
+
+    // Removing the other vertices gives the same mesh.
+    geometry::TriangleMesh removed = *mesh;
+    std::vector<bool> inverse_mask(mask.size());
+    for (size_t vidx = 0; vidx < mask.size(); ++vidx) {
+        inverse_mask[vidx] = !mask[vidx];
+    }
+    removed.RemoveVerticesByMask(inverse_mask);
+    ExpectMeshEQ(*selected, removed);
+
+    EXPECT_ANY_THROW(mesh->SelectByMask(std::vector<bool>(10, true)));
+}
+
 TEST(TriangleMesh, CropTriangleMesh) {
     std::vector<Eigen::Vector3d> ref_vertices = {
             {615.686275, 639.215686, 517.647059},
@@ -1890,6 +2152,70 @@ TEST(TriangleMesh, CreateFromPointCloudPoisson) {
     ExpectEQ(densities_es, densities_gt, 1e-4);
 }
 
+TEST(TriangleMesh, CreateFromPointCloudPoissonToFile) {
+    auto sphere = geometry::TriangleMesh::CreateSphere(1.0, 40);
+    sphere->ComputeVertexNormals();
+    geometry::PointCloud pcd;
+    pcd.points_ = sphere->vertices_;
+    pcd.normals_ = sphere->vertex_normals_;
+    pcd.colors_.resize(pcd.points_.size());
+    for (size_t pidx = 0; pidx < pcd.points_.size(); ++pidx) {
+        pcd.colors_[pidx] = 0.5 * (pcd.points_[pidx].array() + 1.0);
+    }
+
+    geometry::PoissonReconstructionInfo info;
+    std::shared_ptr<geometry::TriangleMesh> mesh;
+    std::vector<double> densities;
+    std::tie(mesh, densities) =
+            geometry::TriangleMesh::CreateFromPointCloudPoisson(
+                    pcd, 5, 0, 1.1f, false, /*n_threads=*/1, &info);
+    EXPECT_EQ(info.input_point_count_, pcd.points_.size());
+    EXPECT_EQ(info.depth_, 5);
+    EXPECT_EQ(info.thread_count_, 1);
+    EXPECT_EQ(info.vertex_count_, mesh->vertices_.size());
+    EXPECT_EQ(info.triangle_count_, mesh->triangles_.size());
+    std::vector<std::string> names;
+    for (const auto& stage : info.stages_) {
+        names.push_back(stage.name_);
+        EXPECT_GE(stage.time_, 0);
+    }
+    EXPECT_EQ(names,
+              std::vector<std::string>(
+                      {"read_samples", "kernel_density", "normal_field",
+                       "finalize_tree", "fem_constraints", "point_constraints",
+                       "solve", "iso_value", "extract", "output"}));
+    EXPECT_GT(info.total_time_, 0);
+
+    // The streamed surface is the same as the in-memory one, up to the float
+    // precision of the file. The output and the temporary files of the
+    // out-of-core mesh go to a scratch directory, which has to be empty again
+    // once the output is removed.
+    const char* temp_root = std::getenv("TMPDIR");
+    if (temp_root == nullptr) temp_root = std::getenv("TEMP");
+    const std::string directory =
+            std::string(temp_root != nullptr ? temp_root : "/tmp") +
+            "/open3d_poisson_to_file_" +
+            std::to_string(std::chrono::steady_clock::now()
+                                   .time_since_epoch()
+                                   .count());
+    ASSERT_TRUE(utility::filesystem::MakeDirectoryHierarchy(directory));
+    const std::string filename = directory + "/poisson_to_file.ply";
+    geometry::PoissonReconstructionInfo file_info;
+    EXPECT_TRUE(geometry::TriangleMesh::CreateFromPointCloudPoissonToFile(
+            pcd, filename, 5, 0, 1.1f, false, /*n_threads=*/1, &file_info));
+    EXPECT_EQ(file_info.vertex_count_, mesh->vertices_.size());
+    EXPECT_EQ(file_info.triangle_count_, mesh->triangles_.size());
+    EXPECT_EQ(file_info.stages_.size(), info.stages_.size());
+
+    geometry::TriangleMesh mesh_file;
+    EXPECT_TRUE(io::ReadTriangleMesh(filename, mesh_file));
+    EXPECT_TRUE(utility::filesystem::RemoveFile(filename));
+    EXPECT_TRUE(utility::filesystem::DeleteDirectory(directory));
+    ExpectEQ(mesh_file.vertices_, mesh->vertices_, 1e-5);
+    ExpectEQ(mesh_file.vertex_colors_, mesh->vertex_colors_, 1.0 / 255);
+    ExpectEQ(mesh_file.triangles_, mesh->triangles_);
+}
+
 TEST(TriangleMesh, CreateFromPointCloudAlphaShape) {
     geometry::PointCloud pcd;
     pcd.points_ = {
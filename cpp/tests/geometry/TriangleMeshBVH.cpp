@@ -0,0 +1,256 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/geometry/TriangleMeshBVH.h"
+
+#include <limits>
+
+#include "open3d/geometry/IntersectionTest.h"
+#include "open3d/geometry/TriangleMesh.h"
+#include "tests/UnitTest.h"
+
+namespace open3d {
+namespace tests {
+
+namespace {
+
+/// Soup of small triangles that do not share vertices.
+geometry::TriangleMesh RandomTriangleSoup(int num_triangles) {
+    std::vector<Eigen::Vector3d> centers(num_triangles);
+    Rand(centers, Eigen::Vector3d(0.0, 0.0, 0.0),
+         Eigen::Vector3d(10.0, 10.0, 10.0), 0);
+    std::vector<Eigen::Vector3d> offsets(3 * num_triangles);
+    Rand(offsets, Eigen::Vector3d(-1.0, -1.0, -1.0),
+         Eigen::Vector3d(1.0, 1.0, 1.0), 1);
+    geometry::TriangleMesh mesh;
+    for (int i = 0; i < num_triangles; ++i) {
+        for (int k = 0; k < 3; ++k) {
+            mesh.vertices_.push_back(centers[i] + offsets[3 * i + k]);
+        }
+        mesh.triangles_.push_back(Eigen::Vector3i(3 * i, 3 * i + 1, 3 * i + 2));
+    }
+    return mesh;
+}
+
+std::vector<Eigen::Vector2i> BruteForceSelfIntersectingTriangles(
+        const geometry::TriangleMesh &mesh) {
+    std::vector<Eigen::Vector2i> pairs;
+    for (int i = 0; i < int(mesh.triangles_.size()); ++i) {
+        const Eigen::Vector3i &p = mesh.triangles_[i];
+        for (int j = i + 1; j < int(mesh.triangles_.size()); ++j) {
+            const Eigen::Vector3i &q = mesh.triangles_[j];
+            bool shared = false;
+            for (int a = 0; a < 3; ++a) {
+                for (int b = 0; b < 3; ++b) {
+                    shared = shared || p(a) == q(b);
+                }
+            }
+            if (!shared &&
+                geometry::IntersectionTest::TriangleTriangle3d(
+                        mesh.vertices_[p(0)], mesh.vertices_[p(1)],
+                        mesh.vertices_[p(2)], mesh.vertices_[q(0)],
+                        mesh.vertices_[q(1)], mesh.vertices_[q(2)])) {
+                pairs.push_back(Eigen::Vector2i(i, j));
+            }
+        }
+    }
+    return pairs;
+}
+
+}  // namespace
+
+TEST(TriangleMeshBVH, Build) {
+    const geometry::TriangleMesh mesh = RandomTriangleSoup(1000);
+    for (int max_leaf_size : {1, 4, 16}) {
+        geometry::TriangleMeshBVH bvh(mesh, max_leaf_size);
+        EXPECT_FALSE(bvh.IsEmpty());
+        std::vector<int> counts(mesh.triangles_.size(), 0);
+        for (size_t n = 0; n < bvh.nodes_.size(); ++n) {
+            const geometry::TriangleMeshBVH::Node &node = bvh.nodes_[n];
+            if (!node.IsLeaf()) {
+                // Children are inside their parent.
+                for (int child : {int(n) + 1, node.offset_}) {
+                    EXPECT_TRUE((bvh.nodes_[child].min_bound_.array() >=
+                                 node.min_bound_.array())
+                                        .all());
+                    EXPECT_TRUE((bvh.nodes_[child].max_bound_.array() <=
+                                 node.max_bound_.array())
+                                        .all());
+                }
+                continue;
+            }
+            EXPECT_LE(node.num_triangles_, max_leaf_size);
+            for (int i = node.offset_; i < node.offset_ + node.num_triangles_;
+                 ++i) {
+                const int tidx = bvh.triangle_indices_[i];
+                counts[tidx]++;
+                for (int k = 0; k < 3; ++k) {
+                    const Eigen::Vector3d &v =
+                            mesh.vertices_[mesh.triangles_[tidx](k)];
+                    EXPECT_TRUE((v.array() >= node.min_bound_.array()).all());
+                    EXPECT_TRUE((v.array() <= node.max_bound_.array()).all());
+                }
+            }
+        }
+        // Every triangle is in exactly one leaf.
+        EXPECT_EQ(counts, std::vector<int>(mesh.triangles_.size(), 1));
+    }
+
+    // Identical triangles cannot be separated by the SAH.
+    geometry::TriangleMesh degenerate;
+    degenerate.vertices_ = {{0, 0, 0}, {1, 0, 0}, {0, 1, 0}};
+    degenerate.triangles_.assign(100, Eigen::Vector3i(0, 1, 2));
+    geometry::TriangleMeshBVH degenerate_bvh(degenerate, 4);
+    EXPECT_EQ(degenerate_bvh.triangle_indices_.size(), 100u);
+
+    EXPECT_TRUE(geometry::TriangleMeshBVH(geometry::TriangleMesh()).IsEmpty());
+}
+
+TEST(TriangleMeshBVH, GetSelfIntersectingTriangles) {
+    const geometry::TriangleMesh soup = RandomTriangleSoup(500);
+    const std::vector<Eigen::Vector2i> ref_pairs =
+            BruteForceSelfIntersectingTriangles(soup);
+    EXPECT_FALSE(ref_pairs.empty());
+    EXPECT_EQ(geometry::TriangleMeshBVH(soup).GetSelfIntersectingTriangles(),
+              ref_pairs);
+    EXPECT_EQ(soup.GetSelfIntersectingTriangles(), ref_pairs);
+
+    // Two overlapping spheres, triangles of the same sphere share vertices.
+    geometry::TriangleMesh spheres = *geometry::TriangleMesh::CreateSphere();
+    geometry::TriangleMesh sphere1 = *geometry::TriangleMesh::CreateSphere();
+    sphere1.Translate(Eigen::Vector3d(1.0, 0.2, 0.1));
+    spheres += sphere1;
+    EXPECT_EQ(spheres.GetSelfIntersectingTriangles(),
+              BruteForceSelfIntersectingTriangles(spheres));
+    EXPECT_FALSE(spheres.GetSelfIntersectingTriangles().empty());
+
+    EXPECT_TRUE(
+            geometry::TriangleMesh().GetSelfIntersectingTriangles().empty());
+}
+
+TEST(TriangleMeshBVH, IsIntersecting) {
+    const geometry::TriangleMesh sphere0 =
+            *geometry::TriangleMesh::CreateSphere();
+    for (double offset : {0.5, 1.9, 2.1, 3.0}) {
+        geometry::TriangleMesh sphere1 =
+                *geometry::TriangleMesh::CreateSphere();
+        sphere1.Translate(Eigen::Vector3d(offset, 0.0, 0.0));
+        geometry::TriangleMesh spheres = sphere0;
+        spheres += sphere1;
+        const std::vector<Eigen::Vector2i> pairs =
+                BruteForceSelfIntersectingTriangles(spheres);
+        const bool expected = !pairs.empty();
+        EXPECT_EQ(sphere0.IsIntersecting(sphere1), expected);
+        EXPECT_EQ(geometry::TriangleMeshBVH(sphere1).IsIntersecting(
+                          geometry::TriangleMeshBVH(sphere0)),
+                  expected);
+    }
+
+    // The small sphere inside the large one does not touch it.
+    const geometry::TriangleMesh small_sphere =
+            *geometry::TriangleMesh::CreateSphere(0.5);
+    EXPECT_FALSE(sphere0.IsIntersecting(small_sphere));
+    EXPECT_FALSE(sphere0.IsIntersecting(geometry::TriangleMesh()));
+}
+
+TEST(TriangleMeshBVH, CastRays) {
+    const geometry::TriangleMesh box = *geometry::TriangleMesh::CreateBox();
+    geometry::TriangleMeshBVH box_bvh(box);
+    std::vector<double> t_hit;
+    std::vector<int> triangle_ids;
+    std::tie(t_hit, triangle_ids) =
+            box_bvh.CastRays({{0.5, 0.5, -1.0}, {0.5, 0.5, 0.5}, {2, 2, 2}},
+                             {{0.0, 0.0, 2.0}, {1.0, 0.0, 0.0}, {1, 0, 0}});
+    EXPECT_NEAR(t_hit[0], 0.5, 1e-12);
+    EXPECT_NEAR(t_hit[1], 0.5, 1e-12);
+    EXPECT_EQ(t_hit[2], std::numeric_limits<double>::infinity());
+    EXPECT_GE(triangle_ids[0], 0);
+    EXPECT_GE(triangle_ids[1], 0);
+    EXPECT_EQ(triangle_ids[2], -1);
+
+    // A BVH with a single leaf tests all triangles.
+    const geometry::TriangleMesh soup = RandomTriangleSoup(1000);
+    geometry::TriangleMeshBVH bvh(soup);
+    geometry::TriangleMeshBVH ref_bvh(soup, int(soup.triangles_.size()));
+    EXPECT_EQ(ref_bvh.nodes_.size(), 1u);
+    std::vector<Eigen::Vector3d> origins(1000), directions(1000);
+    Rand(origins, Eigen::Vector3d(-2.0, -2.0, -2.0),
+         Eigen::Vector3d(12.0, 12.0, 12.0), 2);
+    Rand(directions, Eigen::Vector3d(-1.0, -1.0, -1.0),
+         Eigen::Vector3d(1.0, 1.0, 1.0), 3);
+    std::vector<double> ref_t_hit;
+    std::vector<int> ref_triangle_ids;
+    std::tie(t_hit, triangle_ids) = bvh.CastRays(origins, directions);
+    std::tie(ref_t_hit, ref_triangle_ids) =
+            ref_bvh.CastRays(origins, directions);
+    EXPECT_EQ(t_hit, ref_t_hit);
+    EXPECT_EQ(triangle_ids, ref_triangle_ids);
+    EXPECT_GT(std::count(triangle_ids.begin(), triangle_ids.end(), -1), 0);
+    EXPECT_LT(std::count(triangle_ids.begin(), triangle_ids.end(), -1), 1000);
+
+    EXPECT_ANY_THROW(bvh.CastRays(origins, {}));
+}
+
+TEST(TriangleMeshBVH, ComputeClosestPoints) {
+    const geometry::TriangleMesh box = *geometry::TriangleMesh::CreateBox();
+    geometry::TriangleMeshBVH box_bvh(box);
+    std::vector<Eigen::Vector3d> closest_points;
+    std::vector<int> triangle_ids;
+    std::tie(closest_points, triangle_ids) = box_bvh.ComputeClosestPoints(
+            {{0.5, 0.5, 2.0}, {2.0, 2.0, 2.0}, {0.5, 0.5, 0.4}});
+    ExpectEQ(closest_points[0], Eigen::Vector3d(0.5, 0.5, 1.0));
+    ExpectEQ(closest_points[1], Eigen::Vector3d(1.0, 1.0, 1.0));
+    ExpectEQ(closest_points[2], Eigen::Vector3d(0.5, 0.5, 0.0));
+    ExpectEQ(box_bvh.ComputeDistance(
+                     {{0.5, 0.5, 2.0}, {2.0, 2.0, 2.0}, {0.5, 0.5, 0.4}}),
+             std::vector<double>({1.0, std::sqrt(3.0), 0.4}));
+
+    const geometry::TriangleMesh soup = RandomTriangleSoup(1000);
+    geometry::TriangleMeshBVH bvh(soup);
+    geometry::TriangleMeshBVH ref_bvh(soup, int(soup.triangles_.size()));
+    std::vector<Eigen::Vector3d> queries(1000);
+    Rand(queries, Eigen::Vector3d(-2.0, -2.0, -2.0),
+         Eigen::Vector3d(12.0, 12.0, 12.0), 4);
+    std::vector<Eigen::Vector3d> ref_closest_points;
+    std::vector<int> ref_triangle_ids;
+    std::tie(closest_points, triangle_ids) = bvh.ComputeClosestPoints(queries);
+    std::tie(ref_closest_points, ref_triangle_ids) =
+            ref_bvh.ComputeClosestPoints(queries);
+    ExpectEQ(closest_points, ref_closest_points);
+    EXPECT_EQ(triangle_ids, ref_triangle_ids);
+    ExpectEQ(bvh.ComputeDistance(queries), ref_bvh.ComputeDistance(queries));
+
+    geometry::TriangleMeshBVH empty_bvh(geometry::TriangleMesh(), 4);
+    EXPECT_EQ(empty_bvh.ComputeDistance(queries),
+              std::vector<double>(queries.size(),
+                                  std::numeric_limits<double>::infinity()));
+    std::tie(std::ignore, triangle_ids) =
+            empty_bvh.ComputeClosestPoints(queries);
+    EXPECT_EQ(triangle_ids, std::vector<int>(queries.size(), -1));
+}
+
+}  // namespace tests
+}  // namespace open3d
@@ -24,6 +24,11 @@
 // IN THE SOFTWARE.
 // ----------------------------------------------------------------------------
 
+#include "open3d/io/TriangleMeshIO.h"
+
+#include <fstream>
+
+#include "open3d/geometry/StreamingVertexClustering.h"
 #include "tests/UnitTest.h"
 
 namespace open3d {
@@ -39,5 +44,129 @@ TEST(TriangleMeshIO, DISABLED_ReadTriangleMeshFromPLY) { NotImplemented(); }
 
 TEST(TriangleMeshIO, DISABLED_WriteTriangleMeshToPLY) { NotImplemented(); }
 
+namespace {
+
+/// Reads the mesh chunk by chunk into one mesh.
+geometry::TriangleMesh ReadInChunks(const std::string &filename,
+                                    int chunk_size) {
+    geometry::TriangleMesh mesh;
+    int num_chunks = 0;
+    EXPECT_TRUE(io::ReadTriangleMeshInChunks(
+            filename,
+            [&](const std::vector<Eigen::Vector3d> &vertices,
+                const std::vector<Eigen::Vector3d> &vertex_normals,
+                const std::vector<Eigen::Vector3d> &vertex_colors) {
+                EXPECT_LE(int(vertices.size()), chunk_size);
+                mesh.vertices_.insert(mesh.vertices_.end(), vertices.begin(),
+                                      vertices.end());
+                mesh.vertex_normals_.insert(mesh.vertex_normals_.end(),
+                                            vertex_normals.begin(),
+                                            vertex_normals.end());
+                mesh.vertex_colors_.insert(mesh.vertex_colors_.end(),
+                                           vertex_colors.begin(),
+                                           vertex_colors.end());
+                num_chunks++;
+            },
+            [&](const std::vector<Eigen::Vector3i> &triangles) {
+                EXPECT_LE(int(triangles.size()), chunk_size + 1);
+                for (const Eigen::Vector3i &triangle : triangles) {
+                    EXPECT_LT(triangle.maxCoeff(), int(mesh.vertices_.size()));
+                }
+                mesh.triangles_.insert(mesh.triangles_.end(), triangles.begin(),
+                                       triangles.end());
+                num_chunks++;
+            },
+            chunk_size));
+    EXPECT_GT(num_chunks, 2);
+    return mesh;
+}
+
+}  // namespace
+
+TEST(TriangleMeshIO, ReadTriangleMeshInChunksFromPLY) {
+    auto mesh_gt = geometry::TriangleMesh::CreateSphere(1.0, 20);
+    mesh_gt->ComputeVertexNormals();
+    mesh_gt->vertex_colors_.resize(mesh_gt->vertices_.size());
+    Rand(mesh_gt->vertex_colors_, Eigen::Vector3d(0.0, 0.0, 0.0),
+         Eigen::Vector3d(1.0, 1.0, 1.0), 0);
+    io::WriteTriangleMesh("tmp_chunks.ply", *mesh_gt);
+    geometry::TriangleMesh mesh_read;
+    io::ReadTriangleMesh("tmp_chunks.ply", mesh_read);
+
+    geometry::TriangleMesh mesh = ReadInChunks("tmp_chunks.ply", 50);
+    ExpectEQ(mesh.vertices_, mesh_read.vertices_);
+    ExpectEQ(mesh.vertex_normals_, mesh_read.vertex_normals_);
+    ExpectEQ(mesh.vertex_colors_, mesh_read.vertex_colors_);
+    ExpectEQ(mesh.triangles_, mesh_read.triangles_);
+}
+
+TEST(TriangleMeshIO, ReadTriangleMeshInChunksFromOBJ) {
+    // Unit cube with colors, quads, texture and normal indices, and relative
+    // indices.
+    std::ofstream file("tmp_chunks.obj");
+    file << "# cube\n"
+            "v 0 0 0 1 0 0\nv 1 0 0 1 0 0\nv 1 1 0 1 0 0\nv 0 1 0 1 0 0\n"
+            "vt 0 0\nvn 0 0 -1\n"
+            "f 1/1/1 4/1/1 3/1/1 2/1/1\n"
+            "v 0 0 1 0 1 0\nv 1 0 1 0 1 0\nv 1 1 1 0 1 0\nv 0 1 1 0 1 0\n"
+            "f -4//1 -3//1 -2//1 -1//1\n"
+            "f 1 2 6\nf 1 6 5\nf 2 3 7\nf 2 7 6\n"
+            "f 3 4 8\nf 3 8 7\nf 4 1 5\nf 4 5 8\n";
+    file.close();
+
+    geometry::TriangleMesh mesh = ReadInChunks("tmp_chunks.obj", 3);
+    ExpectEQ(mesh.vertices_, std::vector<Eigen::Vector3d>({{0, 0, 0},
+                                                           {1, 0, 0},
+                                                           {1, 1, 0},
+                                                           {0, 1, 0},
+                                                           {0, 0, 1},
+                                                           {1, 0, 1},
+                                                           {1, 1, 1},
+                                                           {0, 1, 1}}));
+    EXPECT_FALSE(mesh.HasVertexNormals());
+    ExpectEQ(mesh.vertex_colors_, std::vector<Eigen::Vector3d>({{1, 0, 0},
+                                                                {1, 0, 0},
+                                                                {1, 0, 0},
+                                                                {1, 0, 0},
+                                                                {0, 1, 0},
+                                                                {0, 1, 0},
+                                                                {0, 1, 0},
+                                                                {0, 1, 0}}));
+    ExpectEQ(mesh.triangles_, std::vector<Eigen::Vector3i>({{0, 3, 2},
+                                                            {0, 2, 1},
+                                                            {4, 5, 6},
+                                                            {4, 6, 7},
+                                                            {0, 1, 5},
+                                                            {0, 5, 4},
+                                                            {1, 2, 6},
+                                                            {1, 6, 5},
+                                                            {2, 3, 7},
+                                                            {2, 7, 6},
+                                                            {3, 0, 4},
+                                                            {3, 4, 7}}));
+}
+
+TEST(TriangleMeshIO, SimplifyTriangleMeshFileVertexClustering) {
+    auto mesh = geometry::TriangleMesh::CreateSphere(1.0, 40);
+    io::WriteTriangleMesh("tmp_chunks.ply", *mesh);
+    EXPECT_TRUE(io::SimplifyTriangleMeshFileVertexClustering(
+            "tmp_chunks.ply", "tmp_simplified.ply", 0.2,
+            geometry::MeshBase::SimplificationContraction::Quadric));
+
+    geometry::StreamingVertexClustering clustering(
+            0.2, geometry::MeshBase::SimplificationContraction::Quadric);
+    clustering.AddVertices(mesh->vertices_);
+    clustering.AddTriangles(mesh->triangles_);
+    auto expected = clustering.GetSimplifiedMesh();
+    geometry::TriangleMesh simplified;
+    io::ReadTriangleMesh("tmp_simplified.ply", simplified);
+    ExpectEQ(simplified.vertices_, expected->vertices_);
+    ExpectEQ(simplified.triangles_, expected->triangles_);
+    EXPECT_LT(simplified.triangles_.size(), mesh->triangles_.size() / 5);
+
+    EXPECT_FALSE(io::SimplifyTriangleMeshFileVertexClustering(
+            "does_not_exist.ply", "tmp_simplified.ply", 0.2));
+}
+
 }  // namespace tests
 }  // namespace open3d
@@ -24,6 +24,10 @@
 // IN THE SOFTWARE.
 // ----------------------------------------------------------------------------
 
+#include "open3d/pipelines/registration/Feature.h"
+
+#include "open3d/geometry/NeighborGraph.h"
+#include "open3d/geometry/PointCloud.h"
 #include "tests/UnitTest.h"
 
 namespace open3d {
@@ -39,5 +43,24 @@ TEST(Feature, DISABLED_ComputeFPFHFeature) { NotImplemented(); }
 
 TEST(Feature, DISABLED_KDTreeSearchParamKNN) { NotImplemented(); }
 
+TEST(Feature, ComputeFPFHFeatureNeighborGraph) {
+    geometry::PointCloud pc;
+    pc.points_.resize(500);
+    Rand(pc.points_, Eigen::Vector3d(0.0, 0.0, 0.0),
+         Eigen::Vector3d(10.0, 10.0, 10.0), 0);
+    pc.EstimateNormals(geometry::KDTreeSearchParamKNN(10));
+
+    const geometry::KDTreeSearchParamHybrid search_param(2.5, 20);
+    auto ref = pipelines::registration::ComputeFPFHFeature(pc, search_param);
+    auto graph = geometry::NeighborGraph::CreateFromPointCloud(
+            pc, geometry::KDTreeSearchParamRadius(3.0));
+    auto feature = pipelines::registration::ComputeFPFHFeature(pc, search_param,
+                                                               graph);
+    ExpectEQ(feature->data_, ref->data_);
+
+    EXPECT_ANY_THROW(pipelines::registration::ComputeFPFHFeature(
+            pc, geometry::KDTreeSearchParamKNN(20), graph));
+}
+
 }  // namespace tests
 }  // namespace open3d
@@ -199,6 +199,32 @@ TEST_P(PointCloudPermuteDevices, Scale) {
               std::vector<float>({-3, -3, -3, 1, 1, 1, 5, 5, 5}));
 }
 
+TEST_P(PointCloudPermuteDevices, SortByMortonCode) {
+    core::Device device = GetParam();
+
+    t::geometry::PointCloud pcd(core::Dtype::Float32, device);
+    pcd.SetPoints(core::TensorList::FromTensor(
+            core::Tensor(std::vector<float>{1, 1, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0},
+                         {4, 3}, core::Dtype::Float32, device)));
+    pcd.SetPointAttr("labels", core::TensorList::FromTensor(core::Tensor(
+                                       std::vector<int64_t>{3, 0, 1, 2}, {4, 1},
+                                       core::Dtype::Int64, device)));
+
+    core::Tensor permutation = pcd.SortByMortonCode();
+    EXPECT_EQ(permutation.ToFlatVector<int64_t>(),
+              std::vector<int64_t>({1, 2, 3, 0}));
+    EXPECT_EQ(pcd.GetPoints().AsTensor().ToFlatVector<float>(),
+              std::vector<float>({0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 1}));
+    EXPECT_EQ(pcd.GetPointAttr("labels").AsTensor().ToFlatVector<int64_t>(),
+              std::vector<int64_t>({0, 1, 2, 3}));
+
+    // Attributes stay resizable after sorting.
+    pcd.SynchronizedPushBack(
+            {{"points", core::Tensor::Zeros({3}, core::Dtype::Float32, device)},
+             {"labels", core::Tensor::Zeros({1}, core::Dtype::Int64, device)}});
+    EXPECT_EQ(pcd.GetPoints().GetSize(), 5);
+}
+
 TEST_P(PointCloudPermuteDevices, FromLegacyPointCloud) {
     core::Device device = GetParam();
     geometry::PointCloud legacy_pcd;
@@ -0,0 +1,299 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+#include "open3d/t/geometry/VoxelGrid.h"
+
+#include <algorithm>
+#include <numeric>
+
+#include "open3d/camera/PinholeCameraParameters.h"
+#include "open3d/geometry/Image.h"
+#include "open3d/geometry/PointCloud.h"
+#include "open3d/geometry/VoxelGrid.h"
+#include "open3d/t/geometry/PointCloud.h"
+#include "tests/UnitTest.h"
+
+namespace open3d {
+namespace tests {
+
+// Voxels of both grids agree on grid indices and colors, up to tol.
+static void ExpectVoxelsEQ(const geometry::VoxelGrid& voxel_grid,
+                           const geometry::VoxelGrid& voxel_grid_gt,
+                           double tol = 0) {
+    EXPECT_EQ(voxel_grid.voxel_size_, voxel_grid_gt.voxel_size_);
+    ExpectEQ(voxel_grid.origin_, voxel_grid_gt.origin_);
+    ASSERT_EQ(voxel_grid.voxels_.size(), voxel_grid_gt.voxels_.size());
+    for (const auto& it : voxel_grid_gt.voxels_) {
+        auto found = voxel_grid.voxels_.find(it.first);
+        ASSERT_TRUE(found != voxel_grid.voxels_.end());
+        ExpectEQ(found->second.grid_index_, it.second.grid_index_);
+        ExpectEQ(found->second.color_, it.second.color_, tol);
+    }
+}
+
+static geometry::PointCloud CreateColoredPointCloud(int num_points) {
+    geometry::PointCloud pcd;
+    pcd.points_.resize(num_points);
+    pcd.colors_.resize(num_points);
+    Rand(pcd.points_, Eigen::Vector3d(-1, -1, -1), Eigen::Vector3d(1, 1, 1), 0);
+    Rand(pcd.colors_, Eigen::Vector3d(0, 0, 0), Eigen::Vector3d(1, 1, 1), 1);
+    return pcd;
+}
+
+TEST(TensorVoxelGrid, DefaultConstructor) {
+    t::geometry::VoxelGrid voxel_grid;
+    EXPECT_EQ(voxel_grid.GetGeometryType(),
+              t::geometry::Geometry::GeometryType::VoxelGrid);
+    EXPECT_TRUE(voxel_grid.IsEmpty());
+    EXPECT_EQ(voxel_grid.GetSize(), 0);
+    EXPECT_EQ(voxel_grid.GetGridIndices().GetShape(), core::SizeVector({0, 3}));
+    EXPECT_EQ(voxel_grid.GetColors().GetDtype(), core::Dtype::Float32);
+
+    EXPECT_ANY_THROW(t::geometry::VoxelGrid(1.0, Eigen::Vector3d::Zero(),
+                                            core::Dtype::Int64));
+}
+
+TEST(TensorVoxelGrid, LegacyConversion) {
+    const geometry::PointCloud pcd = CreateColoredPointCloud(1000);
+    auto voxel_grid_legacy =
+            geometry::VoxelGrid::CreateFromPointCloud(pcd, 0.1);
+
+    // Float64 colors, the default, are lossless.
+    auto voxel_grid =
+            t::geometry::VoxelGrid::FromLegacyVoxelGrid(*voxel_grid_legacy);
+    EXPECT_EQ(voxel_grid.GetColors().GetDtype(), core::Dtype::Float64);
+    EXPECT_EQ(voxel_grid.GetSize(), int64_t(voxel_grid_legacy->voxels_.size()));
+    ExpectVoxelsEQ(voxel_grid.ToLegacyVoxelGrid(), *voxel_grid_legacy);
+
+    // Float32 colors are exact up to float precision.
+    voxel_grid = t::geometry::VoxelGrid::FromLegacyVoxelGrid(
+            *voxel_grid_legacy, core::Dtype::Float32);
+    ExpectVoxelsEQ(voxel_grid.ToLegacyVoxelGrid(), *voxel_grid_legacy, 1e-7);
+
+    // UInt8 colors are lossless for multiples of 1 / 255.
+    for (auto& it : voxel_grid_legacy->voxels_) {
+        it.second.color_ = (it.second.color_ * 255).array().round() / 255;
+    }
+    voxel_grid = t::geometry::VoxelGrid::FromLegacyVoxelGrid(
+            *voxel_grid_legacy, core::Dtype::UInt8);
+    EXPECT_EQ(voxel_grid.GetColors().GetDtype(), core::Dtype::UInt8);
+    ExpectVoxelsEQ(voxel_grid.ToLegacyVoxelGrid(), *voxel_grid_legacy);
+
+    // Copies are deep and keep their own row table.
+    t::geometry::VoxelGrid copy = voxel_grid;
+    voxel_grid.Clear();
+    EXPECT_TRUE(voxel_grid.IsEmpty());
+    ExpectVoxelsEQ(copy.ToLegacyVoxelGrid(), *voxel_grid_legacy);
+    std::vector<int64_t> rows(copy.GetSize());
+    std::iota(rows.begin(), rows.end(), 0);
+    EXPECT_EQ(copy.FindVoxels(copy.GetGridIndices()).ToFlatVector<int64_t>(),
+              rows);
+}
+
+TEST(TensorVoxelGrid, CreateFromPointCloud) {
+    const geometry::PointCloud pcd = CreateColoredPointCloud(10000);
+    auto voxel_grid_legacy =
+            geometry::VoxelGrid::CreateFromPointCloud(pcd, 0.07);
+
+    auto voxel_grid = t::geometry::VoxelGrid::CreateFromPointCloud(
+            t::geometry::PointCloud::FromLegacyPointCloud(pcd,
+                                                          core::Dtype::Float64),
+            0.07, core::Dtype::Float64);
+    ExpectVoxelsEQ(voxel_grid.ToLegacyVoxelGrid(), *voxel_grid_legacy);
+
+    voxel_grid = t::geometry::VoxelGrid::CreateFromPointCloud(
+            t::geometry::PointCloud::FromLegacyPointCloud(pcd), 0.07,
+            core::Dtype::UInt8);
+    EXPECT_EQ(voxel_grid.GetSize(), int64_t(voxel_grid_legacy->voxels_.size()));
+
+    EXPECT_ANY_THROW(t::geometry::VoxelGrid::CreateFromPointCloud(
+            t::geometry::PointCloud::FromLegacyPointCloud(pcd), -1));
+}
+
+TEST(TensorVoxelGrid, CheckIfIncluded) {
+    const geometry::PointCloud pcd = CreateColoredPointCloud(1000);
+    auto voxel_grid_legacy =
+            geometry::VoxelGrid::CreateFromPointCloud(pcd, 0.2);
+    auto voxel_grid =
+            t::geometry::VoxelGrid::FromLegacyVoxelGrid(*voxel_grid_legacy);
+
+    std::vector<Eigen::Vector3d> queries(1000);
+    Rand(queries, Eigen::Vector3d(-1.5, -1.5, -1.5),
+         Eigen::Vector3d(1.5, 1.5, 1.5), 2);
+    const std::vector<bool> included_gt =
+            voxel_grid_legacy->CheckIfIncluded(queries);
+    std::vector<double> queries_flat;
+    for (const Eigen::Vector3d& query : queries) {
+        queries_flat.insert(queries_flat.end(), query.data(), query.data() + 3);
+    }
+    const core::Tensor included = voxel_grid.CheckIfIncluded(
+            core::Tensor(queries_flat, {1000, 3}, core::Dtype::Float64));
+    EXPECT_EQ(included.ToFlatVector<bool>(), included_gt);
+}
+
+TEST(TensorVoxelGrid, AddVoxels) {
+    t::geometry::VoxelGrid voxel_grid(0.5, Eigen::Vector3d::Zero(),
+                                      core::Dtype::UInt8);
+    voxel_grid.AddVoxels(
+            core::Tensor(std::vector<int32_t>{0, 0, 0, 1, 2, 3, 0, 0, 0},
+                         {3, 3}, core::Dtype::Int32),
+            core::Tensor(std::vector<uint8_t>{1, 1, 1, 2, 2, 2, 3, 3, 3},
+                         {3, 3}, core::Dtype::UInt8));
+    EXPECT_EQ(voxel_grid.GetSize(), 2);
+    // The last color of a repeated grid index is kept.
+    EXPECT_EQ(voxel_grid.GetColors().ToFlatVector<uint8_t>(),
+              std::vector<uint8_t>({3, 3, 3, 2, 2, 2}));
+
+    voxel_grid.AddVoxels(core::Tensor(std::vector<int32_t>{-1, 0, 0, 1, 2, 3},
+                                      {2, 3}, core::Dtype::Int32),
+                         core::Tensor(std::vector<uint8_t>{4, 4, 4, 5, 5, 5},
+                                      {2, 3}, core::Dtype::UInt8));
+    EXPECT_EQ(voxel_grid.GetSize(), 3);
+    EXPECT_EQ(voxel_grid.GetGridIndices().ToFlatVector<int32_t>(),
+              std::vector<int32_t>({0, 0, 0, 1, 2, 3, -1, 0, 0}));
+    EXPECT_EQ(voxel_grid.GetColors().ToFlatVector<uint8_t>(),
+              std::vector<uint8_t>({3, 3, 3, 5, 5, 5, 4, 4, 4}));
+    EXPECT_EQ(voxel_grid
+                      .FindVoxels(core::Tensor(
+                              std::vector<int32_t>{-1, 0, 0, 7, 7, 7}, {2, 3},
+                              core::Dtype::Int32))
+                      .ToFlatVector<int64_t>(),
+              std::vector<int64_t>({2, -1}));
+
+    EXPECT_ANY_THROW(voxel_grid.AddVoxels(
+            core::Tensor::Zeros({1, 3}, core::Dtype::Int32),
+            core::Tensor::Zeros({1, 3}, core::Dtype::Float32)));
+}
+
+TEST(TensorVoxelGrid, Carve) {
+    camera::PinholeCameraParameters camera_parameter;
+    camera_parameter.intrinsic_.SetIntrinsics(64, 48, 50, 50, 31.5, 23.5);
+    camera_parameter.extrinsic_ = Eigen::Matrix4d::Identity();
+    camera_parameter.extrinsic_(2, 3) = 3;
+
+    geometry::Image depth_map;
+    depth_map.Prepare(64, 48, 1, 4);
+    geometry::Image silhouette_mask;
+    silhouette_mask.Prepare(64, 48, 1, 4);
+    for (int v = 0; v < 48; ++v) {
+        for (int u = 0; u < 64; ++u) {
+            *depth_map.PointerAt<float>(u, v) = 2.5f + 0.02f * u;
+            *silhouette_mask.PointerAt<float>(u, v) =
+                    (u - 32) * (u - 32) + (v - 24) * (v - 24) < 300 ? 1.f : 0.f;
+        }
+    }
+
+    for (bool keep_voxels_outside_image : {false, true}) {
+        auto voxel_grid_legacy = geometry::VoxelGrid::CreateDense(
+                Eigen::Vector3d(-1, -1, -1), Eigen::Vector3d(0.2, 0.4, 0.6),
+                0.1, 2, 2, 2);
+        auto voxel_grid = t::geometry::VoxelGrid::FromLegacyVoxelGrid(
+                *voxel_grid_legacy, core::Dtype::Float64);
+
+        voxel_grid_legacy->CarveDepthMap(depth_map, camera_parameter,
+                                         keep_voxels_outside_image);
+        voxel_grid.CarveDepthMap(depth_map, camera_parameter,
+                                 keep_voxels_outside_image);
+        ExpectVoxelsEQ(voxel_grid.ToLegacyVoxelGrid(), *voxel_grid_legacy);
+
+        voxel_grid_legacy->CarveSilhouette(silhouette_mask, camera_parameter,
+                                           keep_voxels_outside_image);
+        voxel_grid.CarveSilhouette(silhouette_mask, camera_parameter,
+                                   keep_voxels_outside_image);
+        ExpectVoxelsEQ(voxel_grid.ToLegacyVoxelGrid(), *voxel_grid_legacy);
+        EXPECT_GT(voxel_grid.GetSize(), 0);
+        EXPECT_LT(voxel_grid.GetSize(), 8000);
+        EXPECT_TRUE(voxel_grid
+                            .CheckIfIncluded(voxel_grid.GetGridIndices()
+                                                     .To(core::Dtype::Float64)
+                                                     .Mul(0.1)
+                                                     .Add(-0.95))
+                            .All());
+    }
+}
+
+TEST(TensorVoxelGrid, CarveAndAddVoxels) {
+    camera::PinholeCameraParameters camera_parameter;
+    camera_parameter.intrinsic_.SetIntrinsics(64, 48, 50, 50, 31.5, 23.5);
+    camera_parameter.extrinsic_ = Eigen::Matrix4d::Identity();
+    camera_parameter.extrinsic_(2, 3) = 3;
+
+    auto voxel_grid_legacy = geometry::VoxelGrid::CreateDense(
+            Eigen::Vector3d(-1, -1, -1), Eigen::Vector3d(0.2, 0.4, 0.6), 0.1, 2,
+            2, 2);
+    auto voxel_grid = t::geometry::VoxelGrid::FromLegacyVoxelGrid(
+            *voxel_grid_legacy, core::Dtype::Float64);
+    const core::Tensor all_grid_indices = voxel_grid.GetGridIndices().Copy();
+    const int64_t num_all = all_grid_indices.GetShape()[0];
+
+    // Carve ever smaller disks and add all voxels back in between, so that
+    // voxels are removed from and inserted into the row table repeatedly.
+    for (int radius : {20, 15, 10, 5, 2}) {
+        geometry::Image silhouette_mask;
+        silhouette_mask.Prepare(64, 48, 1, 4);
+        for (int v = 0; v < 48; ++v) {
+            for (int u = 0; u < 64; ++u) {
+                *silhouette_mask.PointerAt<float>(u, v) =
+                        (u - 32) * (u - 32) + (v - 24) * (v - 24) <
+                                        radius * radius
+                                ? 1.f
+                                : 0.f;
+            }
+        }
+        auto carved_legacy = *voxel_grid_legacy;
+        carved_legacy.CarveSilhouette(silhouette_mask, camera_parameter, false);
+        voxel_grid.CarveSilhouette(silhouette_mask, camera_parameter, false);
+        ExpectVoxelsEQ(voxel_grid.ToLegacyVoxelGrid(), carved_legacy);
+        EXPECT_LT(voxel_grid.GetSize(), num_all);
+
+        // Rows are renumbered in order and removed voxels are not found.
+        const int64_t num_kept = voxel_grid.GetSize();
+        std::vector<int64_t> rows(num_kept);
+        std::iota(rows.begin(), rows.end(), 0);
+        EXPECT_EQ(voxel_grid.FindVoxels(voxel_grid.GetGridIndices())
+                          .ToFlatVector<int64_t>(),
+                  rows);
+        const std::vector<int64_t> found =
+                voxel_grid.FindVoxels(all_grid_indices).ToFlatVector<int64_t>();
+        EXPECT_EQ(std::count(found.begin(), found.end(), -1),
+                  num_all - num_kept);
+
+        voxel_grid.AddVoxels(
+                all_grid_indices,
+                core::Tensor::Zeros({num_all, 3}, core::Dtype::Float64));
+        EXPECT_EQ(voxel_grid.GetSize(), num_all);
+        rows.resize(num_all);
+        std::iota(rows.begin(), rows.end(), 0);
+        EXPECT_EQ(voxel_grid.FindVoxels(voxel_grid.GetGridIndices())
+                          .ToFlatVector<int64_t>(),
+                  rows);
+        for (auto& it : voxel_grid_legacy->voxels_) {
+            it.second.color_.setZero();
+        }
+    }
+}
+
+}  // namespace tests
+}  // namespace open3d
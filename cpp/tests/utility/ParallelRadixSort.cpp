@@ -0,0 +1,76 @@
+// ----------------------------------------------------------------------------
+// -                        Open3D: www.open3d.org                            -
+// ----------------------------------------------------------------------------
+// The MIT License (MIT)
+//
+// Copyright (c) 2018 www.open3d.org
+//
+// Permission is hereby granted, free of charge, to any person obtaining a copy
+// of this software and associated documentation files (the "Software"), to deal
+// in the Software without restriction, including without limitation the rights
+// to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+// copies of the Software, and to permit persons to whom the Software is
+// furnished to do so, subject to the following conditions:
+//
+// The above copyright notice and this permission notice shall be included in
+// all copies or substantial portions of the Software.
+//
+// THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+// IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+// FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+// AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+// LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+// FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+// IN THE SOFTWARE.
+// ----------------------------------------------------------------------------
+
+#include "open3d/utility/ParallelRadixSort.h"
+
+#include <algorithm>
+#include <numeric>
+#include <random>
+
+#include "tests/UnitTest.h"
+
+namespace open3d {
+namespace tests {
+
+TEST(ParallelRadixSort, SortKeyValuePairs) {
+    for (int num_key_bits : {5, 20, 64}) {
+        std::mt19937_64 rng(num_key_bits);
+        const uint64_t mask = num_key_bits == 64
+                                      ? ~uint64_t(0)
+                                      : (uint64_t(1) << num_key_bits) - 1;
+        std::vector<uint64_t> keys(200000);
+        for (uint64_t& key : keys) {
+            key = rng() & mask;
+        }
+        std::vector<int64_t> values(keys.size());
+        std::iota(values.begin(), values.end(), 0);
+
+        // Stable sort by key as reference.
+        std::vector<int64_t> values_ref = values;
+        std::stable_sort(
+                values_ref.begin(), values_ref.end(),
+                [&](int64_t a, int64_t b) { return keys[a] < keys[b]; });
+        std::vector<uint64_t> keys_ref(keys.size());
+        for (size_t i = 0; i < keys.size(); i++) {
+            keys_ref[i] = keys[values_ref[i]];
+        }
+
+        utility::ParallelRadixSort(keys, values, num_key_bits);
+        EXPECT_EQ(keys, keys_ref);
+        EXPECT_EQ(values, values_ref);
+    }
+}
+
+TEST(ParallelRadixSort, Empty) {
+    std::vector<uint64_t> keys;
+    std::vector<int> values;
+    utility::ParallelRadixSort(keys, values);
+    EXPECT_TRUE(keys.empty());
+    EXPECT_TRUE(values.empty());
+}
+
+}  // namespace tests
+}  // namespace open3d
@@ -32,3 +32,37 @@ import pytest
 
 def test_knn_index():
     o3c.nns.test_faiss_integration()
+
+
+@pytest.mark.parametrize(
+    "index_type", [o3c.nns.FaissIndexType.Flat, o3c.nns.FaissIndexType.IVFFlat])
+def test_faiss_backend(index_type):
+    np.random.seed(0)
+    dataset_points = o3c.Tensor(np.random.rand(1000, 3),
+                                dtype=o3c.Dtype.Float32)
+    query_points = o3c.Tensor(np.random.rand(50, 3), dtype=o3c.Dtype.Float32)
+
+    nns_ref = o3c.nns.NearestNeighborSearch(dataset_points)
+    nns_ref.knn_index()
+    nns = o3c.nns.NearestNeighborSearch(dataset_points,
+                                        o3c.nns.NNSBackend.Faiss, index_type)
+    # Visit every IVF cell, so that the search is exact.
+    nns.set_faiss_num_probes(1000)
+    nns.knn_index()
+    assert nns.get_index_build_time() >= 0
+
+    indices_ref, distances_ref = nns_ref.knn_search(query_points, 5)
+    indices, distances = nns.knn_search(query_points, 5)
+    np.testing.assert_equal(indices.numpy(), indices_ref.numpy())
+    np.testing.assert_allclose(distances.numpy(),
+                               distances_ref.numpy(),
+                               rtol=1e-5,
+                               atol=1e-6)
+
+    nns_ref.fixed_radius_index()
+    nns.fixed_radius_index()
+    indices_ref, distances_ref, num_ref = nns_ref.fixed_radius_search(
+        query_points, 0.1)
+    indices, distances, num = nns.fixed_radius_search(query_points, 0.1)
+    np.testing.assert_equal(num.numpy(), num_ref.numpy())
+    np.testing.assert_equal(indices.numpy(), indices_ref.numpy())
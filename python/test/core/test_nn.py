@@ -130,3 +130,58 @@ def test_fixed_radius_search():
         atol=0)
     np.testing.assert_equal(num_neighbors.cpu().numpy(),
                             np.array([2, 2], dtype=np.int64))
+
+
+def test_brute_force_backend():
+    np.random.seed(0)
+    dataset_points = o3c.Tensor(np.random.rand(3000, 3))
+    query_points = o3c.Tensor(np.random.rand(200, 3))
+
+    nns_ref = o3c.nns.NearestNeighborSearch(dataset_points,
+                                            o3c.nns.NNSBackend.NanoFlann)
+    nns = o3c.nns.NearestNeighborSearch(dataset_points,
+                                        o3c.nns.NNSBackend.BruteForce)
+    nns_ref.knn_index()
+    nns.knn_index()
+    indices_ref, distances_ref = nns_ref.knn_search(query_points, 5)
+    indices, distances = nns.knn_search(query_points, 5)
+    np.testing.assert_equal(indices.numpy(), indices_ref.numpy())
+    np.testing.assert_allclose(distances.numpy(), distances_ref.numpy())
+
+    # Small datasets pick brute force automatically.
+    nns_auto = o3c.nns.NearestNeighborSearch(dataset_points)
+    nns_auto.knn_index()
+    assert nns_auto.backend == o3c.nns.NNSBackend.BruteForce
+
+
+def test_dynamic_index():
+    dtype = o3c.Dtype.Float64
+    device = o3c.Device("CPU:0")
+
+    index = o3c.nns.DynamicNanoFlannIndex(3, dtype, leaf_size=2)
+    first = index.add_points(
+        o3c.Tensor([[0.0, 0.0, 0.0], [0.1, 0.0, 0.0], [0.2, 0.0, 0.0]],
+                   dtype=dtype,
+                   device=device))
+    second = index.add_points(
+        o3c.Tensor([[0.3, 0.0, 0.0], [0.4, 0.0, 0.0]],
+                   dtype=dtype,
+                   device=device))
+    np.testing.assert_equal(second.cpu().numpy(),
+                            np.array([3, 4], dtype=np.int64))
+    assert len(index) == 5
+
+    query_points = o3c.Tensor([[0.12, 0.0, 0.0]], dtype=dtype, device=device)
+    indices, distances = index.knn_search(query_points, 2)
+    np.testing.assert_equal(indices.cpu().numpy(),
+                            np.array([[1, 2]], dtype=np.int64))
+
+    # Removed points are not returned anymore.
+    index.remove_points(first)
+    assert len(index) == 2
+    indices, distances = index.knn_search(query_points, 3)
+    np.testing.assert_equal(indices.cpu().numpy(),
+                            np.array([[3, 4]], dtype=np.int64))
+    indices, distances, num_neighbors = index.radius_search(query_points, 0.2)
+    np.testing.assert_equal(indices.cpu().numpy(), np.array([3],
+                                                            dtype=np.int64))
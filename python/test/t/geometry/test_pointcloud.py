@@ -198,3 +198,23 @@ def test_member_functions(device):
         r = o3c.Tensor.eye(3, dtype, device)
         center = o3c.Tensor.ones((3,), dtype, device)
         pcd.rotate(r, center)
+
+
+@pytest.mark.parametrize("device", list_devices())
+def test_sort_by_morton_code(device):
+    dtype = o3c.Dtype.Float32
+
+    points = np.array([[1, 1, 1], [0, 0, 0], [1, 0, 0], [0, 1, 0]],
+                      dtype=np.float32)
+    pcd = o3d.t.geometry.PointCloud(dtype, device)
+    pcd.point["points"] = o3c.TensorList.from_tensor(
+        o3c.Tensor(points, dtype, device))
+    pcd.point["colors"] = o3c.TensorList.from_tensor(
+        o3c.Tensor(points * 0.5, dtype, device))
+
+    permutation = pcd.sort_by_morton_code()
+    np.testing.assert_equal(permutation.numpy(), [1, 2, 3, 0])
+    np.testing.assert_equal(pcd.point["points"].as_tensor().cpu().numpy(),
+                            points[[1, 2, 3, 0]])
+    np.testing.assert_equal(pcd.point["colors"].as_tensor().cpu().numpy(),
+                            points[[1, 2, 3, 0]] * 0.5)
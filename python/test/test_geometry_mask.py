@@ -0,0 +1,107 @@
+# ----------------------------------------------------------------------------
+# -                        Open3D: www.open3d.org                            -
+# ----------------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 www.open3d.org
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+# ----------------------------------------------------------------------------
+
+import open3d as o3d
+import numpy as np
+import pytest
+
+
+def _point_cloud():
+    pcd = o3d.geometry.PointCloud()
+    pcd.points = o3d.utility.Vector3dVector(
+        np.arange(15, dtype=np.float64).reshape(5, 3))
+    return pcd
+
+
+def _mesh():
+    mesh = o3d.geometry.TriangleMesh()
+    mesh.vertices = o3d.utility.Vector3dVector(
+        np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0]],
+                 dtype=np.float64))
+    mesh.triangles = o3d.utility.Vector3iVector(
+        np.array([[0, 1, 2], [1, 3, 2]], dtype=np.int32))
+    return mesh
+
+
+@pytest.mark.parametrize("mask", [
+    np.array([True, False, True, False, True]),
+    [True, False, True, False, True],
+    np.array([1, 0, 2, 0, 3]),
+])
+def test_point_cloud_select_by_mask(mask):
+    pcd = _point_cloud()
+    selected = pcd.select_by_mask(mask)
+    np.testing.assert_equal(np.asarray(selected.points),
+                            np.asarray(pcd.points)[[0, 2, 4]])
+    selected = pcd.select_by_mask(mask, invert=True)
+    np.testing.assert_equal(np.asarray(selected.points),
+                            np.asarray(pcd.points)[[1, 3]])
+
+
+@pytest.mark.parametrize("mask", [
+    np.array([True, True, True, False]),
+    [True, True, True, False],
+])
+def test_triangle_mesh_select_by_mask(mask):
+    mesh = _mesh().select_by_mask(mask)
+    assert len(mesh.vertices) == 3
+    np.testing.assert_equal(np.asarray(mesh.triangles), [[0, 1, 2]])
+
+
+@pytest.mark.parametrize("mask", [
+    np.array([False, True]),
+    [False, True],
+])
+def test_triangle_mesh_remove_triangles_by_mask(mask):
+    mesh = _mesh()
+    mesh.remove_triangles_by_mask(mask)
+    np.testing.assert_equal(np.asarray(mesh.triangles), [[0, 1, 2]])
+
+
+@pytest.mark.parametrize("mask", [
+    np.array([False, False, False, True]),
+    [False, False, False, True],
+])
+def test_triangle_mesh_remove_vertices_by_mask(mask):
+    mesh = _mesh()
+    mesh.remove_vertices_by_mask(mask)
+    assert len(mesh.vertices) == 3
+    np.testing.assert_equal(np.asarray(mesh.triangles), [[0, 1, 2]])
+
+
+def test_mask_dtype_and_shape():
+    pcd = _point_cloud()
+    # Strided bool arrays are accepted too.
+    mask = np.array(
+        [True, True, False, False, True, True, False, False, True, True])[::2]
+    np.testing.assert_equal(np.asarray(pcd.select_by_mask(mask).points),
+                            np.asarray(pcd.points)[[0, 2, 4]])
+    # Masks must be one dimensional.
+    with pytest.raises(RuntimeError):
+        pcd.select_by_mask(np.ones((5, 1), dtype=bool))
+    # Masks must have one entry per point.
+    with pytest.raises(RuntimeError):
+        pcd.select_by_mask(np.ones(4, dtype=bool))